@@ -0,0 +1,5090 @@
+/** This file is auto-generated by tools/print_converters.py */
+
+import { vec3, constrainAngle } from "./util.js";
+import { convert } from "./convert.js";
+import { sRGBGammaToLinear, sRGBLinearToGamma } from "./spaces/util.js";
+import { Rec2020ToLinear, Rec2020ToGamma } from "./spaces/rec2020.js";
+import { A98RGBToLinear, A98RGBToGamma } from "./spaces/a98-rgb.js";
+import {
+  ProPhotoRGBToLinear,
+  ProPhotoRGBToGamma,
+} from "./spaces/prophoto-rgb.js";
+import {
+  XYZ,
+  XYZD50,
+  OKLab,
+  OKLCH,
+  sRGB,
+  sRGBLinear,
+  DisplayP3,
+  DisplayP3Linear,
+  Rec2020,
+  Rec2020Linear,
+  A98RGB,
+  A98RGBLinear,
+  ProPhotoRGB,
+  ProPhotoRGBLinear,
+} from "./spaces.js";
+
+// based on colorjs.io, the same as src/spaces/oklab.js
+const ACHROMATIC_EPSILON = (0.4 - 0.0) / 100000;
+
+export const XYZ_to_XYZD50 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.0479297925449969 * x0 +
+    0.022946870601609652 * y0 -
+    0.05019226628920524 * z0;
+  const y1 =
+    0.02962780877005599 * x0 +
+    0.9904344267538799 * y0 -
+    0.017073799063418826 * z0;
+  const z1 =
+    -0.009243040646204504 * x0 +
+    0.015055191490298152 * y0 +
+    0.7518742814281371 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const XYZ_to_OKLab = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.819022437996703 * x0 +
+    0.3619062600528904 * y0 -
+    0.1288737815209879 * z0;
+  const y1 =
+    0.0329836539323885 * x0 +
+    0.9292868615863434 * y0 +
+    0.0361446663506424 * z0;
+  const z1 =
+    0.0481771893596242 * x0 +
+    0.2642395317527308 * y0 +
+    0.6335478284694309 * z0;
+  const x2 = Math.cbrt(x1);
+  const y2 = Math.cbrt(y1);
+  const z2 = Math.cbrt(z1);
+  const x3 =
+    0.210454268309314 * x2 +
+    0.7936177747023054 * y2 -
+    0.0040720430116193 * z2;
+  const y3 =
+    1.9779985324311684 * x2 -
+    2.42859224204858 * y2 +
+    0.450593709617411 * z2;
+  const z3 =
+    0.0259040424655478 * x2 +
+    0.7827717124575296 * y2 -
+    0.8086757549230774 * z2;
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const XYZ_to_OKLCH = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.819022437996703 * x0 +
+    0.3619062600528904 * y0 -
+    0.1288737815209879 * z0;
+  const y1 =
+    0.0329836539323885 * x0 +
+    0.9292868615863434 * y0 +
+    0.0361446663506424 * z0;
+  const z1 =
+    0.0481771893596242 * x0 +
+    0.2642395317527308 * y0 +
+    0.6335478284694309 * z0;
+  const x2 = Math.cbrt(x1);
+  const y2 = Math.cbrt(y1);
+  const z2 = Math.cbrt(z1);
+  const x3 =
+    0.210454268309314 * x2 +
+    0.7936177747023054 * y2 -
+    0.0040720430116193 * z2;
+  const y3 =
+    1.9779985324311684 * x2 -
+    2.42859224204858 * y2 +
+    0.450593709617411 * z2;
+  const z3 =
+    0.0259040424655478 * x2 +
+    0.7827717124575296 * y2 -
+    0.8086757549230774 * z2;
+  const isAchromatic4 =
+    Math.abs(y3) < ACHROMATIC_EPSILON && Math.abs(z3) < ACHROMATIC_EPSILON;
+  const y4 = isAchromatic4 ? 0 : Math.sqrt(y3 * y3 + z3 * z3);
+  const z4 = isAchromatic4
+    ? 0
+    : constrainAngle((Math.atan2(z3, y3) * 180) / Math.PI);
+  out[0] = x3;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const XYZ_to_sRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    3.2409699419045213 * x0 -
+    1.5373831775700935 * y0 -
+    0.4986107602930033 * z0;
+  const y1 =
+    -0.9692436362808798 * x0 +
+    1.8759675015077206 * y0 +
+    0.04155505740717561 * z0;
+  const z1 =
+    0.05563007969699361 * x0 -
+    0.20397695888897657 * y0 +
+    1.0569715142428786 * z0;
+  const x2 = sRGBLinearToGamma(x1);
+  const y2 = sRGBLinearToGamma(y1);
+  const z2 = sRGBLinearToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const XYZ_to_sRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    3.2409699419045213 * x0 -
+    1.5373831775700935 * y0 -
+    0.4986107602930033 * z0;
+  const y1 =
+    -0.9692436362808798 * x0 +
+    1.8759675015077206 * y0 +
+    0.04155505740717561 * z0;
+  const z1 =
+    0.05563007969699361 * x0 -
+    0.20397695888897657 * y0 +
+    1.0569715142428786 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const XYZ_to_DisplayP3 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    2.4934969119414245 * x0 -
+    0.9313836179191236 * y0 -
+    0.40271078445071684 * z0;
+  const y1 =
+    -0.829488969561575 * x0 +
+    1.7626640603183468 * y0 +
+    0.02362468584194359 * z0;
+  const z1 =
+    0.035845830243784335 * x0 -
+    0.07617238926804171 * y0 +
+    0.9568845240076873 * z0;
+  const x2 = sRGBLinearToGamma(x1);
+  const y2 = sRGBLinearToGamma(y1);
+  const z2 = sRGBLinearToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const XYZ_to_DisplayP3Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    2.4934969119414245 * x0 -
+    0.9313836179191236 * y0 -
+    0.40271078445071684 * z0;
+  const y1 =
+    -0.829488969561575 * x0 +
+    1.7626640603183468 * y0 +
+    0.02362468584194359 * z0;
+  const z1 =
+    0.035845830243784335 * x0 -
+    0.07617238926804171 * y0 +
+    0.9568845240076873 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const XYZ_to_Rec2020 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.7166511879712676 * x0 -
+    0.3556707837763924 * y0 -
+    0.2533662813736598 * z0;
+  const y1 =
+    -0.666684351832489 * x0 +
+    1.616481236634939 * y0 +
+    0.01576854581391113 * z0;
+  const z1 =
+    0.017639857445310915 * x0 -
+    0.042770613257808655 * y0 +
+    0.942103121235474 * z0;
+  const x2 = Rec2020ToGamma(x1);
+  const y2 = Rec2020ToGamma(y1);
+  const z2 = Rec2020ToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const XYZ_to_Rec2020Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.7166511879712676 * x0 -
+    0.3556707837763924 * y0 -
+    0.2533662813736598 * z0;
+  const y1 =
+    -0.666684351832489 * x0 +
+    1.616481236634939 * y0 +
+    0.01576854581391113 * z0;
+  const z1 =
+    0.017639857445310915 * x0 -
+    0.042770613257808655 * y0 +
+    0.942103121235474 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const XYZ_to_A98RGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    2.041587903810746 * x0 -
+    0.5650069742788596 * y0 -
+    0.3447313507783295 * z0;
+  const y1 =
+    -0.9692436362808798 * x0 +
+    1.8759675015077206 * y0 +
+    0.04155505740717561 * z0;
+  const z1 =
+    0.013444280632031024 * x0 -
+    0.11836239223101824 * y0 +
+    1.0151749943912054 * z0;
+  const x2 = A98RGBToGamma(x1);
+  const y2 = A98RGBToGamma(y1);
+  const z2 = A98RGBToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const XYZ_to_A98RGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    2.041587903810746 * x0 -
+    0.5650069742788596 * y0 -
+    0.3447313507783295 * z0;
+  const y1 =
+    -0.9692436362808798 * x0 +
+    1.8759675015077206 * y0 +
+    0.04155505740717561 * z0;
+  const z1 =
+    0.013444280632031024 * x0 -
+    0.11836239223101824 * y0 +
+    1.0151749943912054 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const XYZ_to_ProPhotoRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.4031904633774983 * x0 -
+    0.22301514479051648 * y0 -
+    0.10160668507413796 * z0;
+  const y1 =
+    -0.5262384021633069 * x0 +
+    1.4816319629234642 * y0 +
+    0.01701879027252685 * z0;
+  const z1 =
+    -0.011202265286221482 * x0 +
+    0.018246403479620983 * y0 +
+    0.9112472274915048 * z0;
+  const x2 = ProPhotoRGBToGamma(x1);
+  const y2 = ProPhotoRGBToGamma(y1);
+  const z2 = ProPhotoRGBToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const XYZ_to_ProPhotoRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.4031904633774983 * x0 -
+    0.22301514479051648 * y0 -
+    0.10160668507413796 * z0;
+  const y1 =
+    -0.5262384021633069 * x0 +
+    1.4816319629234642 * y0 +
+    0.01701879027252685 * z0;
+  const z1 =
+    -0.011202265286221482 * x0 +
+    0.018246403479620983 * y0 +
+    0.9112472274915048 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const XYZD50_to_XYZ = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.955473421488075 * x0 -
+    0.02309845494876471 * y0 +
+    0.06325924320057072 * z0;
+  const y1 =
+    -0.0283697093338637 * x0 +
+    1.0099953980813041 * y0 +
+    0.021041441191917323 * z0;
+  const z1 =
+    0.012314014864481998 * x0 -
+    0.020507649298898964 * y0 +
+    1.330365926242124 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const XYZD50_to_OKLab = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.770700042043117 * x0 +
+    0.34924840261939605 * y0 -
+    0.11202351884164678 * z0;
+  const y1 =
+    0.005596492483688405 * x0 +
+    0.9370723401136771 * y0 +
+    0.0697256883625278 * z0;
+  const z1 =
+    0.04633714262191066 * x0 +
+    0.25277531574310524 * y0 +
+    0.851458076746796 * z0;
+  const x2 = Math.cbrt(x1);
+  const y2 = Math.cbrt(y1);
+  const z2 = Math.cbrt(z1);
+  const x3 =
+    0.210454268309314 * x2 +
+    0.7936177747023054 * y2 -
+    0.0040720430116193 * z2;
+  const y3 =
+    1.9779985324311684 * x2 -
+    2.42859224204858 * y2 +
+    0.450593709617411 * z2;
+  const z3 =
+    0.0259040424655478 * x2 +
+    0.7827717124575296 * y2 -
+    0.8086757549230774 * z2;
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const XYZD50_to_OKLCH = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.770700042043117 * x0 +
+    0.34924840261939605 * y0 -
+    0.11202351884164678 * z0;
+  const y1 =
+    0.005596492483688405 * x0 +
+    0.9370723401136771 * y0 +
+    0.0697256883625278 * z0;
+  const z1 =
+    0.04633714262191066 * x0 +
+    0.25277531574310524 * y0 +
+    0.851458076746796 * z0;
+  const x2 = Math.cbrt(x1);
+  const y2 = Math.cbrt(y1);
+  const z2 = Math.cbrt(z1);
+  const x3 =
+    0.210454268309314 * x2 +
+    0.7936177747023054 * y2 -
+    0.0040720430116193 * z2;
+  const y3 =
+    1.9779985324311684 * x2 -
+    2.42859224204858 * y2 +
+    0.450593709617411 * z2;
+  const z3 =
+    0.0259040424655478 * x2 +
+    0.7827717124575296 * y2 -
+    0.8086757549230774 * z2;
+  const isAchromatic4 =
+    Math.abs(y3) < ACHROMATIC_EPSILON && Math.abs(z3) < ACHROMATIC_EPSILON;
+  const y4 = isAchromatic4 ? 0 : Math.sqrt(y3 * y3 + z3 * z3);
+  const z4 = isAchromatic4
+    ? 0
+    : constrainAngle((Math.atan2(z3, y3) * 180) / Math.PI);
+  out[0] = x3;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const XYZD50_to_sRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    3.1341358529001173 * x0 -
+    1.6173859980180427 * y0 -
+    0.4906622179110973 * z0;
+  const y1 =
+    -0.9787954765557777 * x0 +
+    1.9162543773959886 * y0 +
+    0.0334428733903669 * z0;
+  const z1 =
+    0.07195539255794736 * x0 -
+    0.22897675981518203 * y0 +
+    1.4053860351131182 * z0;
+  const x2 = sRGBLinearToGamma(x1);
+  const y2 = sRGBLinearToGamma(y1);
+  const z2 = sRGBLinearToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const XYZD50_to_sRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    3.1341358529001173 * x0 -
+    1.6173859980180427 * y0 -
+    0.4906622179110973 * z0;
+  const y1 =
+    -0.9787954765557777 * x0 +
+    1.9162543773959886 * y0 +
+    0.0334428733903669 * z0;
+  const z1 =
+    0.07195539255794736 * x0 -
+    0.22897675981518203 * y0 +
+    1.4053860351131182 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const XYZD50_to_DisplayP3 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    2.403934121855497 * x0 -
+    0.9900304424955936 * y0 -
+    0.39761363181465603 * z0;
+  const y1 =
+    -0.8422700161454689 * x0 +
+    1.7989580161067085 * y0 +
+    0.016045624770904703 * z0;
+  const z1 =
+    0.04819381686413304 * x0 -
+    0.09738519815446048 * y0 +
+    1.2736713693321273 * z0;
+  const x2 = sRGBLinearToGamma(x1);
+  const y2 = sRGBLinearToGamma(y1);
+  const z2 = sRGBLinearToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const XYZD50_to_DisplayP3Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    2.403934121855497 * x0 -
+    0.9900304424955936 * y0 -
+    0.39761363181465603 * z0;
+  const y1 =
+    -0.8422700161454689 * x0 +
+    1.7989580161067085 * y0 +
+    0.016045624770904703 * z0;
+  const z1 =
+    0.04819381686413304 * x0 -
+    0.09738519815446048 * y0 +
+    1.2736713693321273 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const XYZD50_to_Rec2020 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.6471849046717655 * x0 -
+    0.3936818981316474 * y0 -
+    0.23595963848828255 * z0;
+  const y1 =
+    -0.6826641074173819 * x0 +
+    1.6477146127444076 * y0 +
+    0.012817083385120838 * z0;
+  const z1 =
+    0.029668876652756755 * x0 -
+    0.0629258964297003 * y0 +
+    1.2535578201865774 * z0;
+  const x2 = Rec2020ToGamma(x1);
+  const y2 = Rec2020ToGamma(y1);
+  const z2 = Rec2020ToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const XYZD50_to_Rec2020Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.6471849046717655 * x0 -
+    0.3936818981316474 * y0 -
+    0.23595963848828255 * z0;
+  const y1 =
+    -0.6826641074173819 * x0 +
+    1.6477146127444076 * y0 +
+    0.012817083385120838 * z0;
+  const z1 =
+    0.029668876652756755 * x0 -
+    0.0629258964297003 * y0 +
+    1.2535578201865774 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const XYZD50_to_A98RGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.9624670363768804 * x0 -
+    0.6107423404815077 * y0 -
+    0.3413580980827153 * z0;
+  const y1 =
+    -0.9787954765557777 * x0 +
+    1.9162543773959886 * y0 +
+    0.0334428733903669 * z0;
+  const z1 =
+    0.02870443944957103 * x0 -
+    0.1406748663317068 * y0 +
+    1.3489141814137935 * z0;
+  const x2 = A98RGBToGamma(x1);
+  const y2 = A98RGBToGamma(y1);
+  const z2 = A98RGBToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const XYZD50_to_A98RGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.9624670363768804 * x0 -
+    0.6107423404815077 * y0 -
+    0.3413580980827153 * z0;
+  const y1 =
+    -0.9787954765557777 * x0 +
+    1.9162543773959886 * y0 +
+    0.0334428733903669 * z0;
+  const z1 =
+    0.02870443944957103 * x0 -
+    0.1406748663317068 * y0 +
+    1.3489141814137935 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const XYZD50_to_ProPhotoRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.3457868816471583 * x0 -
+    0.25557208737979475 * y0 -
+    0.05110186497554523 * z0;
+  const y1 =
+    -0.5446307051249016 * x0 +
+    1.5082477428451468 * y0 +
+    0.02052744743642136 * z0;
+  const z1 =
+    2.3126714088960576e-17 * x0 +
+    4.204857107083741e-18 * y0 +
+    1.2119675456389454 * z0;
+  const x2 = ProPhotoRGBToGamma(x1);
+  const y2 = ProPhotoRGBToGamma(y1);
+  const z2 = ProPhotoRGBToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const XYZD50_to_ProPhotoRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.3457868816471583 * x0 -
+    0.25557208737979475 * y0 -
+    0.05110186497554523 * z0;
+  const y1 =
+    -0.5446307051249016 * x0 +
+    1.5082477428451468 * y0 +
+    0.02052744743642136 * z0;
+  const z1 =
+    2.3126714088960576e-17 * x0 +
+    4.204857107083741e-18 * y0 +
+    1.2119675456389454 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const OKLab_to_XYZ = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = x0 + 0.3963377773761749 * y0 + 0.2158037573099136 * z0;
+  const y1 = x0 - 0.1055613458156586 * y0 - 0.0638541728258133 * z0;
+  const z1 = x0 - 0.0894841775298119 * y0 - 1.2914855480194092 * z0;
+  const x2 = x1 * x1 * x1;
+  const y2 = y1 * y1 * y1;
+  const z2 = z1 * z1 * z1;
+  const x3 =
+    1.2268798758459243 * x2 -
+    0.5578149944602171 * y2 +
+    0.2813910456659647 * z2;
+  const y3 =
+    -0.0405757452148008 * x2 +
+    1.112286803280317 * y2 -
+    0.0717110580655164 * z2;
+  const z3 =
+    -0.0763729366746601 * x2 -
+    0.4214933324022432 * y2 +
+    1.5869240198367816 * z2;
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const OKLab_to_XYZD50 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = x0 + 0.3963377773761749 * y0 + 0.2158037573099136 * z0;
+  const y1 = x0 - 0.1055613458156586 * y0 - 0.0638541728258133 * z0;
+  const z1 = x0 - 0.0894841775298119 * y0 - 1.2914855480194092 * z0;
+  const x2 = x1 * x1 * x1;
+  const y2 = y1 * y1 * y1;
+  const z2 = z1 * z1 * z1;
+  const x3 =
+    1.2885862181727064 * x2 -
+    0.5378717444973745 * y2 +
+    0.21358120275423642 * z2;
+  const y3 =
+    -0.0025338764318732837 * x2 +
+    1.092316798871916 * y2 -
+    0.08978292244004273 * z2;
+  const z3 =
+    -0.06937382305734126 * x2 -
+    0.2950083989443126 * y2 +
+    1.189486824512114 * z2;
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const OKLab_to_OKLCH = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const isAchromatic1 =
+    Math.abs(y0) < ACHROMATIC_EPSILON && Math.abs(z0) < ACHROMATIC_EPSILON;
+  const y1 = isAchromatic1 ? 0 : Math.sqrt(y0 * y0 + z0 * z0);
+  const z1 = isAchromatic1
+    ? 0
+    : constrainAngle((Math.atan2(z0, y0) * 180) / Math.PI);
+  out[0] = x0;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const OKLab_to_sRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = x0 + 0.3963377773761749 * y0 + 0.2158037573099136 * z0;
+  const y1 = x0 - 0.1055613458156586 * y0 - 0.0638541728258133 * z0;
+  const z1 = x0 - 0.0894841775298119 * y0 - 1.2914855480194092 * z0;
+  const x2 = x1 * x1 * x1;
+  const y2 = y1 * y1 * y1;
+  const z2 = z1 * z1 * z1;
+  const x3 =
+    4.076741636075959 * x2 -
+    3.307711539258062 * y2 +
+    0.2309699031821041 * z2;
+  const y3 =
+    -1.2684379732850313 * x2 +
+    2.6097573492876878 * y2 -
+    0.3413193760026569 * z2;
+  const z3 =
+    -0.004196076138675526 * x2 -
+    0.703418617935936 * y2 +
+    1.7076146940746113 * z2;
+  const x4 = sRGBLinearToGamma(x3);
+  const y4 = sRGBLinearToGamma(y3);
+  const z4 = sRGBLinearToGamma(z3);
+  out[0] = x4;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const OKLab_to_sRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = x0 + 0.3963377773761749 * y0 + 0.2158037573099136 * z0;
+  const y1 = x0 - 0.1055613458156586 * y0 - 0.0638541728258133 * z0;
+  const z1 = x0 - 0.0894841775298119 * y0 - 1.2914855480194092 * z0;
+  const x2 = x1 * x1 * x1;
+  const y2 = y1 * y1 * y1;
+  const z2 = z1 * z1 * z1;
+  const x3 =
+    4.076741636075959 * x2 -
+    3.307711539258062 * y2 +
+    0.2309699031821041 * z2;
+  const y3 =
+    -1.2684379732850313 * x2 +
+    2.6097573492876878 * y2 -
+    0.3413193760026569 * z2;
+  const z3 =
+    -0.004196076138675526 * x2 -
+    0.703418617935936 * y2 +
+    1.7076146940746113 * z2;
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const OKLab_to_DisplayP3 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = x0 + 0.3963377773761749 * y0 + 0.2158037573099136 * z0;
+  const y1 = x0 - 0.1055613458156586 * y0 - 0.0638541728258133 * z0;
+  const z1 = x0 - 0.0894841775298119 * y0 - 1.2914855480194092 * z0;
+  const x2 = x1 * x1 * x1;
+  const y2 = y1 * y1 * y1;
+  const z2 = z1 * z1 * z1;
+  const x3 =
+    3.1277689713618737 * x2 -
+    2.2571357625916395 * y2 +
+    0.1293667912297651 * z2;
+  const y3 =
+    -1.091009018437798 * x2 +
+    2.413331710306923 * y2 -
+    0.3223226918691248 * z2;
+  const z3 =
+    -0.02601080193857041 * x2 -
+    0.5080413317041669 * y2 +
+    1.5340521336427373 * z2;
+  const x4 = sRGBLinearToGamma(x3);
+  const y4 = sRGBLinearToGamma(y3);
+  const z4 = sRGBLinearToGamma(z3);
+  out[0] = x4;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const OKLab_to_DisplayP3Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = x0 + 0.3963377773761749 * y0 + 0.2158037573099136 * z0;
+  const y1 = x0 - 0.1055613458156586 * y0 - 0.0638541728258133 * z0;
+  const z1 = x0 - 0.0894841775298119 * y0 - 1.2914855480194092 * z0;
+  const x2 = x1 * x1 * x1;
+  const y2 = y1 * y1 * y1;
+  const z2 = z1 * z1 * z1;
+  const x3 =
+    3.1277689713618737 * x2 -
+    2.2571357625916395 * y2 +
+    0.1293667912297651 * z2;
+  const y3 =
+    -1.091009018437798 * x2 +
+    2.413331710306923 * y2 -
+    0.3223226918691248 * z2;
+  const z3 =
+    -0.02601080193857041 * x2 -
+    0.5080413317041669 * y2 +
+    1.5340521336427373 * z2;
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const OKLab_to_Rec2020 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = x0 + 0.3963377773761749 * y0 + 0.2158037573099136 * z0;
+  const y1 = x0 - 0.1055613458156586 * y0 - 0.0638541728258133 * z0;
+  const z1 = x0 - 0.0894841775298119 * y0 - 1.2914855480194092 * z0;
+  const x2 = x1 * x1 * x1;
+  const y2 = y1 * y1 * y1;
+  const z2 = z1 * z1 * z1;
+  const x3 =
+    2.1399067304346513 * x2 -
+    1.246389493760618 * y2 +
+    0.10648276332596689 * z2;
+  const y3 =
+    -0.8847358357577675 * x2 +
+    2.1632309383612007 * y2 -
+    0.27849510260343363 * z2;
+  const z3 =
+    -0.04857374640044396 * x2 -
+    0.45450314971409633 * y2 +
+    1.5030768961145404 * z2;
+  const x4 = Rec2020ToGamma(x3);
+  const y4 = Rec2020ToGamma(y3);
+  const z4 = Rec2020ToGamma(z3);
+  out[0] = x4;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const OKLab_to_Rec2020Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = x0 + 0.3963377773761749 * y0 + 0.2158037573099136 * z0;
+  const y1 = x0 - 0.1055613458156586 * y0 - 0.0638541728258133 * z0;
+  const z1 = x0 - 0.0894841775298119 * y0 - 1.2914855480194092 * z0;
+  const x2 = x1 * x1 * x1;
+  const y2 = y1 * y1 * y1;
+  const z2 = z1 * z1 * z1;
+  const x3 =
+    2.1399067304346513 * x2 -
+    1.246389493760618 * y2 +
+    0.10648276332596689 * z2;
+  const y3 =
+    -0.8847358357577675 * x2 +
+    2.1632309383612007 * y2 -
+    0.27849510260343363 * z2;
+  const z3 =
+    -0.04857374640044396 * x2 -
+    0.45450314971409633 * y2 +
+    1.5030768961145404 * z2;
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const OKLab_to_A98RGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = x0 + 0.3963377773761749 * y0 + 0.2158037573099136 * z0;
+  const y1 = x0 - 0.1055613458156586 * y0 - 0.0638541728258133 * z0;
+  const z1 = x0 - 0.0894841775298119 * y0 - 1.2914855480194092 * z0;
+  const x2 = x1 * x1 * x1;
+  const y2 = y1 * y1 * y1;
+  const z2 = z1 * z1 * z1;
+  const x3 =
+    2.554036838611556 * x2 -
+    1.6219761806828696 * y2 +
+    0.06793934207131354 * z2;
+  const y3 =
+    -1.2684379732850315 * x2 +
+    2.6097573492876887 * y2 -
+    0.3413193760026572 * z2;
+  const z3 =
+    -0.0562347359374939 * x2 -
+    0.5670418395669057 * y2 +
+    1.6232765755043994 * z2;
+  const x4 = A98RGBToGamma(x3);
+  const y4 = A98RGBToGamma(y3);
+  const z4 = A98RGBToGamma(z3);
+  out[0] = x4;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const OKLab_to_A98RGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = x0 + 0.3963377773761749 * y0 + 0.2158037573099136 * z0;
+  const y1 = x0 - 0.1055613458156586 * y0 - 0.0638541728258133 * z0;
+  const z1 = x0 - 0.0894841775298119 * y0 - 1.2914855480194092 * z0;
+  const x2 = x1 * x1 * x1;
+  const y2 = y1 * y1 * y1;
+  const z2 = z1 * z1 * z1;
+  const x3 =
+    2.554036838611556 * x2 -
+    1.6219761806828696 * y2 +
+    0.06793934207131354 * z2;
+  const y3 =
+    -1.2684379732850315 * x2 +
+    2.6097573492876887 * y2 -
+    0.3413193760026572 * z2;
+  const z3 =
+    -0.0562347359374939 * x2 -
+    0.5670418395669057 * y2 +
+    1.6232765755043994 * z2;
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const OKLab_to_ProPhotoRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = x0 + 0.3963377773761749 * y0 + 0.2158037573099136 * z0;
+  const y1 = x0 - 0.1055613458156586 * y0 - 0.0638541728258133 * z0;
+  const z1 = x0 - 0.0894841775298119 * y0 - 1.2914855480194092 * z0;
+  const x2 = x1 * x1 * x1;
+  const y2 = y1 * y1 * y1;
+  const z2 = z1 * z1 * z1;
+  const x3 =
+    1.7383551481157213 * x2 -
+    0.9879509427514458 * y2 +
+    0.24959579463572504 * z2;
+  const y3 =
+    -0.7070494015329266 * x2 +
+    1.934370044440138 * y2 -
+    0.22732064290721157 * z2;
+  const z3 =
+    -0.08407882206239632 * x2 -
+    0.3575406052114133 * y2 +
+    1.4416194272738097 * z2;
+  const x4 = ProPhotoRGBToGamma(x3);
+  const y4 = ProPhotoRGBToGamma(y3);
+  const z4 = ProPhotoRGBToGamma(z3);
+  out[0] = x4;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const OKLab_to_ProPhotoRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = x0 + 0.3963377773761749 * y0 + 0.2158037573099136 * z0;
+  const y1 = x0 - 0.1055613458156586 * y0 - 0.0638541728258133 * z0;
+  const z1 = x0 - 0.0894841775298119 * y0 - 1.2914855480194092 * z0;
+  const x2 = x1 * x1 * x1;
+  const y2 = y1 * y1 * y1;
+  const z2 = z1 * z1 * z1;
+  const x3 =
+    1.7383551481157213 * x2 -
+    0.9879509427514458 * y2 +
+    0.24959579463572504 * z2;
+  const y3 =
+    -0.7070494015329266 * x2 +
+    1.934370044440138 * y2 -
+    0.22732064290721157 * z2;
+  const z3 =
+    -0.08407882206239632 * x2 -
+    0.3575406052114133 * y2 +
+    1.4416194272738097 * z2;
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const OKLCH_to_XYZ = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const y1 = y0 * Math.cos((z0 * Math.PI) / 180);
+  const z1 = y0 * Math.sin((z0 * Math.PI) / 180);
+  const x2 = x0 + 0.3963377773761749 * y1 + 0.2158037573099136 * z1;
+  const y2 = x0 - 0.1055613458156586 * y1 - 0.0638541728258133 * z1;
+  const z2 = x0 - 0.0894841775298119 * y1 - 1.2914855480194092 * z1;
+  const x3 = x2 * x2 * x2;
+  const y3 = y2 * y2 * y2;
+  const z3 = z2 * z2 * z2;
+  const x4 =
+    1.2268798758459243 * x3 -
+    0.5578149944602171 * y3 +
+    0.2813910456659647 * z3;
+  const y4 =
+    -0.0405757452148008 * x3 +
+    1.112286803280317 * y3 -
+    0.0717110580655164 * z3;
+  const z4 =
+    -0.0763729366746601 * x3 -
+    0.4214933324022432 * y3 +
+    1.5869240198367816 * z3;
+  out[0] = x4;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const OKLCH_to_XYZD50 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const y1 = y0 * Math.cos((z0 * Math.PI) / 180);
+  const z1 = y0 * Math.sin((z0 * Math.PI) / 180);
+  const x2 = x0 + 0.3963377773761749 * y1 + 0.2158037573099136 * z1;
+  const y2 = x0 - 0.1055613458156586 * y1 - 0.0638541728258133 * z1;
+  const z2 = x0 - 0.0894841775298119 * y1 - 1.2914855480194092 * z1;
+  const x3 = x2 * x2 * x2;
+  const y3 = y2 * y2 * y2;
+  const z3 = z2 * z2 * z2;
+  const x4 =
+    1.2885862181727064 * x3 -
+    0.5378717444973745 * y3 +
+    0.21358120275423642 * z3;
+  const y4 =
+    -0.0025338764318732837 * x3 +
+    1.092316798871916 * y3 -
+    0.08978292244004273 * z3;
+  const z4 =
+    -0.06937382305734126 * x3 -
+    0.2950083989443126 * y3 +
+    1.189486824512114 * z3;
+  out[0] = x4;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const OKLCH_to_OKLab = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const y1 = y0 * Math.cos((z0 * Math.PI) / 180);
+  const z1 = y0 * Math.sin((z0 * Math.PI) / 180);
+  out[0] = x0;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const OKLCH_to_sRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const y1 = y0 * Math.cos((z0 * Math.PI) / 180);
+  const z1 = y0 * Math.sin((z0 * Math.PI) / 180);
+  const x2 = x0 + 0.3963377773761749 * y1 + 0.2158037573099136 * z1;
+  const y2 = x0 - 0.1055613458156586 * y1 - 0.0638541728258133 * z1;
+  const z2 = x0 - 0.0894841775298119 * y1 - 1.2914855480194092 * z1;
+  const x3 = x2 * x2 * x2;
+  const y3 = y2 * y2 * y2;
+  const z3 = z2 * z2 * z2;
+  const x4 =
+    4.076741636075959 * x3 -
+    3.307711539258062 * y3 +
+    0.2309699031821041 * z3;
+  const y4 =
+    -1.2684379732850313 * x3 +
+    2.6097573492876878 * y3 -
+    0.3413193760026569 * z3;
+  const z4 =
+    -0.004196076138675526 * x3 -
+    0.703418617935936 * y3 +
+    1.7076146940746113 * z3;
+  const x5 = sRGBLinearToGamma(x4);
+  const y5 = sRGBLinearToGamma(y4);
+  const z5 = sRGBLinearToGamma(z4);
+  out[0] = x5;
+  out[1] = y5;
+  out[2] = z5;
+  return out;
+};
+
+export const OKLCH_to_sRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const y1 = y0 * Math.cos((z0 * Math.PI) / 180);
+  const z1 = y0 * Math.sin((z0 * Math.PI) / 180);
+  const x2 = x0 + 0.3963377773761749 * y1 + 0.2158037573099136 * z1;
+  const y2 = x0 - 0.1055613458156586 * y1 - 0.0638541728258133 * z1;
+  const z2 = x0 - 0.0894841775298119 * y1 - 1.2914855480194092 * z1;
+  const x3 = x2 * x2 * x2;
+  const y3 = y2 * y2 * y2;
+  const z3 = z2 * z2 * z2;
+  const x4 =
+    4.076741636075959 * x3 -
+    3.307711539258062 * y3 +
+    0.2309699031821041 * z3;
+  const y4 =
+    -1.2684379732850313 * x3 +
+    2.6097573492876878 * y3 -
+    0.3413193760026569 * z3;
+  const z4 =
+    -0.004196076138675526 * x3 -
+    0.703418617935936 * y3 +
+    1.7076146940746113 * z3;
+  out[0] = x4;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const OKLCH_to_DisplayP3 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const y1 = y0 * Math.cos((z0 * Math.PI) / 180);
+  const z1 = y0 * Math.sin((z0 * Math.PI) / 180);
+  const x2 = x0 + 0.3963377773761749 * y1 + 0.2158037573099136 * z1;
+  const y2 = x0 - 0.1055613458156586 * y1 - 0.0638541728258133 * z1;
+  const z2 = x0 - 0.0894841775298119 * y1 - 1.2914855480194092 * z1;
+  const x3 = x2 * x2 * x2;
+  const y3 = y2 * y2 * y2;
+  const z3 = z2 * z2 * z2;
+  const x4 =
+    3.1277689713618737 * x3 -
+    2.2571357625916395 * y3 +
+    0.1293667912297651 * z3;
+  const y4 =
+    -1.091009018437798 * x3 +
+    2.413331710306923 * y3 -
+    0.3223226918691248 * z3;
+  const z4 =
+    -0.02601080193857041 * x3 -
+    0.5080413317041669 * y3 +
+    1.5340521336427373 * z3;
+  const x5 = sRGBLinearToGamma(x4);
+  const y5 = sRGBLinearToGamma(y4);
+  const z5 = sRGBLinearToGamma(z4);
+  out[0] = x5;
+  out[1] = y5;
+  out[2] = z5;
+  return out;
+};
+
+export const OKLCH_to_DisplayP3Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const y1 = y0 * Math.cos((z0 * Math.PI) / 180);
+  const z1 = y0 * Math.sin((z0 * Math.PI) / 180);
+  const x2 = x0 + 0.3963377773761749 * y1 + 0.2158037573099136 * z1;
+  const y2 = x0 - 0.1055613458156586 * y1 - 0.0638541728258133 * z1;
+  const z2 = x0 - 0.0894841775298119 * y1 - 1.2914855480194092 * z1;
+  const x3 = x2 * x2 * x2;
+  const y3 = y2 * y2 * y2;
+  const z3 = z2 * z2 * z2;
+  const x4 =
+    3.1277689713618737 * x3 -
+    2.2571357625916395 * y3 +
+    0.1293667912297651 * z3;
+  const y4 =
+    -1.091009018437798 * x3 +
+    2.413331710306923 * y3 -
+    0.3223226918691248 * z3;
+  const z4 =
+    -0.02601080193857041 * x3 -
+    0.5080413317041669 * y3 +
+    1.5340521336427373 * z3;
+  out[0] = x4;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const OKLCH_to_Rec2020 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const y1 = y0 * Math.cos((z0 * Math.PI) / 180);
+  const z1 = y0 * Math.sin((z0 * Math.PI) / 180);
+  const x2 = x0 + 0.3963377773761749 * y1 + 0.2158037573099136 * z1;
+  const y2 = x0 - 0.1055613458156586 * y1 - 0.0638541728258133 * z1;
+  const z2 = x0 - 0.0894841775298119 * y1 - 1.2914855480194092 * z1;
+  const x3 = x2 * x2 * x2;
+  const y3 = y2 * y2 * y2;
+  const z3 = z2 * z2 * z2;
+  const x4 =
+    2.1399067304346513 * x3 -
+    1.246389493760618 * y3 +
+    0.10648276332596689 * z3;
+  const y4 =
+    -0.8847358357577675 * x3 +
+    2.1632309383612007 * y3 -
+    0.27849510260343363 * z3;
+  const z4 =
+    -0.04857374640044396 * x3 -
+    0.45450314971409633 * y3 +
+    1.5030768961145404 * z3;
+  const x5 = Rec2020ToGamma(x4);
+  const y5 = Rec2020ToGamma(y4);
+  const z5 = Rec2020ToGamma(z4);
+  out[0] = x5;
+  out[1] = y5;
+  out[2] = z5;
+  return out;
+};
+
+export const OKLCH_to_Rec2020Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const y1 = y0 * Math.cos((z0 * Math.PI) / 180);
+  const z1 = y0 * Math.sin((z0 * Math.PI) / 180);
+  const x2 = x0 + 0.3963377773761749 * y1 + 0.2158037573099136 * z1;
+  const y2 = x0 - 0.1055613458156586 * y1 - 0.0638541728258133 * z1;
+  const z2 = x0 - 0.0894841775298119 * y1 - 1.2914855480194092 * z1;
+  const x3 = x2 * x2 * x2;
+  const y3 = y2 * y2 * y2;
+  const z3 = z2 * z2 * z2;
+  const x4 =
+    2.1399067304346513 * x3 -
+    1.246389493760618 * y3 +
+    0.10648276332596689 * z3;
+  const y4 =
+    -0.8847358357577675 * x3 +
+    2.1632309383612007 * y3 -
+    0.27849510260343363 * z3;
+  const z4 =
+    -0.04857374640044396 * x3 -
+    0.45450314971409633 * y3 +
+    1.5030768961145404 * z3;
+  out[0] = x4;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const OKLCH_to_A98RGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const y1 = y0 * Math.cos((z0 * Math.PI) / 180);
+  const z1 = y0 * Math.sin((z0 * Math.PI) / 180);
+  const x2 = x0 + 0.3963377773761749 * y1 + 0.2158037573099136 * z1;
+  const y2 = x0 - 0.1055613458156586 * y1 - 0.0638541728258133 * z1;
+  const z2 = x0 - 0.0894841775298119 * y1 - 1.2914855480194092 * z1;
+  const x3 = x2 * x2 * x2;
+  const y3 = y2 * y2 * y2;
+  const z3 = z2 * z2 * z2;
+  const x4 =
+    2.554036838611556 * x3 -
+    1.6219761806828696 * y3 +
+    0.06793934207131354 * z3;
+  const y4 =
+    -1.2684379732850315 * x3 +
+    2.6097573492876887 * y3 -
+    0.3413193760026572 * z3;
+  const z4 =
+    -0.0562347359374939 * x3 -
+    0.5670418395669057 * y3 +
+    1.6232765755043994 * z3;
+  const x5 = A98RGBToGamma(x4);
+  const y5 = A98RGBToGamma(y4);
+  const z5 = A98RGBToGamma(z4);
+  out[0] = x5;
+  out[1] = y5;
+  out[2] = z5;
+  return out;
+};
+
+export const OKLCH_to_A98RGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const y1 = y0 * Math.cos((z0 * Math.PI) / 180);
+  const z1 = y0 * Math.sin((z0 * Math.PI) / 180);
+  const x2 = x0 + 0.3963377773761749 * y1 + 0.2158037573099136 * z1;
+  const y2 = x0 - 0.1055613458156586 * y1 - 0.0638541728258133 * z1;
+  const z2 = x0 - 0.0894841775298119 * y1 - 1.2914855480194092 * z1;
+  const x3 = x2 * x2 * x2;
+  const y3 = y2 * y2 * y2;
+  const z3 = z2 * z2 * z2;
+  const x4 =
+    2.554036838611556 * x3 -
+    1.6219761806828696 * y3 +
+    0.06793934207131354 * z3;
+  const y4 =
+    -1.2684379732850315 * x3 +
+    2.6097573492876887 * y3 -
+    0.3413193760026572 * z3;
+  const z4 =
+    -0.0562347359374939 * x3 -
+    0.5670418395669057 * y3 +
+    1.6232765755043994 * z3;
+  out[0] = x4;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const OKLCH_to_ProPhotoRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const y1 = y0 * Math.cos((z0 * Math.PI) / 180);
+  const z1 = y0 * Math.sin((z0 * Math.PI) / 180);
+  const x2 = x0 + 0.3963377773761749 * y1 + 0.2158037573099136 * z1;
+  const y2 = x0 - 0.1055613458156586 * y1 - 0.0638541728258133 * z1;
+  const z2 = x0 - 0.0894841775298119 * y1 - 1.2914855480194092 * z1;
+  const x3 = x2 * x2 * x2;
+  const y3 = y2 * y2 * y2;
+  const z3 = z2 * z2 * z2;
+  const x4 =
+    1.7383551481157213 * x3 -
+    0.9879509427514458 * y3 +
+    0.24959579463572504 * z3;
+  const y4 =
+    -0.7070494015329266 * x3 +
+    1.934370044440138 * y3 -
+    0.22732064290721157 * z3;
+  const z4 =
+    -0.08407882206239632 * x3 -
+    0.3575406052114133 * y3 +
+    1.4416194272738097 * z3;
+  const x5 = ProPhotoRGBToGamma(x4);
+  const y5 = ProPhotoRGBToGamma(y4);
+  const z5 = ProPhotoRGBToGamma(z4);
+  out[0] = x5;
+  out[1] = y5;
+  out[2] = z5;
+  return out;
+};
+
+export const OKLCH_to_ProPhotoRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const y1 = y0 * Math.cos((z0 * Math.PI) / 180);
+  const z1 = y0 * Math.sin((z0 * Math.PI) / 180);
+  const x2 = x0 + 0.3963377773761749 * y1 + 0.2158037573099136 * z1;
+  const y2 = x0 - 0.1055613458156586 * y1 - 0.0638541728258133 * z1;
+  const z2 = x0 - 0.0894841775298119 * y1 - 1.2914855480194092 * z1;
+  const x3 = x2 * x2 * x2;
+  const y3 = y2 * y2 * y2;
+  const z3 = z2 * z2 * z2;
+  const x4 =
+    1.7383551481157213 * x3 -
+    0.9879509427514458 * y3 +
+    0.24959579463572504 * z3;
+  const y4 =
+    -0.7070494015329266 * x3 +
+    1.934370044440138 * y3 -
+    0.22732064290721157 * z3;
+  const z4 =
+    -0.08407882206239632 * x3 -
+    0.3575406052114133 * y3 +
+    1.4416194272738097 * z3;
+  out[0] = x4;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const sRGB_to_XYZ = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 =
+    0.4123907992659595 * x1 +
+    0.35758433938387796 * y1 +
+    0.1804807884018343 * z1;
+  const y2 =
+    0.21263900587151036 * x1 +
+    0.7151686787677559 * y1 +
+    0.07219231536073371 * z1;
+  const z2 =
+    0.01933081871559185 * x1 +
+    0.11919477979462599 * y1 +
+    0.9505321522496606 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const sRGB_to_XYZD50 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 =
+    0.43606574687426947 * x1 +
+    0.3851515095901597 * y1 +
+    0.1430784199651387 * z1;
+  const y2 =
+    0.22249317711056527 * x1 +
+    0.7168870130944824 * y1 +
+    0.060619809794952365 * z1;
+  const z2 =
+    0.013923921463169401 * x1 +
+    0.09708132423141017 * y1 +
+    0.7140993568158808 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const sRGB_to_OKLab = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 =
+    0.4122214694707629 * x1 +
+    0.5363325372617349 * y1 +
+    0.051445993267502196 * z1;
+  const y2 =
+    0.2119034958178251 * x1 +
+    0.6806995506452345 * y1 +
+    0.10739695353694051 * z1;
+  const z2 =
+    0.08830245919005637 * x1 +
+    0.2817188391361215 * y1 +
+    0.6299787016738223 * z1;
+  const x3 = Math.cbrt(x2);
+  const y3 = Math.cbrt(y2);
+  const z3 = Math.cbrt(z2);
+  const x4 =
+    0.210454268309314 * x3 +
+    0.7936177747023054 * y3 -
+    0.0040720430116193 * z3;
+  const y4 =
+    1.9779985324311684 * x3 -
+    2.42859224204858 * y3 +
+    0.450593709617411 * z3;
+  const z4 =
+    0.0259040424655478 * x3 +
+    0.7827717124575296 * y3 -
+    0.8086757549230774 * z3;
+  out[0] = x4;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const sRGB_to_OKLCH = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 =
+    0.4122214694707629 * x1 +
+    0.5363325372617349 * y1 +
+    0.051445993267502196 * z1;
+  const y2 =
+    0.2119034958178251 * x1 +
+    0.6806995506452345 * y1 +
+    0.10739695353694051 * z1;
+  const z2 =
+    0.08830245919005637 * x1 +
+    0.2817188391361215 * y1 +
+    0.6299787016738223 * z1;
+  const x3 = Math.cbrt(x2);
+  const y3 = Math.cbrt(y2);
+  const z3 = Math.cbrt(z2);
+  const x4 =
+    0.210454268309314 * x3 +
+    0.7936177747023054 * y3 -
+    0.0040720430116193 * z3;
+  const y4 =
+    1.9779985324311684 * x3 -
+    2.42859224204858 * y3 +
+    0.450593709617411 * z3;
+  const z4 =
+    0.0259040424655478 * x3 +
+    0.7827717124575296 * y3 -
+    0.8086757549230774 * z3;
+  const isAchromatic5 =
+    Math.abs(y4) < ACHROMATIC_EPSILON && Math.abs(z4) < ACHROMATIC_EPSILON;
+  const y5 = isAchromatic5 ? 0 : Math.sqrt(y4 * y4 + z4 * z4);
+  const z5 = isAchromatic5
+    ? 0
+    : constrainAngle((Math.atan2(z4, y4) * 180) / Math.PI);
+  out[0] = x4;
+  out[1] = y5;
+  out[2] = z5;
+  return out;
+};
+
+export const sRGB_to_sRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const sRGB_to_DisplayP3 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 = 0.8224619687143623 * x1 + 0.17753803128563772 * y1 + 0 * z1;
+  const y2 =
+    0.03319419885096158 * x1 +
+    0.9668058011490382 * y1 -
+    1.3877787807814457e-17 * z1;
+  const z2 =
+    0.017082630721120033 * x1 +
+    0.07239744066396347 * y1 +
+    0.9105199286149166 * z1;
+  const x3 = sRGBLinearToGamma(x2);
+  const y3 = sRGBLinearToGamma(y2);
+  const z3 = sRGBLinearToGamma(z2);
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const sRGB_to_DisplayP3Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 = 0.8224619687143623 * x1 + 0.17753803128563772 * y1 + 0 * z1;
+  const y2 =
+    0.03319419885096158 * x1 +
+    0.9668058011490382 * y1 -
+    1.3877787807814457e-17 * z1;
+  const z2 =
+    0.017082630721120033 * x1 +
+    0.07239744066396347 * y1 +
+    0.9105199286149166 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const sRGB_to_Rec2020 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 =
+    0.627403895934699 * x1 +
+    0.3292830383778836 * y1 +
+    0.043313065687417246 * z1;
+  const y2 =
+    0.06909728935823205 * x1 +
+    0.9195403950754587 * y1 +
+    0.011362315566309173 * z1;
+  const z2 =
+    0.01639143887515028 * x1 +
+    0.08801330787722576 * y1 +
+    0.895595253247624 * z1;
+  const x3 = Rec2020ToGamma(x2);
+  const y3 = Rec2020ToGamma(y2);
+  const z3 = Rec2020ToGamma(z2);
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const sRGB_to_Rec2020Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 =
+    0.627403895934699 * x1 +
+    0.3292830383778836 * y1 +
+    0.043313065687417246 * z1;
+  const y2 =
+    0.06909728935823205 * x1 +
+    0.9195403950754587 * y1 +
+    0.011362315566309173 * z1;
+  const z2 =
+    0.01639143887515028 * x1 +
+    0.08801330787722576 * y1 +
+    0.895595253247624 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const sRGB_to_A98RGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 =
+    0.7151256068556248 * x1 +
+    0.2848743931443754 * y1 +
+    5.551115123125783e-17 * z1;
+  const y2 = -5.193328406205566e-17 * x1 + y1 - 1.3877787807814457e-17 * z1;
+  const z2 =
+    -3.469446951953614e-18 * x1 +
+    0.04116194845011846 * y1 +
+    0.9588380515498816 * z1;
+  const x3 = A98RGBToGamma(x2);
+  const y3 = A98RGBToGamma(y2);
+  const z3 = A98RGBToGamma(z2);
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const sRGB_to_A98RGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 =
+    0.7151256068556248 * x1 +
+    0.2848743931443754 * y1 +
+    5.551115123125783e-17 * z1;
+  const y2 = -5.193328406205566e-17 * x1 + y1 - 1.3877787807814457e-17 * z1;
+  const z2 =
+    -3.469446951953614e-18 * x1 +
+    0.04116194845011846 * y1 +
+    0.9588380515498816 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const sRGB_to_ProPhotoRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 =
+    0.5292769776226117 * x1 +
+    0.330154501978493 * y1 +
+    0.14056852039889559 * z1;
+  const y2 =
+    0.09836585954044925 * x1 +
+    0.8734707129069617 * y1 +
+    0.02816342755258901 * z1;
+  const z2 =
+    0.016875340921386848 * x1 +
+    0.11765941425612084 * y1 +
+    0.8654652448224923 * z1;
+  const x3 = ProPhotoRGBToGamma(x2);
+  const y3 = ProPhotoRGBToGamma(y2);
+  const z3 = ProPhotoRGBToGamma(z2);
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const sRGB_to_ProPhotoRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 =
+    0.5292769776226117 * x1 +
+    0.330154501978493 * y1 +
+    0.14056852039889559 * z1;
+  const y2 =
+    0.09836585954044925 * x1 +
+    0.8734707129069617 * y1 +
+    0.02816342755258901 * z1;
+  const z2 =
+    0.016875340921386848 * x1 +
+    0.11765941425612084 * y1 +
+    0.8654652448224923 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const sRGBLinear_to_XYZ = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.4123907992659595 * x0 +
+    0.35758433938387796 * y0 +
+    0.1804807884018343 * z0;
+  const y1 =
+    0.21263900587151036 * x0 +
+    0.7151686787677559 * y0 +
+    0.07219231536073371 * z0;
+  const z1 =
+    0.01933081871559185 * x0 +
+    0.11919477979462599 * y0 +
+    0.9505321522496606 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const sRGBLinear_to_XYZD50 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.43606574687426947 * x0 +
+    0.3851515095901597 * y0 +
+    0.1430784199651387 * z0;
+  const y1 =
+    0.22249317711056527 * x0 +
+    0.7168870130944824 * y0 +
+    0.060619809794952365 * z0;
+  const z1 =
+    0.013923921463169401 * x0 +
+    0.09708132423141017 * y0 +
+    0.7140993568158808 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const sRGBLinear_to_OKLab = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.4122214694707629 * x0 +
+    0.5363325372617349 * y0 +
+    0.051445993267502196 * z0;
+  const y1 =
+    0.2119034958178251 * x0 +
+    0.6806995506452345 * y0 +
+    0.10739695353694051 * z0;
+  const z1 =
+    0.08830245919005637 * x0 +
+    0.2817188391361215 * y0 +
+    0.6299787016738223 * z0;
+  const x2 = Math.cbrt(x1);
+  const y2 = Math.cbrt(y1);
+  const z2 = Math.cbrt(z1);
+  const x3 =
+    0.210454268309314 * x2 +
+    0.7936177747023054 * y2 -
+    0.0040720430116193 * z2;
+  const y3 =
+    1.9779985324311684 * x2 -
+    2.42859224204858 * y2 +
+    0.450593709617411 * z2;
+  const z3 =
+    0.0259040424655478 * x2 +
+    0.7827717124575296 * y2 -
+    0.8086757549230774 * z2;
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const sRGBLinear_to_OKLCH = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.4122214694707629 * x0 +
+    0.5363325372617349 * y0 +
+    0.051445993267502196 * z0;
+  const y1 =
+    0.2119034958178251 * x0 +
+    0.6806995506452345 * y0 +
+    0.10739695353694051 * z0;
+  const z1 =
+    0.08830245919005637 * x0 +
+    0.2817188391361215 * y0 +
+    0.6299787016738223 * z0;
+  const x2 = Math.cbrt(x1);
+  const y2 = Math.cbrt(y1);
+  const z2 = Math.cbrt(z1);
+  const x3 =
+    0.210454268309314 * x2 +
+    0.7936177747023054 * y2 -
+    0.0040720430116193 * z2;
+  const y3 =
+    1.9779985324311684 * x2 -
+    2.42859224204858 * y2 +
+    0.450593709617411 * z2;
+  const z3 =
+    0.0259040424655478 * x2 +
+    0.7827717124575296 * y2 -
+    0.8086757549230774 * z2;
+  const isAchromatic4 =
+    Math.abs(y3) < ACHROMATIC_EPSILON && Math.abs(z3) < ACHROMATIC_EPSILON;
+  const y4 = isAchromatic4 ? 0 : Math.sqrt(y3 * y3 + z3 * z3);
+  const z4 = isAchromatic4
+    ? 0
+    : constrainAngle((Math.atan2(z3, y3) * 180) / Math.PI);
+  out[0] = x3;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const sRGBLinear_to_sRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBLinearToGamma(x0);
+  const y1 = sRGBLinearToGamma(y0);
+  const z1 = sRGBLinearToGamma(z0);
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const sRGBLinear_to_DisplayP3 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = 0.8224619687143623 * x0 + 0.17753803128563772 * y0 + 0 * z0;
+  const y1 =
+    0.03319419885096158 * x0 +
+    0.9668058011490382 * y0 -
+    1.3877787807814457e-17 * z0;
+  const z1 =
+    0.017082630721120033 * x0 +
+    0.07239744066396347 * y0 +
+    0.9105199286149166 * z0;
+  const x2 = sRGBLinearToGamma(x1);
+  const y2 = sRGBLinearToGamma(y1);
+  const z2 = sRGBLinearToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const sRGBLinear_to_DisplayP3Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = 0.8224619687143623 * x0 + 0.17753803128563772 * y0 + 0 * z0;
+  const y1 =
+    0.03319419885096158 * x0 +
+    0.9668058011490382 * y0 -
+    1.3877787807814457e-17 * z0;
+  const z1 =
+    0.017082630721120033 * x0 +
+    0.07239744066396347 * y0 +
+    0.9105199286149166 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const sRGBLinear_to_Rec2020 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.627403895934699 * x0 +
+    0.3292830383778836 * y0 +
+    0.043313065687417246 * z0;
+  const y1 =
+    0.06909728935823205 * x0 +
+    0.9195403950754587 * y0 +
+    0.011362315566309173 * z0;
+  const z1 =
+    0.01639143887515028 * x0 +
+    0.08801330787722576 * y0 +
+    0.895595253247624 * z0;
+  const x2 = Rec2020ToGamma(x1);
+  const y2 = Rec2020ToGamma(y1);
+  const z2 = Rec2020ToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const sRGBLinear_to_Rec2020Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.627403895934699 * x0 +
+    0.3292830383778836 * y0 +
+    0.043313065687417246 * z0;
+  const y1 =
+    0.06909728935823205 * x0 +
+    0.9195403950754587 * y0 +
+    0.011362315566309173 * z0;
+  const z1 =
+    0.01639143887515028 * x0 +
+    0.08801330787722576 * y0 +
+    0.895595253247624 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const sRGBLinear_to_A98RGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.7151256068556248 * x0 +
+    0.2848743931443754 * y0 +
+    5.551115123125783e-17 * z0;
+  const y1 = -5.193328406205566e-17 * x0 + y0 - 1.3877787807814457e-17 * z0;
+  const z1 =
+    -3.469446951953614e-18 * x0 +
+    0.04116194845011846 * y0 +
+    0.9588380515498816 * z0;
+  const x2 = A98RGBToGamma(x1);
+  const y2 = A98RGBToGamma(y1);
+  const z2 = A98RGBToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const sRGBLinear_to_A98RGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.7151256068556248 * x0 +
+    0.2848743931443754 * y0 +
+    5.551115123125783e-17 * z0;
+  const y1 = -5.193328406205566e-17 * x0 + y0 - 1.3877787807814457e-17 * z0;
+  const z1 =
+    -3.469446951953614e-18 * x0 +
+    0.04116194845011846 * y0 +
+    0.9588380515498816 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const sRGBLinear_to_ProPhotoRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.5292769776226117 * x0 +
+    0.330154501978493 * y0 +
+    0.14056852039889559 * z0;
+  const y1 =
+    0.09836585954044925 * x0 +
+    0.8734707129069617 * y0 +
+    0.02816342755258901 * z0;
+  const z1 =
+    0.016875340921386848 * x0 +
+    0.11765941425612084 * y0 +
+    0.8654652448224923 * z0;
+  const x2 = ProPhotoRGBToGamma(x1);
+  const y2 = ProPhotoRGBToGamma(y1);
+  const z2 = ProPhotoRGBToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const sRGBLinear_to_ProPhotoRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.5292769776226117 * x0 +
+    0.330154501978493 * y0 +
+    0.14056852039889559 * z0;
+  const y1 =
+    0.09836585954044925 * x0 +
+    0.8734707129069617 * y0 +
+    0.02816342755258901 * z0;
+  const z1 =
+    0.016875340921386848 * x0 +
+    0.11765941425612084 * y0 +
+    0.8654652448224923 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const DisplayP3_to_XYZ = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 =
+    0.48657094864821626 * x1 +
+    0.26566769316909294 * y1 +
+    0.1982172852343625 * z1;
+  const y2 =
+    0.22897456406974884 * x1 +
+    0.6917385218365062 * y1 +
+    0.079286914093745 * z1;
+  const z2 = 0 * x1 + 0.045113381858902575 * y1 + 1.0439443689009757 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const DisplayP3_to_XYZD50 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 =
+    0.5151464429681162 * x1 +
+    0.29200998206385786 * y1 +
+    0.157139251397594 * z1;
+  const y2 =
+    0.24120032212525533 * x1 +
+    0.6922225411313819 * y1 +
+    0.06657713674336295 * z1;
+  const z2 =
+    -0.0010501391471401363 * x1 +
+    0.041878270189074605 * y1 +
+    0.7842764714685259 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const DisplayP3_to_OKLab = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 =
+    0.48137985274995443 * x1 +
+    0.4621183710113181 * y1 +
+    0.05650177623872757 * z1;
+  const y2 =
+    0.22883194181124475 * x1 +
+    0.6532168193835676 * y1 +
+    0.11795123880518778 * z1;
+  const z2 =
+    0.08394575232299319 * x1 +
+    0.22416527097756642 * y1 +
+    0.6918889766994405 * z1;
+  const x3 = Math.cbrt(x2);
+  const y3 = Math.cbrt(y2);
+  const z3 = Math.cbrt(z2);
+  const x4 =
+    0.210454268309314 * x3 +
+    0.7936177747023054 * y3 -
+    0.0040720430116193 * z3;
+  const y4 =
+    1.9779985324311684 * x3 -
+    2.42859224204858 * y3 +
+    0.450593709617411 * z3;
+  const z4 =
+    0.0259040424655478 * x3 +
+    0.7827717124575296 * y3 -
+    0.8086757549230774 * z3;
+  out[0] = x4;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const DisplayP3_to_OKLCH = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 =
+    0.48137985274995443 * x1 +
+    0.4621183710113181 * y1 +
+    0.05650177623872757 * z1;
+  const y2 =
+    0.22883194181124475 * x1 +
+    0.6532168193835676 * y1 +
+    0.11795123880518778 * z1;
+  const z2 =
+    0.08394575232299319 * x1 +
+    0.22416527097756642 * y1 +
+    0.6918889766994405 * z1;
+  const x3 = Math.cbrt(x2);
+  const y3 = Math.cbrt(y2);
+  const z3 = Math.cbrt(z2);
+  const x4 =
+    0.210454268309314 * x3 +
+    0.7936177747023054 * y3 -
+    0.0040720430116193 * z3;
+  const y4 =
+    1.9779985324311684 * x3 -
+    2.42859224204858 * y3 +
+    0.450593709617411 * z3;
+  const z4 =
+    0.0259040424655478 * x3 +
+    0.7827717124575296 * y3 -
+    0.8086757549230774 * z3;
+  const isAchromatic5 =
+    Math.abs(y4) < ACHROMATIC_EPSILON && Math.abs(z4) < ACHROMATIC_EPSILON;
+  const y5 = isAchromatic5 ? 0 : Math.sqrt(y4 * y4 + z4 * z4);
+  const z5 = isAchromatic5
+    ? 0
+    : constrainAngle((Math.atan2(z4, y4) * 180) / Math.PI);
+  out[0] = x4;
+  out[1] = y5;
+  out[2] = z5;
+  return out;
+};
+
+export const DisplayP3_to_sRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 = 1.2249401762805596 * x1 - 0.22494017628055993 * y1 + 0 * z1;
+  const y2 =
+    -0.04205695470968818 * x1 +
+    1.0420569547096883 * y1 -
+    3.469446951953614e-17 * z1;
+  const z2 =
+    -0.019637554590334436 * x1 -
+    0.07863604555063189 * y1 +
+    1.0982736001409663 * z1;
+  const x3 = sRGBLinearToGamma(x2);
+  const y3 = sRGBLinearToGamma(y2);
+  const z3 = sRGBLinearToGamma(z2);
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const DisplayP3_to_sRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 = 1.2249401762805596 * x1 - 0.22494017628055993 * y1 + 0 * z1;
+  const y2 =
+    -0.04205695470968818 * x1 +
+    1.0420569547096883 * y1 -
+    3.469446951953614e-17 * z1;
+  const z2 =
+    -0.019637554590334436 * x1 -
+    0.07863604555063189 * y1 +
+    1.0982736001409663 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const DisplayP3_to_DisplayP3Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const DisplayP3_to_Rec2020 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 =
+    0.7538330343617217 * x1 +
+    0.19859736905261627 * y1 +
+    0.047569596585661844 * z1;
+  const y2 =
+    0.045743848965358325 * x1 +
+    0.9417772198116936 * y1 +
+    0.01247893122294813 * z1;
+  const z2 =
+    -0.0012103403545183251 * x1 +
+    0.017601717301089892 * y1 +
+    0.9836086230534283 * z1;
+  const x3 = Rec2020ToGamma(x2);
+  const y3 = Rec2020ToGamma(y2);
+  const z3 = Rec2020ToGamma(z2);
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const DisplayP3_to_Rec2020Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 =
+    0.7538330343617217 * x1 +
+    0.19859736905261627 * y1 +
+    0.047569596585661844 * z1;
+  const y2 =
+    0.045743848965358325 * x1 +
+    0.9417772198116936 * y1 +
+    0.01247893122294813 * z1;
+  const z2 =
+    -0.0012103403545183251 * x1 +
+    0.017601717301089892 * y1 +
+    0.9836086230534283 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const DisplayP3_to_A98RGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 =
+    0.8640051374740483 * x1 +
+    0.13599486252595158 * y1 +
+    5.551115123125783e-17 * z1;
+  const y2 =
+    -0.04205695470968818 * x1 +
+    1.0420569547096883 * y1 -
+    3.469446951953614e-17 * z1;
+  const z2 =
+    -0.02056038078232985 * x1 -
+    0.032506138045508 * y1 +
+    1.0530665188278379 * z1;
+  const x3 = A98RGBToGamma(x2);
+  const y3 = A98RGBToGamma(y2);
+  const z3 = A98RGBToGamma(z2);
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const DisplayP3_to_A98RGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 =
+    0.8640051374740483 * x1 +
+    0.13599486252595158 * y1 +
+    5.551115123125783e-17 * z1;
+  const y2 =
+    -0.04205695470968818 * x1 +
+    1.0420569547096883 * y1 -
+    3.469446951953614e-17 * z1;
+  const z2 =
+    -0.02056038078232985 * x1 -
+    0.032506138045508 * y1 +
+    1.0530665188278379 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const DisplayP3_to_ProPhotoRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 =
+    0.6316869193403591 * x1 +
+    0.2139303856946574 * y1 +
+    0.1543826949649839 * z1;
+  const y2 =
+    0.08320371426648465 * x1 +
+    0.8858651367630241 * y1 +
+    0.030931148970491238 * z1;
+  const z2 =
+    -0.001272734564738806 * x1 +
+    0.05075510433665735 * y1 +
+    0.9505176302280814 * z1;
+  const x3 = ProPhotoRGBToGamma(x2);
+  const y3 = ProPhotoRGBToGamma(y2);
+  const z3 = ProPhotoRGBToGamma(z2);
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const DisplayP3_to_ProPhotoRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBGammaToLinear(x0);
+  const y1 = sRGBGammaToLinear(y0);
+  const z1 = sRGBGammaToLinear(z0);
+  const x2 =
+    0.6316869193403591 * x1 +
+    0.2139303856946574 * y1 +
+    0.1543826949649839 * z1;
+  const y2 =
+    0.08320371426648465 * x1 +
+    0.8858651367630241 * y1 +
+    0.030931148970491238 * z1;
+  const z2 =
+    -0.001272734564738806 * x1 +
+    0.05075510433665735 * y1 +
+    0.9505176302280814 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const DisplayP3Linear_to_XYZ = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.48657094864821626 * x0 +
+    0.26566769316909294 * y0 +
+    0.1982172852343625 * z0;
+  const y1 =
+    0.22897456406974884 * x0 +
+    0.6917385218365062 * y0 +
+    0.079286914093745 * z0;
+  const z1 = 0 * x0 + 0.045113381858902575 * y0 + 1.0439443689009757 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const DisplayP3Linear_to_XYZD50 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.5151464429681162 * x0 +
+    0.29200998206385786 * y0 +
+    0.157139251397594 * z0;
+  const y1 =
+    0.24120032212525533 * x0 +
+    0.6922225411313819 * y0 +
+    0.06657713674336295 * z0;
+  const z1 =
+    -0.0010501391471401363 * x0 +
+    0.041878270189074605 * y0 +
+    0.7842764714685259 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const DisplayP3Linear_to_OKLab = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.48137985274995443 * x0 +
+    0.4621183710113181 * y0 +
+    0.05650177623872757 * z0;
+  const y1 =
+    0.22883194181124475 * x0 +
+    0.6532168193835676 * y0 +
+    0.11795123880518778 * z0;
+  const z1 =
+    0.08394575232299319 * x0 +
+    0.22416527097756642 * y0 +
+    0.6918889766994405 * z0;
+  const x2 = Math.cbrt(x1);
+  const y2 = Math.cbrt(y1);
+  const z2 = Math.cbrt(z1);
+  const x3 =
+    0.210454268309314 * x2 +
+    0.7936177747023054 * y2 -
+    0.0040720430116193 * z2;
+  const y3 =
+    1.9779985324311684 * x2 -
+    2.42859224204858 * y2 +
+    0.450593709617411 * z2;
+  const z3 =
+    0.0259040424655478 * x2 +
+    0.7827717124575296 * y2 -
+    0.8086757549230774 * z2;
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const DisplayP3Linear_to_OKLCH = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.48137985274995443 * x0 +
+    0.4621183710113181 * y0 +
+    0.05650177623872757 * z0;
+  const y1 =
+    0.22883194181124475 * x0 +
+    0.6532168193835676 * y0 +
+    0.11795123880518778 * z0;
+  const z1 =
+    0.08394575232299319 * x0 +
+    0.22416527097756642 * y0 +
+    0.6918889766994405 * z0;
+  const x2 = Math.cbrt(x1);
+  const y2 = Math.cbrt(y1);
+  const z2 = Math.cbrt(z1);
+  const x3 =
+    0.210454268309314 * x2 +
+    0.7936177747023054 * y2 -
+    0.0040720430116193 * z2;
+  const y3 =
+    1.9779985324311684 * x2 -
+    2.42859224204858 * y2 +
+    0.450593709617411 * z2;
+  const z3 =
+    0.0259040424655478 * x2 +
+    0.7827717124575296 * y2 -
+    0.8086757549230774 * z2;
+  const isAchromatic4 =
+    Math.abs(y3) < ACHROMATIC_EPSILON && Math.abs(z3) < ACHROMATIC_EPSILON;
+  const y4 = isAchromatic4 ? 0 : Math.sqrt(y3 * y3 + z3 * z3);
+  const z4 = isAchromatic4
+    ? 0
+    : constrainAngle((Math.atan2(z3, y3) * 180) / Math.PI);
+  out[0] = x3;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const DisplayP3Linear_to_sRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = 1.2249401762805596 * x0 - 0.22494017628055993 * y0 + 0 * z0;
+  const y1 =
+    -0.04205695470968818 * x0 +
+    1.0420569547096883 * y0 -
+    3.469446951953614e-17 * z0;
+  const z1 =
+    -0.019637554590334436 * x0 -
+    0.07863604555063189 * y0 +
+    1.0982736001409663 * z0;
+  const x2 = sRGBLinearToGamma(x1);
+  const y2 = sRGBLinearToGamma(y1);
+  const z2 = sRGBLinearToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const DisplayP3Linear_to_sRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = 1.2249401762805596 * x0 - 0.22494017628055993 * y0 + 0 * z0;
+  const y1 =
+    -0.04205695470968818 * x0 +
+    1.0420569547096883 * y0 -
+    3.469446951953614e-17 * z0;
+  const z1 =
+    -0.019637554590334436 * x0 -
+    0.07863604555063189 * y0 +
+    1.0982736001409663 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const DisplayP3Linear_to_DisplayP3 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = sRGBLinearToGamma(x0);
+  const y1 = sRGBLinearToGamma(y0);
+  const z1 = sRGBLinearToGamma(z0);
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const DisplayP3Linear_to_Rec2020 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.7538330343617217 * x0 +
+    0.19859736905261627 * y0 +
+    0.047569596585661844 * z0;
+  const y1 =
+    0.045743848965358325 * x0 +
+    0.9417772198116936 * y0 +
+    0.01247893122294813 * z0;
+  const z1 =
+    -0.0012103403545183251 * x0 +
+    0.017601717301089892 * y0 +
+    0.9836086230534283 * z0;
+  const x2 = Rec2020ToGamma(x1);
+  const y2 = Rec2020ToGamma(y1);
+  const z2 = Rec2020ToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const DisplayP3Linear_to_Rec2020Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.7538330343617217 * x0 +
+    0.19859736905261627 * y0 +
+    0.047569596585661844 * z0;
+  const y1 =
+    0.045743848965358325 * x0 +
+    0.9417772198116936 * y0 +
+    0.01247893122294813 * z0;
+  const z1 =
+    -0.0012103403545183251 * x0 +
+    0.017601717301089892 * y0 +
+    0.9836086230534283 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const DisplayP3Linear_to_A98RGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.8640051374740483 * x0 +
+    0.13599486252595158 * y0 +
+    5.551115123125783e-17 * z0;
+  const y1 =
+    -0.04205695470968818 * x0 +
+    1.0420569547096883 * y0 -
+    3.469446951953614e-17 * z0;
+  const z1 =
+    -0.02056038078232985 * x0 -
+    0.032506138045508 * y0 +
+    1.0530665188278379 * z0;
+  const x2 = A98RGBToGamma(x1);
+  const y2 = A98RGBToGamma(y1);
+  const z2 = A98RGBToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const DisplayP3Linear_to_A98RGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.8640051374740483 * x0 +
+    0.13599486252595158 * y0 +
+    5.551115123125783e-17 * z0;
+  const y1 =
+    -0.04205695470968818 * x0 +
+    1.0420569547096883 * y0 -
+    3.469446951953614e-17 * z0;
+  const z1 =
+    -0.02056038078232985 * x0 -
+    0.032506138045508 * y0 +
+    1.0530665188278379 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const DisplayP3Linear_to_ProPhotoRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.6316869193403591 * x0 +
+    0.2139303856946574 * y0 +
+    0.1543826949649839 * z0;
+  const y1 =
+    0.08320371426648465 * x0 +
+    0.8858651367630241 * y0 +
+    0.030931148970491238 * z0;
+  const z1 =
+    -0.001272734564738806 * x0 +
+    0.05075510433665735 * y0 +
+    0.9505176302280814 * z0;
+  const x2 = ProPhotoRGBToGamma(x1);
+  const y2 = ProPhotoRGBToGamma(y1);
+  const z2 = ProPhotoRGBToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const DisplayP3Linear_to_ProPhotoRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.6316869193403591 * x0 +
+    0.2139303856946574 * y0 +
+    0.1543826949649839 * z0;
+  const y1 =
+    0.08320371426648465 * x0 +
+    0.8858651367630241 * y0 +
+    0.030931148970491238 * z0;
+  const z1 =
+    -0.001272734564738806 * x0 +
+    0.05075510433665735 * y0 +
+    0.9505176302280814 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const Rec2020_to_XYZ = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = Rec2020ToLinear(x0);
+  const y1 = Rec2020ToLinear(y0);
+  const z1 = Rec2020ToLinear(z0);
+  const x2 =
+    0.6369580483012913 * x1 +
+    0.14461690358620838 * y1 +
+    0.16888097516417205 * z1;
+  const y2 =
+    0.26270021201126703 * x1 +
+    0.677998071518871 * y1 +
+    0.059301716469861945 * z1;
+  const z2 = 0 * x1 + 0.028072693049087508 * y1 + 1.0609850577107909 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const Rec2020_to_XYZD50 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = Rec2020ToLinear(x0);
+  const y1 = Rec2020ToLinear(y0);
+  const z1 = Rec2020ToLinear(z0);
+  const x2 =
+    0.6735154631882763 * x1 +
+    0.16569726370390464 * y1 +
+    0.12508294953738708 * z1;
+  const y2 =
+    0.27905900514112075 * x1 +
+    0.6753180057491098 * y1 +
+    0.04562298910976964 * z1;
+  const z2 =
+    -0.00193242713400438 * x1 +
+    0.029977826792829232 * y1 +
+    0.7970592028516355 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const Rec2020_to_OKLab = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = Rec2020ToLinear(x0);
+  const y1 = Rec2020ToLinear(y0);
+  const z1 = Rec2020ToLinear(z0);
+  const x2 =
+    0.6167557848654444 * x1 +
+    0.3601984012264634 * y1 +
+    0.023045813908092266 * z1;
+  const y2 =
+    0.26513305939263676 * x1 +
+    0.6358393720678492 * y1 +
+    0.09902756853951414 * z1;
+  const z2 =
+    0.10010262952034828 * x1 +
+    0.20390652261661452 * y1 +
+    0.6959908478630372 * z1;
+  const x3 = Math.cbrt(x2);
+  const y3 = Math.cbrt(y2);
+  const z3 = Math.cbrt(z2);
+  const x4 =
+    0.210454268309314 * x3 +
+    0.7936177747023054 * y3 -
+    0.0040720430116193 * z3;
+  const y4 =
+    1.9779985324311684 * x3 -
+    2.42859224204858 * y3 +
+    0.450593709617411 * z3;
+  const z4 =
+    0.0259040424655478 * x3 +
+    0.7827717124575296 * y3 -
+    0.8086757549230774 * z3;
+  out[0] = x4;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const Rec2020_to_OKLCH = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = Rec2020ToLinear(x0);
+  const y1 = Rec2020ToLinear(y0);
+  const z1 = Rec2020ToLinear(z0);
+  const x2 =
+    0.6167557848654444 * x1 +
+    0.3601984012264634 * y1 +
+    0.023045813908092266 * z1;
+  const y2 =
+    0.26513305939263676 * x1 +
+    0.6358393720678492 * y1 +
+    0.09902756853951414 * z1;
+  const z2 =
+    0.10010262952034828 * x1 +
+    0.20390652261661452 * y1 +
+    0.6959908478630372 * z1;
+  const x3 = Math.cbrt(x2);
+  const y3 = Math.cbrt(y2);
+  const z3 = Math.cbrt(z2);
+  const x4 =
+    0.210454268309314 * x3 +
+    0.7936177747023054 * y3 -
+    0.0040720430116193 * z3;
+  const y4 =
+    1.9779985324311684 * x3 -
+    2.42859224204858 * y3 +
+    0.450593709617411 * z3;
+  const z4 =
+    0.0259040424655478 * x3 +
+    0.7827717124575296 * y3 -
+    0.8086757549230774 * z3;
+  const isAchromatic5 =
+    Math.abs(y4) < ACHROMATIC_EPSILON && Math.abs(z4) < ACHROMATIC_EPSILON;
+  const y5 = isAchromatic5 ? 0 : Math.sqrt(y4 * y4 + z4 * z4);
+  const z5 = isAchromatic5
+    ? 0
+    : constrainAngle((Math.atan2(z4, y4) * 180) / Math.PI);
+  out[0] = x4;
+  out[1] = y5;
+  out[2] = z5;
+  return out;
+};
+
+export const Rec2020_to_sRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = Rec2020ToLinear(x0);
+  const y1 = Rec2020ToLinear(y0);
+  const z1 = Rec2020ToLinear(z0);
+  const x2 =
+    1.6604910021084343 * x1 -
+    0.5876411387885496 * y1 -
+    0.0728498633198848 * z1;
+  const y2 =
+    -0.12455047452159085 * x1 +
+    1.1328998971259603 * y1 -
+    0.008349422604369473 * z1;
+  const z2 =
+    -0.018150763354905307 * x1 -
+    0.10057889800800737 * y1 +
+    1.1187296613629127 * z1;
+  const x3 = sRGBLinearToGamma(x2);
+  const y3 = sRGBLinearToGamma(y2);
+  const z3 = sRGBLinearToGamma(z2);
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const Rec2020_to_sRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = Rec2020ToLinear(x0);
+  const y1 = Rec2020ToLinear(y0);
+  const z1 = Rec2020ToLinear(z0);
+  const x2 =
+    1.6604910021084343 * x1 -
+    0.5876411387885496 * y1 -
+    0.0728498633198848 * z1;
+  const y2 =
+    -0.12455047452159085 * x1 +
+    1.1328998971259603 * y1 -
+    0.008349422604369473 * z1;
+  const z2 =
+    -0.018150763354905307 * x1 -
+    0.10057889800800737 * y1 +
+    1.1187296613629127 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const Rec2020_to_DisplayP3 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = Rec2020ToLinear(x0);
+  const y1 = Rec2020ToLinear(y0);
+  const z1 = Rec2020ToLinear(z0);
+  const x2 =
+    1.343578252584332 * x1 -
+    0.28217967052613574 * y1 -
+    0.06139858205819637 * z1;
+  const y2 =
+    -0.06529745278911964 * x1 +
+    1.0757879158485744 * y1 -
+    0.01049046305945497 * z1;
+  const z2 =
+    0.0028217872617009553 * x1 -
+    0.01959849452449406 * y1 +
+    1.0167767072627931 * z1;
+  const x3 = sRGBLinearToGamma(x2);
+  const y3 = sRGBLinearToGamma(y2);
+  const z3 = sRGBLinearToGamma(z2);
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const Rec2020_to_DisplayP3Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = Rec2020ToLinear(x0);
+  const y1 = Rec2020ToLinear(y0);
+  const z1 = Rec2020ToLinear(z0);
+  const x2 =
+    1.343578252584332 * x1 -
+    0.28217967052613574 * y1 -
+    0.06139858205819637 * z1;
+  const y2 =
+    -0.06529745278911964 * x1 +
+    1.0757879158485744 * y1 -
+    0.01049046305945497 * z1;
+  const z2 =
+    0.0028217872617009553 * x1 -
+    0.01959849452449406 * y1 +
+    1.0167767072627931 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const Rec2020_to_Rec2020Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = Rec2020ToLinear(x0);
+  const y1 = Rec2020ToLinear(y0);
+  const z1 = Rec2020ToLinear(z0);
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const Rec2020_to_A98RGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = Rec2020ToLinear(x0);
+  const y1 = Rec2020ToLinear(y0);
+  const z1 = Rec2020ToLinear(z0);
+  const x2 =
+    1.1519783947159163 * x1 -
+    0.09750305530240859 * y1 -
+    0.054475339413507684 * z1;
+  const y2 =
+    -0.12455047452159085 * x1 +
+    1.1328998971259603 * y1 -
+    0.008349422604369473 * z1;
+  const z2 =
+    -0.022530382781055906 * x1 -
+    0.04980650742838877 * y1 +
+    1.0723368902094446 * z1;
+  const x3 = A98RGBToGamma(x2);
+  const y3 = A98RGBToGamma(y2);
+  const z3 = A98RGBToGamma(z2);
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const Rec2020_to_A98RGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = Rec2020ToLinear(x0);
+  const y1 = Rec2020ToLinear(y0);
+  const z1 = Rec2020ToLinear(z0);
+  const x2 =
+    1.1519783947159163 * x1 -
+    0.09750305530240859 * y1 -
+    0.054475339413507684 * z1;
+  const y2 =
+    -0.12455047452159085 * x1 +
+    1.1328998971259603 * y1 -
+    0.008349422604369473 * z1;
+  const z2 =
+    -0.022530382781055906 * x1 -
+    0.04980650742838877 * y1 +
+    1.0723368902094446 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const Rec2020_to_ProPhotoRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = Rec2020ToLinear(x0);
+  const y1 = Rec2020ToLinear(y0);
+  const z1 = Rec2020ToLinear(z0);
+  const x2 =
+    0.8351873331297236 * x1 +
+    0.04886884858605711 * y1 +
+    0.11594381828421954 * z1;
+  const y2 =
+    0.05403324519953381 * x1 +
+    0.9289184085692044 * y1 +
+    0.017048346231262015 * z1;
+  const z2 =
+    -0.0023420389707253897 * x1 +
+    0.03633215316169466 * y1 +
+    0.9660098858090307 * z1;
+  const x3 = ProPhotoRGBToGamma(x2);
+  const y3 = ProPhotoRGBToGamma(y2);
+  const z3 = ProPhotoRGBToGamma(z2);
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const Rec2020_to_ProPhotoRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = Rec2020ToLinear(x0);
+  const y1 = Rec2020ToLinear(y0);
+  const z1 = Rec2020ToLinear(z0);
+  const x2 =
+    0.8351873331297236 * x1 +
+    0.04886884858605711 * y1 +
+    0.11594381828421954 * z1;
+  const y2 =
+    0.05403324519953381 * x1 +
+    0.9289184085692044 * y1 +
+    0.017048346231262015 * z1;
+  const z2 =
+    -0.0023420389707253897 * x1 +
+    0.03633215316169466 * y1 +
+    0.9660098858090307 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const Rec2020Linear_to_XYZ = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.6369580483012913 * x0 +
+    0.14461690358620838 * y0 +
+    0.16888097516417205 * z0;
+  const y1 =
+    0.26270021201126703 * x0 +
+    0.677998071518871 * y0 +
+    0.059301716469861945 * z0;
+  const z1 = 0 * x0 + 0.028072693049087508 * y0 + 1.0609850577107909 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const Rec2020Linear_to_XYZD50 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.6735154631882763 * x0 +
+    0.16569726370390464 * y0 +
+    0.12508294953738708 * z0;
+  const y1 =
+    0.27905900514112075 * x0 +
+    0.6753180057491098 * y0 +
+    0.04562298910976964 * z0;
+  const z1 =
+    -0.00193242713400438 * x0 +
+    0.029977826792829232 * y0 +
+    0.7970592028516355 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const Rec2020Linear_to_OKLab = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.6167557848654444 * x0 +
+    0.3601984012264634 * y0 +
+    0.023045813908092266 * z0;
+  const y1 =
+    0.26513305939263676 * x0 +
+    0.6358393720678492 * y0 +
+    0.09902756853951414 * z0;
+  const z1 =
+    0.10010262952034828 * x0 +
+    0.20390652261661452 * y0 +
+    0.6959908478630372 * z0;
+  const x2 = Math.cbrt(x1);
+  const y2 = Math.cbrt(y1);
+  const z2 = Math.cbrt(z1);
+  const x3 =
+    0.210454268309314 * x2 +
+    0.7936177747023054 * y2 -
+    0.0040720430116193 * z2;
+  const y3 =
+    1.9779985324311684 * x2 -
+    2.42859224204858 * y2 +
+    0.450593709617411 * z2;
+  const z3 =
+    0.0259040424655478 * x2 +
+    0.7827717124575296 * y2 -
+    0.8086757549230774 * z2;
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const Rec2020Linear_to_OKLCH = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.6167557848654444 * x0 +
+    0.3601984012264634 * y0 +
+    0.023045813908092266 * z0;
+  const y1 =
+    0.26513305939263676 * x0 +
+    0.6358393720678492 * y0 +
+    0.09902756853951414 * z0;
+  const z1 =
+    0.10010262952034828 * x0 +
+    0.20390652261661452 * y0 +
+    0.6959908478630372 * z0;
+  const x2 = Math.cbrt(x1);
+  const y2 = Math.cbrt(y1);
+  const z2 = Math.cbrt(z1);
+  const x3 =
+    0.210454268309314 * x2 +
+    0.7936177747023054 * y2 -
+    0.0040720430116193 * z2;
+  const y3 =
+    1.9779985324311684 * x2 -
+    2.42859224204858 * y2 +
+    0.450593709617411 * z2;
+  const z3 =
+    0.0259040424655478 * x2 +
+    0.7827717124575296 * y2 -
+    0.8086757549230774 * z2;
+  const isAchromatic4 =
+    Math.abs(y3) < ACHROMATIC_EPSILON && Math.abs(z3) < ACHROMATIC_EPSILON;
+  const y4 = isAchromatic4 ? 0 : Math.sqrt(y3 * y3 + z3 * z3);
+  const z4 = isAchromatic4
+    ? 0
+    : constrainAngle((Math.atan2(z3, y3) * 180) / Math.PI);
+  out[0] = x3;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const Rec2020Linear_to_sRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.6604910021084343 * x0 -
+    0.5876411387885496 * y0 -
+    0.0728498633198848 * z0;
+  const y1 =
+    -0.12455047452159085 * x0 +
+    1.1328998971259603 * y0 -
+    0.008349422604369473 * z0;
+  const z1 =
+    -0.018150763354905307 * x0 -
+    0.10057889800800737 * y0 +
+    1.1187296613629127 * z0;
+  const x2 = sRGBLinearToGamma(x1);
+  const y2 = sRGBLinearToGamma(y1);
+  const z2 = sRGBLinearToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const Rec2020Linear_to_sRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.6604910021084343 * x0 -
+    0.5876411387885496 * y0 -
+    0.0728498633198848 * z0;
+  const y1 =
+    -0.12455047452159085 * x0 +
+    1.1328998971259603 * y0 -
+    0.008349422604369473 * z0;
+  const z1 =
+    -0.018150763354905307 * x0 -
+    0.10057889800800737 * y0 +
+    1.1187296613629127 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const Rec2020Linear_to_DisplayP3 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.343578252584332 * x0 -
+    0.28217967052613574 * y0 -
+    0.06139858205819637 * z0;
+  const y1 =
+    -0.06529745278911964 * x0 +
+    1.0757879158485744 * y0 -
+    0.01049046305945497 * z0;
+  const z1 =
+    0.0028217872617009553 * x0 -
+    0.01959849452449406 * y0 +
+    1.0167767072627931 * z0;
+  const x2 = sRGBLinearToGamma(x1);
+  const y2 = sRGBLinearToGamma(y1);
+  const z2 = sRGBLinearToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const Rec2020Linear_to_DisplayP3Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.343578252584332 * x0 -
+    0.28217967052613574 * y0 -
+    0.06139858205819637 * z0;
+  const y1 =
+    -0.06529745278911964 * x0 +
+    1.0757879158485744 * y0 -
+    0.01049046305945497 * z0;
+  const z1 =
+    0.0028217872617009553 * x0 -
+    0.01959849452449406 * y0 +
+    1.0167767072627931 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const Rec2020Linear_to_Rec2020 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = Rec2020ToGamma(x0);
+  const y1 = Rec2020ToGamma(y0);
+  const z1 = Rec2020ToGamma(z0);
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const Rec2020Linear_to_A98RGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.1519783947159163 * x0 -
+    0.09750305530240859 * y0 -
+    0.054475339413507684 * z0;
+  const y1 =
+    -0.12455047452159085 * x0 +
+    1.1328998971259603 * y0 -
+    0.008349422604369473 * z0;
+  const z1 =
+    -0.022530382781055906 * x0 -
+    0.04980650742838877 * y0 +
+    1.0723368902094446 * z0;
+  const x2 = A98RGBToGamma(x1);
+  const y2 = A98RGBToGamma(y1);
+  const z2 = A98RGBToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const Rec2020Linear_to_A98RGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.1519783947159163 * x0 -
+    0.09750305530240859 * y0 -
+    0.054475339413507684 * z0;
+  const y1 =
+    -0.12455047452159085 * x0 +
+    1.1328998971259603 * y0 -
+    0.008349422604369473 * z0;
+  const z1 =
+    -0.022530382781055906 * x0 -
+    0.04980650742838877 * y0 +
+    1.0723368902094446 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const Rec2020Linear_to_ProPhotoRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.8351873331297236 * x0 +
+    0.04886884858605711 * y0 +
+    0.11594381828421954 * z0;
+  const y1 =
+    0.05403324519953381 * x0 +
+    0.9289184085692044 * y0 +
+    0.017048346231262015 * z0;
+  const z1 =
+    -0.0023420389707253897 * x0 +
+    0.03633215316169466 * y0 +
+    0.9660098858090307 * z0;
+  const x2 = ProPhotoRGBToGamma(x1);
+  const y2 = ProPhotoRGBToGamma(y1);
+  const z2 = ProPhotoRGBToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const Rec2020Linear_to_ProPhotoRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.8351873331297236 * x0 +
+    0.04886884858605711 * y0 +
+    0.11594381828421954 * z0;
+  const y1 =
+    0.05403324519953381 * x0 +
+    0.9289184085692044 * y0 +
+    0.017048346231262015 * z0;
+  const z1 =
+    -0.0023420389707253897 * x0 +
+    0.03633215316169466 * y0 +
+    0.9660098858090307 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const A98RGB_to_XYZ = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = A98RGBToLinear(x0);
+  const y1 = A98RGBToLinear(y0);
+  const z1 = A98RGBToLinear(z0);
+  const x2 =
+    0.5766690429101308 * x1 +
+    0.18555823790654627 * y1 +
+    0.18822864623499472 * z1;
+  const y2 =
+    0.29734497525053616 * x1 +
+    0.627363566255466 * y1 +
+    0.07529145849399789 * z1;
+  const z2 =
+    0.027031361386412378 * x1 +
+    0.07068885253582714 * y1 +
+    0.9913375368376389 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const A98RGB_to_XYZD50 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = A98RGBToLinear(x0);
+  const y1 = A98RGBToLinear(y0);
+  const z1 = A98RGBToLinear(z0);
+  const x2 =
+    0.6097750418861816 * x1 +
+    0.20530000261929413 * y1 +
+    0.14922063192409227 * z1;
+  const y2 =
+    0.3111246122046417 * x1 +
+    0.6256532308346855 * y1 +
+    0.06322215696067288 * z1;
+  const z2 =
+    0.019470595556481698 * x1 +
+    0.06087908649415867 * y1 +
+    0.74475492045982 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const A98RGB_to_OKLab = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = A98RGBToLinear(x0);
+  const y1 = A98RGBToLinear(y0);
+  const z1 = A98RGBToLinear(z0);
+  const x2 =
+    0.5764322596183941 * x1 +
+    0.36991322261987963 * y1 +
+    0.053654517761726306 * z1;
+  const y2 =
+    0.29631647054222465 * x1 +
+    0.5916761332521886 * y1 +
+    0.11200739620558692 * z1;
+  const z2 =
+    0.12347825101427762 * x1 +
+    0.21949869837199862 * y1 +
+    0.6570230506137239 * z1;
+  const x3 = Math.cbrt(x2);
+  const y3 = Math.cbrt(y2);
+  const z3 = Math.cbrt(z2);
+  const x4 =
+    0.210454268309314 * x3 +
+    0.7936177747023054 * y3 -
+    0.0040720430116193 * z3;
+  const y4 =
+    1.9779985324311684 * x3 -
+    2.42859224204858 * y3 +
+    0.450593709617411 * z3;
+  const z4 =
+    0.0259040424655478 * x3 +
+    0.7827717124575296 * y3 -
+    0.8086757549230774 * z3;
+  out[0] = x4;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const A98RGB_to_OKLCH = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = A98RGBToLinear(x0);
+  const y1 = A98RGBToLinear(y0);
+  const z1 = A98RGBToLinear(z0);
+  const x2 =
+    0.5764322596183941 * x1 +
+    0.36991322261987963 * y1 +
+    0.053654517761726306 * z1;
+  const y2 =
+    0.29631647054222465 * x1 +
+    0.5916761332521886 * y1 +
+    0.11200739620558692 * z1;
+  const z2 =
+    0.12347825101427762 * x1 +
+    0.21949869837199862 * y1 +
+    0.6570230506137239 * z1;
+  const x3 = Math.cbrt(x2);
+  const y3 = Math.cbrt(y2);
+  const z3 = Math.cbrt(z2);
+  const x4 =
+    0.210454268309314 * x3 +
+    0.7936177747023054 * y3 -
+    0.0040720430116193 * z3;
+  const y4 =
+    1.9779985324311684 * x3 -
+    2.42859224204858 * y3 +
+    0.450593709617411 * z3;
+  const z4 =
+    0.0259040424655478 * x3 +
+    0.7827717124575296 * y3 -
+    0.8086757549230774 * z3;
+  const isAchromatic5 =
+    Math.abs(y4) < ACHROMATIC_EPSILON && Math.abs(z4) < ACHROMATIC_EPSILON;
+  const y5 = isAchromatic5 ? 0 : Math.sqrt(y4 * y4 + z4 * z4);
+  const z5 = isAchromatic5
+    ? 0
+    : constrainAngle((Math.atan2(z4, y4) * 180) / Math.PI);
+  out[0] = x4;
+  out[1] = y5;
+  out[2] = z5;
+  return out;
+};
+
+export const A98RGB_to_sRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = A98RGBToLinear(x0);
+  const y1 = A98RGBToLinear(y0);
+  const z1 = A98RGBToLinear(z0);
+  const x2 = 1.3983557439607786 * x1 - 0.3983557439607784 * y1 + 0 * z1;
+  const y2 =
+    -1.3856103764364747e-16 * x1 +
+    0.9999999999999999 * y1 +
+    1.3877787807814457e-17 * z1;
+  const z2 =
+    -6.938893903907228e-18 * x1 -
+    0.042928989294473266 * y1 +
+    1.0429289892944733 * z1;
+  const x3 = sRGBLinearToGamma(x2);
+  const y3 = sRGBLinearToGamma(y2);
+  const z3 = sRGBLinearToGamma(z2);
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const A98RGB_to_sRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = A98RGBToLinear(x0);
+  const y1 = A98RGBToLinear(y0);
+  const z1 = A98RGBToLinear(z0);
+  const x2 = 1.3983557439607786 * x1 - 0.3983557439607784 * y1 + 0 * z1;
+  const y2 =
+    -1.3856103764364747e-16 * x1 +
+    0.9999999999999999 * y1 +
+    1.3877787807814457e-17 * z1;
+  const z2 =
+    -6.938893903907228e-18 * x1 -
+    0.042928989294473266 * y1 +
+    1.0429289892944733 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const A98RGB_to_DisplayP3 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = A98RGBToLinear(x0);
+  const y1 = A98RGBToLinear(y0);
+  const z1 = A98RGBToLinear(z0);
+  const x2 =
+    1.1500944181410182 * x1 -
+    0.1500944181410184 * y1 -
+    1.1102230246251565e-16 * z1;
+  const y2 =
+    0.046417298629418395 * x1 +
+    0.9535827013705814 * y1 -
+    6.938893903907228e-18 * z1;
+  const z2 =
+    0.023887594790839052 * x1 +
+    0.02650477632633013 * y1 +
+    0.9496076288828309 * z1;
+  const x3 = sRGBLinearToGamma(x2);
+  const y3 = sRGBLinearToGamma(y2);
+  const z3 = sRGBLinearToGamma(z2);
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const A98RGB_to_DisplayP3Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = A98RGBToLinear(x0);
+  const y1 = A98RGBToLinear(y0);
+  const z1 = A98RGBToLinear(z0);
+  const x2 =
+    1.1500944181410182 * x1 -
+    0.1500944181410184 * y1 -
+    1.1102230246251565e-16 * z1;
+  const y2 =
+    0.046417298629418395 * x1 +
+    0.9535827013705814 * y1 -
+    6.938893903907228e-18 * z1;
+  const z2 =
+    0.023887594790839052 * x1 +
+    0.02650477632633013 * y1 +
+    0.9496076288828309 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const A98RGB_to_Rec2020 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = A98RGBToLinear(x0);
+  const y1 = A98RGBToLinear(y0);
+  const z1 = A98RGBToLinear(z0);
+  const x2 =
+    0.8773338416636568 * x1 +
+    0.07749370651571999 * y1 +
+    0.04517245182062313 * z1;
+  const y2 =
+    0.09662259146620375 * x1 +
+    0.8915273202441806 * y1 +
+    0.011850088289615712 * z1;
+  const z2 =
+    0.022921062702848393 * x1 +
+    0.04303668501067931 * y1 +
+    0.9340422522864724 * z1;
+  const x3 = Rec2020ToGamma(x2);
+  const y3 = Rec2020ToGamma(y2);
+  const z3 = Rec2020ToGamma(z2);
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const A98RGB_to_Rec2020Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = A98RGBToLinear(x0);
+  const y1 = A98RGBToLinear(y0);
+  const z1 = A98RGBToLinear(z0);
+  const x2 =
+    0.8773338416636568 * x1 +
+    0.07749370651571999 * y1 +
+    0.04517245182062313 * z1;
+  const y2 =
+    0.09662259146620375 * x1 +
+    0.8915273202441806 * y1 +
+    0.011850088289615712 * z1;
+  const z2 =
+    0.022921062702848393 * x1 +
+    0.04303668501067931 * y1 +
+    0.9340422522864724 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const A98RGB_to_A98RGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = A98RGBToLinear(x0);
+  const y1 = A98RGBToLinear(y0);
+  const z1 = A98RGBToLinear(z0);
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const A98RGB_to_ProPhotoRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = A98RGBToLinear(x0);
+  const y1 = A98RGBToLinear(y0);
+  const z1 = A98RGBToLinear(z0);
+  const x2 =
+    0.7401175018047795 * x1 +
+    0.11327951328898118 * y1 +
+    0.1466029849062397 * z1;
+  const y2 =
+    0.1375504646980264 * x1 +
+    0.8330770802694839 * y1 +
+    0.029372455032489787 * z1;
+  const z2 =
+    0.023597729908717675 * x1 +
+    0.07378347703906654 * y1 +
+    0.9026187930522158 * z1;
+  const x3 = ProPhotoRGBToGamma(x2);
+  const y3 = ProPhotoRGBToGamma(y2);
+  const z3 = ProPhotoRGBToGamma(z2);
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const A98RGB_to_ProPhotoRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = A98RGBToLinear(x0);
+  const y1 = A98RGBToLinear(y0);
+  const z1 = A98RGBToLinear(z0);
+  const x2 =
+    0.7401175018047795 * x1 +
+    0.11327951328898118 * y1 +
+    0.1466029849062397 * z1;
+  const y2 =
+    0.1375504646980264 * x1 +
+    0.8330770802694839 * y1 +
+    0.029372455032489787 * z1;
+  const z2 =
+    0.023597729908717675 * x1 +
+    0.07378347703906654 * y1 +
+    0.9026187930522158 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const A98RGBLinear_to_XYZ = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.5766690429101308 * x0 +
+    0.18555823790654627 * y0 +
+    0.18822864623499472 * z0;
+  const y1 =
+    0.29734497525053616 * x0 +
+    0.627363566255466 * y0 +
+    0.07529145849399789 * z0;
+  const z1 =
+    0.027031361386412378 * x0 +
+    0.07068885253582714 * y0 +
+    0.9913375368376389 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const A98RGBLinear_to_XYZD50 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.6097750418861816 * x0 +
+    0.20530000261929413 * y0 +
+    0.14922063192409227 * z0;
+  const y1 =
+    0.3111246122046417 * x0 +
+    0.6256532308346855 * y0 +
+    0.06322215696067288 * z0;
+  const z1 =
+    0.019470595556481698 * x0 +
+    0.06087908649415867 * y0 +
+    0.74475492045982 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const A98RGBLinear_to_OKLab = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.5764322596183941 * x0 +
+    0.36991322261987963 * y0 +
+    0.053654517761726306 * z0;
+  const y1 =
+    0.29631647054222465 * x0 +
+    0.5916761332521886 * y0 +
+    0.11200739620558692 * z0;
+  const z1 =
+    0.12347825101427762 * x0 +
+    0.21949869837199862 * y0 +
+    0.6570230506137239 * z0;
+  const x2 = Math.cbrt(x1);
+  const y2 = Math.cbrt(y1);
+  const z2 = Math.cbrt(z1);
+  const x3 =
+    0.210454268309314 * x2 +
+    0.7936177747023054 * y2 -
+    0.0040720430116193 * z2;
+  const y3 =
+    1.9779985324311684 * x2 -
+    2.42859224204858 * y2 +
+    0.450593709617411 * z2;
+  const z3 =
+    0.0259040424655478 * x2 +
+    0.7827717124575296 * y2 -
+    0.8086757549230774 * z2;
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const A98RGBLinear_to_OKLCH = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.5764322596183941 * x0 +
+    0.36991322261987963 * y0 +
+    0.053654517761726306 * z0;
+  const y1 =
+    0.29631647054222465 * x0 +
+    0.5916761332521886 * y0 +
+    0.11200739620558692 * z0;
+  const z1 =
+    0.12347825101427762 * x0 +
+    0.21949869837199862 * y0 +
+    0.6570230506137239 * z0;
+  const x2 = Math.cbrt(x1);
+  const y2 = Math.cbrt(y1);
+  const z2 = Math.cbrt(z1);
+  const x3 =
+    0.210454268309314 * x2 +
+    0.7936177747023054 * y2 -
+    0.0040720430116193 * z2;
+  const y3 =
+    1.9779985324311684 * x2 -
+    2.42859224204858 * y2 +
+    0.450593709617411 * z2;
+  const z3 =
+    0.0259040424655478 * x2 +
+    0.7827717124575296 * y2 -
+    0.8086757549230774 * z2;
+  const isAchromatic4 =
+    Math.abs(y3) < ACHROMATIC_EPSILON && Math.abs(z3) < ACHROMATIC_EPSILON;
+  const y4 = isAchromatic4 ? 0 : Math.sqrt(y3 * y3 + z3 * z3);
+  const z4 = isAchromatic4
+    ? 0
+    : constrainAngle((Math.atan2(z3, y3) * 180) / Math.PI);
+  out[0] = x3;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const A98RGBLinear_to_sRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = 1.3983557439607786 * x0 - 0.3983557439607784 * y0 + 0 * z0;
+  const y1 =
+    -1.3856103764364747e-16 * x0 +
+    0.9999999999999999 * y0 +
+    1.3877787807814457e-17 * z0;
+  const z1 =
+    -6.938893903907228e-18 * x0 -
+    0.042928989294473266 * y0 +
+    1.0429289892944733 * z0;
+  const x2 = sRGBLinearToGamma(x1);
+  const y2 = sRGBLinearToGamma(y1);
+  const z2 = sRGBLinearToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const A98RGBLinear_to_sRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = 1.3983557439607786 * x0 - 0.3983557439607784 * y0 + 0 * z0;
+  const y1 =
+    -1.3856103764364747e-16 * x0 +
+    0.9999999999999999 * y0 +
+    1.3877787807814457e-17 * z0;
+  const z1 =
+    -6.938893903907228e-18 * x0 -
+    0.042928989294473266 * y0 +
+    1.0429289892944733 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const A98RGBLinear_to_DisplayP3 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.1500944181410182 * x0 -
+    0.1500944181410184 * y0 -
+    1.1102230246251565e-16 * z0;
+  const y1 =
+    0.046417298629418395 * x0 +
+    0.9535827013705814 * y0 -
+    6.938893903907228e-18 * z0;
+  const z1 =
+    0.023887594790839052 * x0 +
+    0.02650477632633013 * y0 +
+    0.9496076288828309 * z0;
+  const x2 = sRGBLinearToGamma(x1);
+  const y2 = sRGBLinearToGamma(y1);
+  const z2 = sRGBLinearToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const A98RGBLinear_to_DisplayP3Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.1500944181410182 * x0 -
+    0.1500944181410184 * y0 -
+    1.1102230246251565e-16 * z0;
+  const y1 =
+    0.046417298629418395 * x0 +
+    0.9535827013705814 * y0 -
+    6.938893903907228e-18 * z0;
+  const z1 =
+    0.023887594790839052 * x0 +
+    0.02650477632633013 * y0 +
+    0.9496076288828309 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const A98RGBLinear_to_Rec2020 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.8773338416636568 * x0 +
+    0.07749370651571999 * y0 +
+    0.04517245182062313 * z0;
+  const y1 =
+    0.09662259146620375 * x0 +
+    0.8915273202441806 * y0 +
+    0.011850088289615712 * z0;
+  const z1 =
+    0.022921062702848393 * x0 +
+    0.04303668501067931 * y0 +
+    0.9340422522864724 * z0;
+  const x2 = Rec2020ToGamma(x1);
+  const y2 = Rec2020ToGamma(y1);
+  const z2 = Rec2020ToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const A98RGBLinear_to_Rec2020Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.8773338416636568 * x0 +
+    0.07749370651571999 * y0 +
+    0.04517245182062313 * z0;
+  const y1 =
+    0.09662259146620375 * x0 +
+    0.8915273202441806 * y0 +
+    0.011850088289615712 * z0;
+  const z1 =
+    0.022921062702848393 * x0 +
+    0.04303668501067931 * y0 +
+    0.9340422522864724 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const A98RGBLinear_to_A98RGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = A98RGBToGamma(x0);
+  const y1 = A98RGBToGamma(y0);
+  const z1 = A98RGBToGamma(z0);
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const A98RGBLinear_to_ProPhotoRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.7401175018047795 * x0 +
+    0.11327951328898118 * y0 +
+    0.1466029849062397 * z0;
+  const y1 =
+    0.1375504646980264 * x0 +
+    0.8330770802694839 * y0 +
+    0.029372455032489787 * z0;
+  const z1 =
+    0.023597729908717675 * x0 +
+    0.07378347703906654 * y0 +
+    0.9026187930522158 * z0;
+  const x2 = ProPhotoRGBToGamma(x1);
+  const y2 = ProPhotoRGBToGamma(y1);
+  const z2 = ProPhotoRGBToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const A98RGBLinear_to_ProPhotoRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.7401175018047795 * x0 +
+    0.11327951328898118 * y0 +
+    0.1466029849062397 * z0;
+  const y1 =
+    0.1375504646980264 * x0 +
+    0.8330770802694839 * y0 +
+    0.029372455032489787 * z0;
+  const z1 =
+    0.023597729908717675 * x0 +
+    0.07378347703906654 * y0 +
+    0.9026187930522158 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const ProPhotoRGB_to_XYZ = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = ProPhotoRGBToLinear(x0);
+  const y1 = ProPhotoRGBToLinear(y0);
+  const z1 = ProPhotoRGBToLinear(z0);
+  const x2 =
+    0.7555907422969209 * x1 +
+    0.11271984265940509 * y1 +
+    0.08214534209534545 * z1;
+  const y2 =
+    0.26832184357857186 * x1 +
+    0.7151152566617912 * y1 +
+    0.01656289975963686 * z1;
+  const z2 =
+    0.003915972762425807 * x1 -
+    0.0129334428368418 * y1 +
+    1.0980752208342943 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const ProPhotoRGB_to_XYZD50 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = ProPhotoRGBToLinear(x0);
+  const y1 = ProPhotoRGBToLinear(y0);
+  const z1 = ProPhotoRGBToLinear(z0);
+  const x2 =
+    0.7977666449006424 * x1 +
+    0.13518129740053303 * y1 +
+    0.031347734128392216 * z1;
+  const y2 =
+    0.28807482881940144 * x1 +
+    0.7118352342418731 * y1 +
+    8.993693872563768e-5 * z1;
+  const z2 =
+    1.431146867680866e-17 * x1 +
+    5.204170427930421e-18 * y1 +
+    0.8251046025104602 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const ProPhotoRGB_to_OKLab = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = ProPhotoRGBToLinear(x0);
+  const y1 = ProPhotoRGBToLinear(y0);
+  const z1 = ProPhotoRGBToLinear(z0);
+  const x2 =
+    0.7154484605655532 * x1 +
+    0.35279155007721175 * y1 -
+    0.06824001064276528 * z1;
+  const y2 =
+    0.27441164900156706 * x1 +
+    0.6677976498412368 * y1 +
+    0.05779070115719622 * z1;
+  const z2 =
+    0.10978443261622936 * x1 +
+    0.18619829115002015 * y1 +
+    0.7040172762337504 * z1;
+  const x3 = Math.cbrt(x2);
+  const y3 = Math.cbrt(y2);
+  const z3 = Math.cbrt(z2);
+  const x4 =
+    0.210454268309314 * x3 +
+    0.7936177747023054 * y3 -
+    0.0040720430116193 * z3;
+  const y4 =
+    1.9779985324311684 * x3 -
+    2.42859224204858 * y3 +
+    0.450593709617411 * z3;
+  const z4 =
+    0.0259040424655478 * x3 +
+    0.7827717124575296 * y3 -
+    0.8086757549230774 * z3;
+  out[0] = x4;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const ProPhotoRGB_to_OKLCH = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = ProPhotoRGBToLinear(x0);
+  const y1 = ProPhotoRGBToLinear(y0);
+  const z1 = ProPhotoRGBToLinear(z0);
+  const x2 =
+    0.7154484605655532 * x1 +
+    0.35279155007721175 * y1 -
+    0.06824001064276528 * z1;
+  const y2 =
+    0.27441164900156706 * x1 +
+    0.6677976498412368 * y1 +
+    0.05779070115719622 * z1;
+  const z2 =
+    0.10978443261622936 * x1 +
+    0.18619829115002015 * y1 +
+    0.7040172762337504 * z1;
+  const x3 = Math.cbrt(x2);
+  const y3 = Math.cbrt(y2);
+  const z3 = Math.cbrt(z2);
+  const x4 =
+    0.210454268309314 * x3 +
+    0.7936177747023054 * y3 -
+    0.0040720430116193 * z3;
+  const y4 =
+    1.9779985324311684 * x3 -
+    2.42859224204858 * y3 +
+    0.450593709617411 * z3;
+  const z4 =
+    0.0259040424655478 * x3 +
+    0.7827717124575296 * y3 -
+    0.8086757549230774 * z3;
+  const isAchromatic5 =
+    Math.abs(y4) < ACHROMATIC_EPSILON && Math.abs(z4) < ACHROMATIC_EPSILON;
+  const y5 = isAchromatic5 ? 0 : Math.sqrt(y4 * y4 + z4 * z4);
+  const z5 = isAchromatic5
+    ? 0
+    : constrainAngle((Math.atan2(z4, y4) * 180) / Math.PI);
+  out[0] = x4;
+  out[1] = y5;
+  out[2] = z5;
+  return out;
+};
+
+export const ProPhotoRGB_to_sRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = ProPhotoRGBToLinear(x0);
+  const y1 = ProPhotoRGBToLinear(y0);
+  const z1 = ProPhotoRGBToLinear(z0);
+  const x2 =
+    2.0343808495169955 * x1 -
+    0.7276357899341349 * y1 -
+    0.30674505958286163 * z1;
+  const y2 =
+    -0.2288257316330504 * x1 +
+    1.231742541190105 * y1 -
+    0.002916809557054527 * z1;
+  const z2 =
+    -0.008558828783917418 * x1 -
+    0.15326670213803723 * y1 +
+    1.1618255309219545 * z1;
+  const x3 = sRGBLinearToGamma(x2);
+  const y3 = sRGBLinearToGamma(y2);
+  const z3 = sRGBLinearToGamma(z2);
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const ProPhotoRGB_to_sRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = ProPhotoRGBToLinear(x0);
+  const y1 = ProPhotoRGBToLinear(y0);
+  const z1 = ProPhotoRGBToLinear(z0);
+  const x2 =
+    2.0343808495169955 * x1 -
+    0.7276357899341349 * y1 -
+    0.30674505958286163 * z1;
+  const y2 =
+    -0.2288257316330504 * x1 +
+    1.231742541190105 * y1 -
+    0.002916809557054527 * z1;
+  const z2 =
+    -0.008558828783917418 * x1 -
+    0.15326670213803723 * y1 +
+    1.1618255309219545 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const ProPhotoRGB_to_DisplayP3 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = ProPhotoRGBToLinear(x0);
+  const y1 = ProPhotoRGBToLinear(y0);
+  const z1 = ProPhotoRGBToLinear(z0);
+  const x2 =
+    1.6325756087069174 * x1 -
+    0.3797716184825989 * y1 -
+    0.2528039902243193 * z1;
+  const y2 =
+    -0.1537004023375508 * x1 +
+    1.1667025472425014 * y1 -
+    0.013002144904950858 * z1;
+  const z2 =
+    0.010393195296765738 * x1 -
+    0.0628073126495944 * y1 +
+    1.0524141173528287 * z1;
+  const x3 = sRGBLinearToGamma(x2);
+  const y3 = sRGBLinearToGamma(y2);
+  const z3 = sRGBLinearToGamma(z2);
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const ProPhotoRGB_to_DisplayP3Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = ProPhotoRGBToLinear(x0);
+  const y1 = ProPhotoRGBToLinear(y0);
+  const z1 = ProPhotoRGBToLinear(z0);
+  const x2 =
+    1.6325756087069174 * x1 -
+    0.3797716184825989 * y1 -
+    0.2528039902243193 * z1;
+  const y2 =
+    -0.1537004023375508 * x1 +
+    1.1667025472425014 * y1 -
+    0.013002144904950858 * z1;
+  const z2 =
+    0.010393195296765738 * x1 -
+    0.0628073126495944 * y1 +
+    1.0524141173528287 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const ProPhotoRGB_to_Rec2020 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = ProPhotoRGBToLinear(x0);
+  const y1 = ProPhotoRGBToLinear(y0);
+  const z1 = ProPhotoRGBToLinear(z0);
+  const x2 =
+    1.2006593295174075 * x1 -
+    0.05756805370122375 * y1 -
+    0.1430912758161844 * z1;
+  const y2 =
+    -0.0699415495588851 * x1 +
+    1.080617897597214 * y1 -
+    0.010676348038328974 * z1;
+  const z2 =
+    0.00554147334294747 * x1 -
+    0.04078219298657951 * y1 +
+    1.035240719643632 * z1;
+  const x3 = Rec2020ToGamma(x2);
+  const y3 = Rec2020ToGamma(y2);
+  const z3 = Rec2020ToGamma(z2);
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const ProPhotoRGB_to_Rec2020Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = ProPhotoRGBToLinear(x0);
+  const y1 = ProPhotoRGBToLinear(y0);
+  const z1 = ProPhotoRGBToLinear(z0);
+  const x2 =
+    1.2006593295174075 * x1 -
+    0.05756805370122375 * y1 -
+    0.1430912758161844 * z1;
+  const y2 =
+    -0.0699415495588851 * x1 +
+    1.080617897597214 * y1 -
+    0.010676348038328974 * z1;
+  const z2 =
+    0.00554147334294747 * x1 -
+    0.04078219298657951 * y1 +
+    1.035240719643632 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const ProPhotoRGB_to_A98RGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = ProPhotoRGBToLinear(x0);
+  const y1 = ProPhotoRGBToLinear(y0);
+  const z1 = ProPhotoRGBToLinear(z0);
+  const x2 =
+    1.38965124815152 * x1 -
+    0.16945907691487802 * y1 -
+    0.22019217123664225 * z1;
+  const y2 =
+    -0.2288257316330504 * x1 +
+    1.231742541190105 * y1 -
+    0.002916809557054527 * z1;
+  const z2 =
+    -0.017625443684260677 * x1 -
+    0.09625702306122665 * y1 +
+    1.1138824667454872 * z1;
+  const x3 = A98RGBToGamma(x2);
+  const y3 = A98RGBToGamma(y2);
+  const z3 = A98RGBToGamma(z2);
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const ProPhotoRGB_to_A98RGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = ProPhotoRGBToLinear(x0);
+  const y1 = ProPhotoRGBToLinear(y0);
+  const z1 = ProPhotoRGBToLinear(z0);
+  const x2 =
+    1.38965124815152 * x1 -
+    0.16945907691487802 * y1 -
+    0.22019217123664225 * z1;
+  const y2 =
+    -0.2288257316330504 * x1 +
+    1.231742541190105 * y1 -
+    0.002916809557054527 * z1;
+  const z2 =
+    -0.017625443684260677 * x1 -
+    0.09625702306122665 * y1 +
+    1.1138824667454872 * z1;
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const ProPhotoRGB_to_ProPhotoRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = ProPhotoRGBToLinear(x0);
+  const y1 = ProPhotoRGBToLinear(y0);
+  const z1 = ProPhotoRGBToLinear(z0);
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const ProPhotoRGBLinear_to_XYZ = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.7555907422969209 * x0 +
+    0.11271984265940509 * y0 +
+    0.08214534209534545 * z0;
+  const y1 =
+    0.26832184357857186 * x0 +
+    0.7151152566617912 * y0 +
+    0.01656289975963686 * z0;
+  const z1 =
+    0.003915972762425807 * x0 -
+    0.0129334428368418 * y0 +
+    1.0980752208342943 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const ProPhotoRGBLinear_to_XYZD50 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.7977666449006424 * x0 +
+    0.13518129740053303 * y0 +
+    0.031347734128392216 * z0;
+  const y1 =
+    0.28807482881940144 * x0 +
+    0.7118352342418731 * y0 +
+    8.993693872563768e-5 * z0;
+  const z1 =
+    1.431146867680866e-17 * x0 +
+    5.204170427930421e-18 * y0 +
+    0.8251046025104602 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const ProPhotoRGBLinear_to_OKLab = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.7154484605655532 * x0 +
+    0.35279155007721175 * y0 -
+    0.06824001064276528 * z0;
+  const y1 =
+    0.27441164900156706 * x0 +
+    0.6677976498412368 * y0 +
+    0.05779070115719622 * z0;
+  const z1 =
+    0.10978443261622936 * x0 +
+    0.18619829115002015 * y0 +
+    0.7040172762337504 * z0;
+  const x2 = Math.cbrt(x1);
+  const y2 = Math.cbrt(y1);
+  const z2 = Math.cbrt(z1);
+  const x3 =
+    0.210454268309314 * x2 +
+    0.7936177747023054 * y2 -
+    0.0040720430116193 * z2;
+  const y3 =
+    1.9779985324311684 * x2 -
+    2.42859224204858 * y2 +
+    0.450593709617411 * z2;
+  const z3 =
+    0.0259040424655478 * x2 +
+    0.7827717124575296 * y2 -
+    0.8086757549230774 * z2;
+  out[0] = x3;
+  out[1] = y3;
+  out[2] = z3;
+  return out;
+};
+
+export const ProPhotoRGBLinear_to_OKLCH = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    0.7154484605655532 * x0 +
+    0.35279155007721175 * y0 -
+    0.06824001064276528 * z0;
+  const y1 =
+    0.27441164900156706 * x0 +
+    0.6677976498412368 * y0 +
+    0.05779070115719622 * z0;
+  const z1 =
+    0.10978443261622936 * x0 +
+    0.18619829115002015 * y0 +
+    0.7040172762337504 * z0;
+  const x2 = Math.cbrt(x1);
+  const y2 = Math.cbrt(y1);
+  const z2 = Math.cbrt(z1);
+  const x3 =
+    0.210454268309314 * x2 +
+    0.7936177747023054 * y2 -
+    0.0040720430116193 * z2;
+  const y3 =
+    1.9779985324311684 * x2 -
+    2.42859224204858 * y2 +
+    0.450593709617411 * z2;
+  const z3 =
+    0.0259040424655478 * x2 +
+    0.7827717124575296 * y2 -
+    0.8086757549230774 * z2;
+  const isAchromatic4 =
+    Math.abs(y3) < ACHROMATIC_EPSILON && Math.abs(z3) < ACHROMATIC_EPSILON;
+  const y4 = isAchromatic4 ? 0 : Math.sqrt(y3 * y3 + z3 * z3);
+  const z4 = isAchromatic4
+    ? 0
+    : constrainAngle((Math.atan2(z3, y3) * 180) / Math.PI);
+  out[0] = x3;
+  out[1] = y4;
+  out[2] = z4;
+  return out;
+};
+
+export const ProPhotoRGBLinear_to_sRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    2.0343808495169955 * x0 -
+    0.7276357899341349 * y0 -
+    0.30674505958286163 * z0;
+  const y1 =
+    -0.2288257316330504 * x0 +
+    1.231742541190105 * y0 -
+    0.002916809557054527 * z0;
+  const z1 =
+    -0.008558828783917418 * x0 -
+    0.15326670213803723 * y0 +
+    1.1618255309219545 * z0;
+  const x2 = sRGBLinearToGamma(x1);
+  const y2 = sRGBLinearToGamma(y1);
+  const z2 = sRGBLinearToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const ProPhotoRGBLinear_to_sRGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    2.0343808495169955 * x0 -
+    0.7276357899341349 * y0 -
+    0.30674505958286163 * z0;
+  const y1 =
+    -0.2288257316330504 * x0 +
+    1.231742541190105 * y0 -
+    0.002916809557054527 * z0;
+  const z1 =
+    -0.008558828783917418 * x0 -
+    0.15326670213803723 * y0 +
+    1.1618255309219545 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const ProPhotoRGBLinear_to_DisplayP3 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.6325756087069174 * x0 -
+    0.3797716184825989 * y0 -
+    0.2528039902243193 * z0;
+  const y1 =
+    -0.1537004023375508 * x0 +
+    1.1667025472425014 * y0 -
+    0.013002144904950858 * z0;
+  const z1 =
+    0.010393195296765738 * x0 -
+    0.0628073126495944 * y0 +
+    1.0524141173528287 * z0;
+  const x2 = sRGBLinearToGamma(x1);
+  const y2 = sRGBLinearToGamma(y1);
+  const z2 = sRGBLinearToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const ProPhotoRGBLinear_to_DisplayP3Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.6325756087069174 * x0 -
+    0.3797716184825989 * y0 -
+    0.2528039902243193 * z0;
+  const y1 =
+    -0.1537004023375508 * x0 +
+    1.1667025472425014 * y0 -
+    0.013002144904950858 * z0;
+  const z1 =
+    0.010393195296765738 * x0 -
+    0.0628073126495944 * y0 +
+    1.0524141173528287 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const ProPhotoRGBLinear_to_Rec2020 = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.2006593295174075 * x0 -
+    0.05756805370122375 * y0 -
+    0.1430912758161844 * z0;
+  const y1 =
+    -0.0699415495588851 * x0 +
+    1.080617897597214 * y0 -
+    0.010676348038328974 * z0;
+  const z1 =
+    0.00554147334294747 * x0 -
+    0.04078219298657951 * y0 +
+    1.035240719643632 * z0;
+  const x2 = Rec2020ToGamma(x1);
+  const y2 = Rec2020ToGamma(y1);
+  const z2 = Rec2020ToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const ProPhotoRGBLinear_to_Rec2020Linear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.2006593295174075 * x0 -
+    0.05756805370122375 * y0 -
+    0.1430912758161844 * z0;
+  const y1 =
+    -0.0699415495588851 * x0 +
+    1.080617897597214 * y0 -
+    0.010676348038328974 * z0;
+  const z1 =
+    0.00554147334294747 * x0 -
+    0.04078219298657951 * y0 +
+    1.035240719643632 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const ProPhotoRGBLinear_to_A98RGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.38965124815152 * x0 -
+    0.16945907691487802 * y0 -
+    0.22019217123664225 * z0;
+  const y1 =
+    -0.2288257316330504 * x0 +
+    1.231742541190105 * y0 -
+    0.002916809557054527 * z0;
+  const z1 =
+    -0.017625443684260677 * x0 -
+    0.09625702306122665 * y0 +
+    1.1138824667454872 * z0;
+  const x2 = A98RGBToGamma(x1);
+  const y2 = A98RGBToGamma(y1);
+  const z2 = A98RGBToGamma(z1);
+  out[0] = x2;
+  out[1] = y2;
+  out[2] = z2;
+  return out;
+};
+
+export const ProPhotoRGBLinear_to_A98RGBLinear = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 =
+    1.38965124815152 * x0 -
+    0.16945907691487802 * y0 -
+    0.22019217123664225 * z0;
+  const y1 =
+    -0.2288257316330504 * x0 +
+    1.231742541190105 * y0 -
+    0.002916809557054527 * z0;
+  const z1 =
+    -0.017625443684260677 * x0 -
+    0.09625702306122665 * y0 +
+    1.1138824667454872 * z0;
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+export const ProPhotoRGBLinear_to_ProPhotoRGB = (input, out = vec3()) => {
+  const x0 = input[0],
+    y0 = input[1],
+    z0 = input[2];
+  const x1 = ProPhotoRGBToGamma(x0);
+  const y1 = ProPhotoRGBToGamma(y0);
+  const z1 = ProPhotoRGBToGamma(z0);
+  out[0] = x1;
+  out[1] = y1;
+  out[2] = z1;
+  return out;
+};
+
+const converters = new Map([
+  [
+    XYZ,
+    new Map([
+      [XYZD50, XYZ_to_XYZD50],
+      [OKLab, XYZ_to_OKLab],
+      [OKLCH, XYZ_to_OKLCH],
+      [sRGB, XYZ_to_sRGB],
+      [sRGBLinear, XYZ_to_sRGBLinear],
+      [DisplayP3, XYZ_to_DisplayP3],
+      [DisplayP3Linear, XYZ_to_DisplayP3Linear],
+      [Rec2020, XYZ_to_Rec2020],
+      [Rec2020Linear, XYZ_to_Rec2020Linear],
+      [A98RGB, XYZ_to_A98RGB],
+      [A98RGBLinear, XYZ_to_A98RGBLinear],
+      [ProPhotoRGB, XYZ_to_ProPhotoRGB],
+      [ProPhotoRGBLinear, XYZ_to_ProPhotoRGBLinear],
+    ]),
+  ],
+  [
+    XYZD50,
+    new Map([
+      [XYZ, XYZD50_to_XYZ],
+      [OKLab, XYZD50_to_OKLab],
+      [OKLCH, XYZD50_to_OKLCH],
+      [sRGB, XYZD50_to_sRGB],
+      [sRGBLinear, XYZD50_to_sRGBLinear],
+      [DisplayP3, XYZD50_to_DisplayP3],
+      [DisplayP3Linear, XYZD50_to_DisplayP3Linear],
+      [Rec2020, XYZD50_to_Rec2020],
+      [Rec2020Linear, XYZD50_to_Rec2020Linear],
+      [A98RGB, XYZD50_to_A98RGB],
+      [A98RGBLinear, XYZD50_to_A98RGBLinear],
+      [ProPhotoRGB, XYZD50_to_ProPhotoRGB],
+      [ProPhotoRGBLinear, XYZD50_to_ProPhotoRGBLinear],
+    ]),
+  ],
+  [
+    OKLab,
+    new Map([
+      [XYZ, OKLab_to_XYZ],
+      [XYZD50, OKLab_to_XYZD50],
+      [OKLCH, OKLab_to_OKLCH],
+      [sRGB, OKLab_to_sRGB],
+      [sRGBLinear, OKLab_to_sRGBLinear],
+      [DisplayP3, OKLab_to_DisplayP3],
+      [DisplayP3Linear, OKLab_to_DisplayP3Linear],
+      [Rec2020, OKLab_to_Rec2020],
+      [Rec2020Linear, OKLab_to_Rec2020Linear],
+      [A98RGB, OKLab_to_A98RGB],
+      [A98RGBLinear, OKLab_to_A98RGBLinear],
+      [ProPhotoRGB, OKLab_to_ProPhotoRGB],
+      [ProPhotoRGBLinear, OKLab_to_ProPhotoRGBLinear],
+    ]),
+  ],
+  [
+    OKLCH,
+    new Map([
+      [XYZ, OKLCH_to_XYZ],
+      [XYZD50, OKLCH_to_XYZD50],
+      [OKLab, OKLCH_to_OKLab],
+      [sRGB, OKLCH_to_sRGB],
+      [sRGBLinear, OKLCH_to_sRGBLinear],
+      [DisplayP3, OKLCH_to_DisplayP3],
+      [DisplayP3Linear, OKLCH_to_DisplayP3Linear],
+      [Rec2020, OKLCH_to_Rec2020],
+      [Rec2020Linear, OKLCH_to_Rec2020Linear],
+      [A98RGB, OKLCH_to_A98RGB],
+      [A98RGBLinear, OKLCH_to_A98RGBLinear],
+      [ProPhotoRGB, OKLCH_to_ProPhotoRGB],
+      [ProPhotoRGBLinear, OKLCH_to_ProPhotoRGBLinear],
+    ]),
+  ],
+  [
+    sRGB,
+    new Map([
+      [XYZ, sRGB_to_XYZ],
+      [XYZD50, sRGB_to_XYZD50],
+      [OKLab, sRGB_to_OKLab],
+      [OKLCH, sRGB_to_OKLCH],
+      [sRGBLinear, sRGB_to_sRGBLinear],
+      [DisplayP3, sRGB_to_DisplayP3],
+      [DisplayP3Linear, sRGB_to_DisplayP3Linear],
+      [Rec2020, sRGB_to_Rec2020],
+      [Rec2020Linear, sRGB_to_Rec2020Linear],
+      [A98RGB, sRGB_to_A98RGB],
+      [A98RGBLinear, sRGB_to_A98RGBLinear],
+      [ProPhotoRGB, sRGB_to_ProPhotoRGB],
+      [ProPhotoRGBLinear, sRGB_to_ProPhotoRGBLinear],
+    ]),
+  ],
+  [
+    sRGBLinear,
+    new Map([
+      [XYZ, sRGBLinear_to_XYZ],
+      [XYZD50, sRGBLinear_to_XYZD50],
+      [OKLab, sRGBLinear_to_OKLab],
+      [OKLCH, sRGBLinear_to_OKLCH],
+      [sRGB, sRGBLinear_to_sRGB],
+      [DisplayP3, sRGBLinear_to_DisplayP3],
+      [DisplayP3Linear, sRGBLinear_to_DisplayP3Linear],
+      [Rec2020, sRGBLinear_to_Rec2020],
+      [Rec2020Linear, sRGBLinear_to_Rec2020Linear],
+      [A98RGB, sRGBLinear_to_A98RGB],
+      [A98RGBLinear, sRGBLinear_to_A98RGBLinear],
+      [ProPhotoRGB, sRGBLinear_to_ProPhotoRGB],
+      [ProPhotoRGBLinear, sRGBLinear_to_ProPhotoRGBLinear],
+    ]),
+  ],
+  [
+    DisplayP3,
+    new Map([
+      [XYZ, DisplayP3_to_XYZ],
+      [XYZD50, DisplayP3_to_XYZD50],
+      [OKLab, DisplayP3_to_OKLab],
+      [OKLCH, DisplayP3_to_OKLCH],
+      [sRGB, DisplayP3_to_sRGB],
+      [sRGBLinear, DisplayP3_to_sRGBLinear],
+      [DisplayP3Linear, DisplayP3_to_DisplayP3Linear],
+      [Rec2020, DisplayP3_to_Rec2020],
+      [Rec2020Linear, DisplayP3_to_Rec2020Linear],
+      [A98RGB, DisplayP3_to_A98RGB],
+      [A98RGBLinear, DisplayP3_to_A98RGBLinear],
+      [ProPhotoRGB, DisplayP3_to_ProPhotoRGB],
+      [ProPhotoRGBLinear, DisplayP3_to_ProPhotoRGBLinear],
+    ]),
+  ],
+  [
+    DisplayP3Linear,
+    new Map([
+      [XYZ, DisplayP3Linear_to_XYZ],
+      [XYZD50, DisplayP3Linear_to_XYZD50],
+      [OKLab, DisplayP3Linear_to_OKLab],
+      [OKLCH, DisplayP3Linear_to_OKLCH],
+      [sRGB, DisplayP3Linear_to_sRGB],
+      [sRGBLinear, DisplayP3Linear_to_sRGBLinear],
+      [DisplayP3, DisplayP3Linear_to_DisplayP3],
+      [Rec2020, DisplayP3Linear_to_Rec2020],
+      [Rec2020Linear, DisplayP3Linear_to_Rec2020Linear],
+      [A98RGB, DisplayP3Linear_to_A98RGB],
+      [A98RGBLinear, DisplayP3Linear_to_A98RGBLinear],
+      [ProPhotoRGB, DisplayP3Linear_to_ProPhotoRGB],
+      [ProPhotoRGBLinear, DisplayP3Linear_to_ProPhotoRGBLinear],
+    ]),
+  ],
+  [
+    Rec2020,
+    new Map([
+      [XYZ, Rec2020_to_XYZ],
+      [XYZD50, Rec2020_to_XYZD50],
+      [OKLab, Rec2020_to_OKLab],
+      [OKLCH, Rec2020_to_OKLCH],
+      [sRGB, Rec2020_to_sRGB],
+      [sRGBLinear, Rec2020_to_sRGBLinear],
+      [DisplayP3, Rec2020_to_DisplayP3],
+      [DisplayP3Linear, Rec2020_to_DisplayP3Linear],
+      [Rec2020Linear, Rec2020_to_Rec2020Linear],
+      [A98RGB, Rec2020_to_A98RGB],
+      [A98RGBLinear, Rec2020_to_A98RGBLinear],
+      [ProPhotoRGB, Rec2020_to_ProPhotoRGB],
+      [ProPhotoRGBLinear, Rec2020_to_ProPhotoRGBLinear],
+    ]),
+  ],
+  [
+    Rec2020Linear,
+    new Map([
+      [XYZ, Rec2020Linear_to_XYZ],
+      [XYZD50, Rec2020Linear_to_XYZD50],
+      [OKLab, Rec2020Linear_to_OKLab],
+      [OKLCH, Rec2020Linear_to_OKLCH],
+      [sRGB, Rec2020Linear_to_sRGB],
+      [sRGBLinear, Rec2020Linear_to_sRGBLinear],
+      [DisplayP3, Rec2020Linear_to_DisplayP3],
+      [DisplayP3Linear, Rec2020Linear_to_DisplayP3Linear],
+      [Rec2020, Rec2020Linear_to_Rec2020],
+      [A98RGB, Rec2020Linear_to_A98RGB],
+      [A98RGBLinear, Rec2020Linear_to_A98RGBLinear],
+      [ProPhotoRGB, Rec2020Linear_to_ProPhotoRGB],
+      [ProPhotoRGBLinear, Rec2020Linear_to_ProPhotoRGBLinear],
+    ]),
+  ],
+  [
+    A98RGB,
+    new Map([
+      [XYZ, A98RGB_to_XYZ],
+      [XYZD50, A98RGB_to_XYZD50],
+      [OKLab, A98RGB_to_OKLab],
+      [OKLCH, A98RGB_to_OKLCH],
+      [sRGB, A98RGB_to_sRGB],
+      [sRGBLinear, A98RGB_to_sRGBLinear],
+      [DisplayP3, A98RGB_to_DisplayP3],
+      [DisplayP3Linear, A98RGB_to_DisplayP3Linear],
+      [Rec2020, A98RGB_to_Rec2020],
+      [Rec2020Linear, A98RGB_to_Rec2020Linear],
+      [A98RGBLinear, A98RGB_to_A98RGBLinear],
+      [ProPhotoRGB, A98RGB_to_ProPhotoRGB],
+      [ProPhotoRGBLinear, A98RGB_to_ProPhotoRGBLinear],
+    ]),
+  ],
+  [
+    A98RGBLinear,
+    new Map([
+      [XYZ, A98RGBLinear_to_XYZ],
+      [XYZD50, A98RGBLinear_to_XYZD50],
+      [OKLab, A98RGBLinear_to_OKLab],
+      [OKLCH, A98RGBLinear_to_OKLCH],
+      [sRGB, A98RGBLinear_to_sRGB],
+      [sRGBLinear, A98RGBLinear_to_sRGBLinear],
+      [DisplayP3, A98RGBLinear_to_DisplayP3],
+      [DisplayP3Linear, A98RGBLinear_to_DisplayP3Linear],
+      [Rec2020, A98RGBLinear_to_Rec2020],
+      [Rec2020Linear, A98RGBLinear_to_Rec2020Linear],
+      [A98RGB, A98RGBLinear_to_A98RGB],
+      [ProPhotoRGB, A98RGBLinear_to_ProPhotoRGB],
+      [ProPhotoRGBLinear, A98RGBLinear_to_ProPhotoRGBLinear],
+    ]),
+  ],
+  [
+    ProPhotoRGB,
+    new Map([
+      [XYZ, ProPhotoRGB_to_XYZ],
+      [XYZD50, ProPhotoRGB_to_XYZD50],
+      [OKLab, ProPhotoRGB_to_OKLab],
+      [OKLCH, ProPhotoRGB_to_OKLCH],
+      [sRGB, ProPhotoRGB_to_sRGB],
+      [sRGBLinear, ProPhotoRGB_to_sRGBLinear],
+      [DisplayP3, ProPhotoRGB_to_DisplayP3],
+      [DisplayP3Linear, ProPhotoRGB_to_DisplayP3Linear],
+      [Rec2020, ProPhotoRGB_to_Rec2020],
+      [Rec2020Linear, ProPhotoRGB_to_Rec2020Linear],
+      [A98RGB, ProPhotoRGB_to_A98RGB],
+      [A98RGBLinear, ProPhotoRGB_to_A98RGBLinear],
+      [ProPhotoRGBLinear, ProPhotoRGB_to_ProPhotoRGBLinear],
+    ]),
+  ],
+  [
+    ProPhotoRGBLinear,
+    new Map([
+      [XYZ, ProPhotoRGBLinear_to_XYZ],
+      [XYZD50, ProPhotoRGBLinear_to_XYZD50],
+      [OKLab, ProPhotoRGBLinear_to_OKLab],
+      [OKLCH, ProPhotoRGBLinear_to_OKLCH],
+      [sRGB, ProPhotoRGBLinear_to_sRGB],
+      [sRGBLinear, ProPhotoRGBLinear_to_sRGBLinear],
+      [DisplayP3, ProPhotoRGBLinear_to_DisplayP3],
+      [DisplayP3Linear, ProPhotoRGBLinear_to_DisplayP3Linear],
+      [Rec2020, ProPhotoRGBLinear_to_Rec2020],
+      [Rec2020Linear, ProPhotoRGBLinear_to_Rec2020Linear],
+      [A98RGB, ProPhotoRGBLinear_to_A98RGB],
+      [A98RGBLinear, ProPhotoRGBLinear_to_A98RGBLinear],
+      [ProPhotoRGB, ProPhotoRGBLinear_to_ProPhotoRGB],
+    ]),
+  ],
+]);
+
+export const getConverter = (fromSpace, toSpace) => {
+  // the converter specialized to the pair of spaces, or one that uses convert()
+  const converter = converters.get(fromSpace)?.get(toSpace);
+  if (converter) return converter;
+  return (input, out = vec3()) => convert(input, fromSpace, toSpace, out);
+};
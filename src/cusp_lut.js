@@ -0,0 +1,1742 @@
+/** This file is auto-generated by tools/print_matrices.py --cusp-lut 1024 */
+
+// linear_sRGB cusp (L, C) pairs at 1024 hues evenly spaced from 0 to 360 degrees,
+// interpolated within 3.3e-05 of the exact cusp at 99% of hues, and 1.8e-02 at most
+
+export const OKLab_to_linear_sRGB_cusp_LUT = [
+  0.647704, 0.2625735, 0.6473583, 0.2622358, 0.6470163, 0.2619048,
+  0.6466778, 0.2615806, 0.6463428, 0.2612632, 0.6460112, 0.2609525,
+  0.6456831, 0.2606485, 0.6453584, 0.2603513, 0.6450369, 0.2600608,
+  0.6447188, 0.2597771, 0.6444039, 0.2595, 0.6440922, 0.2592297,
+  0.6437837, 0.2589661, 0.6434783, 0.2587092, 0.643176, 0.258459,
+  0.6428767, 0.2582155, 0.6425804, 0.2579787, 0.6422871, 0.2577486,
+  0.6419967, 0.2575252, 0.6417092, 0.2573085, 0.6414245, 0.2570984,
+  0.6411427, 0.2568951, 0.6408636, 0.2566984, 0.6405873, 0.2565084,
+  0.6403137, 0.2563251, 0.6400428, 0.2561485, 0.6397745, 0.2559786,
+  0.6395088, 0.2558153, 0.6392457, 0.2556588, 0.6389852, 0.2555089,
+  0.6387271, 0.2553658, 0.6384716, 0.2552293, 0.6382185, 0.2550995,
+  0.6379678, 0.2549765, 0.6377196, 0.2548601, 0.6374736, 0.2547505,
+  0.6372301, 0.2546476, 0.6369888, 0.2545514, 0.6367498, 0.254462,
+  0.6365131, 0.2543793, 0.6362786, 0.2543033, 0.6360463, 0.2542341,
+  0.6358161, 0.2541717, 0.6355881, 0.2541161, 0.6353623, 0.2540673,
+  0.6351385, 0.2540252, 0.6349168, 0.25399, 0.6346971, 0.2539616,
+  0.6344795, 0.25394, 0.6342639, 0.2539253, 0.6340502, 0.2539175,
+  0.6338386, 0.2539165, 0.6336288, 0.2539225, 0.633421, 0.2539353,
+  0.633215, 0.2539551, 0.6330109, 0.2539818, 0.6328087, 0.2540155,
+  0.6326083, 0.2540562, 0.6324097, 0.2541039, 0.6322129, 0.2541586,
+  0.6320178, 0.2542204, 0.6318245, 0.2542892, 0.631633, 0.2543651,
+  0.6314431, 0.2544482, 0.6312549, 0.2545384, 0.6310685, 0.2546357,
+  0.6308836, 0.2547402, 0.6307005, 0.254852, 0.6305189, 0.254971,
+  0.6303389, 0.2550973, 0.6301606, 0.2552308, 0.6299838, 0.2553718,
+  0.6298086, 0.25552, 0.6296349, 0.2556757, 0.6294627, 0.2558388,
+  0.6292921, 0.2560094, 0.629123, 0.2561874, 0.6289553, 0.256373,
+  0.6287891, 0.2565662, 0.6286244, 0.256767, 0.6284611, 0.2569754,
+  0.6282992, 0.2571915, 0.6281388, 0.2574153, 0.6279798, 0.2576469,
+  0.6296479, 0.2560691, 0.6316284, 0.2541979, 0.6335871, 0.252366,
+  0.6355247, 0.2505724, 0.6374417, 0.2488158, 0.6393386, 0.2470954,
+  0.6412158, 0.2454102, 0.6430741, 0.2437593, 0.6449136, 0.2421418,
+  0.6467351, 0.2405567, 0.6485388, 0.2390034, 0.6503253, 0.2374809,
+  0.652095, 0.2359886, 0.6538482, 0.2345257, 0.6555854, 0.2330914,
+  0.6573069, 0.2316851, 0.6590132, 0.2303061, 0.6607046, 0.2289538,
+  0.6623814, 0.2276275, 0.6640441, 0.2263266, 0.6656929, 0.2250507,
+  0.6673282, 0.223799, 0.6689502, 0.222571, 0.6705594, 0.2213663,
+  0.672156, 0.2201844, 0.6737403, 0.2190246, 0.6753126, 0.2178866,
+  0.6768732, 0.2167699, 0.6784223, 0.2156741, 0.6799602, 0.2145986,
+  0.6814873, 0.2135432, 0.6830036, 0.2125073, 0.6845096, 0.2114906,
+  0.6860054, 0.2104928, 0.6874912, 0.2095134, 0.6889674, 0.208552,
+  0.6904341, 0.2076084, 0.6918916, 0.2066823, 0.69334, 0.2057731,
+  0.6947796, 0.2048808, 0.6962106, 0.2040048, 0.6976333, 0.2031451,
+  0.6990477, 0.2023011, 0.7004541, 0.2014728, 0.7018527, 0.2006597,
+  0.7032437, 0.1998617, 0.7046272, 0.1990785, 0.7060035, 0.1983097,
+  0.7073728, 0.1975553, 0.7087351, 0.1968149, 0.7100907, 0.1960883,
+  0.7114397, 0.1953753, 0.7127823, 0.1946756, 0.7141187, 0.1939891,
+  0.7154491, 0.1933156, 0.7167735, 0.1926548, 0.7180921, 0.1920066,
+  0.7194052, 0.1913707, 0.7207127, 0.190747, 0.722015, 0.1901353,
+  0.7233121, 0.1895355, 0.7246042, 0.1889473, 0.7258913, 0.1883706,
+  0.7271738, 0.1878052, 0.7284516, 0.187251, 0.7297249, 0.1867079,
+  0.7309939, 0.1861756, 0.7322587, 0.1856541, 0.7335194, 0.1851431,
+  0.7347762, 0.1846427, 0.7360291, 0.1841525, 0.7372783, 0.1836726,
+  0.738524, 0.1832027, 0.7397661, 0.1827428, 0.741005, 0.1822927,
+  0.7422406, 0.1818524, 0.7434731, 0.1814217, 0.7447026, 0.1810005,
+  0.7459293, 0.1805887, 0.7471531, 0.1801861, 0.7483744, 0.1797928,
+  0.7495931, 0.1794086, 0.7508094, 0.1790334, 0.7520234, 0.1786671,
+  0.7532351, 0.1783097, 0.7544448, 0.177961, 0.7556525, 0.1776209,
+  0.7568583, 0.1772895, 0.7580624, 0.1769665, 0.7592647, 0.176652,
+  0.7604655, 0.1763458, 0.7616649, 0.1760479, 0.7628629, 0.1757582,
+  0.7640596, 0.1754767, 0.7652552, 0.1752033, 0.7664497, 0.1749378,
+  0.7676433, 0.1746804, 0.7688361, 0.1744308, 0.7700281, 0.1741891,
+  0.7712195, 0.1739552, 0.7724103, 0.1737291, 0.7736007, 0.1735106,
+  0.7747907, 0.1732998, 0.7759805, 0.1730965, 0.7771702, 0.1729008,
+  0.7783598, 0.1727127, 0.7795495, 0.172532, 0.7807393, 0.1723587,
+  0.7819294, 0.1721928, 0.7831199, 0.1720343, 0.7843108, 0.1718831,
+  0.7855023, 0.1717392, 0.7866944, 0.1716026, 0.7878873, 0.1714731,
+  0.7890811, 0.1713509, 0.7902758, 0.1712359, 0.7914715, 0.1711281,
+  0.7926685, 0.1710273, 0.7938667, 0.1709337, 0.7950663, 0.1708472,
+  0.7962673, 0.1707677, 0.79747, 0.1706953, 0.7986743, 0.17063,
+  0.7998804, 0.1705717, 0.8010884, 0.1705204, 0.8022984, 0.1704761,
+  0.8035105, 0.1704389, 0.8047247, 0.1704086, 0.8059414, 0.1703853,
+  0.8071604, 0.170369, 0.808382, 0.1703597, 0.8096062, 0.1703574,
+  0.8108332, 0.1703621, 0.8120631, 0.1703738, 0.8132959, 0.1703924,
+  0.8145319, 0.1704181, 0.815771, 0.1704508, 0.8170135, 0.1704904,
+  0.8182595, 0.1705372, 0.819509, 0.1705909, 0.8207622, 0.1706517,
+  0.8220192, 0.1707196, 0.8232802, 0.1707945, 0.8245452, 0.1708766,
+  0.8258144, 0.1709658, 0.827088, 0.1710621, 0.828366, 0.1711656,
+  0.8296485, 0.1712763, 0.8309358, 0.1713942, 0.8322279, 0.1715193,
+  0.833525, 0.1716517, 0.8348273, 0.1717915, 0.8361348, 0.1719385,
+  0.8374477, 0.172093, 0.8387662, 0.1722548, 0.8400903, 0.1724241,
+  0.8414203, 0.1726009, 0.8427564, 0.1727852, 0.8440986, 0.1729771,
+  0.8454471, 0.1731767, 0.846802, 0.1733839, 0.8481637, 0.1735988,
+  0.8495321, 0.1738215, 0.8509075, 0.174052, 0.85229, 0.1742904,
+  0.8536799, 0.1745367, 0.8550773, 0.1747911, 0.8564823, 0.1750535,
+  0.8578952, 0.1753241, 0.8593162, 0.1756028, 0.8607454, 0.1758898,
+  0.862183, 0.1761852, 0.8636293, 0.1764889, 0.8650844, 0.1768012,
+  0.8665486, 0.177122, 0.8680221, 0.1774515, 0.869505, 0.1777897,
+  0.8709976, 0.1781367, 0.8725002, 0.1784926, 0.8740129, 0.1788576,
+  0.875536, 0.1792316, 0.8770697, 0.1796149, 0.8786144, 0.1800074,
+  0.8801701, 0.1804094, 0.8817373, 0.1808209, 0.8833161, 0.181242,
+  0.8849068, 0.1816728, 0.8865098, 0.1821135, 0.8881252, 0.1825642,
+  0.8897534, 0.183025, 0.8913947, 0.1834961, 0.8930493, 0.1839775,
+  0.8947177, 0.1844694, 0.8964001, 0.184972, 0.8980968, 0.1854853,
+  0.8998082, 0.1860096, 0.9015346, 0.186545, 0.9032764, 0.1870917,
+  0.9050339, 0.1876498, 0.9068076, 0.1882195, 0.9085978, 0.1888009,
+  0.9104048, 0.1893944, 0.9122292, 0.1899999, 0.9140713, 0.1906177,
+  0.9159316, 0.1912481, 0.9178104, 0.1918912, 0.9197083, 0.1925472,
+  0.9216257, 0.1932164, 0.9235632, 0.1938989, 0.9255211, 0.1945951,
+  0.9275, 0.195305, 0.9295005, 0.1960291, 0.931523, 0.1967674,
+  0.9335682, 0.1975204, 0.9356366, 0.1982882, 0.9377288, 0.1990711,
+  0.9398455, 0.1998694, 0.9419872, 0.2006834, 0.9441546, 0.2015134,
+  0.9463484, 0.2023598, 0.9485693, 0.2032228, 0.9508181, 0.2041027,
+  0.9530954, 0.205, 0.955402, 0.205915, 0.9577388, 0.206848,
+  0.9601066, 0.2077995, 0.9625062, 0.2087697, 0.9649385, 0.2097592,
+  0.9674045, 0.2107684, 0.967241, 0.2112159, 0.9662745, 0.2114977,
+  0.965308, 0.2117888, 0.9643414, 0.2120892, 0.9633745, 0.2123991,
+  0.9624074, 0.2127184, 0.9614398, 0.2130474, 0.9604719, 0.2133859,
+  0.9595034, 0.2137342, 0.9585343, 0.2140923, 0.9575646, 0.2144602,
+  0.956594, 0.2148381, 0.9556227, 0.215226, 0.9546504, 0.2156241,
+  0.9536772, 0.2160323, 0.9527029, 0.2164509, 0.9517275, 0.2168799,
+  0.9507508, 0.2173194, 0.9497728, 0.2177696, 0.9487934, 0.2182304,
+  0.9478126, 0.2187021, 0.9468302, 0.2191847, 0.9458462, 0.2196784,
+  0.9448605, 0.2201832, 0.943873, 0.2206994, 0.9428836, 0.221227,
+  0.9418923, 0.2217661, 0.9408989, 0.222317, 0.9399034, 0.2228796,
+  0.9389056, 0.2234542, 0.9379056, 0.224041, 0.9369031, 0.22464,
+  0.9358982, 0.2252514, 0.9348907, 0.2258754, 0.9338806, 0.2265121,
+  0.9328677, 0.2271617, 0.9318519, 0.2278244, 0.9308333, 0.2285003,
+  0.9298115, 0.2291897, 0.9287867, 0.2298927, 0.9277586, 0.2306095,
+  0.9267272, 0.2313402, 0.9256924, 0.2320852, 0.9246541, 0.2328446,
+  0.9236121, 0.2336186, 0.9225665, 0.2344075, 0.9215169, 0.2352114,
+  0.9204635, 0.2360306, 0.919406, 0.2368653, 0.9183444, 0.2377159,
+  0.9172785, 0.2385824, 0.9162082, 0.2394653, 0.9151335, 0.2403647,
+  0.9140541, 0.2412809, 0.91297, 0.2422142, 0.9118811, 0.2431649,
+  0.9107872, 0.2441334, 0.9096883, 0.2451198, 0.9085841, 0.2461245,
+  0.9074747, 0.2471479, 0.9063597, 0.2481902, 0.9052392, 0.2492519,
+  0.9041129, 0.2503332, 0.9029808, 0.2514346, 0.9018427, 0.2525563,
+  0.9006984, 0.2536989, 0.8995479, 0.2548627, 0.8983909, 0.256048,
+  0.8972273, 0.2572554, 0.896057, 0.2584852, 0.8948799, 0.259738,
+  0.8936957, 0.2610141, 0.8925042, 0.262314, 0.8913054, 0.2636383,
+  0.8900991, 0.2649874, 0.8888851, 0.2663619, 0.8876632, 0.2677623,
+  0.8864332, 0.2691892, 0.885195, 0.2706431, 0.8839484, 0.2721247,
+  0.8826931, 0.2736345, 0.881429, 0.2751731, 0.8801559, 0.2767414,
+  0.8788736, 0.2783398, 0.8775819, 0.2799691, 0.8762805, 0.2816301,
+  0.8749693, 0.2833235, 0.873648, 0.28505, 0.8723164, 0.2868105,
+  0.8709743, 0.2886059, 0.8696214, 0.2904368, 0.8682574, 0.2923044,
+  0.8668822, 0.2942094, 0.8667028, 0.2925874, 0.8670869, 0.2893717,
+  0.8674676, 0.2862461, 0.867845, 0.2832068, 0.868219, 0.2802505,
+  0.8685896, 0.2773737, 0.868957, 0.2745734, 0.8693212, 0.2718466,
+  0.8696822, 0.2691906, 0.87004, 0.2666026, 0.8703948, 0.2640801,
+  0.8707465, 0.2616209, 0.8710952, 0.2592225, 0.8714409, 0.256883,
+  0.8717837, 0.2546001, 0.8721237, 0.2523721, 0.8724609, 0.250197,
+  0.8727953, 0.248073, 0.873127, 0.2459986, 0.873456, 0.243972,
+  0.8737824, 0.2419918, 0.8741062, 0.2400565, 0.8744275, 0.2381647,
+  0.8747463, 0.2363151, 0.8750626, 0.2345063, 0.8753766, 0.2327371,
+  0.8756882, 0.2310065, 0.8759975, 0.2293132, 0.8763045, 0.2276562,
+  0.8766093, 0.2260344, 0.8769119, 0.2244469, 0.8772124, 0.2228927,
+  0.8775107, 0.2213708, 0.877807, 0.2198805, 0.8781013, 0.2184208,
+  0.8783936, 0.216991, 0.878684, 0.2155903, 0.8789724, 0.2142178,
+  0.879259, 0.2128729, 0.8795437, 0.211555, 0.8798267, 0.2102632,
+  0.8801079, 0.208997, 0.8803873, 0.2077558, 0.8806651, 0.2065389,
+  0.8809412, 0.2053457, 0.8812157, 0.2041758, 0.8814886, 0.2030285,
+  0.8817599, 0.2019033, 0.8820297, 0.2007998, 0.882298, 0.1997174,
+  0.8825649, 0.1986556, 0.8828303, 0.1976141, 0.8830943, 0.1965924,
+  0.8833569, 0.1955899, 0.8836182, 0.1946065, 0.8838782, 0.1936415,
+  0.8841369, 0.1926947, 0.8843943, 0.1917656, 0.8846505, 0.190854,
+  0.8849055, 0.1899594, 0.8851593, 0.1890815, 0.885412, 0.18822,
+  0.8856635, 0.1873746, 0.8859139, 0.1865449, 0.8861633, 0.1857307,
+  0.8864116, 0.1849317, 0.8866589, 0.1841475, 0.8869052, 0.1833779,
+  0.8871505, 0.1826226, 0.8873949, 0.1818815, 0.8876383, 0.1811541,
+  0.8878808, 0.1804404, 0.8881225, 0.17974, 0.8883633, 0.1790527,
+  0.8886032, 0.1783783, 0.8888424, 0.1777166, 0.8890807, 0.1770674,
+  0.8893183, 0.1764304, 0.8895551, 0.1758055, 0.8897912, 0.1751925,
+  0.8900266, 0.1745911, 0.8902613, 0.1740013, 0.8904954, 0.1734228,
+  0.8907287, 0.1728555, 0.8909615, 0.1722991, 0.8911937, 0.1717536,
+  0.8914253, 0.1712187, 0.8916563, 0.1706944, 0.8918867, 0.1701804,
+  0.8921167, 0.1696767, 0.8923461, 0.169183, 0.8925751, 0.1686993,
+  0.8928036, 0.1682254, 0.8930316, 0.1677611, 0.8932592, 0.1673065,
+  0.8934864, 0.1668612, 0.8937131, 0.1664253, 0.8939395, 0.1659986,
+  0.8941656, 0.165581, 0.8943913, 0.1651723, 0.8946167, 0.1647725,
+  0.8948418, 0.1643815, 0.8950666, 0.1639992, 0.8952911, 0.1636254,
+  0.8955154, 0.1632601, 0.8957394, 0.1629032, 0.8959632, 0.1625545,
+  0.8961868, 0.1622141, 0.8964103, 0.1618818, 0.8966336, 0.1615576,
+  0.8968567, 0.1612413, 0.8970797, 0.1609329, 0.8973026, 0.1606323,
+  0.8975253, 0.1603395, 0.8977481, 0.1600543, 0.8979707, 0.1597767,
+  0.8981933, 0.1595067, 0.8984159, 0.1592441, 0.8986385, 0.158989,
+  0.898861, 0.1587412, 0.8990836, 0.1585007, 0.8993063, 0.1582674,
+  0.899529, 0.1580413, 0.8997517, 0.1578224, 0.8999746, 0.1576105,
+  0.9001976, 0.1574057, 0.9004207, 0.1572078, 0.9006439, 0.1570169,
+  0.9008673, 0.1568329, 0.9010909, 0.1566558, 0.9013147, 0.1564855,
+  0.9015387, 0.1563219, 0.9017629, 0.1561651, 0.9019874, 0.1560151,
+  0.9022122, 0.1558717, 0.9024372, 0.1557349, 0.9026626, 0.1556048,
+  0.9028882, 0.1554812, 0.9031142, 0.1553642, 0.9033406, 0.1552538,
+  0.9035673, 0.1551499, 0.9037945, 0.1550524, 0.904022, 0.1549614,
+  0.90425, 0.1548769, 0.9044784, 0.1547988, 0.9047073, 0.1547272,
+  0.9049367, 0.1546619, 0.9051666, 0.154603, 0.905397, 0.1545505,
+  0.9037949, 0.1541916, 0.9021843, 0.1538379, 0.9005829, 0.1534922,
+  0.8989903, 0.1531545, 0.8974063, 0.1528248, 0.8958307, 0.1525028,
+  0.8942633, 0.1521886, 0.892704, 0.1518821, 0.8911524, 0.1515831,
+  0.8896084, 0.1512917, 0.8880718, 0.1510076, 0.8865425, 0.150731,
+  0.8850201, 0.1504617, 0.8835046, 0.1501996, 0.8819958, 0.1499447,
+  0.8804935, 0.1496969, 0.8789974, 0.1494562, 0.8775075, 0.1492225,
+  0.8760236, 0.1489957, 0.8745455, 0.1487759, 0.873073, 0.1485629,
+  0.8716059, 0.1483567, 0.8701442, 0.1481572, 0.8686876, 0.1479645,
+  0.867236, 0.1477784, 0.8657893, 0.1475989, 0.8643472, 0.147426,
+  0.8629096, 0.1472597, 0.8614765, 0.1470999, 0.8600475, 0.1469465,
+  0.8586227, 0.1467996, 0.8572017, 0.1466591, 0.8557846, 0.146525,
+  0.8543712, 0.1463972, 0.8529612, 0.1462757, 0.8515546, 0.1461606,
+  0.8501513, 0.1460517, 0.848751, 0.1459491, 0.8473538, 0.1458526,
+  0.8459593, 0.1457624, 0.8445676, 0.1456784, 0.8431784, 0.1456006,
+  0.8417916, 0.1455289, 0.8404072, 0.1454634, 0.8390249, 0.1454039,
+  0.8376446, 0.1453507, 0.8362663, 0.1453035, 0.8348897, 0.1452624,
+  0.8335148, 0.1452274, 0.8321415, 0.1451985, 0.8307695, 0.1451757,
+  0.8293988, 0.145159, 0.8280292, 0.1451483, 0.8266607, 0.1451438,
+  0.825293, 0.1451453, 0.8239262, 0.1451529, 0.8225599, 0.1451666,
+  0.8211942, 0.1451864, 0.8198289, 0.1452123, 0.8184639, 0.1452443,
+  0.817099, 0.1452824, 0.8157341, 0.1453267, 0.8143691, 0.1453771,
+  0.8130039, 0.1454337, 0.8116383, 0.1454964, 0.8102723, 0.1455654,
+  0.8089056, 0.1456406, 0.8075382, 0.1457219, 0.8061699, 0.1458096,
+  0.8048007, 0.1459035, 0.8034303, 0.1460038, 0.8020586, 0.1461104,
+  0.8006856, 0.1462233, 0.7993111, 0.1463426, 0.7979349, 0.1464684,
+  0.7965569, 0.1466006, 0.7951771, 0.1467393, 0.7937952, 0.1468845,
+  0.7924111, 0.1470363, 0.7910247, 0.1471947, 0.7896358, 0.1473597,
+  0.7882443, 0.1475315, 0.7868501, 0.14771, 0.785453, 0.1478952,
+  0.7840529, 0.1480873, 0.7826497, 0.1482863, 0.7812431, 0.1484923,
+  0.779833, 0.1487052, 0.7784193, 0.1489252, 0.7770019, 0.1491523,
+  0.7755806, 0.1493866, 0.7741551, 0.1496282, 0.7727254, 0.1498771,
+  0.7712914, 0.1501333, 0.7698527, 0.150397, 0.7684094, 0.1506683,
+  0.7669611, 0.1509471, 0.7655078, 0.1512336, 0.7640492, 0.151528,
+  0.7625852, 0.1518301, 0.7611156, 0.1521402, 0.7596402, 0.1524584,
+  0.7581589, 0.1527847, 0.7566713, 0.1531192, 0.7551775, 0.1534621,
+  0.753677, 0.1538133, 0.7521698, 0.1541732, 0.7506557, 0.1545417,
+  0.7491343, 0.154919, 0.7476056, 0.1553051, 0.7460692, 0.1557003,
+  0.7445251, 0.1561046, 0.7429728, 0.1565182, 0.7414123, 0.1569413,
+  0.7398432, 0.1573738, 0.7382653, 0.1578161, 0.7366783, 0.1582682,
+  0.7350821, 0.1587304, 0.7334763, 0.1592027, 0.7318606, 0.1596853,
+  0.7302348, 0.1601784, 0.7285986, 0.1606823, 0.7269517, 0.161197,
+  0.7252938, 0.1617227, 0.7236246, 0.1622597, 0.7219436, 0.1628082,
+  0.7202508, 0.1633684, 0.7185455, 0.1639404, 0.7168276, 0.1645246,
+  0.7150967, 0.1651212, 0.7133523, 0.1657303, 0.7115942, 0.1663523,
+  0.7098218, 0.1669875, 0.7080348, 0.1676361, 0.7062327, 0.1682983,
+  0.7044151, 0.1689745, 0.7025816, 0.1696651, 0.7007316, 0.1703702,
+  0.6988647, 0.1710903, 0.6969803, 0.1718257, 0.695078, 0.1725768,
+  0.6931571, 0.1733439, 0.691217, 0.1741274, 0.6892573, 0.1749278,
+  0.6872772, 0.1757455, 0.6852761, 0.1765809, 0.6832533, 0.1774345,
+  0.6812081, 0.1783068, 0.6791397, 0.1791984, 0.6770474, 0.1801097,
+  0.6749303, 0.1810413, 0.6727876, 0.1819938, 0.6706184, 0.1829679,
+  0.6684217, 0.1839643, 0.6661965, 0.1849835, 0.6639417, 0.1860264,
+  0.6616563, 0.1870938, 0.659339, 0.1881864, 0.6569887, 0.1893052,
+  0.6546039, 0.190451, 0.6521833, 0.1916249, 0.6497254, 0.1928278,
+  0.6472285, 0.194061, 0.644691, 0.1953256, 0.642111, 0.1966229,
+  0.6394866, 0.1979543, 0.6368157, 0.1993212, 0.634096, 0.2007251,
+  0.6313251, 0.202168, 0.6285002, 0.2036515, 0.6256186, 0.2051776,
+  0.622677, 0.2067487, 0.619672, 0.208367, 0.6165999, 0.2100353,
+  0.6134565, 0.2117563, 0.6102371, 0.2135333, 0.6069367, 0.2153698,
+  0.6035495, 0.2172699, 0.600069, 0.2192379, 0.596488, 0.2212789,
+  0.5927982, 0.2233986, 0.58899, 0.2256036, 0.5850523, 0.2279014,
+  0.5809722, 0.230301, 0.5767344, 0.2328129, 0.5723205, 0.2354495,
+  0.5677081, 0.2382262, 0.5628696, 0.2411618, 0.5577699, 0.2442801,
+  0.5523635, 0.2476121, 0.5465894, 0.2511991, 0.5403623, 0.2550989,
+  0.5335566, 0.2593965, 0.5259723, 0.2642268, 0.5172534, 0.2698303,
+  0.5066294, 0.2767261, 0.4915124, 0.2866573, 0.4526916, 0.3126804,
+  0.4534322, 0.3121089, 0.4541758, 0.3115474, 0.4549224, 0.310996,
+  0.455672, 0.3104545, 0.4564247, 0.3099227, 0.4571805, 0.3094007,
+  0.4579395, 0.3088883, 0.4587017, 0.3083855, 0.4594672, 0.3078921,
+  0.4602359, 0.3074081, 0.4610081, 0.3069333, 0.4617836, 0.3064678,
+  0.4625627, 0.3060114, 0.4633452, 0.305564, 0.4641313, 0.3051256,
+  0.464921, 0.3046961, 0.4657143, 0.3042754, 0.4665114, 0.3038635,
+  0.4673123, 0.3034602, 0.4681169, 0.3030655, 0.4689255, 0.3026794,
+  0.4697379, 0.3023017, 0.4705544, 0.3019323, 0.4713748, 0.3015714,
+  0.4721994, 0.3012186, 0.4730281, 0.3008741, 0.473861, 0.3005377,
+  0.4746982, 0.3002093, 0.4755396, 0.299889, 0.4763855, 0.2995766,
+  0.4772357, 0.2992721, 0.4780905, 0.2989754, 0.4789498, 0.2986865,
+  0.4798137, 0.2984053, 0.4806823, 0.2981317, 0.4815556, 0.2978657,
+  0.4824336, 0.2976073, 0.4833166, 0.2973564, 0.4842044, 0.2971129,
+  0.4850972, 0.2968767, 0.485995, 0.2966479, 0.486898, 0.2964264,
+  0.4878061, 0.2962121, 0.4887194, 0.296005, 0.489638, 0.2958051,
+  0.490562, 0.2956122, 0.4914913, 0.2954263, 0.4924262, 0.2952474,
+  0.4933667, 0.2950755, 0.4943127, 0.2949105, 0.4952645, 0.2947523,
+  0.496222, 0.2946009, 0.4971854, 0.2944563, 0.4981547, 0.2943185,
+  0.4991299, 0.2941872, 0.5001112, 0.2940627, 0.5010986, 0.2939447,
+  0.5020922, 0.2938333, 0.5030921, 0.2937284, 0.5040983, 0.2936299,
+  0.5051109, 0.2935379, 0.50613, 0.2934523, 0.5071557, 0.2933731,
+  0.508188, 0.2933002, 0.5092271, 0.2932335, 0.5102729, 0.2931731,
+  0.5113256, 0.2931189, 0.5123852, 0.2930709, 0.5134519, 0.293029,
+  0.5145257, 0.2929932, 0.5156067, 0.2929635, 0.5166949, 0.2929398,
+  0.5177905, 0.2929221, 0.5188936, 0.2929104, 0.5200041, 0.2929046,
+  0.5211223, 0.2929047, 0.5222481, 0.2929107, 0.5233817, 0.2929225,
+  0.5245231, 0.2929401, 0.5256725, 0.2929635, 0.5268299, 0.2929927,
+  0.5279954, 0.2930275, 0.5291691, 0.293068, 0.5303511, 0.2931142,
+  0.5315414, 0.293166, 0.5327402, 0.2932234, 0.5339476, 0.2932863,
+  0.5351635, 0.2933548, 0.5363882, 0.2934288, 0.5376217, 0.2935083,
+  0.5388641, 0.2935932, 0.5401155, 0.2936836, 0.541376, 0.2937793,
+  0.5426456, 0.2938805, 0.5439245, 0.2939869, 0.5452128, 0.2940988,
+  0.5465105, 0.2942159, 0.5478177, 0.2943383, 0.5491346, 0.2944659,
+  0.5504612, 0.2945988, 0.5517977, 0.2947369, 0.553144, 0.2948802,
+  0.5545004, 0.2950286, 0.5558669, 0.2951822, 0.5572435, 0.2953409,
+  0.5586305, 0.2955047, 0.5600278, 0.2956736, 0.5614357, 0.2958475,
+  0.5628541, 0.2960265, 0.5642832, 0.2962105, 0.565723, 0.2963996,
+  0.5671738, 0.2965936, 0.5686355, 0.2967926, 0.5701082, 0.2969965,
+  0.5715921, 0.2972054, 0.5730873, 0.2974192, 0.5745939, 0.297638,
+  0.5761118, 0.2978616, 0.5776414, 0.2980901, 0.5791826, 0.2983235,
+  0.5807355, 0.2985618, 0.5823002, 0.2988049, 0.583877, 0.2990529,
+  0.5854657, 0.2993057, 0.5870666, 0.2995633, 0.5886797, 0.2998257,
+  0.5903051, 0.300093, 0.591943, 0.300365, 0.5935934, 0.3006419,
+  0.5952565, 0.3009235, 0.5969322, 0.30121, 0.5986208, 0.3015012,
+  0.6003223, 0.3017973, 0.6020369, 0.3020981, 0.6037645, 0.3024037,
+  0.6055054, 0.3027141, 0.6072596, 0.3030294, 0.6090272, 0.3033494,
+  0.6108083, 0.3036742, 0.6126031, 0.3040038, 0.6144115, 0.3043383,
+  0.6162338, 0.3046776, 0.61807, 0.3050217, 0.6199202, 0.3053706,
+  0.6217845, 0.3057245, 0.623663, 0.3060832, 0.6255559, 0.3064468,
+  0.6274632, 0.3068153, 0.6293849, 0.3071887, 0.6313213, 0.3075671,
+  0.6332725, 0.3079504, 0.6352384, 0.3083387, 0.6372193, 0.3087321,
+  0.6392152, 0.3091304, 0.6412262, 0.3095339, 0.6432525, 0.3099424,
+  0.6452941, 0.310356, 0.6473512, 0.3107748, 0.6494238, 0.3111988,
+  0.651512, 0.311628, 0.6536161, 0.3120624, 0.655736, 0.3125022,
+  0.6578719, 0.3129473, 0.6600239, 0.3133977, 0.6621921, 0.3138536,
+  0.6643766, 0.314315, 0.6665776, 0.3147818, 0.6687951, 0.3152542,
+  0.6710292, 0.3157323, 0.6732802, 0.316216, 0.675548, 0.3167054,
+  0.6778329, 0.3172006, 0.6801349, 0.3177016, 0.6824542, 0.3182086,
+  0.6847908, 0.3187215, 0.687145, 0.3192404, 0.6895168, 0.3197654,
+  0.6919065, 0.3202966, 0.694314, 0.3208341, 0.6967396, 0.3213778,
+  0.6991834, 0.3219279, 0.7016455, 0.3224846, 0.7007236, 0.3214867,
+  0.6997734, 0.3204795, 0.6988344, 0.3194812, 0.6979063, 0.3184916,
+  0.6969891, 0.3175108, 0.6960827, 0.3165386, 0.6951868, 0.315575,
+  0.6943015, 0.31462, 0.6934265, 0.3136736, 0.6925618, 0.3127355,
+  0.6917072, 0.311806, 0.6908625, 0.3108848, 0.6900278, 0.3099719,
+  0.6892028, 0.3090674, 0.6883875, 0.3081711, 0.6875817, 0.307283,
+  0.6867853, 0.3064032, 0.6859982, 0.3055315, 0.6852204, 0.3046679,
+  0.6844516, 0.3038124, 0.6836918, 0.3029649, 0.6829408, 0.3021254,
+  0.6821986, 0.301294, 0.6814651, 0.3004705, 0.6807401, 0.2996549,
+  0.6800236, 0.2988472, 0.6793154, 0.2980474, 0.6786154, 0.2972554,
+  0.6779236, 0.2964712, 0.6772398, 0.2956948, 0.676564, 0.2949261,
+  0.675896, 0.2941652, 0.6752358, 0.293412, 0.6745832, 0.2926665,
+  0.6739381, 0.2919286, 0.6733005, 0.2911983, 0.6726703, 0.2904757,
+  0.6720473, 0.2897607, 0.6714316, 0.2890532, 0.6708229, 0.2883532,
+  0.6702212, 0.2876608, 0.6696265, 0.2869759, 0.6690385, 0.2862984,
+  0.6684573, 0.2856285, 0.6678828, 0.2849659, 0.6673149, 0.2843108,
+  0.6667534, 0.283663, 0.6661983, 0.2830227, 0.6656496, 0.2823897,
+  0.6651071, 0.281764, 0.6645707, 0.2811457, 0.6640405, 0.2805347,
+  0.6635162, 0.2799309, 0.6629979, 0.2793345, 0.6624854, 0.2787453,
+  0.6619787, 0.2781633, 0.6614777, 0.2775885, 0.6609824, 0.2770209,
+  0.6604925, 0.2764606, 0.6600082, 0.2759074, 0.6595293, 0.2753613,
+  0.6590557, 0.2748224, 0.6585874, 0.2742906, 0.6581243, 0.2737659,
+  0.6576663, 0.2732483, 0.6572134, 0.2727378, 0.6567655, 0.2722343,
+  0.6563225, 0.2717379, 0.6558844, 0.2712485, 0.6554512, 0.2707661,
+  0.6550226, 0.2702908, 0.6545988, 0.2698224, 0.6541795, 0.269361,
+  0.6537648, 0.2689066, 0.6533547, 0.2684591, 0.6529489, 0.2680186,
+  0.6525476, 0.267585, 0.6521506, 0.2671583, 0.6517578, 0.2667385,
+  0.6513693, 0.2663257, 0.6509849, 0.2659197, 0.6506047, 0.2655205,
+  0.6502284, 0.2651282, 0.6498562, 0.2647428, 0.6494879, 0.2643642,
+  0.6491236, 0.2639925, 0.648763, 0.2636275, 0.6484063, 0.2632694,
+  0.6480533, 0.2629181,
+];
+
+// linear_DisplayP3 cusp (L, C) pairs at 1024 hues evenly spaced from 0 to 360 degrees,
+// interpolated within 3.8e-05 of the exact cusp at 99% of hues, and 1.3e-03 at most
+
+export const OKLab_to_linear_DisplayP3_cusp_LUT = [
+  0.6704304, 0.3059899, 0.6700284, 0.3056112, 0.669631, 0.3052397,
+  0.669238, 0.3048753, 0.6688496, 0.3045179, 0.6684655, 0.3041677,
+  0.6680857, 0.3038245, 0.6677103, 0.3034885, 0.667339, 0.3031596,
+  0.666972, 0.3028378, 0.666609, 0.3025231, 0.6662502, 0.3022156,
+  0.6658953, 0.3019152, 0.6655444, 0.3016219, 0.6651975, 0.3013359,
+  0.6648544, 0.3010569, 0.6645151, 0.3007852, 0.6641796, 0.3005206,
+  0.6638479, 0.3002632, 0.6635198, 0.3000129, 0.6631953, 0.2997699,
+  0.6628744, 0.2995341, 0.6625571, 0.2993056, 0.6622433, 0.2990842,
+  0.6619329, 0.2988701, 0.6616259, 0.2986632, 0.6613223, 0.2984636,
+  0.6610221, 0.2982713, 0.6607251, 0.2980862, 0.6604314, 0.2979084,
+  0.6601408, 0.297738, 0.6598535, 0.2975748, 0.6595692, 0.297419,
+  0.6592881, 0.2972705, 0.65901, 0.2971293, 0.6587349, 0.2969956,
+  0.6584628, 0.2968692, 0.6581937, 0.2967502, 0.6579274, 0.2966386,
+  0.657664, 0.2965345, 0.6574035, 0.2964377, 0.6571457, 0.2963485,
+  0.6568907, 0.2962667, 0.6566385, 0.2961924, 0.656389, 0.2961256,
+  0.6561421, 0.2960664, 0.6558979, 0.2960147, 0.6556563, 0.2959706,
+  0.6554172, 0.295934, 0.6551807, 0.2959051, 0.6549468, 0.2958838,
+  0.6547153, 0.2958701, 0.6544863, 0.2958641, 0.6542597, 0.2958659,
+  0.6540355, 0.2958753, 0.6538137, 0.2958925, 0.6535942, 0.2959174,
+  0.6533771, 0.2959502, 0.6531623, 0.2959908, 0.6529497, 0.2960392,
+  0.6527394, 0.2960955, 0.6525313, 0.2961597, 0.6523254, 0.2962319,
+  0.6521217, 0.296312, 0.6519201, 0.2964002, 0.6517207, 0.2964963,
+  0.6515234, 0.2966005, 0.6513281, 0.2967128, 0.6511349, 0.2968333,
+  0.6509438, 0.2969619, 0.6507546, 0.2970987, 0.6505675, 0.2972438,
+  0.6503823, 0.2973971, 0.6501991, 0.2975588, 0.6500179, 0.2977288,
+  0.6498385, 0.2979072, 0.6496611, 0.2980941, 0.6494855, 0.2982894,
+  0.6493118, 0.2984933, 0.6491399, 0.2987057, 0.6489699, 0.2989268,
+  0.6488016, 0.2991565, 0.6486352, 0.2993949, 0.6497881, 0.2981218,
+  0.6516969, 0.2959943, 0.6535845, 0.2939099, 0.6554514, 0.2918675,
+  0.6572981, 0.289866, 0.6591252, 0.2879044, 0.6609332, 0.2859817,
+  0.6627224, 0.2840968, 0.6644933, 0.2822489, 0.6662464, 0.280437,
+  0.6679821, 0.2786603, 0.6697009, 0.2769179, 0.671403, 0.2752091,
+  0.673089, 0.2735329, 0.6747591, 0.2718887, 0.6764139, 0.2702757,
+  0.6780535, 0.2686931, 0.6796784, 0.2671404, 0.681289, 0.2656168,
+  0.6828855, 0.2641218, 0.6844682, 0.2626545, 0.6860376, 0.2612146,
+  0.6875938, 0.2598013, 0.6891373, 0.258414, 0.6906682, 0.2570524,
+  0.6921869, 0.2557158, 0.6936937, 0.2544036, 0.6951888, 0.2531155,
+  0.6966725, 0.2518508, 0.698145, 0.2506092, 0.6996066, 0.2493902,
+  0.7010576, 0.2481933, 0.7024981, 0.2470181, 0.7039285, 0.2458642,
+  0.7053489, 0.2447312, 0.7067597, 0.2436187, 0.7081609, 0.2425263,
+  0.7095528, 0.2414536, 0.7109356, 0.2404002, 0.7123096, 0.2393659,
+  0.7136749, 0.2383503, 0.7150318, 0.237353, 0.7163803, 0.2363737,
+  0.7177208, 0.2354122, 0.7190534, 0.2344681, 0.7203782, 0.233541,
+  0.7216955, 0.2326309, 0.7230055, 0.2317372, 0.7243082, 0.2308598,
+  0.7256039, 0.2299985, 0.7268928, 0.2291529, 0.728175, 0.2283228,
+  0.7294506, 0.2275079, 0.7307199, 0.2267081, 0.7319829, 0.2259231,
+  0.7332398, 0.2251526, 0.7344908, 0.2243965, 0.7357361, 0.2236546,
+  0.7369757, 0.2229266, 0.7382098, 0.2222123, 0.7394385, 0.2215115,
+  0.740662, 0.2208241, 0.7418805, 0.2201499, 0.743094, 0.2194886,
+  0.7443026, 0.2188402, 0.7455066, 0.2182044, 0.746706, 0.217581,
+  0.7479009, 0.21697, 0.7490916, 0.2163711, 0.750278, 0.2157842,
+  0.7514604, 0.2152092, 0.7526388, 0.2146459, 0.7538134, 0.2140941,
+  0.7549842, 0.2135537, 0.7561514, 0.2130247, 0.7573152, 0.2125068,
+  0.7584755, 0.212, 0.7596326, 0.211504, 0.7607865, 0.2110189,
+  0.7619373, 0.2105444, 0.7630852, 0.2100805, 0.7642302, 0.209627,
+  0.7653725, 0.2091839, 0.7665122, 0.2087511, 0.7676493, 0.2083284,
+  0.768784, 0.2079157, 0.7699163, 0.207513, 0.7710464, 0.2071201,
+  0.7721744, 0.206737, 0.7733003, 0.2063636, 0.7744243, 0.2059998,
+  0.7755465, 0.2056455, 0.7766669, 0.2053006, 0.7777856, 0.2049651,
+  0.7789028, 0.2046389, 0.7800186, 0.2043218, 0.7811329, 0.204014,
+  0.782246, 0.2037152, 0.783358, 0.2034254, 0.7844688, 0.2031445,
+  0.7855786, 0.2028726, 0.7866875, 0.2026095, 0.7877957, 0.2023551,
+  0.7889031, 0.2021095, 0.7900098, 0.2018725, 0.7911161, 0.2016441,
+  0.7922219, 0.2014243, 0.7933273, 0.2012131, 0.7944324, 0.2010103,
+  0.7955374, 0.2008159, 0.7966423, 0.2006299, 0.7977472, 0.2004523,
+  0.7988522, 0.200283, 0.7999574, 0.200122, 0.8010629, 0.1999692,
+  0.8021687, 0.1998247, 0.803275, 0.1996883, 0.8043818, 0.1995601,
+  0.8054892, 0.1994401, 0.8065974, 0.1993281, 0.8077064, 0.1992243,
+  0.8088164, 0.1991285, 0.8099273, 0.1990407, 0.8110393, 0.198961,
+  0.8121525, 0.1988893, 0.813267, 0.1988257, 0.8143828, 0.19877,
+  0.8155002, 0.1987223, 0.8166191, 0.1986825, 0.8177396, 0.1986507,
+  0.8188619, 0.1986269, 0.819986, 0.1986111, 0.8211121, 0.1986032,
+  0.8222403, 0.1986032, 0.8233705, 0.1986112, 0.824503, 0.1986272,
+  0.8256379, 0.1986511, 0.8267752, 0.198683, 0.827915, 0.1987229,
+  0.8290575, 0.1987708, 0.8302027, 0.1988266, 0.8313507, 0.1988905,
+  0.8325017, 0.1989624, 0.8336558, 0.1990424, 0.834813, 0.1991304,
+  0.8359735, 0.1992264, 0.8371374, 0.1993306, 0.8383048, 0.199443,
+  0.8394758, 0.1995634, 0.8406505, 0.1996921, 0.8418291, 0.1998289,
+  0.8430116, 0.199974, 0.8441981, 0.2001274, 0.8453889, 0.2002891,
+  0.846584, 0.2004591, 0.8477835, 0.2006375, 0.8489875, 0.2008243,
+  0.8501962, 0.2010196, 0.8514097, 0.2012234, 0.8526282, 0.2014357,
+  0.8538517, 0.2016567, 0.8550805, 0.2018863, 0.8563145, 0.2021246,
+  0.8575541, 0.2023716, 0.8587992, 0.2026275, 0.8600502, 0.2028922,
+  0.861307, 0.2031659, 0.8625698, 0.2034486, 0.8638389, 0.2037404,
+  0.8651143, 0.2040412, 0.8663962, 0.2043513, 0.8676847, 0.2046707,
+  0.8689801, 0.2049994, 0.8702824, 0.2053375, 0.8715919, 0.2056851,
+  0.8729087, 0.2060424, 0.874233, 0.2064093, 0.875565, 0.2067859,
+  0.8769048, 0.2071725, 0.8782526, 0.2075689, 0.8796087, 0.2079755,
+  0.8809731, 0.2083921, 0.8823462, 0.208819, 0.883728, 0.2092563,
+  0.8851188, 0.2097041, 0.8865188, 0.2101624, 0.8879283, 0.2106314,
+  0.8893473, 0.2111112, 0.8907762, 0.211602, 0.8922152, 0.2121038,
+  0.8936645, 0.2126168, 0.8951243, 0.2131412, 0.8965949, 0.213677,
+  0.8980765, 0.2142244, 0.8995694, 0.2147836, 0.9010738, 0.2153547,
+  0.90259, 0.2159378, 0.9041183, 0.2165332, 0.9056589, 0.2171409,
+  0.9072122, 0.2177612, 0.9087784, 0.2183942, 0.9103578, 0.2190401,
+  0.9119507, 0.2196991, 0.9135575, 0.2203714, 0.9151784, 0.2210571,
+  0.9168138, 0.2217565, 0.9184641, 0.2224698, 0.9201295, 0.2231972,
+  0.9218104, 0.2239389, 0.9235073, 0.2246951, 0.9252205, 0.2254661,
+  0.9269503, 0.226252, 0.9286972, 0.2270533, 0.9304615, 0.22787,
+  0.9322438, 0.2287024, 0.9340444, 0.2295509, 0.9358638, 0.2304157,
+  0.9377024, 0.2312971, 0.9395607, 0.2321954, 0.9414393, 0.2331108,
+  0.9433385, 0.2340437, 0.945259, 0.2349945, 0.9472013, 0.2359634,
+  0.9491659, 0.2369507, 0.9511533, 0.2379569, 0.9531642, 0.2389823,
+  0.9551992, 0.2400273, 0.9572589, 0.2410922, 0.959344, 0.2421775,
+  0.961455, 0.2432835, 0.9635928, 0.2444108, 0.9643125, 0.2451922,
+  0.9633252, 0.2455515, 0.9623376, 0.2459217, 0.9613498, 0.2463031,
+  0.9603616, 0.2466956, 0.959373, 0.2470994, 0.9583839, 0.2475145,
+  0.9573942, 0.247941, 0.9564038, 0.248379, 0.9554127, 0.2488286,
+  0.9544207, 0.24929, 0.9534278, 0.2497632, 0.952434, 0.2502484,
+  0.9514391, 0.2507456, 0.950443, 0.2512549, 0.9494457, 0.2517766,
+  0.9484471, 0.2523106, 0.9474471, 0.2528572, 0.9464456, 0.2534165,
+  0.9454426, 0.2539885, 0.944438, 0.2545735, 0.9434316, 0.2551716,
+  0.9424234, 0.2557829, 0.9414133, 0.2564076, 0.9404013, 0.2570458,
+  0.9393871, 0.2576977, 0.9383709, 0.2583635, 0.9373524, 0.2590432,
+  0.9363316, 0.2597372, 0.9353083, 0.2604455, 0.9342826, 0.2611684,
+  0.9332543, 0.2619061, 0.9322232, 0.2626586, 0.9311895, 0.2634263,
+  0.9301528, 0.2642093, 0.9291132, 0.2650079, 0.9280705, 0.2658222,
+  0.9270246, 0.2666525, 0.9259755, 0.267499, 0.924923, 0.2683619,
+  0.9238671, 0.2692416, 0.9228076, 0.2701381, 0.9217445, 0.2710518,
+  0.9206776, 0.271983, 0.9196069, 0.2729318, 0.9185321, 0.2738987,
+  0.9174533, 0.2748838, 0.9163703, 0.2758874, 0.915283, 0.2769099,
+  0.9141912, 0.2779516, 0.913095, 0.2790127, 0.911994, 0.2800936,
+  0.9108884, 0.2811947, 0.9097778, 0.2823162, 0.9086622, 0.2834586,
+  0.9075415, 0.2846222, 0.9064155, 0.2858073, 0.9052842, 0.2870144,
+  0.9041473, 0.2882438, 0.9030048, 0.289496, 0.9018565, 0.2907714,
+  0.9007023, 0.2920704, 0.899542, 0.2933935, 0.8983756, 0.294741,
+  0.8972028, 0.2961136, 0.8960234, 0.2975116, 0.8948375, 0.2989357,
+  0.8936448, 0.3003862, 0.8924451, 0.3018637, 0.8912383, 0.3033689,
+  0.8900242, 0.3049022, 0.8888027, 0.3064642, 0.8875736, 0.3080556,
+  0.8863367, 0.3096769, 0.8850919, 0.3113288, 0.8838389, 0.313012,
+  0.8825776, 0.3147272, 0.8813079, 0.3164751, 0.8800294, 0.3182563,
+  0.878742, 0.3200717, 0.8774456, 0.321922, 0.8761399, 0.3238081,
+  0.8748247, 0.3257307, 0.8734998, 0.3276908, 0.8721649, 0.3296892,
+  0.8708199, 0.3317269, 0.8694646, 0.3338048, 0.8680986, 0.335924,
+  0.8667218, 0.3380853, 0.8653338, 0.34029, 0.8639346, 0.342539,
+  0.8625237, 0.3448337, 0.861101, 0.347175, 0.8596661, 0.3495643,
+  0.8582189, 0.3520029, 0.8567589, 0.354492, 0.8552859, 0.3570331,
+  0.8537997, 0.3596275, 0.8522999, 0.3622768, 0.8507861, 0.3649825,
+  0.8492582, 0.3677462, 0.8491142, 0.3657931, 0.8495082, 0.3620877,
+  0.8499009, 0.3584803, 0.8502922, 0.3549671, 0.8506821, 0.3515447,
+  0.8510706, 0.3482096, 0.8514576, 0.3449587, 0.851843, 0.3417889,
+  0.8522269, 0.3386975, 0.8526093, 0.3356816, 0.85299, 0.3327387,
+  0.8533692, 0.3298663, 0.8537467, 0.327062, 0.8541227, 0.3243236,
+  0.854497, 0.3216489, 0.8548697, 0.3190359, 0.8552408, 0.3164826,
+  0.8556102, 0.3139872, 0.8559781, 0.3115479, 0.8563443, 0.309163,
+  0.856709, 0.3068307, 0.857072, 0.3045497, 0.8574335, 0.3023182,
+  0.8577934, 0.300135, 0.8581518, 0.2979987, 0.8585086, 0.2959078,
+  0.8588639, 0.2938612, 0.8592176, 0.2918576, 0.8595699, 0.2898958,
+  0.8599207, 0.2879748, 0.8602701, 0.2860933, 0.860618, 0.2842505,
+  0.8609645, 0.2824452, 0.8613096, 0.2806766, 0.8616533, 0.2789436,
+  0.8619957, 0.2772454, 0.8623367, 0.2755811, 0.8626764, 0.27395,
+  0.8630148, 0.2723511, 0.8633519, 0.2707837, 0.8636877, 0.269247,
+  0.8640224, 0.2677404, 0.8643558, 0.2662632, 0.864688, 0.2648146,
+  0.8650191, 0.263394, 0.865349, 0.2620008, 0.8656778, 0.2606344,
+  0.8660055, 0.2592942, 0.8663321, 0.2579796, 0.8666577, 0.2566901,
+  0.8669822, 0.2554252, 0.8673057, 0.2541842, 0.8676283, 0.2529669,
+  0.8679498, 0.2517725, 0.8682704, 0.2506008, 0.8685901, 0.2494511,
+  0.8689089, 0.2483232, 0.8692269, 0.2472166, 0.8695439, 0.2461308,
+  0.8698602, 0.2450654, 0.8701756, 0.2440202, 0.8704902, 0.2429946,
+  0.8708041, 0.2419884, 0.8711172, 0.2410011, 0.8714296, 0.2400325,
+  0.8717413, 0.2390822, 0.8720524, 0.2381499, 0.8723627, 0.2372353,
+  0.8726725, 0.236338, 0.8729816, 0.2354578, 0.8732901, 0.2345944,
+  0.8735981, 0.2337475, 0.8739055, 0.2329169, 0.8742124, 0.2321022,
+  0.8745187, 0.2313032, 0.8748246, 0.2305197, 0.8751301, 0.2297515,
+  0.8754351, 0.2289983, 0.8757396, 0.2282598, 0.8760438, 0.2275359,
+  0.8763476, 0.2268263, 0.876651, 0.2261309, 0.8769541, 0.2254494,
+  0.8772569, 0.2247816, 0.8775594, 0.2241274, 0.8778616, 0.2234866,
+  0.8781636, 0.2228589, 0.8784654, 0.2222442, 0.8787669, 0.2216423,
+  0.8790682, 0.2210532, 0.8793694, 0.2204765, 0.8796705, 0.2199122,
+  0.8799714, 0.21936, 0.8802722, 0.21882, 0.8805729, 0.2182918,
+  0.8808736, 0.2177754, 0.8811742, 0.2172706, 0.8814748, 0.2167774,
+  0.8817754, 0.2162955, 0.882076, 0.2158249, 0.8823767, 0.2153653,
+  0.8826775, 0.2149169, 0.8829783, 0.2144793, 0.8832792, 0.2140525,
+  0.8835803, 0.2136364, 0.8838815, 0.2132308, 0.8841829, 0.2128358,
+  0.8844845, 0.2124511, 0.8847863, 0.2120768, 0.8850884, 0.2117126,
+  0.8853907, 0.2113585, 0.8856933, 0.2110145, 0.8859962, 0.2106805,
+  0.8862995, 0.2103562, 0.8866031, 0.2100418, 0.886907, 0.2097371,
+  0.8872114, 0.2094421, 0.8875162, 0.2091566, 0.8878214, 0.2088806,
+  0.8881271, 0.2086141, 0.8884333, 0.208357, 0.88874, 0.2081092,
+  0.8890472, 0.2078706, 0.889355, 0.2076413, 0.8896634, 0.2074211,
+  0.8899723, 0.2072101, 0.890282, 0.2070081, 0.8905922, 0.2068151,
+  0.8909032, 0.2066311, 0.8912149, 0.2064561, 0.8915273, 0.2062899,
+  0.8918405, 0.2061326, 0.8921544, 0.2059842, 0.8924692, 0.2058445,
+  0.8927848, 0.2057136, 0.8916985, 0.2052685, 0.8898017, 0.2046461,
+  0.8879183, 0.2040361, 0.8860479, 0.2034384, 0.8841903, 0.2028527,
+  0.8823451, 0.2022789, 0.8805121, 0.201717, 0.878691, 0.2011666,
+  0.8768815, 0.2006276, 0.8750834, 0.2001, 0.8732962, 0.1995836,
+  0.8715199, 0.1990782, 0.8697541, 0.1985837, 0.8679986, 0.1980999,
+  0.8662531, 0.1976269, 0.8645174, 0.1971643, 0.8627913, 0.1967122,
+  0.8610744, 0.1962704, 0.8593667, 0.1958387, 0.8576678, 0.1954172,
+  0.8559776, 0.1950056, 0.8542958, 0.1946038, 0.8526221, 0.1942119,
+  0.8509565, 0.1938296, 0.8492987, 0.193457, 0.8476485, 0.1930938,
+  0.8460056, 0.19274, 0.8443699, 0.1923956, 0.8427413, 0.1920604,
+  0.8411194, 0.1917343, 0.8395042, 0.1914174, 0.8378953, 0.1911095,
+  0.8362928, 0.1908105, 0.8346962, 0.1905204, 0.8331056, 0.1902391,
+  0.8315207, 0.1899666, 0.8299413, 0.1897027, 0.8283673, 0.1894475,
+  0.8267985, 0.1892008, 0.8252348, 0.1889626, 0.8236759, 0.1887329,
+  0.8221217, 0.1885117, 0.820572, 0.1882987, 0.8190267, 0.1880941,
+  0.8174857, 0.1878978, 0.8159487, 0.1877097, 0.8144157, 0.1875298,
+  0.8128864, 0.187358, 0.8113607, 0.1871944, 0.8098385, 0.1870388,
+  0.8083196, 0.1868913, 0.8068038, 0.1867518, 0.8052911, 0.1866203,
+  0.8037812, 0.1864967, 0.802274, 0.1863811, 0.8007695, 0.1862734,
+  0.7992673, 0.1861736, 0.7977675, 0.1860817, 0.7962698, 0.1859976,
+  0.7947741, 0.1859214, 0.7932803, 0.185853, 0.7917883, 0.1857925,
+  0.7902978, 0.1857397, 0.7888087, 0.1856947, 0.787321, 0.1856576,
+  0.7858345, 0.1856282, 0.784349, 0.1856066, 0.7828643, 0.1855928,
+  0.7813805, 0.1855868, 0.7798973, 0.1855886, 0.7784145, 0.1855982,
+  0.7769321, 0.1856155, 0.7754499, 0.1856407, 0.7739678, 0.1856737,
+  0.7724856, 0.1857146, 0.7710033, 0.1857632, 0.7695205, 0.1858198,
+  0.7680373, 0.1858842, 0.7665535, 0.1859566, 0.7650689, 0.1860368,
+  0.7635834, 0.186125, 0.7620969, 0.1862212, 0.7606092, 0.1863253,
+  0.7591202, 0.1864375, 0.7576296, 0.1865578, 0.7561375, 0.1866862,
+  0.7546436, 0.1868226, 0.7531479, 0.1869673, 0.75165, 0.1871202,
+  0.75015, 0.1872813, 0.7486476, 0.1874507, 0.7471427, 0.1876284,
+  0.7456351, 0.1878146, 0.7441248, 0.1880092, 0.7426115, 0.1882122,
+  0.741095, 0.1884239, 0.7395753, 0.1886441, 0.7380521, 0.188873,
+  0.7365254, 0.1891107, 0.7349948, 0.1893572, 0.7334603, 0.1896125,
+  0.7319217, 0.1898768, 0.7303789, 0.1901501, 0.7288316, 0.1904325,
+  0.7272796, 0.1907241, 0.7257228, 0.191025, 0.7241611, 0.1913352,
+  0.7225942, 0.1916549, 0.7210219, 0.1919841, 0.719444, 0.1923229,
+  0.7178604, 0.1926715, 0.7162709, 0.1930299, 0.7146752, 0.1933982,
+  0.7130731, 0.1937766, 0.7114645, 0.1941652, 0.7098491, 0.1945641,
+  0.7082267, 0.1949734, 0.7065971, 0.1953932, 0.70496, 0.1958238,
+  0.7033152, 0.1962651, 0.7016625, 0.1967174, 0.7000017, 0.1971808,
+  0.6983324, 0.1976555, 0.6966545, 0.1981416, 0.6949676, 0.1986392,
+  0.6932715, 0.1991487, 0.691566, 0.19967, 0.6898507, 0.2002035,
+  0.6881253, 0.2007492, 0.6863896, 0.2013074, 0.6846433, 0.2018783,
+  0.682886, 0.2024622, 0.6811174, 0.2030591, 0.6793372, 0.2036693,
+  0.6775451, 0.2042932, 0.6757406, 0.2049308, 0.6739234, 0.2055825,
+  0.6720932, 0.2062485, 0.6702496, 0.2069291, 0.6683921, 0.2076246,
+  0.6665204, 0.2083352, 0.664634, 0.2090613, 0.6627324, 0.2098031,
+  0.6608153, 0.2105611, 0.6588822, 0.2113354, 0.6569324, 0.2121266,
+  0.6549656, 0.2129349, 0.6529813, 0.2137608, 0.6509787, 0.2146046,
+  0.6489575, 0.2154667, 0.6469169, 0.2163477, 0.6448564, 0.2172479,
+  0.6427753, 0.2181678, 0.6406729, 0.219108, 0.6385485, 0.2200688,
+  0.6364013, 0.221051, 0.6342307, 0.2220551, 0.6320357, 0.2230816,
+  0.6298155, 0.2241312, 0.6275692, 0.2252046, 0.6252959, 0.2263025,
+  0.6229945, 0.2274255, 0.620664, 0.2285746, 0.6183033, 0.2297505,
+  0.6159112, 0.230954, 0.6134865, 0.2321862, 0.6110277, 0.233448,
+  0.6085336, 0.2347405, 0.6060025, 0.2360647, 0.6034329, 0.2374219,
+  0.6008231, 0.2388133, 0.5981712, 0.2402403, 0.5954753, 0.2417044,
+  0.5927331, 0.2432071, 0.5899424, 0.2447502, 0.5871007, 0.2463354,
+  0.5842053, 0.2479648, 0.5812532, 0.2496405, 0.5782412, 0.251365,
+  0.5751657, 0.2531408, 0.5720228, 0.2549707, 0.5688082, 0.256858,
+  0.565517, 0.2588062, 0.5621439, 0.2608192, 0.5586828, 0.2629013,
+  0.5551267, 0.2650577, 0.551468, 0.2672938, 0.5476975, 0.2696163,
+  0.543805, 0.2720326, 0.539778, 0.2745516, 0.5356022, 0.2771836,
+  0.5312603, 0.279941, 0.526731, 0.282839, 0.5219881, 0.2858963,
+  0.5169984, 0.2891366, 0.5117186, 0.2925907, 0.5060906, 0.2962999,
+  0.5000327, 0.3003219, 0.4934243, 0.3047423, 0.4860722, 0.3096976,
+  0.4776287, 0.3154333, 0.4673287, 0.3224894, 0.4670018, 0.3226392,
+  0.4677021, 0.3220873, 0.4684048, 0.3215461, 0.4691101, 0.3210155,
+  0.4698178, 0.3204956, 0.4705281, 0.319986, 0.471241, 0.3194869,
+  0.4719566, 0.318998, 0.4726749, 0.3185193, 0.4733959, 0.3180508,
+  0.4741197, 0.3175922, 0.4748464, 0.3171437, 0.4755759, 0.316705,
+  0.4763084, 0.3162761, 0.4770438, 0.315857, 0.4777822, 0.3154475,
+  0.4785238, 0.3150476, 0.4792684, 0.3146572, 0.4800162, 0.3142762,
+  0.4807673, 0.3139047, 0.4815216, 0.3135424, 0.4822792, 0.3131894,
+  0.4830402, 0.3128455, 0.4838046, 0.3125108, 0.4845725, 0.3121851,
+  0.4853439, 0.3118684, 0.4861188, 0.3115607, 0.4868974, 0.3112618,
+  0.4876797, 0.3109718, 0.4884658, 0.3106905, 0.4892556, 0.3104179,
+  0.4900493, 0.310154, 0.4908468, 0.3098986, 0.4916484, 0.3096518,
+  0.4924539, 0.3094136, 0.4932635, 0.3091837, 0.4940773, 0.3089623,
+  0.4948952, 0.3087492, 0.4957174, 0.3085444, 0.4965439, 0.3083479,
+  0.4973748, 0.3081596, 0.4982101, 0.3079794, 0.4990499, 0.3078074,
+  0.4998943, 0.3076435, 0.5007433, 0.3074876, 0.5015969, 0.3073397,
+  0.5024553, 0.3071997, 0.5033186, 0.3070677, 0.5041867, 0.3069436,
+  0.5050597, 0.3068273, 0.5059378, 0.3067187, 0.5068209, 0.306618,
+  0.5077092, 0.306525, 0.5086027, 0.3064397, 0.5095015, 0.306362,
+  0.5104056, 0.306292, 0.5113152, 0.3062296, 0.5122303, 0.3061747,
+  0.5131509, 0.3061274, 0.5140772, 0.3060875, 0.5150092, 0.3060552,
+  0.515947, 0.3060302, 0.5168907, 0.3060127, 0.5178404, 0.3060025,
+  0.518796, 0.3059997, 0.5197578, 0.3060043, 0.5207257, 0.3060161,
+  0.5216999, 0.3060351, 0.5226805, 0.3060614, 0.5236675, 0.306095,
+  0.524661, 0.3061357, 0.525661, 0.3061836, 0.5266678, 0.3062386,
+  0.5276813, 0.3063007, 0.5287016, 0.3063699, 0.5297289, 0.3064462,
+  0.5307632, 0.3065295, 0.5318046, 0.3066199, 0.5328532, 0.3067172,
+  0.5339091, 0.3068216, 0.5349723, 0.3069328, 0.5360431, 0.3070511,
+  0.5371213, 0.3071762, 0.5382073, 0.3073082, 0.5393009, 0.3074471,
+  0.5404024, 0.3075929, 0.5415119, 0.3077455, 0.5426293, 0.3079049,
+  0.5437549, 0.3080711, 0.5448887, 0.3082441, 0.5460309, 0.3084239,
+  0.5471815, 0.3086104, 0.5483406, 0.3088037, 0.5495083, 0.3090036,
+  0.5506847, 0.3092103, 0.55187, 0.3094236, 0.5530642, 0.3096436,
+  0.5542675, 0.3098703, 0.5554799, 0.3101035, 0.5567016, 0.3103434,
+  0.5579326, 0.31059, 0.5591731, 0.3108431, 0.5604232, 0.3111028,
+  0.561683, 0.311369, 0.5629525, 0.3116418, 0.564232, 0.3119211,
+  0.5655215, 0.312207, 0.5668212, 0.3124994, 0.5681311, 0.3127983,
+  0.5694514, 0.3131037, 0.5707821, 0.3134155, 0.5721235, 0.3137338,
+  0.5734756, 0.3140586, 0.5748385, 0.3143898, 0.5762124, 0.3147275,
+  0.5775973, 0.3150716, 0.5789934, 0.3154221, 0.5804009, 0.3157791,
+  0.5818198, 0.3161424, 0.5832503, 0.3165121, 0.5846924, 0.3168883,
+  0.5861464, 0.3172708, 0.5876123, 0.3176596, 0.5890902, 0.3180549,
+  0.5905804, 0.3184565, 0.5920829, 0.3188645, 0.5935978, 0.3192788,
+  0.5951252, 0.3196995, 0.5966654, 0.3201265, 0.5982184, 0.3205599,
+  0.5997844, 0.3209996, 0.6013635, 0.3214456, 0.6029557, 0.321898,
+  0.6045614, 0.3223567, 0.6061805, 0.3228218, 0.6078133, 0.3232932,
+  0.6094598, 0.3237709, 0.6111202, 0.324255, 0.6127946, 0.3247454,
+  0.6144832, 0.3252422, 0.6161861, 0.3257454, 0.6179034, 0.3262549,
+  0.6196353, 0.3267707, 0.6213819, 0.327293, 0.6231434, 0.3278216,
+  0.6249199, 0.3283566, 0.6267115, 0.328898, 0.6285184, 0.3294458,
+  0.6303406, 0.3300001, 0.6321785, 0.3305608, 0.634032, 0.3311279,
+  0.6359014, 0.3317015, 0.6377868, 0.3322816, 0.6396883, 0.3328682,
+  0.6416061, 0.3334614, 0.6435403, 0.3340611, 0.6454911, 0.3346673,
+  0.6474586, 0.3352801, 0.649443, 0.3358996, 0.6514444, 0.3365257,
+  0.653463, 0.3371584, 0.6554988, 0.3377979, 0.6575522, 0.3384441,
+  0.6596231, 0.339097, 0.6617119, 0.3397568, 0.6638186, 0.3404234,
+  0.6659433, 0.3410968, 0.6680863, 0.3417772, 0.6702477, 0.3424645,
+  0.6724277, 0.3431589, 0.6746263, 0.3438603, 0.6768439, 0.3445687,
+  0.6790805, 0.3452843, 0.6813363, 0.3460071, 0.6836115, 0.3467372,
+  0.6859062, 0.3474746, 0.6882206, 0.3482193, 0.6905549, 0.3489715,
+  0.6929093, 0.3497311, 0.6952839, 0.3504983, 0.6976789, 0.3512732,
+  0.7000944, 0.3520557, 0.7025308, 0.352846, 0.704988, 0.3536442,
+  0.7074664, 0.3544502, 0.7099661, 0.3552643, 0.7124873, 0.3560865,
+  0.7150303, 0.3569169, 0.7175951, 0.3577555, 0.720182, 0.3586026,
+  0.7227911, 0.3594581, 0.724806, 0.3600157, 0.7237783, 0.3590622,
+  0.7227621, 0.3581163, 0.7217574, 0.357178, 0.720764, 0.3562473,
+  0.7197819, 0.355324, 0.7188108, 0.3544083, 0.7178507, 0.3535001,
+  0.7169015, 0.3525992, 0.715963, 0.3517058, 0.7150352, 0.3508197,
+  0.714118, 0.349941, 0.7132112, 0.3490695, 0.7123147, 0.3482054,
+  0.7114285, 0.3473485, 0.7105524, 0.3464988, 0.7096863, 0.3456563,
+  0.7088301, 0.3448211, 0.7079838, 0.343993, 0.7071472, 0.343172,
+  0.7063201, 0.3423583, 0.7055026, 0.3415516, 0.7046945, 0.340752,
+  0.7038958, 0.3399596, 0.7031062, 0.3391742, 0.7023258, 0.3383959,
+  0.7015543, 0.3376247, 0.7007918, 0.3368605, 0.7000381, 0.3361033,
+  0.6992932, 0.3353532, 0.6985568, 0.3346102, 0.697829, 0.3338741,
+  0.6971097, 0.3331451, 0.6963987, 0.332423, 0.695696, 0.331708,
+  0.6950014, 0.331, 0.6943149, 0.330299, 0.6936364, 0.3296049,
+  0.6929658, 0.3289179, 0.692303, 0.3282378, 0.6916479, 0.3275647,
+  0.6910004, 0.3268986, 0.6903605, 0.3262395, 0.689728, 0.3255874,
+  0.6891029, 0.3249422, 0.6884851, 0.324304, 0.6878745, 0.3236728,
+  0.687271, 0.3230486, 0.6866745, 0.3224313, 0.686085, 0.3218211,
+  0.6855023, 0.3212178, 0.6849264, 0.3206215, 0.6843572, 0.3200322,
+  0.6837947, 0.3194498, 0.6832387, 0.3188745, 0.6826891, 0.3183061,
+  0.6821459, 0.3177447, 0.6816091, 0.3171904, 0.6810785, 0.316643,
+  0.680554, 0.3161026, 0.6800356, 0.3155692, 0.6795233, 0.3150428,
+  0.6790169, 0.3145234, 0.6785163, 0.314011, 0.6780215, 0.3135056,
+  0.6775325, 0.3130072, 0.6770491, 0.3125159, 0.6765713, 0.3120316,
+  0.6760989, 0.3115543, 0.6756321, 0.311084, 0.6751706, 0.3106207,
+  0.6747144, 0.3101645, 0.6742635, 0.3097153, 0.6738177, 0.3092731,
+  0.6733771, 0.308838, 0.6729415, 0.30841, 0.6725108, 0.307989,
+  0.6720851, 0.307575, 0.6716643, 0.3071681, 0.6712483, 0.3067683,
+  0.670837, 0.3063755,
+];
+
+// linear_Rec2020 cusp (L, C) pairs at 1024 hues evenly spaced from 0 to 360 degrees,
+// interpolated within 3.2e-05 of the exact cusp at 99% of hues, and 1.0e-02 at most
+
+export const OKLab_to_linear_Rec2020_cusp_LUT = [
+  0.7046763, 0.3774554, 0.7042946, 0.3769954, 0.7039178, 0.3765427,
+  0.7035457, 0.3760975, 0.7031783, 0.3756597, 0.7028155, 0.3752295,
+  0.7024573, 0.3748068, 0.7021037, 0.3743916, 0.7017545, 0.3739841,
+  0.7014097, 0.3735842, 0.7010693, 0.373192, 0.7007332, 0.3728075,
+  0.7004013, 0.3724307, 0.7000737, 0.3720617, 0.6997502, 0.3717005,
+  0.6994308, 0.3713471, 0.6991154, 0.3710016, 0.6988041, 0.370664,
+  0.6984967, 0.3703344, 0.6981931, 0.3700127, 0.6978935, 0.369699,
+  0.6975976, 0.3693933, 0.6973055, 0.3690956, 0.697017, 0.3688061,
+  0.6967323, 0.3685247, 0.6964511, 0.3682514, 0.6961735, 0.3679863,
+  0.6958994, 0.3677294, 0.6956289, 0.3674808, 0.6953617, 0.3672404,
+  0.6950979, 0.3670083, 0.6948375, 0.3667845, 0.6945804, 0.3665691,
+  0.6943265, 0.3663621, 0.6940759, 0.3661635, 0.6938285, 0.3659734,
+  0.6935842, 0.3657917, 0.693343, 0.3656185, 0.6931048, 0.3654539,
+  0.6928697, 0.3652979, 0.6926376, 0.3651505, 0.6924085, 0.3650117,
+  0.6921822, 0.3648816, 0.6919588, 0.3647602, 0.6917383, 0.3646475,
+  0.6915206, 0.3645436, 0.6913057, 0.3644485, 0.6910935, 0.3643622,
+  0.690884, 0.3642848, 0.6906772, 0.3642163, 0.690473, 0.3641567,
+  0.6902715, 0.3641061, 0.6900725, 0.3640645, 0.6898761, 0.364032,
+  0.6896822, 0.3640085, 0.6894908, 0.3639941, 0.6893018, 0.363989,
+  0.6891153, 0.363993, 0.6889312, 0.3640062, 0.6887494, 0.3640287,
+  0.68857, 0.3640605, 0.688393, 0.3641017, 0.6882182, 0.3641523,
+  0.6880457, 0.3642123, 0.6878754, 0.3642818, 0.6877073, 0.3643608,
+  0.6875414, 0.3644494, 0.6873777, 0.3645476, 0.6872162, 0.3646555,
+  0.6875293, 0.364103, 0.6896701, 0.3609793, 0.6917806, 0.3579232,
+  0.6938616, 0.3549328, 0.6959139, 0.3520061, 0.6979382, 0.3491414,
+  0.6999352, 0.3463369, 0.7019057, 0.3435909, 0.7038504, 0.3409019,
+  0.7057699, 0.3382682, 0.7076649, 0.3356884, 0.7095359, 0.333161,
+  0.7113836, 0.3306847, 0.7132086, 0.3282581, 0.7150114, 0.32588,
+  0.7167925, 0.323549, 0.7185526, 0.321264, 0.7202921, 0.3190238,
+  0.7220115, 0.3168272, 0.7237113, 0.3146733, 0.725392, 0.312561,
+  0.727054, 0.3104892, 0.7286978, 0.308457, 0.7303237, 0.3064635,
+  0.7319323, 0.3045077, 0.733524, 0.3025887, 0.735099, 0.3007057,
+  0.7366579, 0.2988579, 0.7382009, 0.2970444, 0.7397285, 0.2952645,
+  0.741241, 0.2935175, 0.7427387, 0.2918026, 0.744222, 0.290119,
+  0.7456912, 0.2884663, 0.7471466, 0.2868436, 0.7485886, 0.2852503,
+  0.7500173, 0.2836858, 0.7514332, 0.2821495, 0.7528365, 0.2806409,
+  0.7542275, 0.2791593, 0.7556065, 0.2777042, 0.7569737, 0.2762751,
+  0.7583294, 0.2748715, 0.7596738, 0.2734928, 0.7610072, 0.2721385,
+  0.7623298, 0.2708083, 0.7636419, 0.2695016, 0.7649437, 0.268218,
+  0.7662354, 0.266957, 0.7675172, 0.2657182, 0.7687894, 0.2645013,
+  0.7700522, 0.2633058, 0.7713057, 0.2621313, 0.7725501, 0.2609775,
+  0.7737858, 0.2598439, 0.7750127, 0.2587303, 0.7762313, 0.2576363,
+  0.7774415, 0.2565615, 0.7786437, 0.2555056, 0.7798379, 0.2544683,
+  0.7810244, 0.2534494, 0.7822032, 0.2524484, 0.7833747, 0.2514651,
+  0.784539, 0.2504992, 0.7856961, 0.2495504, 0.7868463, 0.2486185,
+  0.7879897, 0.2477032, 0.7891265, 0.2468042, 0.7902568, 0.2459213,
+  0.7913807, 0.2450543, 0.7924984, 0.2442028, 0.7936101, 0.2433667,
+  0.7947159, 0.2425458, 0.7958158, 0.2417398, 0.7969102, 0.2409485,
+  0.7979989, 0.2401717, 0.7990823, 0.2394093, 0.8001604, 0.2386609,
+  0.8012333, 0.2379264, 0.8023012, 0.2372057, 0.8033642, 0.2364985,
+  0.8044224, 0.2358046, 0.8054759, 0.235124, 0.8065249, 0.2344564,
+  0.8075694, 0.2338016, 0.8086095, 0.2331596, 0.8096454, 0.23253,
+  0.8106772, 0.2319129, 0.811705, 0.231308, 0.8127288, 0.2307152,
+  0.8137488, 0.2301344, 0.8147651, 0.2295654, 0.8157778, 0.2290081,
+  0.816787, 0.2284623, 0.8177928, 0.227928, 0.8187952, 0.2274049,
+  0.8197944, 0.2268931, 0.8207904, 0.2263923, 0.8217835, 0.2259025,
+  0.8227735, 0.2254236, 0.8237608, 0.2249554, 0.8247452, 0.2244978,
+  0.825727, 0.2240508, 0.8267061, 0.2236142, 0.8276828, 0.2231879,
+  0.828657, 0.2227719, 0.8296289, 0.2223661, 0.8305986, 0.2219703,
+  0.8315661, 0.2215845, 0.8325315, 0.2212086, 0.8334949, 0.2208425,
+  0.8344563, 0.2204862, 0.835416, 0.2201396, 0.8363739, 0.2198025,
+  0.8373301, 0.219475, 0.8382847, 0.2191569, 0.8392377, 0.2188483,
+  0.8401894, 0.2185489, 0.8411397, 0.2182588, 0.8420886, 0.2179779,
+  0.8430364, 0.2177062, 0.8439831, 0.2174436, 0.8449286, 0.21719,
+  0.8458732, 0.2169454, 0.8468169, 0.2167097, 0.8477598, 0.2164829,
+  0.8487019, 0.216265, 0.8496433, 0.2160559, 0.8505841, 0.2158555,
+  0.8515244, 0.2156638, 0.8524643, 0.2154809, 0.8534037, 0.2153066,
+  0.8543428, 0.2151408, 0.8552817, 0.2149837, 0.8562204, 0.2148351,
+  0.8571591, 0.214695, 0.8580977, 0.2145634, 0.8590364, 0.2144403,
+  0.8599752, 0.2143257, 0.8609142, 0.2142194, 0.8618535, 0.2141215,
+  0.8627931, 0.2140321, 0.8637332, 0.2139509, 0.8646738, 0.2138782,
+  0.8656149, 0.2138137, 0.8665567, 0.2137576, 0.8674992, 0.2137098,
+  0.8684425, 0.2136703, 0.8693867, 0.2136391, 0.8703319, 0.2136162,
+  0.871278, 0.2136015, 0.8722253, 0.2135952, 0.8731737, 0.2135971,
+  0.8741234, 0.2136073, 0.8750744, 0.2136258, 0.8760269, 0.2136526,
+  0.8769808, 0.2136877, 0.8779363, 0.2137311, 0.8788934, 0.2137828,
+  0.8798522, 0.2138429, 0.8808129, 0.2139112, 0.8817754, 0.213988,
+  0.8827399, 0.214073, 0.8837065, 0.2141665, 0.8846752, 0.2142684,
+  0.8856461, 0.2143787, 0.8866193, 0.2144975, 0.8875948, 0.2146247,
+  0.8885729, 0.2147604, 0.8895535, 0.2149047, 0.8905367, 0.2150575,
+  0.8915227, 0.2152189, 0.8925115, 0.215389, 0.8935032, 0.2155677,
+  0.894498, 0.215755, 0.8954958, 0.2159512, 0.8964968, 0.2161561,
+  0.8975011, 0.2163698, 0.8985087, 0.2165923, 0.8995199, 0.2168238,
+  0.9005346, 0.2170643, 0.901553, 0.2173137, 0.9025751, 0.2175723,
+  0.9036012, 0.2178399, 0.9046312, 0.2181167, 0.9056653, 0.2184027,
+  0.9067036, 0.2186981, 0.9077462, 0.2190028, 0.9087932, 0.2193169,
+  0.9098448, 0.2196405, 0.9109009, 0.2199736, 0.9119619, 0.2203164,
+  0.9130276, 0.2206689, 0.9140984, 0.2210312, 0.9151743, 0.2214034,
+  0.9162554, 0.2217855, 0.9173419, 0.2221776, 0.9184338, 0.2225799,
+  0.9195314, 0.2229923, 0.9206347, 0.2234151, 0.9217438, 0.2238483,
+  0.922859, 0.2242919, 0.9239803, 0.2247462, 0.925108, 0.2252111,
+  0.926242, 0.2256869, 0.9273827, 0.2261736, 0.92853, 0.2266713,
+  0.9296843, 0.2271801, 0.9308456, 0.2277003, 0.932014, 0.2282318,
+  0.9331899, 0.2287748, 0.9343732, 0.2293295, 0.9355643, 0.229896,
+  0.9367632, 0.2304744, 0.9379701, 0.2310649, 0.9391853, 0.2316675,
+  0.9404089, 0.2322825, 0.941641, 0.2329101, 0.942882, 0.2335503,
+  0.9441319, 0.2342033, 0.9453909, 0.2348694, 0.9466594, 0.2355486,
+  0.9479374, 0.2362411, 0.9492253, 0.2369472, 0.9505231, 0.237667,
+  0.9518312, 0.2384007, 0.9531498, 0.2391484, 0.954479, 0.2399105,
+  0.9558193, 0.2406871, 0.9571707, 0.2414784, 0.9585335, 0.2422846,
+  0.9599081, 0.243106, 0.9612946, 0.2439428, 0.9626934, 0.2447952,
+  0.9641047, 0.2456635, 0.9655288, 0.2465479, 0.966966, 0.2474487,
+  0.9684166, 0.2483661, 0.9698809, 0.2493005, 0.9713592, 0.250252,
+  0.9724423, 0.2511153, 0.9715755, 0.2514873, 0.9707083, 0.2518704,
+  0.9698406, 0.2522646, 0.9689722, 0.2526702, 0.9681032, 0.253087,
+  0.9672334, 0.2535153, 0.9663628, 0.2539551, 0.9654914, 0.2544065,
+  0.9646189, 0.2548697, 0.9637455, 0.2553447, 0.962871, 0.2558316,
+  0.9619954, 0.2563305, 0.9611185, 0.2568416, 0.9602403, 0.257365,
+  0.9593607, 0.2579007, 0.9584797, 0.258449, 0.9575972, 0.2590099,
+  0.9567131, 0.2595836, 0.9558274, 0.2601702, 0.9549399, 0.2607698,
+  0.9540506, 0.2613826, 0.9531595, 0.2620087, 0.9522663, 0.2626483,
+  0.9513712, 0.2633015, 0.9504739, 0.2639685, 0.9495745, 0.2646495,
+  0.9486728, 0.2653446, 0.9477688, 0.266054, 0.9468623, 0.2667778,
+  0.9459533, 0.2675163, 0.9450418, 0.2682696, 0.9441276, 0.2690379,
+  0.9432106, 0.2698215, 0.9422908, 0.2706205, 0.9413681, 0.2714351,
+  0.9404424, 0.2722655, 0.9395136, 0.273112, 0.9385816, 0.2739748,
+  0.9376464, 0.274854, 0.9367078, 0.2757501, 0.9357657, 0.2766631,
+  0.9348202, 0.2775934, 0.9338709, 0.2785411, 0.932918, 0.2795066,
+  0.9319612, 0.2804902, 0.9310005, 0.281492, 0.9300358, 0.2825125,
+  0.9290669, 0.2835518, 0.9280938, 0.2846104, 0.9271164, 0.2856884,
+  0.9261346, 0.2867863, 0.9251482, 0.2879043, 0.9241571, 0.2890427,
+  0.9231613, 0.290202, 0.9221606, 0.2913825, 0.921155, 0.2925846,
+  0.9201442, 0.2938086, 0.9191282, 0.2950549, 0.9181068, 0.2963239,
+  0.91708, 0.297616, 0.9160475, 0.2989317, 0.9150094, 0.3002713,
+  0.9139654, 0.3016354, 0.9129154, 0.3030244, 0.9118593, 0.3044387,
+  0.9107969, 0.3058789, 0.9097282, 0.3073455, 0.9086529, 0.3088389,
+  0.9075709, 0.3103597, 0.9064821, 0.3119084, 0.9053863, 0.3134857,
+  0.9042834, 0.3150921, 0.9031732, 0.3167282, 0.9020556, 0.3183946,
+  0.9009303, 0.3200919, 0.8997972, 0.3218209, 0.8986562, 0.3235822,
+  0.897507, 0.3253765, 0.8963496, 0.3272046, 0.8951836, 0.3290671,
+  0.894009, 0.3309649, 0.8928255, 0.3328987, 0.8916329, 0.3348694,
+  0.8904311, 0.3368778, 0.8892198, 0.3389249, 0.8879988, 0.3410115,
+  0.886768, 0.3431385, 0.885527, 0.345307, 0.8842757, 0.347518,
+  0.8830138, 0.3497725, 0.8817411, 0.3520715, 0.8804574, 0.3544163,
+  0.8791624, 0.3568079, 0.8778559, 0.3592476, 0.8765375, 0.3617366,
+  0.8752071, 0.3642762, 0.8738643, 0.3668678, 0.872509, 0.3695127,
+  0.8711407, 0.3722124, 0.8697592, 0.3749683, 0.8683641, 0.3777822,
+  0.8669553, 0.3806555, 0.8655323, 0.3835899, 0.8640948, 0.3865872,
+  0.8626426, 0.3896493, 0.8611751, 0.3927779, 0.8596921, 0.3959752,
+  0.8581933, 0.3992431, 0.8566782, 0.4025837, 0.8551464, 0.4059994,
+  0.8535976, 0.4094923, 0.8520313, 0.4130651, 0.8504471, 0.4167201,
+  0.8488445, 0.42046, 0.8472232, 0.4242877, 0.8455826, 0.4282059,
+  0.8439223, 0.4322177, 0.8422417, 0.4363263, 0.8405404, 0.4405349,
+  0.8388179, 0.4448471, 0.8370735, 0.4492664, 0.8353067, 0.4537967,
+  0.833517, 0.4584419, 0.8317038, 0.4632062, 0.8298663, 0.4680941,
+  0.830061, 0.4649676, 0.8303602, 0.4615134, 0.8306605, 0.4581397,
+  0.8309617, 0.4548442, 0.8312639, 0.4516243, 0.8315669, 0.448478,
+  0.8318708, 0.4454029, 0.8321755, 0.442397, 0.8324808, 0.4394583,
+  0.8327869, 0.4365849, 0.8330937, 0.433775, 0.8334011, 0.4310267,
+  0.8337091, 0.4283385, 0.8340177, 0.4257087, 0.8343268, 0.4231357,
+  0.8346365, 0.420618, 0.8349466, 0.4181542, 0.8352573, 0.4157429,
+  0.8355685, 0.4133828, 0.8358801, 0.4110726, 0.8361921, 0.4088111,
+  0.8365046, 0.406597, 0.8368176, 0.4044293, 0.8371309, 0.4023068,
+  0.8374447, 0.4002285, 0.8377588, 0.3981933, 0.8380734, 0.3962002,
+  0.8383883, 0.3942483, 0.8387037, 0.3923368, 0.8390194, 0.3904646,
+  0.8393356, 0.3886309, 0.8396521, 0.3868349, 0.8399691, 0.3850758,
+  0.8402864, 0.3833529, 0.8406041, 0.3816654, 0.8409223, 0.3800125,
+  0.8412409, 0.3783935, 0.8415598, 0.3768079, 0.8418792, 0.3752549,
+  0.8421991, 0.3737339, 0.8425194, 0.3722443, 0.8428401, 0.3707855,
+  0.8431613, 0.3693569, 0.8434829, 0.367958, 0.8438051, 0.3665882,
+  0.8441277, 0.3652471, 0.8444508, 0.3639341, 0.8447745, 0.3626487,
+  0.8450987, 0.3613905, 0.8454234, 0.360159, 0.8457486, 0.3589538,
+  0.8460745, 0.3577744, 0.8464009, 0.3566205, 0.8467279, 0.3554915,
+  0.8470555, 0.3543872, 0.8473838, 0.3533072, 0.8477127, 0.3522511,
+  0.8480423, 0.3512185, 0.8483726, 0.3502091, 0.8487035, 0.3492225,
+  0.8490352, 0.3482586, 0.8493676, 0.3473168, 0.8497008, 0.346397,
+  0.8500348, 0.3454988, 0.8503695, 0.344622, 0.8507051, 0.3437663,
+  0.8510415, 0.3429314, 0.8513788, 0.342117, 0.851717, 0.341323,
+  0.852056, 0.340549, 0.852396, 0.3397949, 0.8527369, 0.3390604,
+  0.8530789, 0.3383453, 0.8534218, 0.3376494, 0.8537657, 0.3369725,
+  0.8541107, 0.3363144, 0.8544568, 0.3356749, 0.8548039, 0.3350538,
+  0.8551522, 0.3344509, 0.8555017, 0.3338662, 0.8558523, 0.3332993,
+  0.8562041, 0.3327502, 0.8565572, 0.3322187, 0.8569115, 0.3317047,
+  0.8572672, 0.3312079, 0.8576241, 0.3307284, 0.8579824, 0.3302659,
+  0.8583422, 0.3298203, 0.8587033, 0.3293916, 0.8590659, 0.3289795,
+  0.8594299, 0.328584, 0.8597955, 0.3282051, 0.8601626, 0.3278425,
+  0.8605313, 0.3274962, 0.8609017, 0.3271661, 0.8612737, 0.3268521,
+  0.8616473, 0.3265542, 0.8620228, 0.3262723, 0.8624, 0.3260063,
+  0.8627789, 0.3257561, 0.8631598, 0.3255217, 0.8635425, 0.325303,
+  0.8639272, 0.3251, 0.8643138, 0.3249126, 0.8647024, 0.3247409,
+  0.8650931, 0.3245846, 0.8622843, 0.3232437, 0.8594164, 0.3218974,
+  0.8565761, 0.3205779, 0.8537627, 0.3192848, 0.8509753, 0.3180175,
+  0.8482135, 0.3167757, 0.8454764, 0.3155588, 0.8427636, 0.3143665,
+  0.8400742, 0.3131982, 0.8374078, 0.3120537, 0.8347636, 0.3109324,
+  0.8321413, 0.3098341, 0.8295401, 0.3087583, 0.8269596, 0.3077046,
+  0.8243991, 0.3066728, 0.8218583, 0.3056625, 0.8193365, 0.3046733,
+  0.8168333, 0.303705, 0.8143482, 0.3027573, 0.8118807, 0.3018297,
+  0.8094303, 0.3009221, 0.8069966, 0.3000342, 0.8045792, 0.2991657,
+  0.8021776, 0.2983163, 0.7997915, 0.2974858, 0.7974203, 0.296674,
+  0.7950636, 0.2958805, 0.7927212, 0.2951052, 0.7903925, 0.2943479,
+  0.7880772, 0.2936083, 0.785775, 0.2928861, 0.7834854, 0.2921814,
+  0.7812082, 0.2914937, 0.7789429, 0.290823, 0.7766891, 0.290169,
+  0.7744466, 0.2895316, 0.7722151, 0.2889106, 0.7699941, 0.2883058,
+  0.7677834, 0.2877171, 0.7655826, 0.2871443, 0.7633914, 0.2865874,
+  0.7612095, 0.2860461, 0.7590366, 0.2855202, 0.7568725, 0.2850098,
+  0.7547167, 0.2845146, 0.752569, 0.2840345, 0.7504291, 0.2835695,
+  0.7482967, 0.2831194, 0.7461715, 0.282684, 0.7440533, 0.2822634,
+  0.7419418, 0.2818574, 0.7398366, 0.2814659, 0.7377375, 0.2810889,
+  0.7356443, 0.2807261, 0.7335567, 0.2803777, 0.7314743, 0.2800435,
+  0.7293969, 0.2797234, 0.7273244, 0.2794174, 0.7252563, 0.2791255,
+  0.7231924, 0.2788475, 0.7211325, 0.2785834, 0.7190764, 0.2783332,
+  0.7170236, 0.2780968, 0.7149741, 0.2778743, 0.7129275, 0.2776655,
+  0.7108835, 0.2774704, 0.7088419, 0.2772891, 0.7068025, 0.2771215,
+  0.704765, 0.2769676, 0.7027291, 0.2768274, 0.7006946, 0.2767009,
+  0.6986611, 0.2765881, 0.6966285, 0.276489, 0.6945964, 0.2764036,
+  0.6925647, 0.276332, 0.690533, 0.2762741, 0.688501, 0.2762299,
+  0.6864686, 0.2761996, 0.6844353, 0.2761832, 0.682401, 0.2761806,
+  0.6803653, 0.276192, 0.678328, 0.2762174, 0.6762887, 0.2762569,
+  0.6742473, 0.2763105, 0.6722033, 0.2763782, 0.6701565, 0.2764603,
+  0.6681066, 0.2765568, 0.6660532, 0.2766677, 0.6639961, 0.2767931,
+  0.6619349, 0.2769333, 0.6598694, 0.2770882, 0.657799, 0.277258,
+  0.6557236, 0.2774428, 0.6536428, 0.2776429, 0.6515561, 0.2778582,
+  0.6494633, 0.278089, 0.6473639, 0.2783355, 0.6452576, 0.2785977,
+  0.643144, 0.278876, 0.6410226, 0.2791705, 0.6388931, 0.2794814,
+  0.6367549, 0.2798089, 0.6346077, 0.2801532, 0.6324509, 0.2805147,
+  0.6302841, 0.2808936, 0.6281068, 0.2812901, 0.6259185, 0.2817045,
+  0.6237186, 0.2821372, 0.6215065, 0.2825884, 0.6192818, 0.2830586,
+  0.6170437, 0.2835481, 0.6147916, 0.2840572, 0.6125249, 0.2845864,
+  0.6102428, 0.2851361, 0.6079447, 0.2857069, 0.6056298, 0.286299,
+  0.6032972, 0.2869132, 0.6009461, 0.28755, 0.5985756, 0.2882099,
+  0.5961847, 0.2888936, 0.5937725, 0.2896017, 0.5913378, 0.2903351,
+  0.5888796, 0.2910944, 0.5863966, 0.2918806, 0.5838874, 0.2926944,
+  0.5813508, 0.2935369, 0.5787853, 0.2944092, 0.5761891, 0.2953122,
+  0.5735606, 0.2962474, 0.570898, 0.297216, 0.5681991, 0.2982195,
+  0.5654617, 0.2992594, 0.5626834, 0.3003376, 0.5598616, 0.3014559,
+  0.5569933, 0.3026165, 0.5540752, 0.3038217, 0.5511037, 0.3050743,
+  0.5480747, 0.3063771, 0.5449838, 0.3077334, 0.5418257, 0.3091472,
+  0.5385945, 0.3106227, 0.5352835, 0.3121649, 0.5318848, 0.3137795,
+  0.5283893, 0.3154734, 0.524786, 0.3172546, 0.5210621, 0.3191327,
+  0.5172016, 0.3211195, 0.513185, 0.3232296, 0.5089875, 0.3254813,
+  0.5045771, 0.3278985, 0.4999109, 0.3305133, 0.4949295, 0.3333699,
+  0.4895459, 0.3365335, 0.4836234, 0.3401064, 0.4769239, 0.3442673,
+  0.4689527, 0.3493878, 0.4582277, 0.3565835, 0.4239793, 0.3815725,
+  0.4245558, 0.3802484, 0.4251324, 0.3789447, 0.4257092, 0.377661,
+  0.4262861, 0.3763972, 0.4268633, 0.3751529, 0.4274408, 0.3739278,
+  0.4280186, 0.3727218, 0.4285967, 0.3715346, 0.4291751, 0.3703659,
+  0.429754, 0.3692155, 0.4303333, 0.3680831, 0.4309131, 0.3669686,
+  0.4314934, 0.3658716, 0.4320742, 0.3647921, 0.4326556, 0.3637297,
+  0.4332376, 0.3626843, 0.4338203, 0.3616556, 0.4344036, 0.3606435,
+  0.4349877, 0.3596477, 0.4355725, 0.3586681, 0.436158, 0.3577045,
+  0.4367444, 0.3567566, 0.4373317, 0.3558244, 0.4379198, 0.3549075,
+  0.4385088, 0.354006, 0.4390988, 0.3531195, 0.4396898, 0.3522479,
+  0.4402818, 0.3513911, 0.4408748, 0.3505489, 0.441469, 0.3497212,
+  0.4420643, 0.3489077, 0.4426607, 0.3481084, 0.4432583, 0.3473231,
+  0.4438572, 0.3465516, 0.4444573, 0.3457938, 0.4450588, 0.3450496,
+  0.4456616, 0.3443189, 0.4462657, 0.3436014, 0.4468713, 0.3428971,
+  0.4474784, 0.3422059, 0.4480869, 0.3415276, 0.4486969, 0.3408622,
+  0.4493085, 0.3402094, 0.4499218, 0.3395692, 0.4505366, 0.3389414,
+  0.4511531, 0.338326, 0.4517714, 0.3377229, 0.4523914, 0.3371319,
+  0.4530132, 0.3365529, 0.4536368, 0.3359858, 0.4542623, 0.3354306,
+  0.4548897, 0.3348871, 0.455519, 0.3343553, 0.4561504, 0.333835,
+  0.4567837, 0.3333261, 0.4574192, 0.3328286, 0.4580568, 0.3323424,
+  0.4586965, 0.3318674, 0.4593384, 0.3314035, 0.4599826, 0.3309506,
+  0.460629, 0.3305086, 0.4612778, 0.3300776, 0.4619289, 0.3296573,
+  0.4625825, 0.3292477, 0.4632385, 0.3288488, 0.463897, 0.3284604,
+  0.4645581, 0.3280825, 0.4652217, 0.3277151, 0.465888, 0.3273581,
+  0.466557, 0.3270113, 0.4672287, 0.3266748, 0.4679032, 0.3263484,
+  0.4685806, 0.3260322, 0.4692608, 0.325726, 0.4699439, 0.3254298,
+  0.47063, 0.3251436, 0.4713192, 0.3248672, 0.4720114, 0.3246007,
+  0.4727068, 0.3243439, 0.4734053, 0.3240969, 0.474107, 0.3238595,
+  0.4748121, 0.3236318, 0.4755205, 0.3234137, 0.4762322, 0.3232051,
+  0.4769475, 0.3230059, 0.4776662, 0.3228163, 0.4783885, 0.322636,
+  0.4791144, 0.3224651, 0.4798439, 0.3223035, 0.4805772, 0.3221512,
+  0.4813143, 0.3220081, 0.4820552, 0.3218742, 0.4828001, 0.3217495,
+  0.4835489, 0.3216339, 0.4843017, 0.3215275, 0.4850586, 0.3214301,
+  0.4858197, 0.3213417, 0.486585, 0.3212623, 0.4873545, 0.3211919,
+  0.4881285, 0.3211305, 0.4889068, 0.3210779, 0.4896896, 0.3210343,
+  0.4904769, 0.3209995, 0.4912689, 0.3209735, 0.4920655, 0.3209563,
+  0.4928669, 0.3209479, 0.4936731, 0.3209483, 0.4944842, 0.3209574,
+  0.4953003, 0.3209753, 0.4961214, 0.3210018, 0.4969477, 0.321037,
+  0.4977791, 0.3210809, 0.4986158, 0.3211334, 0.4994578, 0.3211945,
+  0.5003052, 0.3212642, 0.5011582, 0.3213425, 0.5020167, 0.3214294,
+  0.5028809, 0.3215248, 0.5037509, 0.3216288, 0.5046266, 0.3217413,
+  0.5055083, 0.3218623, 0.506396, 0.3219918, 0.5072897, 0.3221298,
+  0.5081896, 0.3222763, 0.5090958, 0.3224312, 0.5100083, 0.3225946,
+  0.5109273, 0.3227665, 0.5118528, 0.3229467, 0.5127849, 0.3231355,
+  0.5137238, 0.3233326, 0.5146694, 0.3235382, 0.515622, 0.3237521,
+  0.5165816, 0.3239745, 0.5175483, 0.3242053, 0.5185222, 0.3244444,
+  0.5195034, 0.324692, 0.520492, 0.3249479, 0.5214881, 0.3252122,
+  0.5224919, 0.3254849, 0.5235033, 0.325766, 0.5245227, 0.3260554,
+  0.5255499, 0.3263532, 0.5265853, 0.3266594, 0.5276288, 0.326974,
+  0.5286805, 0.3272969, 0.5297407, 0.3276282, 0.5308094, 0.3279678,
+  0.5318868, 0.3283159, 0.5329728, 0.3286723, 0.5340678, 0.329037,
+  0.5351717, 0.3294102, 0.5362848, 0.3297917, 0.5374071, 0.3301816,
+  0.5385388, 0.3305798, 0.53968, 0.3309865, 0.5408308, 0.3314015,
+  0.5419914, 0.331825, 0.5431619, 0.3322568, 0.5443424, 0.332697,
+  0.545533, 0.3331457, 0.546734, 0.3336027, 0.5479454, 0.3340682,
+  0.5491673, 0.3345421, 0.5504, 0.3350244, 0.5516436, 0.3355151,
+  0.5528981, 0.3360143, 0.5541639, 0.3365219, 0.5554409, 0.337038,
+  0.5567294, 0.3375626, 0.5580295, 0.3380956, 0.5593413, 0.3386371,
+  0.5606651, 0.3391871, 0.5620009, 0.3397456, 0.563349, 0.3403125,
+  0.5647094, 0.340888, 0.5660824, 0.3414721, 0.5674681, 0.3420646,
+  0.5688667, 0.3426657, 0.5702784, 0.3432754, 0.5717032, 0.3438936,
+  0.5731414, 0.3445204, 0.5745932, 0.3451558, 0.5760587, 0.3457998,
+  0.5775381, 0.3464524, 0.5790316, 0.3471137, 0.5805394, 0.3477835,
+  0.5820615, 0.3484621, 0.5835983, 0.3491493, 0.5851499, 0.3498452,
+  0.5867165, 0.3505498, 0.5882982, 0.3512631, 0.5898953, 0.3519851,
+  0.591508, 0.3527159, 0.5931363, 0.3534555, 0.5947806, 0.3542038,
+  0.5964411, 0.354961, 0.5981178, 0.355727, 0.5998111, 0.3565018,
+  0.6015211, 0.3572855, 0.603248, 0.3580781, 0.604992, 0.3588796,
+  0.6067534, 0.35969, 0.6085322, 0.3605094, 0.6103289, 0.3613378,
+  0.6121434, 0.3621751, 0.6139761, 0.3630216, 0.6158272, 0.3638771,
+  0.6176969, 0.3647417, 0.6195854, 0.3656154, 0.6214929, 0.3664983,
+  0.6234196, 0.3673904, 0.6253658, 0.3682917, 0.6273316, 0.3692023,
+  0.6293174, 0.3701222, 0.6313233, 0.3710514, 0.6333495, 0.3719901,
+  0.6353964, 0.3729381, 0.637464, 0.3738957, 0.6395527, 0.3748627,
+  0.6416627, 0.3758393, 0.6437942, 0.3768256, 0.6459475, 0.3778215,
+  0.6481228, 0.3788272, 0.6503204, 0.3798426, 0.6525404, 0.3808679,
+  0.6547832, 0.3819031, 0.6570489, 0.3829482, 0.6593379, 0.3840034,
+  0.6616504, 0.3850687, 0.6639867, 0.3861442, 0.666347, 0.38723,
+  0.6687315, 0.388326, 0.6711406, 0.3894325, 0.6735745, 0.3905495,
+  0.6760335, 0.3916771, 0.6785178, 0.3928153, 0.6810278, 0.3939644,
+  0.6835636, 0.3951242, 0.6861257, 0.3962951, 0.6887142, 0.3974771,
+  0.6913295, 0.3986702, 0.6939718, 0.3998747, 0.6966416, 0.4010905,
+  0.6993389, 0.402318, 0.7020643, 0.403557, 0.7048179, 0.4048079,
+  0.7076001, 0.4060708, 0.7104112, 0.4073457, 0.7132516, 0.4086329,
+  0.7161215, 0.4099324, 0.7190213, 0.4112445, 0.7219514, 0.4125693,
+  0.7249121, 0.413907, 0.7279037, 0.4152577, 0.7309266, 0.4166217,
+  0.7339812, 0.417999, 0.7370678, 0.41939, 0.7401869, 0.4207948,
+  0.7433388, 0.4222136, 0.743709, 0.4220493, 0.7428678, 0.4211962,
+  0.7420355, 0.4203478, 0.7412122, 0.4195041, 0.7403978, 0.418665,
+  0.7395921, 0.4178306, 0.7387953, 0.4170009, 0.7380072, 0.416176,
+  0.7372277, 0.4153558, 0.7364568, 0.4145405, 0.7356945, 0.4137301,
+  0.7349407, 0.4129245, 0.7341953, 0.4121239, 0.7334582, 0.4113282,
+  0.7327295, 0.4105376, 0.732009, 0.409752, 0.7312968, 0.4089715,
+  0.7305926, 0.4081961, 0.7298965, 0.4074259, 0.7292084, 0.4066609,
+  0.7285282, 0.4059012, 0.7278559, 0.4051468, 0.7271914, 0.4043978,
+  0.7265347, 0.4036541, 0.7258856, 0.4029159, 0.7252442, 0.4021832,
+  0.7246103, 0.4014561, 0.7239839, 0.4007345, 0.7233649, 0.4000186,
+  0.7227532, 0.3993083, 0.7221488, 0.3986038, 0.7215517, 0.3979051,
+  0.7209617, 0.3972121, 0.7203787, 0.3965251, 0.7198028, 0.395844,
+  0.7192339, 0.3951689, 0.7186718, 0.3944998, 0.7181165, 0.3938367,
+  0.717568, 0.3931798, 0.7170261, 0.392529, 0.7164909, 0.3918845,
+  0.7159621, 0.3912462, 0.7154399, 0.3906142, 0.7149241, 0.3899886,
+  0.7144146, 0.3893694, 0.7139114, 0.3887566, 0.7134143, 0.3881504,
+  0.7129235, 0.3875506, 0.7124387, 0.3869575, 0.7119599, 0.3863709,
+  0.711487, 0.3857911, 0.71102, 0.385218, 0.7105588, 0.3846516,
+  0.7101034, 0.384092, 0.7096536, 0.3835393, 0.7092095, 0.3829934,
+  0.7087709, 0.3824545, 0.7083378, 0.3819226, 0.7079101, 0.3813977,
+  0.7074878, 0.3808798, 0.7070707, 0.380369, 0.7066589, 0.3798654,
+  0.7062523, 0.3793689, 0.7058508, 0.3788796, 0.7054543, 0.3783976,
+  0.7050629, 0.3779229,
+];
+
+// linear_A98RGB cusp (L, C) pairs at 1024 hues evenly spaced from 0 to 360 degrees,
+// interpolated within 1.1e-05 of the exact cusp at 99% of hues, and 7.9e-04 at most
+
+export const OKLab_to_linear_A98RGB_cusp_LUT = [
+  0.7242955, 0.2936231, 0.723909, 0.2932454, 0.7235265, 0.2928753,
+  0.7231479, 0.2925127, 0.7227733, 0.2921577, 0.7224026, 0.2918103,
+  0.7220357, 0.2914704, 0.7216725, 0.291138, 0.7213131, 0.2908132,
+  0.7209573, 0.2904959, 0.7206052, 0.2901861, 0.7202567, 0.2898838,
+  0.7199117, 0.2895891, 0.7195701, 0.2893018, 0.719232, 0.289022,
+  0.7188974, 0.2887497, 0.718566, 0.2884849, 0.718238, 0.2882276,
+  0.7179133, 0.2879778, 0.7175918, 0.2877354, 0.7172735, 0.2875005,
+  0.7169583, 0.2872731, 0.7166463, 0.2870532, 0.7163373, 0.2868408,
+  0.7160313, 0.2866358, 0.7157283, 0.2864383, 0.7154283, 0.2862483,
+  0.7151313, 0.2860657, 0.714837, 0.2858906, 0.7145457, 0.2857231,
+  0.7142571, 0.285563, 0.7139714, 0.2854104, 0.7136884, 0.2852652,
+  0.713408, 0.2851276, 0.7131304, 0.2849975, 0.7128554, 0.2848749,
+  0.712583, 0.2847599, 0.7123132, 0.2846523, 0.712046, 0.2845523,
+  0.7117813, 0.2844598, 0.711519, 0.2843749, 0.7112592, 0.2842975,
+  0.7110019, 0.2842277, 0.7107469, 0.2841655, 0.7104944, 0.2841109,
+  0.7102441, 0.2840639, 0.7099962, 0.2840245, 0.7097506, 0.2839928,
+  0.7095072, 0.2839686, 0.7092661, 0.2839522, 0.7090272, 0.2839434,
+  0.7087905, 0.2839424, 0.7085559, 0.283949, 0.7083235, 0.2839634,
+  0.7080932, 0.2839855, 0.707865, 0.2840154, 0.7076388, 0.2840531,
+  0.7074147, 0.2840986, 0.7071926, 0.2841519, 0.7069725, 0.2842131,
+  0.7067544, 0.2842821, 0.7065383, 0.2843591, 0.7063241, 0.284444,
+  0.7061118, 0.2845369, 0.7059014, 0.2846377, 0.7056928, 0.2847466,
+  0.7054861, 0.2848635, 0.7052813, 0.2849884, 0.7050783, 0.2851215,
+  0.704877, 0.2852627, 0.7046776, 0.2854121, 0.7044799, 0.2855697,
+  0.7042839, 0.2857355, 0.7040897, 0.2859096, 0.7038972, 0.2860919,
+  0.7037064, 0.2862827, 0.7035173, 0.2864818, 0.7033298, 0.2866893,
+  0.7031439, 0.2869053, 0.7029597, 0.2871299, 0.7027771, 0.2873629,
+  0.7025961, 0.2876046, 0.7024167, 0.2878549, 0.7022389, 0.2881139,
+  0.7037001, 0.2863913, 0.7054408, 0.2843451, 0.7071612, 0.2823395,
+  0.708862, 0.2803735, 0.7105436, 0.278446, 0.7122064, 0.2765562,
+  0.7138509, 0.274703, 0.7154776, 0.2728856, 0.7170868, 0.2711031,
+  0.7186789, 0.2693547, 0.7202545, 0.2676396, 0.7218137, 0.2659569,
+  0.7233572, 0.2643059, 0.7248851, 0.262686, 0.7263979, 0.2610963,
+  0.7278959, 0.2595362, 0.7293794, 0.2580051, 0.7308488, 0.2565022,
+  0.7323044, 0.255027, 0.7337466, 0.2535788, 0.7351755, 0.2521572,
+  0.7365915, 0.2507614, 0.737995, 0.249391, 0.7393861, 0.2480454,
+  0.7407652, 0.2467242, 0.7421325, 0.2454267, 0.7434883, 0.2441526,
+  0.7448328, 0.2429013, 0.7461664, 0.2416724, 0.7474891, 0.2404655,
+  0.7488013, 0.2392801, 0.7501032, 0.2381158, 0.7513951, 0.2369722,
+  0.7526771, 0.2358489, 0.7539494, 0.2347456, 0.7552123, 0.2336617,
+  0.756466, 0.2325971, 0.7577107, 0.2315513, 0.7589465, 0.230524,
+  0.7601738, 0.2295148, 0.7613925, 0.2285235, 0.762603, 0.2275497,
+  0.7638055, 0.2265932, 0.765, 0.2256535, 0.7661868, 0.2247305,
+  0.7673661, 0.2238238, 0.7685379, 0.2229333, 0.7697026, 0.2220585,
+  0.7708601, 0.2211993, 0.7720108, 0.2203554, 0.7731546, 0.2195265,
+  0.7742919, 0.2187125, 0.7754227, 0.217913, 0.7765472, 0.2171279,
+  0.7776656, 0.216357, 0.7787779, 0.2156, 0.7798843, 0.2148566,
+  0.7809849, 0.2141269, 0.7820799, 0.2134104, 0.7831694, 0.212707,
+  0.7842535, 0.2120166, 0.7853324, 0.2113389, 0.7864062, 0.2106739,
+  0.7874749, 0.2100212, 0.7885388, 0.2093807, 0.7895979, 0.2087523,
+  0.7906524, 0.2081359, 0.7917023, 0.2075311, 0.7927478, 0.206938,
+  0.793789, 0.2063564, 0.794826, 0.205786, 0.7958589, 0.2052268,
+  0.7968879, 0.2046787, 0.7979129, 0.2041414, 0.7989341, 0.2036149,
+  0.7999517, 0.2030991, 0.8009657, 0.2025937, 0.8019762, 0.2020988,
+  0.8029833, 0.2016142, 0.8039872, 0.2011397, 0.8049878, 0.2006753,
+  0.8059854, 0.2002208, 0.8069799, 0.1997762, 0.8079716, 0.1993413,
+  0.8089604, 0.1989161, 0.8099465, 0.1985005, 0.8109299, 0.1980943,
+  0.8119108, 0.1976974, 0.8128892, 0.1973099, 0.8138653, 0.1969315,
+  0.814839, 0.1965622, 0.8158106, 0.196202, 0.81678, 0.1958507,
+  0.8177474, 0.1955083, 0.8187128, 0.1951747, 0.8196764, 0.1948498,
+  0.8206381, 0.1945336, 0.8215981, 0.1942259, 0.8225565, 0.1939268,
+  0.8235134, 0.1936362, 0.8244688, 0.1933539, 0.8254227, 0.19308,
+  0.8263754, 0.1928144, 0.8273268, 0.192557, 0.828277, 0.1923078,
+  0.8292262, 0.1920667, 0.8301744, 0.1918336, 0.8311216, 0.1916086,
+  0.832068, 0.1913916, 0.8330135, 0.1911825, 0.8339584, 0.1909813,
+  0.8349027, 0.190788, 0.8358464, 0.1906024, 0.8367896, 0.1904247,
+  0.8377324, 0.1902546, 0.8386749, 0.1900923, 0.8396171, 0.1899377,
+  0.8405591, 0.1897907, 0.8415011, 0.1896513, 0.842443, 0.1895195,
+  0.8433849, 0.1893952, 0.8443269, 0.1892785, 0.8452692, 0.1891693,
+  0.8462117, 0.1890676, 0.8471545, 0.1889733, 0.8480978, 0.1888865,
+  0.8490415, 0.1888071, 0.8499858, 0.1887352, 0.8509308, 0.1886707,
+  0.8518764, 0.1886135, 0.8528229, 0.1885638, 0.8537702, 0.1885214,
+  0.8547185, 0.1884863, 0.8556677, 0.1884587, 0.8566181, 0.1884384,
+  0.8575696, 0.1884254, 0.8585224, 0.1884198, 0.8594765, 0.1884215,
+  0.860432, 0.1884306, 0.861389, 0.1884471, 0.8623476, 0.1884709,
+  0.8633077, 0.188502, 0.8642697, 0.1885405, 0.8652334, 0.1885864,
+  0.866199, 0.1886397, 0.8671666, 0.1887004, 0.8681362, 0.1887685,
+  0.8691079, 0.188844, 0.8700819, 0.188927, 0.8710582, 0.1890174,
+  0.8720368, 0.1891153, 0.8730179, 0.1892207, 0.8740016, 0.1893337,
+  0.874988, 0.1894541, 0.875977, 0.1895822, 0.876969, 0.1897178,
+  0.8779638, 0.1898611, 0.8789616, 0.190012, 0.8799626, 0.1901706,
+  0.8809667, 0.1903369, 0.8819741, 0.190511, 0.882985, 0.1906929,
+  0.8839993, 0.1908826, 0.8850172, 0.1910802, 0.8860388, 0.1912856,
+  0.8870641, 0.1914991, 0.8880934, 0.1917205, 0.8891267, 0.19195,
+  0.8901641, 0.1921876, 0.8912056, 0.1924334, 0.8922515, 0.1926873,
+  0.8933019, 0.1929495, 0.8943567, 0.1932201, 0.8954163, 0.193499,
+  0.8964806, 0.1937863, 0.8975498, 0.1940821, 0.898624, 0.1943865,
+  0.8997033, 0.1946995, 0.9007879, 0.1950213, 0.9018779, 0.1953518,
+  0.9029734, 0.1956911, 0.9040745, 0.1960394, 0.9051814, 0.1963967,
+  0.9062942, 0.196763, 0.9074131, 0.1971385, 0.9085381, 0.1975233,
+  0.9096695, 0.1979174, 0.9108073, 0.1983209, 0.9119518, 0.198734,
+  0.913103, 0.1991567, 0.9142611, 0.1995891, 0.9154264, 0.2000314,
+  0.9165988, 0.2004835, 0.9177787, 0.2009457, 0.9189662, 0.2014181,
+  0.9201613, 0.2019007, 0.9213644, 0.2023937, 0.9225756, 0.2028972,
+  0.9237951, 0.2034114, 0.925023, 0.2039363, 0.9262596, 0.204472,
+  0.927505, 0.2050188, 0.9287594, 0.2055768, 0.9300231, 0.206146,
+  0.9312962, 0.2067268, 0.932579, 0.2073191, 0.9338716, 0.2079231,
+  0.9351743, 0.2085391, 0.9364874, 0.2091672, 0.937811, 0.2098075,
+  0.9391454, 0.2104602, 0.9404908, 0.2111255, 0.9418475, 0.2118036,
+  0.9432158, 0.2124946, 0.9445958, 0.2131989, 0.9459879, 0.2139164,
+  0.9473924, 0.2146476, 0.9488094, 0.2153925, 0.9502394, 0.2161514,
+  0.9516826, 0.2169244, 0.9531393, 0.217712, 0.9546099, 0.2185142,
+  0.9560946, 0.2193313, 0.9575938, 0.2201635, 0.9591078, 0.2210112,
+  0.960637, 0.2218745, 0.9621817, 0.2227538, 0.9637423, 0.2236493,
+  0.9653192, 0.2245613, 0.9663607, 0.2253613, 0.965328, 0.2256889,
+  0.9642951, 0.2260265, 0.963262, 0.2263743, 0.9622285, 0.2267324,
+  0.9611948, 0.2271008, 0.9601605, 0.2274796, 0.9591257, 0.227869,
+  0.9580903, 0.2282689, 0.9570542, 0.2286795, 0.9560173, 0.2291008,
+  0.9549795, 0.229533, 0.9539408, 0.2299762, 0.952901, 0.2304305,
+  0.9518602, 0.2308959, 0.9508181, 0.2313726, 0.9497747, 0.2318608,
+  0.9487299, 0.2323604, 0.9476837, 0.2328717, 0.946636, 0.2333947,
+  0.9455866, 0.2339296, 0.9445355, 0.2344765, 0.9434825, 0.2350355,
+  0.9424277, 0.2356069, 0.9413709, 0.2361906, 0.9403121, 0.2367869,
+  0.939251, 0.237396, 0.9381878, 0.2380179, 0.9371221, 0.2386528,
+  0.9360541, 0.2393009, 0.9349835, 0.2399624, 0.9339102, 0.2406374,
+  0.9328343, 0.2413261, 0.9317555, 0.2420287, 0.9306739, 0.2427454,
+  0.9295892, 0.2434763, 0.9285014, 0.2442217, 0.9274104, 0.2449817,
+  0.9263161, 0.2457566, 0.9252184, 0.2465466, 0.9241172, 0.2473519,
+  0.9230123, 0.2481727, 0.9219037, 0.2490092, 0.9207913, 0.2498618,
+  0.9196749, 0.2507305, 0.9185545, 0.2516158, 0.9174299, 0.2525178,
+  0.9163011, 0.2534369, 0.9151678, 0.2543732, 0.9140301, 0.255327,
+  0.9128877, 0.2562988, 0.9117406, 0.2572887, 0.9105886, 0.258297,
+  0.9094316, 0.2593241, 0.9082695, 0.2603703, 0.9071021, 0.2614359,
+  0.9059294, 0.2625213, 0.9047511, 0.2636269, 0.9035673, 0.2647529,
+  0.9023776, 0.2658997, 0.901182, 0.2670678, 0.8999804, 0.2682576,
+  0.8987726, 0.2694694, 0.8975585, 0.2707036, 0.8963378, 0.2719608,
+  0.8951105, 0.2732413, 0.8938764, 0.2745455, 0.8926354, 0.2758741,
+  0.8913872, 0.2772274, 0.8901318, 0.278606, 0.8888689, 0.2800104,
+  0.8875985, 0.281441, 0.8863202, 0.2828986, 0.885034, 0.2843836,
+  0.8837397, 0.2858966, 0.882437, 0.2874382, 0.8811258, 0.2890091,
+  0.879806, 0.2906099, 0.8784772, 0.2922413, 0.8771394, 0.2939039,
+  0.8757922, 0.2955985, 0.8744356, 0.2973258, 0.8730693, 0.2990866,
+  0.871693, 0.3008816, 0.8703066, 0.3027117, 0.8689097, 0.3045777,
+  0.8675023, 0.3064805, 0.8660841, 0.308421, 0.8646547, 0.3104001,
+  0.863214, 0.3124188, 0.8617618, 0.3144782, 0.8602976, 0.3165791,
+  0.8588214, 0.3187228, 0.8573327, 0.3209103, 0.8558314, 0.3231429,
+  0.8543171, 0.3254216, 0.8527896, 0.3277478, 0.8512485, 0.3301228,
+  0.8496935, 0.3325478, 0.8481243, 0.3350244, 0.8465406, 0.337554,
+  0.8449421, 0.340138, 0.8433284, 0.3427781, 0.8416991, 0.345476,
+  0.8400539, 0.3482332, 0.8383925, 0.3510517, 0.8367143, 0.3539332,
+  0.8350192, 0.3568798, 0.8333065, 0.3598933, 0.831576, 0.362976,
+  0.8298271, 0.3661301, 0.8280595, 0.3693578, 0.8262727, 0.3726615,
+  0.8244662, 0.3760438, 0.8226395, 0.3795074, 0.8207922, 0.3830548,
+  0.8189238, 0.3866891, 0.8170336, 0.3904133, 0.8151212, 0.3942304,
+  0.8152121, 0.3918765, 0.8156035, 0.3886657, 0.8159948, 0.3855286,
+  0.816386, 0.3824629, 0.8167771, 0.3794663, 0.8171679, 0.3765369,
+  0.8175585, 0.3736725, 0.8179489, 0.3708712, 0.8183388, 0.3681313,
+  0.8187285, 0.3654508, 0.8191177, 0.362828, 0.8195065, 0.3602615,
+  0.8198949, 0.3577495, 0.8202829, 0.3552905, 0.8206703, 0.3528832,
+  0.8210573, 0.3505261, 0.8214438, 0.3482178, 0.8218298, 0.3459571,
+  0.8222152, 0.3437428, 0.8226001, 0.3415736, 0.8229845, 0.3394484,
+  0.8233683, 0.3373661, 0.8237516, 0.3353256, 0.8241343, 0.3333259,
+  0.8245165, 0.3313659, 0.8248982, 0.3294448, 0.8252793, 0.3275616,
+  0.8256598, 0.3257154, 0.8260399, 0.3239054, 0.8264193, 0.3221306,
+  0.8267983, 0.3203904, 0.8271767, 0.3186839, 0.8275547, 0.3170104,
+  0.8279321, 0.3153691, 0.828309, 0.3137594, 0.8286854, 0.3121805,
+  0.8290614, 0.3106319, 0.8294369, 0.3091128, 0.8298119, 0.3076227,
+  0.8301865, 0.306161, 0.8305607, 0.304727, 0.8309344, 0.3033203,
+  0.8313078, 0.3019403, 0.8316807, 0.3005864, 0.8320533, 0.2992582,
+  0.8324255, 0.2979552, 0.8327974, 0.2966768, 0.8331689, 0.2954227,
+  0.8335401, 0.2941923, 0.8339111, 0.2929852, 0.8342817, 0.2918011,
+  0.8346521, 0.2906395, 0.8350222, 0.2894999, 0.8353921, 0.2883821,
+  0.8357618, 0.2872857, 0.8361312, 0.2862102, 0.8365005, 0.2851553,
+  0.8368697, 0.2841207, 0.8372387, 0.2831061, 0.8376076, 0.282111,
+  0.8379763, 0.2811353, 0.838345, 0.2801786, 0.8387136, 0.2792406,
+  0.8390822, 0.278321, 0.8394508, 0.2774196, 0.8398193, 0.276536,
+  0.8401878, 0.2756701, 0.8405564, 0.2748215, 0.8409251, 0.2739899,
+  0.8412938, 0.2731753, 0.8416626, 0.2723772, 0.8420315, 0.2715956,
+  0.8424006, 0.2708301, 0.8427698, 0.2700806, 0.8431392, 0.2693468,
+  0.8435088, 0.2686286, 0.8438787, 0.2679257, 0.8442488, 0.2672379,
+  0.8446191, 0.2665651, 0.8449898, 0.2659071, 0.8453607, 0.2652637,
+  0.845732, 0.2646348, 0.8461037, 0.2640201, 0.8464757, 0.2634195,
+  0.8468482, 0.2628329, 0.8472211, 0.2622601, 0.8475944, 0.2617009,
+  0.8479683, 0.2611552, 0.8483426, 0.2606229, 0.8487174, 0.2601038,
+  0.8490929, 0.2595979, 0.8494689, 0.2591049, 0.8498455, 0.2586247,
+  0.8502227, 0.2581573, 0.8506006, 0.2577026, 0.8509792, 0.2572603,
+  0.8513584, 0.2568304, 0.8517385, 0.2564129, 0.8521192, 0.2560075,
+  0.8525008, 0.2556142, 0.8528832, 0.255233, 0.8532664, 0.2548637,
+  0.8536506, 0.2545061, 0.8540356, 0.2541604, 0.8544215, 0.2538263,
+  0.8548084, 0.2535038, 0.8551963, 0.2531928, 0.8555852, 0.2528932,
+  0.8559752, 0.252605, 0.8563663, 0.2523281, 0.8567584, 0.2520625,
+  0.8571517, 0.251808, 0.8575462, 0.2515647, 0.8579419, 0.2513324,
+  0.8583388, 0.2511112, 0.858737, 0.2509009, 0.8591365, 0.2507016,
+  0.8595374, 0.2505131, 0.8599396, 0.2503354, 0.8583683, 0.2495943,
+  0.8561175, 0.2486675, 0.8538863, 0.2477582, 0.8516744, 0.2468662,
+  0.8494812, 0.2459913, 0.8473063, 0.2451331, 0.8451493, 0.2442915,
+  0.8430097, 0.243466, 0.8408872, 0.2426566, 0.8387814, 0.2418629,
+  0.8366918, 0.2410847, 0.834618, 0.2403218, 0.8325598, 0.239574,
+  0.8305167, 0.2388409, 0.8284883, 0.2381225, 0.8264745, 0.2374186,
+  0.8244746, 0.2367288, 0.8224886, 0.2360531, 0.820516, 0.2353912,
+  0.8185565, 0.234743, 0.8166098, 0.2341082, 0.8146756, 0.2334868,
+  0.8127536, 0.2328785, 0.8108436, 0.2322832, 0.8089451, 0.2317007,
+  0.807058, 0.2311308, 0.805182, 0.2305735, 0.8033168, 0.2300285,
+  0.8014622, 0.2294958, 0.7996178, 0.2289752, 0.7977834, 0.2284665,
+  0.7959589, 0.2279697, 0.7941438, 0.2274845, 0.7923381, 0.227011,
+  0.7905414, 0.2265489, 0.7887536, 0.2260982, 0.7869744, 0.2256587,
+  0.7852035, 0.2252303, 0.7834408, 0.224813, 0.7816861, 0.2244066,
+  0.779939, 0.2240111, 0.7781996, 0.2236263, 0.7764674, 0.2232521,
+  0.7747423, 0.2228886, 0.7730242, 0.2225354, 0.7713127, 0.2221927,
+  0.7696078, 0.2218603, 0.7679092, 0.2215382, 0.7662168, 0.2212262,
+  0.7645303, 0.2209243, 0.7628496, 0.2206324, 0.7611744, 0.2203505,
+  0.7595047, 0.2200784, 0.7578402, 0.2198162, 0.7561808, 0.2195638,
+  0.7545262, 0.2193212, 0.7528763, 0.2190881, 0.751231, 0.2188647,
+  0.7495901, 0.2186509, 0.7479533, 0.2184466, 0.7463206, 0.2182518,
+  0.7446918, 0.2180664, 0.7430667, 0.2178904, 0.7414451, 0.2177238,
+  0.7398269, 0.2175665, 0.738212, 0.2174186, 0.7366001, 0.2172798,
+  0.7349911, 0.2171504, 0.733385, 0.2170301, 0.7317814, 0.216919,
+  0.7301803, 0.2168171, 0.7285814, 0.2167243, 0.7269848, 0.2166407,
+  0.7253901, 0.2165662, 0.7237973, 0.2165008, 0.7222062, 0.2164445,
+  0.7206166, 0.2163973, 0.7190285, 0.2163591, 0.7174415, 0.21633,
+  0.7158557, 0.21631, 0.7142709, 0.2162991, 0.7126868, 0.2162973,
+  0.7111034, 0.2163045, 0.7095205, 0.2163208, 0.707938, 0.2163462,
+  0.7063557, 0.2163808, 0.7047734, 0.2164244, 0.7031911, 0.2164772,
+  0.7016085, 0.2165391, 0.7000256, 0.2166102, 0.6984421, 0.2166905,
+  0.6968579, 0.21678, 0.6952729, 0.2168787, 0.6936869, 0.2169867,
+  0.6920998, 0.217104, 0.6905114, 0.2172307, 0.6889215, 0.2173667,
+  0.68733, 0.2175121, 0.6857368, 0.217667, 0.6841417, 0.2178314,
+  0.6825444, 0.2180053, 0.680945, 0.2181888, 0.6793432, 0.218382,
+  0.6777388, 0.2185848, 0.6761316, 0.2187974, 0.6745216, 0.2190198,
+  0.6729086, 0.219252, 0.6712923, 0.2194942, 0.6696726, 0.2197464,
+  0.6680494, 0.2200087, 0.6664224, 0.2202811, 0.6647915, 0.2205637,
+  0.6631566, 0.2208566, 0.6615173, 0.2211599, 0.6598736, 0.2214737,
+  0.6582252, 0.221798, 0.656572, 0.222133, 0.6549137, 0.2224788,
+  0.6532502, 0.2228354, 0.6515813, 0.2232029, 0.6499068, 0.2235815,
+  0.6482264, 0.2239713, 0.64654, 0.2243723, 0.6448473, 0.2247848,
+  0.6431482, 0.2252088, 0.6414423, 0.2256445, 0.6397295, 0.2260919,
+  0.6380096, 0.2265513, 0.6362822, 0.2270228, 0.6345473, 0.2275065,
+  0.6328044, 0.2280026, 0.6310534, 0.2285112, 0.6292941, 0.2290326,
+  0.6275261, 0.2295668, 0.6257491, 0.230114, 0.623963, 0.2306745,
+  0.6221673, 0.2312484, 0.6203619, 0.2318359, 0.6185465, 0.2324373,
+  0.6167206, 0.2330527, 0.6148841, 0.2336823, 0.6130365, 0.2343264,
+  0.6111776, 0.2349852, 0.609307, 0.235659, 0.6074244, 0.236348,
+  0.6055293, 0.2370524, 0.6036215, 0.2377726, 0.6017005, 0.2385088,
+  0.5997659, 0.2392614, 0.5978173, 0.2400305, 0.5958544, 0.2408166,
+  0.5938765, 0.2416199, 0.5918834, 0.2424408, 0.5898745, 0.2432797,
+  0.5878493, 0.2441369, 0.5858073, 0.2450128, 0.583748, 0.2459078,
+  0.5816708, 0.2468223, 0.5795752, 0.2477568, 0.5774605, 0.2487118,
+  0.5753262, 0.2496876, 0.5731716, 0.2506848, 0.5709959, 0.2517039,
+  0.5687986, 0.2527455, 0.5665788, 0.2538102, 0.5643358, 0.2548984,
+  0.5620688, 0.2560109, 0.5597769, 0.2571484, 0.5574592, 0.2583114,
+  0.5551147, 0.2595008, 0.5527425, 0.2607174, 0.5503415, 0.2619619,
+  0.5479105, 0.2632352, 0.5454484, 0.2645382, 0.542954, 0.2658719,
+  0.5404259, 0.2672374, 0.5378626, 0.2686357, 0.5352627, 0.270068,
+  0.5326245, 0.2715356, 0.5299462, 0.2730397, 0.5272261, 0.2745819,
+  0.5244621, 0.2761636, 0.521652, 0.2777866, 0.5187935, 0.2794526,
+  0.5158839, 0.2811636, 0.5129206, 0.2829218, 0.5099004, 0.2847293,
+  0.5068201, 0.2865888, 0.5036758, 0.2885031, 0.5004635, 0.2904752,
+  0.4971787, 0.2925086, 0.4938163, 0.2946071, 0.4903705, 0.2967749,
+  0.4868347, 0.299017, 0.4832017, 0.3013388, 0.4794628, 0.3037467,
+  0.4756082, 0.3062479, 0.4716262, 0.3088511, 0.4675029, 0.3115665,
+  0.4632218, 0.3144061, 0.4587626, 0.3173849, 0.4590789, 0.3170922,
+  0.45983, 0.3165126, 0.4605841, 0.3159433, 0.4613412, 0.315384,
+  0.4621014, 0.3148349, 0.4628647, 0.3142956, 0.4636312, 0.3137663,
+  0.4644009, 0.3132466, 0.4651738, 0.3127367, 0.4659501, 0.3122363,
+  0.4667297, 0.3117455, 0.4675127, 0.3112641, 0.4682992, 0.310792,
+  0.4690892, 0.3103291, 0.4698828, 0.3098754, 0.47068, 0.3094308,
+  0.4714808, 0.3089953, 0.4722854, 0.3085686, 0.4730937, 0.3081509,
+  0.4739059, 0.3077419, 0.4747219, 0.3073417, 0.4755418, 0.3069501,
+  0.4763657, 0.306567, 0.4771937, 0.3061925, 0.4780258, 0.3058264,
+  0.478862, 0.3054687, 0.4797024, 0.3051193, 0.480547, 0.3047782,
+  0.481396, 0.3044452, 0.4822493, 0.3041203, 0.4831071, 0.3038035,
+  0.4839694, 0.3034947, 0.4848362, 0.3031938, 0.4857076, 0.3029008,
+  0.4865837, 0.3026157, 0.4874645, 0.3023382, 0.4883501, 0.3020685,
+  0.4892406, 0.3018064, 0.490136, 0.301552, 0.4910363, 0.301305,
+  0.4919417, 0.3010656, 0.4928522, 0.3008335, 0.4937679, 0.3006089,
+  0.4946888, 0.3003916, 0.495615, 0.3001816, 0.4965466, 0.2999788,
+  0.4974836, 0.2997832, 0.4984261, 0.2995947, 0.4993742, 0.2994133,
+  0.5003279, 0.2992389, 0.5012873, 0.2990716, 0.5022525, 0.2989112,
+  0.5032236, 0.2987577, 0.5042005, 0.298611, 0.5051835, 0.2984712,
+  0.5061725, 0.2983381, 0.5071676, 0.2982118, 0.5081689, 0.2980922,
+  0.5091766, 0.2979792, 0.5101905, 0.2978728, 0.511211, 0.297773,
+  0.5122379, 0.2976797, 0.5132714, 0.2975928, 0.5143115, 0.2975125,
+  0.5153584, 0.2974385, 0.5164121, 0.2973709, 0.5174727, 0.2973097,
+  0.5185402, 0.2972547, 0.5196148, 0.297206, 0.5206965, 0.2971636,
+  0.5217855, 0.2971273, 0.5228817, 0.2970971, 0.5239853, 0.2970731,
+  0.5250964, 0.2970552, 0.526215, 0.2970433, 0.5273412, 0.2970374,
+  0.5284751, 0.2970375, 0.5296168, 0.2970436, 0.5307664, 0.2970556,
+  0.531924, 0.2970734, 0.5330896, 0.2970971, 0.5342633, 0.2971267,
+  0.5354452, 0.297162, 0.5366355, 0.2972031, 0.5378341, 0.2972499,
+  0.5390413, 0.2973024, 0.540257, 0.2973606, 0.5414814, 0.2974245,
+  0.5427145, 0.2974939, 0.5439565, 0.297569, 0.5452074, 0.2976496,
+  0.5464673, 0.2977357, 0.5477363, 0.2978273, 0.5490146, 0.2979244,
+  0.5503021, 0.298027, 0.5515991, 0.298135, 0.5529055, 0.2982484,
+  0.5542216, 0.2983672, 0.5555473, 0.2984913, 0.5568827, 0.2986207,
+  0.5582281, 0.2987555, 0.5595834, 0.2988955, 0.5609487, 0.2990408,
+  0.5623242, 0.2991913, 0.5637099, 0.2993471, 0.565106, 0.299508,
+  0.5665126, 0.2996741, 0.5679296, 0.2998454, 0.5693573, 0.3000218,
+  0.5707957, 0.3002033, 0.572245, 0.30039, 0.5737052, 0.3005817,
+  0.5751764, 0.3007784, 0.5766587, 0.3009802, 0.5781522, 0.301187,
+  0.5796571, 0.3013989, 0.5811734, 0.3016157, 0.5827012, 0.3018375,
+  0.5842406, 0.3020643, 0.5857917, 0.3022961, 0.5873546, 0.3025328,
+  0.5889294, 0.3027744, 0.5905163, 0.3030209, 0.5921152, 0.3032724,
+  0.5937264, 0.3035287, 0.5953499, 0.30379, 0.5969858, 0.3040561,
+  0.5986341, 0.3043272, 0.6002951, 0.3046031, 0.6019688, 0.3048838,
+  0.6036553, 0.3051695, 0.6053547, 0.30546, 0.6070672, 0.3057553,
+  0.6087927, 0.3060555, 0.6105314, 0.3063606, 0.6122834, 0.3066705,
+  0.6140489, 0.3069853, 0.6158278, 0.307305, 0.6176204, 0.3076295,
+  0.6194266, 0.3079589, 0.6212467, 0.3082932, 0.6230807, 0.3086324,
+  0.6249286, 0.3089764, 0.6267907, 0.3093254, 0.6286671, 0.3096793,
+  0.6305577, 0.3100381, 0.6324627, 0.3104019, 0.6343823, 0.3107706,
+  0.6363164, 0.3111443, 0.6382653, 0.311523, 0.6402291, 0.3119067,
+  0.6422077, 0.3122955, 0.6442014, 0.3126893, 0.6462102, 0.3130882,
+  0.6482343, 0.3134921, 0.6502737, 0.3139013, 0.6523286, 0.3143156,
+  0.654399, 0.314735, 0.6564851, 0.3151597, 0.6585869, 0.3155897,
+  0.6607047, 0.316025, 0.6628384, 0.3164655, 0.6649882, 0.3169115,
+  0.6671542, 0.3173629, 0.6693366, 0.3178197, 0.6715354, 0.318282,
+  0.6737507, 0.3187498, 0.6759827, 0.3192233, 0.6782315, 0.3197024,
+  0.6804972, 0.3201871, 0.6827799, 0.3206777, 0.6850798, 0.321174,
+  0.6873969, 0.3216762, 0.6897313, 0.3221843, 0.6920833, 0.3226984,
+  0.694453, 0.3232185, 0.6968404, 0.3237448, 0.6992457, 0.3242772,
+  0.701669, 0.3248159, 0.7041105, 0.3253609, 0.7065703, 0.3259123,
+  0.7090486, 0.3264702, 0.7115454, 0.3270347, 0.714061, 0.3276058,
+  0.7165955, 0.3281836, 0.719149, 0.3287683, 0.7217217, 0.3293598,
+  0.7243137, 0.3299584, 0.7269252, 0.330564, 0.7295565, 0.3311769,
+  0.7322075, 0.331797, 0.7348786, 0.3324245, 0.7375699, 0.3330596,
+  0.7402815, 0.3337022, 0.7430137, 0.3343525, 0.7457666, 0.3350107,
+  0.7485405, 0.3356769, 0.7513355, 0.3363511, 0.7541518, 0.3370335,
+  0.7569897, 0.3377242, 0.7598493, 0.3384234, 0.7627309, 0.3391312,
+  0.7653885, 0.3397384, 0.7645389, 0.3387907, 0.7636991, 0.337852,
+  0.7628692, 0.3369222, 0.7620489, 0.3360013, 0.7612382, 0.3350893,
+  0.7604369, 0.3341861, 0.759645, 0.3332917, 0.7588623, 0.332406,
+  0.7580886, 0.3315291, 0.757324, 0.3306609, 0.7565683, 0.3298014,
+  0.7558213, 0.3289505, 0.7550829, 0.3281082, 0.7543532, 0.3272745,
+  0.7536318, 0.3264494, 0.7529188, 0.3256328, 0.7522141, 0.3248247,
+  0.7515175, 0.3240251, 0.7508289, 0.3232339, 0.7501482, 0.3224512,
+  0.7494754, 0.3216769, 0.7488103, 0.320911, 0.7481529, 0.3201535,
+  0.747503, 0.3194043, 0.7468605, 0.3186634, 0.7462254, 0.3179308,
+  0.7455975, 0.3172064, 0.7449768, 0.3164903, 0.7443632, 0.3157825,
+  0.7437565, 0.3150829, 0.7431568, 0.3143914, 0.7425638, 0.3137081,
+  0.7419776, 0.313033, 0.7413979, 0.312366, 0.7408249, 0.3117071,
+  0.7402583, 0.3110563, 0.739698, 0.3104136, 0.7391441, 0.3097789,
+  0.7385963, 0.3091522, 0.7380547, 0.3085336, 0.7375192, 0.307923,
+  0.7369896, 0.3073203, 0.7364659, 0.3067257, 0.735948, 0.3061389,
+  0.7354359, 0.3055601, 0.7349294, 0.3049892, 0.7344286, 0.3044262,
+  0.7339332, 0.3038711, 0.7334433, 0.3033238, 0.7329588, 0.3027844,
+  0.7324796, 0.3022529, 0.7320056, 0.3017291, 0.7315368, 0.3012132,
+  0.7310731, 0.300705, 0.7306144, 0.3002046, 0.7301607, 0.299712,
+  0.7297119, 0.2992272, 0.7292679, 0.29875, 0.7288287, 0.2982806,
+  0.7283942, 0.2978189, 0.7279644, 0.2973649, 0.7275392, 0.2969185,
+  0.7271185, 0.2964799, 0.7267022, 0.2960489, 0.7262904, 0.2956255,
+  0.725883, 0.2952098, 0.7254798, 0.2948017, 0.7250809, 0.2944012,
+  0.7246861, 0.2940084,
+];
+
+// linear_ProPhotoRGB cusp (L, C) pairs at 1024 hues evenly spaced from 0 to 360 degrees,
+// interpolated within 6.2e-05 of the exact cusp at 99% of hues, and 3.2e-01 at most
+
+export const OKLab_to_linear_ProPhotoRGB_cusp_LUT = [
+  0.7091737, 0.4478075, 0.7089872, 0.4473024, 0.7088032, 0.4468036,
+  0.7086217, 0.4463113, 0.7084428, 0.4458255, 0.7082663, 0.4453464,
+  0.7080923, 0.444874, 0.7079207, 0.4444084, 0.7077515, 0.4439498,
+  0.7075847, 0.4434981, 0.7074202, 0.4430536, 0.707258, 0.4426163,
+  0.7070981, 0.4421863, 0.7069405, 0.4417636, 0.7067851, 0.4413484,
+  0.7066319, 0.4409408, 0.7064809, 0.4405408, 0.7063321, 0.4401485,
+  0.7061854, 0.439764, 0.7060409, 0.4393873, 0.7058984, 0.4390187,
+  0.705758, 0.438658, 0.7056196, 0.4383054, 0.7054833, 0.437961,
+  0.7053489, 0.4376249, 0.7052165, 0.437297, 0.7050861, 0.4369776,
+  0.7049575, 0.4366666, 0.7048309, 0.4363642, 0.7047062, 0.4360703,
+  0.7045833, 0.4357851, 0.7044622, 0.4355087, 0.7043429, 0.435241,
+  0.7042255, 0.4349822, 0.7041098, 0.4347324, 0.7039958, 0.4344915,
+  0.7038836, 0.4342597, 0.703773, 0.434037, 0.7036642, 0.4338234,
+  0.703557, 0.4336191, 0.7034514, 0.4334242, 0.7033475, 0.4332386,
+  0.7032452, 0.4330624, 0.7031444, 0.4328956, 0.7030452, 0.4327385,
+  0.7029476, 0.4325909, 0.7028515, 0.432453, 0.7027568, 0.4323248,
+  0.7026637, 0.4322064, 0.7025721, 0.4320978, 0.7024819, 0.4319992,
+  0.7023931, 0.4319105, 0.7023057, 0.4318318, 0.7022198, 0.4317631,
+  0.7021352, 0.4317046, 0.702052, 0.4316563, 0.7027831, 0.4303115,
+  0.7052407, 0.4262168, 0.7076599, 0.4222149, 0.7100417, 0.418303,
+  0.7123872, 0.4144784, 0.7146973, 0.4107385, 0.7169731, 0.4070807,
+  0.7192154, 0.4035027, 0.7214251, 0.4000021, 0.7236031, 0.3965766,
+  0.7257503, 0.3932242, 0.7278674, 0.3899428, 0.7299552, 0.3867304,
+  0.7320144, 0.3835851, 0.7340459, 0.3805049, 0.7360503, 0.3774883,
+  0.7380284, 0.3745333, 0.7399806, 0.3716385, 0.7419078, 0.3688022,
+  0.7438106, 0.3660228, 0.7456894, 0.3632989, 0.7475451, 0.3606291,
+  0.749378, 0.3580119, 0.7511887, 0.3554461, 0.7529779, 0.3529303,
+  0.7547459, 0.3504633, 0.7564934, 0.348044, 0.7582207, 0.3456711,
+  0.7599285, 0.3433435, 0.761617, 0.3410601, 0.7632869, 0.33882,
+  0.7649385, 0.336622, 0.7665722, 0.3344652, 0.7681885, 0.3323487,
+  0.7697878, 0.3302714, 0.7713704, 0.3282326, 0.7729367, 0.3262314,
+  0.7744872, 0.3242669, 0.7760221, 0.3223383, 0.7775418, 0.3204449,
+  0.7790466, 0.3185858, 0.780537, 0.3167603, 0.7820131, 0.3149678,
+  0.7834754, 0.3132075, 0.7849241, 0.3114788, 0.7863595, 0.3097809,
+  0.787782, 0.3081133, 0.7891917, 0.3064754, 0.790589, 0.3048665,
+  0.7919742, 0.303286, 0.7933475, 0.3017335, 0.7947092, 0.3002084,
+  0.7960595, 0.29871, 0.7973986, 0.297238, 0.7987269, 0.2957918,
+  0.8000445, 0.2943709, 0.8013517, 0.2929749, 0.8026487, 0.2916032,
+  0.8039357, 0.2902555, 0.805213, 0.2889313, 0.8064806, 0.2876302,
+  0.8077389, 0.2863518, 0.8089881, 0.2850956, 0.8102283, 0.2838613,
+  0.8114597, 0.2826485, 0.8126826, 0.2814568, 0.813897, 0.280286,
+  0.8151033, 0.2791355, 0.8163015, 0.2780051, 0.8174918, 0.2768945,
+  0.8186744, 0.2758033, 0.8198495, 0.2747312, 0.8210172, 0.2736779,
+  0.8221777, 0.2726432, 0.8233311, 0.2716267, 0.8244777, 0.2706281,
+  0.8256174, 0.2696471, 0.8267506, 0.2686836, 0.8278773, 0.2677372,
+  0.8289977, 0.2668077, 0.8301119, 0.2658948, 0.83122, 0.2649984,
+  0.8323223, 0.264118, 0.8334187, 0.2632537, 0.8345096, 0.262405,
+  0.8355948, 0.2615718, 0.8366747, 0.2607539, 0.8377494, 0.259951,
+  0.8388188, 0.259163, 0.8398833, 0.2583897, 0.8409428, 0.2576309,
+  0.8419975, 0.2568864, 0.8430475, 0.256156, 0.844093, 0.2554395,
+  0.845134, 0.2547368, 0.8461706, 0.2540477, 0.847203, 0.253372,
+  0.8482313, 0.2527096, 0.8492555, 0.2520603, 0.8502758, 0.251424,
+  0.8512922, 0.2508005, 0.8523049, 0.2501897, 0.853314, 0.2495914,
+  0.8543195, 0.2490055, 0.8553216, 0.2484319, 0.8563204, 0.2478704,
+  0.8573159, 0.247321, 0.8583082, 0.2467834, 0.8592975, 0.2462576,
+  0.8602837, 0.2457434, 0.8612671, 0.2452408, 0.8622477, 0.2447497,
+  0.8632256, 0.2442698, 0.8642009, 0.2438012, 0.8651736, 0.2433437,
+  0.8661438, 0.2428972, 0.8671117, 0.2424617, 0.8680773, 0.242037,
+  0.8690407, 0.241623, 0.8700019, 0.2412197, 0.8709611, 0.240827,
+  0.8719184, 0.2404448, 0.8728738, 0.240073, 0.8738273, 0.2397115,
+  0.8747792, 0.2393603, 0.8757294, 0.2390193, 0.876678, 0.2386884,
+  0.8776251, 0.2383675, 0.8785708, 0.2380566, 0.8795152, 0.2377557,
+  0.8804583, 0.2374647, 0.8814003, 0.2371834, 0.8823411, 0.2369119,
+  0.8832809, 0.2366501, 0.8842197, 0.2363979, 0.8851576, 0.2361553,
+  0.8860947, 0.2359223, 0.8870311, 0.2356988, 0.8879668, 0.2354847,
+  0.8889019, 0.2352801, 0.8898364, 0.2350848, 0.8907705, 0.2348988,
+  0.8917043, 0.2347222, 0.8926377, 0.2345548, 0.8935709, 0.2343966,
+  0.894504, 0.2342477, 0.8954369, 0.2341079, 0.8963699, 0.2339773,
+  0.8973029, 0.2338558, 0.898236, 0.2337434, 0.8991693, 0.2336401,
+  0.9001029, 0.2335458, 0.9010369, 0.2334606, 0.9019712, 0.2333844,
+  0.9029061, 0.2333172, 0.9038415, 0.233259, 0.9047775, 0.2332098,
+  0.9057143, 0.2331696, 0.9066518, 0.2331383, 0.9075902, 0.233116,
+  0.9085295, 0.2331027, 0.9094699, 0.2330983, 0.9104113, 0.2331029,
+  0.9113539, 0.2331165, 0.9122977, 0.233139, 0.9132428, 0.2331705,
+  0.9141892, 0.233211, 0.9151372, 0.2332604, 0.9160867, 0.2333189,
+  0.9170378, 0.2333863, 0.9179906, 0.2334628, 0.9189451, 0.2335483,
+  0.9199015, 0.2336429, 0.9208598, 0.2337466, 0.9218202, 0.2338593,
+  0.9227826, 0.2339812, 0.9237472, 0.2341122, 0.9247141, 0.2342524,
+  0.9256833, 0.2344018, 0.9266549, 0.2345604, 0.9276291, 0.2347283,
+  0.9286058, 0.2349055, 0.9295852, 0.235092, 0.9305674, 0.2352879,
+  0.9315524, 0.2354932, 0.9325404, 0.2357079, 0.9335314, 0.2359321,
+  0.9345255, 0.2361659, 0.9355229, 0.2364093, 0.9365236, 0.2366623,
+  0.9375276, 0.236925, 0.9385352, 0.2371975, 0.9395464, 0.2374798,
+  0.9405613, 0.2377719, 0.94158, 0.238074, 0.9426026, 0.238386,
+  0.9436292, 0.2387081, 0.9446599, 0.2390403, 0.9456948, 0.2393827,
+  0.9467341, 0.2397354, 0.9477778, 0.2400984, 0.948826, 0.2404719,
+  0.9498789, 0.2408558, 0.9509365, 0.2412503, 0.951999, 0.2416555,
+  0.9530666, 0.2420714, 0.9541392, 0.2424982, 0.9552171, 0.2429359,
+  0.9563004, 0.2433846, 0.9573891, 0.2438445, 0.9584835, 0.2443156,
+  0.9595836, 0.2447981, 0.9606896, 0.245292, 0.9618017, 0.2457974,
+  0.9629198, 0.2463146, 0.9640443, 0.2468435, 0.9651752, 0.2473843,
+  0.9663127, 0.2479372, 0.967457, 0.2485023, 0.9686081, 0.2490796,
+  0.9697662, 0.2496694, 0.9709316, 0.2502717, 0.9721043, 0.2508868,
+  0.9732845, 0.2515147, 0.9744724, 0.2521556, 0.9756681, 0.2528097,
+  0.9768719, 0.2534771, 0.9780839, 0.254158, 0.9793042, 0.2548526,
+  0.9805332, 0.255561, 0.9817709, 0.2562834, 0.9830175, 0.2570199,
+  0.9842733, 0.2577709, 0.9855385, 0.2585364, 0.9868132, 0.2593167,
+  0.9880977, 0.2601119, 0.9893921, 0.2609223, 0.9903003, 0.2616434,
+  0.9895215, 0.2619303, 0.9887426, 0.2622281, 0.9879636, 0.2625368,
+  0.9871845, 0.2628564, 0.9864051, 0.2631871, 0.9856255, 0.2635289,
+  0.9848455, 0.2638819, 0.9840652, 0.2642461, 0.9832843, 0.2646216,
+  0.982503, 0.2650086, 0.9817211, 0.265407, 0.9809385, 0.2658171,
+  0.9801553, 0.2662387, 0.9793713, 0.2666721, 0.9785865, 0.2671174,
+  0.9778008, 0.2675746, 0.9770141, 0.2680438, 0.9762265, 0.2685251,
+  0.9754378, 0.2690187, 0.9746479, 0.2695246, 0.9738569, 0.270043,
+  0.9730646, 0.270574, 0.972271, 0.2711176, 0.971476, 0.2716741,
+  0.9706796, 0.2722435, 0.9698817, 0.2728259, 0.9690822, 0.2734215,
+  0.968281, 0.2740305, 0.9674781, 0.2746529, 0.9666735, 0.275289,
+  0.965867, 0.2759387, 0.9650586, 0.2766024, 0.9642483, 0.2772802,
+  0.9634359, 0.2779722, 0.9626213, 0.2786785, 0.9618046, 0.2793994,
+  0.9609856, 0.280135, 0.9601643, 0.2808856, 0.9593406, 0.2816512,
+  0.9585144, 0.282432, 0.9576856, 0.2832284, 0.9568543, 0.2840404,
+  0.9560202, 0.2848682, 0.9551833, 0.2857121, 0.9543436, 0.2865723,
+  0.9535009, 0.287449, 0.9526552, 0.2883424, 0.9518065, 0.2892528,
+  0.9509545, 0.2901804, 0.9500993, 0.2911253, 0.9492407, 0.292088,
+  0.9483787, 0.2930686, 0.9475131, 0.2940674, 0.946644, 0.2950847,
+  0.9457712, 0.2961207, 0.9448945, 0.2971758, 0.944014, 0.2982502,
+  0.9431295, 0.2993442, 0.942241, 0.3004581, 0.9413483, 0.3015923,
+  0.9404513, 0.3027471, 0.93955, 0.3039228, 0.9386441, 0.3051197,
+  0.9377338, 0.3063383, 0.9368187, 0.3075788, 0.9358989, 0.3088416,
+  0.9349742, 0.3101272, 0.9340445, 0.3114359, 0.9331097, 0.3127681,
+  0.9321697, 0.3141243, 0.9312243, 0.3155049, 0.9302735, 0.3169102,
+  0.9293172, 0.3183408, 0.9283551, 0.3197972, 0.9273872, 0.3212797,
+  0.9264133, 0.322789, 0.9254334, 0.3243255, 0.9244473, 0.3258897,
+  0.9234548, 0.3274821, 0.9224558, 0.3291034, 0.9214502, 0.3307541,
+  0.9204379, 0.3324348, 0.9194186, 0.3341461, 0.9183923, 0.3358886,
+  0.9173587, 0.3376629, 0.9163178, 0.3394698, 0.9152694, 0.3413098,
+  0.9142133, 0.3431838, 0.9131493, 0.3450924, 0.9120773, 0.3470364,
+  0.9109971, 0.3490165, 0.9099085, 0.3510336, 0.9088114, 0.3530885,
+  0.9077055, 0.355182, 0.9065907, 0.357315, 0.9054668, 0.3594884,
+  0.9043335, 0.3617031, 0.9031908, 0.3639602, 0.9020383, 0.3662605,
+  0.9008758, 0.3686053, 0.8997032, 0.3709954, 0.8985202, 0.3734321,
+  0.8973266, 0.3759164, 0.8961221, 0.3784496, 0.8949065, 0.3810328,
+  0.8936796, 0.3836674, 0.8924411, 0.3863547, 0.8911908, 0.3890959,
+  0.8899284, 0.3918927, 0.8886535, 0.3947463, 0.887366, 0.3976583,
+  0.8860655, 0.4006303, 0.8847518, 0.403664, 0.8834246, 0.406761,
+  0.8820834, 0.409923, 0.8807281, 0.413152, 0.8793583, 0.4164498,
+  0.8779736, 0.4198183, 0.8765738, 0.4232598, 0.8751584, 0.4267762,
+  0.873727, 0.4303698, 0.8722794, 0.4340429, 0.8708151, 0.4377979,
+  0.8693337, 0.4416374, 0.8678348, 0.445564, 0.866318, 0.4495803,
+  0.8647828, 0.4536893, 0.8632289, 0.4578939, 0.8616556, 0.4621973,
+  0.8600627, 0.4666025, 0.8584495, 0.4711132, 0.8568156, 0.4757327,
+  0.8551604, 0.4804648, 0.8534834, 0.4853133, 0.8517841, 0.4902824,
+  0.8500618, 0.4953763, 0.848316, 0.5005994, 0.8465461, 0.5059564,
+  0.8447515, 0.5114523, 0.8429314, 0.5170921, 0.8410853, 0.5228813,
+  0.8400882, 0.5247049, 0.8401461, 0.5216369, 0.8402044, 0.5186518,
+  0.8402634, 0.5157474, 0.8403228, 0.512921, 0.8403827, 0.5101706,
+  0.840443, 0.5074939, 0.8405038, 0.5048888, 0.840565, 0.5023534,
+  0.8406267, 0.4998858, 0.8406888, 0.4974843, 0.8407512, 0.495147,
+  0.8408141, 0.4928723, 0.8408773, 0.4906588, 0.8409409, 0.4885048,
+  0.8410048, 0.486409, 0.8410692, 0.48437, 0.8411338, 0.4823865,
+  0.8411988, 0.4804572, 0.8412641, 0.4785809, 0.8413298, 0.4767565,
+  0.8413958, 0.4749828, 0.8414621, 0.4732589, 0.8415288, 0.4715837,
+  0.8415957, 0.4699563, 0.841663, 0.4683756, 0.8417305, 0.466841,
+  0.8417984, 0.4653514, 0.8418666, 0.4639061, 0.8419351, 0.4625043,
+  0.842004, 0.4611453, 0.8420731, 0.4598284, 0.8421425, 0.4585529,
+  0.8422122, 0.4573181, 0.8422823, 0.4561234, 0.8423527, 0.4549683,
+  0.8424233, 0.4538522, 0.8424943, 0.4527745, 0.8425656, 0.4517347,
+  0.8426373, 0.4507324, 0.8427092, 0.449767, 0.8427815, 0.4488382,
+  0.8428541, 0.4479455, 0.842927, 0.4470886, 0.8430003, 0.446267,
+  0.8430739, 0.4454805, 0.8431479, 0.4447286, 0.8432222, 0.4440111,
+  0.8432969, 0.4433277, 0.8433719, 0.4426781, 0.8434473, 0.442062,
+  0.843523, 0.4414793, 0.8435991, 0.4409297, 0.8436757, 0.4404131,
+  0.8437526, 0.4399291, 0.8438298, 0.4394778, 0.8439075, 0.4390589,
+  0.8439857, 0.4386724, 0.8440642, 0.4383181, 0.8441431, 0.4379959,
+  0.8442225, 0.4377057, 0.8443023, 0.4374476, 0.8443826, 0.4372215,
+  0.8444633, 0.4370273, 0.8445445, 0.4368651, 0.8446261, 0.4367348,
+  0.8447083, 0.4366366, 0.8447909, 0.4365704, 0.844874, 0.4365364,
+  0.8449577, 0.4365347, 0.8450419, 0.4365652, 0.8451266, 0.4366283,
+  0.8452118, 0.436724, 0.8452976, 0.4368526, 0.845384, 0.4370141,
+  0.845471, 0.4372088, 0.8455586, 0.437437, 0.8456467, 0.4376989,
+  0.8457355, 0.4379948, 0.845825, 0.438325, 0.845915, 0.4386899,
+  0.8460058, 0.4390897, 0.8460972, 0.4395249, 0.8461893, 0.4399959,
+  0.8462822, 0.4405031, 0.8463757, 0.441047, 0.84647, 0.4416281,
+  0.8465651, 0.4422469, 0.846661, 0.442904, 0.8467576, 0.4436001,
+  0.8468551, 0.4443357, 0.8469534, 0.4451115, 0.8470526, 0.4459282,
+  0.8471526, 0.4467867, 0.8472536, 0.4476877, 0.8473555, 0.4486322,
+  0.8474583, 0.4496209, 0.8475621, 0.4506549, 0.8468388, 0.4512939,
+  0.8426158, 0.4501082, 0.8384162, 0.4489716, 0.8342385, 0.4478838,
+  0.8300813, 0.4468447, 0.8259432, 0.4458541, 0.8218227, 0.4449119,
+  0.8177183, 0.4440183, 0.8136285, 0.4431731, 0.809552, 0.4423766,
+  0.8054872, 0.4416289, 0.8014327, 0.4409302, 0.7973868, 0.4402809,
+  0.7933481, 0.4396812, 0.7893149, 0.4391318, 0.7852857, 0.4386332,
+  0.7812587, 0.4381859, 0.7772323, 0.4377908, 0.7732046, 0.4374486,
+  0.7691738, 0.4371603, 0.765138, 0.436927, 0.7610952, 0.4367499,
+  0.7570432, 0.4366304, 0.7529798, 0.4365699, 0.7489026, 0.4365703,
+  0.7448093, 0.4366334, 0.7406969, 0.4367613, 0.7365628, 0.4369566,
+  0.7324038, 0.4372217, 0.7282165, 0.4375599, 0.7239974, 0.4379745,
+  0.7197424, 0.4384693, 0.7154472, 0.4390488, 0.7111068, 0.4397179,
+  0.706716, 0.4404823, 0.7022686, 0.4413484, 0.6977577, 0.4423239,
+  0.6931756, 0.4434175, 0.6885133, 0.4446394, 0.6837602, 0.4460017,
+  0.6789042, 0.447519, 0.6739306, 0.4492086, 0.6688217, 0.4510919,
+  0.6635558, 0.4531954, 0.6581059, 0.4555529, 0.6524371, 0.458208,
+  0.6465034, 0.4612187, 0.6402422, 0.4646654, 0.6335633, 0.4686643,
+  0.6263296, 0.4733944, 0.6183119, 0.4791571, 0.60907, 0.4865372,
+  0.5975022, 0.4970124, 0.57675, 0.5199012, 0.3321183, 0.8594373,
+  0.3334403, 0.848537, 0.3347206, 0.837953, 0.3359621, 0.8276704,
+  0.3371676, 0.8176756, 0.3383397, 0.8079556, 0.3394805, 0.7984987,
+  0.3405922, 0.7892937, 0.3416766, 0.7803301, 0.3427354, 0.7715981,
+  0.3437701, 0.7630887, 0.3447823, 0.7547931, 0.3457732, 0.7467031,
+  0.346744, 0.7388111, 0.3476958, 0.7311099, 0.3486298, 0.7235924,
+  0.3495467, 0.7162522, 0.3504476, 0.7090831, 0.3513333, 0.7020792,
+  0.3522045, 0.6952349, 0.3530619, 0.6885449, 0.3539061, 0.6820041,
+  0.354738, 0.6756078, 0.3555579, 0.6693513, 0.3563664, 0.6632302,
+  0.3571641, 0.6572402, 0.3579515, 0.6513775, 0.3587289, 0.6456382,
+  0.3594969, 0.6400185, 0.3602558, 0.634515, 0.3610059, 0.6291243,
+  0.3617477, 0.6238431, 0.3624815, 0.6186683, 0.3632076, 0.613597,
+  0.3639263, 0.6086263, 0.3646379, 0.6037534, 0.3653427, 0.5989756,
+  0.3660409, 0.5942905, 0.3667327, 0.5896956, 0.3674185, 0.5851884,
+  0.3680983, 0.5807668, 0.3687726, 0.5764286, 0.3694413, 0.5721715,
+  0.3701048, 0.5679936, 0.3707632, 0.5638929, 0.3714166, 0.5598676,
+  0.3720654, 0.5559156, 0.3727095, 0.5520354, 0.3733492, 0.5482252,
+  0.3739847, 0.5444833, 0.374616, 0.5408081, 0.3752433, 0.5371981,
+  0.3758668, 0.5336517, 0.3764865, 0.5301676, 0.3771026, 0.5267442,
+  0.3777152, 0.5233804, 0.3783244, 0.5200746, 0.3789303, 0.5168257,
+  0.3795331, 0.5136325, 0.3801327, 0.5104936, 0.3807295, 0.507408,
+  0.3813233, 0.5043745, 0.3819143, 0.5013921, 0.3825027, 0.4984596,
+  0.3830884, 0.4955761, 0.3836716, 0.4927405, 0.3842524, 0.4899518,
+  0.3848308, 0.4872092, 0.3854069, 0.4845117, 0.3859808, 0.4818583,
+  0.3865526, 0.4792483, 0.3871223, 0.4766808, 0.38769, 0.474155,
+  0.3882557, 0.47167, 0.3888196, 0.4692252, 0.3893817, 0.4668197,
+  0.389942, 0.4644528, 0.3905007, 0.4621238, 0.3910577, 0.459832,
+  0.3916132, 0.4575768, 0.3921672, 0.4553574, 0.3927197, 0.4531733,
+  0.3932708, 0.4510237, 0.3938205, 0.4489082, 0.394369, 0.446826,
+  0.3949162, 0.4447767, 0.3954623, 0.4427597, 0.3960072, 0.4407743,
+  0.396551, 0.4388201, 0.3970937, 0.4368966, 0.3976355, 0.4350033,
+  0.3981763, 0.4331396, 0.3987162, 0.431305, 0.3992552, 0.4294992,
+  0.3997934, 0.4277216, 0.4003309, 0.4259717, 0.4008676, 0.4242493,
+  0.4014036, 0.4225537, 0.401939, 0.4208847, 0.4024738, 0.4192417,
+  0.403008, 0.4176244, 0.4035417, 0.4160325, 0.4040749, 0.4144655,
+  0.4046077, 0.412923, 0.40514, 0.4114047, 0.405672, 0.4099103,
+  0.4062037, 0.4084394, 0.406735, 0.4069917, 0.4072662, 0.4055667,
+  0.4077971, 0.4041643, 0.4083278, 0.4027841, 0.4088584, 0.4014258,
+  0.4093888, 0.4000891, 0.4099192, 0.3987737, 0.4104496, 0.3974792,
+  0.41098, 0.3962055, 0.4115104, 0.3949523, 0.4120409, 0.3937193,
+  0.4125715, 0.3925062, 0.4131022, 0.3913127, 0.4136331, 0.3901387,
+  0.4141643, 0.3889839, 0.4146957, 0.387848, 0.4152273, 0.3867308,
+  0.4157593, 0.385632, 0.4162917, 0.3845516, 0.4168244, 0.3834891,
+  0.4173576, 0.3824445, 0.4178912, 0.3814175, 0.4184253, 0.3804079,
+  0.4189599, 0.3794155, 0.4194951, 0.3784401, 0.4200309, 0.3774816,
+  0.4205673, 0.3765396, 0.4211044, 0.3756141, 0.4216421, 0.3747049,
+  0.4221806, 0.3738118, 0.4227199, 0.3729346, 0.42326, 0.3720732,
+  0.4238009, 0.3712274, 0.4243427, 0.370397, 0.4248853, 0.3695818,
+  0.425429, 0.3687818, 0.4259736, 0.3679968, 0.4265192, 0.3672266,
+  0.4270658, 0.3664711, 0.4276136, 0.3657301, 0.4281624, 0.3650035,
+  0.4287124, 0.3642913, 0.4292636, 0.3635931, 0.429816, 0.362909,
+  0.4303697, 0.3622387, 0.4309247, 0.3615822, 0.431481, 0.3609394,
+  0.4320387, 0.3603101, 0.4325978, 0.3596942, 0.4331583, 0.3590916,
+  0.4337203, 0.3585023, 0.4342839, 0.357926, 0.434849, 0.3573627,
+  0.4354157, 0.3568122, 0.435984, 0.3562746, 0.436554, 0.3557496,
+  0.4371257, 0.3552373, 0.4376992, 0.3547374, 0.4382745, 0.35425,
+  0.4388516, 0.3537748, 0.4394306, 0.3533119, 0.4400114, 0.3528612,
+  0.4405943, 0.3524225, 0.4411791, 0.3519959, 0.441766, 0.3515811,
+  0.442355, 0.3511782, 0.4429461, 0.350787, 0.4435393, 0.3504075,
+  0.4441348, 0.3500397, 0.4447325, 0.3496834, 0.4453325, 0.3493386,
+  0.4459349, 0.3490052, 0.4465397, 0.3486831, 0.4471469, 0.3483724,
+  0.4477565, 0.3480729, 0.4483687, 0.3477846, 0.4489835, 0.3475074,
+  0.4496009, 0.3472413, 0.450221, 0.3469862, 0.4508438, 0.346742,
+  0.4514693, 0.3465088, 0.4520977, 0.3462864, 0.452729, 0.3460749,
+  0.4533631, 0.3458741, 0.4540003, 0.3456841, 0.4546405, 0.3455047,
+  0.4552837, 0.345336, 0.4559301, 0.3451779, 0.4565797, 0.3450304,
+  0.4572325, 0.3448934, 0.4578886, 0.3447669, 0.458548, 0.3446508,
+  0.4592109, 0.3445452, 0.4598772, 0.34445, 0.4605471, 0.3443651,
+  0.4612205, 0.3442906, 0.4618976, 0.3442264, 0.4625784, 0.3441725,
+  0.463263, 0.3441288, 0.4639514, 0.3440954, 0.4646437, 0.3440722,
+  0.4653399, 0.3440591, 0.4660402, 0.3440562, 0.4667445, 0.3440635,
+  0.467453, 0.3440809, 0.4681657, 0.3441084, 0.4688827, 0.344146,
+  0.4696041, 0.3441937, 0.4703299, 0.3442515, 0.4710602, 0.3443193,
+  0.471795, 0.3443971, 0.4725346, 0.344485, 0.4732788, 0.3445829,
+  0.4740278, 0.3446908, 0.4747817, 0.3448087, 0.4755405, 0.3449366,
+  0.4763044, 0.3450744, 0.4770734, 0.3452223, 0.4778476, 0.3453801,
+  0.478627, 0.3455479, 0.4794118, 0.3457257, 0.480202, 0.3459135,
+  0.4809978, 0.3461112, 0.4817991, 0.3463189, 0.4826062, 0.3465366,
+  0.483419, 0.3467642, 0.4842377, 0.3470019, 0.4850624, 0.3472495,
+  0.4858932, 0.347507, 0.4867301, 0.3477746, 0.4875732, 0.3480522,
+  0.4884228, 0.3483398, 0.4892787, 0.3486374, 0.4901412, 0.348945,
+  0.4910104, 0.3492626, 0.4918863, 0.3495903, 0.4927691, 0.349928,
+  0.4936589, 0.3502758, 0.4945557, 0.3506336, 0.4954597, 0.3510016,
+  0.496371, 0.3513796, 0.4972897, 0.3517678, 0.498216, 0.3521661,
+  0.4991499, 0.3525745, 0.5000915, 0.3529931, 0.5010411, 0.3534218,
+  0.5019986, 0.3538608, 0.5029642, 0.35431, 0.5039382, 0.3547694,
+  0.5049204, 0.3552391, 0.5059112, 0.355719, 0.5069107, 0.3562092,
+  0.5079189, 0.3567097, 0.508936, 0.3572206, 0.5099621, 0.3577419,
+  0.5109974, 0.3582735, 0.5120421, 0.3588155, 0.5130962, 0.3593679,
+  0.5141599, 0.3599308, 0.5152334, 0.3605042, 0.5163168, 0.361088,
+  0.5174103, 0.3616824, 0.5185139, 0.3622874, 0.519628, 0.3629029,
+  0.5207525, 0.3635291, 0.5218878, 0.3641658, 0.5230339, 0.3648133,
+  0.524191, 0.3654714, 0.5253593, 0.3661402, 0.526539, 0.3668198,
+  0.5277302, 0.3675102, 0.5289331, 0.3682114, 0.5301479, 0.3689234,
+  0.5313747, 0.3696463, 0.5326138, 0.3703801, 0.5338653, 0.3711249,
+  0.5351294, 0.3718806, 0.5364063, 0.3726473, 0.5376962, 0.373425,
+  0.5389993, 0.3742138, 0.5403158, 0.3750137, 0.5416459, 0.3758247,
+  0.5429898, 0.3766469, 0.5443476, 0.3774802, 0.5457197, 0.3783248,
+  0.5471062, 0.3791807, 0.5485073, 0.3800479, 0.5499233, 0.3809264,
+  0.5513544, 0.3818163, 0.5528007, 0.3827177, 0.5542626, 0.3836304,
+  0.5557402, 0.3845547, 0.5572337, 0.3854904, 0.5587435, 0.3864378,
+  0.5602697, 0.3873967, 0.5618126, 0.3883673, 0.5633725, 0.3893496,
+  0.5649495, 0.3903435, 0.5665439, 0.3913493, 0.568156, 0.3923668,
+  0.569786, 0.3933962, 0.5714342, 0.3944375, 0.5731008, 0.3954907,
+  0.5747862, 0.3965559, 0.5764905, 0.3976331, 0.578214, 0.3987224,
+  0.5799571, 0.3998237, 0.5817199, 0.4009373, 0.5835028, 0.402063,
+  0.585306, 0.403201, 0.5871299, 0.4043513, 0.5889747, 0.4055139,
+  0.5908406, 0.406689, 0.5927281, 0.4078765, 0.5946374, 0.4090765,
+  0.5965687, 0.4102891, 0.5985224, 0.4115143, 0.6004988, 0.4127522,
+  0.6024983, 0.4140028, 0.604521, 0.4152662, 0.6065674, 0.4165426,
+  0.6086377, 0.4178318, 0.6107322, 0.4191341, 0.6128514, 0.4204494,
+  0.6149955, 0.4217779, 0.6171648, 0.4231195, 0.6193597, 0.4244745,
+  0.6215805, 0.4258429, 0.6238276, 0.4272247, 0.6261013, 0.42862,
+  0.6284019, 0.430029, 0.6307298, 0.4314517, 0.6330854, 0.4328882,
+  0.635469, 0.4343387, 0.637881, 0.4358031, 0.6403217, 0.4372816,
+  0.6427915, 0.4387744, 0.6452908, 0.4402815, 0.64782, 0.4418031,
+  0.6503795, 0.4433392, 0.6529695, 0.44489, 0.6555906, 0.4464557,
+  0.6582432, 0.4480363, 0.6609275, 0.4496321, 0.6636441, 0.4512431,
+  0.6663934, 0.4528695, 0.6691757, 0.4545114, 0.6719915, 0.4561691,
+  0.6748412, 0.4578427, 0.6777253, 0.4595324, 0.6806442, 0.4612384,
+  0.6835983, 0.4629607, 0.6865881, 0.4646998, 0.6896141, 0.4664557,
+  0.6926767, 0.4682287, 0.6957764, 0.470019, 0.6989137, 0.4718268,
+  0.7020891, 0.4736523, 0.7053031, 0.4754959, 0.7085563, 0.4773578,
+  0.711849, 0.4792382, 0.7151819, 0.4811375, 0.7185556, 0.4830558,
+  0.7219705, 0.4849936, 0.7254272, 0.4869511, 0.727765, 0.4881497,
+  0.7273757, 0.4875132, 0.7269894, 0.4868744, 0.7266063, 0.4862335,
+  0.7262263, 0.4855905, 0.7258496, 0.4849456, 0.725476, 0.4842988,
+  0.7251056, 0.4836502, 0.7247385, 0.4830001, 0.7243746, 0.4823485,
+  0.724014, 0.4816955, 0.7236566, 0.4810412, 0.7233026, 0.4803859,
+  0.7229519, 0.4797296, 0.7226044, 0.4790724, 0.7222604, 0.4784146,
+  0.7219196, 0.4777561, 0.7215822, 0.4770973, 0.7212481, 0.4764381,
+  0.7209174, 0.4757788, 0.72059, 0.4751195, 0.7202659, 0.4744603,
+  0.7199453, 0.4738014, 0.7196279, 0.473143, 0.719314, 0.4724851,
+  0.7190033, 0.471828, 0.718696, 0.4711717, 0.7183921, 0.4705164,
+  0.7180914, 0.4698624, 0.7177941, 0.4692096, 0.7175001, 0.4685584,
+  0.7172095, 0.4679087, 0.7169221, 0.4672608, 0.7166379, 0.4666149,
+  0.7163571, 0.465971, 0.7160795, 0.4653293, 0.7158052, 0.46469,
+  0.715534, 0.4640532, 0.7152661, 0.4634191, 0.7150014, 0.4627878,
+  0.7147399, 0.4621594, 0.7144815, 0.4615342, 0.7142263, 0.4609121,
+  0.7139742, 0.4602935, 0.7137252, 0.4596783, 0.7134792, 0.4590669,
+  0.7132364, 0.4584592, 0.7129966, 0.4578555, 0.7127598, 0.4572558,
+  0.712526, 0.4566603, 0.7122952, 0.4560692, 0.7120673, 0.4554825,
+  0.7118424, 0.4549004, 0.7116203, 0.4543231, 0.7114012, 0.4537506,
+  0.7111849, 0.453183, 0.7109714, 0.4526206, 0.7107608, 0.4520634,
+  0.7105529, 0.4515115, 0.7103478, 0.4509651, 0.7101454, 0.4504242,
+  0.7099458, 0.4498891, 0.7097488, 0.4493597, 0.7095545, 0.4488362,
+  0.7093628, 0.4483188,
+];
+
@@ -1,6 +1,9 @@
 export * from "./conversion_matrices.js";
+export * from "./transfer_luts.js";
 export * from "./spaces.js";
 export * from "./gamut.js";
 export * from "./core.js";
 export * from "./okhsl.js";
+export * from "./palette.js";
+export * from "./transfer.js";
 export * from "./util.js";
@@ -0,0 +1,108 @@
+/** This file is auto-generated by tools/print_matrices.py --split src/matrices */
+
+// linear_A98RGB space
+
+// linear_A98RGB to XYZ (D65) matrices
+
+export const linear_A98RGB_to_XYZ_M = [
+  [0.5766690429101308, 0.18555823790654627, 0.18822864623499472],
+  [0.29734497525053616, 0.627363566255466, 0.07529145849399789],
+  [0.027031361386412378, 0.07068885253582714, 0.9913375368376389],
+];
+
+export const XYZ_to_linear_A98RGB_M = [
+  [2.041587903810746, -0.5650069742788596, -0.3447313507783295],
+  [-0.9692436362808798, 1.8759675015077206, 0.04155505740717561],
+  [0.013444280632031024, -0.11836239223101824, 1.0151749943912054],
+];
+
+// linear_A98RGB to LMS matrices
+
+export const linear_A98RGB_to_LMS_M = [
+  [0.5764322596183941, 0.36991322261987963, 0.053654517761726306],
+  [0.29631647054222465, 0.5916761332521886, 0.11200739620558692],
+  [0.12347825101427762, 0.21949869837199862, 0.6570230506137239],
+];
+
+export const LMS_to_linear_A98RGB_M = [
+  [2.554036838611556, -1.6219761806828696, 0.06793934207131354],
+  [-1.2684379732850315, 2.6097573492876887, -0.3413193760026572],
+  [-0.0562347359374939, -0.5670418395669057, 1.6232765755043994],
+];
+
+// linear_A98RGB coefficients for OKLab gamut approximation
+
+export const OKLab_to_linear_A98RGB_coefficients = [
+  [
+    [-1.5916954144257986, -0.8395798483264382],
+    [
+      2.2691287826839255, 3.129830477854208, 1.4260941854190028,
+      1.1576635558342154, 1.3634535938496974,
+    ],
+  ],
+  [
+    [1.8144407988011027, -1.1944526678052367],
+    [
+      0.7554590284841929, -0.48789280880279834, 0.09919954907563015,
+      0.1382426077559837, -0.16637407925498626,
+    ],
+  ],
+  [
+    [-0.01452942893408306, 2.073564997814518],
+    [
+      1.5501111549451418, -0.054832423447136014, -1.3311999906609997,
+      -0.6049437286547624, 0.05082235202381204,
+    ],
+  ],
+];
+
+// linear_A98RGB max and mean error of the approximated max saturation per channel
+
+export const OKLab_to_linear_A98RGB_coefficients_error = {
+  steps: 1,
+  max: [4.44e-6, 1.63e-9, 2.07e-7],
+  mean: [3.74e-7, 5.45e-10, 3.37e-8],
+};
+
+// linear_A98RGB S_mid and T_mid polynomials of OKHSL
+
+export const OKLab_to_linear_A98RGB_st_mid_coefficients = [
+  [
+    0.1515686746547232, 9.150092823697685, 6.801125622987231,
+    -0.5688666692547535, 0.582318104650019, -9.28535875149209,
+    -11.305985567403232, -0.8481425081995968, 4.1320262346837575,
+    5.541878128255541,
+  ],
+  [
+    0.4341294947472853, 3.9047978857143595, -3.18567605133167,
+    -0.09465274542037841, 1.8917300372905044, -4.206841561891825,
+    3.870583605959765, 0.5031866624093495, -1.1623104080868543,
+    1.4930406201163415,
+  ],
+];
+
+// linear_A98RGB to linear RGB matrices, with chromatic adaptation folded in
+
+export const linear_A98RGB_to_linear_sRGB_M = [
+  [1.3983557439607786, -0.3983557439607784, 0.0],
+  [-1.3856103764364747e-16, 0.9999999999999999, 1.3877787807814457e-17],
+  [-6.938893903907228e-18, -0.042928989294473266, 1.0429289892944733],
+];
+
+export const linear_A98RGB_to_linear_DisplayP3_M = [
+  [1.1500944181410182, -0.1500944181410184, -1.1102230246251565e-16],
+  [0.046417298629418395, 0.9535827013705814, -6.938893903907228e-18],
+  [0.023887594790839052, 0.02650477632633013, 0.9496076288828309],
+];
+
+export const linear_A98RGB_to_linear_Rec2020_M = [
+  [0.8773338416636568, 0.07749370651571999, 0.04517245182062313],
+  [0.09662259146620375, 0.8915273202441806, 0.011850088289615712],
+  [0.022921062702848393, 0.04303668501067931, 0.9340422522864724],
+];
+
+export const linear_A98RGB_to_linear_ProPhotoRGB_M = [
+  [0.7401175018047795, 0.11327951328898118, 0.1466029849062397],
+  [0.1375504646980264, 0.8330770802694839, 0.029372455032489787],
+  [0.023597729908717675, 0.07378347703906654, 0.9026187930522158],
+];
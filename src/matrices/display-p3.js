@@ -0,0 +1,108 @@
+/** This file is auto-generated by tools/print_matrices.py --split src/matrices */
+
+// linear_DisplayP3 space
+
+// linear_DisplayP3 to XYZ (D65) matrices
+
+export const linear_DisplayP3_to_XYZ_M = [
+  [0.48657094864821626, 0.26566769316909294, 0.1982172852343625],
+  [0.22897456406974884, 0.6917385218365062, 0.079286914093745],
+  [0.0, 0.045113381858902575, 1.0439443689009757],
+];
+
+export const XYZ_to_linear_DisplayP3_M = [
+  [2.4934969119414245, -0.9313836179191236, -0.40271078445071684],
+  [-0.829488969561575, 1.7626640603183468, 0.02362468584194359],
+  [0.035845830243784335, -0.07617238926804171, 0.9568845240076873],
+];
+
+// linear_DisplayP3 to LMS matrices
+
+export const linear_DisplayP3_to_LMS_M = [
+  [0.48137985274995443, 0.4621183710113181, 0.05650177623872757],
+  [0.22883194181124475, 0.6532168193835676, 0.11795123880518778],
+  [0.08394575232299319, 0.22416527097756642, 0.6918889766994405],
+];
+
+export const LMS_to_linear_DisplayP3_M = [
+  [3.1277689713618737, -2.2571357625916395, 0.1293667912297651],
+  [-1.091009018437798, 2.413331710306923, -0.3223226918691248],
+  [-0.02601080193857041, -0.5080413317041669, 1.5340521336427373],
+];
+
+// linear_DisplayP3 coefficients for OKLab gamut approximation
+
+export const OKLab_to_linear_DisplayP3_coefficients = [
+  [
+    [-1.7723439275129804, -0.8207587433674068],
+    [
+      3.0655383776740712, 4.850774766861289, 2.170391228588169,
+      1.9889988629068966, 2.318674112913799,
+    ],
+  ],
+  [
+    [1.8031987175305477, -1.1932813966558917],
+    [
+      0.785986991117241, -0.48301887731220305, 0.1269537528410884,
+      0.15434100134244236, -0.18801574739070043,
+    ],
+  ],
+  [
+    [0.08970487824467606, 1.9032774657416118],
+    [
+      1.5634048474400246, -0.03752356642820185, -1.325410878723415,
+      -0.582197351108397, 0.033280197615848106,
+    ],
+  ],
+];
+
+// linear_DisplayP3 max and mean error of the approximated max saturation per channel
+
+export const OKLab_to_linear_DisplayP3_coefficients_error = {
+  steps: 1,
+  max: [0.000327, 5.97e-10, 7.52e-8],
+  mean: [1.01e-5, 1.9e-10, 1.22e-8],
+};
+
+// linear_DisplayP3 S_mid and T_mid polynomials of OKHSL
+
+export const OKLab_to_linear_DisplayP3_st_mid_coefficients = [
+  [
+    0.18631867003057767, 12.249797119791381, 9.876159949457232,
+    -1.9071658741540485, 0.28313447417463106, -14.197370748255963,
+    -24.202966369306175, -5.445873757878934, 14.212398439687545,
+    13.139742043484588,
+  ],
+  [
+    0.4313664716771686, 3.571711810464822, -2.69949278107272,
+    0.22809095409380015, 2.1464589600369166, -3.335001753742928,
+    3.690081854023788, 0.4435204576664547, -1.0938307937320577,
+    1.153318045096012,
+  ],
+];
+
+// linear_DisplayP3 to linear RGB matrices, with chromatic adaptation folded in
+
+export const linear_DisplayP3_to_linear_sRGB_M = [
+  [1.2249401762805596, -0.22494017628055993, 0.0],
+  [-0.04205695470968818, 1.0420569547096883, -3.469446951953614e-17],
+  [-0.019637554590334436, -0.07863604555063189, 1.0982736001409663],
+];
+
+export const linear_DisplayP3_to_linear_Rec2020_M = [
+  [0.7538330343617217, 0.19859736905261627, 0.047569596585661844],
+  [0.045743848965358325, 0.9417772198116936, 0.01247893122294813],
+  [-0.0012103403545183251, 0.017601717301089892, 0.9836086230534283],
+];
+
+export const linear_DisplayP3_to_linear_A98RGB_M = [
+  [0.8640051374740483, 0.13599486252595158, 5.551115123125783e-17],
+  [-0.04205695470968818, 1.0420569547096883, -3.469446951953614e-17],
+  [-0.02056038078232985, -0.032506138045508, 1.0530665188278379],
+];
+
+export const linear_DisplayP3_to_linear_ProPhotoRGB_M = [
+  [0.6316869193403591, 0.2139303856946574, 0.1543826949649839],
+  [0.08320371426648465, 0.8858651367630241, 0.030931148970491238],
+  [-0.001272734564738806, 0.05075510433665735, 0.9505176302280814],
+];
@@ -0,0 +1,108 @@
+/** This file is auto-generated by tools/print_matrices.py --split src/matrices */
+
+// linear_ProPhotoRGB space
+
+// linear_ProPhotoRGB to XYZ (D50) matrices
+
+export const linear_ProPhotoRGB_to_XYZ_M = [
+  [0.7977666449006423, 0.13518129740053308, 0.0313477341283922],
+  [0.2880748288194013, 0.711835234241873, 8.993693872564e-5],
+  [0.0, 0.0, 0.8251046025104602],
+];
+
+export const XYZ_to_linear_ProPhotoRGB_M = [
+  [1.3457868816471583, -0.25557208737979464, -0.05110186497554526],
+  [-0.5446307051249019, 1.5082477428451468, 0.02052744743642139],
+  [0.0, 0.0, 1.2119675456389452],
+];
+
+// linear_ProPhotoRGB to LMS matrices
+
+export const linear_ProPhotoRGB_to_LMS_M = [
+  [0.7154484605655532, 0.35279155007721175, -0.06824001064276528],
+  [0.27441164900156706, 0.6677976498412368, 0.05779070115719622],
+  [0.10978443261622936, 0.18619829115002015, 0.7040172762337504],
+];
+
+export const LMS_to_linear_ProPhotoRGB_M = [
+  [1.7383551481157213, -0.9879509427514458, 0.24959579463572504],
+  [-0.7070494015329266, 1.934370044440138, -0.22732064290721157],
+  [-0.08407882206239632, -0.3575406052114133, 1.4416194272738097],
+];
+
+// linear_ProPhotoRGB coefficients for OKLab gamut approximation
+
+export const OKLab_to_linear_ProPhotoRGB_coefficients = [
+  [
+    [-1.1186713796652372, 0.011574875053294414],
+    [
+      68.06787046924094, 140.6370870421406, -1.5538024885635915,
+      73.17257587955058, -1.4601712527859658,
+    ],
+  ],
+  [
+    [6.872475573760862, -16.341134102486432],
+    [
+      3.2885956561375544, -2.021035629437008, 2.506290147499387,
+      -0.8944297290019946, -2.046210509675173,
+    ],
+  ],
+  [
+    [0.1680216312422894, 2.512073213160233],
+    [
+      1.938056700940937, -0.1194121513288262, -1.6801601786829106,
+      -0.7830309568631597, 0.11201603090337163,
+    ],
+  ],
+];
+
+// linear_ProPhotoRGB max and mean error of the approximated max saturation per channel
+
+export const OKLab_to_linear_ProPhotoRGB_coefficients_error = {
+  steps: 1,
+  max: [0.00686, 0.000386, 1.2e-6],
+  mean: [3.89e-5, 0.000103, 1.72e-7],
+};
+
+// linear_ProPhotoRGB S_mid and T_mid polynomials of OKHSL
+
+export const OKLab_to_linear_ProPhotoRGB_st_mid_coefficients = [
+  [
+    0.1785305095110763, 8.084578857471351, 6.051190500248492,
+    2.5025280672501897, 1.7268494561360013, -11.887708026470936,
+    -5.8430451460247115, -2.889198105645767, -2.392139221632959,
+    6.460279078375118,
+  ],
+  [
+    0.43407587687489363, 2.7363751530071863, -2.4912583466100373,
+    -0.3145575420010778, 1.1160267233098429, -2.5896467668440653,
+    2.467909273602559, 0.5445350394756019, -0.7027660673972345,
+    0.5308300428262613,
+  ],
+];
+
+// linear_ProPhotoRGB to linear RGB matrices, with chromatic adaptation folded in
+
+export const linear_ProPhotoRGB_to_linear_sRGB_M = [
+  [2.0343808495169955, -0.7276357899341349, -0.30674505958286163],
+  [-0.2288257316330504, 1.231742541190105, -0.002916809557054527],
+  [-0.008558828783917418, -0.15326670213803723, 1.1618255309219545],
+];
+
+export const linear_ProPhotoRGB_to_linear_DisplayP3_M = [
+  [1.6325756087069174, -0.3797716184825989, -0.2528039902243193],
+  [-0.1537004023375508, 1.1667025472425014, -0.013002144904950858],
+  [0.010393195296765738, -0.0628073126495944, 1.0524141173528287],
+];
+
+export const linear_ProPhotoRGB_to_linear_Rec2020_M = [
+  [1.2006593295174075, -0.05756805370122375, -0.1430912758161844],
+  [-0.0699415495588851, 1.080617897597214, -0.010676348038328974],
+  [0.00554147334294747, -0.04078219298657951, 1.035240719643632],
+];
+
+export const linear_ProPhotoRGB_to_linear_A98RGB_M = [
+  [1.38965124815152, -0.16945907691487802, -0.22019217123664225],
+  [-0.2288257316330504, 1.231742541190105, -0.002916809557054527],
+  [-0.017625443684260677, -0.09625702306122665, 1.1138824667454872],
+];
@@ -0,0 +1,108 @@
+/** This file is auto-generated by tools/print_matrices.py --split src/matrices */
+
+// linear_Rec2020 space
+
+// linear_Rec2020 to XYZ (D65) matrices
+
+export const linear_Rec2020_to_XYZ_M = [
+  [0.6369580483012913, 0.14461690358620838, 0.16888097516417205],
+  [0.26270021201126703, 0.677998071518871, 0.059301716469861945],
+  [0.0, 0.028072693049087508, 1.0609850577107909],
+];
+
+export const XYZ_to_linear_Rec2020_M = [
+  [1.7166511879712676, -0.3556707837763924, -0.2533662813736598],
+  [-0.666684351832489, 1.616481236634939, 0.01576854581391113],
+  [0.017639857445310915, -0.042770613257808655, 0.942103121235474],
+];
+
+// linear_Rec2020 to LMS matrices
+
+export const linear_Rec2020_to_LMS_M = [
+  [0.6167557848654444, 0.3601984012264634, 0.023045813908092266],
+  [0.26513305939263676, 0.6358393720678492, 0.09902756853951414],
+  [0.10010262952034828, 0.20390652261661452, 0.6959908478630372],
+];
+
+export const LMS_to_linear_Rec2020_M = [
+  [2.1399067304346513, -1.246389493760618, 0.10648276332596689],
+  [-0.8847358357577675, 2.1632309383612007, -0.27849510260343363],
+  [-0.04857374640044396, -0.45450314971409633, 1.5030768961145404],
+];
+
+// linear_Rec2020 coefficients for OKLab gamut approximation
+
+export const OKLab_to_linear_Rec2020_coefficients = [
+  [
+    [-1.3683489920695084, -0.4666477292401159],
+    [
+      6.453444279433296, 11.179759749877057, 3.7164025468775352,
+      5.086745856787387, 3.8846747338283327,
+    ],
+  ],
+  [
+    [2.01150796193428, -2.0379095965347],
+    [
+      0.9864450167496069, -0.6579210622753912, 0.28716974174265975,
+      0.2008454654526125, -0.3607882951692005,
+    ],
+  ],
+  [
+    [0.06454093208719965, 2.2970933629671717],
+    [
+      1.7822722002966511, -0.06902276996914065, -1.53732053978465,
+      -0.7070147842646063, 0.06466835622466632,
+    ],
+  ],
+];
+
+// linear_Rec2020 max and mean error of the approximated max saturation per channel
+
+export const OKLab_to_linear_Rec2020_coefficients_error = {
+  steps: 1,
+  max: [0.000434, 0.122, 5.1e-7],
+  mean: [1.05e-5, 0.000157, 7.89e-8],
+};
+
+// linear_Rec2020 S_mid and T_mid polynomials of OKHSL
+
+export const OKLab_to_linear_Rec2020_st_mid_coefficients = [
+  [
+    0.17909348211564619, 9.185268708823825, 7.263929073720355,
+    0.7542540121836959, -0.30166358055017506, -12.478710037696803,
+    -10.227145139204097, -1.9506149794853547, 3.340090255342907,
+    7.32561294665993,
+  ],
+  [
+    0.45489779063616287, 3.4983718825787253, -2.9761222107588594,
+    -0.2710664564820682, 1.6129610604145517, -3.7766577630825315,
+    3.3132053952081555, 0.6071596421229773, -1.0226922347649614,
+    1.1650429299755305,
+  ],
+];
+
+// linear_Rec2020 to linear RGB matrices, with chromatic adaptation folded in
+
+export const linear_Rec2020_to_linear_sRGB_M = [
+  [1.6604910021084343, -0.5876411387885496, -0.0728498633198848],
+  [-0.12455047452159085, 1.1328998971259603, -0.008349422604369473],
+  [-0.018150763354905307, -0.10057889800800737, 1.1187296613629127],
+];
+
+export const linear_Rec2020_to_linear_DisplayP3_M = [
+  [1.343578252584332, -0.28217967052613574, -0.06139858205819637],
+  [-0.06529745278911964, 1.0757879158485744, -0.01049046305945497],
+  [0.0028217872617009553, -0.01959849452449406, 1.0167767072627931],
+];
+
+export const linear_Rec2020_to_linear_A98RGB_M = [
+  [1.1519783947159163, -0.09750305530240859, -0.054475339413507684],
+  [-0.12455047452159085, 1.1328998971259603, -0.008349422604369473],
+  [-0.022530382781055906, -0.04980650742838877, 1.0723368902094446],
+];
+
+export const linear_Rec2020_to_linear_ProPhotoRGB_M = [
+  [0.8351873331297236, 0.04886884858605711, 0.11594381828421954],
+  [0.05403324519953381, 0.9289184085692044, 0.017048346231262015],
+  [-0.0023420389707253897, 0.03633215316169466, 0.9660098858090307],
+];
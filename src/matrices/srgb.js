@@ -0,0 +1,104 @@
+/** This file is auto-generated by tools/print_matrices.py --split src/matrices */
+
+// linear_sRGB space
+
+// linear_sRGB to XYZ (D65) matrices
+
+export const linear_sRGB_to_XYZ_M = [
+  [0.4123907992659595, 0.35758433938387796, 0.1804807884018343],
+  [0.21263900587151036, 0.7151686787677559, 0.07219231536073371],
+  [0.01933081871559185, 0.11919477979462599, 0.9505321522496606],
+];
+
+export const XYZ_to_linear_sRGB_M = [
+  [3.2409699419045213, -1.5373831775700935, -0.4986107602930033],
+  [-0.9692436362808798, 1.8759675015077206, 0.04155505740717561],
+  [0.05563007969699361, -0.20397695888897657, 1.0569715142428786],
+];
+
+// linear_sRGB to LMS matrices
+
+export const linear_sRGB_to_LMS_M = [
+  [0.4122214694707629, 0.5363325372617349, 0.051445993267502196],
+  [0.2119034958178251, 0.6806995506452345, 0.10739695353694051],
+  [0.08830245919005637, 0.2817188391361215, 0.6299787016738223],
+];
+
+export const LMS_to_linear_sRGB_M = [
+  [4.076741636075959, -3.307711539258062, 0.2309699031821041],
+  [-1.2684379732850313, 2.6097573492876878, -0.3413193760026569],
+  [-0.004196076138675526, -0.703418617935936, 1.7076146940746113],
+];
+
+// linear_sRGB coefficients for OKLab gamut approximation
+
+export const OKLab_to_linear_sRGB_coefficients = [
+  [
+    [-1.881703099326589, -0.8093650129914314],
+    [
+      2.9891157406060245, 4.96334598553074, 2.206639458668394,
+      2.1032506646275313, 2.4558850066611626,
+    ],
+  ],
+  [
+    [1.8144407988010973, -1.1944526678052334],
+    [
+      0.7554589746731846, -0.4878927163778485, 0.09919949472127884,
+      0.13824256155269649, -0.1663740069568356,
+    ],
+  ],
+  [
+    [0.13110757611181065, 1.8133397092666077],
+    [
+      1.4013440255372653, -0.014161344368060245, -1.194898981054734,
+      -0.531950504704548, 0.013140382333963183,
+    ],
+  ],
+];
+
+// linear_sRGB max and mean error of the approximated max saturation per channel
+
+export const OKLab_to_linear_sRGB_coefficients_error = {
+  steps: 1,
+  max: [0.00128, 0.105, 7.38e-8],
+  mean: [2.18e-5, 0.000109, 1.15e-8],
+};
+
+// linear_sRGB S_mid and T_mid polynomials of OKHSL
+
+export const OKLab_to_linear_sRGB_st_mid_coefficients = [
+  [
+    0.11516993, 7.4477897, 4.1590124, -2.19557347, 1.75198401, -2.13704948,
+    -10.02301043, -4.24894561, 5.38770819, 4.69891013,
+  ],
+  [
+    0.11239642, 1.6132032, -0.68124379, 0.40370612, 0.90148123, -0.27087943,
+    0.6122399, 0.00299215, -0.45399568, -0.14661872,
+  ],
+];
+
+// linear_sRGB to linear RGB matrices, with chromatic adaptation folded in
+
+export const linear_sRGB_to_linear_DisplayP3_M = [
+  [0.8224619687143623, 0.17753803128563772, 0.0],
+  [0.03319419885096158, 0.9668058011490382, -1.3877787807814457e-17],
+  [0.017082630721120033, 0.07239744066396347, 0.9105199286149166],
+];
+
+export const linear_sRGB_to_linear_Rec2020_M = [
+  [0.627403895934699, 0.3292830383778836, 0.043313065687417246],
+  [0.06909728935823205, 0.9195403950754587, 0.011362315566309173],
+  [0.01639143887515028, 0.08801330787722576, 0.895595253247624],
+];
+
+export const linear_sRGB_to_linear_A98RGB_M = [
+  [0.7151256068556248, 0.2848743931443754, 5.551115123125783e-17],
+  [-5.193328406205566e-17, 1.0, -1.3877787807814457e-17],
+  [-3.469446951953614e-18, 0.04116194845011846, 0.9588380515498816],
+];
+
+export const linear_sRGB_to_linear_ProPhotoRGB_M = [
+  [0.5292769776226117, 0.330154501978493, 0.14056852039889559],
+  [0.09836585954044925, 0.8734707129069617, 0.02816342755258901],
+  [0.016875340921386848, 0.11765941425612084, 0.8654652448224923],
+];
@@ -1,6 +1,7 @@
 import { vec3, constrainAngle as constrain } from "./util.js";
-import { OKLab_to } from "./core.js";
-import { sRGBGamut } from "./spaces.js";
+import { OKLab_to } from "./convert.js";
+import { sRGBGamut } from "./spaces/srgb.js";
+import { OKLab_to_linear_sRGB_st_mid_coefficients } from "./matrices/srgb.js";
 import {
   findCuspOKLCH,
   findGamutIntersectionOKLCH,
@@ -51,40 +52,24 @@ const toScaleL = (lv, cv, a_, b_, lmsToRgb) => {
   );
 };
 
-const computeStMid = (a, b, out) => {
+const stMidPolynomial = (k, a, b) =>
+  k[0] +
+  1.0 /
+    (k[1] +
+      k[2] * b +
+      a *
+        (k[3] +
+          k[4] * b +
+          a * (k[5] + k[6] * b + a * (k[7] + k[8] * b + k[9] * a))));
+
+const computeStMid = (a, b, stMidCoeff, out) => {
   // Returns a smooth approximation of the location of the cusp.
   //
-  // This polynomial was created by an optimization process.
-  // It has been designed so that S_mid < S_max and T_mid < T_max.
-
-  let s =
-    0.11516993 +
-    1.0 /
-      (7.4477897 +
-        4.1590124 * b +
-        a *
-          (-2.19557347 +
-            1.75198401 * b +
-            a *
-              (-2.13704948 -
-                10.02301043 * b +
-                a * (-4.24894561 + 5.38770819 * b + 4.69891013 * a))));
-
-  let t =
-    0.11239642 +
-    1.0 /
-      (1.6132032 -
-        0.68124379 * b +
-        a *
-          (0.40370612 +
-            0.90148123 * b +
-            a *
-              (-0.27087943 +
-                0.6122399 * b +
-                a * (0.00299215 - 0.45399568 * b - 0.14661872 * a))));
-
-  out[0] = s;
-  out[1] = t;
+  // These polynomials were created by an optimization process, see `fit_st_mid`
+  // in tools/print_matrices.py. They have been designed so that S_mid < S_max
+  // and T_mid < T_max.
+  out[0] = stMidPolynomial(stMidCoeff[0], a, b);
+  out[1] = stMidPolynomial(stMidCoeff[1], a, b);
 };
 
 const getCs = (l, a, b, cusp, gamut) => {
@@ -96,8 +81,14 @@ const getCs = (l, a, b, cusp, gamut) => {
   // Scale factor to compensate for the curved part of gamut shape:
   let k = cMax / Math.min(l * stMax[0], (1 - l) * stMax[1]);
 
+  // gamuts without their own polynomials use the ones fitted for sRGB
   const stMid = tmp2B;
-  computeStMid(a, b, stMid);
+  computeStMid(
+    a,
+    b,
+    gamut.stMidCoefficients || OKLab_to_linear_sRGB_st_mid_coefficients,
+    stMid
+  );
 
   // Use a soft minimum function, instead of a sharp triangle shape to get a smooth value for chroma.
   let ca = l * stMid[0];
@@ -0,0 +1,264 @@
+// A k-d tree over the colors of a palette in OKLab, for finding the nearest
+// palette colors with the deltaEOK metric without measuring every color.
+//
+// The tree is stored flat: a range [lo, hi) of the tree arrays is a node whose
+// point is its middle entry, mid = (lo + hi) >> 1, split along axes[mid], with
+// the points below the split in [lo, mid) and the rest in [mid + 1, hi).
+//
+// Palettes of at most LINEAR_SIZE colors are not split at all, and are searched
+// linearly, which is faster than walking a tree that small.
+
+const coordinate = (palette, i, axis) => palette[i][axis];
+
+const partition = (palette, order, lo, hi, k, axis) => {
+  // Quickselect, reorders order[lo, hi) so that order[k] is the point it would
+  // hold if sorted along the axis, with smaller points before it
+  while (hi - lo > 1) {
+    const pivot = coordinate(palette, order[(lo + hi) >> 1], axis);
+    let i = lo;
+    let j = hi - 1;
+    while (i <= j) {
+      while (coordinate(palette, order[i], axis) < pivot) i++;
+      while (coordinate(palette, order[j], axis) > pivot) j--;
+      if (i <= j) {
+        const swap = order[i];
+        order[i] = order[j];
+        order[j] = swap;
+        i++;
+        j--;
+      }
+    }
+    if (k <= j) hi = j + 1;
+    else if (k >= i) lo = i;
+    else return;
+  }
+};
+
+const build = (palette, order, axes, lo, hi) => {
+  if (hi - lo < 2) return;
+  // split along the axis the points of the node spread the most on
+  let axis = 0;
+  let spread = -1;
+  for (let c = 0; c < 3; c++) {
+    let min = Infinity;
+    let max = -Infinity;
+    for (let i = lo; i < hi; i++) {
+      const v = coordinate(palette, order[i], c);
+      if (v < min) min = v;
+      if (v > max) max = v;
+    }
+    if (max - min > spread) {
+      spread = max - min;
+      axis = c;
+    }
+  }
+  const mid = (lo + hi) >> 1;
+  partition(palette, order, lo, hi, mid, axis);
+  axes[mid] = axis;
+  build(palette, order, axes, lo, mid);
+  build(palette, order, axes, mid + 1, hi);
+};
+
+// below about this many colors a linear search beats the tree
+const LINEAR_SIZE = 128;
+
+export const createPaletteIndex = (palette) => {
+  // Builds the index of a list of OKLab colors, once per palette
+  const size = palette.length;
+  const order = new Int32Array(size);
+  for (let i = 0; i < size; i++) order[i] = i;
+  const axes = new Uint8Array(size);
+  if (size > LINEAR_SIZE) build(palette, order, axes, 0, size);
+  const points = new Float64Array(size * 3);
+  for (let i = 0; i < size; i++) {
+    const color = palette[order[i]];
+    points[i * 3] = color[0];
+    points[i * 3 + 1] = color[1];
+    points[i * 3 + 2] = color[2];
+  }
+  return { size, order, axes, points };
+};
+
+// nodes of at most this many points are searched linearly
+const LEAF_SIZE = 8;
+
+// state of the current search, so that queries do not allocate
+let bestIndex = -1;
+let bestDistance = Infinity;
+
+const visitNearest = (index, i, l, a, b) => {
+  const points = index.points;
+  const dL = l - points[i * 3];
+  const da = a - points[i * 3 + 1];
+  const db = b - points[i * 3 + 2];
+  const distance = dL * dL + da * da + db * db;
+  // ties go to the earliest palette color, the same as a linear search
+  if (
+    distance < bestDistance ||
+    (distance === bestDistance && index.order[i] < index.order[bestIndex])
+  ) {
+    bestDistance = distance;
+    bestIndex = i;
+  }
+};
+
+const searchNearest = (index, lo, hi, l, a, b) => {
+  if (hi - lo <= LEAF_SIZE) {
+    for (let i = lo; i < hi; i++) visitNearest(index, i, l, a, b);
+    return;
+  }
+  const mid = (lo + hi) >> 1;
+  visitNearest(index, mid, l, a, b);
+  const axis = index.axes[mid];
+  const d =
+    (axis === 0 ? l : axis === 1 ? a : b) - index.points[mid * 3 + axis];
+  // search the side of the split the color is on first, then the other side
+  // only if it can still hold a color as close
+  if (d < 0) {
+    searchNearest(index, lo, mid, l, a, b);
+    if (d * d <= bestDistance) searchNearest(index, mid + 1, hi, l, a, b);
+  } else {
+    searchNearest(index, mid + 1, hi, l, a, b);
+    if (d * d <= bestDistance) searchNearest(index, lo, mid, l, a, b);
+  }
+};
+
+const scanNearest = (index, l, a, b) => {
+  // a linear search of a palette that was not split, whose points are in
+  // palette order, so the first of equally near colors is kept
+  const points = index.points;
+  let best = -1;
+  let distance = Infinity;
+  for (let i = 0, j = 0; i < index.size; i++, j += 3) {
+    const dL = l - points[j];
+    const da = a - points[j + 1];
+    const db = b - points[j + 2];
+    const d = dL * dL + da * da + db * db;
+    if (d < distance) {
+      distance = d;
+      best = i;
+    }
+  }
+  return best;
+};
+
+export const findNearestInPalette = (oklab, index) => {
+  // The index in the palette of the color nearest to oklab, or -1 if the
+  // palette is empty
+  if (index.size <= LINEAR_SIZE) {
+    return scanNearest(index, oklab[0], oklab[1], oklab[2]);
+  }
+  bestIndex = -1;
+  bestDistance = Infinity;
+  searchNearest(index, 0, index.size, oklab[0], oklab[1], oklab[2]);
+  return bestIndex === -1 ? -1 : index.order[bestIndex];
+};
+
+export const findNearestInPaletteFlat = (
+  input,
+  index,
+  out = new Int32Array(input.length / 3)
+) => {
+  // findNearestInPalette for every color of a flat array of OKLab colors
+  // (such as a Float32Array of an image), writing the palette indices to out
+  const linear = index.size <= LINEAR_SIZE;
+  for (let i = 0, n = input.length / 3; i < n; i++) {
+    if (linear) {
+      out[i] = scanNearest(
+        index,
+        input[i * 3],
+        input[i * 3 + 1],
+        input[i * 3 + 2]
+      );
+      continue;
+    }
+    bestIndex = -1;
+    bestDistance = Infinity;
+    searchNearest(
+      index,
+      0,
+      index.size,
+      input[i * 3],
+      input[i * 3 + 1],
+      input[i * 3 + 2]
+    );
+    out[i] = bestIndex === -1 ? -1 : index.order[bestIndex];
+  }
+  return out;
+};
+
+// state of the current k nearest search, the sorted outputs hold squared
+// distances while searching
+let nearestCount = 0;
+let nearestIndices = null;
+let nearestDistances = null;
+
+const isCloser = (distance, paletteIndex, i) =>
+  distance < nearestDistances[i] ||
+  (distance === nearestDistances[i] && paletteIndex < nearestIndices[i]);
+
+const insertNearest = (index, i, l, a, b) => {
+  // inserts the point i into the sorted outputs if it is one of the k nearest
+  const points = index.points;
+  const dL = l - points[i * 3];
+  const da = a - points[i * 3 + 1];
+  const db = b - points[i * 3 + 2];
+  const distance = dL * dL + da * da + db * db;
+  const paletteIndex = index.order[i];
+  let j = nearestCount - 1;
+  if (isCloser(distance, paletteIndex, j)) {
+    while (j > 0 && isCloser(distance, paletteIndex, j - 1)) {
+      nearestDistances[j] = nearestDistances[j - 1];
+      nearestIndices[j] = nearestIndices[j - 1];
+      j--;
+    }
+    nearestDistances[j] = distance;
+    nearestIndices[j] = paletteIndex;
+  }
+};
+
+const searchKNearest = (index, lo, hi, l, a, b) => {
+  if (hi - lo <= LEAF_SIZE || index.size <= LINEAR_SIZE) {
+    for (let i = lo; i < hi; i++) insertNearest(index, i, l, a, b);
+    return;
+  }
+  const mid = (lo + hi) >> 1;
+  insertNearest(index, mid, l, a, b);
+  const axis = index.axes[mid];
+  const d =
+    (axis === 0 ? l : axis === 1 ? a : b) - index.points[mid * 3 + axis];
+  if (d < 0) {
+    searchKNearest(index, lo, mid, l, a, b);
+    if (d * d <= nearestDistances[nearestCount - 1])
+      searchKNearest(index, mid + 1, hi, l, a, b);
+  } else {
+    searchKNearest(index, mid + 1, hi, l, a, b);
+    if (d * d <= nearestDistances[nearestCount - 1])
+      searchKNearest(index, lo, mid, l, a, b);
+  }
+};
+
+export const findKNearestInPalette = (
+  oklab,
+  index,
+  k,
+  outIndices = new Int32Array(k),
+  outDistances = new Float64Array(k)
+) => {
+  // The indices in the palette of the k colors nearest to oklab, nearest
+  // first, with their deltaEOK in outDistances. Pass both outputs to avoid
+  // allocating. If the palette has fewer than k colors, the rest of the
+  // indices are -1 and their distances Infinity.
+  if (k <= 0) return outIndices;
+  for (let i = 0; i < k; i++) {
+    outIndices[i] = -1;
+    outDistances[i] = Infinity;
+  }
+  nearestCount = k;
+  nearestIndices = outIndices;
+  nearestDistances = outDistances;
+  searchKNearest(index, 0, index.size, oklab[0], oklab[1], oklab[2]);
+  nearestIndices = nearestDistances = null;
+  for (let i = 0; i < k; i++) outDistances[i] = Math.sqrt(outDistances[i]);
+  return outIndices;
+};
@@ -0,0 +1,602 @@
+/** This file is auto-generated by tools/print_matrices.py --saturation-pieces */
+
+// linear_sRGB max saturation, 43 pieces of degree 4 within 1e-05
+
+export const OKLab_to_linear_sRGB_saturation_pieces = {
+  degree: 4,
+  starts: [
+    0, 0.3588335436542142, 0.43897935069743743, 0.5191251577406607,
+    0.6794167718271071, 1, 1.2828924614899737, 1.4243386922349606,
+    1.5657849229799472, 1.6743386922349606, 1.7828924614899737, 2,
+    2.45282212613785, 2.5660276576723122, 2.6792331892067747, 2.792438720741237,
+    2.8490414865084683, 2.877342869392084, 2.891493560833892,
+    2.8985689065547957, 2.9021065794152476, 2.9056442522756996,
+    2.907118560833892, 2.90748713797344, 2.9076714265432138, 2.907763570828101,
+    2.907855715112988, 2.9078787511842097, 2.9078902692198207,
+    2.907896028237626, 2.9079017872554314, 2.907947859397875,
+    2.9080400036827623, 2.908224292252536, 2.908592869392084,
+    2.9115414865084683, 2.917438720741237, 2.9292331892067747, 2.95282212613785,
+    3, 3.25, 3.5, 3.75,
+  ],
+  cells: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1,
+    1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 4, 4, 4, 4, 4, 4,
+    4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5,
+    5, 5, 5, 5, 5, 5, 5, 5, 6, 6, 6, 6, 6, 6, 6, 6, 6, 7, 7, 7, 7, 7, 7, 7, 7,
+    7, 8, 8, 8, 8, 8, 8, 8, 9, 9, 9, 9, 9, 9, 9, 10, 10, 10, 10, 10, 10, 10, 10,
+    10, 10, 10, 10, 10, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11,
+    11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 12, 12, 12, 12,
+    12, 12, 12, 12, 13, 13, 13, 13, 13, 13, 13, 14, 14, 14, 14, 14, 14, 14, 15,
+    15, 15, 15, 16, 16, 17, 21, 36, 37, 38, 38, 38, 39, 39, 39, 39, 39, 39, 39,
+    39, 39, 39, 39, 39, 39, 39, 39, 39, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40,
+    40, 40, 40, 40, 40, 40, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41,
+    41, 41, 41, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42,
+  ],
+  coefficients: [
+    -0.25235546129115016, 0.9676346010537918, 0.39973647133490936,
+    0.00765124229309215, 0.1238233803106558, 0.03406963349806438,
+    0.06167821456741606, -0.5539426600393894, 0.8325548206505595,
+    0.3629307841012666, -0.5322596676774246, 0.961063544269894,
+    -1.7128386413418286, 3.0712189862537835, -0.6770845239912311,
+    0.7359052570620542, 0.2982926743981382, -0.3170420674397544,
+    0.48576995319890826, -0.685781712621453, 1.0190658342307166,
+    -0.8286968174802786, 0.5596977619198221, 0.24481682217506434,
+    -0.1614201366487919, 0.22861673046055173, -0.2415039279548932,
+    0.3149083456703797, -0.9758018155086192, 0.21865684725176707,
+    0.20892470461106388, -0.04442707250236408, 0.11371180111205584,
+    -0.04949186666306558, 0.10030657005403913, -0.982403508456658,
+    -0.186770839726251, 0.20843860377663534, 0.04189925606794637,
+    0.11252073919894388, 0.045635764070533595, 0.09627271842316025,
+    -0.87494137566777, -0.4842288602970606, 0.23493838541369258,
+    0.13322773906992444, 0.1929024489117837, 0.1809680757899092,
+    0.2340611776389048, -0.7139200052110801, -0.7002272675063513,
+    0.28921737430340566, 0.2894230795913624, 0.433787314227929,
+    0.6088960319391298, 0.8921184059537095, -0.5245963457077665,
+    -0.8513510874310654, 0.2867759012085485, -0.4192374104458271,
+    0.8159439890195184, -1.662885555987925, 3.4458370700963132,
+    -0.3524702680493503, -0.9358230121883193, 0.2285853072797576,
+    -0.21614425260140663, 0.3394071457245492, -0.4770275474463189,
+    0.7364722461240435, -0.1348463723568473, -0.9908665176814678,
+    0.1934149271701366, -0.10906073631096042, 0.1678020951016875,
+    -0.16473660227999232, 0.22632149321412803, 0.33881815834514184,
+    -0.9408518775958341, 0.17000834893686687, 0.00010621736051785041,
+    0.0902271659202173, 0.0009686392926803293, 0.0862140389658105,
+    0.7201422841208563, -0.6938264124557351, 0.19133837301338613,
+    0.10355675327467612, 0.16446387851008382, 0.1612720355516646,
+    0.22946422890854545, 0.853749583978131, -0.5206838271515336,
+    0.22391145136088042, 0.2057230043051015, 0.33401181265514285,
+    0.5021603284511367, 0.8510486969025879, 0.9398222435985716,
+    -0.34166379737593955, 0.283221461595134, 0.4278063187974912,
+    0.9325351914878981, 2.3860805775851768, 6.634667787767144,
+    0.9767483720032534, -0.21438894045401263, 0.3641903737832041,
+    0.8854285467138985, 3.217993178582085, 15.749245970729294,
+    89.54573738341874, 0.987633088382516, -0.15678291594435087,
+    0.43162470643399187, 1.5294872975608929, 9.57013944613891,
+    91.11513227025266, 1047.7024666502869, 0.9915604496627096,
+    -0.12964518758783583, 0.4833702357121613, 2.3848744729825575,
+    26.019820422411645, 473.7417807332486, 10579.176716787448,
+    0.9931911604557816, -0.11649600333272339, 0.5210391526843479,
+    3.4632982156231265, 65.01233799455412, 2159.454085677199, 88545.02801161012,
+    0.9939287107890232, -0.11002598724515109, 0.5471358573592101,
+    4.7178259768416995, 145.12579093368302, 8149.37372470094, 567420.0126282932,
+    0.9943922677006424, -0.10575451733696342, 0.5709930146114384,
+    6.691055596225652, 372.112095969522, 43086.599012092665, 5992162.869395429,
+    0.9947080030279489, -0.10274234137954029, 0.5965460390742235,
+    11.25629810702958, 1599.7242171813068, 507227.2689963501,
+    190779283.15531817, 0.9948213714195713, -0.10163876704724181,
+    0.6120470775313573, 18.27640825170567, 6724.697293015128, 4816829.103975641,
+    5.197841546648632, 0.9948550884678629, -0.10130820771092944,
+    0.6190794896978747, 25.07983045809644, 16885.905890677685,
+    22308468.831832882, 11.138936444995549, 0.9948718982215246,
+    -0.1011429984185786, 0.6238331482494716, 33.29205938496496,
+    38621.10041095675, 88338404.34048164, 19.208939533099407,
+    0.9948830864538831, -0.10103288716054493, 0.6281493074455944,
+    47.001709505835436, 114770.09885251401, 557975098.8213704,
+    657.3959869397847, 0.9948900721224406, -0.10096407476030746,
+    0.6321790557107347, 76.87291880837546, 458880.39126106206,
+    0.041885308333342766, 0.00010653112420124703, 0.9948921666822166,
+    -0.10094343304229622, 0.6340139976967751, 106.39534064045634,
+    1208386.171594505, 0.04939930953832722, 7.0266969964737e-5,
+    0.9948932137719683, -0.10093311245812589, 0.6352739894555602,
+    144.207725803588, 2992047.1892126286, 0.04991614478856694,
+    4.3637175524497466e-5, 0.9948939117605109, -0.1009262321790954,
+    0.7100376064124982, 11232.960300560215, -5066617530.323079,
+    21005.61611624842, -0.09176805887170594, 0.9948970519607114,
+    -0.10089527243575663, 0.6918488646835469, -0.3933898885389161,
+    0.3465715327912721, -2.257430023829196e-10, 2.6516898583909677e-10,
+    0.994905420315515, -0.10081272056049527, 0.6918162255651881,
+    -0.39333238035970647, 0.34650519420413073, -0.3305213864170433,
+    -1.1567398629015368e-6, 0.9949221327068587, -0.10064765198471316,
+    0.6917509763659994, -0.3932174232562167, 0.3463729315861138,
+    -0.3312606884782542, 4.2368288176954226e-9, 0.9949554603056827,
+    -0.10031765551440633, 0.6916205940152773, -0.39298774434742867,
+    0.34610865933366153, -0.3309568501026762, 9.122349309906703e-8,
+    0.9951525274444379, -0.0983435159069841, 0.6908422855875623,
+    -0.39161754848987856, 0.34453242695312747, -0.329439008920551,
+    0.28068024227433147, 0.9956558731439775, -0.09310951763328909,
+    0.6887925885471895, -0.3880161563707932, 0.34039263583979634,
+    -0.3253894964854974, 0.27600707605704694, 0.9965674713107677,
+    -0.08278451017709917, 0.6848069988948402, -0.3810429833165784,
+    0.33238893777869394, -0.317629285555787, 0.26716894570734107,
+    0.9980324024829195, -0.06270026789553557, 0.67726632519261,
+    -0.3679598606805717, 0.31740851245043333, -0.30335551311913783,
+    0.2509354533146956, 0.9996940630968434, -0.0247341910909682,
+    0.6637275808665052, -0.3448515211245875, 0.29102046018408023,
+    -0.2790476996336916, 0.22333312044164233, 0.9870874576374967,
+    0.160182243006967, 0.6084612160268563, -0.2569197047524688,
+    0.18881488483325692, -0.20007366541678787, 0.1348059007234777,
+    0.8506508083520403, 0.525731112119133, 0.5287581323915932,
+    -0.16612896170721783, 0.05728713286508185, -0.10227938613637189,
+    0.08072326052213778, 0.5257311121191334, 0.8506508083520401,
+    0.4597915922545803, -0.13385767386763742, 0.039846033293781724,
+    0.015069179437869172, 0.04619412148003775, 0.16018224300696743,
+    0.9870874576374967, 0.41608865035339826, -0.08186081403607383,
+    0.09053988749554899, 0.020165182006728018, 0.0139450104849651,
+  ],
+};
+
+// linear_DisplayP3 max saturation, 25 pieces of degree 4 within 1e-05
+
+export const OKLab_to_linear_DisplayP3_saturation_pieces = {
+  degree: 4,
+  starts: [
+    0, 0.35623182230128164, 0.4367028445136214, 0.5171738667259612,
+    0.6781159111506408, 1, 1.2969892839184765, 1.4454839258777148,
+    1.593978567836953, 1.6954839258777148, 1.7969892839184765, 2,
+    2.4528221261378493, 2.5660276576723113, 2.679233189206774,
+    2.7924387207412362, 2.8490414865084674, 2.8773428693920833,
+    2.891493560833891, 2.898568906554795, 2.9056442522756987, 3, 3.25, 3.5,
+    3.75,
+  ],
+  cells: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1,
+    1, 1, 1, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 4, 4, 4, 4, 4, 4,
+    4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5,
+    5, 5, 5, 5, 5, 5, 5, 5, 5, 6, 6, 6, 6, 6, 6, 6, 6, 6, 7, 7, 7, 7, 7, 7, 7,
+    7, 7, 7, 8, 8, 8, 8, 8, 8, 9, 9, 9, 9, 9, 9, 9, 10, 10, 10, 10, 10, 10, 10,
+    10, 10, 10, 10, 10, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11,
+    11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 12, 12, 12, 12,
+    12, 12, 12, 12, 13, 13, 13, 13, 13, 13, 13, 14, 14, 14, 14, 14, 14, 14, 15,
+    15, 15, 15, 16, 16, 17, 20, 20, 20, 20, 20, 20, 21, 21, 21, 21, 21, 21, 21,
+    21, 21, 21, 21, 21, 21, 21, 21, 21, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22,
+    22, 22, 22, 22, 22, 22, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23,
+    23, 23, 23, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24,
+  ],
+  coefficients: [
+    -0.25002626410786105, 0.9682390548084012, 0.4509722919767558,
+    0.007688577375552161, 0.1263418663513179, 0.048007593204098135,
+    0.05463683211744713, -0.5500668033279987, 0.8351206570768782,
+    0.4101731921347107, -0.5802558132031757, 1.0184692718824506,
+    -1.7469138590276714, 3.012746752792687, -0.6739947211865333,
+    0.7387361611649232, 0.339134762025932, -0.3490765710370497,
+    0.5261145216925787, -0.7219553468625644, 1.0477788197004092,
+    -0.8269565720272714, 0.5622657983382097, 0.2798530479214945,
+    -0.17823392875902266, 0.2523248777042052, -0.2592231911430179,
+    0.33555220229390226, -0.9755489634704158, 0.2197822100894371,
+    0.24034428115786005, -0.047000081731236903, 0.12875561275835107,
+    -0.05173922976629315, 0.11171411785018849, -0.9800952059791848,
+    -0.1985280514602897, 0.2420720267843195, 0.055825506855428975,
+    0.13336438954850294, 0.06171034560617438, 0.11731562933338217,
+    -0.8586053840119875, -0.5126370982923764, 0.2792368502481509,
+    0.17656134557634628, 0.25036461577017377, 0.2541242518139081,
+    0.3283596965355165, -0.6792975201821468, -0.7338629838562413,
+    0.35732063639786626, 0.40497638506390976, 0.634535602249322,
+    0.9769442941037928, 1.5177549694884536, -0.4848183499088834,
+    -0.8746148681514782, 0.37476934404901247, -0.5245918673542147,
+    0.9886133634194734, -1.89823173168481, 3.726484661817177,
+    -0.3250457642637537, -0.9456982875812943, 0.3061735595072828,
+    -0.2892367563827365, 0.4533104175652234, -0.6314684434666459,
+    0.9674188945289425, -0.12438597414160038, -0.9922339086308455,
+    0.261889201995257, -0.15459435205559824, 0.23565869694624772,
+    -0.23766461528921426, 0.32556159403525703, 0.33881815834514145,
+    -0.9408518775958342, 0.2278790840398005, -0.006768206999882724,
+    0.12127760978839322, -0.0073085649310449235, 0.11689056347010379,
+    0.7201422841208553, -0.6938264124557361, 0.2526837801561802,
+    0.12727160914082775, 0.2071854647102023, 0.19340230735085034,
+    0.27761058393262505, 0.8537495839781302, -0.5206838271515352,
+    0.29288887793179924, 0.2539383727011548, 0.40865228659365005,
+    0.5927843085076331, 0.9877471953071099, 0.939822243598571,
+    -0.3416637973759412, 0.3656057562273681, 0.5201861644852493,
+    1.0984390805714948, 2.6903905449915637, 7.234299241516555,
+    0.976748372003253, -0.21438894045401435, 0.4626011984768438,
+    1.0430466995460403, 3.5731177685326387, 16.350549038875645,
+    87.64031152234091, 0.9876330883825157, -0.15678291594435262,
+    0.5405636060315989, 1.729442463193711, 9.775205122196143, 82.86335058949471,
+    855.0696490807622, 0.9915604496627095, -0.1296451875878367,
+    0.5976234524443316, 2.549483114527649, 23.302031320818326,
+    346.14921310984096, 6361.11979928375, 0.9931911604557815,
+    -0.11649600333272428, 0.6365295929651039, 3.4269813319321667,
+    47.7020085678337, 1130.8128705605614, 33400.89295154078, 0.9941619824324389,
+    -0.10789788082257704, 0.6707255013335031, 4.629338550475819,
+    102.92529338408107, 4283.601834007713, 218917.93089397266,
+    0.9986531914776008, -0.051882590062587254, 0.6747995261081704,
+    -0.3322748463690662, 0.3162372443543678, -0.28160309538407485,
+    0.2441276798257805, 0.9870874576374967, 0.160182243006967, 0.61648624657579,
+    -0.22389818922234728, 0.2013452279344971, -0.18705114727462346,
+    0.13253885069497706, 0.8506508083520403, 0.525731112119133,
+    0.5519053740857077, -0.12242722638378084, 0.06677517127640069,
+    -0.11415597095611874, 0.05783554079170106, 0.5257311121191334,
+    0.8506508083520401, 0.5023851525341179, -0.10082830374146344,
+    0.0066865130211065105, 0.0025380542415323376, 0.07291180944496833,
+    0.16018224300696743, 0.9870874576374967, 0.46635286159369194,
+    -0.07422209009824235, 0.06811145905805135, 0.0463271217377555,
+    0.009423089634768763,
+  ],
+};
+
+// linear_Rec2020 max saturation, 43 pieces of degree 4 within 1e-05
+
+export const OKLab_to_linear_Rec2020_saturation_pieces = {
+  degree: 4,
+  starts: [
+    0, 0.3099293745669198, 0.3961882027460548, 0.48244703092518987,
+    0.6549646872834599, 1, 1.3292809257509874, 1.493921388626481,
+    1.576241620064228, 1.6585618515019749, 1.8292809257509874, 2,
+    2.3413225450644166, 2.511983817596625, 2.597314453862729,
+    2.6399797719957814, 2.6613124310623073, 2.6719787605955703,
+    2.6773119253622015, 2.6799785077455174, 2.6826450901288332,
+    2.6838847577455174, 2.6841946746496887, 2.6845045915538597,
+    2.684659550005945, 2.6847370292319876, 2.6847563990384984,
+    2.684775768845009, 2.6847854537482645, 2.68479513865152, 2.6848048235547752,
+    2.6848145084580306, 2.6851244253622015, 2.6876037605955703,
+    2.6925624310623073, 2.7024797719957814, 2.722314453862729,
+    2.761983817596625, 2.8413225450644166, 3, 3.25, 3.5, 3.75,
+  ],
+  cells: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1,
+    1, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 4, 4, 4, 4, 4, 4, 4, 4,
+    4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5,
+    5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 7, 7, 7, 7,
+    7, 8, 8, 8, 8, 8, 8, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 10, 10, 10, 10, 10,
+    10, 10, 10, 10, 10, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11,
+    11, 11, 11, 11, 11, 11, 11, 11, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12,
+    13, 13, 13, 13, 13, 13, 14, 14, 15, 15, 16, 32, 35, 35, 36, 36, 37, 37, 37,
+    37, 37, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 39, 39, 39, 39, 39, 39, 39,
+    39, 39, 39, 39, 39, 39, 39, 39, 39, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40,
+    40, 40, 40, 40, 40, 40, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41,
+    41, 41, 41, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42,
+  ],
+  coefficients: [
+    -0.2095002752056987, 0.9778085879602083, 0.52752019184647,
+    -0.014200706190122994, 0.1291090320929602, 0.06326465715445961,
+    0.03383630719157539, -0.4806584269137665, 0.8769079065881339,
+    0.46154721268864746, -0.7444586020508264, 1.4104003159587077,
+    -2.6481963008257887, 4.909889595364126, -0.6174484717879666,
+    0.7866113301286123, 0.36892655730844404, -0.42421965010788065,
+    0.6655190995055539, -0.981397103592569, 1.4916584597248836,
+    -0.7944631054540988, 0.6073124188358323, 0.2935950423319337,
+    -0.20311060391751684, 0.2850394815090007, -0.3118215849382329,
+    0.40651522297719617, -0.9707578589441705, 0.2400607825075346,
+    0.2458898370627134, -0.04935545886615045, 0.1317894520028528,
+    -0.05489195599070356, 0.11617913117923591, -0.9740784462227483,
+    -0.22621047854658843, 0.25011881342170633, 0.06900276871137323,
+    0.14302854300568846, 0.07899638938142103, 0.13328775077070834,
+    -0.8168851780424369, -0.5768003171762097, 0.30404799234495006,
+    0.23260586291649282, 0.3276799935011446, 0.3828420670614253,
+    0.5086639164213719, -0.6562345977639585, -0.7545569247562277,
+    0.3850123267805247, 0.4762142866983543, 0.7751456918503254,
+    1.2069731158290606, 1.920307674665313, -0.5279572911187572,
+    -0.8492709218821423, 0.48663007333852065, 0.8444029580895769,
+    1.6895869221291284, 3.392866150467555, 6.72769870486276,
+    -0.3341158871281787, -0.9425320015620425, 0.48473119996770386,
+    -0.4516625500451583, 0.7498183170296093, -1.131611546268055,
+    1.8589225969191727, -0.10133953603656831, -0.9948518977395042,
+    0.4095996841722329, -0.20703646849166052, 0.35391684985379424,
+    -0.32429145802259546, 0.47586419816207787, 0.23677802383441496,
+    -0.9715637742469967, 0.3724877265450128, -0.025271928039353034,
+    0.22217881850541324, -0.02554044558804083, 0.22174052113418172,
+    0.600182161831881, -0.7998633462153456, 0.4011069158438763,
+    0.18358218412291344, 0.35758159589583266, 0.38710882043324,
+    0.6756275977110432, 0.7792652655923535, -0.6266942203669016,
+    0.4773683421067057, 0.4770632844434588, 1.0082088922455126,
+    2.3140900753229983, 6.343709485895377, 0.8510578193508113,
+    -0.5250719837525536, 0.5584955929286899, 0.9000199601722718,
+    2.9327671187335267, 13.077501441132176, 70.26268096161436,
+    0.8809778280602273, -0.473157549307083, 0.6268634013821375,
+    1.4783199456212448, 8.137351185849115, 70.29458206228023, 742.0494787843706,
+    0.8943964916154058, -0.4472749890012332, 0.6792795107531011,
+    2.2372251735080297, 21.304620789578532, 346.3539091719546,
+    6921.724973675847, 0.90072387070633, -0.4343921140396157,
+    0.7171600723583452, 3.177177771220542, 51.322426506062904,
+    1483.5839027411257, 52930.06478386087, 0.9037930022246854,
+    -0.4279698694180349, 0.7430713192098961, 4.235282483424309,
+    109.22488083176177, 5156.367792814061, 301696.7155538258,
+    0.9058035356285583, -0.42369795237032126, 0.7662418374838484,
+    5.798146269722697, 255.76759492816396, 22691.48407697668, 2442659.976740189,
+    0.9072597042117827, -0.4205708372124114, 0.7906690131918351,
+    9.007802408260812, 876.962615449707, 178970.39169035247, 44137599.27979192,
+    0.9078332684176983, -0.4193313209790552, 0.8052421309982193,
+    13.025853530161296, 2561.2385068413037, 969846.8903974186,
+    0.8954532757855906, 0.9080619905256697, -0.41883579283838507,
+    0.8133113283078007, 17.069203072943363, 5757.7198829819545,
+    3783627.9725995343, 6.19899119431607, 0.9082333029397548,
+    -0.4184641769986335, 0.8215894320526472, 24.744117566795254,
+    17106.917048686344, 23257788.811817102, 21.84926119489587,
+    0.9083188805861853, -0.418278389557313, 0.8276219402890804,
+    36.38353445445528, 53654.09947611706, 156712133.2455894, 88.47711410774039,
+    0.9083545226841461, -0.41820098172918874, 0.8312249132329307,
+    50.47970244154179, 135318.62913350685, 0.005838019072671651,
+    4.8181059634874104e-5, 0.9083687767787048, -0.4181700196972037,
+    0.8331312961415066, 63.42834217457326, 268169.1330666151,
+    0.02204439245024893, 9.50087862177537e-5, 0.9083794664550828,
+    -0.4181467982931102, 0.8349595539355976, 83.18740307267305,
+    600006.0796895354, 0.01733800643651581, 5.339095821736835e-5,
+    0.9083865924415698, -0.41813131749773697, 0.8365973360993827,
+    117.45185947432299, 1713063.7076432577, 0.09472952924019488,
+    0.0001521701964191432, 0.908393718074471, -0.41811583677593284,
+    0.8704492594212069, 7083.917486877774, -12839450.176444832,
+    0.06723783196063035, -0.0009164842041155477, 0.9084008433537912,
+    -0.41810035612771335, 0.9012915397974338, -0.7153000286688526,
+    0.8060574875884085, -7.73206825777785e-7, 5.859009384642636e-11,
+    0.908518347942937, -0.4178449610214733, 0.901090511301334,
+    -0.7148469895095806, 0.8054407721559144, -0.8454548831005348,
+    2.0661224810807154e-5, 0.9095391378959503, -0.4156182823643488,
+    0.8993443065327508, -0.7109141497997306, 0.8001272349569618,
+    -0.8383095847033218, 0.9270017083385863, 0.9122252737542984,
+    -0.4096889672957955, 0.8947503897491897, -0.7005882355360056,
+    0.7862366884680156, -0.8196692607361664, 0.9029115870606298,
+    0.9174385762958724, -0.3978774418388187, 0.8858346857821279,
+    -0.6806321481912194, 0.7596405424509154, -0.7842687001056969,
+    0.857548559342837, 0.92724030104255, -0.37446685316930445,
+    0.8690385904905248, -0.6433299866238651, 0.7108180051034079,
+    -0.7202896045691545, 0.7766737942398333, 0.9444463674883674,
+    -0.3286655730952477, 0.8391926142072745, -0.5779288777551007,
+    0.6280871716717114, -0.6149412789484913, 0.6466828869580844,
+    0.9702371996075042, -0.2421565124001169, 0.7917716464836548,
+    -0.4759867307026113, 0.5066972622882191, -0.4678681022661965,
+    0.47191987547060704, 0.995659325001563, -0.09307259820931163,
+    0.7301274275034642, -0.3455379572449403, 0.3652773556852397,
+    -0.3102537652196904, 0.29188542731173917, 0.9870874576374967,
+    0.160182243006967, 0.6623943263596684, -0.19956656671776263,
+    0.2223841052743633, -0.18122023706414112, 0.1367271453788605,
+    0.8506508083520403, 0.525731112119133, 0.6105687894779228,
+    -0.08260449510438878, 0.08062685072874841, -0.13023096292947545,
+    0.03314746150089752, 0.5257311121191334, 0.8506508083520401,
+    0.5790285593093141, -0.07244961910293139, -0.03592310677624494,
+    -0.022792601938670172, 0.10864587489570753, 0.16018224300696743,
+    0.9870874576374967, 0.5470568222904194, -0.07981990871615335,
+    0.039656757120962685, 0.08541987633704813, 0.006307629844594012,
+  ],
+};
+
+// linear_A98RGB max saturation, 23 pieces of degree 4 within 1e-05
+
+export const OKLab_to_linear_A98RGB_saturation_pieces = {
+  degree: 4,
+  starts: [
+    0, 0.3588335436542151, 0.4389793506974382, 0.5191251577406614,
+    0.6794167718271076, 1, 1.3243812015884142, 1.4865718023826213,
+    1.5676671027797249, 1.6487624031768287, 1.8243812015884142, 2,
+    2.226411063068925, 2.4528221261378493, 2.5660276576723113,
+    2.679233189206774, 2.7924387207412362, 2.8490414865084674,
+    2.9056442522756987, 3, 3.25, 3.5, 3.75,
+  ],
+  cells: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1,
+    1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 4, 4, 4, 4, 4, 4,
+    4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5,
+    5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 7, 7, 7, 7,
+    7, 8, 8, 8, 8, 8, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 10, 10, 10, 10, 10, 10,
+    10, 10, 10, 10, 10, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11,
+    11, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 13, 13, 13, 13,
+    13, 13, 13, 13, 14, 14, 14, 14, 14, 14, 14, 15, 15, 15, 15, 15, 15, 15, 16,
+    16, 16, 16, 17, 17, 17, 18, 18, 18, 18, 18, 18, 19, 19, 19, 19, 19, 19, 19,
+    19, 19, 19, 19, 19, 19, 19, 19, 19, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20,
+    20, 20, 20, 20, 20, 20, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21,
+    21, 21, 21, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22,
+  ],
+  coefficients: [
+    -0.25235546129115094, 0.9676346010537916, 0.39973647133491,
+    0.00765124229309129, 0.12382338031064982, 0.03406963349807323,
+    0.06167821456744211, -0.5539426600393907, 0.8325548206505587,
+    0.36635924265582015, -0.49813836804307243, 0.8514768702890313,
+    -1.4103539299644896, 2.3553559421916668, -0.6770845239912321,
+    0.7359052570620532, 0.3051840528262674, -0.3032278764879136,
+    0.450343059093805, -0.6012010426088938, 0.8552042878824424,
+    -0.8286968174802792, 0.5596977619198211, 0.25370759162826045,
+    -0.15599139393703465, 0.2213119492820838, -0.22118471624357247,
+    0.2850447132555931, -0.9758018155086193, 0.21865684725176662,
+    0.2194522025551779, -0.03995209355132032, 0.11622274053210502,
+    -0.0435712247765613, 0.09950958959238851, -0.975058776477448,
+    -0.22194680086521196, 0.22352725293831444, 0.05980385702045668,
+    0.12691965044518477, 0.0680447125701282, 0.11704988495054074,
+    -0.8235899225128596, -0.567185718733522, 0.2692247822950952,
+    0.1997526699670874, 0.28108568908799986, 0.32114223381065193,
+    0.42395758104148906, -0.6680347668522818, -0.7441300627421376,
+    0.33696207581123194, 0.4014511317838807, 0.6421764924207425,
+    0.9743000215860269, 1.5200534349623065, -0.5426152734888854,
+    -0.8399813479932647, 0.42096195647867696, 0.6984374669514952,
+    1.3562635381118584, 2.630813232718967, 5.06033205397613,
+    -0.34576466492348795, -0.9383212650741473, 0.4058607830207265,
+    -0.42624088550796546, 0.6842656277159717, -1.063318084800022,
+    1.716916467040202, -0.1047541871925912, -0.9944981449281942,
+    0.3318247358060465, -0.20094962459673898, 0.3020465092817984,
+    -0.3049578205920164, 0.4123465856896976, 0.14188172906212726,
+    -0.9898836168754088, 0.2974924362121173, -0.08628925580512664,
+    0.1830753464006263, -0.10343168546821588, 0.17544048422635558,
+    0.46888023523039957, -0.8832617533949294, 0.28729417702738574,
+    0.02409333174274446, 0.15458561837010473, 0.029610101170914657,
+    0.134486480101477, 0.7201422841208553, -0.6938264124557361,
+    0.31196148429911397, 0.1402386559223262, 0.23510996223556052,
+    0.19822943107886215, 0.28498505772334704, 0.8537495839781302,
+    -0.5206838271515352, 0.3563609217259348, 0.27912026522517075,
+    0.43383859807585495, 0.5680198155950293, 0.8791582391258832,
+    0.939822243598571, -0.3416637973759412, 0.43457146368564703,
+    0.5450002611109078, 1.03154631904997, 2.0967405860640764, 4.674403316650382,
+    0.976748372003253, -0.21438894045401435, 0.5312284120187879,
+    0.97822705760153, 2.5921230494477157, 8.182438100936002, 29.74916419066007,
+    0.9902319156421441, -0.13943010164125108, 0.6255907176515045,
+    1.586720912033993, 6.228621939237783, 34.54343924001855, 227.19881794605948,
+    0.9986531914776008, -0.051882590062587254, 0.6733162464796463,
+    -0.36116521981181726, 0.3096423704881166, -0.29684033411700367,
+    0.2436019928170121, 0.9870874576374967, 0.160182243006967,
+    0.6084612160268563, -0.25691970475247056, 0.18881488483321282,
+    -0.20007366541664395, 0.13480590072589216, 0.8506508083520403,
+    0.525731112119133, 0.528758132391593, -0.16612896170721866,
+    0.057287132865068396, -0.10227938613634875, 0.08072326052236786,
+    0.5257311121191334, 0.8506508083520401, 0.4597915922545805,
+    -0.13385767386763914, 0.039846033293829214, 0.015069179437910338,
+    0.0461941214791054, 0.16018224300696743, 0.9870874576374967,
+    0.4160886503533984, -0.08186081403607556, 0.09053988749555036,
+    0.020165182006836042, 0.013945010485198,
+  ],
+};
+
+// linear_ProPhotoRGB max saturation, 52 pieces of degree 4 within 1e-05
+
+export const OKLab_to_linear_ProPhotoRGB_saturation_pieces = {
+  degree: 4,
+  starts: [
+    0, 0.26232658281190024, 0.35453575996041276, 0.4467449371089252,
+    0.6311632914059502, 1, 1.3301256931152474, 1.495188539672871,
+    1.577719962951683, 1.6602513862304948, 1.8301256931152474, 2,
+    2.164130673794804, 2.2461960106922056, 2.287228679140907, 2.307745013365257,
+    2.318003180477432, 2.3231322640335197, 2.325696805811564, 2.326979076700586,
+    2.3276202121450966, 2.327940779867352, 2.3281010637284796,
+    2.3281812056590434, 2.3282212766243253, 2.3282413121069663,
+    2.328251329848287, 2.3282563387189477, 2.3282613475896077,
+    2.328266472548809, 2.32827159750801, 2.328281847426412, 2.3283023472632163,
+    2.3283433469368253, 2.3284253462840434, 2.3285893449784796,
+    2.328917342367352, 2.3295733371450966, 2.330885326700586, 2.333509305811564,
+    2.3387572640335197, 2.349253180477432, 2.370245013365257, 2.412228679140907,
+    2.4961960106922056, 2.580163342243505, 2.664130673794804, 2.832065336897402,
+    3, 3.25, 3.5, 3.75,
+  ],
+  cells: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2,
+    2, 2, 2, 2, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+    4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5,
+    5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 7, 7, 7, 7,
+    7, 8, 8, 8, 8, 8, 8, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 10, 10, 10, 10, 10,
+    10, 10, 10, 10, 10, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 12, 12, 12,
+    12, 12, 13, 13, 13, 14, 15, 22, 40, 41, 42, 42, 42, 43, 43, 43, 43, 43, 44,
+    44, 44, 44, 44, 44, 45, 45, 45, 45, 45, 46, 46, 46, 46, 46, 46, 46, 46, 46,
+    46, 46, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 48, 48, 48, 48, 48, 48, 48,
+    48, 48, 48, 48, 48, 48, 48, 48, 48, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49,
+    49, 49, 49, 49, 49, 49, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50,
+    50, 50, 50, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51,
+  ],
+  coefficients: [
+    -0.17000371563426675, 0.9854434213441903, 0.6191544611782112,
+    -0.051243840243152414, 0.13836153779499882, 0.08466870339302988,
+    0.001818053156337854, -0.40956363728626516, 0.9122815502972997,
+    0.5253240733033472, -0.9366523754754477, 1.885526747862661,
+    -3.7806736204931943, 7.385134221560774, -0.5570142131809998,
+    0.8305029598468339, 0.40805355162812446, -0.5105353086267638,
+    0.828997220175872, -1.2890028118445218, 2.0301825399014795,
+    -0.7582444287411462, 0.6519703875813785, 0.31407781480814567,
+    -0.22983286941889103, 0.3211500464304816, -0.36707890002908566,
+    0.48184398891353447, -0.9652426676323732, 0.26135529950995817,
+    0.25747380285899546, -0.04992029716593058, 0.13667278780911601,
+    -0.05584085325659893, 0.12147801400131054, -0.9739069355007937,
+    -0.226947749456682, 0.26436132602002677, 0.08070427315516085,
+    0.15502612047739117, 0.09333075924453386, 0.14789841863833866,
+    -0.8157160864196297, -0.5784524754517377, 0.3259140100537094,
+    0.26319139168443517, 0.3710427324964336, 0.44744870546056464,
+    0.598407313441885, -0.6541865012896593, -0.7563332741129367,
+    0.4181985569994939, 0.5443576638915026, 0.9037426126041173,
+    1.4448880021877337, 2.335773672390915, -0.525426028174709,
+    -0.8508392850101304, 0.5354413799776623, 0.9799160871691104,
+    2.0166641404219923, 4.154308596095751, 8.366320305751339,
+    -0.33211469317184483, -0.9432390103146558, 0.5627870014200184,
+    -0.33772937690502536, 0.7716035997844719, -0.9778854920580375,
+    1.931577811638919, -0.10075378639332197, -0.9949113902893105,
+    0.5182716918454627, -0.05749563405217049, 0.5003433784598338,
+    -0.04874131252070314, 0.8013119168266776, 0.0967944121782586,
+    -0.995304396539604, 0.5272042303435426, 0.1573136127866503,
+    0.6530291886836782, 0.7487398004190917, 2.0078635799500346,
+    0.2520398286251112, -0.9677168618902042, 0.5724975723446863,
+    0.45660336701328896, 1.463209277275529, 4.07825345946788,
+    14.574249146164442, 0.3423109591499988, -0.9395867215142026,
+    0.6335828027788333, 0.9108202733642325, 4.043454568803711,
+    22.070576638213517, 142.7349041478605, 0.3900556893241712,
+    -0.9207912680004332, 0.6951746035287714, 1.612545511537974,
+    11.780855237282006, 123.847662565493, 1537.03431999959, 0.4144277315099647,
+    -0.9100822245025472, 0.7497602418414182, 2.6749387062864383,
+    34.45953910744655, 703.2338742705982, 17086.815954412577,
+    0.42671335098435825, -0.9043869283065186, 0.7947747306470923,
+    4.247584001880005, 99.97284438632197, 3997.296363174662, 192002.03904514934,
+    0.43287750110388906, -0.9014527547453901, 0.8302313622838462,
+    6.535365416072731, 287.45136668940603, 22683.736782032625,
+    2165263.1331245084, 0.4359644423482345, -0.8999638909467385,
+    0.8572971348777162, 9.82421152044854, 820.8447767954351, 128485.31031622681,
+    24440350.14860518, 0.43750906943534623, -0.8992139979792448,
+    0.8775048864266285, 14.515646683004508, 2332.5419520803675,
+    728571.6477655389, 276357836.4182086, 0.4382816644945466,
+    -0.8988376842166164, 0.8923511224649724, 21.173621659572923,
+    6861.52094194348, 4151376.501832164, 6.579816268306393, 0.4386680314473752,
+    -0.8986491852698052, 0.903136392452781, 30.59179996228756,
+    19362.24222198292, 23334722.627627254, 17.601328835846797,
+    0.4388612321597871, -0.8985548502496625, 0.9109000664884779,
+    43.85698793636711, 54381.07402658322, 130276138.08046064,
+    48.893784895660055, 0.43895783680999456, -0.8985076613491341,
+    0.9164464159094904, 62.41860587095512, 152469.545175633, 723391661.0336124,
+    2343.1865997848126, 0.43900614020672263, -0.8984840615507853,
+    0.9203798125997179, 89.06160778480893, 419094.12163638405,
+    0.053490875327651344, 0.00016295258383789817, 0.43903029217275846,
+    -0.898472260314531, 0.923142548263399, 124.17286558036221,
+    1116150.2024202752, 0.06399770454822568, 0.00010874503185670883,
+    0.43904236822266507, -0.8984663593621265, 0.9250547176625876,
+    169.82691191124374, 2818545.3534252485, 0.06632034092912852,
+    6.890632293817708e-5, 0.43905041895287655, -0.8984624252673584,
+    0.9268745321737404, 272.6376923596072, 12202612.554232838,
+    0.5056610476665541, 0.0002985865602906718, 0.43905856299216933,
+    -0.8984584454849602, 2.628754177313297, -7.399946039937563,
+    24.163175244171896, 1.7600932937102678e-6, 5.743436917229042e-10,
+    0.4390668003404634, -0.8984544200118265, 2.6286863341704945,
+    -7.399502990787583, 24.16064139430002, 7.482381324519229e-6,
+    4.689024513321015e-10, 0.43907915641042733, -0.8984483816034773,
+    2.628584576110806, -7.39883850342493, 24.156806125977518,
+    -4.664623174638642e-10, 2.030632197512439e-9, 0.4391038686902816,
+    -0.8984363040868439, 2.6283810841998703, -7.3975098332599885,
+    24.149127027011048, -1.8655846934526602e-9, 8.120253572878227e-9,
+    0.4391532938094416, -0.8984121462537772, 2.6279741971801416,
+    -7.39485361567883, 24.133792794049434, -94.08406217483483,
+    1.9584607977535349e-7, 0.4392521462835552, -0.8983638193879416,
+    2.627160810096306, -7.389545951653915, 24.103167589912328,
+    -93.91802346669823, 1.2970617491911442e-7, 0.4394498601588548,
+    -0.8982671208534592, 2.6255355817310098, -7.378949478212164,
+    24.04209390991901, -93.55414658386475, 5.176664700408633e-7,
+    0.43984532348884203, -0.898073544541312, 2.6222912921043857,
+    -7.357831630416044, 23.92064725587785, -92.82885853981001,
+    8.580610134887723e-6, 0.44063639143366834, -0.8976856746903757,
+    2.6158272533100275, -7.315893800949425, 23.68038194129719,
+    -91.4001237922759, 407.1986181469498, 0.4422190841768239,
+    -0.8969070640762125, 2.602996327787922, -7.233189740394295,
+    23.210539006249515, -88.63127232645823, 390.31346510070273,
+    0.4453866304031298, -0.8953383435652389, 2.5777152226714444,
+    -7.072314871278131, 22.3113818683796, -83.4265642532672, 359.1639580727868,
+    0.45172982629400277, -0.8921547870388804, 2.528616345601589,
+    -6.767558773211764, 20.661076463241958, -74.19883697764035,
+    305.75886579132543, 0.4644442195946767, -0.8856023751577746,
+    2.435840933852348, -6.218090690820372, 17.85805488340597,
+    -59.50828707203994, 225.9215740848377, 0.4899482510704484,
+    -0.8717515192260974, 2.269125464592057, -5.3103034670119875,
+    13.69841010734333, -40.07550049807534, 131.57868801541952,
+    0.5409427328394373, -0.8410594270253448, 1.9946450160721976,
+    -4.009498299234554, 8.710946172375417, -20.779299358680024,
+    53.98851440445299, 0.6401612788109091, -0.7682405463858188,
+    1.604588328577909, -2.5024756519426914, 4.273080653338723,
+    -7.745679739512179, 14.590377787853264, 0.7585474931689912,
+    -0.6516177565160723, 1.2811831916750696, -1.5032394521385632,
+    2.0912335433534537, -2.9199961583766507, 4.191207307052173,
+    0.853921295746853, -0.520402172045828, 1.0829395241099453,
+    -0.9854257337096999, 1.2078787925549002, -1.410722719938598,
+    1.725272773875315, 0.9448413947924025, -0.3275282257863397,
+    0.9177482538257749, -0.5984014866107964, 0.6746674407440223,
+    -0.6636602877619934, 0.7195592493869215, 0.9950463404506344,
+    -0.09941217408245388, 0.8087778377386055, -0.35326767156939765,
+    0.4050032322256498, -0.3274652281897314, 0.32309708701846046,
+    0.9870874576374967, 0.160182243006967, 0.7402577872920875,
+    -0.18596928130555224, 0.25224541796903716, -0.18346109344561945,
+    0.1471569050487777, 0.8506508083520403, 0.525731112119133,
+    0.6980187628107435, -0.04889049438195747, 0.0976467514117328,
+    -0.1534102869471328, 0.004604569860281777, 0.5257311121191334,
+    0.8506508083520401, 0.6814054031253661, -0.0539693855728984,
+    -0.09274999461816379, -0.06052243606447764, 0.1610533250964911,
+    0.16018224300696743, 0.9870874576374967, 0.6473950399292348,
+    -0.10476346277022233, 0.009592198774787834, 0.14425520030940966,
+    -0.004153369250564223,
+  ],
+};
+
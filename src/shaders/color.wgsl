@@ -0,0 +1,424 @@
+/* This file is auto-generated by tools/print_matrices.py --format wgsl */
+
+// Conversions and OKLCH gamut mapping, ported from src/core.js, src/gamut.js and src/spaces.
+// Include it before your own code. Matrices are column-major (as WGSL expects), so they are
+// applied as `M * v`.
+
+struct OKGamut {
+  // LMS to the gamut's linear RGB
+  LMS_to_RGB: mat3x3<f32>,
+  // directions used to select the channel that goes below zero first
+  dirR: vec2<f32>,
+  dirG: vec2<f32>,
+  // the first four coefficients of the max saturation polynomial of each channel,
+  // and the fifth coefficient of each channel
+  kR: vec4<f32>,
+  kG: vec4<f32>,
+  kB: vec4<f32>,
+  k4: vec3<f32>,
+}
+
+const FLOAT_MAX: f32 = 3.4028234663852886e38;
+
+// based on colorjs.io, could perhaps use a more specific number than this
+const ACHROMATIC_EPSILON: f32 = 4e-6;
+
+// OKLab to LMS matrices
+
+const OKLab_to_LMS_M = mat3x3<f32>(
+  1.0, 1.0, 1.0,
+  0.3963377773761749, -0.1055613458156586, -0.0894841775298119,
+  0.2158037573099136, -0.0638541728258133, -1.2914855480194092
+);
+
+const LMS_to_OKLab_M = mat3x3<f32>(
+  0.210454268309314, 1.9779985324311684, 0.0259040424655478,
+  0.7936177747023054, -2.42859224204858, 0.7827717124575296,
+  -0.0040720430116193, 0.450593709617411, -0.8086757549230774
+);
+
+const XYZ_to_LMS_M = mat3x3<f32>(
+  0.819022437996703, 0.0329836539323885, 0.0481771893596242,
+  0.3619062600528904, 0.9292868615863434, 0.2642395317527308,
+  -0.1288737815209879, 0.0361446663506424, 0.6335478284694309
+);
+
+const LMS_to_XYZ_M = mat3x3<f32>(
+  1.2268798758459243, -0.0405757452148008, -0.0763729366746601,
+  -0.5578149944602171, 1.112286803280317, -0.4214933324022432,
+  0.2813910456659647, -0.0717110580655164, 1.5869240198367816
+);
+
+// linear_sRGB to XYZ (D65) and LMS matrices
+
+const linear_sRGB_to_XYZ_M = mat3x3<f32>(
+  0.4123907992659595, 0.21263900587151036, 0.01933081871559185,
+  0.35758433938387796, 0.7151686787677559, 0.11919477979462599,
+  0.1804807884018343, 0.07219231536073371, 0.9505321522496606
+);
+
+const XYZ_to_linear_sRGB_M = mat3x3<f32>(
+  3.2409699419045213, -0.9692436362808798, 0.05563007969699361,
+  -1.5373831775700935, 1.8759675015077206, -0.20397695888897657,
+  -0.4986107602930033, 0.04155505740717561, 1.0569715142428786
+);
+
+const linear_sRGB_to_LMS_M = mat3x3<f32>(
+  0.4122214694707629, 0.2119034958178251, 0.08830245919005637,
+  0.5363325372617349, 0.6806995506452345, 0.2817188391361215,
+  0.051445993267502196, 0.10739695353694051, 0.6299787016738223
+);
+
+const LMS_to_linear_sRGB_M = mat3x3<f32>(
+  4.076741636075959, -1.2684379732850313, -0.004196076138675526,
+  -3.307711539258062, 2.6097573492876878, -0.703418617935936,
+  0.2309699031821041, -0.3413193760026569, 1.7076146940746113
+);
+
+// linear_DisplayP3 to XYZ (D65) and LMS matrices
+
+const linear_DisplayP3_to_XYZ_M = mat3x3<f32>(
+  0.48657094864821626, 0.22897456406974884, 0.0,
+  0.26566769316909294, 0.6917385218365062, 0.045113381858902575,
+  0.1982172852343625, 0.079286914093745, 1.0439443689009757
+);
+
+const XYZ_to_linear_DisplayP3_M = mat3x3<f32>(
+  2.4934969119414245, -0.829488969561575, 0.035845830243784335,
+  -0.9313836179191236, 1.7626640603183468, -0.07617238926804171,
+  -0.40271078445071684, 0.02362468584194359, 0.9568845240076873
+);
+
+const linear_DisplayP3_to_LMS_M = mat3x3<f32>(
+  0.48137985274995443, 0.22883194181124475, 0.08394575232299319,
+  0.4621183710113181, 0.6532168193835676, 0.22416527097756642,
+  0.05650177623872757, 0.11795123880518778, 0.6918889766994405
+);
+
+const LMS_to_linear_DisplayP3_M = mat3x3<f32>(
+  3.1277689713618737, -1.091009018437798, -0.02601080193857041,
+  -2.2571357625916395, 2.413331710306923, -0.5080413317041669,
+  0.1293667912297651, -0.3223226918691248, 1.5340521336427373
+);
+
+// linear_Rec2020 to XYZ (D65) and LMS matrices
+
+const linear_Rec2020_to_XYZ_M = mat3x3<f32>(
+  0.6369580483012913, 0.26270021201126703, 0.0,
+  0.14461690358620838, 0.677998071518871, 0.028072693049087508,
+  0.16888097516417205, 0.059301716469861945, 1.0609850577107909
+);
+
+const XYZ_to_linear_Rec2020_M = mat3x3<f32>(
+  1.7166511879712676, -0.666684351832489, 0.017639857445310915,
+  -0.3556707837763924, 1.616481236634939, -0.042770613257808655,
+  -0.2533662813736598, 0.01576854581391113, 0.942103121235474
+);
+
+const linear_Rec2020_to_LMS_M = mat3x3<f32>(
+  0.6167557848654444, 0.26513305939263676, 0.10010262952034828,
+  0.3601984012264634, 0.6358393720678492, 0.20390652261661452,
+  0.023045813908092266, 0.09902756853951414, 0.6959908478630372
+);
+
+const LMS_to_linear_Rec2020_M = mat3x3<f32>(
+  2.1399067304346513, -0.8847358357577675, -0.04857374640044396,
+  -1.246389493760618, 2.1632309383612007, -0.45450314971409633,
+  0.10648276332596689, -0.27849510260343363, 1.5030768961145404
+);
+
+// linear_A98RGB to XYZ (D65) and LMS matrices
+
+const linear_A98RGB_to_XYZ_M = mat3x3<f32>(
+  0.5766690429101308, 0.29734497525053616, 0.027031361386412378,
+  0.18555823790654627, 0.627363566255466, 0.07068885253582714,
+  0.18822864623499472, 0.07529145849399789, 0.9913375368376389
+);
+
+const XYZ_to_linear_A98RGB_M = mat3x3<f32>(
+  2.041587903810746, -0.9692436362808798, 0.013444280632031024,
+  -0.5650069742788596, 1.8759675015077206, -0.11836239223101824,
+  -0.3447313507783295, 0.04155505740717561, 1.0151749943912054
+);
+
+const linear_A98RGB_to_LMS_M = mat3x3<f32>(
+  0.5764322596183941, 0.29631647054222465, 0.12347825101427762,
+  0.36991322261987963, 0.5916761332521886, 0.21949869837199862,
+  0.053654517761726306, 0.11200739620558692, 0.6570230506137239
+);
+
+const LMS_to_linear_A98RGB_M = mat3x3<f32>(
+  2.554036838611556, -1.2684379732850315, -0.0562347359374939,
+  -1.6219761806828696, 2.6097573492876887, -0.5670418395669057,
+  0.06793934207131354, -0.3413193760026572, 1.6232765755043994
+);
+
+// linear_ProPhotoRGB to XYZ (D50) and LMS matrices
+
+const linear_ProPhotoRGB_to_XYZ_M = mat3x3<f32>(
+  0.7977666449006423, 0.2880748288194013, 0.0,
+  0.13518129740053308, 0.711835234241873, 0.0,
+  0.0313477341283922, 8.993693872564e-05, 0.8251046025104602
+);
+
+const XYZ_to_linear_ProPhotoRGB_M = mat3x3<f32>(
+  1.3457868816471583, -0.5446307051249019, 0.0,
+  -0.25557208737979464, 1.5082477428451468, 0.0,
+  -0.05110186497554526, 0.02052744743642139, 1.2119675456389452
+);
+
+const linear_ProPhotoRGB_to_LMS_M = mat3x3<f32>(
+  0.7154484605655532, 0.27441164900156706, 0.10978443261622936,
+  0.35279155007721175, 0.6677976498412368, 0.18619829115002015,
+  -0.06824001064276528, 0.05779070115719622, 0.7040172762337504
+);
+
+const LMS_to_linear_ProPhotoRGB_M = mat3x3<f32>(
+  1.7383551481157213, -0.7070494015329266, -0.08407882206239632,
+  -0.9879509427514458, 1.934370044440138, -0.3575406052114133,
+  0.24959579463572504, -0.22732064290721157, 1.4416194272738097
+);
+
+// linear_sRGB gamut for OKLab gamut approximation
+
+const sRGBGamut = OKGamut(
+  LMS_to_linear_sRGB_M,
+  vec2<f32>(-1.881703099326589, -0.8093650129914314),
+  vec2<f32>(1.8144407988010973, -1.1944526678052334),
+  vec4<f32>(2.9891157406060245, 4.96334598553074, 2.206639458668394, 2.1032506646275313),
+  vec4<f32>(0.7554589746731846, -0.4878927163778485, 0.09919949472127884, 0.13824256155269649),
+  vec4<f32>(1.4013440255372653, -0.014161344368060245, -1.194898981054734, -0.531950504704548),
+  vec3<f32>(2.4558850066611626, -0.1663740069568356, 0.013140382333963183)
+);
+
+// linear_DisplayP3 gamut for OKLab gamut approximation
+
+const DisplayP3Gamut = OKGamut(
+  LMS_to_linear_DisplayP3_M,
+  vec2<f32>(-1.7723439275129804, -0.8207587433674068),
+  vec2<f32>(1.8031987175305477, -1.1932813966558917),
+  vec4<f32>(3.0655383776740712, 4.850774766861289, 2.170391228588169, 1.9889988629068966),
+  vec4<f32>(0.785986991117241, -0.48301887731220305, 0.1269537528410884, 0.15434100134244236),
+  vec4<f32>(1.5634048474400246, -0.03752356642820185, -1.325410878723415, -0.582197351108397),
+  vec3<f32>(2.318674112913799, -0.18801574739070043, 0.033280197615848106)
+);
+
+// linear_Rec2020 gamut for OKLab gamut approximation
+
+const Rec2020Gamut = OKGamut(
+  LMS_to_linear_Rec2020_M,
+  vec2<f32>(-1.3683489920695084, -0.4666477292401159),
+  vec2<f32>(2.01150796193428, -2.0379095965347),
+  vec4<f32>(6.453444279433296, 11.179759749877057, 3.7164025468775352, 5.086745856787387),
+  vec4<f32>(0.9864450167496069, -0.6579210622753912, 0.28716974174265975, 0.2008454654526125),
+  vec4<f32>(1.7822722002966511, -0.06902276996914065, -1.53732053978465, -0.7070147842646063),
+  vec3<f32>(3.8846747338283327, -0.3607882951692005, 0.06466835622466632)
+);
+
+// linear_A98RGB gamut for OKLab gamut approximation
+
+const A98RGBGamut = OKGamut(
+  LMS_to_linear_A98RGB_M,
+  vec2<f32>(-1.5916954144257986, -0.8395798483264382),
+  vec2<f32>(1.8144407988011027, -1.1944526678052367),
+  vec4<f32>(2.2691287826839255, 3.129830477854208, 1.4260941854190028, 1.1576635558342154),
+  vec4<f32>(0.7554590284841929, -0.48789280880279834, 0.09919954907563015, 0.1382426077559837),
+  vec4<f32>(1.5501111549451418, -0.054832423447136014, -1.3311999906609997, -0.6049437286547624),
+  vec3<f32>(1.3634535938496974, -0.16637407925498626, 0.05082235202381204)
+);
+
+// linear_ProPhotoRGB gamut for OKLab gamut approximation
+
+const ProPhotoRGBGamut = OKGamut(
+  LMS_to_linear_ProPhotoRGB_M,
+  vec2<f32>(-1.1186713796652372, 0.011574875053294414),
+  vec2<f32>(6.872475573760862, -16.341134102486432),
+  vec4<f32>(68.06787046924094, 140.6370870421406, -1.5538024885635915, 73.17257587955058),
+  vec4<f32>(3.2885956561375544, -2.021035629437008, 2.506290147499387, -0.8944297290019946),
+  vec4<f32>(1.938056700940937, -0.1194121513288262, -1.6801601786829106, -0.7830309568631597),
+  vec3<f32>(-1.4601712527859658, -2.046210509675173, 0.11201603090337163)
+);
+
+fn cbrt(x: f32) -> f32 {
+  return sign(x) * pow(abs(x), 1.0 / 3.0);
+}
+
+fn cbrt3(x: vec3<f32>) -> vec3<f32> {
+  return sign(x) * pow(abs(x), vec3<f32>(1.0 / 3.0));
+}
+
+// OKLab
+
+fn OKLab_to(OKLab: vec3<f32>, LMS_to_output: mat3x3<f32>) -> vec3<f32> {
+  let lms = OKLab_to_LMS_M * OKLab;
+  return LMS_to_output * (lms * lms * lms);
+}
+
+fn OKLab_from(color: vec3<f32>, input_to_LMS: mat3x3<f32>) -> vec3<f32> {
+  return LMS_to_OKLab_M * cbrt3(input_to_LMS * color);
+}
+
+fn OKLCH_to_OKLab(oklch: vec3<f32>) -> vec3<f32> {
+  let h = radians(oklch.z);
+  return vec3<f32>(oklch.x, oklch.y * cos(h), oklch.y * sin(h));
+}
+
+fn OKLab_to_OKLCH(oklab: vec3<f32>) -> vec3<f32> {
+  if (abs(oklab.y) < ACHROMATIC_EPSILON && abs(oklab.z) < ACHROMATIC_EPSILON) {
+    return vec3<f32>(oklab.x, 0.0, 0.0);
+  }
+  let hue = degrees(atan2(oklab.z, oklab.y));
+  return vec3<f32>(oklab.x, length(oklab.yz), select(hue, hue + 360.0, hue < 0.0));
+}
+
+// Transfer functions, the sRGB ones are also used by Display P3
+
+fn sRGBGammaToLinear(v: vec3<f32>) -> vec3<f32> {
+  let a = abs(v);
+  return select(v / 12.92, sign(v) * pow((a + 0.055) / 1.055, vec3<f32>(2.4)), a > vec3<f32>(0.04045));
+}
+
+fn sRGBLinearToGamma(v: vec3<f32>) -> vec3<f32> {
+  let a = abs(v);
+  return select(12.92 * v, sign(v) * (1.055 * pow(a, vec3<f32>(1.0 / 2.4)) - 0.055), a > vec3<f32>(0.0031308));
+}
+
+const REC2020_ALPHA: f32 = 1.09929682680944;
+const REC2020_BETA: f32 = 0.018053968510807;
+
+fn Rec2020ToLinear(v: vec3<f32>) -> vec3<f32> {
+  let power = pow((max(v, vec3<f32>(REC2020_BETA * 4.5)) + REC2020_ALPHA - 1.0) / REC2020_ALPHA, vec3<f32>(1.0 / 0.45));
+  return select(v / 4.5, power, v >= vec3<f32>(REC2020_BETA * 4.5));
+}
+
+fn Rec2020ToGamma(v: vec3<f32>) -> vec3<f32> {
+  let power = REC2020_ALPHA * pow(max(v, vec3<f32>(REC2020_BETA)), vec3<f32>(0.45)) - (REC2020_ALPHA - 1.0);
+  return select(4.5 * v, power, v >= vec3<f32>(REC2020_BETA));
+}
+
+fn A98RGBToLinear(v: vec3<f32>) -> vec3<f32> {
+  return sign(v) * pow(abs(v), vec3<f32>(563.0 / 256.0));
+}
+
+fn A98RGBToGamma(v: vec3<f32>) -> vec3<f32> {
+  return sign(v) * pow(abs(v), vec3<f32>(256.0 / 563.0));
+}
+
+const PROPHOTO_ET: f32 = 1.0 / 512.0;
+const PROPHOTO_ET2: f32 = 16.0 / 512.0;
+
+fn ProPhotoRGBToLinear(v: vec3<f32>) -> vec3<f32> {
+  return select(v / 16.0, pow(max(v, vec3<f32>(PROPHOTO_ET2)), vec3<f32>(1.8)), v >= vec3<f32>(PROPHOTO_ET2));
+}
+
+fn ProPhotoRGBToGamma(v: vec3<f32>) -> vec3<f32> {
+  return select(16.0 * v, pow(max(v, vec3<f32>(PROPHOTO_ET)), vec3<f32>(1.0 / 1.8)), v >= vec3<f32>(PROPHOTO_ET));
+}
+
+// Gamut approximation and mapping, hues are given as normalized a, b (a^2 + b^2 == 1)
+
+fn computeMaxSaturationOKLC(a: f32, b: f32, gamut: OKGamut) -> f32 {
+  // select the coefficients and LMS to RGB row of the component that goes below zero first
+  let m = gamut.LMS_to_RGB;
+  var k: vec4<f32>;
+  var k4: f32;
+  var w: vec3<f32>;
+  if (dot(gamut.dirR, vec2<f32>(a, b)) > 1.0) {
+    k = gamut.kR;
+    k4 = gamut.k4.x;
+    w = vec3<f32>(m[0][0], m[1][0], m[2][0]);
+  } else if (dot(gamut.dirG, vec2<f32>(a, b)) > 1.0) {
+    k = gamut.kG;
+    k4 = gamut.k4.y;
+    w = vec3<f32>(m[0][1], m[1][1], m[2][1]);
+  } else {
+    k = gamut.kB;
+    k4 = gamut.k4.z;
+    w = vec3<f32>(m[0][2], m[1][2], m[2][2]);
+  }
+
+  // approximate max saturation using a polynomial
+  let sat = k.x + k.y * a + k.z * b + k.w * (a * a) + k4 * a * b;
+
+  // then one step of Halley's method to get closer
+  let kLMS = OKLab_to_LMS_M * vec3<f32>(0.0, a, b);
+  let lms_ = 1.0 + sat * kLMS;
+  let lms = lms_ * lms_ * lms_;
+  let lmsdS = 3.0 * kLMS * lms_ * lms_;
+  let lmsdS2 = 6.0 * kLMS * kLMS * lms_;
+
+  let f = dot(w, lms);
+  let f1 = dot(w, lmsdS);
+  let f2 = dot(w, lmsdS2);
+  return sat - (f * f1) / (f1 * f1 - 0.5 * f * f2);
+}
+
+fn findCuspOKLCH(a: f32, b: f32, gamut: OKGamut) -> vec2<f32> {
+  // first, find the maximum saturation
+  let S_cusp = computeMaxSaturationOKLC(a, b, gamut);
+
+  // convert to linear RGB to find the first point where at least one of r, g or b >= 1
+  let rgb_at_max = OKLab_to(vec3<f32>(1.0, S_cusp * a, S_cusp * b), gamut.LMS_to_RGB);
+  let L_cusp = cbrt(1.0 / max(max(rgb_at_max.r, rgb_at_max.g), rgb_at_max.b));
+  return vec2<f32>(L_cusp, L_cusp * S_cusp);
+}
+
+fn findGamutIntersectionOKLCH(a: f32, b: f32, l1: f32, c1: f32, l0: f32, cusp: vec2<f32>, gamut: OKGamut) -> f32 {
+  // Finds the intersection t of the line L = L0 * (1 - t) + t * L1, C = t * C1 with the gamut
+  if ((l1 - l0) * cusp.y - (cusp.x - l0) * c1 <= 0.0) {
+    // lower half
+    let denom = c1 * cusp.x + cusp.y * (l0 - l1);
+    return select((cusp.y * l0) / denom, 0.0, denom == 0.0);
+  }
+
+  // upper half, first intersect with triangle
+  let denom = c1 * (cusp.x - 1.0) + cusp.y * (l0 - l1);
+  let t = select((cusp.y * (l0 - 1.0)) / denom, 0.0, denom == 0.0);
+
+  // then one step Halley's method
+  let kLMS = OKLab_to_LMS_M * vec3<f32>(0.0, a, b);
+  let lmsdt_ = (l1 - l0) + c1 * kLMS;
+
+  let L = l0 * (1.0 - t) + t * l1;
+  let C = t * c1;
+
+  let lms_ = L + C * kLMS;
+  let lms = lms_ * lms_ * lms_;
+  let lmsdt = 3.0 * lmsdt_ * lms_ * lms_;
+  let lmsdt2 = 6.0 * lmsdt_ * lmsdt_ * lms_;
+
+  let c_ = gamut.LMS_to_RGB * lms - 1.0;
+  let c1_ = gamut.LMS_to_RGB * lmsdt;
+  let c2_ = gamut.LMS_to_RGB * lmsdt2;
+
+  // the step to where a rising channel reaches 1, or a falling one 0, which wide gamuts such as
+  // ProPhoto RGB can reach above the cusp
+  let u = c1_ / (c1_ * c1_ - 0.5 * c_ * c2_);
+  let v_ = c_ + 1.0;
+  let u0 = c1_ / (c1_ * c1_ - 0.5 * v_ * c2_);
+  let steps = min(
+    select(vec3<f32>(FLOAT_MAX), -c_ * u, u >= vec3<f32>(0.0)),
+    select(vec3<f32>(FLOAT_MAX), -v_ * u0, u0 <= vec3<f32>(0.0))
+  );
+  return t + min(steps.x, min(steps.y, steps.z));
+}
+
+fn gamutMapOKLCH(oklch: vec3<f32>, gamut: OKGamut) -> vec3<f32> {
+  // Maps the OKLCH color towards the cusp lightness of its hue (MapToCuspL) until it lies
+  // within the gamut, returning the clipped linear RGB of the gamut
+  let lch = vec3<f32>(clamp(oklch.x, 0.0, 1.0), max(oklch.y, 0.0), oklch.z);
+  var rgb = OKLab_to(OKLCH_to_OKLab(lch), gamut.LMS_to_RGB);
+
+  if (any(rgb < vec3<f32>(0.0)) || any(rgb > vec3<f32>(1.0))) {
+    let h = radians(lch.z);
+    let a = cos(h);
+    let b = sin(h);
+    let cusp = findCuspOKLCH(a, b, gamut);
+    let LTarget = cusp.x;
+    let t = findGamutIntersectionOKLCH(a, b, lch.x, lch.y, LTarget, cusp, gamut);
+    let L = mix(LTarget, lch.x, t);
+    let C = lch.y * t;
+    rgb = OKLab_to(vec3<f32>(L, C * a, C * b), gamut.LMS_to_RGB);
+  }
+  return clamp(rgb, vec3<f32>(0.0), vec3<f32>(1.0));
+}
@@ -1,3 +1,5 @@
+import { vec3 } from "./util.js";
+import { deserialize, convert } from "./convert.js";
 import { XYZ, XYZD50 } from "./spaces/xyz.js";
 import { OKLab, OKLCH, OKHSV, OKHSL } from "./spaces/oklab.js";
 import { sRGB, sRGBLinear, sRGBGamut } from "./spaces/srgb.js";
@@ -8,7 +10,11 @@ import {
 } from "./spaces/display-p3.js";
 import { Rec2020, Rec2020Linear, Rec2020Gamut } from "./spaces/rec2020.js";
 import { A98RGB, A98RGBLinear, A98RGBGamut } from "./spaces/a98-rgb.js";
-import { ProPhotoRGB, ProPhotoRGBLinear } from "./spaces/prophoto-rgb.js";
+import {
+  ProPhotoRGB,
+  ProPhotoRGBLinear,
+  ProPhotoRGBGamut,
+} from "./spaces/prophoto-rgb.js";
 
 export * from "./spaces/xyz.js";
 export * from "./spaces/oklab.js";
@@ -40,5 +46,30 @@ export const listColorSpaces = () => {
 };
 
 export const listColorGamuts = () => {
-  return [sRGBGamut, DisplayP3Gamut, Rec2020Gamut, A98RGBGamut];
+  return [
+    sRGBGamut,
+    DisplayP3Gamut,
+    Rec2020Gamut,
+    A98RGBGamut,
+    ProPhotoRGBGamut,
+  ];
+};
+
+export const parse = (input, targetSpace, out = vec3()) => {
+  if (!targetSpace)
+    throw new Error(`must specify a target space to parse into`);
+
+  const { coords, id } = deserialize(input);
+  const space = listColorSpaces().find((f) => id === f.id);
+  if (!space) throw new Error(`could not find space with the id ${id}`);
+  const alpha = coords.length === 4 ? coords[3] : 1;
+
+  // convert the 3D coords into the output
+  convert(coords, space, targetSpace, out);
+
+  // store alpha
+  if (alpha !== 1) out[3] = alpha;
+  // reduce to 3D
+  if (alpha == 1 && out.length === 4) out.pop();
+  return out;
 };
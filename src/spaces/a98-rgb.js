@@ -5,15 +5,20 @@ import {
   linear_A98RGB_to_LMS_M,
   LMS_to_linear_A98RGB_M,
   OKLab_to_linear_A98RGB_coefficients,
-} from "../conversion_matrices.js";
+  OKLab_to_linear_A98RGB_st_mid_coefficients,
+  linear_A98RGB_to_linear_sRGB_M,
+  linear_A98RGB_to_linear_DisplayP3_M,
+  linear_A98RGB_to_linear_Rec2020_M,
+  linear_A98RGB_to_linear_ProPhotoRGB_M,
+} from "../matrices/a98-rgb.js";
 
-const A98RGBToLinear = (val) => {
+export const A98RGBToLinear = (val) => {
   let sign = val < 0 ? -1 : 1;
   let abs = Math.abs(val);
   return sign * Math.pow(abs, 563 / 256);
 };
 
-const A98RGBToGamma = (val) => {
+export const A98RGBToGamma = (val) => {
   let sign = val < 0 ? -1 : 1;
   let abs = Math.abs(val);
   return sign * Math.pow(abs, 256 / 563);
@@ -25,6 +30,13 @@ export const A98RGBLinear = {
   fromXYZ_M: XYZ_to_linear_A98RGB_M,
   toLMS_M: linear_A98RGB_to_LMS_M,
   fromLMS_M: LMS_to_linear_A98RGB_M,
+  toSpace_M: {
+    // direct matrices to other linear spaces, see convert()
+    "srgb-linear": linear_A98RGB_to_linear_sRGB_M,
+    "display-p3-linear": linear_A98RGB_to_linear_DisplayP3_M,
+    "rec2020-linear": linear_A98RGB_to_linear_Rec2020_M,
+    "prophoto-rgb-linear": linear_A98RGB_to_linear_ProPhotoRGB_M,
+  },
 };
 
 export const A98RGB = {
@@ -47,4 +59,5 @@ export const A98RGB = {
 export const A98RGBGamut = {
   space: A98RGB,
   coefficients: OKLab_to_linear_A98RGB_coefficients,
+  stMidCoefficients: OKLab_to_linear_A98RGB_st_mid_coefficients,
 };
@@ -4,7 +4,12 @@ import {
   LMS_to_linear_DisplayP3_M,
   XYZ_to_linear_DisplayP3_M,
   OKLab_to_linear_DisplayP3_coefficients,
-} from "../conversion_matrices.js";
+  OKLab_to_linear_DisplayP3_st_mid_coefficients,
+  linear_DisplayP3_to_linear_sRGB_M,
+  linear_DisplayP3_to_linear_Rec2020_M,
+  linear_DisplayP3_to_linear_A98RGB_M,
+  linear_DisplayP3_to_linear_ProPhotoRGB_M,
+} from "../matrices/display-p3.js";
 import { sRGBGammaToLinearVec3, sRGBLinearToGammaVec3 } from "./util.js";
 
 export const DisplayP3Linear = {
@@ -13,6 +18,13 @@ export const DisplayP3Linear = {
   fromXYZ_M: XYZ_to_linear_DisplayP3_M,
   toLMS_M: linear_DisplayP3_to_LMS_M,
   fromLMS_M: LMS_to_linear_DisplayP3_M,
+  toSpace_M: {
+    // direct matrices to other linear spaces, see convert()
+    "srgb-linear": linear_DisplayP3_to_linear_sRGB_M,
+    "rec2020-linear": linear_DisplayP3_to_linear_Rec2020_M,
+    "a98-rgb-linear": linear_DisplayP3_to_linear_A98RGB_M,
+    "prophoto-rgb-linear": linear_DisplayP3_to_linear_ProPhotoRGB_M,
+  },
 };
 
 export const DisplayP3 = {
@@ -25,4 +37,5 @@ export const DisplayP3 = {
 export const DisplayP3Gamut = {
   space: DisplayP3,
   coefficients: OKLab_to_linear_DisplayP3_coefficients,
+  stMidCoefficients: OKLab_to_linear_DisplayP3_st_mid_coefficients,
 };
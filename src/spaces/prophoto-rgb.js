@@ -2,15 +2,23 @@ import { vec3 } from "../util.js";
 import {
   linear_ProPhotoRGB_to_XYZ_M,
   XYZ_to_linear_ProPhotoRGB_M,
-} from "../conversion_matrices.js";
-import { D50_to_D65_M, D65_to_D50_M } from "./xyz.js";
+  linear_ProPhotoRGB_to_LMS_M,
+  LMS_to_linear_ProPhotoRGB_M,
+  OKLab_to_linear_ProPhotoRGB_coefficients,
+  OKLab_to_linear_ProPhotoRGB_st_mid_coefficients,
+  linear_ProPhotoRGB_to_linear_sRGB_M,
+  linear_ProPhotoRGB_to_linear_DisplayP3_M,
+  linear_ProPhotoRGB_to_linear_Rec2020_M,
+  linear_ProPhotoRGB_to_linear_A98RGB_M,
+} from "../matrices/prophoto-rgb.js";
+import { D50_to_D65_M, D65_to_D50_M } from "../matrices/oklab.js";
 
 const Et = 1 / 512;
 const Et2 = 16 / 512;
 
 // Transfer curve is gamma 1.8 with a small linear portion
-const ProPhotoRGBToLinear = (v) => (v < Et2 ? v / 16 : v ** 1.8);
-const ProPhotoRGBToGamma = (v) => (v >= Et ? v ** (1 / 1.8) : 16 * v);
+export const ProPhotoRGBToLinear = (v) => (v < Et2 ? v / 16 : v ** 1.8);
+export const ProPhotoRGBToGamma = (v) => (v >= Et ? v ** (1 / 1.8) : 16 * v);
 
 // Note: below is a possibly improved transfer function proposed by CSS Module 4 spec
 // It is currently not matching the outputs of Colorjs.io when dealing with particular
@@ -45,6 +53,16 @@ export const ProPhotoRGBLinear = {
   // Note these are in D50
   toXYZ_M: linear_ProPhotoRGB_to_XYZ_M,
   fromXYZ_M: XYZ_to_linear_ProPhotoRGB_M,
+  // the LMS matrices have the adaptation folded in
+  toLMS_M: linear_ProPhotoRGB_to_LMS_M,
+  fromLMS_M: LMS_to_linear_ProPhotoRGB_M,
+  toSpace_M: {
+    // direct matrices to other linear spaces, see convert()
+    "srgb-linear": linear_ProPhotoRGB_to_linear_sRGB_M,
+    "display-p3-linear": linear_ProPhotoRGB_to_linear_DisplayP3_M,
+    "rec2020-linear": linear_ProPhotoRGB_to_linear_Rec2020_M,
+    "a98-rgb-linear": linear_ProPhotoRGB_to_linear_A98RGB_M,
+  },
 };
 
 export const ProPhotoRGB = {
@@ -64,9 +82,10 @@ export const ProPhotoRGB = {
   },
 };
 
-// Note: this is currently not supported, some overflows are occurring
-// in the python script. Please file an issue or PR if you think you can help.
-// export const ProPhotoRGBGamut = {
-//   space: ProPhotoRGB,
-//   coefficients: OKLab_to_linear_ProPhotoRGB_coefficients,
-// };
+export const ProPhotoRGBGamut = {
+  space: ProPhotoRGB,
+  coefficients: OKLab_to_linear_ProPhotoRGB_coefficients,
+  stMidCoefficients: OKLab_to_linear_ProPhotoRGB_st_mid_coefficients,
+  // the R channel and the intersection near the yellow cusp need more steps
+  halleySteps: 3,
+};
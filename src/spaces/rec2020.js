@@ -5,15 +5,20 @@ import {
   LMS_to_linear_Rec2020_M,
   XYZ_to_linear_Rec2020_M,
   OKLab_to_linear_Rec2020_coefficients,
-} from "../conversion_matrices.js";
+  OKLab_to_linear_Rec2020_st_mid_coefficients,
+  linear_Rec2020_to_linear_sRGB_M,
+  linear_Rec2020_to_linear_DisplayP3_M,
+  linear_Rec2020_to_linear_A98RGB_M,
+  linear_Rec2020_to_linear_ProPhotoRGB_M,
+} from "../matrices/rec2020.js";
 
 const ALPHA = 1.09929682680944;
 const BETA = 0.018053968510807;
 
-const Rec2020ToLinear = (val) =>
+export const Rec2020ToLinear = (val) =>
   val < BETA * 4.5 ? val / 4.5 : Math.pow((val + ALPHA - 1) / ALPHA, 1 / 0.45);
 
-const Rec2020ToGamma = (val) =>
+export const Rec2020ToGamma = (val) =>
   val >= BETA ? ALPHA * Math.pow(val, 0.45) - (ALPHA - 1) : 4.5 * val;
 
 export const Rec2020Linear = {
@@ -22,6 +27,13 @@ export const Rec2020Linear = {
   fromXYZ_M: XYZ_to_linear_Rec2020_M,
   toLMS_M: linear_Rec2020_to_LMS_M,
   fromLMS_M: LMS_to_linear_Rec2020_M,
+  toSpace_M: {
+    // direct matrices to other linear spaces, see convert()
+    "srgb-linear": linear_Rec2020_to_linear_sRGB_M,
+    "display-p3-linear": linear_Rec2020_to_linear_DisplayP3_M,
+    "a98-rgb-linear": linear_Rec2020_to_linear_A98RGB_M,
+    "prophoto-rgb-linear": linear_Rec2020_to_linear_ProPhotoRGB_M,
+  },
 };
 
 export const Rec2020 = {
@@ -44,4 +56,5 @@ export const Rec2020 = {
 export const Rec2020Gamut = {
   space: Rec2020,
   coefficients: OKLab_to_linear_Rec2020_coefficients,
+  stMidCoefficients: OKLab_to_linear_Rec2020_st_mid_coefficients,
 };
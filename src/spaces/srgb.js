@@ -4,16 +4,31 @@ import {
   LMS_to_linear_sRGB_M,
   XYZ_to_linear_sRGB_M,
   OKLab_to_linear_sRGB_coefficients,
-} from "../conversion_matrices.js";
+  OKLab_to_linear_sRGB_st_mid_coefficients,
+  linear_sRGB_to_linear_DisplayP3_M,
+  linear_sRGB_to_linear_Rec2020_M,
+  linear_sRGB_to_linear_A98RGB_M,
+  linear_sRGB_to_linear_ProPhotoRGB_M,
+} from "../matrices/srgb.js";
 
 import { sRGBGammaToLinearVec3, sRGBLinearToGammaVec3 } from "./util.js";
 
+// the scalar transfer functions, shared with Display P3
+export { sRGBGammaToLinear, sRGBLinearToGamma } from "./util.js";
+
 export const sRGBLinear = {
   id: "srgb-linear",
   toXYZ_M: linear_sRGB_to_XYZ_M,
   fromXYZ_M: XYZ_to_linear_sRGB_M,
   toLMS_M: linear_sRGB_to_LMS_M,
   fromLMS_M: LMS_to_linear_sRGB_M,
+  toSpace_M: {
+    // direct matrices to other linear spaces, see convert()
+    "display-p3-linear": linear_sRGB_to_linear_DisplayP3_M,
+    "rec2020-linear": linear_sRGB_to_linear_Rec2020_M,
+    "a98-rgb-linear": linear_sRGB_to_linear_A98RGB_M,
+    "prophoto-rgb-linear": linear_sRGB_to_linear_ProPhotoRGB_M,
+  },
 };
 
 export const sRGB = {
@@ -26,4 +41,5 @@ export const sRGB = {
 export const sRGBGamut = {
   space: sRGB,
   coefficients: OKLab_to_linear_sRGB_coefficients,
+  stMidCoefficients: OKLab_to_linear_sRGB_st_mid_coefficients,
 };
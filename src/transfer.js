@@ -0,0 +1,56 @@
+import { vec3, hexToRGB } from "./util.js";
+import { sRGB_decode_LUT } from "./transfer_luts.js";
+
+export const createDecodeLUT = (toLinear, bits = 8) => {
+  // A table of the linear value of every code value of the given bit depth,
+  // e.g. createDecodeLUT(sRGBGammaToLinear, 16) for 16-bit sRGB inputs
+  const max = (1 << bits) - 1;
+  const lut = new Float64Array(max + 1);
+  for (let i = 0; i <= max; i++) lut[i] = toLinear(i / max);
+  return lut;
+};
+
+export const decodeWithLUT = (
+  input,
+  lut,
+  out = new Float32Array(input.length)
+) => {
+  // Decodes an array of integer code values (such as a Uint8Array of pixels,
+  // or a Uint16Array with a 16-bit table) to linear light
+  for (let i = 0; i < input.length; i++) out[i] = lut[input[i]];
+  return out;
+};
+
+export const hexToLinearRGB = (str, out = vec3(), lut = sRGB_decode_LUT) => {
+  // hexToRGB, but decoded straight to linear light
+  hexToRGB(str, out);
+  out[0] = lut[Math.round(out[0] * 0xff)];
+  out[1] = lut[Math.round(out[1] * 0xff)];
+  out[2] = lut[Math.round(out[2] * 0xff)];
+  return out;
+};
+
+export const encodeWithLUT = (val, lut) => {
+  // Encodes a linear value with the interpolated encode tables of
+  // transfer_luts.js, which are sampled evenly in sqrt(val).
+  // Values are clamped to 0..1.
+  const size = lut.length - 1;
+  const x = Math.sqrt(val > 0 ? (val < 1 ? val : 1) : 0) * size;
+  const i = x < size ? Math.floor(x) : size - 1;
+  const a = lut[i];
+  return a + (lut[i + 1] - a) * (x - i);
+};
+
+export const encodeToIntegers = (
+  input,
+  lut,
+  out = new Uint8ClampedArray(input.length),
+  max = out.BYTES_PER_ELEMENT === 2 ? 0xffff : 0xff
+) => {
+  // Encodes an array of linear values to rounded integer code values, 8-bit
+  // by default or 16-bit when out is a Uint16Array
+  for (let i = 0; i < input.length; i++) {
+    out[i] = Math.round(encodeWithLUT(input[i], lut) * max);
+  }
+  return out;
+};
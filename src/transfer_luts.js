@@ -0,0 +1,1066 @@
+/** This file is auto-generated by tools/print_transfer_luts.py --encode-size 1024 */
+
+// sRGB and Display P3, linear values of the 8-bit code values 0 to 255
+export const sRGB_decode_LUT = [
+  0, 0.0003035269835488375, 0.000607053967097675, 0.0009105809506465125,
+  0.00121410793419535, 0.0015176349177441874, 0.001821161901293025,
+  0.0021246888848418626, 0.0024282158683907, 0.0027317428519395373,
+  0.003035269835488375, 0.0033465357638991604, 0.003676507324047436,
+  0.004024717018496307, 0.004391442037410293, 0.004776953480693729,
+  0.005181516702338385, 0.005605391624202723, 0.006048833022857054,
+  0.006512090792594474, 0.006995410187265387, 0.007499032043226175,
+  0.008023192985384994, 0.008568125618069307, 0.009134058702220785,
+  0.009721217320237847, 0.010329823029626936, 0.010960094006488244,
+  0.011612245179743887, 0.01228648835691587, 0.012983032342173012,
+  0.013702083047289686, 0.014443843596092545, 0.01520851442291271,
+  0.01599629336550963, 0.016807375752887384, 0.01764195448838408,
+  0.018500220128379697, 0.019382360956935723, 0.020288563056652397,
+  0.021219010376003555, 0.022173884793387385, 0.023153366178110413,
+  0.024157632448504752, 0.025186859627361627, 0.026241221894849898,
+  0.027320891639074894, 0.028426039504420793, 0.0295568344378088,
+  0.030713443732993638, 0.03189603307301153, 0.033104766570885055,
+  0.03433980680868217, 0.03560131487502034, 0.03688945040110003,
+  0.0382043715953465, 0.03954623527673283, 0.04091519690685319,
+  0.042311410620809675, 0.043735029256973465, 0.04518620438567554,
+  0.046665086336880095, 0.048171824226889426, 0.04970656598412723,
+  0.05126945837404324, 0.052860647023180246, 0.05448027644244237,
+  0.05612849004960009, 0.05780543019106722, 0.0595112381629812,
+  0.06124605423161761, 0.06301001765316767, 0.06480326669290577,
+  0.06662593864377288, 0.06847816984440017, 0.07036009569659589,
+  0.07227185068231748, 0.07421356838014963, 0.07618538148130784,
+  0.07818742180518633, 0.08021982031446831, 0.0822827071298148,
+  0.08437621154414882, 0.08650046203654976, 0.08865558628577294,
+  0.09084171118340768, 0.09305896284668747, 0.0953074666309647,
+  0.09758734714186244, 0.09989872824711389, 0.1022417330881013,
+  0.10461648409110419, 0.10702310297826761, 0.10946171077829932,
+  0.1119324278369056, 0.11443537382697373, 0.11697066775851084,
+  0.11953842798834562, 0.12213877222960187, 0.1247718175609505,
+  0.12743768043564743, 0.1301364766903643, 0.13286832155381795,
+  0.13563332965520566, 0.13843161503245185, 0.14126329114027164,
+  0.14412847085805777, 0.14702726649759498, 0.14995978981060856,
+  0.15292615199615017, 0.1559264637078274, 0.1589608350608804,
+  0.16202937563911096, 0.1651321945016676, 0.16826940018969075,
+  0.17144110073282257, 0.17464740365558504, 0.17788841598362914,
+  0.18116424424986022, 0.184474994500441, 0.18782077230067787,
+  0.1912016827407914, 0.1946178304415758, 0.19806931955994883,
+  0.20155625379439707, 0.20507873639031693, 0.20863687014525575,
+  0.21223075741405523, 0.21586050011389923, 0.2195261997292692,
+  0.2232279573168085, 0.22696587351009836, 0.23074004852434912,
+  0.23455058216100522, 0.238397573812271, 0.2422811224655549,
+  0.24620132670783548, 0.25015828472995344, 0.25415209433082675,
+  0.25818285292159576, 0.2622506575296962, 0.2663556048028624,
+  0.2704977910130658, 0.27467731206038465, 0.2788942634768104,
+  0.2831487404299921, 0.2874408377269175, 0.29177064981753587,
+  0.2961382707983211, 0.3005437944157765, 0.3049873140698863,
+  0.3094689228175085, 0.31398871337571754, 0.31854677812509186,
+  0.32314320911295075, 0.3277780980565422, 0.33245153634617935,
+  0.3371636150483303, 0.3419144249086609, 0.34670405635502954,
+  0.35153259950043936, 0.35640014414594356, 0.3613067797835095,
+  0.3662525955988395, 0.3712376804741491, 0.3762621229909065,
+  0.38132601143253014, 0.38642943378704897, 0.3915724777497232,
+  0.39675523072562685, 0.40197777983219574, 0.4072402119017367,
+  0.41254261348390375, 0.4178850708481375, 0.4232676699860717,
+  0.4286904966139066, 0.4341536361747489, 0.4396571738409188,
+  0.44520119451622786, 0.4507857828382234, 0.45641102318040466,
+  0.4620769996544071, 0.4677837961121589, 0.47353149614800955,
+  0.4793201831008268, 0.48514994005607043, 0.4910208498478356,
+  0.4969329950608704, 0.5028864580325687, 0.5088813208549338,
+  0.5149176653765214, 0.5209955732043543, 0.5271151257058131,
+  0.5332764040105051, 0.5394794890121071, 0.5457244613701866,
+  0.5520114015120001, 0.5583403896342679, 0.5647115057049292,
+  0.5711248294648731, 0.5775804404296505, 0.5840784178911641,
+  0.5906188409193368, 0.5972017883637634, 0.6038273388553377,
+  0.6104955708078648, 0.6172065624196511, 0.6239603916750761,
+  0.6307571363461467, 0.6375968739940325, 0.6444796819705821,
+  0.6514056374198242, 0.6583748172794485, 0.665387298282272, 0.6724431569576875,
+  0.6795424696330938, 0.6866853124353134, 0.6938717612919899,
+  0.7011018919329731, 0.7083757798916869, 0.7156935005064808,
+  0.7230551289219693, 0.7304607400903537, 0.737910408772731, 0.7454042095403874,
+  0.7529422167760779, 0.7605245046752924, 0.7681511472475071,
+  0.7758222183174236, 0.7835377915261934, 0.7912979403326302, 0.799102738014409,
+  0.8069522576692516, 0.8148465722161012, 0.8227857543962835,
+  0.8307698767746546, 0.83879901174074, 0.8468732315098579, 0.8549926081242337,
+  0.8631572134541023, 0.8713671191987972, 0.8796223968878317,
+  0.8879231178819663, 0.8962693533742664, 0.9046611743911496,
+  0.9130986517934192, 0.9215818562772946, 0.9301108583754237, 0.938685728457888,
+  0.9473065367331999, 0.9559733532492861, 0.9646862478944651,
+  0.9734452903984125, 0.9822505503331171, 0.9911020971138299, 1,
+];
+
+// sRGB and Display P3, encoded values of (i / 1024)^2 for i from 0 to 1024
+export const sRGB_encode_LUT = [
+  0, 1.23214722e-5, 4.92858887e-5, 0.00011089325, 0.000197143555,
+  0.000308036804, 0.000443572998, 0.000603752136, 0.000788574219,
+  0.000998039246, 0.00123214722, 0.00149089813, 0.00177429199, 0.0020823288,
+  0.00241500854, 0.00277233124, 0.00315429687, 0.00356090546, 0.00399215698,
+  0.00444805145, 0.00492858887, 0.00543376923, 0.00596359253, 0.00651805878,
+  0.00709716797, 0.0077009201, 0.00832931519, 0.00898235321, 0.00966003418,
+  0.0103623581, 0.011089325, 0.0118409348, 0.0126171875, 0.0134180832,
+  0.0142436218, 0.0150938034, 0.0159686279, 0.0168680954, 0.0177922058,
+  0.0187409592, 0.0197143555, 0.0207123947, 0.0217350769, 0.022782402,
+  0.0238543701, 0.0249509811, 0.0260722351, 0.027218132, 0.0283886719,
+  0.0295838547, 0.0308036804, 0.0320481491, 0.0333172607, 0.0346110153,
+  0.0359294128, 0.0372724533, 0.0386401367, 0.0400324631, 0.0414256312,
+  0.0428090796, 0.0441886253, 0.045564344, 0.0469363089, 0.0483045905,
+  0.0496692569, 0.0510303739, 0.0523880053, 0.0537422124, 0.0550930549,
+  0.0564405905, 0.057784875, 0.0591259624, 0.0604639054, 0.0617987547,
+  0.0631305599, 0.0644593687, 0.0657852278, 0.0671081824, 0.0684282765,
+  0.0697455528, 0.0710600529, 0.0723718172, 0.0736808851, 0.0749872949,
+  0.076291084, 0.0775922887, 0.0788909445, 0.0801870858, 0.0814807465,
+  0.0827719593, 0.0840607563, 0.0853471688, 0.0866312273, 0.0879129617,
+  0.0891924011, 0.0904695739, 0.091744508, 0.0930172306, 0.0942877682,
+  0.0955561468, 0.0968223918, 0.0980865282, 0.0993485802, 0.100608572,
+  0.101866526, 0.103122466, 0.104376414, 0.105628392, 0.106878421, 0.108126522,
+  0.109372717, 0.110617025, 0.111859465, 0.113100059, 0.114338824, 0.115575779,
+  0.116810942, 0.118044333, 0.119275967, 0.120505863, 0.121734038, 0.122960508,
+  0.12418529, 0.1254084, 0.126629854, 0.127849667, 0.129067854, 0.130284432,
+  0.131499414, 0.132712814, 0.133924648, 0.13513493, 0.136343672, 0.13755089,
+  0.138756595, 0.139960802, 0.141163523, 0.142364771, 0.143564558, 0.144762898,
+  0.145959801, 0.14715528, 0.148349347, 0.149542014, 0.150733291, 0.15192319,
+  0.153111722, 0.154298898, 0.155484729, 0.156669225, 0.157852397, 0.159034255,
+  0.160214809, 0.16139407, 0.162572046, 0.163748749, 0.164924187, 0.166098369,
+  0.167271306, 0.168443006, 0.169613479, 0.170782733, 0.171950777, 0.17311762,
+  0.174283271, 0.175447738, 0.176611029, 0.177773153, 0.178934117, 0.18009393,
+  0.1812526, 0.182410135, 0.183566542, 0.184721829, 0.185876003, 0.187029072,
+  0.188181044, 0.189331926, 0.190481724, 0.191630446, 0.192778099, 0.19392469,
+  0.195070226, 0.196214713, 0.197358158, 0.198500568, 0.199641949, 0.200782308,
+  0.201921651, 0.203059984, 0.204197314, 0.205333647, 0.206468988, 0.207603345,
+  0.208736722, 0.209869126, 0.211000563, 0.212131038, 0.213260556, 0.214389125,
+  0.215516749, 0.216643433, 0.217769183, 0.218894006, 0.220017904, 0.221140886,
+  0.222262954, 0.223384115, 0.224504374, 0.225623735, 0.226742204, 0.227859786,
+  0.228976485, 0.230092307, 0.231207256, 0.232321337, 0.233434555, 0.234546914,
+  0.235658419, 0.236769075, 0.237878885, 0.238987856, 0.24009599, 0.241203292,
+  0.242309768, 0.24341542, 0.244520254, 0.245624273, 0.246727482, 0.247829885,
+  0.248931485, 0.250032288, 0.251132297, 0.252231516, 0.253329948, 0.254427599,
+  0.255524472, 0.25662057, 0.257715898, 0.258810458, 0.259904256, 0.260997295,
+  0.262089578, 0.263181108, 0.264271891, 0.265361929, 0.266451225, 0.267539784,
+  0.268627608, 0.269714701, 0.270801068, 0.27188671, 0.272971631, 0.274055835,
+  0.275139325, 0.276222105, 0.277304177, 0.278385545, 0.279466211, 0.28054618,
+  0.281625454, 0.282704037, 0.283781931, 0.284859139, 0.285935665, 0.287011512,
+  0.288086682, 0.289161179, 0.290235005, 0.291308163, 0.292380657, 0.293452489,
+  0.294523662, 0.295594179, 0.296664043, 0.297733256, 0.298801821, 0.299869741,
+  0.300937019, 0.302003657, 0.303069658, 0.304135025, 0.30519976, 0.306263866,
+  0.307327346, 0.308390201, 0.309452435, 0.310514051, 0.31157505, 0.312635435,
+  0.313695209, 0.314754374, 0.315812932, 0.316870887, 0.31792824, 0.318984993,
+  0.32004115, 0.321096712, 0.322151682, 0.323206062, 0.324259855, 0.325313062,
+  0.326365687, 0.32741773, 0.328469195, 0.329520084, 0.330570399, 0.331620141,
+  0.332669314, 0.33371792, 0.33476596, 0.335813436, 0.336860352, 0.337906708,
+  0.338952508, 0.339997752, 0.341042443, 0.342086584, 0.343130176, 0.344173221,
+  0.345215721, 0.346257678, 0.347299095, 0.348339973, 0.349380313, 0.350420119,
+  0.351459391, 0.352498133, 0.353536345, 0.354574029, 0.355611188, 0.356647824,
+  0.357683937, 0.358719531, 0.359754606, 0.360789165, 0.36182321, 0.362856741,
+  0.363889762, 0.364922273, 0.365954277, 0.366985775, 0.368016769, 0.369047261,
+  0.370077252, 0.371106744, 0.372135739, 0.373164239, 0.374192245, 0.375219758,
+  0.376246781, 0.377273315, 0.378299361, 0.379324922, 0.380349999, 0.381374593,
+  0.382398706, 0.38342234, 0.384445496, 0.385468176, 0.386490382, 0.387512114,
+  0.388533374, 0.389554165, 0.390574487, 0.391594342, 0.392613731, 0.393632656,
+  0.394651118, 0.39566912, 0.396686661, 0.397703745, 0.398720371, 0.399736543,
+  0.40075226, 0.401767525, 0.402782338, 0.403796702, 0.404810618, 0.405824086,
+  0.406837109, 0.407849688, 0.408861824, 0.409873519, 0.410884773, 0.411895588,
+  0.412905966, 0.413915908, 0.414925415, 0.415934489, 0.41694313, 0.41795134,
+  0.418959121, 0.419966473, 0.420973398, 0.421979897, 0.422985972, 0.423991623,
+  0.424996852, 0.42600166, 0.427006049, 0.428010019, 0.429013572, 0.430016709,
+  0.431019432, 0.432021741, 0.433023637, 0.434025122, 0.435026197, 0.436026863,
+  0.437027122, 0.438026974, 0.439026421, 0.440025463, 0.441024103, 0.44202234,
+  0.443020177, 0.444017614, 0.445014652, 0.446011293, 0.447007537, 0.448003386,
+  0.448998842, 0.449993904, 0.450988574, 0.451982853, 0.452976742, 0.453970243,
+  0.454963355, 0.455956082, 0.456948422, 0.457940378, 0.458931951, 0.459923141,
+  0.460913949, 0.461904377, 0.462894426, 0.463884096, 0.464873389, 0.465862306,
+  0.466850847, 0.467839014, 0.468826807, 0.469814229, 0.470801278, 0.471787957,
+  0.472774267, 0.473760208, 0.474745782, 0.475730989, 0.476715831, 0.477700307,
+  0.47868442, 0.479668171, 0.480651559, 0.481634586, 0.482617254, 0.483599562,
+  0.484581512, 0.485563105, 0.486544341, 0.487525222, 0.488505749, 0.489485922,
+  0.490465742, 0.49144521, 0.492424327, 0.493403094, 0.494381512, 0.495359581,
+  0.496337303, 0.497314678, 0.498291708, 0.499268392, 0.500244732, 0.50122073,
+  0.502196384, 0.503171698, 0.50414667, 0.505121303, 0.506095596, 0.507069552,
+  0.50804317, 0.509016451, 0.509989396, 0.510962007, 0.511934283, 0.512906226,
+  0.513877837, 0.514849115, 0.515820063, 0.51679068, 0.517760968, 0.518730928,
+  0.519700559, 0.520669864, 0.521638842, 0.522607495, 0.523575822, 0.524543826,
+  0.525511507, 0.526478865, 0.527445901, 0.528412616, 0.529379012, 0.530345087,
+  0.531310844, 0.532276282, 0.533241404, 0.534206209, 0.535170697, 0.536134871,
+  0.53709873, 0.538062276, 0.539025509, 0.539988429, 0.540951038, 0.541913336,
+  0.542875324, 0.543837002, 0.544798371, 0.545759433, 0.546720187, 0.547680634,
+  0.548640775, 0.549600611, 0.550560143, 0.55151937, 0.552478294, 0.553436915,
+  0.554395235, 0.555353253, 0.55631097, 0.557268388, 0.558225506, 0.559182325,
+  0.560138846, 0.56109507, 0.562050998, 0.563006629, 0.563961965, 0.564917005,
+  0.565871752, 0.566826205, 0.567780366, 0.568734234, 0.56968781, 0.570641095,
+  0.57159409, 0.572546795, 0.573499211, 0.574451339, 0.575403178, 0.57635473,
+  0.577305995, 0.578256975, 0.579207668, 0.580158077, 0.581108201, 0.582058042,
+  0.583007599, 0.583956874, 0.584905867, 0.585854579, 0.586803009, 0.58775116,
+  0.588699031, 0.589646622, 0.590593936, 0.591540971, 0.592487729, 0.59343421,
+  0.594380415, 0.595326344, 0.596271999, 0.597217378, 0.598162484, 0.599107316,
+  0.600051876, 0.600996163, 0.601940178, 0.602883922, 0.603827395, 0.604770598,
+  0.605713532, 0.606656197, 0.607598593, 0.608540721, 0.609482581, 0.610424175,
+  0.611365502, 0.612306563, 0.61324736, 0.614187891, 0.615128158, 0.616068161,
+  0.6170079, 0.617947378, 0.618886592, 0.619825545, 0.620764237, 0.621702669,
+  0.62264084, 0.623578751, 0.624516403, 0.625453796, 0.626390931, 0.627327809,
+  0.628264429, 0.629200793, 0.6301369, 0.631072752, 0.632008348, 0.632943689,
+  0.633878777, 0.63481361, 0.635748191, 0.636682518, 0.637616593, 0.638550416,
+  0.639483988, 0.640417309, 0.641350379, 0.642283199, 0.64321577, 0.644148092,
+  0.645080165, 0.646011991, 0.646943568, 0.647874898, 0.648805982, 0.649736819,
+  0.65066741, 0.651597756, 0.652527857, 0.653457714, 0.654387327, 0.655316696,
+  0.656245822, 0.657174705, 0.658103346, 0.659031745, 0.659959903, 0.66088782,
+  0.661815496, 0.662742932, 0.663670129, 0.664597087, 0.665523805, 0.666450286,
+  0.667376528, 0.668302533, 0.669228301, 0.670153833, 0.671079128, 0.672004188,
+  0.672929012, 0.673853601, 0.674777956, 0.675702076, 0.676625963, 0.677549617,
+  0.678473037, 0.679396226, 0.680319182, 0.681241906, 0.6821644, 0.683086662,
+  0.684008694, 0.684930496, 0.685852069, 0.686773412, 0.687694527, 0.688615413,
+  0.689536071, 0.690456501, 0.691376704, 0.69229668, 0.69321643, 0.694135954,
+  0.695055252, 0.695974325, 0.696893173, 0.697811796, 0.698730195, 0.699648371,
+  0.700566323, 0.701484052, 0.702401558, 0.703318843, 0.704235905, 0.705152746,
+  0.706069366, 0.706985765, 0.707901943, 0.708817902, 0.709733641, 0.710649161,
+  0.711564462, 0.712479544, 0.713394408, 0.714309055, 0.715223484, 0.716137696,
+  0.717051691, 0.71796547, 0.718879032, 0.71979238, 0.720705511, 0.721618428,
+  0.722531131, 0.723443619, 0.724355893, 0.725267954, 0.726179802, 0.727091436,
+  0.728002859, 0.728914069, 0.729825067, 0.730735854, 0.73164643, 0.732556795,
+  0.73346695, 0.734376894, 0.735286629, 0.736196155, 0.737105471, 0.738014579,
+  0.738923478, 0.739832169, 0.740740653, 0.741648929, 0.742556998, 0.74346486,
+  0.744372516, 0.745279966, 0.74618721, 0.747094249, 0.748001082, 0.748907711,
+  0.749814135, 0.750720356, 0.751626372, 0.752532185, 0.753437795, 0.754343202,
+  0.755248406, 0.756153408, 0.757058208, 0.757962807, 0.758867205, 0.759771401,
+  0.760675397, 0.761579192, 0.762482788, 0.763386184, 0.76428938, 0.765192377,
+  0.766095176, 0.766997776, 0.767900177, 0.768802381, 0.769704388, 0.770606197,
+  0.771507809, 0.772409225, 0.773310444, 0.774211467, 0.775112294, 0.776012926,
+  0.776913362, 0.777813604, 0.778713651, 0.779613504, 0.780513163, 0.781412628,
+  0.7823119, 0.783210979, 0.784109864, 0.785008558, 0.785907059, 0.786805368,
+  0.787703485, 0.788601411, 0.789499146, 0.79039669, 0.791294043, 0.792191207,
+  0.79308818, 0.793984963, 0.794881558, 0.795777963, 0.796674179, 0.797570206,
+  0.798466046, 0.799361697, 0.80025716, 0.801152436, 0.802047525, 0.802942427,
+  0.803837142, 0.804731671, 0.805626014, 0.806520171, 0.807414142, 0.808307928,
+  0.809201529, 0.810094946, 0.810988178, 0.811881225, 0.812774089, 0.813666769,
+  0.814559265, 0.815451578, 0.816343709, 0.817235656, 0.818127422, 0.819019005,
+  0.819910406, 0.820801626, 0.821692665, 0.822583522, 0.823474198, 0.824364694,
+  0.82525501, 0.826145145, 0.827035101, 0.827924877, 0.828814474, 0.829703892,
+  0.830593131, 0.831482192, 0.832371074, 0.833259778, 0.834148304, 0.835036653,
+  0.835924825, 0.836812819, 0.837700637, 0.838588278, 0.839475743, 0.840363032,
+  0.841250144, 0.842137082, 0.843023844, 0.843910431, 0.844796843, 0.84568308,
+  0.846569143, 0.847455032, 0.848340747, 0.849226289, 0.850111657, 0.850996851,
+  0.851881873, 0.852766722, 0.853651399, 0.854535904, 0.855420236, 0.856304397,
+  0.857188386, 0.858072204, 0.858955851, 0.859839327, 0.860722632, 0.861605767,
+  0.862488732, 0.863371527, 0.864254152, 0.865136608, 0.866018894, 0.866901012,
+  0.867782961, 0.868664741, 0.869546353, 0.870427796, 0.871309072, 0.872190181,
+  0.873071121, 0.873951895, 0.874832502, 0.875712941, 0.876593215, 0.877473322,
+  0.878353263, 0.879233038, 0.880112647, 0.880992091, 0.88187137, 0.882750483,
+  0.883629432, 0.884508216, 0.885386836, 0.886265292, 0.887143584, 0.888021712,
+  0.888899676, 0.889777478, 0.890655116, 0.891532591, 0.892409904, 0.893287054,
+  0.894164042, 0.895040868, 0.895917532, 0.896794034, 0.897670376, 0.898546555,
+  0.899422574, 0.900298432, 0.90117413, 0.902049667, 0.902925044, 0.903800261,
+  0.904675319, 0.905550216, 0.906424955, 0.907299534, 0.908173954, 0.909048216,
+  0.909922319, 0.910796264, 0.91167005, 0.912543679, 0.91341715, 0.914290463,
+  0.915163619, 0.916036618, 0.91690946, 0.917782145, 0.918654674, 0.919527046,
+  0.920399262, 0.921271322, 0.922143227, 0.923014976, 0.923886569, 0.924758007,
+  0.925629291, 0.926500419, 0.927371393, 0.928242212, 0.929112878, 0.929983389,
+  0.930853746, 0.93172395, 0.932594, 0.933463897, 0.934333641, 0.935203232,
+  0.93607267, 0.936941956, 0.937811089, 0.938680071, 0.9395489, 0.940417577,
+  0.941286103, 0.942154478, 0.943022701, 0.943890774, 0.944758695, 0.945626466,
+  0.946494086, 0.947361556, 0.948228876, 0.949096046, 0.949963066, 0.950829937,
+  0.951696658, 0.95256323, 0.953429653, 0.954295927, 0.955162052, 0.956028029,
+  0.956893858, 0.957759538, 0.958625071, 0.959490456, 0.960355693, 0.961220782,
+  0.962085725, 0.96295052, 0.963815168, 0.96467967, 0.965544025, 0.966408234,
+  0.967272296, 0.968136213, 0.968999983, 0.969863608, 0.970727088, 0.971590422,
+  0.97245361, 0.973316654, 0.974179553, 0.975042307, 0.975904917, 0.976767383,
+  0.977629704, 0.978491881, 0.979353915, 0.980215804, 0.981077551, 0.981939154,
+  0.982800614, 0.98366193, 0.984523104, 0.985384136, 0.986245025, 0.987105771,
+  0.987966375, 0.988826838, 0.989687158, 0.990547337, 0.991407374, 0.99226727,
+  0.993127025, 0.993986639, 0.994846112, 0.995705444, 0.996564636, 0.997423687,
+  0.998282598, 0.999141369, 1,
+];
+
+// Rec. 2020, linear values of the 8-bit code values 0 to 255
+export const Rec2020_decode_LUT = [
+  0, 0.0008714596949891067, 0.0017429193899782135, 0.00261437908496732,
+  0.003485838779956427, 0.004357298474945533, 0.00522875816993464,
+  0.006100217864923747, 0.006971677559912854, 0.00784313725490196,
+  0.008714596949891067, 0.009586056644880174, 0.01045751633986928,
+  0.011328976034858388, 0.012200435729847494, 0.013071895424836602,
+  0.013943355119825708, 0.014814814814814815, 0.01568627450980392,
+  0.016557734204793027, 0.017429193899782133, 0.018301580944001375,
+  0.019191196302792094, 0.020104089077333923, 0.02104036769936563,
+  0.022000138868874086, 0.022983507616046204, 0.02399057735982645,
+  0.025021449963327, 0.026076225786316864, 0.027155003734995416,
+  0.028257881309237825, 0.029384954647483984, 0.03053631856942796,
+  0.03171206661665195, 0.032912291091337184, 0.03413708309317337,
+  0.035386532554578805, 0.03666072827433485, 0.03795975794972998,
+  0.039283708207301746, 0.04063266463225955, 0.042006711796662384,
+  0.043405933286423504, 0.044830411727206906, 0.04628022880927653,
+  0.04775546531135521, 0.049256201123545985, 0.05078251526936555,
+  0.05233448592693549, 0.053912190449375105, 0.05551570538443556,
+  0.05714510649341376, 0.058800468769381005, 0.06048186645476015,
+  0.06218937305828219, 0.06392306137135176, 0.06568300348384971,
+  0.06746927079939753, 0.06928193405011018, 0.07112106331085843,
+  0.07298672801306363, 0.07487899695804567, 0.0767979383299428,
+  0.07874361970822266, 0.08071610807980109, 0.0827154698507861,
+  0.08474177085786161, 0.08679507637932696, 0.08887545114580511,
+  0.09098295935063368, 0.09311766465995072, 0.09527963022248882,
+  0.09746891867908652, 0.09968559217193027, 0.10192971235353565,
+  0.104201340395479, 0.1065005369968875, 0.10882736239269795,
+  0.11118187636169172, 0.11356413823431478, 0.11597420690029019,
+  0.11841214081603024, 0.12087799801185621, 0.12337183609903121,
+  0.12589371227661408, 0.12844368333813888, 0.13102180567812766,
+  0.13362813529844045, 0.13626272781446944, 0.13892563846118144,
+  0.14161692209901347, 0.1443366332196285, 0.14708482595153247,
+  0.1498615540655592, 0.1526668709802277, 0.15550082976697394,
+  0.15836348315526347, 0.16125488353758627, 0.1641750829743393,
+  0.1671241331985988, 0.17010208562078696, 0.173108991333235,
+  0.17614490111464556, 0.17920986543446007, 0.18230393445712967,
+  0.1854271580462956, 0.18857958576888106, 0.19176126689909603,
+  0.19497225042235888, 0.19821258503913605, 0.20148231916870296,
+  0.2047815009528274, 0.20811017825937886, 0.21146839868586412,
+  0.21485620956289286, 0.2182736579575739, 0.2217207906768443,
+  0.22519765427073352, 0.22870429503556428, 0.23224075901709054,
+  0.2358070920135763, 0.23940333957881532, 0.2430295470250931,
+  0.2466857594260945, 0.25037202161975547, 0.25408837821106356,
+  0.25783487357480467, 0.26161155185826146, 0.26541845698386224,
+  0.26925563265178076, 0.2731231223424909, 0.277020969319275,
+  0.2809492166306874, 0.2849079071129758, 0.288897083392459,
+  0.29291678788786396, 0.2969670628126218, 0.30104795017712543,
+  0.3051594917909475, 0.30930172926502175, 0.3134747040137867,
+  0.31767845725729355, 0.32191303002328, 0.326178463149208, 0.3304747972842693,
+  0.3348020728913574, 0.3391603302490083, 0.3435496094533087,
+  0.3479699504197741, 0.3524213928851974, 0.35690397640946697,
+  0.3614177403773567, 0.36596272400028773, 0.3705389663180634,
+  0.37514650620057527, 0.37978538234948517, 0.3844556332998791,
+  0.38915729742189814, 0.3938904129223428, 0.3986550178462535,
+  0.40345115007846843, 0.408278847345156, 0.41313814721532627,
+  0.41802908710232006, 0.4229517042652735, 0.42790603581056535,
+  0.43289211869324024, 0.43790998971841133, 0.44295968554264437,
+  0.4480412426753205, 0.4531546974799809, 0.4583000861756504,
+  0.46347744483814457, 0.4686868094013569, 0.4739282156585292,
+  0.47920169926350287, 0.4845072957319539, 0.4898450404426113,
+  0.49521496863845715, 0.5006171154279119, 0.5060515157860026,
+  0.5115182045555166, 0.5170172164481375, 0.5225485860455681,
+  0.5281123478006382, 0.5337085360383959, 0.5393371849571859,
+  0.5449983286297148, 0.5506920010040989, 0.556418235904903, 0.5621770670341618,
+  0.5679685279723907, 0.5737926521795822, 0.5796494729961899,
+  0.5855390236441004, 0.5914613372275939, 0.5974164467342886, 0.603404385036079,
+  0.6094251848900587, 0.6154788789394325, 0.6215654997144173,
+  0.6276850796331329, 0.6338376510024798, 0.6400232460190087,
+  0.6462418967697774, 0.652493635233199, 0.6587784932798784, 0.6650965026734394,
+  0.6714476950713434, 0.6778321020256947, 0.6842497549840402,
+  0.6907006852901574, 0.6971849241848344, 0.7037025028066389,
+  0.7102534521926807, 0.7168378032793631, 0.7234555869031281,
+  0.7301068338011901, 0.7367915746122635, 0.7435098398772821,
+  0.7502616600401067, 0.7570470654482304, 0.7638660863534722,
+  0.7707187529126627, 0.7776050951883239, 0.7845251431493402,
+  0.7914789266716237, 0.7984664755387689, 0.8054878194427023,
+  0.8125429879843273, 0.8196320106741566, 0.8267549169329418, 0.833911736092295,
+  0.8411024973953042, 0.8483272299971405, 0.8555859629656605,
+  0.8628787252820025, 0.8702055458411739, 0.8775664534526355,
+  0.8849614768408772, 0.89239064464599, 0.8998539854242292, 0.9073515276485735,
+  0.9148832997092796, 0.9224493299144272, 0.9300496464904622,
+  0.9376842775827318, 0.9453532512560169, 0.9530565954950548,
+  0.9607943382050612, 0.9685665072122434, 0.9763731302643119, 0.98421423503098,
+  0.9920898491044696, 1.0000000000000004,
+];
+
+// Rec. 2020, encoded values of (i / 1024)^2 for i from 0 to 1024
+export const Rec2020_encode_LUT = [
+  0, 4.29153442e-6, 1.71661377e-5, 3.86238098e-5, 6.86645508e-5, 0.000107288361,
+  0.000154495239, 0.000210285187, 0.000274658203, 0.000347614288,
+  0.000429153442, 0.000519275665, 0.000617980957, 0.000725269318,
+  0.000841140747, 0.000965595245, 0.00109863281, 0.00124025345, 0.00139045715,
+  0.00154924393, 0.00171661377, 0.00189256668, 0.00207710266, 0.00227022171,
+  0.00247192383, 0.00268220901, 0.00290107727, 0.00312852859, 0.00336456299,
+  0.00360918045, 0.00386238098, 0.00412416458, 0.00439453125, 0.00467348099,
+  0.00496101379, 0.00525712967, 0.00556182861, 0.00587511063, 0.00619697571,
+  0.00652742386, 0.00686645508, 0.00721406937, 0.00757026672, 0.00793504715,
+  0.00830841064, 0.00869035721, 0.00908088684, 0.00947999954, 0.00988769531,
+  0.0103039742, 0.0107288361, 0.011162281, 0.0116043091, 0.0120549202,
+  0.0125141144, 0.0129818916, 0.013458252, 0.0139431953, 0.0144367218,
+  0.0149388313, 0.0154495239, 0.0159687996, 0.0164966583, 0.0170331001,
+  0.017578125, 0.0181317329, 0.018693924, 0.019264698, 0.0198440552,
+  0.0204319954, 0.0210285187, 0.021633625, 0.0222473145, 0.0228695869,
+  0.0235004425, 0.0241398811, 0.0247879028, 0.0254445076, 0.0261096954,
+  0.0267834663, 0.0274658203, 0.0281567574, 0.0288562775, 0.0295643806,
+  0.0302810669, 0.0310063362, 0.0317401886, 0.0324826241, 0.0332336426,
+  0.0339932442, 0.0347614288, 0.0355381966, 0.0363235474, 0.0371174812,
+  0.0379199982, 0.0387310982, 0.0395507812, 0.0403790474, 0.0412158966,
+  0.0420613289, 0.0429153442, 0.0437779427, 0.0446491241, 0.0455288887,
+  0.0464172363, 0.047314167, 0.0482196808, 0.0491337776, 0.0500564575,
+  0.0509877205, 0.0519275665, 0.0528759956, 0.0538330078, 0.0547986031,
+  0.0557727814, 0.0567555428, 0.0577468872, 0.0587468147, 0.0597553253,
+  0.060772419, 0.0617980957, 0.0628323555, 0.0638751984, 0.0649266243,
+  0.0659866333, 0.0670552254, 0.0681324005, 0.0692181587, 0.0703125,
+  0.0714154243, 0.0725269318, 0.0736470222, 0.0747756958, 0.0759129524,
+  0.0770587921, 0.0782132149, 0.0793762207, 0.0805478096, 0.0817271874,
+  0.0829073522, 0.0840866682, 0.0852651422, 0.0864427806, 0.08761959,
+  0.0887955768, 0.0899707472, 0.0911451073, 0.0923186634, 0.0934914215,
+  0.0946633873, 0.0958345669, 0.097004966, 0.0981745902, 0.0993434451,
+  0.100511536, 0.101678869, 0.102845449, 0.104011282, 0.105176372, 0.106340725,
+  0.107504346, 0.10866724, 0.109829412, 0.110990867, 0.112151609, 0.113311644,
+  0.114470976, 0.115629609, 0.116787549, 0.117944801, 0.119101367, 0.120257254,
+  0.121412464, 0.122567003, 0.123720875, 0.124874084, 0.126026635, 0.12717853,
+  0.128329775, 0.129480374, 0.130630329, 0.131779647, 0.132928329, 0.13407638,
+  0.135223804, 0.136370605, 0.137516786, 0.138662351, 0.139807303, 0.140951647,
+  0.142095385, 0.143238522, 0.14438106, 0.145523003, 0.146664355, 0.147805118,
+  0.148945297, 0.150084894, 0.151223912, 0.152362356, 0.153500228, 0.154637531,
+  0.155774268, 0.156910442, 0.158046057, 0.159181116, 0.160315621, 0.161449575,
+  0.162582982, 0.163715844, 0.164848164, 0.165979945, 0.167111189, 0.1682419,
+  0.169372081, 0.170501733, 0.17163086, 0.172759465, 0.173887549, 0.175015116,
+  0.176142169, 0.177268709, 0.17839474, 0.179520263, 0.180645282, 0.181769799,
+  0.182893816, 0.184017336, 0.185140361, 0.186262893, 0.187384936, 0.18850649,
+  0.18962756, 0.190748146, 0.191868251, 0.192987878, 0.194107028, 0.195225705,
+  0.196343909, 0.197461644, 0.198578911, 0.199695713, 0.200812051, 0.201927928,
+  0.203043346, 0.204158307, 0.205272813, 0.206386866, 0.207500468, 0.208613621,
+  0.209726327, 0.210838589, 0.211950407, 0.213061784, 0.214172722, 0.215283222,
+  0.216393287, 0.217502919, 0.218612119, 0.219720889, 0.220829231, 0.221937147,
+  0.223044638, 0.224151707, 0.225258355, 0.226364584, 0.227470395, 0.228575791,
+  0.229680773, 0.230785343, 0.231889502, 0.232993252, 0.234096595, 0.235199533,
+  0.236302066, 0.237404198, 0.238505928, 0.23960726, 0.240708194, 0.241808732,
+  0.242908875, 0.244008626, 0.245107985, 0.246206955, 0.247305536, 0.248403731,
+  0.24950154, 0.250598966, 0.251696009, 0.252792672, 0.253888955, 0.25498486,
+  0.256080388, 0.257175542, 0.258270321, 0.259364729, 0.260458765, 0.261552432,
+  0.262645731, 0.263738663, 0.264831229, 0.265923432, 0.267015271, 0.268106749,
+  0.269197867, 0.270288626, 0.271379028, 0.272469073, 0.273558763, 0.274648099,
+  0.275737083, 0.276825716, 0.277913999, 0.279001933, 0.280089519, 0.281176759,
+  0.282263654, 0.283350205, 0.284436414, 0.285522281, 0.286607807, 0.287692995,
+  0.288777844, 0.289862357, 0.290946533, 0.292030376, 0.293113884, 0.294197061,
+  0.295279906, 0.296362421, 0.297444608, 0.298526466, 0.299607998, 0.300689203,
+  0.301770085, 0.302850642, 0.303930877, 0.305010791, 0.306090384, 0.307169658,
+  0.308248614, 0.309327252, 0.310405574, 0.311483581, 0.312561273, 0.313638652,
+  0.31471572, 0.315792475, 0.316868921, 0.317945057, 0.319020885, 0.320096406,
+  0.32117162, 0.322246529, 0.323321133, 0.324395434, 0.325469432, 0.326543129,
+  0.327616525, 0.328689621, 0.329762418, 0.330834917, 0.33190712, 0.332979026,
+  0.334050636, 0.335121953, 0.336192976, 0.337263706, 0.338334145, 0.339404293,
+  0.340474151, 0.34154372, 0.342613, 0.343681993, 0.3447507, 0.345819121,
+  0.346887257, 0.347955109, 0.349022677, 0.350089964, 0.351156968, 0.352223692,
+  0.353290136, 0.354356301, 0.355422188, 0.356487797, 0.357553129, 0.358618186,
+  0.359682967, 0.360747474, 0.361811707, 0.362875667, 0.363939355, 0.365002772,
+  0.366065919, 0.367128795, 0.368191403, 0.369253742, 0.370315814, 0.371377619,
+  0.372439157, 0.373500431, 0.374561439, 0.375622184, 0.376682666, 0.377742885,
+  0.378802843, 0.379862539, 0.380921975, 0.381981152, 0.383040069, 0.384098729,
+  0.38515713, 0.386215275, 0.387273164, 0.388330797, 0.389388176, 0.3904453,
+  0.391502171, 0.392558789, 0.393615154, 0.394671269, 0.395727132, 0.396782746,
+  0.397838109, 0.398893224, 0.399948091, 0.40100271, 0.402057082, 0.403111208,
+  0.404165088, 0.405218723, 0.406272114, 0.407325261, 0.408378164, 0.409430825,
+  0.410483245, 0.411535422, 0.412587359, 0.413639056, 0.414690513, 0.415741732,
+  0.416792712, 0.417843454, 0.418893959, 0.419944228, 0.42099426, 0.422044057,
+  0.42309362, 0.424142948, 0.425192042, 0.426240903, 0.427289532, 0.428337929,
+  0.429386094, 0.430434029, 0.431481733, 0.432529208, 0.433576453, 0.43462347,
+  0.435670258, 0.436716819, 0.437763153, 0.438809261, 0.439855143, 0.440900799,
+  0.44194623, 0.442991437, 0.444036421, 0.445081181, 0.446125718, 0.447170033,
+  0.448214127, 0.449257999, 0.450301651, 0.451345082, 0.452388294, 0.453431286,
+  0.45447406, 0.455516616, 0.456558955, 0.457601076, 0.45864298, 0.459684668,
+  0.460726141, 0.461767399, 0.462808441, 0.46384927, 0.464889885, 0.465930287,
+  0.466970476, 0.468010453, 0.469050218, 0.470089771, 0.471129114, 0.472168246,
+  0.473207169, 0.474245882, 0.475284386, 0.476322682, 0.477360769, 0.478398649,
+  0.479436322, 0.480473788, 0.481511048, 0.482548102, 0.483584951, 0.484621595,
+  0.485658034, 0.48669427, 0.487730302, 0.48876613, 0.489801756, 0.49083718,
+  0.491872402, 0.492907423, 0.493942242, 0.494976862, 0.496011281, 0.4970455,
+  0.49807952, 0.499113341, 0.500146964, 0.501180389, 0.502213616, 0.503246646,
+  0.50427948, 0.505312117, 0.506344558, 0.507376803, 0.508408854, 0.50944071,
+  0.510472371, 0.511503839, 0.512535113, 0.513566194, 0.514597082, 0.515627778,
+  0.516658282, 0.517688594, 0.518718716, 0.519748646, 0.520778386, 0.521807937,
+  0.522837297, 0.523866469, 0.524895451, 0.525924246, 0.526952852, 0.52798127,
+  0.529009501, 0.530037546, 0.531065403, 0.532093075, 0.53312056, 0.534147861,
+  0.535174976, 0.536201906, 0.537228652, 0.538255214, 0.539281593, 0.540307788,
+  0.5413338, 0.54235963, 0.543385277, 0.544410743, 0.545436027, 0.54646113,
+  0.547486053, 0.548510795, 0.549535356, 0.550559738, 0.551583941, 0.552607965,
+  0.55363181, 0.554655476, 0.555678965, 0.556702276, 0.557725409, 0.558748366,
+  0.559771146, 0.560793749, 0.561816177, 0.562838429, 0.563860505, 0.564882407,
+  0.565904134, 0.566925687, 0.567947065, 0.56896827, 0.569989301, 0.57101016,
+  0.572030846, 0.573051359, 0.5740717, 0.57509187, 0.576111868, 0.577131695,
+  0.578151351, 0.579170837, 0.580190152, 0.581209298, 0.582228274, 0.58324708,
+  0.584265718, 0.585284188, 0.586302488, 0.587320621, 0.588338586, 0.589356384,
+  0.590374015, 0.591391478, 0.592408776, 0.593425907, 0.594442872, 0.595459671,
+  0.596476306, 0.597492775, 0.598509079, 0.599525219, 0.600541195, 0.601557007,
+  0.602572656, 0.603588141, 0.604603463, 0.605618623, 0.60663362, 0.607648455,
+  0.608663128, 0.609677639, 0.61069199, 0.611706179, 0.612720208, 0.613734076,
+  0.614747784, 0.615761332, 0.61677472, 0.617787949, 0.61880102, 0.619813931,
+  0.620826684, 0.621839278, 0.622851715, 0.623863994, 0.624876116, 0.62588808,
+  0.626899887, 0.627911538, 0.628923033, 0.629934371, 0.630945554, 0.631956581,
+  0.632967453, 0.63397817, 0.634988732, 0.635999139, 0.637009392, 0.638019492,
+  0.639029437, 0.640039229, 0.641048868, 0.642058354, 0.643067687, 0.644076868,
+  0.645085896, 0.646094773, 0.647103498, 0.648112071, 0.649120493, 0.650128765,
+  0.651136885, 0.652144855, 0.653152675, 0.654160345, 0.655167865, 0.656175236,
+  0.657182458, 0.65818953, 0.659196454, 0.660203229, 0.661209856, 0.662216335,
+  0.663222666, 0.66422885, 0.665234886, 0.666240776, 0.667246518, 0.668252114,
+  0.669257564, 0.670262867, 0.671268024, 0.672273036, 0.673277902, 0.674282624,
+  0.6752872, 0.676291631, 0.677295918, 0.678300061, 0.679304059, 0.680307914,
+  0.681311625, 0.682315193, 0.683318618, 0.6843219, 0.685325039, 0.686328035,
+  0.687330889, 0.688333602, 0.689336172, 0.690338601, 0.691340888, 0.692343034,
+  0.69334504, 0.694346904, 0.695348629, 0.696350212, 0.697351656, 0.69835296,
+  0.699354124, 0.700355149, 0.701356035, 0.702356781, 0.703357389, 0.704357858,
+  0.705358189, 0.706358382, 0.707358437, 0.708358354, 0.709358133, 0.710357775,
+  0.711357281, 0.712356649, 0.71335588, 0.714354975, 0.715353934, 0.716352756,
+  0.717351443, 0.718349994, 0.71934841, 0.72034669, 0.721344835, 0.722342845,
+  0.723340721, 0.724338462, 0.725336069, 0.726333542, 0.727330881, 0.728328086,
+  0.729325157, 0.730322096, 0.731318901, 0.732315574, 0.733312114, 0.734308521,
+  0.735304796, 0.736300938, 0.737296949, 0.738292828, 0.739288576, 0.740284192,
+  0.741279677, 0.742275031, 0.743270255, 0.744265347, 0.74526031, 0.746255142,
+  0.747249844, 0.748244416, 0.749238859, 0.750233172, 0.751227355, 0.75222141,
+  0.753215336, 0.754209133, 0.755202801, 0.756196341, 0.757189753, 0.758183037,
+  0.759176193, 0.760169221, 0.761162122, 0.762154896, 0.763147543, 0.764140062,
+  0.765132455, 0.766124721, 0.767116861, 0.768108875, 0.769100762, 0.770092524,
+  0.77108416, 0.772075671, 0.773067056, 0.774058316, 0.775049451, 0.776040461,
+  0.777031347, 0.778022108, 0.779012745, 0.780003257, 0.780993646, 0.781983911,
+  0.782974052, 0.78396407, 0.784953965, 0.785943736, 0.786933385, 0.78792291,
+  0.788912314, 0.789901594, 0.790890753, 0.791879789, 0.792868703, 0.793857496,
+  0.794846167, 0.795834716, 0.796823144, 0.797811451, 0.798799638, 0.799787703,
+  0.800775648, 0.801763472, 0.802751176, 0.803738759, 0.804726223, 0.805713567,
+  0.806700791, 0.807687896, 0.808674882, 0.809661748, 0.810648495, 0.811635123,
+  0.812621633, 0.813608024, 0.814594296, 0.815580451, 0.816566487, 0.817552405,
+  0.818538206, 0.819523889, 0.820509454, 0.821494902, 0.822480233, 0.823465447,
+  0.824450544, 0.825435524, 0.826420388, 0.827405136, 0.828389767, 0.829374282,
+  0.830358681, 0.831342964, 0.832327132, 0.833311184, 0.83429512, 0.835278942,
+  0.836262648, 0.83724624, 0.838229717, 0.839213079, 0.840196327, 0.84117946,
+  0.842162479, 0.843145384, 0.844128176, 0.845110853, 0.846093417, 0.847075868,
+  0.848058205, 0.849040429, 0.85002254, 0.851004538, 0.851986423, 0.852968196,
+  0.853949856, 0.854931404, 0.85591284, 0.856894164, 0.857875376, 0.858856476,
+  0.859837464, 0.860818342, 0.861799107, 0.862779762, 0.863760305, 0.864740738,
+  0.86572106, 0.866701271, 0.867681372, 0.868661362, 0.869641242, 0.870621012,
+  0.871600672, 0.872580222, 0.873559663, 0.874538994, 0.875518215, 0.876497328,
+  0.877476331, 0.878455225, 0.87943401, 0.880412687, 0.881391254, 0.882369714,
+  0.883348065, 0.884326308, 0.885304442, 0.886282469, 0.887260388, 0.888238199,
+  0.889215903, 0.890193499, 0.891170988, 0.89214837, 0.893125645, 0.894102813,
+  0.895079874, 0.896056828, 0.897033676, 0.898010417, 0.898987052, 0.899963581,
+  0.900940004, 0.901916322, 0.902892533, 0.903868638, 0.904844639, 0.905820533,
+  0.906796323, 0.907772007, 0.908747587, 0.909723061, 0.910698431, 0.911673696,
+  0.912648856, 0.913623912, 0.914598864, 0.915573712, 0.916548455, 0.917523095,
+  0.918497631, 0.919472063, 0.920446392, 0.921420617, 0.922394739, 0.923368758,
+  0.924342673, 0.925316486, 0.926290196, 0.927263803, 0.928237308, 0.92921071,
+  0.93018401, 0.931157208, 0.932130303, 0.933103297, 0.934076188, 0.935048978,
+  0.936021666, 0.936994253, 0.937966738, 0.938939122, 0.939911405, 0.940883587,
+  0.941855667, 0.942827647, 0.943799527, 0.944771305, 0.945742983, 0.946714561,
+  0.947686039, 0.948657416, 0.949628693, 0.950599871, 0.951570948, 0.952541926,
+  0.953512804, 0.954483583, 0.955454263, 0.956424843, 0.957395324, 0.958365706,
+  0.959335989, 0.960306174, 0.961276259, 0.962246246, 0.963216135, 0.964185925,
+  0.965155617, 0.966125211, 0.967094707, 0.968064105, 0.969033405, 0.970002607,
+  0.970971712, 0.971940719, 0.972909629, 0.973878442, 0.974847157, 0.975815776,
+  0.976784297, 0.977752722, 0.97872105, 0.979689281, 0.980657416, 0.981625454,
+  0.982593396, 0.983561242, 0.984528991, 0.985496645, 0.986464203, 0.987431665,
+  0.988399031, 0.989366302, 0.990333477, 0.991300557, 0.992267541, 0.993234431,
+  0.994201225, 0.995167924, 0.996134529, 0.997101038, 0.998067453, 0.999033774,
+  1,
+];
+
+// Adobe RGB (1998), linear values of the 8-bit code values 0 to 255
+export const A98RGB_decode_LUT = [
+  0, 5.099078671483812e-6, 2.341652914594477e-5, 5.711967424262048e-5,
+  0.00010753586531413878, 0.00017566273965993062, 0.00026231101790786317,
+  0.00036816895747529804, 0.0004938375903955528, 0.0006398522940681873,
+  0.0008066970384487688, 0.0009948143285116826, 0.0012046124392025707,
+  0.001436470856685494, 0.0016907444812659992, 0.0019677669462239717,
+  0.0022678532876009793, 0.0025913021261326917, 0.0029383974750064614,
+  0.003309410255569636, 0.0037045995815722516, 0.004124213857464306,
+  0.004568491725509798, 0.005037662888651404, 0.005531948830267067,
+  0.006051563447608698, 0.006596713612400069, 0.007167599669516945,
+  0.007764415882681334, 0.008387350834533189, 0.009036587787195636,
+  0.009712305008449062, 0.010414676067820225, 0.011143870106232969,
+  0.01190005208232596, 0.012683382998095929, 0.013494020106153163,
+  0.014332117100565768, 0.015197824293007858, 0.0160912887757068,
+  0.017012654572497083, 0.01796206277912934, 0.01893965169384597,
+  0.019945556939117898, 0.02097991157533513, 0.022042846207156467,
+  0.023134489083146997, 0.02425496618926588, 0.025404401336708245,
+  0.026582916244554392, 0.027790630617634114, 0.029027662219974663,
+  0.030294126944165396, 0.031590138876941384, 0.03291581036126018,
+  0.034271252055121625, 0.03565657298735818, 0.03707188061060398,
+  0.038517280851632404, 0.03999287815923695, 0.041498775549814924,
+  0.04303507465080135, 0.04460187574208814, 0.04619927779555349,
+  0.0478273785128165, 0.0494862743613236, 0.05117606060886511,
+  0.052896831356613175, 0.054648679570766114, 0.0564316971128772,
+  0.05824597476894147, 0.06009160227730834, 0.06196866835548361,
+  0.0638772607258799, 0.06581746614057064, 0.06778937040509939,
+  0.06979305840139279, 0.07182861410982205, 0.07389612063045582,
+  0.07599566020354347, 0.0781273142292669, 0.08029116328679532,
+  0.08248728715267621, 0.08471576481859314, 0.08697667450852044,
+  0.08927009369530116, 0.09159609911667511, 0.093954766790781,
+  0.0963461720311563, 0.09877038946125588, 0.10122749302851117,
+  0.10371755601794809, 0.10624065106538386, 0.10879685017021863,
+  0.11138622470783986, 0.11400884544165421, 0.11666478253476295,
+  0.11935410556129411, 0.12207688351740562, 0.12483318483197174,
+  0.12762307737696577, 0.13044662847754965, 0.1333039049218824,
+  0.13619497297065744, 0.1391198983663792, 0.14207874634238823,
+  0.14507158163164444, 0.1480984684752765, 0.15115947063090668,
+  0.15425465138075814, 0.1573840735395531, 0.16054779946220837,
+  0.1637458910513361, 0.16697840976455552, 0.1702454166216229,
+  0.17354697221138474, 0.17688313669856157, 0.18025396983036637,
+  0.18365953094296425, 0.18709987896777744, 0.19057507243764174,
+  0.1940851694928182, 0.19763022788686505, 0.20121030499237383,
+  0.20482545780657496, 0.20847574295681537, 0.21216121670591323,
+  0.21588193495739272, 0.2196379532606032, 0.22342932681572564,
+  0.2272561104786697, 0.23111835876586506, 0.23501612585894976,
+  0.23894946560935815, 0.24291843154281292, 0.24692307686372145,
+  0.25096345445948154, 0.25503961690469756, 0.25915161646531015,
+  0.2632995051026419, 0.2674833344773609, 0.27170315595336453,
+  0.27595902060158656, 0.2802509792037277, 0.28457908225591383,
+  0.28894337997228187, 0.293343922288497, 0.29778075886520106,
+  0.3022539390913962, 0.30676351208776287, 0.3113095267099166,
+  0.3158920315516027, 0.32051107494783193, 0.3251667049779579,
+  0.329858969468698, 0.33458791599709947, 0.3393535918934513,
+  0.3441560442441435, 0.34899531989447563, 0.3538714654514154,
+  0.35878452728630783, 0.36373455153753737, 0.3687215841131434,
+  0.37374567069339015, 0.37880685673329295, 0.38390518746509983,
+  0.38904070790073253, 0.39421346283418507, 0.399423496843882,
+  0.40467085429499783, 0.4099555793417369, 0.4152777159295767,
+  0.42063730779747355, 0.426034398480032, 0.43146903130964015,
+  0.43694124941856927, 0.4424510957410402, 0.44799861301525684,
+  0.45358384378540717, 0.45920683040363275, 0.4648676150319675,
+  0.4705662396442452, 0.47630274602797945, 0.4820771757862124,
+  0.48788957033933605, 0.4937399709268863, 0.49962841860930857,
+  0.5055549542696977, 0.511519618615511, 0.5175224521802562, 0.5235634953251542,
+  0.5296427882407775, 0.5357603709486635, 0.541916283302905, 0.5481105649917183,
+  0.5543432555389864, 0.5606143943057829, 0.5669240204918703,
+  0.5732721731371814, 0.5796588911232758, 0.5860842131747782,
+  0.5925481778607952, 0.5990508235963129, 0.6055921886435752,
+  0.6121723111134431, 0.6187912289667334, 0.6254489800155429,
+  0.6321456019245507, 0.6388811322123047, 0.6456556082524908,
+  0.6524690672751842, 0.6593215463680848, 0.6662130824777358,
+  0.6731437124107255, 0.6801134728348748, 0.6871224002804077, 0.694170531141107,
+  0.7012579016754554, 0.7083845480077607, 0.7155505061292677,
+  0.7227558118992558, 0.7300005010461207, 0.7372846091684456,
+  0.7446081717360559, 0.7519712240910621, 0.7593738014488893, 0.766815938899294,
+  0.7742976714073674, 0.7818190338145284, 0.7893800608395011,
+  0.7969807870792839, 0.8046212470101042, 0.8123014749883624,
+  0.8200215052515645, 0.8277813719192435, 0.8355811089938695,
+  0.8434207503617491, 0.8513003297939137, 0.8592198809469982,
+  0.8671794373641085, 0.8751790324756791, 0.8832186996003202,
+  0.8912984719456563, 0.899418382609153, 0.9075784645789367, 0.9157787507346018,
+  0.9240192738480122, 0.9323000665840906, 0.9406211615016009,
+  0.9489825910539202, 0.9573843875898034, 0.9658265833541381,
+  0.9743092104886922, 0.9828323010328517, 0.991395886924352, 1,
+];
+
+// Adobe RGB (1998), encoded values of (i / 1024)^2 for i from 0 to 1024
+export const A98RGB_encode_LUT = [
+  0, 0.00182974898, 0.00343678499, 0.00496926541, 0.00645525215, 0.00790759684,
+  0.00933368289, 0.0107382962, 0.0121247854, 0.013495621, 0.0148526986,
+  0.0161975172, 0.0175312907, 0.0188550215, 0.0201695509, 0.0214755947,
+  0.0227737688, 0.024064609, 0.025348585, 0.026626112, 0.0278975598,
+  0.0291632593, 0.0304235086, 0.0316785776, 0.0329287116, 0.0341741346,
+  0.0354150517, 0.0366516518, 0.0378841089, 0.0391125844, 0.0403372278,
+  0.0415581781, 0.0427755652, 0.0439895104, 0.0452001274, 0.0464075226,
+  0.0476117966, 0.0488130436, 0.0500113529, 0.0512068087, 0.0523994906,
+  0.0535894743, 0.0547768315, 0.0559616303, 0.0571439355, 0.0583238088,
+  0.0595013093, 0.060676493, 0.0618494138, 0.0630201228, 0.0641886695,
+  0.0653551008, 0.0665194621, 0.0676817966, 0.068842146, 0.0700005504,
+  0.0711570484, 0.0723116771, 0.0734644721, 0.074615468, 0.0757646979,
+  0.076912194, 0.0780579872, 0.0792021075, 0.0803445838, 0.0814854441,
+  0.0826247155, 0.0837624243, 0.0848985958, 0.0860332547, 0.0871664249,
+  0.0882981296, 0.0894283912, 0.0905572317, 0.0916846722, 0.0928107334,
+  0.0939354352, 0.0950587973, 0.0961808385, 0.0973015774, 0.0984210319,
+  0.0995392194, 0.100656157, 0.101771862, 0.102886349, 0.103999635, 0.105111735,
+  0.106222665, 0.107332438, 0.10844107, 0.109548573, 0.110654963, 0.111760252,
+  0.112864452, 0.113967578, 0.115069642, 0.116170654, 0.117270629, 0.118369577,
+  0.119467509, 0.120564437, 0.121660372, 0.122755324, 0.123849305, 0.124942323,
+  0.12603439, 0.127125515, 0.128215709, 0.129304979, 0.130393336, 0.13148079,
+  0.132567348, 0.133653019, 0.134737813, 0.135821738, 0.136904801, 0.137987012,
+  0.139068378, 0.140148907, 0.141228607, 0.142307485, 0.14338555, 0.144462807,
+  0.145539265, 0.14661493, 0.14768981, 0.148763911, 0.14983724, 0.150909804,
+  0.151981609, 0.153052661, 0.154122968, 0.155192535, 0.156261367, 0.157329473,
+  0.158396856, 0.159463523, 0.160529481, 0.161594733, 0.162659287, 0.163723147,
+  0.164786318, 0.165848807, 0.166910619, 0.167971758, 0.169032229, 0.170092039,
+  0.171151191, 0.17220969, 0.173267542, 0.174324751, 0.175381321, 0.176437258,
+  0.177492566, 0.178547249, 0.179601312, 0.180654759, 0.181707595, 0.182759823,
+  0.183811449, 0.184862475, 0.185912906, 0.186962747, 0.188012, 0.189060671,
+  0.190108762, 0.191156279, 0.192203223, 0.1932496, 0.194295413, 0.195340666,
+  0.196385362, 0.197429504, 0.198473097, 0.199516143, 0.200558647, 0.201600611,
+  0.202642039, 0.203682934, 0.204723299, 0.205763138, 0.206802454, 0.20784125,
+  0.208879529, 0.209917294, 0.210954548, 0.211991295, 0.213027537, 0.214063277,
+  0.215098518, 0.216133262, 0.217167514, 0.218201275, 0.219234549, 0.220267338,
+  0.221299644, 0.222331472, 0.223362822, 0.224393698, 0.225424103, 0.226454039,
+  0.227483508, 0.228512514, 0.229541058, 0.230569144, 0.231596772, 0.232623947,
+  0.233650671, 0.234676945, 0.235702772, 0.236728155, 0.237753095, 0.238777596,
+  0.239801659, 0.240825286, 0.241848481, 0.242871244, 0.243893578, 0.244915486,
+  0.245936969, 0.24695803, 0.247978671, 0.248998893, 0.250018699, 0.25103809,
+  0.25205707, 0.253075639, 0.254093801, 0.255111556, 0.256128906, 0.257145855,
+  0.258162403, 0.259178552, 0.260194305, 0.261209663, 0.262224628, 0.263239201,
+  0.264253386, 0.265267182, 0.266280593, 0.26729362, 0.268306265, 0.269318529,
+  0.270330414, 0.271341922, 0.272353055, 0.273363814, 0.274374201, 0.275384217,
+  0.276393864, 0.277403144, 0.278412059, 0.279420609, 0.280428797, 0.281436624,
+  0.282444092, 0.283451202, 0.284457955, 0.285464354, 0.2864704, 0.287476093,
+  0.288481437, 0.289486431, 0.290491078, 0.291495379, 0.292499336, 0.293502949,
+  0.294506221, 0.295509152, 0.296511744, 0.297513999, 0.298515918, 0.299517502,
+  0.300518752, 0.30151967, 0.302520257, 0.303520515, 0.304520444, 0.305520047,
+  0.306519324, 0.307518276, 0.308516905, 0.309515213, 0.310513199, 0.311510867,
+  0.312508216, 0.313505248, 0.314501965, 0.315498367, 0.316494455, 0.317490232,
+  0.318485697, 0.319480853, 0.3204757, 0.321470239, 0.322464472, 0.3234584,
+  0.324452024, 0.325445344, 0.326438363, 0.327431081, 0.328423499, 0.329415619,
+  0.330407441, 0.331398966, 0.332390196, 0.333381132, 0.334371775, 0.335362125,
+  0.336352184, 0.337341952, 0.338331432, 0.339320624, 0.340309528, 0.341298146,
+  0.342286479, 0.343274528, 0.344262293, 0.345249776, 0.346236979, 0.3472239,
+  0.348210543, 0.349196907, 0.350182993, 0.351168804, 0.352154338, 0.353139598,
+  0.354124584, 0.355109297, 0.356093739, 0.357077909, 0.358061809, 0.35904544,
+  0.360028803, 0.361011898, 0.361994727, 0.36297729, 0.363959588, 0.364941622,
+  0.365923392, 0.366904901, 0.367886148, 0.368867134, 0.369847861, 0.370828329,
+  0.371808538, 0.37278849, 0.373768186, 0.374747626, 0.375726811, 0.376705742,
+  0.377684419, 0.378662844, 0.379641017, 0.38061894, 0.381596612, 0.382574034,
+  0.383551208, 0.384528134, 0.385504813, 0.386481245, 0.387457432, 0.388433374,
+  0.389409071, 0.390384526, 0.391359737, 0.392334706, 0.393309435, 0.394283922,
+  0.39525817, 0.396232179, 0.397205949, 0.398179481, 0.399152777, 0.400125836,
+  0.401098659, 0.402071248, 0.403043602, 0.404015722, 0.40498761, 0.405959265,
+  0.406930689, 0.407901882, 0.408872844, 0.409843577, 0.410814081, 0.411784357,
+  0.412754405, 0.413724225, 0.41469382, 0.415663189, 0.416632332, 0.417601251,
+  0.418569947, 0.419538418, 0.420506668, 0.421474695, 0.422442501, 0.423410086,
+  0.424377451, 0.425344596, 0.426311522, 0.42727823, 0.42824472, 0.429210993,
+  0.430177049, 0.43114289, 0.432108514, 0.433073924, 0.434039119, 0.435004101,
+  0.43596887, 0.436933426, 0.437897769, 0.438861902, 0.439825823, 0.440789534,
+  0.441753035, 0.442716327, 0.443679411, 0.444642286, 0.445604953, 0.446567413,
+  0.447529667, 0.448491714, 0.449453556, 0.450415194, 0.451376626, 0.452337855,
+  0.45329888, 0.454259703, 0.455220323, 0.456180741, 0.457140957, 0.458100973,
+  0.459060789, 0.460020404, 0.460979821, 0.461939038, 0.462898057, 0.463856878,
+  0.464815502, 0.465773929, 0.46673216, 0.467690194, 0.468648033, 0.469605678,
+  0.470563127, 0.471520383, 0.472477445, 0.473434314, 0.474390991, 0.475347475,
+  0.476303768, 0.477259869, 0.47821578, 0.479171501, 0.480127031, 0.481082372,
+  0.482037525, 0.482992488, 0.483947264, 0.484901852, 0.485856253, 0.486810468,
+  0.487764496, 0.488718338, 0.489671995, 0.490625466, 0.491578754, 0.492531857,
+  0.493484776, 0.494437513, 0.495390066, 0.496342437, 0.497294626, 0.498246634,
+  0.49919846, 0.500150105, 0.501101571, 0.502052856, 0.503003962, 0.503954888,
+  0.504905636, 0.505856206, 0.506806598, 0.507756812, 0.508706849, 0.50965671,
+  0.510606394, 0.511555902, 0.512505235, 0.513454393, 0.514403375, 0.515352184,
+  0.516300819, 0.51724928, 0.518197567, 0.519145682, 0.520093625, 0.521041395,
+  0.521988994, 0.522936421, 0.523883678, 0.524830764, 0.525777679, 0.526724425,
+  0.527671002, 0.528617409, 0.529563647, 0.530509718, 0.53145562, 0.532401354,
+  0.533346921, 0.534292321, 0.535237555, 0.536182622, 0.537127524, 0.53807226,
+  0.53901683, 0.539961236, 0.540905477, 0.541849555, 0.542793468, 0.543737218,
+  0.544680804, 0.545624228, 0.54656749, 0.547510589, 0.548453527, 0.549396303,
+  0.550338918, 0.551281372, 0.552223666, 0.553165799, 0.554107773, 0.555049588,
+  0.555991243, 0.556932739, 0.557874077, 0.558815256, 0.559756278, 0.560697142,
+  0.561637849, 0.562578399, 0.563518793, 0.56445903, 0.565399111, 0.566339036,
+  0.567278807, 0.568218422, 0.569157882, 0.570097188, 0.57103634, 0.571975338,
+  0.572914182, 0.573852873, 0.574791411, 0.575729797, 0.57666803, 0.577606112,
+  0.578544041, 0.579481819, 0.580419446, 0.581356922, 0.582294248, 0.583231423,
+  0.584168448, 0.585105324, 0.58604205, 0.586978627, 0.587915056, 0.588851335,
+  0.589787467, 0.59072345, 0.591659286, 0.592594974, 0.593530515, 0.59446591,
+  0.595401158, 0.596336259, 0.597271214, 0.598206024, 0.599140688, 0.600075207,
+  0.601009581, 0.60194381, 0.602877895, 0.603811836, 0.604745633, 0.605679286,
+  0.606612796, 0.607546163, 0.608479387, 0.609412469, 0.610345408, 0.611278205,
+  0.612210861, 0.613143375, 0.614075747, 0.615007979, 0.61594007, 0.61687202,
+  0.617803831, 0.618735501, 0.619667032, 0.620598423, 0.621529675, 0.622460788,
+  0.623391762, 0.624322597, 0.625253295, 0.626183855, 0.627114276, 0.628044561,
+  0.628974708, 0.629904718, 0.630834591, 0.631764328, 0.632693929, 0.633623393,
+  0.634552722, 0.635481915, 0.636410973, 0.637339896, 0.638268684, 0.639197337,
+  0.640125856, 0.641054241, 0.641982492, 0.642910609, 0.643838593, 0.644766444,
+  0.645694161, 0.646621746, 0.647549198, 0.648476518, 0.649403706, 0.650330763,
+  0.651257687, 0.65218448, 0.653111142, 0.654037673, 0.654964073, 0.655890343,
+  0.656816483, 0.657742492, 0.658668372, 0.659594122, 0.660519742, 0.661445234,
+  0.662370596, 0.66329583, 0.664220935, 0.665145912, 0.66607076, 0.666995481,
+  0.667920074, 0.66884454, 0.669768878, 0.67069309, 0.671617174, 0.672541132,
+  0.673464963, 0.674388668, 0.675312248, 0.676235701, 0.677159029, 0.678082231,
+  0.679005308, 0.679928261, 0.680851088, 0.681773791, 0.68269637, 0.683618824,
+  0.684541154, 0.685463361, 0.686385444, 0.687307404, 0.68822924, 0.689150954,
+  0.690072544, 0.690994013, 0.691915358, 0.692836582, 0.693757683, 0.694678663,
+  0.695599521, 0.696520258, 0.697440874, 0.698361368, 0.699281742, 0.700201995,
+  0.701122128, 0.70204214, 0.702962032, 0.703881804, 0.704801457, 0.70572099,
+  0.706640404, 0.707559699, 0.708478874, 0.709397931, 0.71031687, 0.711235689,
+  0.712154391, 0.713072975, 0.713991441, 0.714909789, 0.715828019, 0.716746133,
+  0.717664129, 0.718582008, 0.719499771, 0.720417417, 0.721334946, 0.722252359,
+  0.723169656, 0.724086838, 0.725003903, 0.725920853, 0.726837688, 0.727754407,
+  0.728671012, 0.729587502, 0.730503877, 0.731420137, 0.732336283, 0.733252315,
+  0.734168233, 0.735084038, 0.735999728, 0.736915305, 0.737830769, 0.73874612,
+  0.739661358, 0.740576483, 0.741491495, 0.742406395, 0.743321183, 0.744235858,
+  0.745150422, 0.746064873, 0.746979213, 0.747893442, 0.748807559, 0.749721565,
+  0.750635461, 0.751549245, 0.752462919, 0.753376482, 0.754289935, 0.755203277,
+  0.75611651, 0.757029633, 0.757942646, 0.75885555, 0.759768344, 0.760681029,
+  0.761593605, 0.762506072, 0.76341843, 0.76433068, 0.765242821, 0.766154854,
+  0.767066779, 0.767978596, 0.768890305, 0.769801906, 0.7707134, 0.771624786,
+  0.772536065, 0.773447238, 0.774358303, 0.775269261, 0.776180113, 0.777090859,
+  0.778001498, 0.778912031, 0.779822458, 0.780732779, 0.781642994, 0.782553104,
+  0.783463108, 0.784373008, 0.785282802, 0.786192491, 0.787102075, 0.788011554,
+  0.788920929, 0.7898302, 0.790739366, 0.791648428, 0.792557386, 0.793466241,
+  0.794374991, 0.795283639, 0.796192182, 0.797100623, 0.79800896, 0.798917195,
+  0.799825326, 0.800733355, 0.801641281, 0.802549105, 0.803456827, 0.804364446,
+  0.805271964, 0.806179379, 0.807086693, 0.807993906, 0.808901016, 0.809808026,
+  0.810714934, 0.811621742, 0.812528448, 0.813435054, 0.814341559, 0.815247963,
+  0.816154267, 0.817060471, 0.817966575, 0.818872579, 0.819778483, 0.820684287,
+  0.821589991, 0.822495597, 0.823401103, 0.824306509, 0.825211817, 0.826117026,
+  0.827022136, 0.827927147, 0.82883206, 0.829736874, 0.83064159, 0.831546208,
+  0.832450728, 0.83335515, 0.834259475, 0.835163701, 0.836067831, 0.836971862,
+  0.837875797, 0.838779634, 0.839683375, 0.840587018, 0.841490565, 0.842394015,
+  0.843297369, 0.844200626, 0.845103787, 0.846006852, 0.846909821, 0.847812694,
+  0.848715471, 0.849618153, 0.850520739, 0.851423229, 0.852325625, 0.853227925,
+  0.85413013, 0.85503224, 0.855934256, 0.856836177, 0.857738003, 0.858639735,
+  0.859541372, 0.860442915, 0.861344364, 0.86224572, 0.863146981, 0.864048149,
+  0.864949223, 0.865850203, 0.86675109, 0.867651884, 0.868552585, 0.869453193,
+  0.870353708, 0.87125413, 0.872154459, 0.873054696, 0.87395484, 0.874854892,
+  0.875754852, 0.876654719, 0.877554495, 0.878454179, 0.879353771, 0.880253271,
+  0.88115268, 0.882051997, 0.882951223, 0.883850358, 0.884749402, 0.885648354,
+  0.886547216, 0.887445987, 0.888344668, 0.889243257, 0.890141757, 0.891040166,
+  0.891938485, 0.892836713, 0.893734852, 0.894632901, 0.89553086, 0.896428729,
+  0.897326509, 0.8982242, 0.899121801, 0.900019312, 0.900916735, 0.901814068,
+  0.902711313, 0.903608469, 0.904505536, 0.905402514, 0.906299404, 0.907196206,
+  0.908092919, 0.908989544, 0.909886081, 0.91078253, 0.911678891, 0.912575165,
+  0.91347135, 0.914367448, 0.915263459, 0.916159382, 0.917055218, 0.917950967,
+  0.918846629, 0.919742204, 0.920637692, 0.921533093, 0.922428407, 0.923323635,
+  0.924218777, 0.925113832, 0.926008801, 0.926903684, 0.927798481, 0.928693191,
+  0.929587816, 0.930482356, 0.931376809, 0.932271177, 0.93316546, 0.934059657,
+  0.934953769, 0.935847795, 0.936741737, 0.937635594, 0.938529366, 0.939423053,
+  0.940316655, 0.941210173, 0.942103606, 0.942996955, 0.94389022, 0.9447834,
+  0.945676497, 0.946569509, 0.947462437, 0.948355282, 0.949248043, 0.95014072,
+  0.951033314, 0.951925824, 0.952818251, 0.953710595, 0.954602855, 0.955495033,
+  0.956387127, 0.957279139, 0.958171068, 0.959062914, 0.959954677, 0.960846358,
+  0.961737957, 0.962629473, 0.963520907, 0.964412259, 0.965303529, 0.966194717,
+  0.967085823, 0.967976847, 0.968867789, 0.96975865, 0.97064943, 0.971540128,
+  0.972430744, 0.97332128, 0.974211734, 0.975102107, 0.975992399, 0.976882611,
+  0.977772741, 0.978662791, 0.97955276, 0.980442649, 0.981332457, 0.982222185,
+  0.983111833, 0.9840014, 0.984890887, 0.985780295, 0.986669622, 0.98755887,
+  0.988448037, 0.989337126, 0.990226134, 0.991115063, 0.992003913, 0.992892683,
+  0.993781374, 0.994669986, 0.995558519, 0.996446973, 0.997335348, 0.998223644,
+  0.999111861, 1,
+];
+
+// ProPhoto RGB, linear values of the 8-bit code values 0 to 255
+export const ProPhotoRGB_decode_LUT = [
+  0, 0.00024509803921568627, 0.0004901960784313725, 0.0007352941176470588,
+  0.000980392156862745, 0.0012254901960784314, 0.0014705882352941176,
+  0.001715686274509804, 0.001966933385356166, 0.0024314435559125293,
+  0.00293919009375914, 0.003489269453765431, 0.0040808808809875315,
+  0.004713306794171285, 0.005385898187330846, 0.006098063487309054,
+  0.006849259866351051, 0.007638986344833238, 0.008466778228889534,
+  0.009332202562939233, 0.010234854367025628, 0.01117435349018896,
+  0.012150341953869822, 0.013162481689781994, 0.014210452598752319,
+  0.015293950873268652, 0.016412687538613042, 0.017566387176645656,
+  0.01875478680334577, 0.01997763487667151, 0.021234690415569697,
+  0.022525722214340963, 0.023850508139253775, 0.02520883449646137,
+  0.026600495462023904, 0.02802529256626395, 0.02948303422585258,
+  0.0309735353179894, 0.03249661679184113, 0.034052105313073476,
+  0.035639832937871825, 0.03725963681332122, 0.03891135890141603,
+  0.04059484572431248, 0.04230994812872762, 0.04405652106763959,
+  0.045834423397658544, 0.04764351769062419, 0.04948367005814681,
+  0.05135474998794922, 0.0532566301909891, 0.05518918645844859,
+  0.05715229752777145, 0.059145844957011307, 0.061169713006826755,
+  0.06322378852952415, 0.0653079608646055, 0.06742212174033002,
+  0.06956616518084272, 0.07173998741846434, 0.07394348681077204,
+  0.07617656376213364, 0.07843912064938616, 0.08073106175137654,
+  0.08305229318210468, 0.08540272282723152, 0.08778226028373284,
+  0.09019081680249733, 0.09262830523368362, 0.09509463997466434,
+  0.09758973692039905, 0.10011351341608914, 0.10266588821197949,
+  0.10524678142018024, 0.10785611447339226, 0.1104938100854273,
+  0.11315979221342234, 0.11585398602165317, 0.11857631784686022,
+  0.12132671516500433, 0.12410510655937633, 0.12691142168998878,
+  0.12974559126418317, 0.13260754700838964, 0.13549722164098152,
+  0.13841454884616858, 0.14135946324887796, 0.14433190039057447,
+  0.14733179670597446, 0.1503590895006102, 0.15341371692920483,
+  0.15649561797481976, 0.1596047324287388, 0.16274100087105464,
+  0.16590436465192698, 0.16909476587348066, 0.172312147372317,
+  0.1755564527026101, 0.1788276261197633, 0.18212561256460122,
+  0.18545035764807574, 0.18880180763646257, 0.192179909437029,
+  0.1955846105841532, 0.19901585922587647, 0.20247360411087093,
+  0.20595779457580568, 0.20946838053309613, 0.2130053124590211,
+  0.21656854138219322, 0.22015801887236913, 0.22377369702958622,
+  0.2274155284736142, 0.23108346633370883, 0.23477746423865664,
+  0.23849747630710053, 0.24224345713813542, 0.24601536180216405,
+  0.24981314583200398, 0.25363676521423634, 0.2574861763807885,
+  0.26136133620074126, 0.26526220197235423, 0.26918873141530014,
+  0.2731408826631031, 0.2771186142557713, 0.2811218851326201, 0.285150654625277,
+  0.2892048824508643, 0.293284528705352, 0.29738955385707666,
+  0.30151991874041995, 0.3056755845496425, 0.3098565128328667,
+  0.3140626654862063, 0.31829400474803554, 0.32255049319339435,
+  0.32683209372852645, 0.33113876958554467, 0.3354704843172209,
+  0.33982720179189585, 0.3442088861885056, 0.3486155019917219,
+  0.35304701398720156, 0.35750338725694264, 0.36198458717474447,
+  0.3664905794017679, 0.37102132988219283, 0.37557680483897155,
+  0.38015697076967236, 0.3847617944424149, 0.38939124289189053,
+  0.39404528341546874, 0.3987238835693843, 0.40342701116500584,
+  0.4081546342651809, 0.41290672118065774, 0.4176832404665795,
+  0.42248416091905167, 0.42730945157177747, 0.4321590816927623,
+  0.43703302078108386, 0.4419312385637268, 0.4468537049924796,
+  0.4518003902408934, 0.45677126470129903, 0.46176629898188354,
+  0.466785463903822, 0.4718287304984651, 0.47689607000457995,
+  0.4819874538656438, 0.48710285372718826, 0.49224224143419393,
+  0.4974055890285327, 0.5025928687464588, 0.5078040530161452,
+  0.5130391144552645, 0.5182980258686163, 0.5235807602457941,
+  0.5288872907588981, 0.5342175907602855, 0.5395716337803629,
+  0.5449493935254176, 0.5503508438754865, 0.5557759588822629,
+  0.5612247127670394, 0.5666970799186867, 0.5721930348916671,
+  0.5777125524040825, 0.5832556073357547, 0.5888221747263392,
+  0.5944122297734714, 0.6000257478309414, 0.6056627044069023,
+  0.6113230751621065, 0.6170068359081714, 0.6227139626058744, 0.628444431363474,
+  0.634198218435061, 0.6399753002189335, 0.6457756532560001, 0.651599254228208,
+  0.6574460799569958, 0.6633161074017716, 0.669209313658415, 0.6751256759578009,
+  0.6810651716643505, 0.6870277782746004, 0.6930134734157957, 0.699022234844506,
+  0.7050540404452604, 0.7111088682292052, 0.7171866963327803,
+  0.7232875030164169, 0.729411266663255, 0.7355579657778785, 0.7417275789850711,
+  0.7479200850285891, 0.7541354627699532, 0.7603736911872581,
+  0.7666347493739988, 0.7729186165379145, 0.77922527199985, 0.785554695192632,
+  0.7919068656599625, 0.7982817630553282, 0.8046793671409246,
+  0.8110996577865965, 0.8175426149687927, 0.8240082187695346,
+  0.8304964493754016, 0.8370072870765283, 0.8435407122656171,
+  0.8500967054369634, 0.8566752471854947, 0.8632763182058233,
+  0.8698998992913114, 0.8765459713331482, 0.8832145153194411, 0.889905512334318,
+  0.8966189435570424, 0.903354790261139, 0.910113033813532, 0.9168936556736954,
+  0.9236966373928129, 0.9305219606129493, 0.9373696070662345,
+  0.9442395585740553, 0.9511317970462597, 0.9580463044803713,
+  0.9649830629608123, 0.9719420546581384, 0.978923261828283, 0.9859266668118092,
+  0.9929522520331739, 1,
+];
+
+// ProPhoto RGB, encoded values of (i / 1024)^2 for i from 0 to 1024
+export const ProPhotoRGB_encode_LUT = [
+  0, 1.52587891e-5, 6.10351562e-5, 0.000137329102, 0.000244140625,
+  0.000381469727, 0.000549316406, 0.000747680664, 0.0009765625, 0.00123596191,
+  0.00152587891, 0.00184631348, 0.00219726562, 0.00257873535, 0.00299072266,
+  0.00343322754, 0.00390625, 0.00440979004, 0.00494384766, 0.00550842285,
+  0.00610351562, 0.00672912598, 0.00738525391, 0.00807189941, 0.0087890625,
+  0.00953674316, 0.0103149414, 0.0111236572, 0.0119628906, 0.0128326416,
+  0.0137329102, 0.0146636963, 0.015625, 0.0166168213, 0.0176391602,
+  0.0186920166, 0.0197753906, 0.0208892822, 0.0220336914, 0.0232086182,
+  0.0244140625, 0.0256500244, 0.0269165039, 0.028213501, 0.0295410156,
+  0.0308990479, 0.0318222565, 0.0325918325, 0.03336323, 0.0341364154,
+  0.0349113562, 0.035688021, 0.0364663799, 0.0372464038, 0.0380280648,
+  0.0388113359, 0.0395961911, 0.0403826051, 0.0411705537, 0.0419600133,
+  0.042750961, 0.0435433749, 0.0443372336, 0.0451325163, 0.0459292029,
+  0.0467272739, 0.0475267103, 0.0483274938, 0.0491296064, 0.0499330307,
+  0.0507377499, 0.0515437475, 0.0523510075, 0.0531595142, 0.0539692526,
+  0.0547802077, 0.0555923651, 0.0564057108, 0.057220231, 0.0580359124,
+  0.0588527418, 0.0596707065, 0.0604897941, 0.0613099923, 0.0621312893,
+  0.0629536734, 0.0637771332, 0.0646016577, 0.0654272359, 0.0662538571,
+  0.067081511, 0.0679101873, 0.0687398761, 0.0695705676, 0.0704022521,
+  0.0712349203, 0.072068563, 0.0729031711, 0.0737387358, 0.0745752484,
+  0.0754127004, 0.0762510835, 0.0770903893, 0.07793061, 0.0787717375,
+  0.0796137642, 0.0804566824, 0.0813004846, 0.0821451636, 0.082990712,
+  0.0838371227, 0.0846843889, 0.0855325036, 0.0863814602, 0.0872312519,
+  0.0880818723, 0.0889333149, 0.0897855735, 0.0906386419, 0.0914925139,
+  0.0923471836, 0.093202645, 0.0940588923, 0.0949159198, 0.0957737219,
+  0.0966322929, 0.0974916275, 0.0983517202, 0.0992125657, 0.100074159,
+  0.100936494, 0.101799567, 0.102663373, 0.103527905, 0.104393161, 0.105259134,
+  0.10612582, 0.106993214, 0.107861312, 0.10873011, 0.109599602, 0.110469784,
+  0.111340653, 0.112212203, 0.113084431, 0.113957332, 0.114830902, 0.115705137,
+  0.116580034, 0.117455587, 0.118331794, 0.119208649, 0.120086151, 0.120964294,
+  0.121843074, 0.12272249, 0.123602536, 0.124483208, 0.125364505, 0.126246421,
+  0.127128954, 0.1280121, 0.128895855, 0.129780217, 0.130665182, 0.131550747,
+  0.132436909, 0.133323663, 0.134211008, 0.13509894, 0.135987456, 0.136876553,
+  0.137766228, 0.138656477, 0.139547299, 0.14043869, 0.141330647, 0.142223167,
+  0.143116247, 0.144009885, 0.144904079, 0.145798824, 0.146694118, 0.14758996,
+  0.148486345, 0.149383272, 0.150280738, 0.15117874, 0.152077276, 0.152976343,
+  0.153875939, 0.154776061, 0.155676707, 0.156577874, 0.15747956, 0.158381763,
+  0.15928448, 0.160187708, 0.161091447, 0.161995692, 0.162900443, 0.163805697,
+  0.164711451, 0.165617703, 0.166524452, 0.167431694, 0.168339429, 0.169247653,
+  0.170156365, 0.171065562, 0.171975243, 0.172885405, 0.173796047, 0.174707166,
+  0.17561876, 0.176530828, 0.177443368, 0.178356377, 0.179269853, 0.180183796,
+  0.181098202, 0.18201307, 0.182928398, 0.183844184, 0.184760427, 0.185677124,
+  0.186594275, 0.187511876, 0.188429926, 0.189348424, 0.190267368, 0.191186756,
+  0.192106586, 0.193026857, 0.193947566, 0.194868713, 0.195790296, 0.196712312,
+  0.197634761, 0.198557641, 0.19948095, 0.200404686, 0.201328849, 0.202253436,
+  0.203178445, 0.204103876, 0.205029727, 0.205955996, 0.206882682, 0.207809783,
+  0.208737298, 0.209665225, 0.210593564, 0.211522311, 0.212451467, 0.213381029,
+  0.214310996, 0.215241367, 0.21617214, 0.217103314, 0.218034888, 0.21896686,
+  0.219899228, 0.220831992, 0.221765151, 0.222698702, 0.223632645, 0.224566978,
+  0.2255017, 0.226436809, 0.227372305, 0.228308186, 0.22924445, 0.230181097,
+  0.231118126, 0.232055534, 0.232993322, 0.233931486, 0.234870028, 0.235808944,
+  0.236748235, 0.237687898, 0.238627933, 0.239568339, 0.240509113, 0.241450256,
+  0.242391766, 0.243333642, 0.244275882, 0.245218486, 0.246161452, 0.24710478,
+  0.248048468, 0.248992516, 0.249936921, 0.250881683, 0.251826801, 0.252772274,
+  0.253718101, 0.254664281, 0.255610812, 0.256557694, 0.257504925, 0.258452505,
+  0.259400433, 0.260348707, 0.261297327, 0.262246291, 0.263195598, 0.264145249,
+  0.26509524, 0.266045573, 0.266996244, 0.267947255, 0.268898603, 0.269850288,
+  0.270802308, 0.271754664, 0.272707353, 0.273660375, 0.27461373, 0.275567415,
+  0.27652143, 0.277475775, 0.278430448, 0.279385449, 0.280340776, 0.281296428,
+  0.282252406, 0.283208707, 0.284165332, 0.285122278, 0.286079546, 0.287037134,
+  0.287995042, 0.288953269, 0.289911813, 0.290870675, 0.291829852, 0.292789345,
+  0.293749153, 0.294709274, 0.295669708, 0.296630454, 0.297591512, 0.29855288,
+  0.299514558, 0.300476544, 0.301438839, 0.302401441, 0.303364349, 0.304327563,
+  0.305291082, 0.306254906, 0.307219032, 0.308183462, 0.309148193, 0.310113226,
+  0.311078558, 0.312044191, 0.313010122, 0.313976352, 0.314942879, 0.315909703,
+  0.316876822, 0.317844237, 0.318811947, 0.31977995, 0.320748247, 0.321716836,
+  0.322685716, 0.323654888, 0.32462435, 0.325594101, 0.326564141, 0.32753447,
+  0.328505086, 0.329475989, 0.330447178, 0.331418653, 0.332390413, 0.333362457,
+  0.334334784, 0.335307394, 0.336280286, 0.33725346, 0.338226915, 0.33920065,
+  0.340174665, 0.341148958, 0.34212353, 0.34309838, 0.344073507, 0.34504891,
+  0.346024589, 0.347000543, 0.347976772, 0.348953274, 0.34993005, 0.350907099,
+  0.35188442, 0.352862012, 0.353839876, 0.354818009, 0.355796413, 0.356775085,
+  0.357754026, 0.358733235, 0.359712711, 0.360692454, 0.361672464, 0.362652739,
+  0.363633279, 0.364614083, 0.365595151, 0.366576483, 0.367558077, 0.368539934,
+  0.369522052, 0.370504432, 0.371487072, 0.372469972, 0.373453131, 0.374436549,
+  0.375420226, 0.37640416, 0.377388352, 0.3783728, 0.379357505, 0.380342465,
+  0.381327681, 0.382313151, 0.383298875, 0.384284853, 0.385271084, 0.386257567,
+  0.387244302, 0.388231289, 0.389218527, 0.390206015, 0.391193753, 0.392181741,
+  0.393169977, 0.394158462, 0.395147195, 0.396136176, 0.397125403, 0.398114877,
+  0.399104597, 0.400094563, 0.401084773, 0.402075228, 0.403065927, 0.40405687,
+  0.405048055, 0.406039484, 0.407031154, 0.408023066, 0.409015219, 0.410007613,
+  0.411000247, 0.411993122, 0.412986235, 0.413979587, 0.414973178, 0.415967006,
+  0.416961073, 0.417955376, 0.418949915, 0.419944691, 0.420939703, 0.42193495,
+  0.422930432, 0.423926148, 0.424922098, 0.425918281, 0.426914698, 0.427911347,
+  0.428908228, 0.429905341, 0.430902686, 0.431900261, 0.432898067, 0.433896102,
+  0.434894368, 0.435892862, 0.436891586, 0.437890538, 0.438889717, 0.439889125,
+  0.440888759, 0.44188862, 0.442888707, 0.44388902, 0.444889559, 0.445890323,
+  0.446891311, 0.447892524, 0.44889396, 0.44989562, 0.450897504, 0.451899609,
+  0.452901937, 0.453904487, 0.454907258, 0.455910251, 0.456913464, 0.457916898,
+  0.458920551, 0.459924424, 0.460928516, 0.461932827, 0.462937356, 0.463942103,
+  0.464947068, 0.465952251, 0.46695765, 0.467963265, 0.468969097, 0.469975145,
+  0.470981408, 0.471987886, 0.472994578, 0.474001485, 0.475008606, 0.476015941,
+  0.477023488, 0.478031249, 0.479039222, 0.480047407, 0.481055804, 0.482064412,
+  0.483073232, 0.484082262, 0.485091503, 0.486100953, 0.487110613, 0.488120483,
+  0.489130561, 0.490140849, 0.491151344, 0.492162047, 0.493172958, 0.494184077,
+  0.495195402, 0.496206934, 0.497218672, 0.498230616, 0.499242765, 0.50025512,
+  0.501267679, 0.502280444, 0.503293412, 0.504306584, 0.50531996, 0.50633354,
+  0.507347322, 0.508361307, 0.509375494, 0.510389883, 0.511404473, 0.512419265,
+  0.513434258, 0.514449452, 0.515464846, 0.51648044, 0.517496234, 0.518512228,
+  0.51952842, 0.520544811, 0.521561401, 0.522578189, 0.523595175, 0.524612358,
+  0.525629739, 0.526647317, 0.527665091, 0.528683061, 0.529701228, 0.53071959,
+  0.531738148, 0.532756901, 0.533775849, 0.534794991, 0.535814328, 0.536833859,
+  0.537853583, 0.5388735, 0.539893611, 0.540913915, 0.541934411, 0.542955099,
+  0.543975979, 0.544997051, 0.546018314, 0.547039768, 0.548061413, 0.549083248,
+  0.550105273, 0.551127489, 0.552149894, 0.553172488, 0.554195272, 0.555218244,
+  0.556241405, 0.557264754, 0.558288291, 0.559312016, 0.560335928, 0.561360027,
+  0.562384313, 0.563408786, 0.564433445, 0.56545829, 0.566483321, 0.567508537,
+  0.568533939, 0.569559525, 0.570585296, 0.571611252, 0.572637392, 0.573663716,
+  0.574690223, 0.575716914, 0.576743788, 0.577770845, 0.578798084, 0.579825506,
+  0.58085311, 0.581880896, 0.582908863, 0.583937012, 0.584965341, 0.585993852,
+  0.587022543, 0.588051414, 0.589080465, 0.590109696, 0.591139107, 0.592168697,
+  0.593198466, 0.594228414, 0.59525854, 0.596288845, 0.597319327, 0.598349988,
+  0.599380826, 0.600411841, 0.601443034, 0.602474403, 0.603505949, 0.604537671,
+  0.60556957, 0.606601644, 0.607633894, 0.608666319, 0.609698919, 0.610731695,
+  0.611764645, 0.612797769, 0.613831068, 0.61486454, 0.615898187, 0.616932006,
+  0.617965999, 0.619000166, 0.620034505, 0.621069016, 0.6221037, 0.623138556,
+  0.624173584, 0.625208783, 0.626244154, 0.627279696, 0.62831541, 0.629351293,
+  0.630387348, 0.631423573, 0.632459967, 0.633496532, 0.634533266, 0.63557017,
+  0.636607243, 0.637644485, 0.638681896, 0.639719475, 0.640757222, 0.641795138,
+  0.642833221, 0.643871473, 0.644909891, 0.645948477, 0.64698723, 0.648026149,
+  0.649065236, 0.650104488, 0.651143907, 0.652183492, 0.653223242, 0.654263158,
+  0.655303239, 0.656343486, 0.657383897, 0.658424473, 0.659465214, 0.660506118,
+  0.661547187, 0.66258842, 0.663629816, 0.664671376, 0.665713099, 0.666754985,
+  0.667797034, 0.668839245, 0.669881619, 0.670924155, 0.671966853, 0.673009713,
+  0.674052735, 0.675095918, 0.676139262, 0.677182767, 0.678226433, 0.67927026,
+  0.680314247, 0.681358395, 0.682402702, 0.683447169, 0.684491796, 0.685536583,
+  0.686581528, 0.687626633, 0.688671896, 0.689717319, 0.690762899, 0.691808638,
+  0.692854535, 0.69390059, 0.694946803, 0.695993173, 0.697039701, 0.698086385,
+  0.699133227, 0.700180225, 0.701227381, 0.702274692, 0.70332216, 0.704369783,
+  0.705417563, 0.706465498, 0.707513588, 0.708561834, 0.709610235, 0.710658791,
+  0.711707502, 0.712756367, 0.713805387, 0.71485456, 0.715903888, 0.71695337,
+  0.718003005, 0.719052794, 0.720102736, 0.721152831, 0.722203079, 0.72325348,
+  0.724304033, 0.725354739, 0.726405597, 0.727456607, 0.728507768, 0.729559082,
+  0.730610547, 0.731662164, 0.732713931, 0.73376585, 0.734817919, 0.735870139,
+  0.73692251, 0.737975031, 0.739027702, 0.740080523, 0.741133494, 0.742186614,
+  0.743239884, 0.744293303, 0.745346871, 0.746400588, 0.747454454, 0.748508469,
+  0.749562632, 0.750616943, 0.751671402, 0.75272601, 0.753780765, 0.754835668,
+  0.755890718, 0.756945915, 0.75800126, 0.759056751, 0.76011239, 0.761168175,
+  0.762224106, 0.763280184, 0.764336408, 0.765392777, 0.766449293, 0.767505954,
+  0.768562761, 0.769619713, 0.770676811, 0.771734053, 0.77279144, 0.773848972,
+  0.774906648, 0.775964469, 0.777022434, 0.778080543, 0.779138796, 0.780197193,
+  0.781255733, 0.782314417, 0.783373244, 0.784432214, 0.785491328, 0.786550584,
+  0.787609982, 0.788669524, 0.789729207, 0.790789033, 0.791849001, 0.792909111,
+  0.793969362, 0.795029755, 0.79609029, 0.797150966, 0.798211783, 0.799272741,
+  0.800333839, 0.801395079, 0.802456459, 0.80351798, 0.80457964, 0.805641441,
+  0.806703382, 0.807765463, 0.808827683, 0.809890043, 0.810952542, 0.812015181,
+  0.813077958, 0.814140875, 0.81520393, 0.816267124, 0.817330456, 0.818393927,
+  0.819457536, 0.820521283, 0.821585168, 0.82264919, 0.823713351, 0.824777649,
+  0.825842084, 0.826906656, 0.827971366, 0.829036212, 0.830101195, 0.831166315,
+  0.832231572, 0.833296964, 0.834362493, 0.835428159, 0.83649396, 0.837559896,
+  0.838625969, 0.839692177, 0.84075852, 0.841824999, 0.842891613, 0.843958362,
+  0.845025246, 0.846092264, 0.847159417, 0.848226704, 0.849294126, 0.850361682,
+  0.851429372, 0.852497196, 0.853565153, 0.854633245, 0.855701469, 0.856769828,
+  0.857838319, 0.858906943, 0.859975701, 0.861044591, 0.862113614, 0.86318277,
+  0.864252058, 0.865321478, 0.866391031, 0.867460715, 0.868530532, 0.86960048,
+  0.87067056, 0.871740771, 0.872811114, 0.873881588, 0.874952194, 0.87602293,
+  0.877093797, 0.878164795, 0.879235924, 0.880307183, 0.881378572, 0.882450092,
+  0.883521742, 0.884593522, 0.885665431, 0.886737471, 0.88780964, 0.888881939,
+  0.889954367, 0.891026924, 0.89209961, 0.893172425, 0.89424537, 0.895318443,
+  0.896391644, 0.897464974, 0.898538433, 0.899612019, 0.900685734, 0.901759577,
+  0.902833548, 0.903907646, 0.904981873, 0.906056226, 0.907130707, 0.908205316,
+  0.909280051, 0.910354914, 0.911429904, 0.91250502, 0.913580263, 0.914655633,
+  0.915731129, 0.916806751, 0.9178825, 0.918958374, 0.920034375, 0.921110501,
+  0.922186754, 0.923263132, 0.924339635, 0.925416264, 0.926493018, 0.927569897,
+  0.928646901, 0.92972403, 0.930801284, 0.931878663, 0.932956166, 0.934033794,
+  0.935111546, 0.936189422, 0.937267422, 0.938345547, 0.939423795, 0.940502167,
+  0.941580662, 0.942659282, 0.943738024, 0.94481689, 0.945895879, 0.946974992,
+  0.948054227, 0.949133585, 0.950213066, 0.95129267, 0.952372396, 0.953452244,
+  0.954532215, 0.955612308, 0.956692523, 0.95777286, 0.958853319, 0.9599339,
+  0.961014602, 0.962095426, 0.963176371, 0.964257438, 0.965338626, 0.966419935,
+  0.967501365, 0.968582916, 0.969664588, 0.97074638, 0.971828293, 0.972910326,
+  0.97399248, 0.975074754, 0.976157148, 0.977239662, 0.978322296, 0.97940505,
+  0.980487924, 0.981570917, 0.98265403, 0.983737262, 0.984820613, 0.985904084,
+  0.986987673, 0.988071382, 0.98915521, 0.990239156, 0.991323221, 0.992407404,
+  0.993491706, 0.994576127, 0.995660665, 0.996745322, 0.997830097, 0.998914989,
+  1,
+];
@@ -0,0 +1,95 @@
+// Times the evaluation of modules in a fresh process, and lists the generated
+// matrix modules (src/matrices) they load, e.g. to check that importing
+// convert.js and a single space module only loads the data of that space's
+// gamut.
+// Run with `npm run bench:modules`
+
+import { execFileSync } from "child_process";
+import fs from "fs";
+import path from "path";
+import { fileURLToPath } from "url";
+
+const srcDir = fileURLToPath(new URL("../src/", import.meta.url));
+const matricesDir = path.join(srcDir, "matrices");
+
+// evaluations per module, the median is reported
+const RUNS = 15;
+
+// each entry is imported on its own, in a process that has loaded nothing
+const entries = [
+  // every gamut, which is what each space module loaded before the split
+  ["conversion_matrices.js"],
+  ["matrices/srgb.js"],
+  ["convert.js"],
+  // core.js also re-exports parse(), which looks up every space
+  ["core.js"],
+  ["spaces/srgb.js"],
+  ["spaces/display-p3.js"],
+  ["spaces/rec2020.js"],
+  ["spaces/a98-rgb.js"],
+  ["spaces/prophoto-rgb.js"],
+  // what converting with a single space actually loads
+  ["convert.js", "spaces/srgb.js"],
+  ["convert.js", "spaces/display-p3.js"],
+  ["convert.js", "spaces/rec2020.js"],
+  ["convert.js", "spaces/a98-rgb.js"],
+  ["convert.js", "spaces/prophoto-rgb.js"],
+  // as in test/bench-size.js; OKHSL and OKHSV load the sRGB gamut
+  ["convert.js", "spaces/oklab.js", "spaces/display-p3.js"],
+  // gamut mapping, which defaults to sRGB and converts through OKLCH
+  ["gamut.js"],
+  ["gamut.js", "spaces/display-p3.js"],
+  ["index.js"],
+  // the specialized converters, which index.js does not load
+  ["converters.js"],
+];
+
+const getModuleGraph = (file, graph = new Set()) => {
+  // The modules statically imported by a module, itself included
+  if (graph.has(file)) return graph;
+  graph.add(file);
+  const code = fs.readFileSync(file, "utf8");
+  for (const [, specifier] of code.matchAll(
+    /^(?:import|export)\s[^;]*?from\s*"([^"]+)"/gm
+  )) {
+    if (specifier.startsWith(".")) {
+      getModuleGraph(path.resolve(path.dirname(file), specifier), graph);
+    }
+  }
+  return graph;
+};
+
+const timeImport = (files) => {
+  // milliseconds to import the modules, in a process that has loaded nothing
+  const script = [
+    `const start = performance.now();`,
+    ...files.map((f) => `await import(${JSON.stringify("file://" + f)});`),
+    `console.log(performance.now() - start);`,
+  ].join("\n");
+  const output = execFileSync(
+    process.execPath,
+    ["--input-type=module", "-e", script],
+    { encoding: "utf8" }
+  );
+  return parseFloat(output);
+};
+
+const median = (values) => {
+  const sorted = values.slice().sort((a, b) => a - b);
+  return sorted[sorted.length >> 1];
+};
+
+for (const entry of entries) {
+  const files = entry.map((f) => path.join(srcDir, f));
+  const graph = new Set();
+  for (const file of files) getModuleGraph(file, graph);
+  const matrices = [...graph].filter((f) => path.dirname(f) === matricesDir);
+  const bytes = matrices.reduce((sum, f) => sum + fs.statSync(f).size, 0);
+  const times = Array.from({ length: RUNS }, () => timeImport(files));
+  const names = matrices.map((f) => path.basename(f, ".js")).join(", ");
+  console.log(
+    `${entry.join(" + ")}: ${median(times).toFixed(2)}ms, ` +
+      `${graph.size} modules, ` +
+      `matrices ${(bytes / 1024).toFixed(1)} kB (${names})`
+  );
+}
@@ -5,7 +5,32 @@ import {
   sRGBGamut,
   listColorSpaces,
   gamutMapOKLCH,
+  OKLab,
+  XYZD50,
+  DisplayP3,
+  ProPhotoRGB,
+  Rec2020Linear,
+  sRGBLinear,
+  transform,
+  transformPacked,
+  deltaEOK,
+  createPaletteIndex,
+  findNearestInPalette,
+  findCuspOKLCH,
+  degToRad,
+  computeMaxSaturationOKLC,
+  computeMaxSaturationPacked,
+  computeMaxSaturationPiecewise,
+  floatToByte,
+  sRGBGammaToLinear,
+  sRGBLinearToGamma,
+  sRGB_decode_LUT,
+  sRGB_encode_LUT,
+  decodeWithLUT,
+  encodeToIntegers,
 } from "../src/index.js";
+import { getConverter } from "../src/converters.js";
+import { OKLab_to_linear_sRGB_saturation_pieces } from "../src/saturation_pieces.js";
 
 const spaces = listColorSpaces().filter((f) => !/ok(hsv|hsl)/i.test(f.id));
 
@@ -41,6 +66,225 @@ for (let vec of vecs) {
   }
 }
 
+// specialized converters (see src/converters.js) against the generic convert()
+const bench = (fn, iterations = 100) => {
+  fn(); // warm up
+  const start = performance.now();
+  for (let i = 0; i < iterations; i++) fn();
+  return performance.now() - start;
+};
+
+const pairs = [
+  [OKLCH, sRGB],
+  [sRGB, OKLab],
+  [DisplayP3, ProPhotoRGB],
+  [XYZD50, OKLCH],
+  [sRGB, Rec2020Linear],
+];
+for (const [a, b] of pairs) {
+  const converter = getConverter(a, b);
+  const generic = bench(() => {
+    for (let vec of vecs) convert(vec, a, b, tmp);
+  });
+  const specialized = bench(() => {
+    for (let vec of vecs) converter(vec, tmp);
+  });
+  const speedup = (generic / specialized).toFixed(2);
+  console.log(
+    `${a.id} -> ${b.id}: convert ${generic.toFixed(1)}ms, ` +
+      `specialized ${specialized.toFixed(1)}ms (${speedup}x)`
+  );
+}
+
+const oklchs = vecs.map((_, i) => [
+  (i % 128) / 127,
+  0.4 * (Math.floor(i / 128) / 127),
+  (i * 137.5) % 360,
+]);
+const rgbs = oklchs.map((oklch) => gamutMapOKLCH(oklch, sRGBGamut));
+const hueA = Float64Array.from(oklchs, ([, , h]) => Math.cos(degToRad(h)));
+const hueB = Float64Array.from(oklchs, ([, , h]) => Math.sin(degToRad(h)));
+
+// nested matrices and coefficients against the packed layout of
+// `print_matrices.py --format packed`, packed here from the nested ones
+const packMatrix = (m) => Float64Array.from(m.flat());
+const packCoefficients = (c) =>
+  Float64Array.from([
+    ...c[0][0],
+    ...c[1][0],
+    ...c[0][1],
+    ...c[1][1],
+    ...c[2][1],
+  ]);
+const toXYZ = sRGBLinear.toXYZ_M;
+const packedToXYZ = packMatrix(toXYZ);
+const lmsToRgb = sRGBLinear.fromLMS_M;
+const packedLmsToRgb = packMatrix(lmsToRgb);
+const coefficients = sRGBGamut.coefficients;
+const packedCoefficients = packCoefficients(coefficients);
+const layouts = [
+  [
+    "transform",
+    () => {
+      for (let rgb of rgbs) transform(rgb, toXYZ, tmp);
+    },
+    () => {
+      for (let rgb of rgbs) transformPacked(rgb, packedToXYZ, tmp);
+    },
+  ],
+];
+for (const steps of [1, 3]) {
+  layouts.push([
+    `max saturation (${steps} Halley steps)`,
+    () => {
+      for (let i = 0; i < hueA.length; i++) {
+        computeMaxSaturationOKLC(
+          hueA[i],
+          hueB[i],
+          lmsToRgb,
+          coefficients,
+          steps
+        );
+      }
+    },
+    () => {
+      for (let i = 0; i < hueA.length; i++) {
+        computeMaxSaturationPacked(
+          hueA[i],
+          hueB[i],
+          packedLmsToRgb,
+          packedCoefficients,
+          steps
+        );
+      }
+    },
+  ]);
+}
+for (const [name, nestedRun, packedRun] of layouts) {
+  const nested = bench(nestedRun);
+  const packed = bench(packedRun);
+  console.log(
+    `${name}: nested ${nested.toFixed(1)}ms, packed ${packed.toFixed(1)}ms ` +
+      `(${(nested / packed).toFixed(2)}x)`
+  );
+}
+
+// piecewise max saturation polynomials (see src/saturation_pieces.js) against
+// the polynomial and Halley step of computeMaxSaturationOKLC
+const piecewiseGamut = {
+  ...sRGBGamut,
+  saturationPieces: OKLab_to_linear_sRGB_saturation_pieces,
+};
+const cusp = [0, 0];
+const cuspBenches = [
+  [
+    "max saturation",
+    (gamut) => () => {
+      const lmsToRgb = gamut.space.base.fromLMS_M;
+      const { coefficients, saturationPieces } = gamut;
+      for (let i = 0; i < hueA.length; i++) {
+        if (saturationPieces) {
+          computeMaxSaturationPiecewise(hueA[i], hueB[i], saturationPieces);
+        } else {
+          computeMaxSaturationOKLC(hueA[i], hueB[i], lmsToRgb, coefficients);
+        }
+      }
+    },
+  ],
+  [
+    "findCuspOKLCH",
+    (gamut) => () => {
+      for (let i = 0; i < hueA.length; i++) {
+        findCuspOKLCH(hueA[i], hueB[i], gamut, cusp);
+      }
+    },
+  ],
+  [
+    "gamutMapOKLCH",
+    (gamut) => () => {
+      for (let oklch of oklchs) gamutMapOKLCH(oklch, gamut, sRGB, tmp);
+    },
+  ],
+];
+for (const [name, run] of cuspBenches) {
+  const halley = bench(run(sRGBGamut));
+  const piecewise = bench(run(piecewiseGamut));
+  const count = oklchs.length * 100;
+  console.log(
+    `${name}: 1 Halley step ${((count / halley) * 1e-3).toFixed(2)}M/s, ` +
+      `piecewise ${((count / piecewise) * 1e-3).toFixed(2)}M/s ` +
+      `(${(halley / piecewise).toFixed(2)}x)`
+  );
+}
+
+// nearest palette color of OKLab pixels, a linear search against the index,
+// which itself searches palettes of up to 128 colors linearly
+const pixels = oklchs.map((oklch) => convert(oklch, OKLCH, OKLab));
+const findNearestLinear = (oklab, palette) => {
+  let best = -1;
+  let bestDistance = Infinity;
+  for (let i = 0; i < palette.length; i++) {
+    const distance = deltaEOK(oklab, palette[i]);
+    if (distance < bestDistance) {
+      bestDistance = distance;
+      best = i;
+    }
+  }
+  return best;
+};
+for (const size of [16, 64, 128, 256, 1024, 4096]) {
+  // every nth pixel, so the palette spans the same colors as the pixels
+  const step = Math.floor(pixels.length / size);
+  const palette = pixels.filter((_, i) => i % step === 1);
+  palette.length = size;
+  const index = createPaletteIndex(palette);
+  const iterations = 5;
+  const linear = bench(() => {
+    for (let oklab of pixels) findNearestLinear(oklab, palette);
+  }, iterations);
+  const indexed = bench(() => {
+    for (let oklab of pixels) findNearestInPalette(oklab, index);
+  }, iterations);
+  console.log(
+    `nearest of ${size} palette colors: linear ${linear.toFixed(1)}ms, ` +
+      `index ${indexed.toFixed(1)}ms (${(linear / indexed).toFixed(2)}x)`
+  );
+}
+
+// 8-bit sRGB pixels decoded and encoded with the transfer function tables
+// against calling the transfer functions per channel
+const bytes = new Uint8Array(1 << 20).map((_, i) => (i * 97) & 0xff);
+const linearPixels = new Float32Array(bytes.length);
+const encodedPixels = new Uint8ClampedArray(bytes.length);
+const transferBenches = [
+  [
+    "decode",
+    () => {
+      for (let i = 0; i < bytes.length; i++) {
+        linearPixels[i] = sRGBGammaToLinear(bytes[i] / 0xff);
+      }
+    },
+    () => decodeWithLUT(bytes, sRGB_decode_LUT, linearPixels),
+  ],
+  [
+    "encode",
+    () => {
+      for (let i = 0; i < linearPixels.length; i++) {
+        encodedPixels[i] = floatToByte(sRGBLinearToGamma(linearPixels[i]));
+      }
+    },
+    () => encodeToIntegers(linearPixels, sRGB_encode_LUT, encodedPixels),
+  ],
+];
+for (const [name, scalar, table] of transferBenches) {
+  const pow = bench(scalar, 20);
+  const lut = bench(table, 20);
+  console.log(
+    `sRGB ${name} of 8-bit channels: Math.pow ${pow.toFixed(1)}ms, ` +
+      `table ${lut.toFixed(1)}ms (${(pow / lut).toFixed(2)}x)`
+  );
+}
+
 // benchmark for EOK
 // for (let i = 0; i < 1000; i++) {
 //   for (let vec of vecs) {
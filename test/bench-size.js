@@ -3,6 +3,19 @@ import * as colors from "../src/index.js";
 const rgb = colors.convert([0.5, 0.15, 30], colors.OKLCH, colors.sRGB);
 console.log(rgb);
 
+// To test convert.js with single space modules, which include the OKLab matrices
+// and those of their gamuts; spaces/oklab.js also includes sRGB, the gamut of
+// OKHSL and OKHSV (`npm run bench:modules` lists what each entry loads)
+// import { convert } from "../src/convert.js";
+// import { OKLCH } from "../src/spaces/oklab.js";
+// import { DisplayP3 } from "../src/spaces/display-p3.js";
+// console.log(convert([0.5, 0.15, 30], OKLCH, DisplayP3));
+
+// To test the specialized converters, which are not part of index.js
+// import { getConverter } from "../src/converters.js";
+// import { OKLCH, sRGB } from "../src/spaces.js";
+// console.log(getConverter(OKLCH, sRGB)([0.5, 0.15, 30]));
+
 // To test colorjs.io (~55.3 kb)
 // import Color from "colorjs.io";
 // console.log(new Color("oklch", [0.5, 0.15, 30]).to("srgb").coords);
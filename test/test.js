@@ -20,6 +20,7 @@ import {
   OKLab_from,
   OKLab_to,
   transform,
+  transformPacked,
   OKHSL,
   sRGBGamut,
   OKHSV,
@@ -45,7 +46,58 @@ import {
   deserialize,
   parse,
   MapToL,
+  lookupCuspOKLCH,
+  DisplayP3Linear,
+  Rec2020Linear,
+  listColorSpaces,
+  computeMaxSaturationOKLC,
+  computeMaxSaturationPacked,
+  LMS_to_linear_DisplayP3_M,
+  OKLab_to_linear_DisplayP3_coefficients,
+  OKLab_to_linear_DisplayP3_coefficients_error,
+  ProPhotoRGBGamut,
+  listColorGamuts,
+  PACKED_COEFFICIENTS_LAYOUT,
+  deltaEOK,
+  createPaletteIndex,
+  findNearestInPalette,
+  findNearestInPaletteFlat,
+  findKNearestInPalette,
+  sRGBGammaToLinear,
+  sRGBLinearToGamma,
+  Rec2020ToLinear,
+  Rec2020ToGamma,
+  A98RGBToLinear,
+  A98RGBToGamma,
+  ProPhotoRGBToLinear,
+  ProPhotoRGBToGamma,
+  sRGB_decode_LUT,
+  sRGB_encode_LUT,
+  Rec2020_decode_LUT,
+  Rec2020_encode_LUT,
+  A98RGB_decode_LUT,
+  A98RGB_encode_LUT,
+  ProPhotoRGB_decode_LUT,
+  ProPhotoRGB_encode_LUT,
+  createDecodeLUT,
+  decodeWithLUT,
+  encodeWithLUT,
+  encodeToIntegers,
+  hexToLinearRGB,
+  computeMaxSaturationPiecewise,
+  Rec2020Gamut,
+  A98RGBGamut,
 } from "../src/index.js";
+import { getConverter, OKLCH_to_sRGB } from "../src/converters.js";
+import { parse as parseFromCore } from "../src/core.js";
+import { OKLab_to_linear_sRGB_cusp_LUT } from "../src/cusp_lut.js";
+import {
+  OKLab_to_linear_sRGB_saturation_pieces,
+  OKLab_to_linear_DisplayP3_saturation_pieces,
+  OKLab_to_linear_Rec2020_saturation_pieces,
+  OKLab_to_linear_A98RGB_saturation_pieces,
+  OKLab_to_linear_ProPhotoRGB_saturation_pieces,
+} from "../src/saturation_pieces.js";
 
 test("should convert XYZ in different whitepoints", async (t) => {
   const oklab = [0.56, 0.03, -0.1];
@@ -176,7 +228,7 @@ test("should convert to okhsl", async (t) => {
 
   const okhsv = okhsl.slice();
   const expectedLABfromOKHSV = [
-    0.45178419415172344, 0.0658295198906634, 0.03800669102949832,
+    0.4517841921681803, 0.0658295212231412, 0.03800669179880475,
   ];
   t.deepEqual(OKHSVToOKLab(okhsv, sRGBGamut), expectedLABfromOKHSV);
   t.deepEqual(
@@ -196,6 +248,22 @@ test("should convert to okhsl", async (t) => {
   );
 });
 
+test("should convert to okhsl in wide gamuts", async (t) => {
+  for (const gamut of listColorGamuts()) {
+    t.ok(gamut.stMidCoefficients, `${gamut.space.id} has S_mid and T_mid`);
+    for (let h = 0; h < 360; h += 30) {
+      for (const s of [0.25, 0.8, 1]) {
+        const okhsl = [h, s, 0.6];
+        const oklab = OKHSLToOKLab(okhsl, gamut);
+        t.ok(
+          arrayAlmostEqual(OKLabToOKHSL(oklab, gamut), okhsl),
+          `${gamut.space.id} round trip ${okhsl}`
+        );
+      }
+    }
+  }
+});
+
 test("should find cusp", async (t) => {
   const H = 30;
   const hueAngle = degToRad(H);
@@ -204,13 +272,13 @@ test("should find cusp", async (t) => {
   const bNorm = Math.sin(hueAngle);
   const out2 = [0, 0];
   const cusp = findCuspOKLCH(aNorm, bNorm, sRGBGamut, out2);
-  const hue30sRGBCusp = [0.6322837041534408, 0.2535829789121266];
+  const hue30sRGBCusp = [0.6322836946187109, 0.2535829883261977];
 
   t.equal(out2, cusp);
   t.deepEqual(cusp, hue30sRGBCusp);
 
   const cuspP3 = findCuspOKLCH(aNorm, bNorm, DisplayP3Gamut, out2);
-  const hue30P3Cusp = [0.6542359095783624, 0.2931937837912358];
+  const hue30P3Cusp = [0.6542090516186371, 0.29322446951902004];
   t.equal(out2, cuspP3);
   t.deepEqual(cuspP3, hue30P3Cusp);
 
@@ -218,7 +286,147 @@ test("should find cusp", async (t) => {
   const c2 = 0.3;
   const newLCH = [l2, c2, H];
   const mapped = gamutMapOKLCH(newLCH, sRGBGamut, OKLCH);
-  t.deepEqual(mapped, [0.679529110489262, 0.2093088779230169, 30]);
+  t.deepEqual(mapped, [0.6795291080886788, 0.20930888005751647, 30]);
+});
+
+test("should look up cusp", async (t) => {
+  const lutGamut = { ...sRGBGamut, cuspLUT: OKLab_to_linear_sRGB_cusp_LUT };
+  // exact cusps from tools/print_matrices.py
+  const exactCusps = [
+    [0, [0.647703980101593, 0.2625735482827107]],
+    [30, [0.6322836865363858, 0.253582996306244]],
+    [142.5, [0.8664447577044833, 0.29478318205532383]],
+    [200, [0.8821631400843851, 0.1499726789490365]],
+    [330, [0.6972936534159673, 0.3178367655410083]],
+    [359.99, [0.6477138652220811, 0.2625832546425516]],
+  ];
+  for (const [H, expected] of exactCusps) {
+    const hueAngle = degToRad(H);
+    const aNorm = Math.cos(hueAngle);
+    const bNorm = Math.sin(hueAngle);
+    const out = [0, 0];
+    const cusp = lookupCuspOKLCH(
+      aNorm,
+      bNorm,
+      OKLab_to_linear_sRGB_cusp_LUT,
+      out
+    );
+    t.equal(out, cusp);
+    // the table is within 1e-4 of the exact cusp at 99% of hues, but
+    // interpolation cuts the corner where the cusp bends sharply near 142°
+    const tolerance = H === 142.5 ? 1.2e-3 : 1e-4;
+    t.ok(arrayAlmostEqual(cusp, expected, tolerance), `cusp at hue ${H}`);
+    t.deepEqual(findCuspOKLCH(aNorm, bNorm, lutGamut), cusp);
+  }
+
+  const mapped = gamutMapOKLCH([0.7, 0.3, 30], lutGamut, OKLCH);
+  t.ok(
+    arrayAlmostEqual(
+      mapped,
+      [0.6795291080886788, 0.20930888005751647, 30],
+      1e-4
+    )
+  );
+});
+
+test("should refine max saturation with more Halley steps", async (t) => {
+  const lmsToRgb = LMS_to_linear_DisplayP3_M;
+  const okCoeff = OKLab_to_linear_DisplayP3_coefficients;
+  const error = OKLab_to_linear_DisplayP3_coefficients_error;
+  t.equal(error.steps, 1);
+  t.equal(error.max.length, 3);
+  t.equal(error.mean.length, 3);
+
+  for (const H of [30, 142.5, 200]) {
+    const hueAngle = degToRad(H);
+    const a = Math.cos(hueAngle);
+    const b = Math.sin(hueAngle);
+    const S1 = computeMaxSaturationOKLC(a, b, lmsToRgb, okCoeff);
+    const S3 = computeMaxSaturationOKLC(a, b, lmsToRgb, okCoeff, 3);
+    t.ok(Math.abs(S1 - S3) <= Math.max(...error.max), `hue ${H}`);
+
+    // at the refined max saturation one channel is zero
+    const rgb = OKLab_to([1, S3 * a, S3 * b], lmsToRgb);
+    t.ok(Math.abs(Math.min(...rgb)) < 1e-12, `channel at hue ${H}`);
+
+    const gamut = { ...DisplayP3Gamut, halleySteps: 3 };
+    const cusp = findCuspOKLCH(a, b, gamut);
+    t.ok(Math.abs(cusp[1] / cusp[0] - S3) < 1e-12);
+  }
+});
+
+test("should find the cusp with piecewise max saturation", async (t) => {
+  const gamuts = [
+    [sRGBGamut, OKLab_to_linear_sRGB_saturation_pieces],
+    [DisplayP3Gamut, OKLab_to_linear_DisplayP3_saturation_pieces],
+    [Rec2020Gamut, OKLab_to_linear_Rec2020_saturation_pieces],
+    [A98RGBGamut, OKLab_to_linear_A98RGB_saturation_pieces],
+    [ProPhotoRGBGamut, OKLab_to_linear_ProPhotoRGB_saturation_pieces],
+  ];
+  for (const [gamut, pieces] of gamuts) {
+    const exactGamut = { ...gamut, halleySteps: 3 };
+    const piecewiseGamut = { ...gamut, saturationPieces: pieces };
+    for (let H = 0; H < 360; H += 7.5) {
+      const hueAngle = degToRad(H);
+      const a = Math.cos(hueAngle);
+      const b = Math.sin(hueAngle);
+      const S = computeMaxSaturationPiecewise(a, b, pieces);
+      const cusp = findCuspOKLCH(a, b, piecewiseGamut);
+      const expected = findCuspOKLCH(a, b, exactGamut);
+      t.ok(
+        Math.abs(S * expected[0] - expected[1]) < 2e-5,
+        `${gamut.space.id} max saturation at hue ${H}`
+      );
+      t.ok(
+        arrayAlmostEqual(cusp, expected, 2e-5),
+        `${gamut.space.id} cusp at hue ${H}`
+      );
+    }
+  }
+
+  const mapped = gamutMapOKLCH(
+    [0.7, 0.3, 30],
+    { ...sRGBGamut, saturationPieces: OKLab_to_linear_sRGB_saturation_pieces },
+    sRGBLinear
+  );
+  t.ok(isRGBInGamut(mapped), "mapped into gamut");
+});
+
+test("should gamut map to ProPhoto RGB", async (t) => {
+  t.ok(listColorGamuts().includes(ProPhotoRGBGamut));
+  for (const H of [0, 30, 90, 150, 200, 210, 270, 330]) {
+    const mapped = gamutMapOKLCH([0.7, 0.6, H], ProPhotoRGBGamut);
+    const rgb = convert(mapped, ProPhotoRGB, ProPhotoRGBLinear);
+    t.ok(isRGBInGamut(rgb, 0), `in gamut at hue ${H}`);
+    // mapped onto the edge of the gamut, before clipping too
+    const edge = Math.min(...rgb.map((c) => Math.min(c, 1 - c)));
+    t.ok(edge < 1e-5, `on the edge at hue ${H}`);
+    const unclipped = gamutMapOKLCH([0.7, 0.6, H], ProPhotoRGBGamut, OKLCH);
+    const unclippedRGB = convert(unclipped, OKLCH, ProPhotoRGBLinear);
+    t.ok(isRGBInGamut(unclippedRGB, 1e-5), `unclipped in gamut at hue ${H}`);
+
+    const hueAngle = degToRad(H);
+    const cusp = findCuspOKLCH(Math.cos(hueAngle), Math.sin(hueAngle), {
+      ...ProPhotoRGBGamut,
+      halleySteps: 3,
+    });
+    const lab = [
+      cusp[0],
+      cusp[1] * Math.cos(hueAngle),
+      cusp[1] * Math.sin(hueAngle),
+    ];
+    const cuspRGB = convert(lab, OKLab, ProPhotoRGBLinear);
+    t.ok(Math.abs(Math.min(...cuspRGB)) < 1e-9, `cusp at hue ${H}`);
+    t.ok(Math.abs(Math.max(...cuspRGB) - 1) < 1e-9, `cusp at hue ${H}`);
+  }
+
+  // just above the yellow cusp, where the G channel rises above 1 and falls
+  // back along the line, and B reaches 0
+  for (const oklch of [[0.99, 0.38, 104.3], [0.99, 0.12, 103.6]]) {
+    const mapped = gamutMapOKLCH(oklch, ProPhotoRGBGamut, OKLCH);
+    const rgb = convert(mapped, OKLCH, ProPhotoRGBLinear);
+    t.ok(isRGBInGamut(rgb, 1e-5), `in gamut at ${oklch}`);
+  }
 });
 
 test("should gamut map", async (t) => {
@@ -284,6 +492,12 @@ test("should serialize", async (t) => {
 //   );
 // });
 
+test("should parse from core.js", async (t) => {
+  // parse() lives in spaces.js, and core.js re-exports it
+  t.equal(parseFromCore, parse);
+  t.deepEqual(parseFromCore("rgb(0, 128, 255)", sRGB), [0, 128 / 0xff, 1]);
+});
+
 test("should deserialize color string information", async (t) => {
   t.deepEqual(deserialize("rgb(0, 128, 255)"), {
     coords: [0, 128 / 0xff, 255 / 0xff],
@@ -421,6 +635,209 @@ test("should convert D65 based to D50 based color spaces", async (t) => {
   );
 });
 
+test("should convert between linear spaces with a single matrix", async (t) => {
+  const spaces = [
+    sRGBLinear,
+    DisplayP3Linear,
+    Rec2020Linear,
+    A98RGBLinear,
+    ProPhotoRGBLinear,
+  ];
+  const rgbin = [0.25, 0.5, 1];
+  for (const a of spaces) {
+    for (const b of spaces) {
+      if (a === b) continue;
+      t.ok(b.id in a.toSpace_M, `${a.id} to ${b.id} matrix`);
+      // the same as going through XYZ D65
+      const expected = convert(convert(rgbin, a, XYZ), XYZ, b);
+      t.ok(
+        arrayAlmostEqual(convert(rgbin, a, b), expected),
+        `${a.id} to ${b.id}`
+      );
+    }
+  }
+});
+
+test("should convert with specialized converters", async (t) => {
+  const spaces = listColorSpaces();
+  const inputs = [
+    [0.25, 0.5, 1],
+    [-0.1, 0.05, 1.1],
+    [0.5, 0, 0],
+  ];
+  for (const a of spaces) {
+    for (const b of spaces) {
+      const converter = getConverter(a, b);
+      for (const input of inputs) {
+        const expected = convert(input, a, b);
+        const out = [0, 0, 0];
+        t.equal(converter(input, out), out, `${a.id} to ${b.id} output`);
+        t.ok(arrayAlmostEqual(out, expected), `${a.id} to ${b.id}`);
+      }
+    }
+  }
+  t.equal(getConverter(OKLCH, sRGB), OKLCH_to_sRGB);
+  // custom spaces fall back to convert()
+  const custom = { ...sRGB };
+  t.ok(
+    arrayAlmostEqual(
+      getConverter(custom, OKLab)([0.25, 0.5, 1]),
+      convert([0.25, 0.5, 1], sRGB, OKLab)
+    )
+  );
+});
+
+test("should transform and find max saturation with packed data", async (t) => {
+  const packMatrix = (m) => Float64Array.from(m.flat());
+  const c = sRGBGamut.coefficients;
+  const coefficients = Float64Array.from([
+    ...c[0][0],
+    ...c[1][0],
+    ...c[0][1],
+    ...c[1][1],
+    ...c[2][1],
+  ]);
+  t.equal(coefficients.length, PACKED_COEFFICIENTS_LAYOUT.length);
+  const input = [0.25, 0.5, 1];
+  t.deepEqual(
+    transformPacked(input, packMatrix(sRGBLinear.toXYZ_M)),
+    transform(input, sRGBLinear.toXYZ_M)
+  );
+  const lmsToRgb = sRGBLinear.fromLMS_M;
+  const packedLmsToRgb = packMatrix(lmsToRgb);
+  for (let H = 0; H < 360; H += 15) {
+    const a = Math.cos(degToRad(H));
+    const b = Math.sin(degToRad(H));
+    for (const steps of [1, 3]) {
+      t.equal(
+        computeMaxSaturationPacked(a, b, packedLmsToRgb, coefficients, steps),
+        computeMaxSaturationOKLC(a, b, lmsToRgb, c, steps),
+        `max saturation at hue ${H}`
+      );
+    }
+  }
+});
+
+test("should find the nearest palette colors", async (t) => {
+  // a palette with duplicates, and colors between its entries
+  const palette = [];
+  const colors = [];
+  for (let i = 0; i < 300; i++) {
+    const h = (i * 137.5) % 360;
+    const L = 0.3 + (i % 7) * 0.1;
+    palette.push(convert([L, (i % 5) * 0.05, h], OKLCH, OKLab));
+    colors.push(convert([(i % 11) * 0.1, (i % 3) * 0.1, h + 10], OKLCH, OKLab));
+  }
+  palette.push(palette[10].slice(), palette[20].slice());
+  colors.push(palette[10].slice(), palette[20].slice());
+
+  const k = 4;
+  const indices = new Int32Array(k);
+  const distances = new Float64Array(k);
+  // small palettes are searched linearly rather than with the tree
+  const smallPalette = [...palette.slice(0, 64), ...palette.slice(300)];
+  for (const entries of [palette, smallPalette]) {
+    const index = createPaletteIndex(entries);
+    for (const oklab of colors) {
+      const sorted = entries
+        .map((color, i) => [deltaEOK(oklab, color), i])
+        .sort((x, y) => x[0] - y[0] || x[1] - y[1]);
+      t.equal(findNearestInPalette(oklab, index), sorted[0][1]);
+      findKNearestInPalette(oklab, index, k, indices, distances);
+      t.deepEqual(
+        Array.from(indices),
+        sorted.slice(0, k).map((x) => x[1])
+      );
+      t.ok(
+        arrayAlmostEqual(
+          Array.from(distances),
+          sorted.slice(0, k).map((x) => x[0])
+        )
+      );
+    }
+    t.equal(findNearestInPalette(entries[20], index), 20);
+
+    const flat = Float32Array.from(colors.flat());
+    const nearest = findNearestInPaletteFlat(flat, index);
+    t.equal(nearest.length, colors.length);
+    for (let i = 0; i < colors.length; i++) {
+      const color = Array.from(flat.subarray(i * 3, i * 3 + 3));
+      t.equal(nearest[i], findNearestInPalette(color, index));
+    }
+  }
+
+  const empty = createPaletteIndex([]);
+  t.equal(findNearestInPalette([0.5, 0, 0], empty), -1);
+  // fewer colors than k
+  const small = createPaletteIndex(palette.slice(0, 2));
+  findKNearestInPalette([0.5, 0, 0], small, 3, indices, distances);
+  t.deepEqual(Array.from(indices.subarray(0, 3)).sort(), [-1, 0, 1]);
+  t.equal(indices[2], -1);
+  t.equal(distances[2], Infinity);
+});
+
+test("should decode and encode with transfer function tables", async (t) => {
+  const transfers = [
+    [sRGBGammaToLinear, sRGBLinearToGamma, sRGB_decode_LUT, sRGB_encode_LUT],
+    [Rec2020ToLinear, Rec2020ToGamma, Rec2020_decode_LUT, Rec2020_encode_LUT],
+    [A98RGBToLinear, A98RGBToGamma, A98RGB_decode_LUT, A98RGB_encode_LUT],
+    [
+      ProPhotoRGBToLinear,
+      ProPhotoRGBToGamma,
+      ProPhotoRGB_decode_LUT,
+      ProPhotoRGB_encode_LUT,
+    ],
+  ];
+  for (const [toLinear, toGamma, decodeLUT, encodeLUT] of transfers) {
+    t.equal(decodeLUT.length, 256);
+    const bytes = new Uint8Array(256).map((_, i) => i);
+    const expected = Array.from(bytes, (i) => toLinear(i / 255));
+    t.ok(arrayAlmostEqual(Array.from(decodeLUT), expected, 1e-15));
+    t.ok(arrayAlmostEqual(Array.from(createDecodeLUT(toLinear)), expected));
+    t.ok(
+      arrayAlmostEqual(
+        Array.from(decodeWithLUT(bytes, decodeLUT, new Float64Array(256))),
+        expected
+      )
+    );
+    const lut16 = createDecodeLUT(toLinear, 16);
+    t.equal(lut16.length, 65536);
+    t.equal(lut16[0x8000], toLinear(0x8000 / 0xffff));
+
+    let error = 0;
+    for (let i = 0; i <= 1000; i++) {
+      const x = i / 1000;
+      const diff = Math.abs(encodeWithLUT(x, encodeLUT) - toGamma(x));
+      error = Math.max(error, diff);
+    }
+    t.ok(error < 2e-4, `encode error ${error}`);
+    t.equal(encodeWithLUT(-0.5, encodeLUT), 0);
+    t.equal(encodeWithLUT(2, encodeLUT), encodeLUT[encodeLUT.length - 1]);
+  }
+
+  t.deepEqual(
+    hexToLinearRGB("#ff8000"),
+    convert(hexToRGB("#ff8000"), sRGB, sRGBLinear)
+  );
+  t.deepEqual(
+    hexToLinearRGB("#f80", [0, 0, 0], Rec2020_decode_LUT),
+    hexToRGB("#ff8800").map(Rec2020ToLinear)
+  );
+
+  const linear = new Float32Array([0, 0.001, 0.2, 0.5, 1, -1, 2]);
+  t.deepEqual(
+    Array.from(encodeToIntegers(linear, sRGB_encode_LUT)),
+    Array.from(linear, (x) => floatToByte(sRGBLinearToGamma(x)))
+  );
+  const encoded16 = encodeToIntegers(
+    linear,
+    sRGB_encode_LUT,
+    new Uint16Array(linear.length)
+  );
+  t.deepEqual(Array.from(encoded16.subarray(4)), [65535, 0, 65535]);
+  t.ok(Math.abs(encoded16[3] - sRGBLinearToGamma(0.5) * 65535) <= 1);
+});
+
 test("should handle problematic coords", async (t) => {
   const in0 = [0.95, 1, 1.089];
   const out0 = convert(in0, XYZ, OKLab);
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+"""
+Bakes 3D LUTs of gamut mapped conversions from one RGB space to another, such as Rec. 2020 to
+sRGB, for video and image pipelines where evaluating gamutMapOKLCH per pixel is too slow.
+
+Run from the repository root:
+
+  python3 tools/bake_lut.py rec2020 srgb [--mapping MapToCuspL] [--size 33] [--cube PATH] [--raw PATH] [--jobs N]
+
+Each grid point is a color of the source space, with every channel in 0..1. It is converted to
+OKLCH and mapped into the gamut of the destination space with gamutMapOKLCH and the chosen mapping
+strategy, using tools/texel_color (the same matrices and gamut approximation as src/). The grid is
+split by blue into shards that are spread across a pool of processes.
+
+`--cube PATH` writes an Adobe / Resolve .cube file (values rounded to CUBE_DIGITS decimals) and
+`--raw PATH` writes the table as raw little endian float32, size^3 RGB triplets in the same order
+as the .cube file: red changes fastest, then green, then blue, i.e. a (blue, green, red, 3) array.
+
+The interpolation error of the table is then reported: `--samples` random source colors, off the
+grid, are mapped exactly and looked up in the float32 table with trilinear interpolation, and the
+largest and mean channel differences and the deltaEOK between the two are printed, along with the
+worst sample. The error is largest where the mapping bends, near the edge of the destination gamut.
+"""
+
+import argparse
+import concurrent.futures
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.getcwd())
+
+from tools.texel_color import convert, deltaEOK, gamutMapOKLCH, listColorGamuts, OKLab, OKLCH # noqa: E402
+from tools.texel_color import MapToL, MapToGray, MapToCuspL, MapToAdaptiveGray, MapToAdaptiveCuspL # noqa: E402
+
+MAPPINGS = {
+  'MapToL': MapToL,
+  'MapToGray': MapToGray,
+  'MapToCuspL': MapToCuspL,
+  'MapToAdaptiveGray': MapToAdaptiveGray,
+  'MapToAdaptiveCuspL': MapToAdaptiveCuspL,
+}
+
+# decimals of the values written to .cube files
+CUBE_DIGITS = 7
+
+# approximate number of colors mapped per shard, which bounds the memory of each worker
+SHARD_POINTS = 1 << 18
+
+def get_rgb_spaces():
+  # The spaces a LUT can go from or to, by id, along with the gamut each one is mapped into:
+  # the encoded space of every gamut and its linear base
+  spaces = {}
+  for gamut in listColorGamuts():
+    space = gamut['space']
+    spaces[space['id']] = (space, gamut)
+    if space.get('base'):
+      spaces[space['base']['id']] = (space['base'], gamut)
+  return spaces
+
+def map_colors(source_id, dest_id, mapping, rgb):
+  # The gamut mapped destination colors of source colors
+  spaces = get_rgb_spaces()
+  source = spaces[source_id][0]
+  (dest, gamut) = spaces[dest_id]
+  oklch = convert(rgb, source, OKLCH)
+  return gamutMapOKLCH(oklch, gamut, dest, mapping=MAPPINGS[mapping])
+
+def bake_shard(source_id, dest_id, mapping, size, blues):
+  # The table entries of the given blue indices, red changing fastest
+  steps = np.linspace(0, 1, size)
+  (b, g, r) = np.meshgrid(steps[blues], steps, steps, indexing='ij')
+  rgb = np.stack([r.ravel(), g.ravel(), b.ravel()], axis=-1)
+  return map_colors(source_id, dest_id, mapping, rgb)
+
+def run_sharded(pool, fn, args):
+  # Applies fn to every tuple of args, in the pool if there is one
+  if pool is None:
+    return [fn(*a) for a in args]
+  return list(pool.map(fn, *zip(*args)))
+
+def bake_lut(source_id, dest_id, mapping, size, pool):
+  # The (size, size, size, 3) table, indexed by blue, green then red
+  planes = max(1, SHARD_POINTS // (size * size))
+  shards = [(source_id, dest_id, mapping, size, np.arange(i, min(i + planes, size))) for i in range(0, size, planes)]
+  lut = np.concatenate(run_sharded(pool, bake_shard, shards))
+  return lut.reshape(size, size, size, 3)
+
+def interpolate_lut(lut, rgb):
+  # Trilinear interpolation of the table at source colors in 0..1
+  size = len(lut)
+  x = np.clip(rgb, 0, 1) * (size - 1)
+  i0 = np.minimum(np.floor(x).astype(int), size - 2)
+  t = x - i0
+  (r, g, b) = (i0[:, 0], i0[:, 1], i0[:, 2])
+  (tr, tg, tb) = (t[:, 0:1], t[:, 1:2], t[:, 2:3])
+
+  def lerp(a, c, s):
+    return a + (c - a) * s
+
+  c00 = lerp(lut[b, g, r], lut[b, g, r + 1], tr)
+  c01 = lerp(lut[b, g + 1, r], lut[b, g + 1, r + 1], tr)
+  c10 = lerp(lut[b + 1, g, r], lut[b + 1, g, r + 1], tr)
+  c11 = lerp(lut[b + 1, g + 1, r], lut[b + 1, g + 1, r + 1], tr)
+  return lerp(lerp(c00, c01, tg), lerp(c10, c11, tg), tb)
+
+def measure_error(lut, source_id, dest_id, mapping, samples, pool):
+  # The differences between the interpolated table and exact mapping at random off-grid colors
+  rgb = np.random.default_rng(0).uniform(0, 1, (samples, 3))
+  chunks = [(source_id, dest_id, mapping, rgb[i:i + SHARD_POINTS]) for i in range(0, samples, SHARD_POINTS)]
+  exact = np.concatenate(run_sharded(pool, map_colors, chunks))
+  interpolated = interpolate_lut(lut.astype(np.float32), rgb)
+
+  dest = get_rgb_spaces()[dest_id][0]
+  diff = np.max(np.abs(interpolated - exact), axis=-1)
+  delta = deltaEOK(convert(interpolated, dest, OKLab), convert(exact, dest, OKLab))
+  worst = np.argmax(delta)
+  return {
+    'max': float(np.max(diff)),
+    'mean': float(np.mean(diff)),
+    'p999': float(np.percentile(diff, 99.9)),
+    'deltaEOK_max': float(delta[worst]),
+    'deltaEOK_mean': float(np.mean(delta)),
+    'worst': (rgb[worst], exact[worst], interpolated[worst]),
+  }
+
+def write_cube(path, lut, title):
+  size = len(lut)
+  with open(path, 'w', encoding='utf-8') as f:
+    f.write(f'TITLE "{title}"\n')
+    f.write(f'LUT_3D_SIZE {size}\n')
+    f.write('DOMAIN_MIN 0.0 0.0 0.0\n')
+    f.write('DOMAIN_MAX 1.0 1.0 1.0\n')
+    np.savetxt(f, lut.reshape(-1, 3), fmt=f'%.{CUBE_DIGITS}f')
+
+def write_raw(path, lut):
+  lut.astype('<f4').tofile(path)
+
+def format_rgb(rgb):
+  return '(' + ', '.join(f'{v:.6f}' for v in rgb) + ')'
+
+def main(argv = None):
+  spaces = get_rgb_spaces()
+  parser = argparse.ArgumentParser(description='Bakes a 3D LUT of the gamut mapped conversion between two RGB spaces, and reports its interpolation error.')
+  parser.add_argument('source', choices=spaces.keys(), help='id of the space the LUT converts from')
+  parser.add_argument('dest', choices=spaces.keys(), help='id of the space the LUT converts and gamut maps to')
+  parser.add_argument('--mapping', choices=MAPPINGS.keys(), default='MapToCuspL', help='gamut mapping strategy (default: MapToCuspL)')
+  parser.add_argument('--size', type=int, default=33, help='number of grid points per channel (default: 33)')
+  parser.add_argument('--cube', metavar='PATH', help='write the LUT as a .cube file to PATH')
+  parser.add_argument('--raw', metavar='PATH', help='write the LUT as raw little endian float32 to PATH')
+  parser.add_argument('--samples', type=int, default=100000, help='number of random colors the interpolation error is measured on, 0 skips it (default: 100000)')
+  parser.add_argument('--jobs', '-j', type=int, default=0, help='number of processes, 0 uses all cores (default: 0)')
+  args = parser.parse_args(argv)
+  if args.size < 2:
+    parser.error('--size must be at least 2')
+
+  jobs = args.jobs if args.jobs > 0 else os.cpu_count()
+  pool = concurrent.futures.ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+  try:
+    start = time.perf_counter()
+    lut = bake_lut(args.source, args.dest, args.mapping, args.size, pool)
+    elapsed = time.perf_counter() - start
+    print(f'{args.source} to {args.dest} ({args.mapping}): {args.size}^3 LUT baked in {elapsed:.2f}s ({lut.size // 3 / elapsed / 1e6:.2f}M colors/s, {jobs} process{"es" if jobs > 1 else ""})')
+
+    title = f'{args.source} to {args.dest}, {args.mapping}'
+    if args.cube:
+      write_cube(args.cube, lut, title)
+      print(f'wrote {args.cube}')
+    if args.raw:
+      write_raw(args.raw, lut)
+      print(f'wrote {args.raw}')
+
+    if args.samples > 0:
+      error = measure_error(lut, args.source, args.dest, args.mapping, args.samples, pool)
+      print(f'trilinear interpolation error over {args.samples:,} random colors:')
+      print(f'  channel difference: max {error["max"]:.3e}, 99.9% {error["p999"]:.3e}, mean {error["mean"]:.3e}')
+      print(f'  deltaEOK: max {error["deltaEOK_max"]:.3e}, mean {error["deltaEOK_mean"]:.3e}')
+      (source, exact, interpolated) = error['worst']
+      print(f'  worst: {format_rgb(source)} maps to {format_rgb(exact)}, interpolated {format_rgb(interpolated)}')
+  finally:
+    if pool is not None:
+      pool.shutdown()
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks for the matrix generator in `tools/print_matrices.py`.
+
+Run from the repository root:
+
+  python3 tools/bench_matrices.py [--runs N] [--json PATH] [--baseline PATH [--threshold T]]
+
+Each measurement is taken in a fresh interpreter so that module caches do not hide the cold
+start cost, and the median of N runs is reported along with which heavy dependencies ended
+up being imported.
+
+The generation pipeline is then profiled stage by stage in a fresh interpreter: the imports,
+and for each gamut the matrix derivation, every channel's fit (with scipy's nfev and nit), the
+coefficient calculation and the emission of its part of the JS module. The peak RSS of the
+process is recorded after every stage.
+
+`--json PATH` writes everything as a JSON report. `--baseline PATH` compares the run against
+such a report, and exits with an error if any stage got slower (or its peak RSS grew) by more
+than the threshold, 25% by default. Differences under `--min-ms` are ignored as noise.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ['numpy', 'scipy', 'coloraide', 'matplotlib']
+
+# each snippet is timed in a fresh interpreter, from the repository root
+IMPORT_BENCHMARKS = {
+  'import calc_oklab_matrices': 'import tools.calc_oklab_matrices',
+  'import print_matrices': 'import tools.print_matrices',
+  'cached run': 'import tools.print_matrices as pm; pm.calc_gamuts(pm.GAMUTS, 1, pm.CACHE_DIR)',
+}
+
+def time_snippet(snippet):
+  code = f'''
+import sys, time, json, os
+sys.path.insert(0, os.getcwd())
+start = time.perf_counter()
+{snippet}
+elapsed = time.perf_counter() - start
+print(json.dumps({{ 'time': elapsed, 'modules': [m for m in {HEAVY_MODULES!r} if m in sys.modules] }}))
+'''
+  out = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout
+  return json.loads(out.strip().splitlines()[-1])
+
+def bench_imports(runs = 5):
+  results = {}
+  for (name, snippet) in IMPORT_BENCHMARKS.items():
+    samples = [time_snippet(snippet) for i in range(runs)]
+    results[name] = {
+      'median_ms': statistics.median([sample['time'] for sample in samples]) * 1000,
+      'modules': samples[-1]['modules'],
+    }
+  return results
+
+def get_peak_rss():
+  # peak resident set size of this process so far, in MiB
+  import resource
+  rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+  # bytes on macOS, kilobytes elsewhere
+  return rss / 2 ** 20 if sys.platform == 'darwin' else rss / 2 ** 10
+
+def profile_pipeline():
+  # Runs every stage of the generator in this process, returning a list of stage records.
+  # Meant to be called in a fresh interpreter, see bench_pipeline.
+  import contextlib
+  import io
+
+  stages = []
+  def stage(name, fn, gamut = None, **extra):
+    start = time.perf_counter()
+    value = fn()
+    record = { 'stage': name, 'gamut': gamut, 'time_ms': (time.perf_counter() - start) * 1000, 'peak_rss_mib': get_peak_rss(), **extra }
+    stages.append(record)
+    return (value, record)
+
+  (pm, _) = stage('load print_matrices', lambda: __import__('tools.print_matrices', fromlist=['*']))
+  # scipy and coloraide are imported lazily by the generator, so load them up front to keep them out of the first stages
+  stage('load dependencies', lambda: (__import__('scipy.optimize'), __import__('coloraide.algebra')))
+
+  results = []
+  for gamut in pm.GAMUTS:
+    stage('matrices', lambda: pm.get_gamut_matrices(gamut), gamut)
+    fits = {}
+    if gamut not in pm.UNSUPPORTED_GAMUTS:
+      for channel in pm.CHANNELS:
+        (result, record) = stage(f'fit {channel}', lambda: pm.fit_channel(gamut, channel), gamut)
+        record.update({ 'nfev': int(result.nfev), 'nit': int(result.nit) })
+        fits[(gamut, channel)] = result.x
+    (result, _) = stage('calc', lambda: pm.do_calc(gamut, fits), gamut)
+    results.append(result)
+    with contextlib.redirect_stdout(io.StringIO()):
+      stage('emit', lambda: pm.print_gamut(result), gamut)
+
+  with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+    stage('emit composite matrices', lambda: pm.print_composite_matrices(results))
+  return stages
+
+def bench_pipeline():
+  code = 'import sys, os, json; sys.path.insert(0, os.getcwd()); from tools.bench_matrices import profile_pipeline; print(json.dumps(profile_pipeline()))'
+  out = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout
+  return json.loads(out.strip().splitlines()[-1])
+
+def get_versions():
+  versions = { 'python': platform.python_version() }
+  for module in ['numpy', 'scipy', 'coloraide']:
+    try:
+      versions[module] = __import__(module).__version__
+    except ImportError:
+      versions[module] = None
+  return versions
+
+def stage_key(record):
+  return f'{record["gamut"]} {record["stage"]}' if record['gamut'] else record['stage']
+
+def print_stages(stages):
+  print(f'{"stage":<32} {"time":>10}   {"peak RSS":>10}   nfev / nit')
+  for record in stages:
+    evals = f'{record["nfev"]} / {record["nit"]}' if 'nfev' in record else ''
+    print(f'{stage_key(record):<32} {record["time_ms"]:7.1f} ms   {record["peak_rss_mib"]:6.1f} MiB   {evals}')
+  total = sum(record['time_ms'] for record in stages)
+  print(f'{"total":<32} {total:7.1f} ms   {max(record["peak_rss_mib"] for record in stages):6.1f} MiB')
+
+def compare_baseline(report, baseline, threshold, min_ms):
+  # Prints the change of every stage against the baseline report, returns False if any regressed
+  ok = True
+  base_stages = { stage_key(record): record for record in baseline['stages'] }
+  base_stages.update({ name: { 'time_ms': result['median_ms'] } for (name, result) in baseline['imports'].items() })
+  current = [(stage_key(record), record) for record in report['stages']]
+  current += [(name, { 'time_ms': result['median_ms'] }) for (name, result) in report['imports'].items()]
+
+  print(f'\ncompared to baseline, failing above +{threshold:.0%}')
+  print(f'{"stage":<32} {"baseline":>10}   {"current":>10}   {"change":>7}')
+  for (key, record) in current:
+    base = base_stages.get(key)
+    if base is None:
+      print(f'{key:<32} {"-":>10}   {record["time_ms"]:7.1f} ms   new')
+      continue
+    change = record['time_ms'] / base['time_ms'] - 1 if base['time_ms'] > 0 else 0
+    regressed = change > threshold and record['time_ms'] - base['time_ms'] > min_ms
+    if 'peak_rss_mib' in record and 'peak_rss_mib' in base and record['peak_rss_mib'] > base['peak_rss_mib'] * (1 + threshold):
+      regressed = True
+      print(f'{key:<32} peak RSS {base["peak_rss_mib"]:.1f} MiB -> {record["peak_rss_mib"]:.1f} MiB')
+    if record.get('nfev') != base.get('nfev'):
+      print(f'{key:<32} nfev {base.get("nfev")} -> {record.get("nfev")}')
+    ok = ok and not regressed
+    print(f'{key:<32} {base["time_ms"]:7.1f} ms   {record["time_ms"]:7.1f} ms   {change:+6.0%}{"   REGRESSION" if regressed else ""}')
+  return ok
+
+def main(argv = None):
+  parser = argparse.ArgumentParser(description='Benchmarks the matrix generator.')
+  parser.add_argument('--runs', type=int, default=5, help='number of fresh interpreters per measurement (default: 5)')
+  parser.add_argument('--json', metavar='PATH', help='write the results as a JSON report to PATH')
+  parser.add_argument('--baseline', metavar='PATH', help='compare against a JSON report, failing if a stage regressed')
+  parser.add_argument('--threshold', type=float, default=0.25, help='relative slowdown or RSS growth that counts as a regression (default: 0.25)')
+  parser.add_argument('--min-ms', type=float, default=5, help='ignore slowdowns smaller than this many milliseconds (default: 5)')
+  args = parser.parse_args(argv)
+
+  imports = bench_imports(args.runs)
+  for (name, result) in imports.items():
+    modules = ', '.join(result['modules']) or '-'
+    print(f'{name:<28} {result["median_ms"]:8.1f} ms   loaded: {modules}')
+  print()
+
+  stages = bench_pipeline()
+  print_stages(stages)
+
+  report = {
+    'versions': get_versions(),
+    'imports': imports,
+    'stages': stages,
+    'peak_rss_mib': max(record['peak_rss_mib'] for record in stages),
+  }
+  if args.json:
+    with open(args.json, 'w', encoding='utf-8') as f:
+      json.dump(report, f, indent=2)
+
+  if args.baseline:
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+      baseline = json.load(f)
+    if not compare_baseline(report, baseline, args.threshold, args.min_ms):
+      sys.exit(1)
+
+if __name__ == '__main__':
+  main()
@@ -130,25 +130,35 @@ that we match quite well up to ~7 digits.
 import sys
 import os
 import struct
+from functools import lru_cache
 
 sys.path.insert(0, os.getcwd())
 
-# import tools.calc_xyz_transform as xyzt  # noqa: E402
-from coloraide import util  # noqa: E402
-from coloraide import algebra as alg  # noqa: E402
+"""
+Calculate XYZ conversion matrices.
 
-"""Calculate XYZ conversion matrices."""
-import sys
-import os
+Nothing is computed at import time, and coloraide is only imported once a matrix is needed.
+Matrices are calculated on first use and memoized, use `get_matrix(name)` or `xyzt_white(name)`.
+The module level names (`XYZ_TO_LMS`, `xyzt_white_d65`, etc) are still available as lazy attributes.
+Returned values are shared between callers and must not be modified.
+"""
 
-sys.path.insert(0, os.getcwd())
+# white point chromaticities
+XYZT_WHITES = {
+    'd65': (0.31270, 0.32900),
+    'd50': (0.34570, 0.35850),
+    'aces': (0.32168, 0.33767),
+}
 
-xyzt_white_d65 = util.xy_to_xyz((0.31270, 0.32900))
-xyzt_white_d50 = util.xy_to_xyz((0.34570, 0.35850))
-xyzt_white_aces = util.xy_to_xyz((0.32168, 0.33767))
+@lru_cache(maxsize=None)
+def xyzt_white(name):
+    """Get the XYZ of the specified white point."""
 
-def xyzt_get_matrix(wp, space):
-    """Get the matrices for the specified space."""
+    from coloraide import util
+    return util.xy_to_xyz(XYZT_WHITES[name])
+
+def xyzt_get_primaries(space):
+    """Get the xy chromaticities of the red, green and blue primaries for the specified space."""
 
     if space == 'srgb':
         x = [0.64, 0.30, 0.15]
@@ -174,6 +184,15 @@ def xyzt_get_matrix(wp, space):
     else:
         raise ValueError
 
+    return x, y
+
+def xyzt_get_matrix(wp, space):
+    """Get the matrices for the specified space, or for the given `(x, y)` primary chromaticities."""
+
+    from coloraide import util
+    from coloraide import algebra as alg
+
+    x, y = xyzt_get_primaries(space) if isinstance(space, str) else space
     m = alg.transpose([util.xy_to_xyz(xy) for xy in zip(x, y)])
     rgb = alg.solve(m, wp)
     rgb2xyz = alg.multiply(m, rgb)
@@ -181,10 +200,11 @@ def xyzt_get_matrix(wp, space):
 
     return rgb2xyz, xyz2rgb
 
-float32 = alg.vectorize(lambda value: struct.unpack('f', struct.pack('f', value))[0])
+def float32(value):
+    """Round the (nested) values to 32 bit floats, returned as 64 bit."""
 
-# Calculated using our own `calc_xyz_transform.py`
-RGB_TO_XYZ, XYZ_TO_RGB = xyzt_get_matrix(xyzt_white_d65, 'srgb')
+    from coloraide import algebra as alg
+    return alg.vectorize(lambda value: struct.unpack('f', struct.pack('f', value))[0])(value)
 
 # Matrix provided by the author of Oklab to allow for calculating a precise M1 matrix
 # using any white point.
@@ -194,18 +214,6 @@ M0 = [
     [0.05092917, 0.27933344, 0.66973739]
 ]
 
-# Calculate XYZ to LMS and LMS to XYZ using our white point.
-XYZ_TO_LMS = alg.divide(M0, alg.outer(alg.matmul(M0, xyzt_white_d65), alg.ones(3)))
-XYZD50_TO_LMS = alg.divide(M0, alg.outer(alg.matmul(M0, xyzt_white_d50), alg.ones(3)))
-
-# Calculate the inverse
-LMS_TO_XYZ = alg.inv(XYZ_TO_LMS)
-LMS_TO_XYZD50 = alg.inv(XYZD50_TO_LMS)
-
-# Calculate linear sRGB to LMS (used for Okhsl and Okhsv)
-SRGBL_TO_LMS = alg.matmul(XYZ_TO_LMS, RGB_TO_XYZ)
-LMS_TO_SRGBL = alg.inv(SRGBL_TO_LMS)
-
 # Oklab specifies the following matrix as M1 along with the inverse.
 # ```
 # LMS3_TO_OKLAB = [
@@ -222,12 +230,58 @@ LMS_TO_SRGBL = alg.inv(SRGBL_TO_LMS)
 # In order to adjust for this, we take documented 32 bit inverse matrix which
 # gives us a perfect translation from Oklab `[1, 0, 0]` to LMS of `[1, 1, 1]`
 # and parse the matrix as float 32 and emit it as 64 bit and then take the inverse.
-OKLAB_TO_LMS3 = float32([
+M2_INV = [
     [1.0, 0.3963377774, 0.2158037573],
     [1.0, -0.1055613458, -0.0638541728],
     [1.0, -0.0894841775, -1.2914855480]
-])
+]
+
+def _xyz_to_lms(white):
+    from coloraide import algebra as alg
+    return alg.divide(M0, alg.outer(alg.matmul(M0, xyzt_white(white)), alg.ones(3)))
+
+def _inv(name):
+    from coloraide import algebra as alg
+    return alg.inv(get_matrix(name))
+
+def _matmul(a, b):
+    from coloraide import algebra as alg
+    return alg.matmul(get_matrix(a), get_matrix(b))
+
+MATRICES = {
+    # Calculated using our own `calc_xyz_transform.py`
+    'RGB_TO_XYZ': lambda: xyzt_get_matrix(xyzt_white('d65'), 'srgb')[0],
+    'XYZ_TO_RGB': lambda: xyzt_get_matrix(xyzt_white('d65'), 'srgb')[1],
+
+    # Calculate XYZ to LMS and LMS to XYZ using our white point.
+    'XYZ_TO_LMS': lambda: _xyz_to_lms('d65'),
+    'XYZD50_TO_LMS': lambda: _xyz_to_lms('d50'),
+
+    # Calculate the inverse
+    'LMS_TO_XYZ': lambda: _inv('XYZ_TO_LMS'),
+    'LMS_TO_XYZD50': lambda: _inv('XYZD50_TO_LMS'),
+
+    # Calculate linear sRGB to LMS (used for Okhsl and Okhsv)
+    'SRGBL_TO_LMS': lambda: _matmul('XYZ_TO_LMS', 'RGB_TO_XYZ'),
+    'LMS_TO_SRGBL': lambda: _inv('SRGBL_TO_LMS'),
+
+    # See the note on M2_INV above
+    'OKLAB_TO_LMS3': lambda: float32(M2_INV),
+
+    # Calculate the inverse
+    'LMS3_TO_OKLAB': lambda: _inv('OKLAB_TO_LMS3'),
+}
+
+@lru_cache(maxsize=None)
+def get_matrix(name):
+    """Get the named matrix, calculating it on first use."""
 
-# Calculate the inverse
-LMS3_TO_OKLAB = alg.inv(OKLAB_TO_LMS3)
+    return MATRICES[name]()
 
+def __getattr__(name):
+    # lazy access to the module level names this module used to calculate on import
+    if name in MATRICES:
+        return get_matrix(name)
+    if name.startswith('xyzt_white_') and name[11:] in XYZT_WHITES:
+        return xyzt_white(name[11:])
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+"""
+Checks that the committed generated modules are exactly what their generators print, so that no
+hand-edited or stale data ships.
+
+Run from the repository root (or with `npm run check:generated`):
+
+  python3 tools/check_generated.py [--skip-slow]
+
+Every generator is run as its npm script does, into a temporary directory, and the result is
+compared with the committed file. The JS modules are formatted by prettier after generation, so
+they are compared token by token: comments, names and punctuation must be the same (ignoring
+whitespace, trailing commas and quotes around keys), and numbers must have the same value. The
+Python and shader modules are not formatted and must be identical. `--skip-slow` leaves out the
+saturation pieces, which take a couple of minutes to fit.
+
+The generators are run with the cache of tools/print_matrices.py; `python3 tools/print_matrices.py
+--verify-cache` checks the cache against fresh fits.
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+# the committed files, the generator arguments printing them, and whether they are JS formatted by prettier
+GENERATED = [
+  ('src/conversion_matrices.js', ['tools/print_matrices.py', '--split', 'src/matrices'], True),
+  ('tools/texel_color/conversion_matrices.py', ['tools/print_matrices.py', '--format', 'py'], False),
+  ('src/shaders/color.glsl', ['tools/print_matrices.py', '--format', 'glsl'], False),
+  ('src/shaders/color.wgsl', ['tools/print_matrices.py', '--format', 'wgsl'], False),
+  ('src/cusp_lut.js', ['tools/print_matrices.py', '--cusp-lut', '1024'], True),
+  ('src/saturation_pieces.js', ['tools/print_matrices.py', '--saturation-pieces'], True),
+  ('src/converters.js', ['tools/print_converters.py'], True),
+  ('src/transfer_luts.js', ['tools/print_transfer_luts.py'], True),
+]
+
+SLOW = ['src/saturation_pieces.js']
+
+# the modules written by print_matrices.py --split, next to the printed module
+SPLIT_DIR = 'src/matrices'
+
+TOKEN = re.compile(r'''
+  (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<string>"[^"]*"|'[^']*'|`[^`]*`)
+  | (?P<number>-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<name>[A-Za-z_$][\w$]*)
+  | (?P<punct>\S)
+''', re.S | re.X)
+
+def tokenize(text):
+  # The tokens of a JS module, as (kind, value), with formatting differences normalized away
+  tokens = []
+  for m in TOKEN.finditer(text):
+    kind = m.lastgroup
+    value = m.group()
+    if kind == 'comment':
+      value = ' '.join(value.split())
+    elif kind == 'number':
+      value = float(value)
+    elif kind == 'string' and value[0] == '"':
+      value = "'" + value[1:-1] + "'"
+    tokens.append((kind, value))
+
+  normalized = []
+  for (i, token) in enumerate(tokens):
+    following = tokens[i + 1][1] if i + 1 < len(tokens) else None
+    # trailing commas
+    if token == ('punct', ',') and following in (']', '}', ')'):
+      continue
+    # quoted keys
+    if token[0] == 'string' and following == ':' and re.fullmatch(r"'[A-Za-z_$][\w$]*'", token[1]):
+      token = ('name', token[1][1:-1])
+    normalized.append(token)
+  return normalized
+
+def compare_js(expected, actual):
+  # The first difference between two JS modules, or None if they are the same
+  a = tokenize(expected)
+  b = tokenize(actual)
+  for (i, (x, y)) in enumerate(zip(a, b)):
+    if x != y:
+      context = ' '.join(str(v) for (_, v) in a[max(0, i - 4):i])
+      return f'generated {x[1]!r}, committed {y[1]!r} after: {context}'
+  if len(a) != len(b):
+    return f'generated {len(a)} tokens, committed {len(b)}'
+  return None
+
+def compare_text(expected, actual):
+  for (i, (x, y)) in enumerate(zip(expected.splitlines(), actual.splitlines())):
+    if x != y:
+      return f'line {i + 1}: generated {x.strip()[:60]!r}, committed {y.strip()[:60]!r}'
+  if len(expected.splitlines()) != len(actual.splitlines()):
+    return 'different number of lines'
+  return None
+
+def read(path):
+  with open(path, 'r', encoding='utf-8') as f:
+    return f.read()
+
+def generate(args, tmp):
+  # The printed module, along with the modules written by --split as { committed path: text }
+  written = {}
+  if '--split' in args:
+    split_dir = os.path.join(tmp, os.path.basename(SPLIT_DIR))
+    args = [split_dir if a == SPLIT_DIR else a for a in args]
+  output = subprocess.run([sys.executable] + args, capture_output=True, text=True, check=True).stdout
+  if '--split' in args:
+    for name in sorted(os.listdir(split_dir)):
+      # the header names the directory the modules were written to
+      written[f'{SPLIT_DIR}/{name}'] = read(os.path.join(split_dir, name)).replace(split_dir, SPLIT_DIR)
+    output = output.replace(split_dir, SPLIT_DIR)
+  return (output, written)
+
+def main(argv = None):
+  parser = argparse.ArgumentParser(description='Checks that the committed generated modules match their generators.')
+  parser.add_argument('--skip-slow', action='store_true', help=f'skip {", ".join(SLOW)}')
+  args = parser.parse_args(argv)
+
+  ok = True
+  with tempfile.TemporaryDirectory() as tmp:
+    for (path, generator, is_js) in GENERATED:
+      if args.skip_slow and path in SLOW:
+        print(f'{path:<42} skipped')
+        continue
+      (output, written) = generate(generator, tmp)
+      compare = compare_js if is_js else compare_text
+      for (committed, text) in [(path, output)] + list(written.items()):
+        difference = compare(text, read(committed))
+        print(f'{committed:<42} {"ok" if difference is None else "DIFFERS, " + difference}')
+        ok = ok and difference is None
+      if written:
+        extra = set(os.listdir(SPLIT_DIR)) - {os.path.basename(p) for p in written}
+        for name in sorted(extra):
+          print(f'{SPLIT_DIR + "/" + name:<42} DIFFERS, not generated')
+          ok = False
+
+  print(f'generated modules {"match" if ok else "do not match"} their generators')
+  sys.exit(0 if ok else 1)
+
+if __name__ == '__main__':
+  main()
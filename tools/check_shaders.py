@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+"""
+Checks the GLSL and WGSL modules emitted by `tools/print_matrices.py --format glsl|wgsl` on the CPU.
+
+Run from the repository root:
+
+  python3 tools/check_shaders.py [--count N]
+
+The constants of src/shaders/color.glsl and src/shaders/color.wgsl are parsed back and checked
+to be the same float64 values as tools/texel_color/conversion_matrices.py. They are then rounded
+to float32, as a GPU does, and the OKLab conversions and gamut mapping of the shaders are run in
+float32 with NumPy (`tools/texel_color` keeps the precision of its inputs), and compared against
+the float64 results. The shaders take one Halley step, so they are compared against gamuts that
+take one step too, even where the built-in gamut asks for more (ProPhoto RGB). Random colors are used, along with every 0.01 degree hue at full chroma for
+gamut mapping.
+
+The float32 results are expected to be within `CONVERSION_TOLERANCE` of the float64 results
+for conversions, and within `GAMUT_MAP_TOLERANCE` for gamut mapping. The largest gamut mapping
+errors are isolated (near hues where the channel that goes below zero first changes, a rounding
+difference can select the other channel's polynomial), so the 99.9th percentile is reported too.
+"""
+
+import argparse
+import os
+import re
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.getcwd())
+
+from tools.texel_color import OKLab_from, OKLab_to, findCuspOKLCH, findGamutIntersectionOKLCH, gamutMapOKLCH, listColorGamuts # noqa: E402
+from tools.texel_color.util import stack3 # noqa: E402
+import tools.texel_color.conversion_matrices as conversion_matrices # noqa: E402
+
+SHADERS = {
+  'glsl': 'src/shaders/color.glsl',
+  'wgsl': 'src/shaders/color.wgsl',
+}
+
+# maximum difference between float32 and float64 linear RGB and OKLab, relative to the largest coordinate
+CONVERSION_TOLERANCE = 1e-5
+
+# maximum difference between float32 and float64 gamut mapped linear RGB
+GAMUT_MAP_TOLERANCE = 1e-4
+
+NUMBER = r'-?[0-9.]+(?:e[-+]?[0-9]+)?'
+
+def parse_numbers(text):
+  return [float(x) for x in re.findall(NUMBER, text)]
+
+def parse_shader(path):
+  # The matrices and gamuts of an emitted module, as { name: row-major matrix } and
+  # { name: [LMS_to_RGB name, dirR, dirG, kR, kG, kB, k4] }
+  with open(path, 'r', encoding='utf-8') as f:
+    source = f.read()
+
+  matrices = {}
+  for (name, values) in re.findall(r'const (?:mat3 )?(\w+_M) = mat3(?:x3<f32>)?\(([^)]*)\)', source):
+    # column-major, so the transpose is the row-major matrix used by texel_color
+    matrices[name] = np.array(parse_numbers(values)).reshape(3, 3).T
+
+  gamuts = {}
+  for (name, body) in re.findall(r'const (?:OKGamut )?(\w+Gamut) = OKGamut\(\n(.*?)\n\);', source, re.S):
+    fields = body.split('\n')
+    vectors = [parse_numbers(re.sub(r'^\s*vec\d(<f32>)?', '', field)) for field in fields[1:]]
+    gamuts[name] = [fields[0].strip().rstrip(',')] + vectors
+  return (matrices, gamuts)
+
+def check_constants(matrices, gamuts):
+  # The largest difference between the parsed constants and the texel_color ones, which should be zero
+  diff = 0.0
+  for (name, M) in matrices.items():
+    diff = max(diff, np.max(np.abs(M - np.array(getattr(conversion_matrices, name)))))
+  for (name, (lmsToRgb, dirR, dirG, kR, kG, kB, k4)) in gamuts.items():
+    coefficients = getattr(conversion_matrices, lmsToRgb.replace('LMS_to_', 'OKLab_to_').replace('_M', '_coefficients'))
+    expected = [coefficients[0][0], coefficients[1][0], coefficients[0][1][:4], coefficients[1][1][:4], coefficients[2][1][:4], [c[1][4] for c in coefficients]]
+    for (actual, values) in zip([dirR, dirG, kR, kG, kB, k4], expected):
+      diff = max(diff, np.max(np.abs(np.array(actual) - np.array(values))))
+  return diff
+
+def get_float32_gamut(name, matrices, gamuts):
+  # A texel_color gamut dict holding the parsed constants as float32, in place of the float64 ones
+  (lmsToRgb, dirR, dirG, kR, kG, kB, k4) = gamuts[name]
+  f32 = lambda x: np.asarray(x, dtype=np.float32)
+  # the blue channel has no direction, as it is selected when neither red nor green are
+  coefficients = [[f32(d), f32(k + [k4[i]])] for (i, (d, k)) in enumerate([(dirR, kR), (dirG, kG), ([0, 0], kB)])]
+  return { 'space': { 'fromLMS_M': f32(matrices[lmsToRgb]) }, 'coefficients': coefficients }
+
+def map_gamut_float32(oklch, gamut):
+  # gamutMapOKLCH of the shaders, mapping with MapToCuspL and returning the clipped linear RGB
+  lmsToRgb = gamut['space']['fromLMS_M']
+  (L, C, H) = (np.clip(oklch[:, 0], 0, 1), np.maximum(oklch[:, 1], 0), oklch[:, 2])
+  hueAngle = np.radians(H)
+  (a, b) = (np.cos(hueAngle), np.sin(hueAngle))
+  rgb = OKLab_to(stack3(L, C * a, C * b), lmsToRgb)
+
+  outside = ~np.all((rgb >= 0) & (rgb <= 1), axis=-1)
+  (L, C, a, b) = (L[outside], C[outside], a[outside], b[outside])
+  cusp = findCuspOKLCH(a, b, gamut)
+  LTarget = cusp[:, 0]
+  t = findGamutIntersectionOKLCH(a, b, L, C, LTarget, cusp, gamut)
+  mappedL = LTarget * (1 - t) + L * t
+  mappedC = C * t
+  rgb[outside] = OKLab_to(stack3(mappedL, mappedC * a, mappedC * b), lmsToRgb)
+  return np.clip(rgb, 0, 1)
+
+def relative_difference(actual, expected):
+  return np.max(np.abs(actual - expected), axis=-1) / max(1, np.max(np.abs(expected)))
+
+def main(argv = None):
+  parser = argparse.ArgumentParser(description='Checks the constants of the emitted shaders, and their float32 error.')
+  parser.add_argument('--count', type=int, default=100000, help='number of random colors (default: 100000)')
+  args = parser.parse_args(argv)
+
+  ok = True
+  parsed = { key: parse_shader(path) for (key, path) in SHADERS.items() }
+  for (key, (matrices, gamuts)) in parsed.items():
+    diff = check_constants(matrices, gamuts)
+    print(f'{SHADERS[key]}: {len(matrices)} matrices, {len(gamuts)} gamuts, max difference from texel_color {diff:.3e}')
+    ok = ok and diff == 0 and len(gamuts) > 0
+  (matrices, gamuts) = parsed['glsl']
+
+  rng = np.random.default_rng(0)
+  rgb = rng.uniform(-0.1, 1.1, (args.count, 3))
+  hues = np.arange(36000) * 0.01
+  oklch = np.concatenate([
+    np.stack([rng.uniform(0, 1, args.count), rng.uniform(0, 0.5, args.count), rng.uniform(0, 360, args.count)], axis=-1),
+    np.stack([np.full_like(hues, 0.7), np.full_like(hues, 0.4), hues], axis=-1),
+  ])
+
+  print('gamut                  linear RGB > OKLab > linear RGB   gamut map (max / 99.9%)')
+  for gamut in listColorGamuts():
+    space = gamut['space'].get('base') or gamut['space']
+    # the shader gamut whose LMS to RGB matrix is the one of this gamut
+    gamut_name = next(n for (n, g) in gamuts.items() if getattr(conversion_matrices, g[0]) is space['fromLMS_M'])
+    gamut32 = get_float32_gamut(gamut_name, matrices, gamuts)
+    fromLMS = gamut32['space']['fromLMS_M']
+    toLMS = np.float32(matrices[gamuts[gamut_name][0].replace('LMS_to_', '').replace('_M', '_to_LMS_M')])
+
+    # round trip through OKLab
+    oklab64 = OKLab_from(rgb, space['toLMS_M'])
+    oklab32 = OKLab_from(rgb.astype(np.float32), toLMS)
+    back32 = OKLab_to(oklab32, fromLMS)
+    conversion = max(np.max(relative_difference(oklab32, oklab64)), np.max(relative_difference(back32, rgb)))
+
+    mapped64 = gamutMapOKLCH(oklch, { **gamut, 'halleySteps': 1 }, space)
+    mapped32 = map_gamut_float32(oklch.astype(np.float32), gamut32)
+    error = np.abs(mapped32 - mapped64).max(axis=-1)
+    (worst, percentile) = (np.max(error), np.percentile(error, 99.9))
+
+    print(f'{gamut_name:<22} {conversion:33.3e}   {worst:.3e} / {percentile:.3e}')
+    ok = ok and conversion <= CONVERSION_TOLERANCE and worst <= GAMUT_MAP_TOLERANCE
+
+  print(f'float32 shader constants {"agree" if ok else "do not agree"} with float64 within {CONVERSION_TOLERANCE:g} (conversions) and {GAMUT_MAP_TOLERANCE:g} (gamut mapping)')
+  sys.exit(0 if ok else 1)
+
+if __name__ == '__main__':
+  main()
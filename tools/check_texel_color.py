@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+"""
+Cross-checks the NumPy conversions in `tools/texel_color` against the JS library.
+
+Run from the repository root (requires node):
+
+  python3 tools/check_texel_color.py [--count N]
+
+Random sRGB colors (slightly beyond the 0..1 range) are converted to every space in JS, then
+every space is converted to every other space in both JS and Python. The largest differences
+are reported, hues of near-achromatic colors are ignored as they are numerical noise.
+
+Random OKLCH colors are also gamut mapped to every gamut with every mapping strategy, with
+the gamut's own space and OKLCH as the target spaces.
+
+Finally, the random colors (in OKLab) are looked up in palettes of several sizes with the
+nearest and k nearest palette queries, whose indices must be the same in JS and Python.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.getcwd())
+
+from tools.texel_color import convert, listColorSpaces, listColorGamuts, gamutMapOKLCH, OKLab, OKLCH, sRGB # noqa: E402
+from tools.texel_color import createPaletteIndex, findNearestInPalette, findKNearestInPalette # noqa: E402
+import tools.texel_color.gamut as gamut_module # noqa: E402
+
+# maximum difference between the JS and Python outputs, relative to the largest output coordinate
+TOLERANCE = 1e-5
+
+JS_CONVERT = '''
+import { convert, listColorSpaces, sRGB } from "./src/index.js";
+const srgb = JSON.parse(process.argv[1]);
+const spaces = listColorSpaces();
+const inputs = {};
+for (const s of spaces) inputs[s.id] = srgb.map((c) => convert(c, sRGB, s));
+const outputs = {};
+for (const a of spaces)
+  for (const b of spaces)
+    outputs[`${a.id}>${b.id}`] = inputs[a.id].map((c) => convert(c, a, b));
+console.log(JSON.stringify({ inputs, outputs }));
+'''
+
+JS_GAMUT_MAP = '''
+import * as colors from "./src/index.js";
+const oklch = JSON.parse(process.argv[1]);
+const outputs = {};
+for (const gamut of colors.listColorGamuts())
+  for (const mapping of %s)
+    for (const target of [gamut.space, colors.OKLCH])
+      outputs[`${gamut.space.id}>${target.id} ${mapping}`] = oklch.map((c) =>
+        colors.gamutMapOKLCH(c, gamut, target, [0, 0, 0], colors[mapping])
+      );
+console.log(JSON.stringify(outputs));
+'''
+
+JS_PALETTE = '''
+import { readFileSync } from "fs";
+import * as colors from "./src/index.js";
+// read from stdin, as the palettes are too large for an argument
+const { palettes, queries, k } = JSON.parse(readFileSync(0, "utf8"));
+const outputs = {};
+for (const palette of palettes) {
+  const index = colors.createPaletteIndex(palette);
+  outputs[`${palette.length} nearest`] = queries.map((q) => colors.findNearestInPalette(q, index));
+  outputs[`${palette.length} ${k} nearest`] = queries.map((q) => Array.from(colors.findKNearestInPalette(q, index, k)));
+}
+console.log(JSON.stringify(outputs));
+'''
+
+# palette sizes and k of the palette queries
+PALETTE_SIZES = [1, 16, 256, 4096]
+PALETTE_K = 4
+
+MAPPINGS = ['MapToL', 'MapToGray', 'MapToCuspL', 'MapToAdaptiveGray', 'MapToAdaptiveCuspL']
+
+# index of the hue in each polar space
+HUES = { 'oklch': 2, 'okhsl': 0, 'okhsv': 0 }
+
+def run_js(script, data):
+  out = subprocess.run(['node', '--input-type=module', '-e', script, json.dumps(data.tolist())], check=True, capture_output=True, text=True).stdout
+  return json.loads(out)
+
+def relative_difference(actual, expected, space_id):
+  diff = np.abs(actual - expected)
+  if space_id in HUES:
+    hue = HUES[space_id]
+    diff[..., hue] = np.minimum(diff[..., hue], 360 - diff[..., hue])
+    diff[..., hue] = np.where(np.abs(expected[..., 1]) < 1e-6, 0, diff[..., hue])
+  return np.max(diff) / max(1, np.max(np.abs(expected)))
+
+def compare(srgb):
+  data = run_js(JS_CONVERT, srgb)
+  spaces = { space['id']: space for space in listColorSpaces() }
+  results = []
+  for (key, expected) in data['outputs'].items():
+    (a, b) = key.split('>')
+    expected = np.array(expected)
+    actual = convert(np.array(data['inputs'][a]), spaces[a], spaces[b])
+    results.append((relative_difference(actual, expected, b), key))
+  return sorted(results, reverse=True)
+
+def compare_gamut_map(oklch):
+  data = run_js(JS_GAMUT_MAP % json.dumps(MAPPINGS), oklch)
+  results = []
+  for gamut in listColorGamuts():
+    for mapping in MAPPINGS:
+      for target in [gamut['space'], OKLCH]:
+        key = f'{gamut["space"]["id"]}>{target["id"]} {mapping}'
+        # small chunks, so that chunking is exercised too
+        actual = gamutMapOKLCH(oklch, gamut, target, mapping=getattr(gamut_module, mapping), chunk_size=97)
+        results.append((relative_difference(actual, np.array(data[key]), target['id']), key))
+  return sorted(results, reverse=True)
+
+def compare_palette(oklab, rng):
+  # The fraction of palette queries whose indices differ between JS and Python
+  palettes = [oklab[rng.choice(len(oklab), size)] + rng.normal(0, 1e-3, (size, 3)) for size in PALETTE_SIZES]
+  data = { 'palettes': [palette.tolist() for palette in palettes], 'queries': oklab.tolist(), 'k': PALETTE_K }
+  out = subprocess.run(['node', '--input-type=module', '-e', JS_PALETTE], input=json.dumps(data), check=True, capture_output=True, text=True).stdout
+  data = json.loads(out)
+  results = []
+  for palette in palettes:
+    index = createPaletteIndex(palette)
+    for (key, actual) in [(f'{len(palette)} nearest', findNearestInPalette(oklab, index)), (f'{len(palette)} {PALETTE_K} nearest', findKNearestInPalette(oklab, index, PALETTE_K)[0])]:
+      results.append((np.mean(np.any((actual != np.array(data[key])).reshape(len(oklab), -1), axis=-1)), key))
+  return sorted(results, reverse=True)
+
+def main(argv = None):
+  parser = argparse.ArgumentParser(description='Cross-checks tools/texel_color against the JS conversions.')
+  parser.add_argument('--count', type=int, default=1000, help='number of random colors (default: 1000)')
+  args = parser.parse_args(argv)
+
+  rng = np.random.default_rng(0)
+  srgb = rng.uniform(-0.1, 1.1, (args.count, 3))
+  oklch = np.stack([rng.uniform(-0.1, 1.1, args.count), rng.uniform(0, 0.5, args.count), rng.uniform(0, 360, args.count)], axis=-1)
+  ok = True
+
+  oklab = convert(srgb, sRGB, OKLab)
+  for (label, results) in [('conversions', compare(srgb)), ('gamut mappings', compare_gamut_map(oklch)), ('palette queries', compare_palette(oklab, rng))]:
+    print(f'{len(results)} {label} of {args.count} colors, largest relative differences:')
+    for (diff, key) in results[:10]:
+      print(f'  {key:<40} {diff:.3e}')
+    ok = ok and results[0][0] <= TOLERANCE
+
+  print(f'JS and Python {"agree" if ok else "do not agree"} within {TOLERANCE:g}')
+  sys.exit(0 if ok else 1)
+
+if __name__ == '__main__':
+  main()
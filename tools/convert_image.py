@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+
+"""
+Converts large float images between RGB spaces with OKLCH gamut mapping, streaming them through
+memory-mapped files so that buffers far larger than memory can be converted.
+
+Run from the repository root:
+
+  python3 tools/convert_image.py rec2020-linear srgb input.npy --output output.npy [--mapping MapToCuspL] [--jobs N]
+  python3 tools/convert_image.py rec2020-linear display-p3 input.f32 --dtype float32 --channels 4 --in-place
+
+Inputs are `.npy` files, whose last axis holds the channels, or raw interleaved pixels (anything
+else) with `--dtype float32|float16` and `--channels 3|4`. A fourth channel is alpha and is passed
+through. The converted pixels are written back into the input with `--in-place`, or to a new
+memory-mapped file with `--output PATH`, in the same format and shape as the input and with the
+input's dtype unless `--out-dtype` is given.
+
+The pixels are split into chunks of `--chunk` pixels, which are converted by a pool of processes.
+Each worker maps the files itself and reads and writes only its chunk, so memory stays bounded by
+the chunk size and the number of workers regardless of the size of the image. Every chunk is
+converted to OKLCH and mapped into the gamut of the destination space with gamutMapOKLCH of
+tools/texel_color (the same matrices and gamut approximation as src/), like tools/bake_lut.py.
+
+Progress is reported on stderr while converting, followed by the throughput in megapixels/s.
+"""
+
+import argparse
+import concurrent.futures
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.getcwd())
+
+from tools.texel_color import convert, gamutMapOKLCH, OKLCH # noqa: E402
+from tools.bake_lut import MAPPINGS, get_rgb_spaces # noqa: E402
+
+RAW_DTYPES = ['float32', 'float16']
+NPY_DTYPES = ['float64', 'float32', 'float16']
+
+# default number of pixels converted per task, which bounds the memory of each worker
+CHUNK_PIXELS = 1 << 20
+
+# seconds between progress reports
+PROGRESS_INTERVAL = 0.5
+
+def is_npy(path):
+  return path.lower().endswith('.npy')
+
+def open_pixels(spec, mode):
+  # Maps an image described by (path, dtype, channels) as an (N, channels) array, a view of the file
+  (path, dtype, channels) = spec
+  if is_npy(path):
+    image = np.load(path, mmap_mode=mode)
+    if not image.flags.c_contiguous:
+      raise ValueError(f'{path} must be stored in C order')
+    return image.reshape(-1, image.shape[-1])
+  return np.memmap(path, dtype=dtype, mode=mode).reshape(-1, channels)
+
+def get_image_info(path, dtype, channels):
+  # The (shape, dtype) of an input image
+  if is_npy(path):
+    image = np.load(path, mmap_mode='r')
+    if image.ndim < 2 or image.shape[-1] not in (3, 4):
+      raise ValueError(f'{path} must have 3 or 4 channels in its last axis, got shape {image.shape}')
+    if image.dtype.name not in NPY_DTYPES:
+      raise ValueError(f'{path} must be one of {", ".join(NPY_DTYPES)}, got {image.dtype}')
+    return (image.shape, image.dtype)
+  if dtype is None or channels is None:
+    raise ValueError(f'{path} is raw, --dtype and --channels are required')
+  size = os.path.getsize(path)
+  pixel_bytes = np.dtype(dtype).itemsize * channels
+  if size % pixel_bytes != 0:
+    raise ValueError(f'{path} is {size} bytes, which is not a whole number of {channels} channel {dtype} pixels')
+  return ((size // pixel_bytes, channels), np.dtype(dtype))
+
+def create_output(path, shape, dtype):
+  # Creates the output file, to be filled by the workers
+  if is_npy(path):
+    image = np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=shape)
+  else:
+    image = np.memmap(path, dtype=dtype, mode='w+', shape=shape)
+  image.flush()
+  del image
+
+# the images mapped by this process, so each worker maps them once
+mapped_images = {}
+
+def get_pixels(spec, mode):
+  key = (spec, mode)
+  if key not in mapped_images:
+    mapped_images[key] = open_pixels(spec, mode)
+  return mapped_images[key]
+
+def convert_chunk(source_id, dest_id, mapping, input_spec, output_spec, start, end):
+  # Converts the pixels [start, end) of the input into the output, returning the number converted
+  spaces = get_rgb_spaces()
+  source = spaces[source_id][0]
+  (dest, gamut) = spaces[dest_id]
+  in_place = input_spec == output_spec
+  pixels = get_pixels(input_spec, 'r+' if in_place else 'r')
+  out = pixels if in_place else get_pixels(output_spec, 'r+')
+
+  rgb = np.asarray(pixels[start:end, :3], dtype=np.float64)
+  oklch = convert(rgb, source, OKLCH)
+  # only the first three channels are written, alpha is left as it is
+  gamutMapOKLCH(oklch, gamut, dest, out=out[start:end], mapping=MAPPINGS[mapping])
+  if not in_place and out.shape[-1] == 4:
+    out[start:end, 3] = pixels[start:end, 3]
+  return end - start
+
+class Progress:
+  def __init__(self, total):
+    self.total = total
+    self.done = 0
+    self.start = time.perf_counter()
+    self.reported = self.start
+
+  def update(self, count):
+    self.done += count
+    now = time.perf_counter()
+    if now - self.reported >= PROGRESS_INTERVAL or self.done == self.total:
+      self.reported = now
+      elapsed = now - self.start
+      sys.stderr.write(f'\r{self.done / self.total:6.1%}  {self.done / 1e6:.1f} / {self.total / 1e6:.1f} MP  {self.done / 1e6 / elapsed:.2f} MP/s')
+      sys.stderr.flush()
+
+  def finish(self):
+    sys.stderr.write('\n')
+    return time.perf_counter() - self.start
+
+def run_chunks(pool, tasks, progress):
+  # Converts every chunk, in the pool if there is one, reporting progress as chunks complete
+  if pool is None:
+    for task in tasks:
+      progress.update(convert_chunk(*task))
+    return
+  futures = [pool.submit(convert_chunk, *task) for task in tasks]
+  try:
+    for future in concurrent.futures.as_completed(futures):
+      progress.update(future.result())
+  except BaseException:
+    for future in futures:
+      future.cancel()
+    raise
+
+def main(argv = None):
+  spaces = get_rgb_spaces()
+  parser = argparse.ArgumentParser(description='Converts a memory-mapped float image between RGB spaces with OKLCH gamut mapping.')
+  parser.add_argument('source', choices=spaces.keys(), help='id of the space of the input pixels')
+  parser.add_argument('dest', choices=spaces.keys(), help='id of the space to convert and gamut map to')
+  parser.add_argument('input', help='.npy file, or raw interleaved pixels')
+  output = parser.add_mutually_exclusive_group(required=True)
+  output.add_argument('--output', '-o', metavar='PATH', help='write the converted pixels to a new file at PATH')
+  output.add_argument('--in-place', action='store_true', help='write the converted pixels back into the input')
+  parser.add_argument('--dtype', choices=RAW_DTYPES, help='type of the channels of a raw input')
+  parser.add_argument('--channels', type=int, choices=[3, 4], help='number of channels of a raw input, the fourth is alpha')
+  parser.add_argument('--out-dtype', choices=NPY_DTYPES, help='type of the channels of the output (default: the input type)')
+  parser.add_argument('--mapping', choices=MAPPINGS.keys(), default='MapToCuspL', help='gamut mapping strategy (default: MapToCuspL)')
+  parser.add_argument('--chunk', type=int, default=CHUNK_PIXELS, help=f'number of pixels per task (default: {CHUNK_PIXELS})')
+  parser.add_argument('--jobs', '-j', type=int, default=0, help='number of processes, 0 uses all cores (default: 0)')
+  args = parser.parse_args(argv)
+  if args.chunk < 1:
+    parser.error('--chunk must be at least 1')
+
+  try:
+    (shape, dtype) = get_image_info(args.input, args.dtype, args.channels)
+  except (OSError, ValueError) as e:
+    parser.error(str(e))
+  channels = shape[-1]
+  input_spec = (args.input, dtype.name, channels)
+  if args.in_place:
+    if args.out_dtype and args.out_dtype != dtype.name:
+      parser.error('--out-dtype can not change the type of an image converted in place')
+    output_spec = input_spec
+  else:
+    if is_npy(args.output) != is_npy(args.input):
+      parser.error('the output must be in the same format as the input (.npy or raw)')
+    if os.path.exists(args.output) and os.path.samefile(args.output, args.input):
+      parser.error('the output is the input, use --in-place')
+    out_dtype = np.dtype(args.out_dtype or dtype)
+    if not is_npy(args.output) and out_dtype.name not in RAW_DTYPES:
+      parser.error(f'raw outputs must be one of {", ".join(RAW_DTYPES)}')
+    create_output(args.output, shape, out_dtype)
+    output_spec = (args.output, out_dtype.name, channels)
+
+  pixels = int(np.prod(shape[:-1]))
+  tasks = [(args.source, args.dest, args.mapping, input_spec, output_spec, start, min(start + args.chunk, pixels)) for start in range(0, pixels, args.chunk)]
+  jobs = args.jobs if args.jobs > 0 else os.cpu_count()
+  jobs = min(jobs, max(1, len(tasks)))
+  pool = concurrent.futures.ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+  progress = Progress(pixels)
+  try:
+    run_chunks(pool, tasks, progress)
+  finally:
+    if pool is not None:
+      pool.shutdown(cancel_futures=True)
+  elapsed = progress.finish()
+
+  target = args.input if args.in_place else args.output
+  print(f'{args.source} to {args.dest} ({args.mapping}): {pixels / 1e6:.2f} MP in {elapsed:.2f}s ({pixels / 1e6 / elapsed:.2f} MP/s, {jobs} process{"es" if jobs > 1 else ""}), wrote {target}')
+
+if __name__ == '__main__':
+  main()
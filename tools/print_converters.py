@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+
+"""
+Prints a JS module of converters specialized to each pair of built-in color spaces, such as
+`OKLCH_to_sRGB(input, out)`, along with `getConverter(fromSpace, toSpace)` to look them up.
+
+Run from the repository root (or with `npm run converters`):
+
+  python3 tools/print_converters.py > src/converters.js
+
+The route `convert` in src/convert.js would take between two spaces (transfer functions, OKLab,
+XYZ, chromatic adaptation) is resolved here, and consecutive matrices are multiplied together,
+so each converter is a fixed sequence of scalar operations with the matrices inlined as
+constants. The matrices are those of tools/texel_color, which are generated from the same data
+as src/conversion_matrices.js. OKHSL and OKHSV are left to `convert`.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.getcwd())
+
+from tools.texel_color import spaces as S # noqa: E402
+from tools.texel_color.conversion_matrices import OKLab_to_LMS_M, LMS_to_OKLab_M # noqa: E402
+
+# the spaces that get converters, along with their JS export names
+SPACES = [
+  (S.XYZ, 'XYZ'),
+  (S.XYZD50, 'XYZD50'),
+  (S.OKLab, 'OKLab'),
+  (S.OKLCH, 'OKLCH'),
+  (S.sRGB, 'sRGB'),
+  (S.sRGBLinear, 'sRGBLinear'),
+  (S.DisplayP3, 'DisplayP3'),
+  (S.DisplayP3Linear, 'DisplayP3Linear'),
+  (S.Rec2020, 'Rec2020'),
+  (S.Rec2020Linear, 'Rec2020Linear'),
+  (S.A98RGB, 'A98RGB'),
+  (S.A98RGBLinear, 'A98RGBLinear'),
+  (S.ProPhotoRGB, 'ProPhotoRGB'),
+  (S.ProPhotoRGBLinear, 'ProPhotoRGBLinear'),
+]
+
+# the toBase and fromBase steps of every space with a base, transfer functions are the scalar
+# functions of src/spaces, imported by the module
+BASE_STEPS = {
+  'xyz-d50': ([('matrix', S.D50_to_D65_M)], [('matrix', S.D65_to_D50_M)]),
+  'oklch': ([('oklch_to_oklab',)], [('oklab_to_oklch',)]),
+  'srgb': ([('transfer', 'sRGBGammaToLinear')], [('transfer', 'sRGBLinearToGamma')]),
+  'display-p3': ([('transfer', 'sRGBGammaToLinear')], [('transfer', 'sRGBLinearToGamma')]),
+  'rec2020': ([('transfer', 'Rec2020ToLinear')], [('transfer', 'Rec2020ToGamma')]),
+  'a98-rgb': ([('transfer', 'A98RGBToLinear')], [('transfer', 'A98RGBToGamma')]),
+  'prophoto-rgb': ([('transfer', 'ProPhotoRGBToLinear')], [('transfer', 'ProPhotoRGBToGamma')]),
+}
+
+# the module each transfer function is imported from
+TRANSFER_MODULES = {
+  './spaces/util.js': ['sRGBGammaToLinear', 'sRGBLinearToGamma'],
+  './spaces/rec2020.js': ['Rec2020ToLinear', 'Rec2020ToGamma'],
+  './spaces/a98-rgb.js': ['A98RGBToLinear', 'A98RGBToGamma'],
+  './spaces/prophoto-rgb.js': ['ProPhotoRGBToLinear', 'ProPhotoRGBToGamma'],
+}
+
+MAX_LINE = 80
+
+def get_route(from_space, to_space):
+  # The steps convert() takes from one space to the other, see src/convert.js
+  steps = []
+  if from_space.get('base'):
+    steps += BASE_STEPS[from_space['id']][0]
+    from_space = from_space['base']
+  to_base = to_space.get('base') or to_space
+
+  if from_space is not to_base:
+    to_xyz = [('matrix', from_space.get('toXYZ_M'))] if from_space['id'] != 'xyz' else []
+    from_xyz = [('matrix', to_base.get('fromXYZ_M'))] if to_base['id'] != 'xyz' else []
+    adapt = [('matrix', space['adapt'][key]) for (space, key) in [(from_space, 'to'), (to_base, 'from')] if space.get('adapt')]
+    if from_space['id'] == 'oklab':
+      steps += [('matrix', OKLab_to_LMS_M), ('cube',)]
+      if to_base.get('fromLMS_M'):
+        steps += [('matrix', to_base['fromLMS_M'])]
+      else:
+        steps += [('matrix', S.XYZ['fromLMS_M'])] + adapt + from_xyz
+    elif to_base['id'] == 'oklab':
+      if from_space.get('toLMS_M'):
+        steps += [('matrix', from_space['toLMS_M'])]
+      else:
+        steps += to_xyz + adapt + [('matrix', S.XYZ['toLMS_M'])]
+      steps += [('cbrt',), ('matrix', LMS_to_OKLab_M)]
+    elif to_base['id'] in from_space.get('toSpace_M', {}):
+      steps += [('matrix', from_space['toSpace_M'][to_base['id']])]
+    else:
+      steps += to_xyz + adapt + from_xyz
+
+  if to_space is not to_base:
+    steps += BASE_STEPS[to_space['id']][1]
+  return fold_matrices(steps)
+
+def fold_matrices(steps):
+  # Multiplies consecutive matrix steps into one
+  folded = []
+  for step in steps:
+    if step[0] == 'matrix' and folded and folded[-1][0] == 'matrix':
+      folded[-1] = ('matrix', np.asarray(step[1]) @ np.asarray(folded[-1][1]))
+    else:
+      folded.append(step)
+  return folded
+
+def js_number(x):
+  # the shortest representation that round-trips, formatted as JS prints it
+  text = repr(float(x))
+  if text.endswith('.0'):
+    text = text[:-2]
+  if 'e' in text:
+    (mantissa, exponent) = text.split('e')
+    text = f'{mantissa}e{int(exponent)}'
+  return text
+
+def format_const(name, value):
+  # a declaration the way prettier formats it, value may be a list of terms of a long sum
+  if isinstance(value, str):
+    return [f'  const {name} = {value};']
+  line = f'  const {name} = {value[0]}' + ''.join(f' {op} {term}' for (op, term) in value[1:]) + ';'
+  if len(line) <= MAX_LINE:
+    return [line]
+  lines = [f'  const {name} =', f'    {value[0]}']
+  for (op, term) in value[1:]:
+    lines[-1] += f' {op}'
+    lines.append(f'    {term}')
+  return lines[:-1] + [lines[-1] + ';']
+
+def format_terms(row, names):
+  # the dot product of a matrix row with the channels, as the terms of a sum
+  terms = []
+  for (c, name) in zip(row, names):
+    term = name if c == 1 else f'{js_number(abs(c))} * {name}'
+    if not terms:
+      terms.append(f'-{term}' if c < 0 else term)
+    else:
+      terms.append(('-' if c < 0 else '+', term))
+  return terms
+
+def format_step(step, names, index):
+  # The lines of a step, and the names of the channels it leaves
+  out = [f'{channel}{index}' for channel in 'xyz']
+  (x, y, z) = names
+  kind = step[0]
+  if kind == 'matrix':
+    lines = sum([format_const(out[i], format_terms(row, names)) for (i, row) in enumerate(np.asarray(step[1]))], [])
+  elif kind == 'transfer':
+    lines = [f'  const {o} = {step[1]}({n});' for (o, n) in zip(out, names)]
+  elif kind == 'cube':
+    lines = [f'  const {o} = {n} * {n} * {n};' for (o, n) in zip(out, names)]
+  elif kind == 'cbrt':
+    lines = [f'  const {o} = Math.cbrt({n});' for (o, n) in zip(out, names)]
+  elif kind == 'oklch_to_oklab':
+    # chroma is left unclamped, see src/spaces/oklab.js
+    out[0] = x
+    lines = [
+      f'  const {out[1]} = {y} * Math.cos(({z} * Math.PI) / 180);',
+      f'  const {out[2]} = {y} * Math.sin(({z} * Math.PI) / 180);',
+    ]
+  elif kind == 'oklab_to_oklch':
+    out[0] = x
+    lines = [
+      f'  const isAchromatic{index} =',
+      f'    Math.abs({y}) < ACHROMATIC_EPSILON && Math.abs({z}) < ACHROMATIC_EPSILON;',
+      f'  const {out[1]} = isAchromatic{index} ? 0 : Math.sqrt({y} * {y} + {z} * {z});',
+      f'  const {out[2]} = isAchromatic{index}',
+      '    ? 0',
+      f'    : constrainAngle((Math.atan2({z}, {y}) * 180) / Math.PI);',
+    ]
+  else:
+    raise ValueError(f'unknown step {kind}')
+  return (lines, out)
+
+def get_converter_name(from_name, to_name):
+  return f'{from_name}_to_{to_name}'
+
+def print_converter(from_space, from_name, to_space, to_name):
+  print(f'export const {get_converter_name(from_name, to_name)} = (input, out = vec3()) => {{')
+  names = ['x0', 'y0', 'z0']
+  print('  const x0 = input[0],')
+  print('    y0 = input[1],')
+  print('    z0 = input[2];')
+  for (i, step) in enumerate(get_route(from_space, to_space)):
+    (lines, names) = format_step(step, names, i + 1)
+    print('\n'.join(lines))
+  for (i, name) in enumerate(names):
+    print(f'  out[{i}] = {name};')
+  print('  return out;')
+  print('};')
+  print()
+
+def main():
+  print('/** This file is auto-generated by tools/print_converters.py */\n')
+  print('import { vec3, constrainAngle } from "./util.js";')
+  print('import { convert } from "./convert.js";')
+  for (module, names) in TRANSFER_MODULES.items():
+    line = f'import {{ {", ".join(names)} }} from "{module}";'
+    if len(line) > MAX_LINE:
+      line = 'import {\n' + ''.join(f'  {name},\n' for name in names) + f'}} from "{module}";'
+    print(line)
+  print('import {')
+  for (_, name) in SPACES:
+    print(f'  {name},')
+  print('} from "./spaces.js";')
+  print()
+  print('// based on colorjs.io, the same as src/spaces/oklab.js')
+  print('const ACHROMATIC_EPSILON = (0.4 - 0.0) / 100000;')
+  print()
+
+  for (from_space, from_name) in SPACES:
+    for (to_space, to_name) in SPACES:
+      if from_space is not to_space:
+        print_converter(from_space, from_name, to_space, to_name)
+
+  # looked up by space object, so custom spaces reusing a built-in id fall back to convert()
+  print('const converters = new Map([')
+  for (from_space, from_name) in SPACES:
+    print('  [')
+    print(f'    {from_name},')
+    print('    new Map([')
+    for (to_space, to_name) in SPACES:
+      if from_space is not to_space:
+        print(f'      [{to_name}, {get_converter_name(from_name, to_name)}],')
+    print('    ]),')
+    print('  ],')
+  print(']);')
+  print('''
+export const getConverter = (fromSpace, toSpace) => {
+  // the converter specialized to the pair of spaces, or one that uses convert()
+  const converter = converters.get(fromSpace)?.get(toSpace);
+  if (converter) return converter;
+  return (input, out = vec3()) => convert(input, fromSpace, toSpace, out);
+};''')
+
+if __name__ == '__main__':
+  main()
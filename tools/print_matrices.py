@@ -36,22 +36,33 @@ This notebook was used to compute coefficients for the compute_max_saturation fu
 
 The code is available for reference, since it could be useful to derive coefficients for other color spaces. It was
 written quickly to derive the values and both structure and documentation is poor.
+
+**Usage**
+
+Run from the repository root (or with `npm run matrices`):
+
+  python3 tools/print_matrices.py --split src/matrices > src/conversion_matrices.js
+  python3 tools/print_matrices.py --format py > tools/texel_color/conversion_matrices.py
+
+See `--help` for the other modules it prints and the options of the fits.
 """
 
 # Commented out `IPython` magic to ensure Python compatibility.
+# Note: scipy, coloraide and matplotlib are imported where they are used, so that
+# fully cached runs and diagnostics-free runs start quickly.
 import numpy as np
-import scipy.optimize
-import matplotlib.pyplot as plt
 import sys
 import os
 import json
-from coloraide import algebra as alg
+import argparse
+import concurrent.futures
+import contextlib
+import hashlib
+import time
 sys.path.insert(0, os.getcwd())
 
 # Use higher precision Oklab conversion matrix along with LMS matrix with our exact white point
-from tools.calc_oklab_matrices import xyzt_white_d65, xyzt_white_d50, xyzt_get_matrix, SRGBL_TO_LMS, LMS_TO_SRGBL, LMS3_TO_OKLAB, OKLAB_TO_LMS3, LMS_TO_XYZD50, XYZD50_TO_LMS # noqa: E402
-
-PRINT_DIAGS = False
+from tools.calc_oklab_matrices import XYZT_WHITES, M0, M2_INV, xyzt_white, xyzt_get_primaries, xyzt_get_matrix, get_matrix # noqa: E402
 
 # Recalculated for consistent reference white
 # see https://github.com/w3c/csswg-drafts/issues/6642#issuecomment-943521484
@@ -79,24 +90,183 @@ OKLAB_TO_LMS3 = [
 ]
 
 
+# the generated module is either JS (src/conversion_matrices.js) or Python (tools/texel_color/conversion_matrices.py)
+OUTPUT_FORMATS = {
+  'js': { 'declare': 'export const {name} = {value};\n', 'comment': '// {text}\n', 'header': '/** {text} */\n' },
+  'py': { 'declare': '{name} = {value}\n', 'comment': '# {text}\n', 'header': '"""{text}"""\n' },
+  # the JS module with every matrix and gamut's coefficients packed into a flat Float64Array, see format_packed
+  'packed': { 'declare': 'export const {name} = {value};\n', 'comment': '// {text}\n', 'header': '/** {text} */\n', 'packed': True },
+  # shader modules are the constants filled into a template of tools/shader_templates, see print_shader
+  'glsl': {
+    'comment': '// {text}\n', 'header': '/* {text} */\n',
+    'matrix': 'const mat3 {name} = mat3(\n{value}\n);\n', 'vector': 'vec{size}({value})',
+    'gamut': 'const OKGamut {name} = OKGamut(\n{value}\n);\n',
+  },
+  'wgsl': {
+    'comment': '// {text}\n', 'header': '/* {text} */\n',
+    'matrix': 'const {name} = mat3x3<f32>(\n{value}\n);\n', 'vector': 'vec{size}<f32>({value})',
+    'gamut': 'const {name} = OKGamut(\n{value}\n);\n',
+  },
+}
+SHADER_FORMATS = ['glsl', 'wgsl']
+SHADER_TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'shader_templates')
+output_format = OUTPUT_FORMATS['js']
+
+def print_declaration (name, value):
+  print(output_format['declare'].format(name=name, value=value))
+
+def print_comment (text):
+  print(output_format['comment'].format(text=text))
+
+def format_packed (values):
+  # a flat Float64Array, matrices are packed row-major
+  return f'new Float64Array({json.dumps([float(v) for v in values])})'
+
+def pack_coefficients (coeff):
+  # the red and green directions, then the polynomial of each channel, as PACKED_COEFFICIENTS_LAYOUT in src/gamut.js
+  return coeff[0][0] + coeff[1][0] + coeff[0][1] + coeff[1][1] + coeff[2][1]
+
 def print_matrix (a, b, arr):
-  data = json.dumps(arr.tolist(), indent=2, separators=(',', ': '))
+  if output_format.get('packed'):
+    data = format_packed(np.ravel(arr))
+  else:
+    data = json.dumps(arr.tolist(), indent=2, separators=(',', ': '))
   suffix = '_M'
-  print(f'export const {a}_to_{b}{suffix} = {data};\n')
+  print_declaration(f'{a}_to_{b}{suffix}', data)
 
 def print_rational (a, b, rstr):
   suffix = '_M'
-  print(f'export const {a}_to_{b}{suffix} = {eval(rstr)};\n')
+  value = eval(rstr)
+  print_declaration(f'{a}_to_{b}{suffix}', format_packed(np.ravel(value)) if output_format.get('packed') else value)
 
 
 def print_json (label, data):
   str = json.dumps(data, indent=2, separators=(',', ': '))
-  print(f'export const {label} = {str};\n')
-
-def do_calc(GAMUT = 'srgb'):
-  global SRGBL_TO_LMS, LMS_TO_SRGBL, LMS3_TO_OKLAB, OKLAB_TO_LMS3, XYZD50_TO_LMS, LMS_TO_XYZD50, XYZD50_TO_LMS
-  np.set_printoptions(precision=8)
+  print_declaration(label, str)
+
+GAMUTS = ['srgb', 'display-p3', 'rec2020', 'a98-rgb', 'prophoto-rgb']
+
+# gamuts that do not yet support OKLab gamut approximation
+UNSUPPORTED_GAMUTS = []
+
+CHANNELS = ['R', 'G', 'B']
+
+# initial guesses for the numerical fits of each channel, gamuts with imaginary primaries start from
+# a least squares fit to the exact max saturation instead (see get_initial_coefficients)
+INITIAL_COEFFICIENTS = {
+  'R': [1.19086277, 1.76576728, 0.59662641, 0.75515197, 0.56771245],
+  'G': [0.73956515, -0.45954404,  0.08285427,  0.12541073, -0.14503204],
+  'B': [1.35733652, -0.00915799, -1.1513021,  -0.50559606,  0.00692167],
+}
+
+# number of hues sampled along each channel's edge of the gamut
+RESOLUTION = 100000
+
+# number of Halley steps computeMaxSaturationOKLC takes from the polynomial, the coefficients are
+# fitted for this count and the runtime should take as many (see `halleySteps` in src/gamut.js)
+HALLEY_STEPS = 1
+
+# numbers of hues the fits run on in turn, each stage starting from the coefficients of the last,
+# so only the final stage polishes on every hue. It reaches the objective and max error of a
+# single fit on every hue with fewer evaluations (see --compare-schedule)
+FIT_SCHEDULE = [2000, 10000, RESOLUTION]
+
+# The S_mid and T_mid polynomials of OKHSL (see computeStMid in src/okhsl.js), smooth approximations
+# from below of the S = C / L and T = C / (1 - L) of the cusp, each evaluated as
+# k0 + 1 / (k1 + k2 * b + a * (k3 + k4 * b + a * (k5 + k6 * b + a * (k7 + k8 * b + k9 * a)))).
+# These are Björn Ottosson's, fitted for sRGB: sRGB keeps them, and they are the initial guesses of
+# the fits for the other gamuts (see fit_st_mid).
+ST_MID_SRGB = [
+  [0.11516993, 7.4477897, 4.1590124, -2.19557347, 1.75198401, -2.13704948, -10.02301043, -4.24894561, 5.38770819, 4.69891013],
+  [0.11239642, 1.6132032, -0.68124379, 0.40370612, 0.90148123, -0.27087943, 0.6122399, 0.00299215, -0.45399568, -0.14661872],
+]
 
+# number of hues over [0, 360) the S_mid and T_mid polynomials are fitted on
+ST_MID_HUES = 3600
+
+# weight of the squared relative error where a polynomial is above the cusp, so that the fits stay below it
+ST_MID_OVER_WEIGHT = 1000
+
+# largest ratio of a fitted polynomial to the exact S or T of the cusp, fits above it are scaled down
+ST_MID_LIMIT = 0.999
+
+# Gamuts defined by their primaries with --gamut or --config, as { id: definition }, see
+# parse_custom_gamut. They are fitted the same way as the built-in ones and printed as a module
+# of spaces and gamuts, see print_custom_gamut_module.
+CUSTOM_GAMUTS = {}
+
+# transfer functions of custom gamuts, as the built-in space whose toBase and fromBase are reused,
+# a number (or `gamma:N`) gives a sign preserving power function instead
+CUSTOM_TRANSFERS = {
+  'linear': None,
+  'srgb': 'sRGB',
+  'rec2020': 'Rec2020',
+  'a98-rgb': 'A98RGB',
+  'prophoto-rgb': 'ProPhotoRGB',
+}
+
+def parse_custom_gamut(data):
+  # Checks a gamut definition, given as { name, id, primaries, white, transfer } where primaries
+  # are the [x, y] of red, green and blue (or a space known to xyzt_get_primaries, as 'aces-ap1'),
+  # and white is a white point name of XYZT_WHITES or its [x, y]. Returns it normalized.
+  name = data.get('name')
+  if not isinstance(name, str) or not name.isidentifier():
+    raise ValueError(f'expected the gamut name to be a JS identifier, got {name!r}')
+  gamut_id = data.get('id', name.lower())
+  if gamut_id in GAMUTS:
+    raise ValueError(f'gamut id {gamut_id!r} is already used by a built-in gamut')
+
+  primaries = data.get('primaries')
+  if isinstance(primaries, str):
+    try:
+      (x, y) = xyzt_get_primaries(primaries)
+    except ValueError:
+      raise ValueError(f'unknown primaries {primaries!r}')
+    primaries = [[x[i], y[i]] for i in range(3)]
+  if np.shape(primaries) != (3, 2):
+    raise ValueError(f'expected primaries to be three [x, y] pairs, got {primaries!r}')
+
+  white = data.get('white', 'd65')
+  if isinstance(white, str):
+    if white not in XYZT_WHITES:
+      raise ValueError(f'unknown white point {white!r}, expected one of {list(XYZT_WHITES)} or [x, y]')
+  elif np.shape(white) != (2,):
+    raise ValueError(f'expected white point to be a name or [x, y], got {white!r}')
+  else:
+    white = [float(c) for c in white]
+
+  transfer = data.get('transfer', 'linear')
+  if isinstance(transfer, str) and transfer.startswith('gamma:'):
+    transfer = transfer[6:]
+  if transfer not in CUSTOM_TRANSFERS:
+    try:
+      transfer = float(transfer)
+    except (TypeError, ValueError):
+      raise ValueError(f'unknown transfer function {transfer!r}, expected one of {list(CUSTOM_TRANSFERS)} or gamma:N')
+
+  return {
+    'id': gamut_id,
+    'name': name,
+    'primaries': [[float(x), float(y)] for (x, y) in primaries],
+    'white': white,
+    'transfer': transfer,
+  }
+
+def register_custom_gamuts(definitions):
+  # also the initializer of the worker processes of fit_gamuts
+  for definition in definitions:
+    CUSTOM_GAMUTS[definition['id']] = definition
+
+def read_gamut_config(path):
+  # The gamut definitions of a JSON file, a list of definitions (or a single one) as taken by
+  # parse_custom_gamut, e.g. [{ "name": "ACEScg", "primaries": "aces-ap1", "white": "aces" }]
+  with open(path, 'r', encoding='utf-8') as f:
+    data = json.load(f)
+  return [parse_custom_gamut(entry) for entry in (data if isinstance(data, list) else [data])]
+
+def get_var_name(GAMUT = 'srgb'):
+  if GAMUT in CUSTOM_GAMUTS:
+    return f'linear_{CUSTOM_GAMUTS[GAMUT]["name"]}'
   var_name = 'linear_sRGB'
   if GAMUT == 'display-p3':
     var_name = 'linear_DisplayP3'
@@ -106,10 +276,26 @@ def do_calc(GAMUT = 'srgb'):
     var_name = 'linear_A98RGB'
   elif GAMUT == 'prophoto-rgb':
     var_name = 'linear_ProPhotoRGB'
-
-  white = xyzt_white_d50 if GAMUT == 'prophoto-rgb' else xyzt_white_d65
-  whitepoint = 'D50' if GAMUT == 'prophoto-rgb' else 'D65'
-  RGBL_TO_XYZ, XYZ_TO_RGBL = xyzt_get_matrix(white, GAMUT)
+  return var_name
+
+def get_gamut_inputs(GAMUT = 'srgb'):
+  # Everything the matrices and fits of a gamut are derived from, these are hashed to key the cache
+  if GAMUT in CUSTOM_GAMUTS:
+    custom = CUSTOM_GAMUTS[GAMUT]
+    white = custom['white']
+    return {
+      'primaries': [list(c) for c in zip(*custom['primaries'])],
+      'white': white if isinstance(white, str) else None,
+      'white_xy': list(XYZT_WHITES[white]) if isinstance(white, str) else white,
+      'RGBL_TO_XYZ': None,
+      'XYZ_TO_RGBL': None,
+      'RGBL_TO_XYZ_RATIONAL': '',
+      'XYZ_TO_RGBL_RATIONAL': '',
+    }
+
+  white = 'd50' if GAMUT == 'prophoto-rgb' else 'd65'
+  RGBL_TO_XYZ = None
+  XYZ_TO_RGBL = None
 
   """
   Hard coding the matrices using rational numbers to match CSS working draft spec.
@@ -187,146 +373,674 @@ def do_calc(GAMUT = 'srgb'):
       [  0.00000000000000000,  0.00000000000000000,  1.21196754563894520 ]
     ]
 
+  return {
+    'primaries': [list(c) for c in xyzt_get_primaries(GAMUT)],
+    'white': white,
+    'white_xy': list(XYZT_WHITES[white]),
+    'RGBL_TO_XYZ': RGBL_TO_XYZ,
+    'XYZ_TO_RGBL': XYZ_TO_RGBL,
+    'RGBL_TO_XYZ_RATIONAL': RGBL_TO_XYZ_RATIONAL,
+    'XYZ_TO_RGBL_RATIONAL': XYZ_TO_RGBL_RATIONAL,
+  }
+
+def get_custom_gamut_matrices(inputs):
+  # Custom gamuts are relative to XYZ D65, with the Bradford adaptation from their white point folded
+  # into their matrices (the same adaptation as D50_TO_D65), so their spaces need no `adapt`
+  from coloraide import util, cat
+
+  white_xy = tuple(inputs['white_xy'])
+  (RGBL_TO_XYZ, XYZ_TO_RGBL) = xyzt_get_matrix(util.xy_to_xyz(white_xy), inputs['primaries'])
+  if white_xy != XYZT_WHITES['d65']:
+    RGBL_TO_XYZ = np.asfarray(cat.calc_adaptation_matrices(white_xy, XYZT_WHITES['d65'], cat.Bradford.MATRIX)) @ RGBL_TO_XYZ
+    XYZ_TO_RGBL = np.linalg.inv(RGBL_TO_XYZ)
+  RGBL_TO_LMS = np.asfarray(XYZ_TO_LMS) @ RGBL_TO_XYZ
+
+  return {
+    'RGBL_TO_XYZ': RGBL_TO_XYZ,
+    'XYZ_TO_RGBL': XYZ_TO_RGBL,
+    'RGBL_TO_XYZ_RATIONAL': '',
+    'XYZ_TO_RGBL_RATIONAL': '',
+    'RGBL_TO_LMS': RGBL_TO_LMS,
+    'LMS_TO_RGBL': np.linalg.inv(RGBL_TO_LMS),
+  }
+
+def get_gamut_matrices(GAMUT = 'srgb'):
+  from coloraide import algebra as alg
+
+  inputs = get_gamut_inputs(GAMUT)
+  if GAMUT in CUSTOM_GAMUTS:
+    return get_custom_gamut_matrices(inputs)
+  RGBL_TO_XYZ_RATIONAL = inputs['RGBL_TO_XYZ_RATIONAL']
+  XYZ_TO_RGBL_RATIONAL = inputs['XYZ_TO_RGBL_RATIONAL']
+
+  RGBL_TO_XYZ, XYZ_TO_RGBL = xyzt_get_matrix(xyzt_white(inputs['white']), GAMUT)
+  if inputs['RGBL_TO_XYZ'] is not None:
+    RGBL_TO_XYZ = inputs['RGBL_TO_XYZ']
+  if inputs['XYZ_TO_RGBL'] is not None:
+    XYZ_TO_RGBL = inputs['XYZ_TO_RGBL']
+
   if len(XYZ_TO_RGBL_RATIONAL) > 0:
     XYZ_TO_RGBL = eval(XYZ_TO_RGBL_RATIONAL)
   if len(RGBL_TO_XYZ_RATIONAL) > 0:
     RGBL_TO_XYZ = eval(RGBL_TO_XYZ_RATIONAL)
-    
+
   # Calculate the gamut <-> LMS matrices to adjust the working gamut
   if GAMUT == 'srgb':
-      RGBL_TO_LMS = SRGBL_TO_LMS
-      LMS_TO_RGBL = LMS_TO_SRGBL
+      RGBL_TO_LMS = get_matrix('SRGBL_TO_LMS')
+      LMS_TO_RGBL = get_matrix('LMS_TO_SRGBL')
   elif GAMUT == 'prophoto-rgb':
-      # Note: this is not currently used in the final results as ProPhoto gamut is not yet supported
+      # D50 based, so through XYZ D50 to LMS, which is the same Bradford adaptation to D65 that
+      # convert() applies, rather than get_matrix('XYZD50_TO_LMS') (a von Kries scaling in LMS)
       RGBL_TO_LMS = alg.matmul(XYZD50_TO_LMS, RGBL_TO_XYZ)
       LMS_TO_RGBL = alg.inv(RGBL_TO_LMS)
   else:
       RGBL_TO_LMS = alg.matmul(XYZ_TO_LMS, RGBL_TO_XYZ)
       LMS_TO_RGBL = alg.inv(RGBL_TO_LMS)
 
-  def printarray (label, arr):
-    print(label, '[ ' + ', '.join([str(n) for n in arr]) + ' ]')
-
-  # print('RGBL_TO_LMS',RGBL_TO_LMS)
-  # print('LMS_TO_RGBL', LMS_TO_RGBL)
-
+  return {
+    'RGBL_TO_XYZ': RGBL_TO_XYZ,
+    'XYZ_TO_RGBL': XYZ_TO_RGBL,
+    'RGBL_TO_XYZ_RATIONAL': RGBL_TO_XYZ_RATIONAL,
+    'XYZ_TO_RGBL_RATIONAL': XYZ_TO_RGBL_RATIONAL,
+    'RGBL_TO_LMS': np.asfarray(RGBL_TO_LMS),
+    'LMS_TO_RGBL': np.asfarray(LMS_TO_RGBL),
+  }
+
+def linear_rgb_to_oklab(RGBL_TO_LMS, c):
+  l = RGBL_TO_LMS[0][0] * c[0, ...] + RGBL_TO_LMS[0][1] * c[1, ...] + RGBL_TO_LMS[0][2] * c[2, ...]
+  m = RGBL_TO_LMS[1][0] * c[0, ...] + RGBL_TO_LMS[1][1] * c[1, ...] + RGBL_TO_LMS[1][2] * c[2, ...]
+  s = RGBL_TO_LMS[2][0] * c[0, ...] + RGBL_TO_LMS[2][1] * c[1, ...] + RGBL_TO_LMS[2][2] * c[2, ...]
+
+  l_ = np.cbrt(l)
+  m_ = np.cbrt(m)
+  s_ = np.cbrt(s)
+
+  return np.array([
+      LMS3_TO_OKLAB[0][0] * l_ + LMS3_TO_OKLAB[0][1] * m_ + LMS3_TO_OKLAB[0][2] * s_,
+      LMS3_TO_OKLAB[1][0] * l_ + LMS3_TO_OKLAB[1][1] * m_ + LMS3_TO_OKLAB[1][2] * s_,
+      LMS3_TO_OKLAB[2][0] * l_ + LMS3_TO_OKLAB[2][1] * m_ + LMS3_TO_OKLAB[2][2] * s_,
+  ])
+
+# define functions for R, G and B as functions of S, h (with L = 1 and S = C/L)
+# the channel is selected by passing its row `w` of the LMS to linear RGB matrix
+
+def to_lms(S, h):
+  a = S * np.cos(h)
+  b = S * np.sin(h)
+
+  l_ = OKLAB_TO_LMS3[0][0] + OKLAB_TO_LMS3[0][1] * a + OKLAB_TO_LMS3[0][2] * b
+  m_ = OKLAB_TO_LMS3[1][0] + OKLAB_TO_LMS3[1][1] * a + OKLAB_TO_LMS3[1][2] * b
+  s_ = OKLAB_TO_LMS3[2][0] + OKLAB_TO_LMS3[2][1] * a + OKLAB_TO_LMS3[2][2] * b
+
+  l = l_ * l_ * l_
+  m = m_ * m_ * m_
+  s = s_ * s_ * s_
+
+  return (l, m, s)
+
+def to_lms_k(h):
+  # l_, m_ and s_ are 1 + S * k along the hue h (with L = 1)
+  kl = OKLAB_TO_LMS3[0][1] * np.cos(h) + OKLAB_TO_LMS3[0][2] * np.sin(h)
+  km = OKLAB_TO_LMS3[1][1] * np.cos(h) + OKLAB_TO_LMS3[1][2] * np.sin(h)
+  ks = OKLAB_TO_LMS3[2][1] * np.cos(h) + OKLAB_TO_LMS3[2][2] * np.sin(h)
+  return (kl, km, ks)
+
+def to_lms_dS(S, h):
+  # d/dS of to_lms
+  (kl, km, ks) = to_lms_k(h)
+
+  l_ = 1 + S * kl
+  m_ = 1 + S * km
+  s_ = 1 + S * ks
+
+  l = 3 * kl * l_ * l_
+  m = 3 * km * m_ * m_
+  s = 3 * ks * s_ * s_
+
+  return (l, m, s)
+
+def to_lms_dS2(S, h):
+  # d^2/dS^2 of to_lms
+  (kl, km, ks) = to_lms_k(h)
+
+  l = 6 * kl * kl * (1 + S * kl)
+  m = 6 * km * km * (1 + S * km)
+  s = 6 * ks * ks * (1 + S * ks)
+
+  return (l, m, s)
+
+def to_channel(w, S, h):
+  (l, m, s) = to_lms(S, h)
+  return w[0] * l + w[1] * m + w[2] * s
+
+def to_channel_dS(w, S, h):
+  (l, m, s) = to_lms_dS(S, h)
+  return w[0] * l + w[1] * m + w[2] * s
+
+def to_channel_dS2(w, S, h):
+  (l, m, s) = to_lms_dS2(S, h)
+  return w[0] * l + w[1] * m + w[2] * s
+
+def halley_step(w, S, h):
+  # One Halley step towards the S where the channel is zero, as computeMaxSaturationOKLC in src/gamut.js takes it
+  f = to_channel(w, S, h)
+  f1 = to_channel_dS(w, S, h)
+  f2 = to_channel_dS2(w, S, h)
+  return S - f * f1 / (f1 ** 2 - f * f2 / 2)
+
+# derivatives with respect to S, used for the analytic gradient of the fitting objective
+def to_lms_grad(S, h, order = 2):
+  # d/dS of to_lms, to_lms_dS and to_lms_dS2
+  (kl, km, ks) = to_lms_k(h)
+  d0 = to_lms_dS(S, h)
+  if order == 0:
+    return (d0,)
+  d1 = to_lms_dS2(S, h)
+  d2 = (6 * kl ** 3 * np.ones_like(S), 6 * km ** 3 * np.ones_like(S), 6 * ks ** 3 * np.ones_like(S))
+  return (d0, d1, d2)
+
+def to_channel_slope(w, S, h):
+  (d0,) = to_lms_grad(S, h, 0)
+  return w[0] * d0[0] + w[1] * d0[1] + w[2] * d0[2]
+
+def to_channel_grad(w, S, h):
+  (d0, d1, d2) = to_lms_grad(S, h)
+  return (
+    w[0] * d0[0] + w[1] * d0[1] + w[2] * d0[2],
+    w[0] * d1[0] + w[1] * d1[1] + w[2] * d1[2],
+    w[0] * d2[0] + w[1] * d2[1] + w[2] * d2[2],
+  )
+
+def halley_step_grad(w, S, h):
+  # the same step as halley_step, along with the derivative of the result with respect to S
+  f = to_channel(w, S, h)
+  f1 = to_channel_dS(w, S, h)
+  f2 = to_channel_dS2(w, S, h)
+  (df, df1, df2) = to_channel_grad(w, S, h)
+
+  n = f * f1
+  d = f1 ** 2 - f * f2 / 2
+  dn = df * f1 + f * df1
+  dd = 2 * f1 * df1 - (df * f2 + f * df2) / 2
+
+  return (S - n / d, 1 - (dn * d - n * dd) / d ** 2)
+
+def get_primary_hues(RGBL_TO_LMS):
+  r_lab = linear_rgb_to_oklab(RGBL_TO_LMS, np.array([1, 0, 0]))
+  g_lab = linear_rgb_to_oklab(RGBL_TO_LMS, np.array([0, 1, 0]))
+  b_lab = linear_rgb_to_oklab(RGBL_TO_LMS, np.array([0, 0, 1]))
+
+  r_h = np.arctan2(r_lab[2], r_lab[1])
+  g_h = np.arctan2(g_lab[2], g_lab[1])
+  b_h = np.arctan2(b_lab[2], b_lab[1])
+
+  return (r_h, g_h, b_h)
+
+# hues around each primary that are searched for the hue where the first channel to go below zero changes
+SECTOR_SEARCH_HUES = np.radians(np.linspace(-30, 30, 601))
+
+# searched when the channels do not switch within SECTOR_SEARCH_HUES, as for the green to red switch of ACES AP0
+SECTOR_SEARCH_ALL_HUES = np.radians(np.linspace(-180, 180, 3601))
+
+# bisection steps refining each of those hues
+SECTOR_ITERATIONS = 50
+
+sector_hues_cache = {}
+
+def get_first_channel(LMS_TO_RGBL, h):
+  # The index of the channel that goes below zero first at each hue, at the exact max saturation
+  W = np.asfarray(LMS_TO_RGBL)
+  S = find_max_saturation_exact(W, h)
+  k = np.array(to_lms_k(h)).T
+  return np.argmin(((1 + S[:, None] * k) ** 3) @ W.T, axis=-1)
+
+def has_imaginary_primaries(RGBL_TO_LMS):
+  # whether a primary lies outside of the spectral locus, with a negative LMS component
+  return bool(np.any(np.asfarray(RGBL_TO_LMS) < 0))
+
+def get_sector_hues(RGBL_TO_LMS):
+  # The hues where the channel that goes below zero first changes, as (r_h, g_h, b_h) where the
+  # channels switch from G to B, B to R and R to G. These are the primary hues, unless a primary is
+  # imaginary (with a negative LMS component, as the blue of ProPhoto RGB): a channel can then go
+  # below zero before the primary, and the hue where the channels switch is found by bisection.
   RGBL_TO_LMS = np.asfarray(RGBL_TO_LMS)
-  LMS_TO_RGBL = np.asfarray(LMS_TO_RGBL)
-  LMS3_TO_OKLAB = np.asfarray(LMS3_TO_OKLAB)
-  OKLAB_TO_LMS3 = np.asfarray(OKLAB_TO_LMS3)
-
-  def linear_srgb_to_oklab(c):
-      l = RGBL_TO_LMS[0][0] * c[0, ...] + RGBL_TO_LMS[0][1] * c[1, ...] + RGBL_TO_LMS[0][2] * c[2, ...]
-      m = RGBL_TO_LMS[1][0] * c[0, ...] + RGBL_TO_LMS[1][1] * c[1, ...] + RGBL_TO_LMS[1][2] * c[2, ...]
-      s = RGBL_TO_LMS[2][0] * c[0, ...] + RGBL_TO_LMS[2][1] * c[1, ...] + RGBL_TO_LMS[2][2] * c[2, ...]
-
-      l_ = np.cbrt(l)
-      m_ = np.cbrt(m)
-      s_ = np.cbrt(s)
-
-      return np.array([
-          LMS3_TO_OKLAB[0][0] * l_ + LMS3_TO_OKLAB[0][1] * m_ + LMS3_TO_OKLAB[0][2] * s_,
-          LMS3_TO_OKLAB[1][0] * l_ + LMS3_TO_OKLAB[1][1] * m_ + LMS3_TO_OKLAB[1][2] * s_,
-          LMS3_TO_OKLAB[2][0] * l_ + LMS3_TO_OKLAB[2][1] * m_ + LMS3_TO_OKLAB[2][2] * s_,
-      ])
-
-  # define functions for R, G and B as functions of S, h (with L = 1 and S = C/L)
-
-  def to_lms(S, h):
-    a = S * np.cos(h)
-    b = S * np.sin(h)
-
-    l_ = OKLAB_TO_LMS3[0][0] + OKLAB_TO_LMS3[0][1] * a + OKLAB_TO_LMS3[0][2] * b
-    m_ = OKLAB_TO_LMS3[1][0] + OKLAB_TO_LMS3[1][1] * a + OKLAB_TO_LMS3[1][2] * b
-    s_ = OKLAB_TO_LMS3[2][0] + OKLAB_TO_LMS3[2][1] * a + OKLAB_TO_LMS3[2][2] * b
-
-    l = l_ * l_ * l_
-    m = m_ * m_ * m_
-    s = s_ * s_ * s_
-
-    return (l, m, s)
-
-  def to_lms_dS(S, h):
-    a = S * np.cos(h)
-    b = S * np.sin(h)
-
-    l_ = OKLAB_TO_LMS3[0][0] + OKLAB_TO_LMS3[0][1] * a + OKLAB_TO_LMS3[0][2] * b
-    m_ = OKLAB_TO_LMS3[1][0] + OKLAB_TO_LMS3[1][1] * a + OKLAB_TO_LMS3[1][2] * b
-    s_ = OKLAB_TO_LMS3[2][0] + OKLAB_TO_LMS3[2][1] * a + OKLAB_TO_LMS3[2][2] * b
-
-    l = (LMS3_TO_OKLAB[0][1] * np.cos(h) + LMS3_TO_OKLAB[0][1] * np.sin(h)) * 3 * l_* l_
-    m = (LMS3_TO_OKLAB[1][1] * np.cos(h) + LMS3_TO_OKLAB[1][1] * np.sin(h)) * 3 * m_* m_
-    s = (LMS3_TO_OKLAB[2][1] * np.cos(h) + LMS3_TO_OKLAB[2][1] * np.sin(h)) * 3 * s_* s_
-
-    return (l, m, s)
-
-  def to_lms_dS2(S, h):
-    a = S * np.cos(h)
-    b = S * np.sin(h)
-
-    l_ = OKLAB_TO_LMS3[0][0] + OKLAB_TO_LMS3[0][1] * a + OKLAB_TO_LMS3[0][2] * b
-    m_ = OKLAB_TO_LMS3[1][0] + OKLAB_TO_LMS3[1][1] * a + OKLAB_TO_LMS3[1][2] * b
-    s_ = OKLAB_TO_LMS3[2][0] + OKLAB_TO_LMS3[2][1] * a + OKLAB_TO_LMS3[2][2] * b
-
-    l = (LMS3_TO_OKLAB[0][1] * np.cos(h) + LMS3_TO_OKLAB[0][2] * np.sin(h)) ** 2 * 6 * l_
-    m = (LMS3_TO_OKLAB[1][1] * np.cos(h) + LMS3_TO_OKLAB[0][2] * np.sin(h)) ** 2 * 6 * m_
-    s = (LMS3_TO_OKLAB[2][1] * np.cos(h) + LMS3_TO_OKLAB[0][2] * np.sin(h)) ** 2 * 6 * s_
-
-    return (l, m, s)
-
-
-  def to_R(S, h):
-    (l, m, s) = to_lms(S, h)
-    return LMS_TO_RGBL[0][0] * l + LMS_TO_RGBL[0][1] * m + LMS_TO_RGBL[0][2] * s
-
-  def to_R_dS(S, h):
-    (l, m, s) = to_lms_dS(S, h)
-    return LMS_TO_RGBL[0][0] * l + LMS_TO_RGBL[0][1] * m + LMS_TO_RGBL[0][2] * s
-
-  def to_R_dS2(S, h):
-    (l, m, s) = to_lms_dS2(S, h)
-    return LMS_TO_RGBL[0][0] * l + LMS_TO_RGBL[0][1] * m + LMS_TO_RGBL[0][2] * s
-
-  def to_G(S, h):
-    (l, m, s) = to_lms(S, h)
-    return LMS_TO_RGBL[1][0] * l + LMS_TO_RGBL[1][1] * m + LMS_TO_RGBL[1][2] * s
-
-  def to_G_dS(S, h):
-    (l, m, s) = to_lms_dS(S, h)
-    return LMS_TO_RGBL[1][0] * l + LMS_TO_RGBL[1][1] * m + LMS_TO_RGBL[1][2] * s
-
-  def to_G_dS2(S, h):
-    (l, m, s) = to_lms_dS2(S, h)
-    return LMS_TO_RGBL[1][0] * l + LMS_TO_RGBL[1][1] * m + LMS_TO_RGBL[1][2] * s
-
-  def to_B(S, h):
-    (l, m, s) = to_lms(S, h)
-    return LMS_TO_RGBL[2][0] * l + LMS_TO_RGBL[2][1] * m + LMS_TO_RGBL[2][2] * s
-
-  def to_B_dS(S, h):
-    (l, m, s) = to_lms_dS(S, h)
-    return LMS_TO_RGBL[2][0] * l + LMS_TO_RGBL[2][1] * m + LMS_TO_RGBL[2][2] * s
-
-  def to_B_dS2(S, h):
-    (l, m, s) = to_lms_dS2(S, h)
-    return LMS_TO_RGBL[2][0] * l + LMS_TO_RGBL[2][1] * m + LMS_TO_RGBL[2][2] * s
+  hues = get_primary_hues(RGBL_TO_LMS)
+  if not has_imaginary_primaries(RGBL_TO_LMS):
+    return hues
+
+  key = RGBL_TO_LMS.tobytes()
+  if key not in sector_hues_cache:
+    LMS_TO_RGBL = np.linalg.inv(RGBL_TO_LMS)
+    sectors = []
+    for (h, before) in zip(hues, [1, 2, 0]):
+      # the switch away from the channel before the primary, closest to the primary
+      for search in [SECTOR_SEARCH_HUES, SECTOR_SEARCH_ALL_HUES]:
+        samples = h + search
+        channels = get_first_channel(LMS_TO_RGBL, samples)
+        switches = np.nonzero((channels[:-1] == before) & (channels[1:] != before))[0]
+        if len(switches) > 0:
+          break
+      i = switches[np.argmin(np.abs(samples[switches] - h))]
+      (lo, hi) = (samples[i], samples[i + 1])
+      for j in range(SECTOR_ITERATIONS):
+        mid = 0.5 * (lo + hi)
+        if get_first_channel(LMS_TO_RGBL, np.array([mid]))[0] == before:
+          lo = mid
+        else:
+          hi = mid
+      sectors.append(0.5 * (lo + hi))
+    sector_hues_cache[key] = tuple(sectors)
+  return sector_hues_cache[key]
+
+def get_channel_hues(channel, RGBL_TO_LMS, resolution = RESOLUTION):
+  # the range of hues where this channel is the first to go below zero
+  (r_h, g_h, b_h) = get_sector_hues(RGBL_TO_LMS)
+  if channel == 'R':
+    return np.linspace(g_h, 2 * np.pi + b_h, resolution)
+  elif channel == 'G':
+    return np.linspace(b_h, r_h, resolution)
+  else:
+    return np.linspace(r_h, g_h, resolution)
+
+# hues the least squares initial guesses are fitted on
+INITIAL_FIT_RESOLUTION = 20000
+
+def get_initial_coefficients(matrices, channel):
+  # The starting point of a channel's fit. The fixed guesses are far from the max saturation of
+  # gamuts with imaginary primaries, where the fits then stop, so those start from the polynomial
+  # closest to the exact max saturation in the least squares sense.
+  if not has_imaginary_primaries(matrices['RGBL_TO_LMS']):
+    return np.array(INITIAL_COEFFICIENTS[channel])
+  h = get_channel_hues(channel, matrices['RGBL_TO_LMS'], INITIAL_FIT_RESOLUTION)
+  S = find_max_saturation_exact(matrices['LMS_TO_RGBL'], h)
+  return np.linalg.lstsq(get_channel_basis(h).T, S, rcond=None)[0]
+
+def get_channel_basis(h):
+  # d S / d x for the polynomial S = x0 + x1 * a + x2 * b + x3 * a^2 + x4 * a * b
+  a = np.cos(h)
+  b = np.sin(h)
+  return np.array([np.ones_like(a), a, b, a ** 2, a * b])
+
+class ChannelEvaluator:
+  """
+  The fitting objective of one gamut channel, evaluated over a fixed set of hues.
 
-  if GAMUT != 'prophoto-rgb':
-    hs, Ss = np.meshgrid(np.linspace(-np.pi, np.pi, 720), np.linspace(0, 1, 200))
+  Everything that only depends on the hue (the trig tables, the per-hue derivative factors of
+  to_lms_dS and to_lms_dS2 and their derivatives) is computed once up front, and every call
+  writes into preallocated buffers, so evaluating the objective allocates next to nothing.
+  The results match the unfused functions above (to_channel, halley_step, halley_step_grad...).
+  """
 
-    Rs = to_R(Ss, hs)
-    Gs = to_G(Ss, hs)
-    Bs = to_B(Ss, hs)
+  def __init__(self, w, h, steps = HALLEY_STEPS):
+    w = np.asfarray(w)
+    n = len(h)
+    cos_h = np.cos(h)
+    sin_h = np.sin(h)
+
+    self.n = n
+    self.w = w
+    self.steps = steps
+    self.basis = get_channel_basis(h)
+
+    # l_, m_, s_ = c + S * k
+    self.c = np.array([OKLAB_TO_LMS3[i][0] for i in range(3)])[:, None]
+    self.k = np.array([OKLAB_TO_LMS3[i][1] * cos_h + OKLAB_TO_LMS3[i][2] * sin_h for i in range(3)])
+
+    # per-hue factors of the derivatives f' (on u^2) and f'' (on u) weighted by the channel row,
+    # and the third derivative, which does not depend on S
+    self.w1 = 3 * w[:, None] * self.k
+    self.w2 = 6 * w[:, None] * self.k ** 2
+    self.f3 = np.sum(self.w2 * self.k, axis=0)
+
+    # buffers, reused by every call
+    self.S = np.empty(n)
+    self.active = np.empty(n, dtype=bool)
+    self.u = np.empty((3, n))
+    self.u2 = np.empty((3, n))
+    self.tmp = np.empty((3, n))
+    self.f = np.empty(n)
+    self.f1 = np.empty(n)
+    self.f2 = np.empty(n)
+    self.num = np.empty(n)
+    self.den = np.empty(n)
+    self.t0 = np.empty(n)
+    self.t1 = np.empty(n)
+    self.S_1 = np.empty(n)
+    self.dS_1 = np.empty(n)
+    self.dS = np.empty(n)
+    self.grad = np.empty(5)
+
+  def polynomial(self, x):
+    # S for the coefficients x, clamped at zero, into self.S (and where it was clamped into self.active)
+    np.dot(x, self.basis, out=self.S)
+    np.greater(self.S, 0, out=self.active)
+    np.maximum(self.S, 0, out=self.S)
+    return self.S
+
+  def powers(self, S):
+    # u = (l_, m_, s_) at S and its square
+    np.multiply(self.k, S, out=self.u)
+    self.u += self.c
+    np.multiply(self.u, self.u, out=self.u2)
+
+  def evaluate(self, S, derivatives = True):
+    # f, f' and f'' at S, in one pass
+    self.powers(S)
+    np.multiply(self.u2, self.u, out=self.tmp)
+    np.dot(self.w, self.tmp, out=self.f)
+    if derivatives:
+      np.multiply(self.w1, self.u2, out=self.tmp)
+      np.sum(self.tmp, axis=0, out=self.f1)
+      np.multiply(self.w2, self.u, out=self.tmp)
+      np.sum(self.tmp, axis=0, out=self.f2)
+    return (self.f, self.f1, self.f2)
+
+  def halley_step(self, S, grad = False):
+    # S_1 = S - f f' / (f'^2 - f f'' / 2), into self.S_1 (and d S_1 / d S into self.dS_1)
+    (f, f1, f2) = self.evaluate(S)
+    num, den, t0, t1 = self.num, self.den, self.t0, self.t1
+
+    np.multiply(f, f1, out=num)
+    np.multiply(f, f2, out=den)
+    den *= -0.5
+    np.multiply(f1, f1, out=t0)
+    den += t0
+    np.divide(num, den, out=t0)
+    np.subtract(S, t0, out=self.S_1)
+
+    if grad:
+      # the derivatives of f, f' and f'' with respect to S are f', f'' and f'''
+      f3 = self.f3
+      # dn = f'^2 + f f''
+      np.multiply(f1, f1, out=t0)
+      np.multiply(f, f2, out=t1)
+      t0 += t1
+      t0 *= den
+      # dd = 2 f' f'' - (f' f'' + f f''') / 2
+      np.multiply(f1, f2, out=t1)
+      t1 *= 1.5
+      np.multiply(f, f3, out=self.dS_1)
+      self.dS_1 *= -0.5
+      t1 += self.dS_1
+      # 1 - (dn d - n dd) / d^2
+      t1 *= num
+      t0 -= t1
+      np.multiply(den, den, out=t1)
+      np.divide(t0, t1, out=self.dS_1)
+      np.subtract(1, self.dS_1, out=self.dS_1)
+
+    return self.S_1
+
+  def halley_steps(self, x, grad = False):
+    # S after `steps` Halley steps from the polynomial of x (and d S / d S_0 into self.dS)
+    S = self.polynomial(x)
+    for i in range(self.steps):
+      S = self.halley_step(S, grad)
+      if grad and i == 0:
+        self.dS[:] = self.dS_1
+      elif grad:
+        self.dS *= self.dS_1
+    return S
+
+  def objective(self, x):
+    # log(mean(f(S_1) ** 10)) / 10, the solution that is easiest to solve with `steps` steps of
+    # Halley's method. Once the steps converge, mean(f ** 10) is far below the tolerance of the
+    # optimizer, so its log (that of the L10 norm of f, which has the same minimum) is minimized.
+    S_1 = self.halley_steps(x)
+    f = self.evaluate(S_1, False)[0]
+    np.multiply(f, f, out=self.t0)
+    np.multiply(self.t0, self.t0, out=self.t1)
+    self.t1 *= f
+    return np.log(np.dot(self.t1, self.t1) / self.n) / 10
+
+  def objective_grad(self, x):
+    # the objective along with its gradient with respect to x
+    S_1 = self.halley_steps(x, True)
+    f = self.evaluate(S_1, False)[0]
+    t0, t1 = self.t0, self.t1
+
+    # f ** 5 into t1, then the sum of f ** 10
+    np.multiply(f, f, out=t0)
+    np.multiply(t0, t0, out=t1)
+    t1 *= f
+    total = np.dot(t1, t1)
+    value = np.log(total / self.n) / 10
+
+    # chain rule back through the log, f ** 10, the Halley steps and the clamp at zero:
+    # d/dS = f^9 f'(S_1) dS_1/dS [S > 0] / sum(f^10), with f^9 = f^5 f^5 / f written as f^4 f^5
+    np.multiply(f, f, out=t0)
+    t0 *= t0
+    t0 *= t1
+    np.multiply(self.w1, self.u2, out=self.tmp)
+    np.sum(self.tmp, axis=0, out=t1)
+    t0 *= t1
+    t0 *= self.dS
+    t0 *= self.active
+    t0 /= total
+    np.dot(self.basis, t0, out=self.grad)
+    return (value, self.grad.copy())
+
+def fit_stage(evaluator, x0, jac = True):
+  import scipy.optimize
+
+  # the Halley steps overflow for a few hues while the fits explore, which the line searches
+  # step back from, so numpy's warnings about them are silenced
+  with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+    if jac:
+      return scipy.optimize.minimize(evaluator.objective_grad, x0, jac=True)
+    return scipy.optimize.minimize(evaluator.objective, x0)
+
+# hues and tolerance of the check that the fitted Halley steps find the channel's first zero: the
+# fits land within about 0.01 of it, another zero of the channel is at least about 1 away
+ZERO_CHECK_RESOLUTION = 2000
+ZERO_TOLERANCE = 0.1
+
+def get_channel_zero_error(w, channel, RGBL_TO_LMS, x, steps):
+  # The largest |S - S_zero| over the channel's hues, with S estimated from the coefficients x and
+  # `steps` Halley steps, and S_zero the first zero of the channel, found by bisection
+  h = get_channel_hues(channel, RGBL_TO_LMS, ZERO_CHECK_RESOLUTION)
+  S = x @ get_channel_basis(h)
+  with np.errstate(over='ignore', invalid='ignore'):
+    for i in range(steps):
+      S = halley_step(w, S, h)
+  return np.max(np.abs(S - find_max_saturation_exact([w], h)))
+
+def fit_channel(GAMUT, channel, jac = True, schedule = None, steps = HALLEY_STEPS):
+  # These are numerical fits to the edge of the chroma
+  # The resulting coefficient, x_R, x_G and x_B are used in compute_max_saturation, as values for k0
+  # With jac=False the gradient is estimated by scipy with finite differences instead.
+  # The fit runs once per resolution of the schedule, see FIT_SCHEDULE. The result of the last
+  # stage is returned, with the evaluations of every stage added up in `nfev`, `nit` and `cost`
+  # (the number of hues evaluated). The coefficients are fitted for `steps` Halley steps, going
+  # through the fits for fewer steps first, as fits for more steps from the initial guesses
+  # can diverge when the steps overflow. A fit that diverges, or whose Halley steps land on another
+  # zero of the channel than the max saturation, raises a ValueError.
+  matrices = get_gamut_matrices(GAMUT)
+  w = matrices['LMS_TO_RGBL'][CHANNELS.index(channel)]
+
+  x = get_initial_coefficients(matrices, channel)
+  (nfev, nit, cost) = (0, 0, 0)
+  for n in range(1, steps + 1):
+    for resolution in schedule or FIT_SCHEDULE:
+      evaluator = ChannelEvaluator(w, get_channel_hues(channel, matrices['RGBL_TO_LMS'], resolution), n)
+      result = fit_stage(evaluator, x, jac)
+      if not (np.all(np.isfinite(result.x)) and np.isfinite(result.fun)):
+        raise ValueError(f'the {channel} fit of {GAMUT} for {n} Halley step(s) on {resolution} hues diverged: {result.message}')
+      x = result.x
+      nfev += result.nfev
+      nit += result.nit
+      cost += result.nfev * resolution
+    error = get_channel_zero_error(w, channel, matrices['RGBL_TO_LMS'], x, n)
+    if not error <= ZERO_TOLERANCE:
+      raise ValueError(f'the {channel} fit of {GAMUT} for {n} Halley step(s) lands up to {error:.3g} away from the max saturation, on another zero of the channel')
+  (result.nfev, result.nit, result.cost) = (nfev, nit, cost)
+  return result
+
+def unfused_objective_grad(w, h, basis, x):
+  # ChannelEvaluator.objective_grad written with the functions above, kept as a reference for profile_fit
+  S = x @ basis
+  active = S > 0
+  S = np.maximum(0, S)
+
+  (S_1, dS_1) = halley_step_grad(w, S, h)
+
+  f_ = to_channel(w, S_1, h)
+  df_ = to_channel_slope(w, S_1, h)
+
+  dS = f_ ** 9 * df_ * dS_1 * active / np.sum(f_ ** 10)
+  return (np.log(np.average(f_ ** 10)) / 10, basis @ dS)
+
+def measure_objective(fn, x, calls):
+  # Mean wall time and peak memory allocated (as traced by tracemalloc) of one call of fn(x)
+  import tracemalloc
+
+  fn(x)
+  start = time.perf_counter()
+  for i in range(calls):
+    fn(x)
+  elapsed = (time.perf_counter() - start) / calls
+
+  tracemalloc.start()
+  fn(x)
+  (current, peak) = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  return (elapsed, peak)
+
+def profile_fit(gamuts = GAMUTS, calls = 20):
+  # Prints the time and memory of one evaluation of the fitting objective (with its gradient),
+  # for the fused ChannelEvaluator and the unfused reference implementation
+  tasks = [(gamut, channel) for gamut in gamuts if gamut not in UNSUPPORTED_GAMUTS for channel in CHANNELS]
+  totals = [0.0, 0.0]
+
+  print(f'objective + gradient over {RESOLUTION} hues, mean of {calls} calls', file=sys.stderr)
+  print('gamut          ch   time (unfused / fused)     peak alloc (unfused / fused)   max rel diff', file=sys.stderr)
+  for (gamut, channel) in tasks:
+    matrices = get_gamut_matrices(gamut)
+    w = matrices['LMS_TO_RGBL'][CHANNELS.index(channel)]
+    h = get_channel_hues(channel, matrices['RGBL_TO_LMS'])
+    basis = get_channel_basis(h)
+    evaluator = ChannelEvaluator(w, h)
+    x = np.array(INITIAL_COEFFICIENTS[channel])
+
+    (ref_time, ref_peak) = measure_objective(lambda x: unfused_objective_grad(w, h, basis, x), x, calls)
+    (fused_time, fused_peak) = measure_objective(evaluator.objective_grad, x, calls)
+    totals[0] += ref_time
+    totals[1] += fused_time
+
+    (ref_value, ref_grad) = unfused_objective_grad(w, h, basis, x)
+    (value, grad) = evaluator.objective_grad(x)
+    diff = max(abs(value - ref_value) / abs(ref_value), np.max(np.abs(grad - ref_grad)) / np.max(np.abs(ref_grad)))
+    print(f'{gamut:<14} {channel:<4} {ref_time * 1000:7.2f}ms / {fused_time * 1000:7.2f}ms   {ref_peak / 2 ** 20:9.2f}MiB / {fused_peak / 2 ** 10:7.2f}KiB   {diff:12.3e}', file=sys.stderr)
+
+  print(f'{"total":<19} {totals[0] * 1000:7.2f}ms / {totals[1] * 1000:7.2f}ms   ({totals[0] / totals[1]:.2f}x)', file=sys.stderr)
+
+def fit_gamuts(gamuts = GAMUTS, jobs = 1, schedule = None, steps = HALLEY_STEPS):
+  # Every (gamut, channel) fit is independent, so they can be spread across a process pool.
+  # Results are gathered into a dict keyed by (gamut, channel) so that the output order,
+  # and therefore the printed file, is identical to a serial run.
+  tasks = [(gamut, channel) for gamut in gamuts if gamut not in UNSUPPORTED_GAMUTS for channel in CHANNELS]
+  if jobs == 1:
+    return { task: fit_channel(*task, schedule=schedule, steps=steps).x for task in tasks }
+  with concurrent.futures.ProcessPoolExecutor(max_workers=jobs if jobs > 0 else None, initializer=register_custom_gamuts, initargs=(list(CUSTOM_GAMUTS.values()),)) as pool:
+    futures = { task: pool.submit(fit_channel, *task, schedule=schedule, steps=steps) for task in tasks }
+    return { task: future.result().x for task, future in futures.items() }
+
+# maximum difference between the analytic and the central finite difference gradient of the
+# objective, relative to the largest component, at the initial coefficients of each fit
+JAC_TOLERANCE = 1e-5
+
+def get_gradient_error(evaluator, x, step = 1e-7):
+  # The largest difference between the analytic gradient at x and a central finite difference
+  # estimate, relative to the largest component of the estimate
+  grad = evaluator.objective_grad(x)[1]
+  estimate = np.array([(evaluator.objective(x + e) - evaluator.objective(x - e)) / (2 * step) for e in np.eye(len(x)) * step])
+  return np.max(np.abs(grad - estimate)) / np.max(np.abs(estimate))
+
+def compare_jac(gamuts = GAMUTS):
+  # Fits every channel with both finite difference and analytic gradients, printing the
+  # evaluation counts and wall time, and checks the analytic gradient at the initial coefficients
+  tasks = [(gamut, channel) for gamut in gamuts if gamut not in UNSUPPORTED_GAMUTS for channel in CHANNELS]
+  totals = [0, 0, 0.0, 0.0]
+  max_error = 0
+
+  print('gamut          ch   nfev (fd / jac)   time (fd / jac)      speedup   gradient error   converged', file=sys.stderr)
+  for (gamut, channel) in tasks:
+    start = time.perf_counter()
+    fd = fit_channel(gamut, channel, jac=False)
+    fd_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    an = fit_channel(gamut, channel, jac=True)
+    an_time = time.perf_counter() - start
+
+    matrices = get_gamut_matrices(gamut)
+    evaluator = ChannelEvaluator(matrices['LMS_TO_RGBL'][CHANNELS.index(channel)], get_channel_hues(channel, matrices['RGBL_TO_LMS']))
+    error = get_gradient_error(evaluator, get_initial_coefficients(matrices, channel))
+    max_error = max(max_error, error)
+    totals[0] += fd.nfev
+    totals[1] += an.nfev
+    totals[2] += fd_time
+    totals[3] += an_time
+    print(f'{gamut:<14} {channel:<4} {fd.nfev:>4} / {an.nfev:<4}       {fd_time:6.2f}s / {an_time:6.2f}s   {fd_time / an_time:6.2f}x   {error:14.3e}   {an.success}', file=sys.stderr)
+
+  print(f'{"total":<19} {totals[0]:>4} / {totals[1]:<4}       {totals[2]:6.2f}s / {totals[3]:6.2f}s   {totals[2] / totals[3]:6.2f}x   {max_error:14.3e}', file=sys.stderr)
+  ok = max_error <= JAC_TOLERANCE
+  print(f'analytic gradients {"agree" if ok else "do not agree"} with finite differences within {JAC_TOLERANCE:g}', file=sys.stderr)
+  return ok
+
+def get_max_channel_error(GAMUT, channel, x, steps = 1):
+  # The largest |f(S)| over the channel's hues, with the max saturation estimated from the
+  # coefficients x and `steps` exact Halley steps, as the runtime does
+  matrices = get_gamut_matrices(GAMUT)
+  w = np.asfarray(matrices['LMS_TO_RGBL'][CHANNELS.index(channel)])
+  h = get_channel_hues(channel, matrices['RGBL_TO_LMS'])
+  S = x @ get_channel_basis(h)
+  with np.errstate(over='ignore', invalid='ignore'):
+    for i in range(steps):
+      S = halley_step(w, S, h)
+    return np.max(np.abs(to_channel(w, S, h)))
+
+def compare_schedule(gamuts = GAMUTS, schedule = FIT_SCHEDULE):
+  # Fits every channel on every hue and with the schedule, printing the cost (the number of hues
+  # evaluated over all objective evaluations), wall time and the final objective on every hue
+  tasks = [(gamut, channel) for gamut in gamuts if gamut not in UNSUPPORTED_GAMUTS for channel in CHANNELS]
+  totals = [0, 0, 0.0, 0.0]
+
+  print(f'schedule {schedule} against a single fit on {RESOLUTION} hues', file=sys.stderr)
+  print('gamut          ch   hues evaluated (single / schedule)   time (single / schedule)   objective (single / schedule)   difference   max |f(S)| (single / schedule)', file=sys.stderr)
+  for (gamut, channel) in tasks:
+    matrices = get_gamut_matrices(gamut)
+    evaluator = ChannelEvaluator(matrices['LMS_TO_RGBL'][CHANNELS.index(channel)], get_channel_hues(channel, matrices['RGBL_TO_LMS']))
+    fits = []
+    for stages in [[RESOLUTION], schedule]:
+      start = time.perf_counter()
+      with np.errstate(all='ignore'):
+        result = fit_channel(gamut, channel, schedule=stages)
+        objective = evaluator.objective(result.x)
+      fits.append((result.cost, time.perf_counter() - start, objective, get_max_channel_error(gamut, channel, result.x)))
+    ((single_cost, single_time, single_objective, single_error), (cost, elapsed, objective, error)) = fits
+    totals[0] += single_cost
+    totals[1] += cost
+    totals[2] += single_time
+    totals[3] += elapsed
+    print(f'{gamut:<14} {channel:<4} {single_cost / 1e6:9.2f}M / {cost / 1e6:7.2f}M ({single_cost / cost:6.1f}x)   {single_time:6.2f}s / {elapsed:6.2f}s   {single_objective:13.4e} / {objective:11.4e}   {objective - single_objective:10.3e}   {single_error:11.3e} / {error:9.3e}', file=sys.stderr)
+
+  print(f'{"total":<19} {totals[0] / 1e6:9.2f}M / {totals[1] / 1e6:7.2f}M ({totals[0] / totals[1]:6.1f}x)   {totals[2]:6.2f}s / {totals[3]:6.2f}s', file=sys.stderr)
+
+def do_calc(GAMUT = 'srgb', fits = None, steps = HALLEY_STEPS):
+  # Computes the matrices and coefficients of a gamut, returned as plain JSON data
+  np.set_printoptions(precision=8)
 
-    gamut = np.minimum(Rs, np.minimum(Gs, Bs))
+  matrices = get_gamut_matrices(GAMUT)
+  RGBL_TO_LMS = matrices['RGBL_TO_LMS']
+  LMS_TO_RGBL = matrices['LMS_TO_RGBL']
 
-    r_lab = linear_srgb_to_oklab(np.array([1, 0, 0]))
-    g_lab = linear_srgb_to_oklab(np.array([0, 1, 0]))
-    b_lab = linear_srgb_to_oklab(np.array([0, 0, 1]))
+  coeff = None
+  if GAMUT not in UNSUPPORTED_GAMUTS:
+    if fits is None:
+      fits = fit_gamuts([GAMUT], steps=steps)
 
-    r_h = np.arctan2(r_lab[2], r_lab[1])
-    g_h = np.arctan2(g_lab[2], g_lab[1])
-    b_h = np.arctan2(b_lab[2], b_lab[1])
+    (r_h, g_h, b_h) = get_sector_hues(RGBL_TO_LMS)
 
     r_dir = 0.5 * np.array([np.cos(b_h) + np.cos(g_h), np.sin(b_h) + np.sin(g_h)])
     g_dir = 0.5 * np.array([np.cos(b_h) + np.cos(r_h), np.sin(b_h) + np.sin(r_h)])
@@ -340,139 +1054,10 @@ def do_calc(GAMUT = 'srgb'):
     # Used like this in compute_max_saturation:
     # if (-1.88170328f * a - 0.80936493f * b > 1) // Red component goes below zero first
 
-    r_hs, r_Ss = np.meshgrid(np.linspace(g_h, 2 * np.pi + b_h, 200), np.linspace(0, 1, 200))
-
-    r_Rs = to_R(r_Ss, r_hs)
-
-    g_hs, g_Ss = np.meshgrid(np.linspace(b_h, r_h, 200), np.linspace(0, 1, 200))
-
-    g_Gs = to_G(g_Ss, g_hs)
-
-    b_hs, b_Ss = np.meshgrid(np.linspace(r_h, g_h, 200), np.linspace(0, 1, 200))
-
-    b_Bs = to_B(b_Ss, b_hs)
+    x_R = fits[(GAMUT, 'R')]
+    x_G = fits[(GAMUT, 'G')]
+    x_B = fits[(GAMUT, 'B')]
 
-    # These are numerical fits to the edge of the chroma
-    # The resulting coefficient, x_R, x_G and x_B are used in compute_max_saturation, as values for k0
-    its = 1
-
-    resolution = 100000
-
-    h = np.linspace(g_h, 2 * np.pi + b_h, resolution)
-    a = np.cos(h)
-    b = np.sin(h)
-
-    def e_R(x):
-      S = x[0] + x[1] * a + x[2] * b + x[3] * a ** 2 + x[4] * a * b
-      S = np.maximum(0, S)
-
-      # optimize for solution that is easiest to solve with one step Haley's method
-      f = to_R(S, h)
-      f1 = to_R_dS(S, h)
-      f2 = to_R_dS2(S, h)
-      S_1 = S - f * f1 / (f1 ** 2 - f * f2 / 2)
-
-      f_ = to_R(S_1, h)
-      return np.average(f_ ** 10) # + f_[0] ** 2 + f_[-1] ** 2
-
-    x_R = scipy.optimize.minimize(e_R, np.array([1.19086277, 1.76576728, 0.59662641, 0.75515197, 0.56771245])).x
-
-    # printarray('R COEFF', x_R)
-
-    S_R = x_R[0] + x_R[1] * a + x_R[2] * b + x_R[3] * a ** 2 + x_R[4] * a * b
-
-    S_R1 = S_R
-    for i in range(0, its):
-      f = to_R(S_R1, h)
-      f1 = to_R_dS(S_R1, h)
-      f2 = to_R_dS2(S_R1, h)
-      S_R1 = S_R1 - f * f1 / (f1 ** 2 - f * f2 / (2))
-
-      plt.plot(S_R1, 'r')
-
-    #####
-
-    h = np.linspace(b_h, r_h, resolution)
-    a = np.cos(h)
-    b = np.sin(h)
-
-    def e_G(x):
-      S = x[0] + x[1] * a + x[2] * b + x[3] * a ** 2 + x[4] * a * b
-      S = np.maximum(0, S)
-
-      # optimize for solution that is easiest to solve with one step Haley's method
-      f = to_G(S, h)
-      f1 = to_G_dS(S, h)
-      f2 = to_G_dS2(S, h)
-      S_1 = S - f * f1 / (f1 ** 2 - f * f2 / 2)
-
-      f_ = to_G(S_1, h)
-      return np.average(f_ ** 10) # + f_[0] ** 2 + f_[-1] ** 2
-
-    x_G = scipy.optimize.minimize(e_G, np.array([0.73956515, -0.45954404,  0.08285427,  0.12541073, -0.14503204])).x
-
-    # printarray('G COEFF', x_G)
-
-    S_G = x_G[0] + x_G[1] * a + x_G[2] * b + x_G[3] * a ** 2 + x_G[4] * a * b
-
-    S_G1 = S_G
-    for i in range(0, its):
-      f = to_G(S_G1, h)
-      f1 = to_G_dS(S_G1, h)
-      f2 = to_G_dS2(S_G1, h)
-      S_G1 = S_G1 - f * f1 / (f1 ** 2 - f * f2 / (2))
-      
-
-    #####
-
-    h = np.linspace(r_h, g_h, resolution)
-    a = np.cos(h)
-    b = np.sin(h)
-
-    def e_B(x):
-      S = x[0] + x[1] * a + x[2] * b + x[3] * a ** 2 + x[4] * a * b
-      S = np.maximum(0, S)
-
-      # optimize for solution that is easiest to solve with one step Haley's method
-      f = to_B(S, h)
-      f1 = to_B_dS(S, h)
-      f2 = to_B_dS2(S, h)
-      S_1 = S - f * f1 / (f1 ** 2 - f * f2 / 2)
-
-      f_ = to_B(S_1, h)
-      return np.average(f_ ** 10) # + f_[0] ** 2 + f_[-1] ** 2
-
-    x_B = scipy.optimize.minimize(e_B, np.array([1.35733652, -0.00915799, -1.1513021,  -0.50559606,  0.00692167])).x
-
-    # printarray('B COEFF', x_B)
-
-    S_B = x_B[0] + x_B[1] * a + x_B[2] * b + x_B[3] * a ** 2 + x_B[4] * a * b
-
-    S_B1 = S_B
-    for i in range(0, its):
-      f = to_B(S_B1, h)
-      f1 = to_B_dS(S_B1, h)
-      f2 = to_B_dS2(S_B1, h)
-      S_B1 = S_B1 - f * f1 / (f1 ** 2 - f * f2 / (2))
-
-  print(f'// {var_name} space\n')
-    
-  print(f'// {var_name} to XYZ ({whitepoint}) matrices\n')
-  if len(RGBL_TO_XYZ_RATIONAL) > 0:
-    print_rational(var_name, 'XYZ', RGBL_TO_XYZ_RATIONAL)
-  else:
-    print_matrix(var_name, 'XYZ', np.asfarray(RGBL_TO_XYZ))
-
-  if len(XYZ_TO_RGBL_RATIONAL) > 0:
-    print_rational('XYZ', var_name, XYZ_TO_RGBL_RATIONAL)
-  else:
-    print_matrix('XYZ', var_name, np.asfarray(XYZ_TO_RGBL))
-  
-  print(f'// {var_name} to LMS matrices\n')
-  print_matrix(var_name, 'LMS', RGBL_TO_LMS)
-  print_matrix('LMS', var_name, LMS_TO_RGBL)
-  
-  if GAMUT != 'prophoto-rgb':
     coeff = [
       [
         r_dir.tolist(),
@@ -487,23 +1072,1030 @@ def do_calc(GAMUT = 'srgb'):
         x_B.tolist()
       ]
     ]
-    print(f'// {var_name} coefficients for OKLab gamut approximation\n')
-    print_json(f'OKLab_to_{var_name}_coefficients', coeff)
+
+  result = {
+    'gamut': GAMUT,
+    'var_name': get_var_name(GAMUT),
+    'whitepoint': 'D50' if GAMUT == 'prophoto-rgb' else 'D65',
+    'RGBL_TO_XYZ': np.asfarray(matrices['RGBL_TO_XYZ']).tolist(),
+    'XYZ_TO_RGBL': np.asfarray(matrices['XYZ_TO_RGBL']).tolist(),
+    'RGBL_TO_XYZ_RATIONAL': matrices['RGBL_TO_XYZ_RATIONAL'],
+    'XYZ_TO_RGBL_RATIONAL': matrices['XYZ_TO_RGBL_RATIONAL'],
+    'RGBL_TO_LMS': RGBL_TO_LMS.tolist(),
+    'LMS_TO_RGBL': LMS_TO_RGBL.tolist(),
+    'coefficients': coeff,
+  }
+  if coeff is not None:
+    result['coefficients_error'] = get_saturation_error(result, steps)
+    result['st_mid'] = fit_st_mid(result)
+  return result
+
+def print_gamut(result):
+  var_name = result['var_name']
+  whitepoint = result['whitepoint']
+
+  print_comment(f'{var_name} space')
+    
+  print_comment(f'{var_name} to XYZ ({whitepoint}) matrices')
+  if len(result['RGBL_TO_XYZ_RATIONAL']) > 0:
+    print_rational(var_name, 'XYZ', result['RGBL_TO_XYZ_RATIONAL'])
   else:
-    print(f'// {var_name} does not yet support OKLab gamut approximation\n')
+    print_matrix(var_name, 'XYZ', np.asfarray(result['RGBL_TO_XYZ']))
 
-# print things...
+  if len(result['XYZ_TO_RGBL_RATIONAL']) > 0:
+    print_rational('XYZ', var_name, result['XYZ_TO_RGBL_RATIONAL'])
+  else:
+    print_matrix('XYZ', var_name, np.asfarray(result['XYZ_TO_RGBL']))
+  
+  print_comment(f'{var_name} to LMS matrices')
+  print_matrix(var_name, 'LMS', np.asfarray(result['RGBL_TO_LMS']))
+  print_matrix('LMS', var_name, np.asfarray(result['LMS_TO_RGBL']))
+  
+  if result['coefficients'] is not None:
+    print_comment(f'{var_name} coefficients for OKLab gamut approximation')
+    if output_format.get('packed'):
+      print_declaration(f'OKLab_to_{var_name}_coefficients', format_packed(pack_coefficients(result['coefficients'])))
+    else:
+      print_json(f'OKLab_to_{var_name}_coefficients', result['coefficients'])
+    print_comment(f'{var_name} max and mean error of the approximated max saturation per channel')
+    print_json(f'OKLab_to_{var_name}_coefficients_error', result['coefficients_error'])
+    if result.get('st_mid') is not None:
+      print_comment(f'{var_name} S_mid and T_mid polynomials of OKHSL')
+      if output_format.get('packed'):
+        print_declaration(f'OKLab_to_{var_name}_st_mid_coefficients', format_packed(result['st_mid'][0] + result['st_mid'][1]))
+      else:
+        print_json(f'OKLab_to_{var_name}_st_mid_coefficients', result['st_mid'])
+  else:
+    print_comment(f'{var_name} does not yet support OKLab gamut approximation')
+
+# Composite matrices, mapping every linear RGB space directly to every other
 
-print(f'/** This file is auto-generated by tools/print_matrices.py */\n')
-print(f'// OKLab to LMS matrices\n')
-print_matrix('OKLab', 'LMS', np.asfarray(OKLAB_TO_LMS3))
-print_matrix('LMS', 'OKLab', np.asfarray(LMS3_TO_OKLAB))
-print_matrix('XYZ', 'LMS', np.asfarray(XYZ_TO_LMS))
-print_matrix('LMS', 'XYZ', np.asfarray(LMS_TO_XYZ))
+# Bradford chromatic adaptation between the white points, used by src/spaces/xyz.js
+D65_TO_D50 = [
+  [1.0479297925449969, 0.022946870601609652, -0.05019226628920524],
+  [0.02962780877005599, 0.9904344267538799, -0.017073799063418826],
+  [-0.009243040646204504, 0.015055191490298152, 0.7518742814281371],
+]
+D50_TO_D65 = [
+  [0.955473421488075, -0.02309845494876471, 0.06325924320057072],
+  [-0.0283697093338637, 1.0099953980813041, 0.021041441191917323],
+  [0.012314014864481998, -0.020507649298898964, 1.330365926242124],
+]
 
-# don't need these...
-# print_matrix('XYZD50', 'LMS', np.asfarray(XYZD50_TO_LMS))
-# print_matrix('LMS', 'XYZD50', np.asfarray(LMS_TO_XYZD50))
+# XYZ (D50) to LMS, through the adaptation to D65, used by the D50 based ProPhoto RGB
+XYZD50_TO_LMS = (np.asfarray(XYZ_TO_LMS) @ np.asfarray(D50_TO_D65)).tolist()
+
+# maximum deviation between a composite matrix and the chained matrices, relative to the largest output
+COMPOSITE_TOLERANCE = 1e-12
+
+def get_chained_matrices(a, b):
+  # The matrices convert() applies in turn to go from linear space `a` to `b` through XYZ (D65)
+  chain = [np.asfarray(a['RGBL_TO_XYZ'])]
+  if a['whitepoint'] == 'D50':
+    chain.append(np.asfarray(D50_TO_D65))
+  if b['whitepoint'] == 'D50':
+    chain.append(np.asfarray(D65_TO_D50))
+  chain.append(np.asfarray(b['XYZ_TO_RGBL']))
+  return chain
+
+def get_composite_matrices(results):
+  # The fused matrix of every ordered pair of spaces, as { (a, b): matrix }
+  composites = {}
+  for a in results:
+    for b in results:
+      if a is not b:
+        M = np.identity(3)
+        for step in get_chained_matrices(a, b):
+          M = step @ M
+        composites[(a['var_name'], b['var_name'])] = M
+  return composites
+
+def verify_composite_matrices(results, composites, count = 10000):
+  # Applies each composite matrix and its chain of matrices to random colors, returning the
+  # largest relative deviation of every pair
+  rng = np.random.default_rng(0)
+  colors = np.concatenate([np.identity(3), np.ones((1, 3)), rng.uniform(-0.1, 1.1, (count, 3))]).T
+  by_name = { result['var_name']: result for result in results }
+  deviations = {}
+  for ((a, b), M) in composites.items():
+    chained = colors
+    for step in get_chained_matrices(by_name[a], by_name[b]):
+      chained = step @ chained
+    deviations[(a, b)] = np.max(np.abs(M @ colors - chained)) / np.max(np.abs(chained))
+  return deviations
+
+def check_composite_matrices(results, diag = False):
+  # The composite matrices, once they are checked against their chains of matrices
+  composites = get_composite_matrices(results)
+  deviations = verify_composite_matrices(results, composites)
+  if diag:
+    for ((a, b), deviation) in deviations.items():
+      print(f'{a + " > " + b:<40} {deviation:.3e}', file=sys.stderr)
+  (worst, deviation) = max(deviations.items(), key=lambda item: item[1])
+  ok = deviation <= COMPOSITE_TOLERANCE
+  print(f'composite matrices: {len(composites)} pairs, max deviation from the chained matrices {deviation:.3e} ({worst[0]} > {worst[1]})', file=sys.stderr)
+  if not ok:
+    raise ValueError(f'composite matrices deviate by more than {COMPOSITE_TOLERANCE:g}')
+  return composites
+
+def print_composite_matrices(composites, source = None):
+  # Prints the composite matrices, or only those from the space named `source`
+  if source is None:
+    print_comment('Linear RGB to linear RGB matrices, with chromatic adaptation folded in')
+  else:
+    print_comment(f'{source} to linear RGB matrices, with chromatic adaptation folded in')
+  for ((a, b), M) in composites.items():
+    if source is None or a == source:
+      print_matrix(a, b, M)
+
+# Split modules, enabled with --split DIR
+
+# the module of DIR holding the matrices shared by every space, the others are named by gamut id
+# as the space modules of src/spaces
+SHARED_MODULE = 'oklab'
+
+def print_header(command = 'tools/print_matrices.py'):
+  print(output_format['header'].format(text=f'This file is auto-generated by {command}'))
+
+def print_oklab_matrices():
+  print_comment('OKLab to LMS matrices')
+  print_matrix('OKLab', 'LMS', np.asfarray(OKLAB_TO_LMS3))
+  print_matrix('LMS', 'OKLab', np.asfarray(LMS3_TO_OKLAB))
+  print_matrix('XYZ', 'LMS', np.asfarray(XYZ_TO_LMS))
+  print_matrix('LMS', 'XYZ', np.asfarray(LMS_TO_XYZ))
+
+  print_comment('Bradford chromatic adaptation between XYZ D65 and D50')
+  print_matrix('D65', 'D50', np.asfarray(D65_TO_D50))
+  print_matrix('D50', 'D65', np.asfarray(D50_TO_D65))
+
+  # don't need these...
+  # print_matrix('XYZD50', 'LMS', np.asfarray(XYZD50_TO_LMS))
+  # print_matrix('LMS', 'XYZD50', np.asfarray(LMS_TO_XYZD50))
+
+def write_module(path, print_module):
+  # Writes what print_module prints to the file at path
+  with open(path, 'w', encoding='utf-8') as f, contextlib.redirect_stdout(f):
+    print_module()
+
+def print_split_modules(results, composites, split_dir):
+  # Writes a module of the shared matrices and one per gamut to split_dir, each gamut module
+  # holding the matrices and coefficients of its space and the composite matrices from it, then
+  # prints a module re-exporting all of them
+  command = f'tools/print_matrices.py --split {split_dir}'
+  os.makedirs(split_dir, exist_ok=True)
+
+  def print_shared():
+    print_header(command)
+    print_oklab_matrices()
+
+  write_module(os.path.join(split_dir, f'{SHARED_MODULE}.js'), print_shared)
+  for (gamut, result) in zip(GAMUTS, results):
+    def print_gamut_module(result = result):
+      print_header(command)
+      print_gamut(result)
+      print_composite_matrices(composites, result['var_name'])
+    write_module(os.path.join(split_dir, f'{gamut}.js'), print_gamut_module)
+
+  # the printed module is expected next to split_dir
+  name = os.path.basename(os.path.normpath(split_dir))
+  print_header(command)
+  for module in [SHARED_MODULE] + GAMUTS:
+    print(f'export * from "./{name}/{module}.js";')
+
+# Results are cached on disk, keyed by a hash of everything they are derived from.
+# Bump the version whenever the fitting procedure changes, to invalidate old entries.
+CACHE_VERSION = 6
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+
+def get_cache_key(GAMUT, schedule = None, steps = HALLEY_STEPS):
+  data = {
+    'version': CACHE_VERSION,
+    'gamut': GAMUT,
+    'inputs': get_gamut_inputs(GAMUT),
+    'OKLAB_TO_LMS3': OKLAB_TO_LMS3,
+    'LMS3_TO_OKLAB': LMS3_TO_OKLAB,
+    'XYZ_TO_LMS': XYZ_TO_LMS,
+    'M0': M0,
+    'M2_INV': M2_INV,
+    'initial': INITIAL_COEFFICIENTS,
+    'schedule': schedule or FIT_SCHEDULE,
+    'steps': steps,
+    'st_mid': [ST_MID_SRGB, ST_MID_HUES, ST_MID_OVER_WEIGHT, ST_MID_LIMIT],
+    'supported': GAMUT not in UNSUPPORTED_GAMUTS,
+  }
+  return hashlib.sha256(json.dumps(data, sort_keys=True).encode('utf-8')).hexdigest()
+
+def read_cache(cache_dir, key):
+  path = os.path.join(cache_dir, f'{key}.json')
+  if not os.path.exists(path):
+    return None
+  with open(path, 'r', encoding='utf-8') as f:
+    return json.load(f)
+
+def write_cache(cache_dir, key, result):
+  os.makedirs(cache_dir, exist_ok=True)
+  path = os.path.join(cache_dir, f'{key}.json')
+  # write to a temporary file first so an interrupted run never leaves a partial entry
+  with open(path + '.tmp', 'w', encoding='utf-8') as f:
+    json.dump(result, f, indent=2)
+  os.replace(path + '.tmp', path)
+
+def calc_gamuts(gamuts = GAMUTS, jobs = 1, cache_dir = None, schedule = None, steps = HALLEY_STEPS):
+  # Computes every gamut, re-using cached results for gamuts whose inputs have not changed.
+  # Results are returned in the same order as `gamuts`.
+  results = {}
+  keys = {}
+  if cache_dir is not None:
+    for gamut in gamuts:
+      keys[gamut] = get_cache_key(gamut, schedule, steps)
+      cached = read_cache(cache_dir, keys[gamut])
+      if cached is not None:
+        results[gamut] = cached
+
+  pending = [gamut for gamut in gamuts if gamut not in results]
+  if cache_dir is not None:
+    print(f'cache: {len(gamuts) - len(pending)} cached, {len(pending)} to compute {pending}', file=sys.stderr)
+
+  fits = fit_gamuts(pending, jobs, schedule, steps)
+  for gamut in pending:
+    results[gamut] = do_calc(gamut, fits, steps)
+    if cache_dir is not None:
+      write_cache(cache_dir, keys[gamut], results[gamut])
+
+  return [results[gamut] for gamut in gamuts]
+
+def max_difference(a, b):
+  # largest absolute difference between two (nested) results, or inf if their structure differs
+  if isinstance(a, dict) and isinstance(b, dict):
+    if a.keys() != b.keys():
+      return float('inf')
+    return max([max_difference(a[k], b[k]) for k in a] + [0])
+  if isinstance(a, list) and isinstance(b, list):
+    if len(a) != len(b):
+      return float('inf')
+    return max([max_difference(x, y) for (x, y) in zip(a, b)] + [0])
+  if isinstance(a, float) and isinstance(b, float):
+    return abs(a - b)
+  return 0 if a == b else float('inf')
+
+def verify_cache(gamuts = GAMUTS, jobs = 1, cache_dir = CACHE_DIR, schedule = None, steps = HALLEY_STEPS):
+  # Recomputes every gamut and checks it against its cache entry, if any
+  ok = True
+  for result in calc_gamuts(gamuts, jobs, schedule=schedule, steps=steps):
+    gamut = result['gamut']
+    cached = read_cache(cache_dir, get_cache_key(gamut, schedule, steps))
+    if cached is None:
+      status = 'missing'
+    elif cached == result:
+      status = 'ok'
+    else:
+      status = f'MISMATCH (max difference {max_difference(cached, result):.3e})'
+      ok = False
+    print(f'{gamut:<14} {status}', file=sys.stderr)
+  return ok
+
+# Diagnostics, enabled with --diag and --plot
+
+def get_channel_saturation(result, channel, its = 1):
+  # The max saturation along a channel's hues, estimated with the fitted polynomial and `its` Halley steps
+  # the same way as the runtime does
+  RGBL_TO_LMS = np.asfarray(result['RGBL_TO_LMS'])
+  w = np.asfarray(result['LMS_TO_RGBL'])[CHANNELS.index(channel)]
+  x = result['coefficients'][CHANNELS.index(channel)][1]
+
+  h = get_channel_hues(channel, RGBL_TO_LMS)
+  a = np.cos(h)
+  b = np.sin(h)
+
+  S = x[0] + x[1] * a + x[2] * b + x[3] * a ** 2 + x[4] * a * b
+  for i in range(0, its):
+    S = halley_step(w, S, h)
+  return (h, S)
+
+def get_runtime_channels(result, basis):
+  # The index of the channel computeMaxSaturationOKLC selects at each hue of the basis
+  (dir_R, dir_G) = (result['coefficients'][0][0], result['coefficients'][1][0])
+  red = dir_R[0] * basis[1] + dir_R[1] * basis[2] > 1
+  green = dir_G[0] * basis[1] + dir_G[1] * basis[2] > 1
+  return np.where(red, 0, np.where(green, 1, 2))
+
+def get_max_saturation_runtime(result, h, steps = 1):
+  # The max saturation at each hue (radians) as computeMaxSaturationOKLC in src/gamut.js finds it,
+  # from the polynomial of the channel it selects and `steps` Halley steps
+  basis = get_channel_basis(h)
+  channels = get_runtime_channels(result, basis)
+  k = np.asfarray([c[1] for c in result['coefficients']])[channels]
+  w = np.asfarray(result['LMS_TO_RGBL'])[channels].T
+  S = np.sum(k.T * basis, axis=0)
+  for i in range(steps):
+    S = halley_step(w, S, h)
+  return S
+
+# hues over [0, 360) the error of the approximated max saturation is measured at
+ERROR_HUES = 72000
+
+def get_saturation_error(result, steps = HALLEY_STEPS):
+  # The max and mean |S - S_exact| of each channel, over the hues where computeMaxSaturationOKLC
+  # selects it, with S estimated the same way as the runtime (with `steps` Halley steps) and
+  # S_exact found by bisection, rounded to 3 significant digits
+  h = np.arange(ERROR_HUES) * (2 * np.pi / ERROR_HUES)
+  basis = get_channel_basis(h)
+  channels = get_runtime_channels(result, basis)
+  S_exact = find_max_saturation_exact(result['LMS_TO_RGBL'], h)
+
+  error = { 'steps': steps, 'max': [], 'mean': [] }
+  for (i, channel) in enumerate(CHANNELS):
+    hues = channels == i
+    w = np.asfarray(result['LMS_TO_RGBL'][i])
+    S = np.asfarray(result['coefficients'][i][1]) @ basis[:, hues]
+    for j in range(steps):
+      S = halley_step(w, S, h[hues])
+    diff = np.abs(S - S_exact[hues])
+    error['max'].append(float(f'{np.max(diff):.3g}'))
+    error['mean'].append(float(f'{np.mean(diff):.3g}'))
+  return error
+
+def print_diagnostics(results):
+  # For each channel, how far the channel is from zero at the estimated max saturation
+  print('gamut          ch   hues (deg)        S range             max |f(S)|   mean |f(S)|   objective', file=sys.stderr)
+  for result in results:
+    if result['coefficients'] is None:
+      print(f'{result["gamut"]:<14} does not support OKLab gamut approximation', file=sys.stderr)
+      continue
+    w_all = np.asfarray(result['LMS_TO_RGBL'])
+    for channel in CHANNELS:
+      (h, S) = get_channel_saturation(result, channel, result['coefficients_error']['steps'])
+      f = np.abs(to_channel(w_all[CHANNELS.index(channel)], S, h))
+      hues = f'{np.degrees(h[0]):7.2f} .. {np.degrees(h[-1]):7.2f}'
+      print(f'{result["gamut"]:<14} {channel:<4} {hues}   {np.min(S):8.5f} .. {np.max(S):8.5f}   {np.max(f):11.3e}   {np.mean(f):11.3e}   {np.average(f ** 10):10.3e}', file=sys.stderr)
+
+  # How close S_mid and T_mid are to the cusp, against Ottosson's sRGB polynomials they replace
+  print('gamut          S_mid / S_max, T_mid / T_max (min / mean / max)   with the sRGB polynomials', file=sys.stderr)
+  for result in results:
+    if result.get('st_mid') is None:
+      continue
+    (fit, srgb) = (get_st_mid_ratio(result, result['st_mid']), get_st_mid_ratio(result, ST_MID_SRGB))
+    format_ratio = lambda r, i: f'{r["min"][i]:.3f} / {r["mean"][i]:.3f} / {r["max"][i]:.3f}'
+    for (i, name) in enumerate(['S', 'T']):
+      print(f'{result["gamut"]:<14} {name}   {format_ratio(fit, i):<44} {format_ratio(srgb, i)}', file=sys.stderr)
+
+def plot_diagnostics(results, path):
+  # Plots the estimated max saturation against hue for every gamut, saved to `path`
+  import matplotlib
+  matplotlib.use('Agg')
+  import matplotlib.pyplot as plt
+
+  colors = { 'R': 'r', 'G': 'g', 'B': 'b' }
+  supported = [result for result in results if result['coefficients'] is not None]
+  fig, axes = plt.subplots(len(supported), 1, figsize=(8, 3 * len(supported)), squeeze=False)
+  for (ax, result) in zip(axes[:, 0], supported):
+    for channel in CHANNELS:
+      (h, S) = get_channel_saturation(result, channel, result['coefficients_error']['steps'])
+      ax.plot(np.degrees(h) % 360, S, colors[channel], linewidth=0.75)
+    ax.set_title(result['var_name'])
+    ax.set_xlabel('hue (degrees)')
+    ax.set_ylabel('max saturation')
+  fig.tight_layout()
+  fig.savefig(path)
+  print(f'plot: saved {path}', file=sys.stderr)
+
+# Cusp lookup tables, enabled with --cusp-lut N
+
+# table sizes the interpolation error is reported for, along with the requested size
+CUSP_LUT_SIZES = [16, 32, 64, 128, 256, 512, 1024, 2048, 4096]
+
+# hues the interpolation error is measured at
+CUSP_LUT_TEST_HUES = 36000
+
+# significant digits of the emitted tables, well below the interpolation error of any table size
+CUSP_LUT_DIGITS = 7
+
+# largest max saturation searched for, far beyond any gamut with real primaries (ACES AP0 reaches 34)
+S_MAX_LIMIT = 1024
+
+def find_max_saturation_exact(LMS_TO_RGBL, h, S_max = 4, samples = 400, iterations = 50, chunk_size = 4096):
+  # The max saturation S = C/L for each hue, found by sampling S along the hue for the first
+  # point where a channel goes below zero, then bisecting. Unlike the runtime approximation this
+  # is continuous across the hues where the component that goes below zero first changes.
+  # Hues where no channel goes below zero up to S_max are searched again with twice the range.
+  W = np.asfarray(LMS_TO_RGBL)
+  S_grid = np.linspace(0, S_max, samples)
+  out = np.empty(len(h))
+  wider = np.zeros(len(h), dtype=bool)
+
+  for start in range(0, len(h), chunk_size):
+    hc = h[start:start + chunk_size]
+    k = np.array(to_lms_k(hc)).T[:, None, :]
+
+    def min_channel(S):
+      lms = (1 + S[..., None] * k) ** 3
+      return np.min(lms @ W.T, axis=-1)
+
+    below = min_channel(np.broadcast_to(S_grid, (len(hc), samples))) < 0
+    wider[start:start + chunk_size] = ~np.any(below, axis=1)
+    first = np.where(np.any(below, axis=1), np.argmax(below, axis=1), samples - 1)
+    lo = S_grid[np.maximum(first - 1, 0)][:, None]
+    hi = S_grid[first][:, None]
+    for i in range(iterations):
+      mid = 0.5 * (lo + hi)
+      inside = min_channel(mid) >= 0
+      lo = np.where(inside, mid, lo)
+      hi = np.where(inside, hi, mid)
+    out[start:start + chunk_size] = lo[:, 0]
+
+  if np.any(wider) and S_max < S_MAX_LIMIT:
+    out[wider] = find_max_saturation_exact(W, h[wider], 2 * S_max, samples, iterations, chunk_size)
+  return out
+
+def get_cusp(result, S, h):
+  # The (L, C) of the cusp at each hue (radians) with the max saturation S, scaled so that the
+  # largest channel is 1. It is computed from the matrices of this script, never from the generated
+  # tools/texel_color module, so that a run does not depend on the output of an earlier one.
+  rgb = np.asfarray(result['LMS_TO_RGBL']) @ np.array(to_lms(S, h))
+  L = np.cbrt(1 / np.max(rgb, axis=0))
+  return np.stack([L, L * S], axis=-1)
+
+def find_cusp_exact(result, h):
+  # The (L, C) of the cusp at each hue (radians)
+  return get_cusp(result, find_max_saturation_exact(result['LMS_TO_RGBL'], h), h)
+
+def get_st_mid_basis(a, b):
+  # the terms of the denominator of the S_mid and T_mid polynomials, in the order of their coefficients
+  return np.array([np.ones_like(a), b, a, a * b, a * a, a * a * b, a ** 3, a ** 3 * b, a ** 4])
+
+def eval_st_mid(k, basis):
+  return k[0] + 1 / (np.asarray(k[1:]) @ basis)
+
+def get_st_max(result, h):
+  # The exact S and T of the cusp at each hue (radians)
+  cusp = find_cusp_exact(result, h)
+  return (cusp[:, 1] / cusp[:, 0], cusp[:, 1] / (1 - cusp[:, 0]))
+
+def fit_st_mid_polynomial(target, x0, basis):
+  # Least squares fit of the relative error of a polynomial to `target`, where errors above the
+  # target weigh ST_MID_OVER_WEIGHT times more. The polynomial is linear in all but k0, and the
+  # fit uses its analytic Jacobian.
+  from scipy.optimize import least_squares
+
+  over = np.sqrt(ST_MID_OVER_WEIGHT)
+
+  def weights(x):
+    return np.where(eval_st_mid(x, basis) > target, over, 1) / target
+
+  def fn(x):
+    return weights(x) * (eval_st_mid(x, basis) - target)
+
+  def jac(x):
+    w = weights(x)
+    P = x[1:] @ basis
+    J = np.empty((len(target), len(x)))
+    J[:, 0] = w
+    J[:, 1:] = (-w * basis / (P * P)).T
+    return J
+
+  return least_squares(fn, x0, jac=jac, method='lm').x
+
+def fit_st_mid(result):
+  # The S_mid and T_mid polynomials of a gamut, fitted to its exact cusp and scaled down so that
+  # they stay below it (by ST_MID_LIMIT), or None if a fit has a pole. sRGB keeps ST_MID_SRGB.
+  if result['gamut'] == 'srgb':
+    return ST_MID_SRGB
+  h = np.arange(ST_MID_HUES) * (2 * np.pi / ST_MID_HUES)
+  basis = get_st_mid_basis(np.cos(h), np.sin(h))
+  st_mid = []
+  for (target, x0) in zip(get_st_max(result, h), ST_MID_SRGB):
+    x = fit_st_mid_polynomial(target, np.asfarray(x0), basis)
+    if np.min(x[1:] @ basis) <= 0:
+      return None
+    # k0 + 1 / P scaled by c is c * k0 + 1 / (P / c)
+    c = min(1, ST_MID_LIMIT / np.max(eval_st_mid(x, basis) / target))
+    x[0] *= c
+    x[1:] /= c
+    st_mid.append([float(v) for v in x])
+  return st_mid
+
+def get_st_mid_ratio(result, st_mid):
+  # The min, mean and max ratio of S_mid and T_mid to the exact S and T of the cusp, over ERROR_HUES hues
+  h = np.arange(ERROR_HUES) * (2 * np.pi / ERROR_HUES)
+  basis = get_st_mid_basis(np.cos(h), np.sin(h))
+  ratio = { 'min': [], 'mean': [], 'max': [] }
+  for (target, k) in zip(get_st_max(result, h), st_mid):
+    q = eval_st_mid(k, basis) / target
+    for (key, fn) in [('min', np.min), ('mean', np.mean), ('max', np.max)]:
+      ratio[key].append(float(f'{fn(q):.3g}'))
+  return ratio
+
+def find_cusp_runtime(result, h):
+  # The (L, C) of the cusp at each hue as found by findCuspOKLCH in src/gamut.js
+  return get_cusp(result, get_max_saturation_runtime(result, h), h)
+
+def get_cusp_lut(result, size):
+  # The exact cusp at `size` hues evenly spaced over [0, 360), rounded to CUSP_LUT_DIGITS
+  h = np.arange(size) * (2 * np.pi / size)
+  return np.vectorize(lambda x: float(f'{x:.{CUSP_LUT_DIGITS}g}'))(find_cusp_exact(result, h))
+
+def interpolate_cusp_lut(lut, h):
+  # Linear interpolation of the table at hues `h` (radians), the same as lookupCuspOKLCH in src/gamut.js
+  size = len(lut)
+  x = np.mod(h / (2 * np.pi), 1) * size
+  i0 = np.floor(x).astype(int) % size
+  t = (x - np.floor(x))[:, None]
+  return lut[i0] * (1 - t) + lut[(i0 + 1) % size] * t
+
+def get_cusp_lut_test_hues():
+  return (np.arange(CUSP_LUT_TEST_HUES) + 0.5) * (2 * np.pi / CUSP_LUT_TEST_HUES)
+
+def get_cusp_errors(cusps, exact):
+  # The max |L error| and |C error|, and the 99th and 99.9th percentiles of the larger of the two.
+  # The percentiles leave out the few hues around the bends of the cusp, where the channel that
+  # limits it changes, and the blue hues where it is nearly discontinuous.
+  error = np.abs(cusps - exact)
+  return (*np.max(error, axis=0), *np.percentile(np.max(error, axis=1), [99, 99.9]))
+
+def print_cusp_lut_errors(results, size):
+  # For every table size, the largest difference between the interpolated and exact cusp,
+  # along with the error of the runtime approximation for comparison
+  sizes = sorted(set(CUSP_LUT_SIZES + [size]))
+  h = get_cusp_lut_test_hues()
+
+  print('gamut                size     bytes   max |L error|   max |C error|   99% error   99.9% error', file=sys.stderr)
+  for result in results:
+    if result['coefficients'] is None:
+      continue
+    exact = find_cusp_exact(result, h)
+    error = get_cusp_errors(find_cusp_runtime(result, h), exact)
+    print(f'{result["gamut"]:<14} {"runtime":>11} {"-":>9}   {error[0]:13.3e}   {error[1]:13.3e}   {error[2]:9.3e}   {error[3]:11.3e}', file=sys.stderr)
+    for n in sizes:
+      error = get_cusp_errors(interpolate_cusp_lut(get_cusp_lut(result, n), h), exact)
+      marker = ' <' if n == size else ''
+      # bytes as a Float32Array, the table is emitted as a plain array
+      print(f'{result["gamut"]:<14} {n:>11} {n * 2 * 4:>9}   {error[0]:13.3e}   {error[1]:13.3e}   {error[2]:9.3e}   {error[3]:11.3e}{marker}', file=sys.stderr)
+
+def print_cusp_luts(results, size):
+  print(output_format['header'].format(text=f'This file is auto-generated by tools/print_matrices.py --cusp-lut {size}'))
+  h = get_cusp_lut_test_hues()
+  for result in results:
+    if result['coefficients'] is None:
+      continue
+    var_name = result['var_name']
+    lut = get_cusp_lut(result, size)
+    error = get_cusp_errors(interpolate_cusp_lut(lut, h), find_cusp_exact(result, h))
+    rows = ',\n'.join('  ' + ', '.join(f'{x:.{CUSP_LUT_DIGITS}g}' for x in lut[i:i + 3].ravel()) for i in range(0, size, 3))
+    print(''.join(output_format['comment'].format(text=text) for text in [
+      f'{var_name} cusp (L, C) pairs at {size} hues evenly spaced from 0 to 360 degrees,',
+      f'interpolated within {error[2]:.1e} of the exact cusp at 99% of hues, and {max(error[:2]):.1e} at most',
+    ]))
+    print_declaration(f'OKLab_to_{var_name}_cusp_LUT', f'[\n{rows},\n]')
+
+# Piecewise max saturation, enabled with --saturation-pieces
+
+# degree of the polynomial of each piece, and the largest |S - S_exact| the pieces are split to
+SATURATION_DEGREE = 4
+SATURATION_TOLERANCE = 1e-5
+
+# degrees and tolerances the tradeoff between accuracy and coefficient count is reported for
+SATURATION_DEGREES = [3, 4, 5]
+SATURATION_TOLERANCES = [1e-4, 1e-5, 1e-6]
+
+# pieces narrower than this (in pseudo angle, where 1 is 90 degrees) are not split further, they
+# only remain around the hues where the max saturation jumps, as near the blue primary
+SATURATION_MIN_WIDTH = 1e-5
+
+# Chebyshev nodes each piece is fitted on, evenly spaced hues it is checked on, and the iterations
+# of Lawson's algorithm, which turns the least squares fit into a minimax one
+SATURATION_FIT_NODES = 48
+SATURATION_CHECK_HUES = 200
+SATURATION_LAWSON_ITERATIONS = 20
+
+# number of even cells over [0, 4) the pieces are looked up with, see computeMaxSaturationPiecewise
+SATURATION_CELLS = 256
+
+def get_pseudo_angle(a, b):
+  # A monotonic function of the hue over [0, 4) that is cheaper than atan2, one per quadrant,
+  # the same as pseudoAngle in src/gamut.js
+  with np.errstate(divide='ignore', invalid='ignore'):
+    return np.where(b >= 0, np.where(a >= 0, b / (a + b), 1 - a / (b - a)), np.where(a < 0, 2 - b / (-a - b), 3 + a / (a - b)))
+
+def get_pseudo_angle_hue(p):
+  # The hue (radians) of a pseudo angle
+  quadrant = np.minimum(np.floor(p), 3)
+  f = p - quadrant
+  return np.arctan2(f, 1 - f) + quadrant * (np.pi / 2)
+
+def fit_saturation_piece(LMS_TO_RGBL, p0, p1, degree):
+  # The minimax polynomial of degree `degree` in u = sin(h - h_mid) closest to the exact max
+  # saturation over the pseudo angles [p0, p1], as (h_mid, coefficients, max error)
+  (h0, h1) = (get_pseudo_angle_hue(p0), get_pseudo_angle_hue(p1))
+  h_mid = 0.5 * (h0 + h1)
+  nodes = h_mid + 0.5 * (h1 - h0) * np.cos((np.arange(SATURATION_FIT_NODES) + 0.5) * (np.pi / SATURATION_FIT_NODES))
+  S = find_max_saturation_exact(LMS_TO_RGBL, nodes)
+  V = np.vander(np.sin(nodes - h_mid), degree + 1, increasing=True)
+
+  weights = np.full(len(nodes), 1 / len(nodes))
+  best = None
+  for i in range(SATURATION_LAWSON_ITERATIONS):
+    k = np.linalg.lstsq(V * np.sqrt(weights)[:, None], S * np.sqrt(weights), rcond=None)[0]
+    error = np.abs(V @ k - S)
+    if best is None or np.max(error) < best[1]:
+      best = (k, np.max(error))
+    weights = weights * error
+    if not np.sum(weights) > 1e-300:
+      break
+    weights /= np.sum(weights)
+
+  k = best[0]
+  hues = np.linspace(h0, h1, SATURATION_CHECK_HUES)
+  check = np.abs(np.vander(np.sin(hues - h_mid), degree + 1, increasing=True) @ k - find_max_saturation_exact(LMS_TO_RGBL, hues))
+  return (h_mid, k, max(best[1], np.max(check)))
+
+def fit_saturation_pieces(result, degree = SATURATION_DEGREE, tolerance = SATURATION_TOLERANCE):
+  # Splits the hues into pieces until the polynomial of each is within `tolerance` of the exact
+  # max saturation, starting from the quadrants and the hues where the channel that goes below
+  # zero first changes, where the max saturation has a kink. Returns the pieces as
+  # { degree, starts, cells, coefficients }, see computeMaxSaturationPiecewise in src/gamut.js.
+  sectors = np.mod(get_pseudo_angle(np.cos(get_sector_hues(result['RGBL_TO_LMS'])), np.sin(get_sector_hues(result['RGBL_TO_LMS']))), 4)
+  bounds = sorted(set([0.0, 1.0, 2.0, 3.0, 4.0] + [float(p) for p in sectors]))
+  todo = [(bounds[i], bounds[i + 1]) for i in reversed(range(len(bounds) - 1))]
+  pieces = []
+  while todo:
+    (p0, p1) = todo.pop()
+    (h_mid, k, error) = fit_saturation_piece(result['LMS_TO_RGBL'], p0, p1, degree)
+    if error > tolerance and p1 - p0 > SATURATION_MIN_WIDTH:
+      mid = 0.5 * (p0 + p1)
+      todo += [(mid, p1), (p0, mid)]
+    else:
+      pieces.append((p0, h_mid, k))
+
+  starts = [p0 for (p0, _, _) in pieces]
+  cells = np.searchsorted(starts, np.arange(SATURATION_CELLS) * (4 / SATURATION_CELLS), side='right') - 1
+  # each piece is u = dot((a, b), (-sin(h_mid), cos(h_mid))), then its polynomial in u
+  coefficients = sum([[-np.sin(h_mid), np.cos(h_mid)] + list(k) for (_, h_mid, k) in pieces], [])
+  return {
+    'degree': degree,
+    'starts': [float(p) for p in starts],
+    'cells': [int(i) for i in cells],
+    'coefficients': [float(x) for x in coefficients],
+  }
+
+def eval_saturation_pieces(pieces, a, b):
+  # The max saturation of the pieces, the same as computeMaxSaturationPiecewise in src/gamut.js
+  p = get_pseudo_angle(a, b)
+  (starts, cells) = (np.asarray(pieces['starts']), np.asarray(pieces['cells']))
+  i = cells[np.minimum(np.floor(p * (len(cells) / 4)).astype(int), len(cells) - 1)]
+  # the pieces that start within the cell
+  while True:
+    after = (i + 1 < len(starts)) & (starts[np.minimum(i + 1, len(starts) - 1)] <= p)
+    if not np.any(after):
+      break
+    i = i + after
+  stride = pieces['degree'] + 3
+  k = np.asarray(pieces['coefficients']).reshape(-1, stride)[i]
+  u = k[:, 0] * a + k[:, 1] * b
+  S = k[:, -1]
+  for j in reversed(range(pieces['degree'])):
+    S = S * u + k[:, 2 + j]
+  return S
+
+def get_saturation_pieces_error(result, S_exact, pieces, a, b):
+  error = np.abs(eval_saturation_pieces(pieces, a, b) - S_exact)
+  return (np.max(error), np.percentile(error, 99.9), np.mean(error))
+
+def print_saturation_pieces_errors(results, degree, tolerance):
+  # For every degree and tolerance, the number of pieces and coefficients and the error of the
+  # pieces, along with the error of the polynomial and Halley steps of computeMaxSaturationOKLC
+  h = (np.arange(ERROR_HUES) + 0.5) * (2 * np.pi / ERROR_HUES)
+  (a, b) = (np.cos(h), np.sin(h))
+  print('gamut                          pieces   coefficients   max |S error|   99.9% error    mean error', file=sys.stderr)
+  for result in results:
+    if result['coefficients'] is None:
+      continue
+    S_exact = find_max_saturation_exact(result['LMS_TO_RGBL'], h)
+    for steps in [1, 2, 3]:
+      error = np.abs(get_max_saturation_runtime(result, h, steps) - S_exact)
+      label = f'{steps} Halley step{"s" if steps > 1 else ""}'
+      print(f'{result["gamut"]:<14} {label:<15} {"-":>6}   {19:>12}   {np.max(error):13.3e}   {np.percentile(error, 99.9):11.3e}   {np.mean(error):11.3e}', file=sys.stderr)
+    for d in sorted(set(SATURATION_DEGREES + [degree])):
+      for t in sorted(set(SATURATION_TOLERANCES + [tolerance]), reverse=True):
+        pieces = fit_saturation_pieces(result, d, t)
+        error = get_saturation_pieces_error(result, S_exact, pieces, a, b)
+        label = f'degree {d}, {t:.0e}'
+        marker = ' <' if (d, t) == (degree, tolerance) else ''
+        print(f'{result["gamut"]:<14} {label:<15} {len(pieces["starts"]):>6}   {len(pieces["coefficients"]):>12}   {error[0]:13.3e}   {error[1]:11.3e}   {error[2]:11.3e}{marker}', file=sys.stderr)
+
+def format_js_number(x):
+  # the shortest representation that round-trips, formatted as prettier prints it
+  text = repr(x)
+  if text.endswith('.0'):
+    text = text[:-2]
+  if 'e' in text:
+    (mantissa, exponent) = text.split('e')
+    text = f'{mantissa}e{int(exponent)}'
+  return text
+
+def format_js_numbers(values, indent):
+  # the items of a number array, filled to the line length as prettier does
+  lines = []
+  line = indent
+  for x in values:
+    item = format_js_number(x) + ','
+    if len(line) + len(item) + 1 > 80:
+      lines.append(line)
+      line = indent
+    line += ('' if line == indent else ' ') + item
+  return '\n'.join(lines + [line])
+
+def print_saturation_pieces(results, degree, tolerance):
+  print(output_format['header'].format(text='This file is auto-generated by tools/print_matrices.py --saturation-pieces'))
+  for result in results:
+    if result['coefficients'] is None:
+      continue
+    var_name = result['var_name']
+    pieces = fit_saturation_pieces(result, degree, tolerance)
+    print_comment(f'{var_name} max saturation, {len(pieces["starts"])} pieces of degree {degree} within {tolerance:g}')
+    fields = [f'  degree: {degree},']
+    for key in ['starts', 'cells', 'coefficients']:
+      fields += [f'  {key}: [', format_js_numbers(pieces[key], '    '), '  ],']
+    print_declaration(f'OKLab_to_{var_name}_saturation_pieces', '{\n' + '\n'.join(fields) + '\n}')
+
+# Shader modules, enabled with --format glsl or --format wgsl
+
+def format_shader_float(x):
+  # the shortest repr that round-trips the float64 value, always with a decimal point or exponent
+  text = repr(float(x))
+  return text if any(c in text for c in '.e') else text + '.0'
+
+def format_shader_vector(values):
+  return output_format['vector'].format(size=len(values), value=', '.join(format_shader_float(x) for x in values))
+
+def format_shader_matrix(name, M):
+  # shader matrices are column-major, so the values are listed column by column
+  M = np.asfarray(M)
+  columns = [', '.join(format_shader_float(M[i][j]) for i in range(3)) for j in range(3)]
+  return output_format['matrix'].format(name=name, value=',\n'.join('  ' + column for column in columns))
+
+def get_shader_gamut_name(var_name):
+  # the name of the gamut object in src/spaces, i.e. linear_sRGB => sRGBGamut
+  return var_name.replace('linear_', '') + 'Gamut'
+
+def format_shader_gamut(result):
+  # an OKGamut { LMS_to_RGB, dirR, dirG, kR, kG, kB, k4 }, see the templates
+  var_name = result['var_name']
+  ((dirR, kR), (dirG, kG), (dirB, kB)) = result['coefficients']
+  fields = [
+    f'LMS_to_{var_name}_M',
+    format_shader_vector(dirR),
+    format_shader_vector(dirG),
+    format_shader_vector(kR[:4]),
+    format_shader_vector(kG[:4]),
+    format_shader_vector(kB[:4]),
+    format_shader_vector([kR[4], kG[4], kB[4]]),
+  ]
+  return output_format['gamut'].format(name=get_shader_gamut_name(var_name), value=',\n'.join('  ' + field for field in fields))
+
+def print_shader(results, shader_format):
+  # Fills the constants into the shader template, so the shaders use the same matrices and
+  # coefficients as src/conversion_matrices.js
+  constants = [
+    output_format['comment'].format(text='OKLab to LMS matrices'),
+    format_shader_matrix('OKLab_to_LMS_M', OKLAB_TO_LMS3),
+    format_shader_matrix('LMS_to_OKLab_M', LMS3_TO_OKLAB),
+    format_shader_matrix('XYZ_to_LMS_M', XYZ_TO_LMS),
+    format_shader_matrix('LMS_to_XYZ_M', LMS_TO_XYZ),
+  ]
+  for result in results:
+    var_name = result['var_name']
+    constants += [
+      output_format['comment'].format(text=f'{var_name} to XYZ ({result["whitepoint"]}) and LMS matrices'),
+      format_shader_matrix(f'{var_name}_to_XYZ_M', result['RGBL_TO_XYZ']),
+      format_shader_matrix(f'XYZ_to_{var_name}_M', result['XYZ_TO_RGBL']),
+      format_shader_matrix(f'{var_name}_to_LMS_M', result['RGBL_TO_LMS']),
+      format_shader_matrix(f'LMS_to_{var_name}_M', result['LMS_TO_RGBL']),
+    ]
+  for result in results:
+    if result['coefficients'] is not None:
+      constants += [
+        output_format['comment'].format(text=f'{result["var_name"]} gamut for OKLab gamut approximation'),
+        format_shader_gamut(result),
+      ]
 
-for gamut in ['srgb', 'display-p3', 'rec2020', 'a98-rgb', 'prophoto-rgb']:
-  d = do_calc(gamut)
+  with open(os.path.join(SHADER_TEMPLATES_DIR, f'color.{shader_format}'), 'r', encoding='utf-8') as f:
+    template = f.read()
+  header = output_format['header'].format(text=f'This file is auto-generated by tools/print_matrices.py --format {shader_format}')
+  print(header + '\n' + template.replace('// @constants\n', '\n'.join(constants)), end='')
+
+# Custom gamut modules, enabled with --gamut or --config
+
+# max saturation error above which the approximation of a custom gamut is reported as unusable
+CUSTOM_ERROR_LIMIT = 1
+
+def format_white(white):
+  return white if isinstance(white, str) else f'({white[0]}, {white[1]})'
+
+def print_transfer(name, gamma):
+  # a sign preserving power function, the same form as A98RGBToLinear
+  for (suffix, exponent) in [('ToLinear', f'{gamma}'), ('ToGamma', f'1 / {gamma}')]:
+    print(f'export const {name}{suffix} = (val) => {{')
+    print('  let sign = val < 0 ? -1 : 1;')
+    print('  let abs = Math.abs(val);')
+    print(f'  return sign * Math.pow(abs, {exponent});')
+    print('};\n')
+
+def print_custom_space(custom, result):
+  # The space objects of a custom gamut, the same shape as the built-in ones (see src/spaces/a98-rgb.js),
+  # a linear gamut is a single space, otherwise the encoded space has the linear one as its base
+  (name, var_name, transfer) = (custom['name'], result['var_name'], custom['transfer'])
+  linear_name = name if transfer == 'linear' else f'{name}Linear'
+  linear_id = custom['id'] if transfer == 'linear' else f'{custom["id"]}-linear'
+  print(f'export const {linear_name} = {{')
+  print(f'  id: "{linear_id}",')
+  print(f'  toXYZ_M: {var_name}_to_XYZ_M,')
+  print(f'  fromXYZ_M: XYZ_to_{var_name}_M,')
+  print(f'  toLMS_M: {var_name}_to_LMS_M,')
+  print(f'  fromLMS_M: LMS_to_{var_name}_M,')
+  print('};\n')
+  if transfer == 'linear':
+    return
+
+  print(f'export const {name} = {{')
+  print(f'  id: "{custom["id"]}",')
+  print(f'  base: {linear_name},')
+  if isinstance(transfer, float):
+    for (field, suffix) in [('toBase', 'ToLinear'), ('fromBase', 'ToGamma')]:
+      print(f'  {field}: (vec, out = vec3()) => {{')
+      for i in range(3):
+        print(f'    out[{i}] = {name}{suffix}(vec[{i}]);')
+      print('    return out;')
+      print('  },')
+  else:
+    print(f'  toBase: {CUSTOM_TRANSFERS[transfer]}.toBase,')
+    print(f'  fromBase: {CUSTOM_TRANSFERS[transfer]}.fromBase,')
+  print('};\n')
+
+def print_custom_gamut_module(results, import_from, steps = HALLEY_STEPS):
+  # A JS module of the matrices, coefficients, spaces and gamut of every custom gamut, which
+  # imports what it reuses of the library from `import_from`
+  customs = [CUSTOM_GAMUTS[result['gamut']] for result in results]
+  transfers = [custom['transfer'] for custom in customs]
+  imports = sorted({CUSTOM_TRANSFERS[t] for t in transfers if isinstance(t, str) and CUSTOM_TRANSFERS[t]})
+  if any(isinstance(t, float) for t in transfers):
+    imports = ['vec3'] + imports
+
+  print(output_format['header'].format(text='This file is auto-generated by tools/print_matrices.py'))
+  if imports:
+    print(f'import {{ {", ".join(imports)} }} from "{import_from}";\n')
+
+  for (custom, result) in zip(customs, results):
+    primaries = ', '.join(f'({x}, {y})' for (x, y) in custom['primaries'])
+    print_comment(f'{custom["name"]}: primaries {primaries}, white point {format_white(custom["white"])}')
+    if custom['white'] != 'd65':
+      print_comment('the Bradford adaptation to D65 is folded into the matrices')
+    print_gamut(result)
+    if isinstance(custom['transfer'], float):
+      print_transfer(custom['name'], custom['transfer'])
+    print_custom_space(custom, result)
+
+    name = custom['name']
+    print(f'export const {name}Gamut = {{')
+    print(f'  space: {name},')
+    print(f'  coefficients: OKLab_to_{result["var_name"]}_coefficients,')
+    if result.get('st_mid') is not None:
+      print(f'  stMidCoefficients: OKLab_to_{result["var_name"]}_st_mid_coefficients,')
+    if steps > 1:
+      print(f'  halleySteps: {steps},')
+    print('};\n')
+
+    error = result['coefficients_error']
+    print(f'{name}: max saturation error ({error["steps"]} Halley step{"" if error["steps"] == 1 else "s"}) max {error["max"]} / mean {error["mean"]} (R, G, B)', file=sys.stderr)
+    if result.get('st_mid') is None:
+      print(f'{name}: the S_mid and T_mid polynomials of OKHSL could not be fitted, it uses the sRGB ones', file=sys.stderr)
+    if max(error['max']) > CUSTOM_ERROR_LIMIT:
+      print(f'{name}: the max saturation of this gamut is too far from the polynomial approximation for gamut mapping to hold, only its conversions are usable', file=sys.stderr)
+
+def parse_primaries(text):
+  # a space known to xyzt_get_primaries, or the comma separated x, y of red, green and blue
+  if not text[0].isdigit() and text[0] not in '.-':
+    return text
+  values = [float(n) for n in text.split(',')]
+  if len(values) != 6:
+    raise argparse.ArgumentTypeError('expected 6 comma separated numbers, the x, y of red, green and blue')
+  return [values[i:i + 2] for i in range(0, 6, 2)]
+
+def parse_white(text):
+  # a white point name, or its comma separated x, y
+  if text in XYZT_WHITES:
+    return text
+  values = [float(n) for n in text.split(',')]
+  if len(values) != 2:
+    raise argparse.ArgumentTypeError(f'expected one of {list(XYZT_WHITES)} or a comma separated x, y')
+  return values
+
+def parse_schedule(text):
+  schedule = [int(n) for n in text.split(',')]
+  if any(n < 10 for n in schedule):
+    raise argparse.ArgumentTypeError('every stage needs at least 10 hues')
+  return schedule
+
+def main(argv = None):
+  parser = argparse.ArgumentParser(description='Prints the conversion matrices and OKLab gamut approximation coefficients as a JS module.')
+  parser.add_argument('--jobs', '-j', type=int, default=1, help='number of processes used to fit the gamut coefficients, 0 uses all cores (default: 1)')
+  parser.add_argument('--format', choices=OUTPUT_FORMATS.keys(), default='js', help='language of the printed module (default: js)')
+  parser.add_argument('--schedule', type=parse_schedule, metavar='N,N,...', help=f'numbers of hues the fits run on in turn, ending on the full resolution (default: {",".join(map(str, FIT_SCHEDULE))})')
+  parser.add_argument('--halley-steps', type=int, choices=[1, 2, 3], default=HALLEY_STEPS, help=f'number of Halley steps the coefficients are fitted for, for gamuts given `halleySteps` (default: {HALLEY_STEPS})')
+  parser.add_argument('--compare-schedule', action='store_true', help='compare the fits of --schedule with a single fit on every hue, then exit')
+  parser.add_argument('--compare-jac', action='store_true', help=f'compare the fits with analytic and finite difference gradients, and check the analytic gradients within {JAC_TOLERANCE:g}, then exit')
+  parser.add_argument('--profile-fit', action='store_true', help='report the time and memory of one evaluation of the fitting objective, then exit')
+  parser.add_argument('--cache-dir', default=CACHE_DIR, help=f'directory of cached results, keyed by a hash of the inputs and fit settings of each gamut (default: {os.path.relpath(CACHE_DIR)})')
+  parser.add_argument('--no-cache', action='store_true', help='ignore the cache, recomputing every gamut')
+  parser.add_argument('--verify-cache', action='store_true', help='recompute every gamut and check it against the cache, then exit')
+  parser.add_argument('--cusp-lut', type=int, metavar='N', default=0, help='print cusp lookup tables with N hues per gamut instead of the matrices, and report their interpolation error')
+  parser.add_argument('--saturation-pieces', action='store_true', help='print piecewise max saturation polynomials of every gamut instead of the matrices, and report their accuracy')
+  parser.add_argument('--saturation-degree', type=int, default=SATURATION_DEGREE, help=f'degree of the polynomial of each piece of --saturation-pieces (default: {SATURATION_DEGREE})')
+  parser.add_argument('--saturation-tolerance', type=float, default=SATURATION_TOLERANCE, help=f'largest max saturation error of the pieces of --saturation-pieces (default: {SATURATION_TOLERANCE:g})')
+  parser.add_argument('--split', metavar='DIR', help='write the matrices of each gamut, and the shared OKLab, LMS and adaptation matrices, to their own JS modules in DIR, and print a module re-exporting them')
+  parser.add_argument('--gamut', metavar='NAME', help='print a module of the space and gamut NAME given by --primaries, --white and --transfer instead')
+  parser.add_argument('--primaries', type=parse_primaries, metavar='XR,YR,XG,YG,XB,YB', help='xy chromaticities of the primaries of --gamut, or a known set such as aces-ap1')
+  parser.add_argument('--white', type=parse_white, default='d65', metavar='NAME|X,Y', help=f'white point of --gamut, one of {", ".join(XYZT_WHITES)} or its xy chromaticity (default: d65)')
+  parser.add_argument('--transfer', default='linear', metavar='NAME|gamma:N', help=f'transfer function of --gamut, one of {", ".join(CUSTOM_TRANSFERS)} or gamma:N (default: linear)')
+  parser.add_argument('--config', metavar='PATH', help='print a module of the spaces and gamuts defined in the JSON file PATH instead')
+  parser.add_argument('--import-from', default='@texel/color', metavar='MODULE', help='module the --gamut and --config modules import the library from (default: @texel/color)')
+  parser.add_argument('--diag', action='store_true', help='print per-channel accuracy diagnostics to stderr')
+  parser.add_argument('--plot', metavar='PATH', help='save a plot of the max saturation per hue to PATH (requires matplotlib)')
+  args = parser.parse_args(argv)
+
+  global output_format
+  output_format = OUTPUT_FORMATS[args.format]
+
+  if args.compare_schedule:
+    compare_schedule(GAMUTS, args.schedule or FIT_SCHEDULE)
+    sys.exit(0)
+
+  if args.compare_jac:
+    sys.exit(0 if compare_jac(GAMUTS) else 1)
+
+  if args.profile_fit:
+    profile_fit(GAMUTS)
+    sys.exit(0)
+
+  if args.verify_cache:
+    sys.exit(0 if verify_cache(GAMUTS, args.jobs, args.cache_dir, args.schedule, args.halley_steps) else 1)
+
+  customs = []
+  try:
+    if args.config:
+      customs += read_gamut_config(args.config)
+    if args.gamut:
+      if args.primaries is None:
+        parser.error('--gamut requires --primaries')
+      customs.append(parse_custom_gamut({ 'name': args.gamut, 'primaries': args.primaries, 'white': args.white, 'transfer': args.transfer }))
+  except ValueError as e:
+    parser.error(str(e))
+
+  if args.split and (args.format not in ['js', 'packed'] or args.cusp_lut > 0 or args.saturation_pieces):
+    parser.error('--split only applies to the JS matrices')
+
+  if customs:
+    if args.split:
+      parser.error('custom gamuts are printed as a single module, without --split')
+    if args.format not in ['js', 'packed'] or args.cusp_lut > 0 or args.saturation_pieces:
+      parser.error('custom gamuts are only printed as a JS module')
+    register_custom_gamuts(customs)
+    results = calc_gamuts([custom['id'] for custom in customs], args.jobs, None if args.no_cache else args.cache_dir, args.schedule, args.halley_steps)
+    print_custom_gamut_module(results, args.import_from, args.halley_steps)
+    return
+
+  # compute all gamuts up front, so that the printed output is in a fixed order
+  results = calc_gamuts(GAMUTS, args.jobs, None if args.no_cache else args.cache_dir, args.schedule, args.halley_steps)
+
+  if args.cusp_lut > 0:
+    print_cusp_luts(results, args.cusp_lut)
+    print_cusp_lut_errors(results, args.cusp_lut)
+    return
+
+  if args.saturation_pieces:
+    print_saturation_pieces(results, args.saturation_degree, args.saturation_tolerance)
+    print_saturation_pieces_errors(results, args.saturation_degree, args.saturation_tolerance)
+    return
+
+  if args.format in SHADER_FORMATS:
+    print_shader(results, args.format)
+    return
+
+  composites = check_composite_matrices(results, args.diag)
+
+  if args.split:
+    print_split_modules(results, composites, args.split)
+  else:
+    # print things...
+    print_header()
+    print_oklab_matrices()
+    for result in results:
+      print_gamut(result)
+    print_composite_matrices(composites)
+
+  if args.diag:
+    print_diagnostics(results)
+  if args.plot:
+    plot_diagnostics(results, args.plot)
+
+if __name__ == '__main__':
+  main()
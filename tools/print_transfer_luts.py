@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+"""
+Prints a JS module of lookup tables for the transfer functions of the built-in RGB spaces, for
+decoding integer inputs to linear light and encoding linear light without calling Math.pow per
+channel. They are used by the functions of src/transfer.js.
+
+Run from the repository root (or with `npm run transfer-luts`):
+
+  python3 tools/print_transfer_luts.py [--encode-size 1024] > src/transfer_luts.js
+
+Each transfer function gets a decode table, `sRGB_decode_LUT` etc, holding the linear value of
+every 8-bit code value, so decoding is exact. Display P3 shares the sRGB tables. 16-bit decode
+tables would be 65,536 entries each and are built at runtime from the scalar functions instead,
+see createDecodeLUT.
+
+Encode tables, `sRGB_encode_LUT` etc, hold `--encode-size + 1` samples of the linear to gamma
+curve, which are linearly interpolated. The curves are steepest near black, so the samples are
+spaced evenly in sqrt(linear) rather than in linear, i.e. entry i is the encoding of (i / N)^2:
+for the same size, this is one to two orders of magnitude more accurate than even spacing. The
+interpolation error of each table is reported on stderr, against the exact curve, for a few
+table sizes, along with how often it rounds to a different 8-bit and 16-bit code value.
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.getcwd())
+
+from tools.texel_color import spaces as S # noqa: E402
+
+# the transfer functions that get tables, with their export name prefix and the spaces using them
+TRANSFERS = [
+  ('sRGB', S.sRGB_gamma_to_linear, S.sRGB_linear_to_gamma, 'sRGB and Display P3'),
+  ('Rec2020', S.Rec2020_to_linear, S.Rec2020_to_gamma, 'Rec. 2020'),
+  ('A98RGB', S.A98RGB_to_linear, S.A98RGB_to_gamma, 'Adobe RGB (1998)'),
+  ('ProPhotoRGB', S.ProPhotoRGB_to_linear, S.ProPhotoRGB_to_gamma, 'ProPhoto RGB'),
+]
+
+ENCODE_LUT_SIZE = 1024
+
+# the encode table sizes the error is reported for
+ENCODE_LUT_SIZES = [256, 1024, 4096]
+
+# significant digits of the encode tables, far below their interpolation error
+ENCODE_LUT_DIGITS = 9
+
+# number of evenly spaced linear values the encode tables are tested on
+ENCODE_TEST_SIZE = 1_000_001
+
+MAX_LINE = 80
+
+def js_number(x, digits = None):
+  text = repr(float(x)) if digits is None else f'{float(x):.{digits}g}'
+  if text.endswith('.0'):
+    text = text[:-2]
+  if 'e' in text:
+    (mantissa, exponent) = text.split('e')
+    text = f'{mantissa}e{int(exponent)}'
+  return text
+
+def format_array(name, values, digits = None):
+  # a declaration of a number array, filled to the line length as prettier does
+  lines = [f'export const {name} = [']
+  line = ' '
+  for x in values:
+    item = f' {js_number(x, digits)},'
+    if len(line) + len(item) > MAX_LINE:
+      lines.append(line)
+      line = ' '
+    line += item
+  lines.append(line)
+  return '\n'.join(lines + ['];'])
+
+def get_decode_lut(to_linear):
+  return to_linear(np.arange(256) / 255)
+
+def get_encode_lut(to_gamma, size):
+  return to_gamma((np.arange(size + 1) / size) ** 2)
+
+def interpolate_encode_lut(lut, x):
+  # The same as encodeWithLUT in src/transfer.js
+  size = len(lut) - 1
+  u = np.sqrt(np.clip(x, 0, 1)) * size
+  i = np.minimum(np.floor(u).astype(int), size - 1)
+  t = u - i
+  return lut[i] + (lut[i + 1] - lut[i]) * t
+
+def print_encode_errors(size):
+  x = np.linspace(0, 1, ENCODE_TEST_SIZE)
+  print('transfer        size   max error   8-bit mismatches   16-bit mismatches', file=sys.stderr)
+  for (name, _, to_gamma, _) in TRANSFERS:
+    exact = to_gamma(x)
+    for n in sorted(set(ENCODE_LUT_SIZES + [size])):
+      lut = np.array([float(js_number(v, ENCODE_LUT_DIGITS)) for v in get_encode_lut(to_gamma, n)])
+      encoded = interpolate_encode_lut(lut, x)
+      error = np.max(np.abs(encoded - exact))
+      mismatches = [np.mean(np.round(encoded * m) != np.round(exact * m)) for m in (255, 65535)]
+      marker = ' <' if n == size else ''
+      print(f'{name:<12} {n:>7}   {error:9.3e}   {mismatches[0]:16.3e}   {mismatches[1]:17.3e}{marker}', file=sys.stderr)
+
+def main(argv = None):
+  parser = argparse.ArgumentParser(description='Prints a JS module of transfer function lookup tables, and reports the error of the encode tables.')
+  parser.add_argument('--encode-size', type=int, default=ENCODE_LUT_SIZE, help=f'number of intervals of the encode tables (default: {ENCODE_LUT_SIZE})')
+  args = parser.parse_args(argv)
+  if args.encode_size < 1:
+    parser.error('--encode-size must be at least 1')
+
+  print(f'/** This file is auto-generated by tools/print_transfer_luts.py --encode-size {args.encode_size} */')
+  for (name, to_linear, to_gamma, spaces) in TRANSFERS:
+    print()
+    print(f'// {spaces}, linear values of the 8-bit code values 0 to 255')
+    print(format_array(f'{name}_decode_LUT', get_decode_lut(to_linear)))
+    print()
+    print(f'// {spaces}, encoded values of (i / {args.encode_size})^2 for i from 0 to {args.encode_size}')
+    print(format_array(f'{name}_encode_LUT', get_encode_lut(to_gamma, args.encode_size), ENCODE_LUT_DIGITS))
+  print_encode_errors(args.encode_size)
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,207 @@
+// Conversions and OKLCH gamut mapping, ported from src/core.js, src/gamut.js and src/spaces.
+// Written for GLSL ES 3.00 (WebGL 2, after `precision highp float;`) and GLSL 3.30, include it
+// before your own code.
+// Matrices are column-major (as GLSL expects), so they are applied as `M * v`.
+
+struct OKGamut {
+  // LMS to the gamut's linear RGB
+  mat3 LMS_to_RGB;
+  // directions used to select the channel that goes below zero first
+  vec2 dirR;
+  vec2 dirG;
+  // the first four coefficients of the max saturation polynomial of each channel,
+  // and the fifth coefficient of each channel
+  vec4 kR;
+  vec4 kG;
+  vec4 kB;
+  vec3 k4;
+};
+
+const float FLOAT_MAX = 3.4028234663852886e38;
+
+// based on colorjs.io, could perhaps use a more specific number than this
+const float ACHROMATIC_EPSILON = 4e-6;
+
+// @constants
+
+float cbrt(float x) {
+  return sign(x) * pow(abs(x), 1.0 / 3.0);
+}
+
+vec3 cbrt(vec3 x) {
+  return sign(x) * pow(abs(x), vec3(1.0 / 3.0));
+}
+
+// OKLab
+
+vec3 OKLab_to(vec3 OKLab, mat3 LMS_to_output) {
+  vec3 lms = OKLab_to_LMS_M * OKLab;
+  return LMS_to_output * (lms * lms * lms);
+}
+
+vec3 OKLab_from(vec3 color, mat3 input_to_LMS) {
+  return LMS_to_OKLab_M * cbrt(input_to_LMS * color);
+}
+
+vec3 OKLCH_to_OKLab(vec3 oklch) {
+  float h = radians(oklch.z);
+  return vec3(oklch.x, oklch.y * cos(h), oklch.y * sin(h));
+}
+
+vec3 OKLab_to_OKLCH(vec3 oklab) {
+  if (abs(oklab.y) < ACHROMATIC_EPSILON && abs(oklab.z) < ACHROMATIC_EPSILON) {
+    return vec3(oklab.x, 0.0, 0.0);
+  }
+  float hue = degrees(atan(oklab.z, oklab.y));
+  return vec3(oklab.x, length(oklab.yz), hue < 0.0 ? hue + 360.0 : hue);
+}
+
+// Transfer functions, the sRGB ones are also used by Display P3
+
+vec3 sRGBGammaToLinear(vec3 v) {
+  vec3 a = abs(v);
+  return mix(v / 12.92, sign(v) * pow((a + 0.055) / 1.055, vec3(2.4)), greaterThan(a, vec3(0.04045)));
+}
+
+vec3 sRGBLinearToGamma(vec3 v) {
+  vec3 a = abs(v);
+  return mix(12.92 * v, sign(v) * (1.055 * pow(a, vec3(1.0 / 2.4)) - 0.055), greaterThan(a, vec3(0.0031308)));
+}
+
+vec3 Rec2020ToLinear(vec3 v) {
+  const float ALPHA = 1.09929682680944;
+  const float BETA = 0.018053968510807;
+  vec3 power = pow((max(v, vec3(BETA * 4.5)) + ALPHA - 1.0) / ALPHA, vec3(1.0 / 0.45));
+  return mix(v / 4.5, power, greaterThanEqual(v, vec3(BETA * 4.5)));
+}
+
+vec3 Rec2020ToGamma(vec3 v) {
+  const float ALPHA = 1.09929682680944;
+  const float BETA = 0.018053968510807;
+  vec3 power = ALPHA * pow(max(v, vec3(BETA)), vec3(0.45)) - (ALPHA - 1.0);
+  return mix(4.5 * v, power, greaterThanEqual(v, vec3(BETA)));
+}
+
+vec3 A98RGBToLinear(vec3 v) {
+  return sign(v) * pow(abs(v), vec3(563.0 / 256.0));
+}
+
+vec3 A98RGBToGamma(vec3 v) {
+  return sign(v) * pow(abs(v), vec3(256.0 / 563.0));
+}
+
+vec3 ProPhotoRGBToLinear(vec3 v) {
+  const float Et2 = 16.0 / 512.0;
+  return mix(v / 16.0, pow(max(v, vec3(Et2)), vec3(1.8)), greaterThanEqual(v, vec3(Et2)));
+}
+
+vec3 ProPhotoRGBToGamma(vec3 v) {
+  const float Et = 1.0 / 512.0;
+  return mix(16.0 * v, pow(max(v, vec3(Et)), vec3(1.0 / 1.8)), greaterThanEqual(v, vec3(Et)));
+}
+
+// Gamut approximation and mapping, hues are given as normalized a, b (a^2 + b^2 == 1)
+
+float computeMaxSaturationOKLC(float a, float b, OKGamut gamut) {
+  // select the coefficients and LMS to RGB row of the component that goes below zero first
+  mat3 m = gamut.LMS_to_RGB;
+  vec4 k;
+  float k4;
+  vec3 w;
+  if (dot(gamut.dirR, vec2(a, b)) > 1.0) {
+    k = gamut.kR;
+    k4 = gamut.k4.x;
+    w = vec3(m[0][0], m[1][0], m[2][0]);
+  } else if (dot(gamut.dirG, vec2(a, b)) > 1.0) {
+    k = gamut.kG;
+    k4 = gamut.k4.y;
+    w = vec3(m[0][1], m[1][1], m[2][1]);
+  } else {
+    k = gamut.kB;
+    k4 = gamut.k4.z;
+    w = vec3(m[0][2], m[1][2], m[2][2]);
+  }
+
+  // approximate max saturation using a polynomial
+  float sat = k.x + k.y * a + k.z * b + k.w * (a * a) + k4 * a * b;
+
+  // then one step of Halley's method to get closer
+  vec3 kLMS = OKLab_to_LMS_M * vec3(0.0, a, b);
+  vec3 lms_ = 1.0 + sat * kLMS;
+  vec3 lms = lms_ * lms_ * lms_;
+  vec3 lmsdS = 3.0 * kLMS * lms_ * lms_;
+  vec3 lmsdS2 = 6.0 * kLMS * kLMS * lms_;
+
+  float f = dot(w, lms);
+  float f1 = dot(w, lmsdS);
+  float f2 = dot(w, lmsdS2);
+  return sat - (f * f1) / (f1 * f1 - 0.5 * f * f2);
+}
+
+vec2 findCuspOKLCH(float a, float b, OKGamut gamut) {
+  // first, find the maximum saturation
+  float S_cusp = computeMaxSaturationOKLC(a, b, gamut);
+
+  // convert to linear RGB to find the first point where at least one of r, g or b >= 1
+  vec3 rgb_at_max = OKLab_to(vec3(1.0, S_cusp * a, S_cusp * b), gamut.LMS_to_RGB);
+  float L_cusp = cbrt(1.0 / max(max(rgb_at_max.r, rgb_at_max.g), rgb_at_max.b));
+  return vec2(L_cusp, L_cusp * S_cusp);
+}
+
+float findGamutIntersectionOKLCH(float a, float b, float l1, float c1, float l0, vec2 cusp, OKGamut gamut) {
+  // Finds the intersection t of the line L = L0 * (1 - t) + t * L1, C = t * C1 with the gamut
+  if ((l1 - l0) * cusp.y - (cusp.x - l0) * c1 <= 0.0) {
+    // lower half
+    float denom = c1 * cusp.x + cusp.y * (l0 - l1);
+    return denom == 0.0 ? 0.0 : (cusp.y * l0) / denom;
+  }
+
+  // upper half, first intersect with triangle
+  float denom = c1 * (cusp.x - 1.0) + cusp.y * (l0 - l1);
+  float t = denom == 0.0 ? 0.0 : (cusp.y * (l0 - 1.0)) / denom;
+
+  // then one step Halley's method
+  vec3 kLMS = OKLab_to_LMS_M * vec3(0.0, a, b);
+  vec3 lmsdt_ = (l1 - l0) + c1 * kLMS;
+
+  float L = l0 * (1.0 - t) + t * l1;
+  float C = t * c1;
+
+  vec3 lms_ = L + C * kLMS;
+  vec3 lms = lms_ * lms_ * lms_;
+  vec3 lmsdt = 3.0 * lmsdt_ * lms_ * lms_;
+  vec3 lmsdt2 = 6.0 * lmsdt_ * lmsdt_ * lms_;
+
+  vec3 c_ = gamut.LMS_to_RGB * lms - 1.0;
+  vec3 c1_ = gamut.LMS_to_RGB * lmsdt;
+  vec3 c2_ = gamut.LMS_to_RGB * lmsdt2;
+
+  // the step to where a rising channel reaches 1, or a falling one 0, which wide gamuts such as
+  // ProPhoto RGB can reach above the cusp
+  vec3 u = c1_ / (c1_ * c1_ - 0.5 * c_ * c2_);
+  vec3 steps = mix(vec3(FLOAT_MAX), -c_ * u, greaterThanEqual(u, vec3(0.0)));
+  vec3 v_ = c_ + 1.0;
+  vec3 u0 = c1_ / (c1_ * c1_ - 0.5 * v_ * c2_);
+  steps = min(steps, mix(vec3(FLOAT_MAX), -v_ * u0, lessThanEqual(u0, vec3(0.0))));
+  return t + min(steps.x, min(steps.y, steps.z));
+}
+
+vec3 gamutMapOKLCH(vec3 oklch, OKGamut gamut) {
+  // Maps the OKLCH color towards the cusp lightness of its hue (MapToCuspL) until it lies
+  // within the gamut, returning the clipped linear RGB of the gamut
+  vec3 lch = vec3(clamp(oklch.x, 0.0, 1.0), max(oklch.y, 0.0), oklch.z);
+  vec3 rgb = OKLab_to(OKLCH_to_OKLab(lch), gamut.LMS_to_RGB);
+
+  if (any(lessThan(rgb, vec3(0.0))) || any(greaterThan(rgb, vec3(1.0)))) {
+    float h = radians(lch.z);
+    float a = cos(h);
+    float b = sin(h);
+    vec2 cusp = findCuspOKLCH(a, b, gamut);
+    float LTarget = cusp.x;
+    float t = findGamutIntersectionOKLCH(a, b, lch.x, lch.y, LTarget, cusp, gamut);
+    float L = mix(LTarget, lch.x, t);
+    float C = lch.y * t;
+    rgb = OKLab_to(vec3(L, C * a, C * b), gamut.LMS_to_RGB);
+  }
+  return clamp(rgb, 0.0, 1.0);
+}
@@ -0,0 +1,208 @@
+// Conversions and OKLCH gamut mapping, ported from src/core.js, src/gamut.js and src/spaces.
+// Include it before your own code. Matrices are column-major (as WGSL expects), so they are
+// applied as `M * v`.
+
+struct OKGamut {
+  // LMS to the gamut's linear RGB
+  LMS_to_RGB: mat3x3<f32>,
+  // directions used to select the channel that goes below zero first
+  dirR: vec2<f32>,
+  dirG: vec2<f32>,
+  // the first four coefficients of the max saturation polynomial of each channel,
+  // and the fifth coefficient of each channel
+  kR: vec4<f32>,
+  kG: vec4<f32>,
+  kB: vec4<f32>,
+  k4: vec3<f32>,
+}
+
+const FLOAT_MAX: f32 = 3.4028234663852886e38;
+
+// based on colorjs.io, could perhaps use a more specific number than this
+const ACHROMATIC_EPSILON: f32 = 4e-6;
+
+// @constants
+
+fn cbrt(x: f32) -> f32 {
+  return sign(x) * pow(abs(x), 1.0 / 3.0);
+}
+
+fn cbrt3(x: vec3<f32>) -> vec3<f32> {
+  return sign(x) * pow(abs(x), vec3<f32>(1.0 / 3.0));
+}
+
+// OKLab
+
+fn OKLab_to(OKLab: vec3<f32>, LMS_to_output: mat3x3<f32>) -> vec3<f32> {
+  let lms = OKLab_to_LMS_M * OKLab;
+  return LMS_to_output * (lms * lms * lms);
+}
+
+fn OKLab_from(color: vec3<f32>, input_to_LMS: mat3x3<f32>) -> vec3<f32> {
+  return LMS_to_OKLab_M * cbrt3(input_to_LMS * color);
+}
+
+fn OKLCH_to_OKLab(oklch: vec3<f32>) -> vec3<f32> {
+  let h = radians(oklch.z);
+  return vec3<f32>(oklch.x, oklch.y * cos(h), oklch.y * sin(h));
+}
+
+fn OKLab_to_OKLCH(oklab: vec3<f32>) -> vec3<f32> {
+  if (abs(oklab.y) < ACHROMATIC_EPSILON && abs(oklab.z) < ACHROMATIC_EPSILON) {
+    return vec3<f32>(oklab.x, 0.0, 0.0);
+  }
+  let hue = degrees(atan2(oklab.z, oklab.y));
+  return vec3<f32>(oklab.x, length(oklab.yz), select(hue, hue + 360.0, hue < 0.0));
+}
+
+// Transfer functions, the sRGB ones are also used by Display P3
+
+fn sRGBGammaToLinear(v: vec3<f32>) -> vec3<f32> {
+  let a = abs(v);
+  return select(v / 12.92, sign(v) * pow((a + 0.055) / 1.055, vec3<f32>(2.4)), a > vec3<f32>(0.04045));
+}
+
+fn sRGBLinearToGamma(v: vec3<f32>) -> vec3<f32> {
+  let a = abs(v);
+  return select(12.92 * v, sign(v) * (1.055 * pow(a, vec3<f32>(1.0 / 2.4)) - 0.055), a > vec3<f32>(0.0031308));
+}
+
+const REC2020_ALPHA: f32 = 1.09929682680944;
+const REC2020_BETA: f32 = 0.018053968510807;
+
+fn Rec2020ToLinear(v: vec3<f32>) -> vec3<f32> {
+  let power = pow((max(v, vec3<f32>(REC2020_BETA * 4.5)) + REC2020_ALPHA - 1.0) / REC2020_ALPHA, vec3<f32>(1.0 / 0.45));
+  return select(v / 4.5, power, v >= vec3<f32>(REC2020_BETA * 4.5));
+}
+
+fn Rec2020ToGamma(v: vec3<f32>) -> vec3<f32> {
+  let power = REC2020_ALPHA * pow(max(v, vec3<f32>(REC2020_BETA)), vec3<f32>(0.45)) - (REC2020_ALPHA - 1.0);
+  return select(4.5 * v, power, v >= vec3<f32>(REC2020_BETA));
+}
+
+fn A98RGBToLinear(v: vec3<f32>) -> vec3<f32> {
+  return sign(v) * pow(abs(v), vec3<f32>(563.0 / 256.0));
+}
+
+fn A98RGBToGamma(v: vec3<f32>) -> vec3<f32> {
+  return sign(v) * pow(abs(v), vec3<f32>(256.0 / 563.0));
+}
+
+const PROPHOTO_ET: f32 = 1.0 / 512.0;
+const PROPHOTO_ET2: f32 = 16.0 / 512.0;
+
+fn ProPhotoRGBToLinear(v: vec3<f32>) -> vec3<f32> {
+  return select(v / 16.0, pow(max(v, vec3<f32>(PROPHOTO_ET2)), vec3<f32>(1.8)), v >= vec3<f32>(PROPHOTO_ET2));
+}
+
+fn ProPhotoRGBToGamma(v: vec3<f32>) -> vec3<f32> {
+  return select(16.0 * v, pow(max(v, vec3<f32>(PROPHOTO_ET)), vec3<f32>(1.0 / 1.8)), v >= vec3<f32>(PROPHOTO_ET));
+}
+
+// Gamut approximation and mapping, hues are given as normalized a, b (a^2 + b^2 == 1)
+
+fn computeMaxSaturationOKLC(a: f32, b: f32, gamut: OKGamut) -> f32 {
+  // select the coefficients and LMS to RGB row of the component that goes below zero first
+  let m = gamut.LMS_to_RGB;
+  var k: vec4<f32>;
+  var k4: f32;
+  var w: vec3<f32>;
+  if (dot(gamut.dirR, vec2<f32>(a, b)) > 1.0) {
+    k = gamut.kR;
+    k4 = gamut.k4.x;
+    w = vec3<f32>(m[0][0], m[1][0], m[2][0]);
+  } else if (dot(gamut.dirG, vec2<f32>(a, b)) > 1.0) {
+    k = gamut.kG;
+    k4 = gamut.k4.y;
+    w = vec3<f32>(m[0][1], m[1][1], m[2][1]);
+  } else {
+    k = gamut.kB;
+    k4 = gamut.k4.z;
+    w = vec3<f32>(m[0][2], m[1][2], m[2][2]);
+  }
+
+  // approximate max saturation using a polynomial
+  let sat = k.x + k.y * a + k.z * b + k.w * (a * a) + k4 * a * b;
+
+  // then one step of Halley's method to get closer
+  let kLMS = OKLab_to_LMS_M * vec3<f32>(0.0, a, b);
+  let lms_ = 1.0 + sat * kLMS;
+  let lms = lms_ * lms_ * lms_;
+  let lmsdS = 3.0 * kLMS * lms_ * lms_;
+  let lmsdS2 = 6.0 * kLMS * kLMS * lms_;
+
+  let f = dot(w, lms);
+  let f1 = dot(w, lmsdS);
+  let f2 = dot(w, lmsdS2);
+  return sat - (f * f1) / (f1 * f1 - 0.5 * f * f2);
+}
+
+fn findCuspOKLCH(a: f32, b: f32, gamut: OKGamut) -> vec2<f32> {
+  // first, find the maximum saturation
+  let S_cusp = computeMaxSaturationOKLC(a, b, gamut);
+
+  // convert to linear RGB to find the first point where at least one of r, g or b >= 1
+  let rgb_at_max = OKLab_to(vec3<f32>(1.0, S_cusp * a, S_cusp * b), gamut.LMS_to_RGB);
+  let L_cusp = cbrt(1.0 / max(max(rgb_at_max.r, rgb_at_max.g), rgb_at_max.b));
+  return vec2<f32>(L_cusp, L_cusp * S_cusp);
+}
+
+fn findGamutIntersectionOKLCH(a: f32, b: f32, l1: f32, c1: f32, l0: f32, cusp: vec2<f32>, gamut: OKGamut) -> f32 {
+  // Finds the intersection t of the line L = L0 * (1 - t) + t * L1, C = t * C1 with the gamut
+  if ((l1 - l0) * cusp.y - (cusp.x - l0) * c1 <= 0.0) {
+    // lower half
+    let denom = c1 * cusp.x + cusp.y * (l0 - l1);
+    return select((cusp.y * l0) / denom, 0.0, denom == 0.0);
+  }
+
+  // upper half, first intersect with triangle
+  let denom = c1 * (cusp.x - 1.0) + cusp.y * (l0 - l1);
+  let t = select((cusp.y * (l0 - 1.0)) / denom, 0.0, denom == 0.0);
+
+  // then one step Halley's method
+  let kLMS = OKLab_to_LMS_M * vec3<f32>(0.0, a, b);
+  let lmsdt_ = (l1 - l0) + c1 * kLMS;
+
+  let L = l0 * (1.0 - t) + t * l1;
+  let C = t * c1;
+
+  let lms_ = L + C * kLMS;
+  let lms = lms_ * lms_ * lms_;
+  let lmsdt = 3.0 * lmsdt_ * lms_ * lms_;
+  let lmsdt2 = 6.0 * lmsdt_ * lmsdt_ * lms_;
+
+  let c_ = gamut.LMS_to_RGB * lms - 1.0;
+  let c1_ = gamut.LMS_to_RGB * lmsdt;
+  let c2_ = gamut.LMS_to_RGB * lmsdt2;
+
+  // the step to where a rising channel reaches 1, or a falling one 0, which wide gamuts such as
+  // ProPhoto RGB can reach above the cusp
+  let u = c1_ / (c1_ * c1_ - 0.5 * c_ * c2_);
+  let v_ = c_ + 1.0;
+  let u0 = c1_ / (c1_ * c1_ - 0.5 * v_ * c2_);
+  let steps = min(
+    select(vec3<f32>(FLOAT_MAX), -c_ * u, u >= vec3<f32>(0.0)),
+    select(vec3<f32>(FLOAT_MAX), -v_ * u0, u0 <= vec3<f32>(0.0))
+  );
+  return t + min(steps.x, min(steps.y, steps.z));
+}
+
+fn gamutMapOKLCH(oklch: vec3<f32>, gamut: OKGamut) -> vec3<f32> {
+  // Maps the OKLCH color towards the cusp lightness of its hue (MapToCuspL) until it lies
+  // within the gamut, returning the clipped linear RGB of the gamut
+  let lch = vec3<f32>(clamp(oklch.x, 0.0, 1.0), max(oklch.y, 0.0), oklch.z);
+  var rgb = OKLab_to(OKLCH_to_OKLab(lch), gamut.LMS_to_RGB);
+
+  if (any(rgb < vec3<f32>(0.0)) || any(rgb > vec3<f32>(1.0))) {
+    let h = radians(lch.z);
+    let a = cos(h);
+    let b = sin(h);
+    let cusp = findCuspOKLCH(a, b, gamut);
+    let LTarget = cusp.x;
+    let t = findGamutIntersectionOKLCH(a, b, lch.x, lch.y, LTarget, cusp, gamut);
+    let L = mix(LTarget, lch.x, t);
+    let C = lch.y * t;
+    rgb = OKLab_to(vec3<f32>(L, C * a, C * b), gamut.LMS_to_RGB);
+  }
+  return clamp(rgb, vec3<f32>(0.0), vec3<f32>(1.0));
+}
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+"""
+Sweeps the OKLab gamut approximation over dense (L, C, H) grids to find how far gamut mapped
+colors can still lie outside of their gamut, which is what RGB_CLIP_EPSILON in src/gamut.js
+trades off. This replaces the scalar test/check-gamut-epsilon.js, whose 0.5 degree hue steps
+miss narrow problem areas such as the sRGB blue hues around 264 degrees.
+
+Run from the repository root:
+
+  python3 tools/sweep_gamut_epsilon.py [--hues N] [--lightness N] [--chroma N] [--mapping NAME] [--jobs N]
+
+Every gamut with coefficients is sampled at N hues evenly spaced from 0 to 360 degrees, with
+a lightness by chroma grid in each hue plane (chroma up to --max-chroma). Colors outside the
+gamut are mapped with each mapping strategy (MapToCuspL, MapToL, etc) without the final clip,
+as gamutMapOKLCH does, and the distance of the mapped linear RGB from the 0..1 cube (the largest
+channel overshoot) is measured. The grid is split by hue into shards that are spread across a
+pool of processes.
+
+For each gamut and strategy the worst offenders, a histogram of the clip deltas and a
+recommended epsilon are printed: the smallest round value covering every mapped color, along
+with how many of the unmapped out of gamut colors it would let skip mapping. A table of the
+largest delta of every gamut and strategy ends the report.
+"""
+
+import argparse
+import concurrent.futures
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.getcwd())
+
+from tools.texel_color import OKLab_to, findCuspOKLCH, findGamutIntersectionOKLCH, getGamutLMStoRGB, listColorGamuts # noqa: E402
+from tools.texel_color import MapToL, MapToGray, MapToCuspL, MapToAdaptiveGray, MapToAdaptiveCuspL # noqa: E402
+from tools.texel_color.util import stack3 # noqa: E402
+
+# histogram bins of log10(delta), deltas of exactly zero are counted separately
+HISTOGRAM_EDGES = np.arange(-17, 0.5, 1.0)
+
+# the epsilons that can be recommended, 1, 2 and 5 times every power of ten
+CANDIDATE_EPSILONS = np.array([step * 10.0 ** exponent for exponent in range(-17, 1) for step in [1, 2, 5]])
+
+# number of worst offenders kept per shard, and printed per gamut
+WORST_COUNT = 10
+
+# the mapping strategies, by name so that shards can be sent to other processes
+MAPPINGS = { mapping.__name__: mapping for mapping in [MapToCuspL, MapToL, MapToGray, MapToAdaptiveGray, MapToAdaptiveCuspL] }
+
+# approximate number of grid points evaluated per shard, which bounds the memory of each worker
+SHARD_POINTS = 1 << 21
+
+def get_gamut(gamut_id):
+  return next(gamut for gamut in listColorGamuts() if gamut['space']['id'] == gamut_id)
+
+def clip_delta(rgb):
+  # the largest distance of any channel from the 0..1 range
+  return np.max(np.maximum(-rgb, rgb - 1), axis=-1).clip(0)
+
+def sweep_shard(gamut_id, mapping, hues, lightness, chroma):
+  # Maps every out of gamut (L, C, H) of the grid with the named strategy and summarizes the clip deltas
+  gamut = get_gamut(gamut_id)
+  lmsToRgb = getGamutLMStoRGB(gamut)
+
+  # every hue plane is the same lightness by chroma grid, so everything but the mapping is done per hue
+  plane = len(lightness) * len(chroma)
+  (L, C) = [x.ravel() for x in np.meshgrid(lightness, chroma, indexing='ij')]
+  (L, C) = (np.tile(L, len(hues)), np.tile(C, len(hues)))
+  hueAngle = np.radians(hues)
+  (aHue, bHue) = (np.cos(hueAngle), np.sin(hueAngle))
+  (aNorm, bNorm) = (np.repeat(aHue, plane), np.repeat(bHue, plane))
+
+  rgb = OKLab_to(stack3(L, C * aNorm, C * bNorm), lmsToRgb)
+  before = clip_delta(rgb)
+  outside = before > 0
+
+  # the cusp only depends on the hue, so it is found once per hue of the shard
+  cusps = np.repeat(findCuspOKLCH(aHue, bHue, gamut), plane, axis=0)[outside]
+
+  (L, C, aNorm, bNorm) = (L[outside], C[outside], aNorm[outside], bNorm[outside])
+  LTarget = MAPPINGS[mapping](stack3(L, C, np.zeros_like(L)), cusps)
+  t = findGamutIntersectionOKLCH(aNorm, bNorm, L, C, LTarget, cusps, gamut)
+  mappedL = LTarget * (1 - t) + L * t
+  mappedC = C * t
+  delta = clip_delta(OKLab_to(stack3(mappedL, mappedC * aNorm, mappedC * bNorm), lmsToRgb))
+
+  # the worst point of each of the worst hues, as many points of a hue map to the same color
+  grid = np.zeros(len(outside))
+  grid[outside] = np.where(np.isfinite(delta), delta, np.inf)
+  grid = grid.reshape(len(hues), plane)
+  worst_in_hue = np.argmax(grid, axis=1)
+  worst_of_hue = grid[np.arange(len(hues)), worst_in_hue]
+  worst = np.argsort(worst_of_hue)[::-1][:WORST_COUNT]
+  (L_grid, C_grid) = [x.ravel() for x in np.meshgrid(lightness, chroma, indexing='ij')]
+
+  nonzero = delta[delta > 0]
+  return {
+    'points': len(before),
+    'outside': len(delta),
+    'zero': len(delta) - len(nonzero),
+    'non_finite': int(np.count_nonzero(~np.isfinite(delta))),
+    'sum': float(np.sum(delta[np.isfinite(delta)])),
+    'max': float(np.max(delta[np.isfinite(delta)], initial=0)),
+    'histogram': np.histogram(np.log10(nonzero[np.isfinite(nonzero)]), HISTOGRAM_EDGES)[0],
+    # how many of the out of gamut colors each candidate epsilon would let skip mapping
+    'skipped': np.searchsorted(np.sort(before[outside]), CANDIDATE_EPSILONS, side='right'),
+    'worst': [(float(worst_of_hue[i]), float(L_grid[worst_in_hue[i]]), float(C_grid[worst_in_hue[i]]), float(hues[i])) for i in worst],
+  }
+
+def merge_shards(shards):
+  merged = {
+    'points': sum(shard['points'] for shard in shards),
+    'outside': sum(shard['outside'] for shard in shards),
+    'zero': sum(shard['zero'] for shard in shards),
+    'non_finite': sum(shard['non_finite'] for shard in shards),
+    'sum': sum(shard['sum'] for shard in shards),
+    'max': max(shard['max'] for shard in shards),
+    'histogram': np.sum([shard['histogram'] for shard in shards], axis=0),
+    'skipped': np.sum([shard['skipped'] for shard in shards], axis=0),
+    'worst': sorted((w for shard in shards for w in shard['worst']), key=lambda w: -w[0])[:WORST_COUNT],
+  }
+  return merged
+
+def recommend_epsilon(max_delta):
+  # the index of the smallest candidate epsilon that is at least max_delta
+  return min(np.searchsorted(CANDIDATE_EPSILONS, max_delta), len(CANDIDATE_EPSILONS) - 1)
+
+def sweep_gamut(gamut_id, mapping, args, pool):
+  hues = np.arange(args.hues) * (360 / args.hues)
+  lightness = np.linspace(0, 1, args.lightness)
+  chroma = np.linspace(0, args.max_chroma, args.chroma)
+
+  hues_per_shard = max(1, SHARD_POINTS // (len(lightness) * len(chroma)))
+  blocks = [hues[i:i + hues_per_shard] for i in range(0, len(hues), hues_per_shard)]
+  if pool is None:
+    shards = [sweep_shard(gamut_id, mapping, block, lightness, chroma) for block in blocks]
+  else:
+    count = len(blocks)
+    shards = list(pool.map(sweep_shard, [gamut_id] * count, [mapping] * count, blocks, [lightness] * count, [chroma] * count))
+  return merge_shards(shards)
+
+def print_report(gamut_id, mapping, result, elapsed):
+  outside = result['outside']
+  print(f'{gamut_id} {mapping}: {result["points"]:,} points in {elapsed:.1f}s ({result["points"] / elapsed / 1e6:.1f}M/s), {outside:,} out of gamut')
+  if outside == 0:
+    return
+
+  mean = result['sum'] / (outside - result['non_finite'])
+  print(f'  clip delta after mapping: max {result["max"]:.3e}, mean {mean:.3e}, exactly in gamut {result["zero"] / outside:.2%}')
+  if result['non_finite'] > 0:
+    print(f'  {result["non_finite"]:,} mapped colors are not finite')
+
+  print('  histogram of clip deltas after mapping:')
+  print(f'    {"0":>17}   {result["zero"]:>13,}')
+  for (i, count) in enumerate(result['histogram']):
+    if count > 0:
+      print(f'    {f"1e{HISTOGRAM_EDGES[i]:.0f} .. 1e{HISTOGRAM_EDGES[i + 1]:.0f}":>17}   {count:>13,}')
+
+  print('  worst hues, with the (L, C) of their largest delta:')
+  for (delta, L, C, H) in result['worst']:
+    print(f'    {delta:.3e}   L {L:.6f}   C {C:.6f}   H {H:.4f}')
+
+  i = recommend_epsilon(result['max'])
+  (epsilon, skipped) = (CANDIDATE_EPSILONS[i], result['skipped'][i])
+  print(f'  recommended epsilon: {epsilon:g}, covers every mapped color and lets {skipped:,} ({skipped / outside:.4%}) of the unmapped out of gamut colors skip mapping')
+
+def main(argv = None):
+  parser = argparse.ArgumentParser(description='Sweeps the gamut mapping approximation for how far mapped colors lie outside the gamut.')
+  parser.add_argument('--hues', type=int, default=36000, help='number of hues from 0 to 360 degrees (default: 36000, 0.01 degree steps)')
+  parser.add_argument('--lightness', type=int, default=100, help='number of lightness steps from 0 to 1 (default: 100)')
+  parser.add_argument('--chroma', type=int, default=100, help='number of chroma steps from 0 to --max-chroma (default: 100)')
+  parser.add_argument('--max-chroma', type=float, default=0.4, help='largest chroma sampled (default: 0.4)')
+  parser.add_argument('--gamut', action='append', help='id of a gamut space to sweep, may be repeated (default: every gamut)')
+  parser.add_argument('--mapping', action='append', choices=list(MAPPINGS), help='mapping strategy to sweep, may be repeated (default: every strategy)')
+  parser.add_argument('--jobs', '-j', type=int, default=0, help='number of processes, 0 uses all cores (default: 0)')
+  args = parser.parse_args(argv)
+
+  gamut_ids = args.gamut or [gamut['space']['id'] for gamut in listColorGamuts()]
+  mappings = args.mapping or list(MAPPINGS)
+  jobs = args.jobs if args.jobs > 0 else os.cpu_count()
+  pool = concurrent.futures.ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+  try:
+    summary = []
+    for gamut_id in gamut_ids:
+      for mapping in mappings:
+        start = time.perf_counter()
+        result = sweep_gamut(gamut_id, mapping, args, pool)
+        print_report(gamut_id, mapping, result, time.perf_counter() - start)
+        summary.append((gamut_id, mapping, result['max']))
+    print('largest clip delta after mapping:')
+    for (gamut_id, mapping, max_delta) in summary:
+      print(f'  {gamut_id:<14} {mapping:<20} {max_delta:.3e}')
+  finally:
+    if pool is not None:
+      pool.shutdown()
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,32 @@
+"""
+A vectorized NumPy mirror of the conversions in src/, for batch conversion and for
+cross-checking the JS output offline. Import it from the repository root:
+
+  import numpy as np
+  from tools.texel_color import convert, OKLCH, sRGB
+
+  rgb = convert(np.array([[0.5, 0.15, 30]]), OKLCH, sRGB)
+
+Coordinates are (..., 3) arrays and every function works on whole arrays at once, so
+millions of colors can be converted per call. Spaces and gamuts are dicts with the same
+keys as the JS objects, built on the matrices in conversion_matrices.py, which is generated
+by `python3 tools/print_matrices.py --format py` from the same data as src/conversion_matrices.js.
+"""
+
+from .core import convert, transform, OKLab_to, OKLab_from, deltaEOK
+from .spaces import (
+  XYZ, XYZD50, OKLab, OKLCH, OKHSV, OKHSL,
+  sRGB, sRGBLinear, sRGBGamut,
+  DisplayP3, DisplayP3Linear, DisplayP3Gamut,
+  Rec2020, Rec2020Linear, Rec2020Gamut,
+  A98RGB, A98RGBLinear, A98RGBGamut,
+  ProPhotoRGB, ProPhotoRGBLinear, ProPhotoRGBGamut,
+  D65_to_D50_M, D50_to_D65_M,
+  listColorSpaces, listColorGamuts,
+)
+from .gamut import (
+  computeMaxSaturationOKLC, findCuspOKLCH, findGamutIntersectionOKLCH, getGamutLMStoRGB, gamutMapOKLCH,
+  MapToL, MapToGray, MapToCuspL, MapToAdaptiveGray, MapToAdaptiveCuspL,
+)
+from .okhsl import OKHSLToOKLab, OKLabToOKHSL, OKHSVToOKLab, OKLabToOKHSV
+from .palette import createPaletteIndex, findNearestInPalette, findKNearestInPalette
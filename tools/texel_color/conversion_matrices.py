@@ -0,0 +1,1183 @@
+"""This file is auto-generated by tools/print_matrices.py"""
+
+# OKLab to LMS matrices
+
+OKLab_to_LMS_M = [
+  [
+    1.0,
+    0.3963377773761749,
+    0.2158037573099136
+  ],
+  [
+    1.0,
+    -0.1055613458156586,
+    -0.0638541728258133
+  ],
+  [
+    1.0,
+    -0.0894841775298119,
+    -1.2914855480194092
+  ]
+]
+
+LMS_to_OKLab_M = [
+  [
+    0.210454268309314,
+    0.7936177747023054,
+    -0.0040720430116193
+  ],
+  [
+    1.9779985324311684,
+    -2.42859224204858,
+    0.450593709617411
+  ],
+  [
+    0.0259040424655478,
+    0.7827717124575296,
+    -0.8086757549230774
+  ]
+]
+
+XYZ_to_LMS_M = [
+  [
+    0.819022437996703,
+    0.3619062600528904,
+    -0.1288737815209879
+  ],
+  [
+    0.0329836539323885,
+    0.9292868615863434,
+    0.0361446663506424
+  ],
+  [
+    0.0481771893596242,
+    0.2642395317527308,
+    0.6335478284694309
+  ]
+]
+
+LMS_to_XYZ_M = [
+  [
+    1.2268798758459243,
+    -0.5578149944602171,
+    0.2813910456659647
+  ],
+  [
+    -0.0405757452148008,
+    1.112286803280317,
+    -0.0717110580655164
+  ],
+  [
+    -0.0763729366746601,
+    -0.4214933324022432,
+    1.5869240198367816
+  ]
+]
+
+# Bradford chromatic adaptation between XYZ D65 and D50
+
+D65_to_D50_M = [
+  [
+    1.0479297925449969,
+    0.022946870601609652,
+    -0.05019226628920524
+  ],
+  [
+    0.02962780877005599,
+    0.9904344267538799,
+    -0.017073799063418826
+  ],
+  [
+    -0.009243040646204504,
+    0.015055191490298152,
+    0.7518742814281371
+  ]
+]
+
+D50_to_D65_M = [
+  [
+    0.955473421488075,
+    -0.02309845494876471,
+    0.06325924320057072
+  ],
+  [
+    -0.0283697093338637,
+    1.0099953980813041,
+    0.021041441191917323
+  ],
+  [
+    0.012314014864481998,
+    -0.020507649298898964,
+    1.330365926242124
+  ]
+]
+
+# linear_sRGB space
+
+# linear_sRGB to XYZ (D65) matrices
+
+linear_sRGB_to_XYZ_M = [[0.4123907992659595, 0.35758433938387796, 0.1804807884018343], [0.21263900587151036, 0.7151686787677559, 0.07219231536073371], [0.01933081871559185, 0.11919477979462599, 0.9505321522496606]]
+
+XYZ_to_linear_sRGB_M = [[3.2409699419045213, -1.5373831775700935, -0.4986107602930033], [-0.9692436362808798, 1.8759675015077206, 0.04155505740717561], [0.05563007969699361, -0.20397695888897657, 1.0569715142428786]]
+
+# linear_sRGB to LMS matrices
+
+linear_sRGB_to_LMS_M = [
+  [
+    0.4122214694707629,
+    0.5363325372617349,
+    0.051445993267502196
+  ],
+  [
+    0.2119034958178251,
+    0.6806995506452345,
+    0.10739695353694051
+  ],
+  [
+    0.08830245919005637,
+    0.2817188391361215,
+    0.6299787016738223
+  ]
+]
+
+LMS_to_linear_sRGB_M = [
+  [
+    4.076741636075959,
+    -3.307711539258062,
+    0.2309699031821041
+  ],
+  [
+    -1.2684379732850313,
+    2.6097573492876878,
+    -0.3413193760026569
+  ],
+  [
+    -0.004196076138675526,
+    -0.703418617935936,
+    1.7076146940746113
+  ]
+]
+
+# linear_sRGB coefficients for OKLab gamut approximation
+
+OKLab_to_linear_sRGB_coefficients = [
+  [
+    [
+      -1.881703099326589,
+      -0.8093650129914314
+    ],
+    [
+      2.9891157406060245,
+      4.96334598553074,
+      2.206639458668394,
+      2.1032506646275313,
+      2.4558850066611626
+    ]
+  ],
+  [
+    [
+      1.8144407988010973,
+      -1.1944526678052334
+    ],
+    [
+      0.7554589746731846,
+      -0.4878927163778485,
+      0.09919949472127884,
+      0.13824256155269649,
+      -0.1663740069568356
+    ]
+  ],
+  [
+    [
+      0.13110757611181065,
+      1.8133397092666077
+    ],
+    [
+      1.4013440255372653,
+      -0.014161344368060245,
+      -1.194898981054734,
+      -0.531950504704548,
+      0.013140382333963183
+    ]
+  ]
+]
+
+# linear_sRGB max and mean error of the approximated max saturation per channel
+
+OKLab_to_linear_sRGB_coefficients_error = {
+  "steps": 1,
+  "max": [
+    0.00128,
+    0.105,
+    7.38e-08
+  ],
+  "mean": [
+    2.18e-05,
+    0.000109,
+    1.15e-08
+  ]
+}
+
+# linear_sRGB S_mid and T_mid polynomials of OKHSL
+
+OKLab_to_linear_sRGB_st_mid_coefficients = [
+  [
+    0.11516993,
+    7.4477897,
+    4.1590124,
+    -2.19557347,
+    1.75198401,
+    -2.13704948,
+    -10.02301043,
+    -4.24894561,
+    5.38770819,
+    4.69891013
+  ],
+  [
+    0.11239642,
+    1.6132032,
+    -0.68124379,
+    0.40370612,
+    0.90148123,
+    -0.27087943,
+    0.6122399,
+    0.00299215,
+    -0.45399568,
+    -0.14661872
+  ]
+]
+
+# linear_DisplayP3 space
+
+# linear_DisplayP3 to XYZ (D65) matrices
+
+linear_DisplayP3_to_XYZ_M = [[0.48657094864821626, 0.26566769316909294, 0.1982172852343625], [0.22897456406974884, 0.6917385218365062, 0.079286914093745], [0.0, 0.045113381858902575, 1.0439443689009757]]
+
+XYZ_to_linear_DisplayP3_M = [[2.4934969119414245, -0.9313836179191236, -0.40271078445071684], [-0.829488969561575, 1.7626640603183468, 0.02362468584194359], [0.035845830243784335, -0.07617238926804171, 0.9568845240076873]]
+
+# linear_DisplayP3 to LMS matrices
+
+linear_DisplayP3_to_LMS_M = [
+  [
+    0.48137985274995443,
+    0.4621183710113181,
+    0.05650177623872757
+  ],
+  [
+    0.22883194181124475,
+    0.6532168193835676,
+    0.11795123880518778
+  ],
+  [
+    0.08394575232299319,
+    0.22416527097756642,
+    0.6918889766994405
+  ]
+]
+
+LMS_to_linear_DisplayP3_M = [
+  [
+    3.1277689713618737,
+    -2.2571357625916395,
+    0.1293667912297651
+  ],
+  [
+    -1.091009018437798,
+    2.413331710306923,
+    -0.3223226918691248
+  ],
+  [
+    -0.02601080193857041,
+    -0.5080413317041669,
+    1.5340521336427373
+  ]
+]
+
+# linear_DisplayP3 coefficients for OKLab gamut approximation
+
+OKLab_to_linear_DisplayP3_coefficients = [
+  [
+    [
+      -1.7723439275129804,
+      -0.8207587433674068
+    ],
+    [
+      3.0655383776740712,
+      4.850774766861289,
+      2.170391228588169,
+      1.9889988629068966,
+      2.318674112913799
+    ]
+  ],
+  [
+    [
+      1.8031987175305477,
+      -1.1932813966558917
+    ],
+    [
+      0.785986991117241,
+      -0.48301887731220305,
+      0.1269537528410884,
+      0.15434100134244236,
+      -0.18801574739070043
+    ]
+  ],
+  [
+    [
+      0.08970487824467606,
+      1.9032774657416118
+    ],
+    [
+      1.5634048474400246,
+      -0.03752356642820185,
+      -1.325410878723415,
+      -0.582197351108397,
+      0.033280197615848106
+    ]
+  ]
+]
+
+# linear_DisplayP3 max and mean error of the approximated max saturation per channel
+
+OKLab_to_linear_DisplayP3_coefficients_error = {
+  "steps": 1,
+  "max": [
+    0.000327,
+    5.97e-10,
+    7.52e-08
+  ],
+  "mean": [
+    1.01e-05,
+    1.9e-10,
+    1.22e-08
+  ]
+}
+
+# linear_DisplayP3 S_mid and T_mid polynomials of OKHSL
+
+OKLab_to_linear_DisplayP3_st_mid_coefficients = [
+  [
+    0.18631867003057767,
+    12.249797119791381,
+    9.876159949457232,
+    -1.9071658741540485,
+    0.28313447417463106,
+    -14.197370748255963,
+    -24.202966369306175,
+    -5.445873757878934,
+    14.212398439687545,
+    13.139742043484588
+  ],
+  [
+    0.4313664716771686,
+    3.571711810464822,
+    -2.69949278107272,
+    0.22809095409380015,
+    2.1464589600369166,
+    -3.335001753742928,
+    3.690081854023788,
+    0.4435204576664547,
+    -1.0938307937320577,
+    1.153318045096012
+  ]
+]
+
+# linear_Rec2020 space
+
+# linear_Rec2020 to XYZ (D65) matrices
+
+linear_Rec2020_to_XYZ_M = [[0.6369580483012913, 0.14461690358620838, 0.16888097516417205], [0.26270021201126703, 0.677998071518871, 0.059301716469861945], [0.0, 0.028072693049087508, 1.0609850577107909]]
+
+XYZ_to_linear_Rec2020_M = [[1.7166511879712676, -0.3556707837763924, -0.2533662813736598], [-0.666684351832489, 1.616481236634939, 0.01576854581391113], [0.017639857445310915, -0.042770613257808655, 0.942103121235474]]
+
+# linear_Rec2020 to LMS matrices
+
+linear_Rec2020_to_LMS_M = [
+  [
+    0.6167557848654444,
+    0.3601984012264634,
+    0.023045813908092266
+  ],
+  [
+    0.26513305939263676,
+    0.6358393720678492,
+    0.09902756853951414
+  ],
+  [
+    0.10010262952034828,
+    0.20390652261661452,
+    0.6959908478630372
+  ]
+]
+
+LMS_to_linear_Rec2020_M = [
+  [
+    2.1399067304346513,
+    -1.246389493760618,
+    0.10648276332596689
+  ],
+  [
+    -0.8847358357577675,
+    2.1632309383612007,
+    -0.27849510260343363
+  ],
+  [
+    -0.04857374640044396,
+    -0.45450314971409633,
+    1.5030768961145404
+  ]
+]
+
+# linear_Rec2020 coefficients for OKLab gamut approximation
+
+OKLab_to_linear_Rec2020_coefficients = [
+  [
+    [
+      -1.3683489920695084,
+      -0.4666477292401159
+    ],
+    [
+      6.453444279433296,
+      11.179759749877057,
+      3.7164025468775352,
+      5.086745856787387,
+      3.8846747338283327
+    ]
+  ],
+  [
+    [
+      2.01150796193428,
+      -2.0379095965347
+    ],
+    [
+      0.9864450167496069,
+      -0.6579210622753912,
+      0.28716974174265975,
+      0.2008454654526125,
+      -0.3607882951692005
+    ]
+  ],
+  [
+    [
+      0.06454093208719965,
+      2.2970933629671717
+    ],
+    [
+      1.7822722002966511,
+      -0.06902276996914065,
+      -1.53732053978465,
+      -0.7070147842646063,
+      0.06466835622466632
+    ]
+  ]
+]
+
+# linear_Rec2020 max and mean error of the approximated max saturation per channel
+
+OKLab_to_linear_Rec2020_coefficients_error = {
+  "steps": 1,
+  "max": [
+    0.000434,
+    0.122,
+    5.1e-07
+  ],
+  "mean": [
+    1.05e-05,
+    0.000157,
+    7.89e-08
+  ]
+}
+
+# linear_Rec2020 S_mid and T_mid polynomials of OKHSL
+
+OKLab_to_linear_Rec2020_st_mid_coefficients = [
+  [
+    0.17909348211564619,
+    9.185268708823825,
+    7.263929073720355,
+    0.7542540121836959,
+    -0.30166358055017506,
+    -12.478710037696803,
+    -10.227145139204097,
+    -1.9506149794853547,
+    3.340090255342907,
+    7.32561294665993
+  ],
+  [
+    0.45489779063616287,
+    3.4983718825787253,
+    -2.9761222107588594,
+    -0.2710664564820682,
+    1.6129610604145517,
+    -3.7766577630825315,
+    3.3132053952081555,
+    0.6071596421229773,
+    -1.0226922347649614,
+    1.1650429299755305
+  ]
+]
+
+# linear_A98RGB space
+
+# linear_A98RGB to XYZ (D65) matrices
+
+linear_A98RGB_to_XYZ_M = [[0.5766690429101308, 0.18555823790654627, 0.18822864623499472], [0.29734497525053616, 0.627363566255466, 0.07529145849399789], [0.027031361386412378, 0.07068885253582714, 0.9913375368376389]]
+
+XYZ_to_linear_A98RGB_M = [[2.041587903810746, -0.5650069742788596, -0.3447313507783295], [-0.9692436362808798, 1.8759675015077206, 0.04155505740717561], [0.013444280632031024, -0.11836239223101824, 1.0151749943912054]]
+
+# linear_A98RGB to LMS matrices
+
+linear_A98RGB_to_LMS_M = [
+  [
+    0.5764322596183941,
+    0.36991322261987963,
+    0.053654517761726306
+  ],
+  [
+    0.29631647054222465,
+    0.5916761332521886,
+    0.11200739620558692
+  ],
+  [
+    0.12347825101427762,
+    0.21949869837199862,
+    0.6570230506137239
+  ]
+]
+
+LMS_to_linear_A98RGB_M = [
+  [
+    2.554036838611556,
+    -1.6219761806828696,
+    0.06793934207131354
+  ],
+  [
+    -1.2684379732850315,
+    2.6097573492876887,
+    -0.3413193760026572
+  ],
+  [
+    -0.0562347359374939,
+    -0.5670418395669057,
+    1.6232765755043994
+  ]
+]
+
+# linear_A98RGB coefficients for OKLab gamut approximation
+
+OKLab_to_linear_A98RGB_coefficients = [
+  [
+    [
+      -1.5916954144257986,
+      -0.8395798483264382
+    ],
+    [
+      2.2691287826839255,
+      3.129830477854208,
+      1.4260941854190028,
+      1.1576635558342154,
+      1.3634535938496974
+    ]
+  ],
+  [
+    [
+      1.8144407988011027,
+      -1.1944526678052367
+    ],
+    [
+      0.7554590284841929,
+      -0.48789280880279834,
+      0.09919954907563015,
+      0.1382426077559837,
+      -0.16637407925498626
+    ]
+  ],
+  [
+    [
+      -0.01452942893408306,
+      2.073564997814518
+    ],
+    [
+      1.5501111549451418,
+      -0.054832423447136014,
+      -1.3311999906609997,
+      -0.6049437286547624,
+      0.05082235202381204
+    ]
+  ]
+]
+
+# linear_A98RGB max and mean error of the approximated max saturation per channel
+
+OKLab_to_linear_A98RGB_coefficients_error = {
+  "steps": 1,
+  "max": [
+    4.44e-06,
+    1.63e-09,
+    2.07e-07
+  ],
+  "mean": [
+    3.74e-07,
+    5.45e-10,
+    3.37e-08
+  ]
+}
+
+# linear_A98RGB S_mid and T_mid polynomials of OKHSL
+
+OKLab_to_linear_A98RGB_st_mid_coefficients = [
+  [
+    0.1515686746547232,
+    9.150092823697685,
+    6.801125622987231,
+    -0.5688666692547535,
+    0.582318104650019,
+    -9.28535875149209,
+    -11.305985567403232,
+    -0.8481425081995968,
+    4.1320262346837575,
+    5.541878128255541
+  ],
+  [
+    0.4341294947472853,
+    3.9047978857143595,
+    -3.18567605133167,
+    -0.09465274542037841,
+    1.8917300372905044,
+    -4.206841561891825,
+    3.870583605959765,
+    0.5031866624093495,
+    -1.1623104080868543,
+    1.4930406201163415
+  ]
+]
+
+# linear_ProPhotoRGB space
+
+# linear_ProPhotoRGB to XYZ (D50) matrices
+
+linear_ProPhotoRGB_to_XYZ_M = [
+  [
+    0.7977666449006423,
+    0.13518129740053308,
+    0.0313477341283922
+  ],
+  [
+    0.2880748288194013,
+    0.711835234241873,
+    8.993693872564e-05
+  ],
+  [
+    0.0,
+    0.0,
+    0.8251046025104602
+  ]
+]
+
+XYZ_to_linear_ProPhotoRGB_M = [
+  [
+    1.3457868816471583,
+    -0.25557208737979464,
+    -0.05110186497554526
+  ],
+  [
+    -0.5446307051249019,
+    1.5082477428451468,
+    0.02052744743642139
+  ],
+  [
+    0.0,
+    0.0,
+    1.2119675456389452
+  ]
+]
+
+# linear_ProPhotoRGB to LMS matrices
+
+linear_ProPhotoRGB_to_LMS_M = [
+  [
+    0.7154484605655532,
+    0.35279155007721175,
+    -0.06824001064276528
+  ],
+  [
+    0.27441164900156706,
+    0.6677976498412368,
+    0.05779070115719622
+  ],
+  [
+    0.10978443261622936,
+    0.18619829115002015,
+    0.7040172762337504
+  ]
+]
+
+LMS_to_linear_ProPhotoRGB_M = [
+  [
+    1.7383551481157213,
+    -0.9879509427514458,
+    0.24959579463572504
+  ],
+  [
+    -0.7070494015329266,
+    1.934370044440138,
+    -0.22732064290721157
+  ],
+  [
+    -0.08407882206239632,
+    -0.3575406052114133,
+    1.4416194272738097
+  ]
+]
+
+# linear_ProPhotoRGB coefficients for OKLab gamut approximation
+
+OKLab_to_linear_ProPhotoRGB_coefficients = [
+  [
+    [
+      -1.1186713796652372,
+      0.011574875053294414
+    ],
+    [
+      68.06787046924094,
+      140.6370870421406,
+      -1.5538024885635915,
+      73.17257587955058,
+      -1.4601712527859658
+    ]
+  ],
+  [
+    [
+      6.872475573760862,
+      -16.341134102486432
+    ],
+    [
+      3.2885956561375544,
+      -2.021035629437008,
+      2.506290147499387,
+      -0.8944297290019946,
+      -2.046210509675173
+    ]
+  ],
+  [
+    [
+      0.1680216312422894,
+      2.512073213160233
+    ],
+    [
+      1.938056700940937,
+      -0.1194121513288262,
+      -1.6801601786829106,
+      -0.7830309568631597,
+      0.11201603090337163
+    ]
+  ]
+]
+
+# linear_ProPhotoRGB max and mean error of the approximated max saturation per channel
+
+OKLab_to_linear_ProPhotoRGB_coefficients_error = {
+  "steps": 1,
+  "max": [
+    0.00686,
+    0.000386,
+    1.2e-06
+  ],
+  "mean": [
+    3.89e-05,
+    0.000103,
+    1.72e-07
+  ]
+}
+
+# linear_ProPhotoRGB S_mid and T_mid polynomials of OKHSL
+
+OKLab_to_linear_ProPhotoRGB_st_mid_coefficients = [
+  [
+    0.1785305095110763,
+    8.084578857471351,
+    6.051190500248492,
+    2.5025280672501897,
+    1.7268494561360013,
+    -11.887708026470936,
+    -5.8430451460247115,
+    -2.889198105645767,
+    -2.392139221632959,
+    6.460279078375118
+  ],
+  [
+    0.43407587687489363,
+    2.7363751530071863,
+    -2.4912583466100373,
+    -0.3145575420010778,
+    1.1160267233098429,
+    -2.5896467668440653,
+    2.467909273602559,
+    0.5445350394756019,
+    -0.7027660673972345,
+    0.5308300428262613
+  ]
+]
+
+# Linear RGB to linear RGB matrices, with chromatic adaptation folded in
+
+linear_sRGB_to_linear_DisplayP3_M = [
+  [
+    0.8224619687143623,
+    0.17753803128563772,
+    0.0
+  ],
+  [
+    0.03319419885096158,
+    0.9668058011490382,
+    -1.3877787807814457e-17
+  ],
+  [
+    0.017082630721120033,
+    0.07239744066396347,
+    0.9105199286149166
+  ]
+]
+
+linear_sRGB_to_linear_Rec2020_M = [
+  [
+    0.627403895934699,
+    0.3292830383778836,
+    0.043313065687417246
+  ],
+  [
+    0.06909728935823205,
+    0.9195403950754587,
+    0.011362315566309173
+  ],
+  [
+    0.01639143887515028,
+    0.08801330787722576,
+    0.895595253247624
+  ]
+]
+
+linear_sRGB_to_linear_A98RGB_M = [
+  [
+    0.7151256068556248,
+    0.2848743931443754,
+    5.551115123125783e-17
+  ],
+  [
+    -5.193328406205566e-17,
+    1.0,
+    -1.3877787807814457e-17
+  ],
+  [
+    -3.469446951953614e-18,
+    0.04116194845011846,
+    0.9588380515498816
+  ]
+]
+
+linear_sRGB_to_linear_ProPhotoRGB_M = [
+  [
+    0.5292769776226117,
+    0.330154501978493,
+    0.14056852039889559
+  ],
+  [
+    0.09836585954044925,
+    0.8734707129069617,
+    0.02816342755258901
+  ],
+  [
+    0.016875340921386848,
+    0.11765941425612084,
+    0.8654652448224923
+  ]
+]
+
+linear_DisplayP3_to_linear_sRGB_M = [
+  [
+    1.2249401762805596,
+    -0.22494017628055993,
+    0.0
+  ],
+  [
+    -0.04205695470968818,
+    1.0420569547096883,
+    -3.469446951953614e-17
+  ],
+  [
+    -0.019637554590334436,
+    -0.07863604555063189,
+    1.0982736001409663
+  ]
+]
+
+linear_DisplayP3_to_linear_Rec2020_M = [
+  [
+    0.7538330343617217,
+    0.19859736905261627,
+    0.047569596585661844
+  ],
+  [
+    0.045743848965358325,
+    0.9417772198116936,
+    0.01247893122294813
+  ],
+  [
+    -0.0012103403545183251,
+    0.017601717301089892,
+    0.9836086230534283
+  ]
+]
+
+linear_DisplayP3_to_linear_A98RGB_M = [
+  [
+    0.8640051374740483,
+    0.13599486252595158,
+    5.551115123125783e-17
+  ],
+  [
+    -0.04205695470968818,
+    1.0420569547096883,
+    -3.469446951953614e-17
+  ],
+  [
+    -0.02056038078232985,
+    -0.032506138045508,
+    1.0530665188278379
+  ]
+]
+
+linear_DisplayP3_to_linear_ProPhotoRGB_M = [
+  [
+    0.6316869193403591,
+    0.2139303856946574,
+    0.1543826949649839
+  ],
+  [
+    0.08320371426648465,
+    0.8858651367630241,
+    0.030931148970491238
+  ],
+  [
+    -0.001272734564738806,
+    0.05075510433665735,
+    0.9505176302280814
+  ]
+]
+
+linear_Rec2020_to_linear_sRGB_M = [
+  [
+    1.6604910021084343,
+    -0.5876411387885496,
+    -0.0728498633198848
+  ],
+  [
+    -0.12455047452159085,
+    1.1328998971259603,
+    -0.008349422604369473
+  ],
+  [
+    -0.018150763354905307,
+    -0.10057889800800737,
+    1.1187296613629127
+  ]
+]
+
+linear_Rec2020_to_linear_DisplayP3_M = [
+  [
+    1.343578252584332,
+    -0.28217967052613574,
+    -0.06139858205819637
+  ],
+  [
+    -0.06529745278911964,
+    1.0757879158485744,
+    -0.01049046305945497
+  ],
+  [
+    0.0028217872617009553,
+    -0.01959849452449406,
+    1.0167767072627931
+  ]
+]
+
+linear_Rec2020_to_linear_A98RGB_M = [
+  [
+    1.1519783947159163,
+    -0.09750305530240859,
+    -0.054475339413507684
+  ],
+  [
+    -0.12455047452159085,
+    1.1328998971259603,
+    -0.008349422604369473
+  ],
+  [
+    -0.022530382781055906,
+    -0.04980650742838877,
+    1.0723368902094446
+  ]
+]
+
+linear_Rec2020_to_linear_ProPhotoRGB_M = [
+  [
+    0.8351873331297236,
+    0.04886884858605711,
+    0.11594381828421954
+  ],
+  [
+    0.05403324519953381,
+    0.9289184085692044,
+    0.017048346231262015
+  ],
+  [
+    -0.0023420389707253897,
+    0.03633215316169466,
+    0.9660098858090307
+  ]
+]
+
+linear_A98RGB_to_linear_sRGB_M = [
+  [
+    1.3983557439607786,
+    -0.3983557439607784,
+    0.0
+  ],
+  [
+    -1.3856103764364747e-16,
+    0.9999999999999999,
+    1.3877787807814457e-17
+  ],
+  [
+    -6.938893903907228e-18,
+    -0.042928989294473266,
+    1.0429289892944733
+  ]
+]
+
+linear_A98RGB_to_linear_DisplayP3_M = [
+  [
+    1.1500944181410182,
+    -0.1500944181410184,
+    -1.1102230246251565e-16
+  ],
+  [
+    0.046417298629418395,
+    0.9535827013705814,
+    -6.938893903907228e-18
+  ],
+  [
+    0.023887594790839052,
+    0.02650477632633013,
+    0.9496076288828309
+  ]
+]
+
+linear_A98RGB_to_linear_Rec2020_M = [
+  [
+    0.8773338416636568,
+    0.07749370651571999,
+    0.04517245182062313
+  ],
+  [
+    0.09662259146620375,
+    0.8915273202441806,
+    0.011850088289615712
+  ],
+  [
+    0.022921062702848393,
+    0.04303668501067931,
+    0.9340422522864724
+  ]
+]
+
+linear_A98RGB_to_linear_ProPhotoRGB_M = [
+  [
+    0.7401175018047795,
+    0.11327951328898118,
+    0.1466029849062397
+  ],
+  [
+    0.1375504646980264,
+    0.8330770802694839,
+    0.029372455032489787
+  ],
+  [
+    0.023597729908717675,
+    0.07378347703906654,
+    0.9026187930522158
+  ]
+]
+
+linear_ProPhotoRGB_to_linear_sRGB_M = [
+  [
+    2.0343808495169955,
+    -0.7276357899341349,
+    -0.30674505958286163
+  ],
+  [
+    -0.2288257316330504,
+    1.231742541190105,
+    -0.002916809557054527
+  ],
+  [
+    -0.008558828783917418,
+    -0.15326670213803723,
+    1.1618255309219545
+  ]
+]
+
+linear_ProPhotoRGB_to_linear_DisplayP3_M = [
+  [
+    1.6325756087069174,
+    -0.3797716184825989,
+    -0.2528039902243193
+  ],
+  [
+    -0.1537004023375508,
+    1.1667025472425014,
+    -0.013002144904950858
+  ],
+  [
+    0.010393195296765738,
+    -0.0628073126495944,
+    1.0524141173528287
+  ]
+]
+
+linear_ProPhotoRGB_to_linear_Rec2020_M = [
+  [
+    1.2006593295174075,
+    -0.05756805370122375,
+    -0.1430912758161844
+  ],
+  [
+    -0.0699415495588851,
+    1.080617897597214,
+    -0.010676348038328974
+  ],
+  [
+    0.00554147334294747,
+    -0.04078219298657951,
+    1.035240719643632
+  ]
+]
+
+linear_ProPhotoRGB_to_linear_A98RGB_M = [
+  [
+    1.38965124815152,
+    -0.16945907691487802,
+    -0.22019217123664225
+  ],
+  [
+    -0.2288257316330504,
+    1.231742541190105,
+    -0.002916809557054527
+  ],
+  [
+    -0.017625443684260677,
+    -0.09625702306122665,
+    1.1138824667454872
+  ]
+]
+
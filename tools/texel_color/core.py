@@ -0,0 +1,116 @@
+import numpy as np
+
+from .util import transform
+from .conversion_matrices import LMS_to_OKLab_M, OKLab_to_LMS_M, LMS_to_XYZ_M, XYZ_to_LMS_M
+
+def as_coords(input):
+  # (..., 3) float64 coordinates, dropping alpha if present
+  return np.asarray(input, dtype=np.float64)[..., :3]
+
+def OKLab_to(OKLab, LMS_to_output):
+  lms = transform(OKLab, OKLab_to_LMS_M)
+  lms = lms * lms * lms
+  return transform(lms, LMS_to_output)
+
+def OKLab_from(input, input_to_LMS):
+  lms = transform(input, input_to_LMS)
+  return transform(np.cbrt(lms), LMS_to_OKLab_M)
+
+def convert(input, from_space, to_space, out = None):
+  """
+  Converts (..., 3) coordinates from one space to another, following the same routing as
+  `convert` in src/convert.js: through the spaces' bases, then OKLab/LMS or XYZ (D65) with
+  D50 adaptation where needed. Returns a new array unless `out` is given.
+  """
+  if not from_space:
+    raise ValueError('must specify a from_space')
+  if not to_space:
+    raise ValueError('must specify a to_space')
+
+  coords = as_coords(input).copy()
+
+  if from_space is not to_space:
+    coords = convert_coords(coords, from_space, to_space)
+
+  if out is None:
+    return coords
+  out[..., :3] = coords
+  return out
+
+def convert_coords(coords, from_space, to_space):
+  # e.g. convert OKLCH -> OKLab or sRGB -> sRGBLinear
+  if from_space.get('base'):
+    coords = from_space['toBase'](coords)
+    from_space = from_space['base']
+
+  # now we have the base space like sRGBLinear or XYZ
+  from_base_space = from_space
+
+  # and the base we want to get to, linear, OKLab, XYZ etc...
+  to_base_space = to_space.get('base') or to_space
+
+  if from_space.get('base') or to_base_space.get('base'):
+    raise ValueError('Currently only base of depth=1 is supported')
+
+  if from_base_space is not to_base_space:
+    # [from space] -> (adaptation) -> [xyz] -> (adaptation) -> [to space]
+    xyz_in = from_base_space['id'] == 'xyz'
+    xyz_out = to_base_space['id'] == 'xyz'
+    through_xyz = False
+    output_oklab = False
+
+    if from_base_space['id'] == 'oklab':
+      mat = to_base_space.get('fromLMS_M')
+      if mat is None:
+        # space doesn't support direct from OKLab, go through XYZ
+        mat = LMS_to_XYZ_M
+        through_xyz = True
+        xyz_in = True
+      coords = OKLab_to(coords, mat)
+    elif to_base_space['id'] == 'oklab':
+      mat = from_base_space.get('toLMS_M')
+      if mat is None:
+        # space doesn't support direct to OKLab, use XYZ as the connection
+        through_xyz = True
+        output_oklab = True
+      else:
+        coords = OKLab_from(coords, mat)
+    elif to_base_space['id'] in from_base_space.get('toSpace_M', {}):
+      # fast path between linear spaces, a single matrix with adaptation folded in
+      coords = transform(coords, from_base_space['toSpace_M'][to_base_space['id']])
+    else:
+      # any other spaces, we use XYZ D65 as a connection
+      through_xyz = True
+
+    if through_xyz:
+      if not xyz_in:
+        if from_base_space.get('toXYZ_M') is None:
+          raise ValueError(f'no toXYZ_M on {from_base_space["id"]}')
+        coords = transform(coords, from_base_space['toXYZ_M'])
+
+      # adapt D50 <-> D65 if we need to
+      if from_base_space.get('adapt'):
+        coords = transform(coords, from_base_space['adapt']['to'])
+      if to_base_space.get('adapt'):
+        coords = transform(coords, to_base_space['adapt']['from'])
+
+      if not xyz_out:
+        if output_oklab:
+          coords = OKLab_from(coords, XYZ_to_LMS_M)
+        elif to_base_space.get('fromXYZ_M') is not None:
+          coords = transform(coords, to_base_space['fromXYZ_M'])
+        else:
+          raise ValueError(f'no fromXYZ_M on {to_base_space["id"]}')
+
+  # final transformation to the target space, e.g. OKLab -> OKLCH or sRGBLinear -> sRGB
+  if to_base_space is not to_space:
+    if not to_space.get('fromBase'):
+      raise ValueError(f'could not transform {to_base_space["id"]} to {to_space["id"]}')
+    coords = to_space['fromBase'](coords)
+
+  return coords
+
+def deltaEOK(oklab1, oklab2):
+  # simple root sum of squares, per color
+  d = as_coords(oklab1) - as_coords(oklab2)
+  return np.sqrt(d[..., 0] * d[..., 0] + d[..., 1] * d[..., 1] + d[..., 2] * d[..., 2])
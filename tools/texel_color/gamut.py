@@ -0,0 +1,304 @@
+"""
+Vectorized versions of the OKLab gamut approximation in src/gamut.js. Hues are given as
+normalized `a`, `b` arrays (a^2 + b^2 == 1) and gamuts as the dicts in spaces.py.
+"""
+
+import numpy as np
+
+from .core import OKLab_to, convert
+from .util import stack3
+from .conversion_matrices import OKLab_to_LMS_M
+
+def get_lms_k(a, b):
+  # d(l_, m_, s_) / dC along a hue, the dotYZ(OKLab_to_LMS_M[i], [*, a, b]) of the JS code
+  kl = OKLab_to_LMS_M[0][1] * a + OKLab_to_LMS_M[0][2] * b
+  km = OKLab_to_LMS_M[1][1] * a + OKLab_to_LMS_M[1][2] * b
+  ks = OKLab_to_LMS_M[2][1] * a + OKLab_to_LMS_M[2][2] * b
+  return (kl, km, ks)
+
+def get_max_saturation_channel(a, b, okCoeff):
+  # The index of the component that goes below zero first for each hue (0, 1 or 2 for r, g or b)
+  red = okCoeff[0][0][0] * a + okCoeff[0][0][1] * b > 1
+  green = okCoeff[1][0][0] * a + okCoeff[1][0][1] * b > 1
+  return np.where(red, 0, np.where(green, 1, 2))
+
+def computeMaxSaturationOKLC(a, b, lmsToRgb, okCoeff, steps = 1):
+  # Finds the maximum saturation (S = C/L) possible for each hue that fits in RGB,
+  # which is when one of r, g or b goes below zero.
+  polynomials = np.array([okCoeff[i][1] for i in range(3)])
+  lmsToRgb = np.asarray(lmsToRgb)
+
+  # select the coefficients of the component that goes below zero first
+  channel = get_max_saturation_channel(a, b, okCoeff)
+  k = polynomials[channel]
+  w = lmsToRgb[channel]
+
+  # approximate max saturation using a polynomial
+  sat = k[..., 0] + k[..., 1] * a + k[..., 2] * b + k[..., 3] * (a * a) + k[..., 4] * a * b
+
+  # then `steps` steps of Halley's method to get closer
+  (kl, km, ks) = get_lms_k(a, b)
+
+  for i in range(steps):
+    l_ = 1.0 + sat * kl
+    m_ = 1.0 + sat * km
+    s_ = 1.0 + sat * ks
+
+    l = l_ * l_ * l_
+    m = m_ * m_ * m_
+    s = s_ * s_ * s_
+
+    lds = 3.0 * kl * (l_ * l_)
+    mds = 3.0 * km * (m_ * m_)
+    sds = 3.0 * ks * (s_ * s_)
+
+    lds2 = 6.0 * (kl * kl) * l_
+    mds2 = 6.0 * (km * km) * m_
+    sds2 = 6.0 * (ks * ks) * s_
+
+    f = w[..., 0] * l + w[..., 1] * m + w[..., 2] * s
+    f1 = w[..., 0] * lds + w[..., 1] * mds + w[..., 2] * sds
+    f2 = w[..., 0] * lds2 + w[..., 1] * mds2 + w[..., 2] * sds2
+
+    sat = sat - (f * f1) / (f1 * f1 - 0.5 * f * f2)
+
+  return sat
+
+def getGamutLMStoRGB(gamut):
+  if not gamut:
+    raise ValueError('expected gamut to have { space }')
+  space = gamut['space'].get('base') or gamut['space']
+  lmsToRgb = space.get('fromLMS_M')
+  if lmsToRgb is None:
+    raise ValueError('expected gamut { space } to have a fromLMS_M matrix')
+  return lmsToRgb
+
+def findCuspOKLCH(a, b, gamut):
+  # The (L, C) of the cusp of each hue, as a (..., 2) array
+  lmsToRgb = getGamutLMStoRGB(gamut)
+  okCoeff = gamut.get('coefficients')
+  if okCoeff is None:
+    raise ValueError('expected gamut to have { coefficients }')
+
+  # first, find the maximum saturation, with the gamut's number of Halley steps
+  S_cusp = computeMaxSaturationOKLC(a, b, lmsToRgb, okCoeff, gamut.get('halleySteps', 1))
+
+  # convert to linear RGB to find the first point where at least one of r, g or b >= 1
+  rgb_at_max = OKLab_to(stack3(1, S_cusp * a, S_cusp * b), lmsToRgb)
+  L_cusp = np.cbrt(1 / np.maximum(np.maximum(rgb_at_max[..., 0], rgb_at_max[..., 1]), rgb_at_max[..., 2]))
+
+  out = np.empty(np.shape(L_cusp) + (2,), dtype=np.result_type(L_cusp))
+  out[..., 0] = L_cusp
+  out[..., 1] = L_cusp * S_cusp
+  return out
+
+# with more than one Halley step, how far outside of the gamut the intersection can lie before it is
+# bisected, and the number of bisection steps, which bring t within 1e-9
+INTERSECTION_EPSILON = 1e-7
+BISECTION_STEPS = 30
+
+def get_clip_delta(lmsToRgb, L, C, kl, km, ks):
+  # How far the linear RGB of L, C at the hue of kl, km, ks lies outside 0..1
+  l_ = L + C * kl
+  m_ = L + C * km
+  s_ = L + C * ks
+  (l, m, s) = (l_ * l_ * l_, m_ * m_ * m_, s_ * s_ * s_)
+  delta = 0
+  for row in lmsToRgb:
+    v = row[0] * l + row[1] * m + row[2] * s
+    delta = np.maximum(delta, np.maximum(-v, v - 1))
+  return delta
+
+def findGamutIntersectionOKLCH(a, b, l1, c1, l0, cusp, gamut):
+  # Finds the intersection t of each line L = L0 * (1 - t) + t * L1, C = t * C1 with the gamut
+  lmsToRgb = getGamutLMStoRGB(gamut)
+  if cusp is None:
+    raise ValueError('must pass cusp')
+
+  cusp_L = cusp[..., 0]
+  cusp_C = cusp[..., 1]
+  floatMax = np.finfo(np.result_type(a, l1, 0.0)).max
+
+  with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+    # lower half
+    lower = (l1 - l0) * cusp_C - (cusp_L - l0) * c1 <= 0.0
+    denom = c1 * cusp_L + cusp_C * (l0 - l1)
+    t_lower = np.where(denom == 0, 0, (cusp_C * l0) / denom)
+
+    # upper half, first intersect with triangle
+    denom = c1 * (cusp_L - 1.0) + cusp_C * (l0 - l1)
+    t = np.where(denom == 0, 0, (cusp_C * (l0 - 1.0)) / denom)
+
+    # then Halley's method, one step unless the gamut asks for more
+    steps = gamut.get('halleySteps', 1)
+    dl = l1 - l0
+    dc = c1
+
+    (kl, km, ks) = get_lms_k(a, b)
+
+    ldt_ = dl + dc * kl
+    mdt_ = dl + dc * km
+    sdt_ = dl + dc * ks
+
+    for _ in range(steps):
+      L = l0 * (1.0 - t) + t * l1
+      C = t * c1
+
+      l_ = L + C * kl
+      m_ = L + C * km
+      s_ = L + C * ks
+
+      l = l_ * l_ * l_
+      m = m_ * m_ * m_
+      s = s_ * s_ * s_
+
+      ldt = 3 * ldt_ * l_ * l_
+      mdt = 3 * mdt_ * m_ * m_
+      sdt = 3 * sdt_ * s_ * s_
+
+      ldt2 = 6 * ldt_ * ldt_ * l_
+      mdt2 = 6 * mdt_ * mdt_ * m_
+      sdt2 = 6 * sdt_ * sdt_ * s_
+
+      dt = floatMax
+      for row in lmsToRgb:
+        v = row[0] * l + row[1] * m + row[2] * s
+        v1 = row[0] * ldt + row[1] * mdt + row[2] * sdt
+        v2 = row[0] * ldt2 + row[1] * mdt2 + row[2] * sdt2
+
+        # the step to where the channel reaches 1 if it is rising, or 0 if it is falling, which wide
+        # gamuts such as ProPhoto RGB can reach above the cusp
+        u1 = v1 / (v1 * v1 - 0.5 * (v - 1) * v2)
+        dt = np.minimum(dt, np.where(u1 >= 0.0, -(v - 1) * u1, floatMax))
+        u0 = v1 / (v1 * v1 - 0.5 * v * v2)
+        dt = np.minimum(dt, np.where(u0 <= 0.0, -v * u0, floatMax))
+      t = t + dt
+
+    # Halley steps from beyond a channel that rose above 1 and fell back, as the G channel of ProPhoto
+    # RGB does near its yellow cusp, cannot find where it first crossed, so when more steps are asked
+    # for, lines still out of gamut at t are bisected between l0 and the color instead
+    if steps > 1:
+      delta = get_clip_delta(lmsToRgb, l0 * (1.0 - t) + t * l1, t * c1, kl, km, ks)
+      outside = ~lower & (delta > INTERSECTION_EPSILON)
+      if np.any(outside):
+        lo = np.zeros_like(t)
+        hi = np.minimum(t, 1)
+        for _ in range(BISECTION_STEPS):
+          mid = (lo + hi) / 2
+          mid_outside = get_clip_delta(lmsToRgb, l0 * (1.0 - mid) + mid * l1, mid * c1, kl, km, ks) > 0
+          hi = np.where(mid_outside, mid, hi)
+          lo = np.where(mid_outside, lo, mid)
+        t = np.where(outside, lo, t)
+
+    t_upper = t
+
+  return np.where(lower, t_lower, t_upper)
+
+# Mapping strategies, each returns the target lightness that out of gamut colors are projected towards
+
+DEFAULT_ALPHA = 0.05
+
+def MapToL(oklch, cusp):
+  return oklch[..., 0]
+
+def MapToGray(oklch, cusp):
+  return np.full(np.shape(oklch)[:-1], 0.5)
+
+def MapToCuspL(oklch, cusp):
+  return cusp[..., 0]
+
+def MapToAdaptiveGray(oklch, cusp):
+  L = cusp[..., 0]
+  Ld = oklch[..., 0] - L
+  k = 2 * np.where(Ld > 0, 1 - L, L)
+  e1 = 0.5 * k + np.abs(Ld) + (DEFAULT_ALPHA * oklch[..., 1]) / k
+  return L + 0.5 * (np.sign(Ld) * (e1 - np.sqrt(e1 * e1 - 2 * k * np.abs(Ld))))
+
+def MapToAdaptiveCuspL(oklch, cusp):
+  Ld = oklch[..., 0] - 0.5
+  e1 = 0.5 + np.abs(Ld) + DEFAULT_ALPHA * oklch[..., 1]
+  return 0.5 * (1 + np.sign(Ld) * (e1 - np.sqrt(e1 * e1 - 2.0 * np.abs(Ld))))
+
+# number of colors mapped at a time by gamutMapOKLCH, which bounds the size of its temporaries
+CHUNK_SIZE = 1 << 16
+
+def gamutMapOKLCH(oklch, gamut = None, targetSpace = None, out = None, mapping = MapToCuspL, cusp = None, chunk_size = CHUNK_SIZE):
+  """
+  Maps (..., 3) OKLCH colors to fall within the given gamut (sRGBGamut by default), returning them
+  in `targetSpace` (the gamut's space by default), the same as gamutMapOKLCH in src/gamut.js.
+
+  Colors are processed `chunk_size` at a time and written into `out`, which may be a preallocated
+  or memory-mapped array, so memory use stays flat regardless of the input size. `cusp` may be
+  a single (L, C) pair used for every color, otherwise it is found per color.
+  """
+  from .spaces import sRGBGamut
+  if gamut is None:
+    gamut = sRGBGamut
+  if targetSpace is None:
+    targetSpace = gamut.get('space')
+  if not gamut.get('coefficients') or not gamut.get('space'):
+    raise ValueError('expected gamut with { space, coefficients }')
+  getGamutLMStoRGB(gamut)
+
+  oklch = np.asarray(oklch)
+  if out is None:
+    out = np.empty(oklch.shape[:-1] + (3,))
+
+  flat_in = oklch.reshape(-1, oklch.shape[-1])
+  flat_out = out.reshape(-1, out.shape[-1])
+  if not np.shares_memory(flat_out, out):
+    raise ValueError('out must be reshapable to (N, 3) without copying')
+
+  for start in range(0, len(flat_in), chunk_size):
+    end = min(start + chunk_size, len(flat_in))
+    flat_out[start:end, :3] = map_chunk(np.asarray(flat_in[start:end, :3], dtype=np.float64), gamut, targetSpace, mapping, cusp)
+  return out
+
+def map_chunk(oklch, gamut, targetSpace, mapping, cusp):
+  from .spaces import OKLCH
+
+  gamutSpace = gamut['space']
+  gamutSpaceBase = gamutSpace.get('base') or gamutSpace
+  targetSpaceBase = targetSpace.get('base') or targetSpace
+
+  # first, clamp lightness and chroma, hue remains constant
+  lch = np.empty_like(oklch)
+  lch[:, 0] = np.clip(oklch[:, 0], 0, 1)
+  lch[:, 1] = np.maximum(oklch[:, 1], 0)
+  lch[:, 2] = oklch[:, 2]
+
+  # convert to the base gamut space (i.e. linear sRGB) and find where the points lie
+  rgb = convert(lch, OKLCH, gamutSpaceBase)
+  outside = ~np.all((rgb >= 0) & (rgb <= 1), axis=-1)
+
+  result = np.empty_like(lch)
+  # points mapped directly to an OKLab based target skip the final clip, as in the JS
+  early = np.zeros(len(lch), dtype=bool)
+
+  if np.any(outside):
+    mapped = lch[outside]
+    L = mapped[:, 0]
+    C = mapped[:, 1]
+    hueAngle = np.radians(mapped[:, 2])
+    aNorm = np.cos(hueAngle)
+    bNorm = np.sin(hueAngle)
+
+    # choose our strategy
+    cusps = findCuspOKLCH(aNorm, bNorm, gamut) if cusp is None else np.broadcast_to(np.asarray(cusp, dtype=np.float64), (len(mapped), 2))
+    LTarget = mapping(mapped, cusps)
+
+    t = findGamutIntersectionOKLCH(aNorm, bNorm, L, C, LTarget, cusps, gamut)
+    mapped[:, 0] = LTarget * (1 - t) + L * t
+    mapped[:, 1] = C * t
+
+    if targetSpaceBase['id'] == 'oklab':
+      result[outside] = convert(mapped, OKLCH, targetSpace)
+      early = outside
+    else:
+      # now that the LCH sits on (or nearly on) the gamut, convert again to linear space
+      rgb[outside] = convert(mapped, OKLCH, gamutSpaceBase)
+
+  # clip the linear RGB to 0..1 range, then convert it to the final target space
+  rest = ~early
+  result[rest] = convert(np.clip(rgb[rest], 0, 1), gamutSpaceBase, targetSpace)
+  return result
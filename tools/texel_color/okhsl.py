@@ -0,0 +1,249 @@
+"""
+Vectorized versions of the OKHSL and OKHSV conversions in src/okhsl.js. Colors whose hue
+is undefined (gray, black or white) skip the gamut lookups, exactly as the JS branches do.
+"""
+
+import numpy as np
+
+from .core import OKLab_to
+from .util import stack3, constrain_angle
+from .gamut import findCuspOKLCH, findGamutIntersectionOKLCH, getGamutLMStoRGB
+from .conversion_matrices import OKLab_to_linear_sRGB_st_mid_coefficients
+
+K1 = 0.206
+K2 = 0.03
+K3 = (1.0 + K1) / (1.0 + K2)
+
+tau = 2 * np.pi
+
+def toe(x):
+  return 0.5 * (K3 * x - K1 + np.sqrt((K3 * x - K1) * (K3 * x - K1) + 4 * K2 * K3 * x))
+
+def toeInv(x):
+  return (x ** 2 + K1 * x) / (K3 * (x + K2))
+
+def computeSt(cusp):
+  l = cusp[..., 0]
+  c = cusp[..., 1]
+  return (c / l, c / (1 - l))
+
+def toScaleL(lv, cv, a_, b_, lmsToRgb):
+  lvt = toeInv(lv)
+  cvt = (cv * lvt) / lv
+
+  # RGB scale
+  rgb = OKLab_to(stack3(lvt, a_ * cvt, b_ * cvt), lmsToRgb)
+  scale = 1.0 / np.maximum(np.maximum(rgb[..., 0], rgb[..., 1]), np.maximum(rgb[..., 2], 0.0))
+  return np.copysign(np.abs(scale) ** (1 / 3), scale)
+
+def stMidPolynomial(k, a, b):
+  return k[0] + 1.0 / (
+    k[1] + k[2] * b + a * (
+      k[3] + k[4] * b + a * (
+        k[5] + k[6] * b + a * (k[7] + k[8] * b + k[9] * a))))
+
+def computeStMid(a, b, stMidCoeff):
+  # A smooth approximation of the location of the cusp, created by an optimization process
+  # (see fit_st_mid in tools/print_matrices.py). It has been designed so that S_mid < S_max
+  # and T_mid < T_max.
+  return (stMidPolynomial(stMidCoeff[0], a, b), stMidPolynomial(stMidCoeff[1], a, b))
+
+def getCs(l, a, b, cusp, gamut):
+  cMax = findGamutIntersectionOKLCH(a, b, l, 1, l, cusp, gamut)
+  (sMax, tMax) = computeSt(cusp)
+
+  # scale factor to compensate for the curved part of gamut shape
+  k = cMax / np.minimum(l * sMax, (1 - l) * tMax)
+
+  # gamuts without their own polynomials use the ones fitted for sRGB
+  (sMid, tMid) = computeStMid(a, b, gamut.get('stMidCoefficients') or OKLab_to_linear_sRGB_st_mid_coefficients)
+
+  # soft minimum instead of a sharp triangle shape, to get a smooth value for chroma
+  ca = l * sMid
+  cb = (1.0 - l) * tMid
+  cMid = 0.9 * k * np.sqrt(np.sqrt(1.0 / (1.0 / ca ** 4 + 1.0 / cb ** 4)))
+
+  # for C_0 the shape is independent of hue, ST are roughly the average values
+  ca = l * 0.4
+  cb = (1.0 - l) * 0.8
+  c0 = np.sqrt(1.0 / (1.0 / ca ** 2 + 1.0 / cb ** 2))
+
+  return (c0, cMid, cMax)
+
+def OKHSLToOKLab(hsl, gamut = None):
+  if gamut is None:
+    from .spaces import sRGBGamut as gamut
+
+  h = constrain_angle(hsl[..., 0]) / 360.0
+  s = hsl[..., 1]
+  L = toeInv(hsl[..., 2])
+  a = np.zeros_like(L)
+  b = np.zeros_like(L)
+
+  i = (L != 0.0) & (L != 1.0) & (s != 0)
+  if np.any(i):
+    (h_i, s_i, L_i) = (h[i], s[i], L[i])
+    a_ = np.cos(tau * h_i)
+    b_ = np.sin(tau * h_i)
+
+    cusp = findCuspOKLCH(a_, b_, gamut)
+    (c0, cMid, cMax) = getCs(L_i, a_, b_, cusp, gamut)
+
+    # interpolate the three values for C so that:
+    # at s=0: dC/ds = C_0, C=0
+    # at s=0.8: C=C_mid
+    # at s=1.0: C=C_max
+    mid = 0.8
+    midInv = 1.25
+    below = s_i < mid
+
+    t = np.where(below, midInv * s_i, 5 * (s_i - 0.8))
+    k0 = np.where(below, 0.0, cMid)
+    k1 = np.where(below, mid * c0, (0.2 * cMid ** 2 * 1.25 ** 2) / c0)
+    k2 = np.where(below, 1.0 - k1 / cMid, 1.0 - k1 / (cMax - cMid))
+
+    c = k0 + (t * k1) / (1.0 - k2 * t)
+    a[i] = c * a_
+    b[i] = c * b_
+
+  return stack3(L, a, b)
+
+def OKLabToOKHSL(lab, gamut = None):
+  if gamut is None:
+    from .spaces import sRGBGamut as gamut
+
+  # epsilon for lightness should approach close to 32 bit lightness,
+  # epsilon for saturation just needs to be sufficiently close when denoting achromatic
+  εL = 1e-7
+  εS = 1e-4
+  L = lab[..., 0]
+
+  s = np.zeros_like(L)
+  l = toe(L)
+
+  c = np.sqrt(lab[..., 1] ** 2 + lab[..., 2] ** 2)
+  h = 0.5 + np.arctan2(-lab[..., 2], -lab[..., 1]) / tau
+
+  i = (l != 0.0) & (l != 1.0) & (c != 0)
+  if np.any(i):
+    (L_i, c_i) = (L[i], c[i])
+    a_ = lab[..., 1][i] / c_i
+    b_ = lab[..., 2][i] / c_i
+
+    cusp = findCuspOKLCH(a_, b_, gamut)
+    (c0, cMid, cMax) = getCs(L_i, a_, b_, cusp, gamut)
+
+    mid = 0.8
+    midInv = 1.25
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+      # below mid
+      k1 = mid * c0
+      k2 = 1.0 - k1 / cMid
+      t = c_i / (k1 + k2 * c_i)
+      s_below = t * mid
+
+      # above mid
+      k0 = cMid
+      k1 = (0.2 * cMid ** 2 * midInv ** 2) / c0
+      k2 = 1.0 - k1 / (cMax - cMid)
+      t = (c_i - k0) / (k1 + k2 * (c_i - k0))
+      s_above = mid + 0.2 * t
+
+    s[i] = np.where(c_i < cMid, s_below, s_above)
+
+  # due to floating point imprecision near lightness of 1, saturation can be really high around white
+  achromatic = np.abs(s) < εS
+  s = np.where(~achromatic & ((l == 0.0) | (np.abs(1 - l) < εL)), 0.0, s)
+
+  return stack3(constrain_angle(h * 360), s, l)
+
+def OKHSVToOKLab(hsv, gamut = None):
+  if gamut is None:
+    from .spaces import sRGBGamut as gamut
+
+  h = constrain_angle(hsv[..., 0]) / 360.0
+  s = hsv[..., 1]
+  v = hsv[..., 2]
+
+  l = toeInv(v)
+  a = np.zeros_like(l)
+  b = np.zeros_like(l)
+
+  # avoid processing gray or colors with undefined hues
+  i = (l != 0.0) & (s != 0.0)
+  if np.any(i):
+    (h_i, s_i, v_i) = (h[i], s[i], v[i])
+    a_ = np.cos(tau * h_i)
+    b_ = np.sin(tau * h_i)
+
+    lmsToRgb = getGamutLMStoRGB(gamut)
+    cusp = findCuspOKLCH(a_, b_, gamut)
+    (sMax, tMax) = computeSt(cusp)
+    s0 = 0.5
+    k = 1 - s0 / sMax
+
+    # first we compute L and V as if the gamut is a perfect triangle, L, C when v == 1
+    lv = 1 - (s_i * s0) / (s0 + tMax - tMax * k * s_i)
+    cv = (s_i * tMax * s0) / (s0 + tMax - tMax * k * s_i)
+
+    l_i = v_i * lv
+    c = v_i * cv
+
+    # then we compensate for both toe and the curved top part of the triangle
+    scaleL = toScaleL(lv, cv, a_, b_, lmsToRgb)
+
+    lNew = toeInv(l_i)
+    c = (c * lNew) / l_i
+    l_i = lNew * scaleL
+    c = c * scaleL
+
+    l[i] = l_i
+    a[i] = c * a_
+    b[i] = c * b_
+
+  return stack3(l, a, b)
+
+def OKLabToOKHSV(lab, gamut = None):
+  if gamut is None:
+    from .spaces import sRGBGamut as gamut
+
+  lmsToRgb = getGamutLMStoRGB(gamut)
+
+  l = lab[..., 0]
+  s = np.zeros_like(l)
+  v = toe(l)
+  c = np.sqrt(lab[..., 1] ** 2 + lab[..., 2] ** 2)
+  h = 0.5 + np.arctan2(-lab[..., 2], -lab[..., 1]) / tau
+
+  i = (l != 0.0) & (l != 1) & (c != 0.0)
+  if np.any(i):
+    (l_i, c_i) = (l[i], c[i])
+    a_ = lab[..., 1][i] / c_i
+    b_ = lab[..., 2][i] / c_i
+
+    cusp = findCuspOKLCH(a_, b_, gamut)
+    (sMax, tMax) = computeSt(cusp)
+
+    s0 = 0.5
+    k = 1 - s0 / sMax
+
+    # first we find L_v, C_v, L_vt and C_vt
+    t = tMax / (c_i + l_i * tMax)
+    lv = t * l_i
+    cv = t * c_i
+
+    scaleL = toScaleL(lv, cv, a_, b_, lmsToRgb)
+
+    l_i = l_i / scaleL
+    c_i = c_i / scaleL
+
+    toeL = toe(l_i)
+    c_i = (c_i * toeL) / l_i
+    l_i = toeL
+
+    # we can now compute v and s
+    v[i] = l_i / lv
+    s[i] = ((s0 + tMax) * cv) / (tMax * s0 + tMax * k * cv)
+
+  return stack3(constrain_angle(h * 360), s, v)
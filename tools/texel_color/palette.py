@@ -0,0 +1,31 @@
+"""
+Nearest palette color queries in OKLab with the deltaEOK metric, the batched counterpart of
+src/palette.js. The index is a scipy k-d tree (imported when an index is first created), so
+whole (..., 3) arrays of colors are queried at once without measuring every palette color.
+"""
+
+import numpy as np
+
+def createPaletteIndex(palette):
+  # Builds the index of an (N, 3) array of OKLab colors, once per palette
+  from scipy.spatial import cKDTree
+
+  palette = np.asarray(palette, dtype=np.float64).reshape(-1, 3)
+  return { 'palette': palette, 'tree': cKDTree(palette) if len(palette) else None }
+
+def findKNearestInPalette(oklab, index, k):
+  # The indices in the palette of the k colors nearest to each color, nearest first, and their
+  # deltaEOK, as two (..., k) arrays. If the palette has fewer than k colors, the rest of the
+  # indices are -1 and their distances inf, as in the JS.
+  oklab = np.asarray(oklab, dtype=np.float64)
+  shape = oklab.shape[:-1] + (k,)
+  if index['tree'] is None:
+    return (np.full(shape, -1), np.full(shape, np.inf))
+  (distances, indices) = index['tree'].query(oklab.reshape(-1, 3), k=[i + 1 for i in range(k)])
+  # missing neighbours are given the palette size as their index
+  indices = np.where(indices < len(index['palette']), indices, -1)
+  return (indices.reshape(shape), distances.reshape(shape))
+
+def findNearestInPalette(oklab, index):
+  # The index in the palette of the color nearest to each color, as a (...) array
+  return findKNearestInPalette(oklab, index, 1)[0][..., 0]
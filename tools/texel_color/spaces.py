@@ -0,0 +1,297 @@
+"""
+The color spaces of src/spaces.js, as plain dicts with the same keys as the JS objects
+(id, base, toBase, fromBase, toXYZ_M, fromXYZ_M, toLMS_M, fromLMS_M, toSpace_M, adapt).
+The toBase/fromBase functions take and return (..., 3) arrays.
+"""
+
+import numpy as np
+
+from .util import transform, stack3, constrain_angle
+from . import conversion_matrices as M
+from . import okhsl
+
+# Bradford chromatic adaptation between D65 and D50, as in src/spaces/xyz.js
+D65_to_D50_M = M.D65_to_D50_M
+D50_to_D65_M = M.D50_to_D65_M
+
+# XYZ
+
+XYZ = {
+  'id': 'xyz', # xyz-d65
+  'toLMS_M': M.XYZ_to_LMS_M,
+  'fromLMS_M': M.LMS_to_XYZ_M,
+}
+
+XYZD50 = {
+  'id': 'xyz-d50',
+  'base': XYZ,
+  'toBase': lambda xyz: transform(xyz, D50_to_D65_M),
+  'fromBase': lambda xyz: transform(xyz, D65_to_D50_M),
+}
+
+# OKLab and related spaces
+
+# based on colorjs.io, could perhaps use a more specific number than this
+ACHROMATIC_EPSILON = (0.4 - 0.0) / 100000
+
+def OKLCH_to_OKLab(oklch):
+  # chroma is left unclamped, see src/spaces/oklab.js
+  C = oklch[..., 1]
+  H = oklch[..., 2]
+  return stack3(oklch[..., 0], C * np.cos((H * np.pi) / 180), C * np.sin((H * np.pi) / 180))
+
+def OKLab_to_OKLCH(oklab):
+  a = oklab[..., 1]
+  b = oklab[..., 2]
+  achromatic = (np.abs(a) < ACHROMATIC_EPSILON) & (np.abs(b) < ACHROMATIC_EPSILON)
+  hue = np.where(achromatic, 0, constrain_angle((np.arctan2(b, a) * 180) / np.pi))
+  C = np.where(achromatic, 0, np.sqrt(a * a + b * b))
+  return stack3(oklab[..., 0], C, hue)
+
+OKLab = {
+  'id': 'oklab',
+}
+
+OKLCH = {
+  'id': 'oklch',
+  'base': OKLab,
+  'toBase': OKLCH_to_OKLab,
+  'fromBase': OKLab_to_OKLCH,
+}
+
+# sRGB
+
+def sRGB_gamma_to_linear(val):
+  # extended transfer function, the linear portion and power function are reflected for negative values
+  sign = np.where(val < 0, -1, 1)
+  abs = np.abs(val)
+  return np.where(abs <= 0.04045, val / 12.92, sign * ((abs + 0.055) / 1.055) ** 2.4)
+
+def sRGB_linear_to_gamma(val):
+  sign = np.where(val < 0, -1, 1)
+  abs = np.abs(val)
+  return np.where(abs > 0.0031308, sign * (1.055 * abs ** (1 / 2.4) - 0.055), 12.92 * val)
+
+sRGBLinear = {
+  'id': 'srgb-linear',
+  'toXYZ_M': M.linear_sRGB_to_XYZ_M,
+  'fromXYZ_M': M.XYZ_to_linear_sRGB_M,
+  'toLMS_M': M.linear_sRGB_to_LMS_M,
+  'fromLMS_M': M.LMS_to_linear_sRGB_M,
+  'toSpace_M': {
+    # direct matrices to other linear spaces, see convert()
+    'display-p3-linear': M.linear_sRGB_to_linear_DisplayP3_M,
+    'rec2020-linear': M.linear_sRGB_to_linear_Rec2020_M,
+    'a98-rgb-linear': M.linear_sRGB_to_linear_A98RGB_M,
+    'prophoto-rgb-linear': M.linear_sRGB_to_linear_ProPhotoRGB_M,
+  },
+}
+
+sRGB = {
+  'id': 'srgb',
+  'base': sRGBLinear,
+  'toBase': sRGB_gamma_to_linear,
+  'fromBase': sRGB_linear_to_gamma,
+}
+
+sRGBGamut = {
+  'space': sRGB,
+  'coefficients': M.OKLab_to_linear_sRGB_coefficients,
+  'stMidCoefficients': M.OKLab_to_linear_sRGB_st_mid_coefficients,
+}
+
+# Display P3, uses the sRGB transfer function
+
+DisplayP3Linear = {
+  'id': 'display-p3-linear',
+  'toXYZ_M': M.linear_DisplayP3_to_XYZ_M,
+  'fromXYZ_M': M.XYZ_to_linear_DisplayP3_M,
+  'toLMS_M': M.linear_DisplayP3_to_LMS_M,
+  'fromLMS_M': M.LMS_to_linear_DisplayP3_M,
+  'toSpace_M': {
+    # direct matrices to other linear spaces, see convert()
+    'srgb-linear': M.linear_DisplayP3_to_linear_sRGB_M,
+    'rec2020-linear': M.linear_DisplayP3_to_linear_Rec2020_M,
+    'a98-rgb-linear': M.linear_DisplayP3_to_linear_A98RGB_M,
+    'prophoto-rgb-linear': M.linear_DisplayP3_to_linear_ProPhotoRGB_M,
+  },
+}
+
+DisplayP3 = {
+  'id': 'display-p3',
+  'base': DisplayP3Linear,
+  'toBase': sRGB_gamma_to_linear,
+  'fromBase': sRGB_linear_to_gamma,
+}
+
+DisplayP3Gamut = {
+  'space': DisplayP3,
+  'coefficients': M.OKLab_to_linear_DisplayP3_coefficients,
+  'stMidCoefficients': M.OKLab_to_linear_DisplayP3_st_mid_coefficients,
+}
+
+# Rec. 2020
+
+REC2020_ALPHA = 1.09929682680944
+REC2020_BETA = 0.018053968510807
+
+def Rec2020_to_linear(val):
+  # the power branch is only evaluated at or above its threshold, to avoid taking roots of negative values
+  power = ((np.maximum(val, REC2020_BETA * 4.5) + REC2020_ALPHA - 1) / REC2020_ALPHA) ** (1 / 0.45)
+  return np.where(val < REC2020_BETA * 4.5, val / 4.5, power)
+
+def Rec2020_to_gamma(val):
+  power = REC2020_ALPHA * np.maximum(val, REC2020_BETA) ** 0.45 - (REC2020_ALPHA - 1)
+  return np.where(val >= REC2020_BETA, power, 4.5 * val)
+
+Rec2020Linear = {
+  'id': 'rec2020-linear',
+  'toXYZ_M': M.linear_Rec2020_to_XYZ_M,
+  'fromXYZ_M': M.XYZ_to_linear_Rec2020_M,
+  'toLMS_M': M.linear_Rec2020_to_LMS_M,
+  'fromLMS_M': M.LMS_to_linear_Rec2020_M,
+  'toSpace_M': {
+    # direct matrices to other linear spaces, see convert()
+    'srgb-linear': M.linear_Rec2020_to_linear_sRGB_M,
+    'display-p3-linear': M.linear_Rec2020_to_linear_DisplayP3_M,
+    'a98-rgb-linear': M.linear_Rec2020_to_linear_A98RGB_M,
+    'prophoto-rgb-linear': M.linear_Rec2020_to_linear_ProPhotoRGB_M,
+  },
+}
+
+Rec2020 = {
+  'id': 'rec2020',
+  'base': Rec2020Linear,
+  'toBase': Rec2020_to_linear,
+  'fromBase': Rec2020_to_gamma,
+}
+
+Rec2020Gamut = {
+  'space': Rec2020,
+  'coefficients': M.OKLab_to_linear_Rec2020_coefficients,
+  'stMidCoefficients': M.OKLab_to_linear_Rec2020_st_mid_coefficients,
+}
+
+# Adobe RGB (1998)
+
+def A98RGB_to_linear(val):
+  return np.sign(val) * np.abs(val) ** (563 / 256)
+
+def A98RGB_to_gamma(val):
+  return np.sign(val) * np.abs(val) ** (256 / 563)
+
+A98RGBLinear = {
+  'id': 'a98-rgb-linear',
+  'toXYZ_M': M.linear_A98RGB_to_XYZ_M,
+  'fromXYZ_M': M.XYZ_to_linear_A98RGB_M,
+  'toLMS_M': M.linear_A98RGB_to_LMS_M,
+  'fromLMS_M': M.LMS_to_linear_A98RGB_M,
+  'toSpace_M': {
+    # direct matrices to other linear spaces, see convert()
+    'srgb-linear': M.linear_A98RGB_to_linear_sRGB_M,
+    'display-p3-linear': M.linear_A98RGB_to_linear_DisplayP3_M,
+    'rec2020-linear': M.linear_A98RGB_to_linear_Rec2020_M,
+    'prophoto-rgb-linear': M.linear_A98RGB_to_linear_ProPhotoRGB_M,
+  },
+}
+
+A98RGB = {
+  'id': 'a98-rgb',
+  'base': A98RGBLinear,
+  'toBase': A98RGB_to_linear,
+  'fromBase': A98RGB_to_gamma,
+}
+
+A98RGBGamut = {
+  'space': A98RGB,
+  'coefficients': M.OKLab_to_linear_A98RGB_coefficients,
+  'stMidCoefficients': M.OKLab_to_linear_A98RGB_st_mid_coefficients,
+}
+
+# ProPhoto RGB, in D50
+
+PROPHOTO_ET = 1 / 512
+PROPHOTO_ET2 = 16 / 512
+
+def ProPhotoRGB_to_linear(val):
+  # gamma 1.8 with a small linear portion
+  return np.where(val < PROPHOTO_ET2, val / 16, np.maximum(val, PROPHOTO_ET2) ** 1.8)
+
+def ProPhotoRGB_to_gamma(val):
+  return np.where(val >= PROPHOTO_ET, np.maximum(val, PROPHOTO_ET) ** (1 / 1.8), 16 * val)
+
+ProPhotoRGBLinear = {
+  'id': 'prophoto-rgb-linear',
+  'adapt': {
+    # chromatic adaptation to and from D65
+    'to': D50_to_D65_M,
+    'from': D65_to_D50_M,
+  },
+  # Note these are in D50
+  'toXYZ_M': M.linear_ProPhotoRGB_to_XYZ_M,
+  'fromXYZ_M': M.XYZ_to_linear_ProPhotoRGB_M,
+  # the LMS matrices have the adaptation folded in
+  'toLMS_M': M.linear_ProPhotoRGB_to_LMS_M,
+  'fromLMS_M': M.LMS_to_linear_ProPhotoRGB_M,
+  'toSpace_M': {
+    # direct matrices to other linear spaces, see convert()
+    'srgb-linear': M.linear_ProPhotoRGB_to_linear_sRGB_M,
+    'display-p3-linear': M.linear_ProPhotoRGB_to_linear_DisplayP3_M,
+    'rec2020-linear': M.linear_ProPhotoRGB_to_linear_Rec2020_M,
+    'a98-rgb-linear': M.linear_ProPhotoRGB_to_linear_A98RGB_M,
+  },
+}
+
+ProPhotoRGB = {
+  'id': 'prophoto-rgb',
+  'base': ProPhotoRGBLinear,
+  'toBase': ProPhotoRGB_to_linear,
+  'fromBase': ProPhotoRGB_to_gamma,
+}
+
+ProPhotoRGBGamut = {
+  'space': ProPhotoRGB,
+  'coefficients': M.OKLab_to_linear_ProPhotoRGB_coefficients,
+  'stMidCoefficients': M.OKLab_to_linear_ProPhotoRGB_st_mid_coefficients,
+  # the R channel and the intersection near the yellow cusp need more steps
+  'halleySteps': 3,
+}
+
+# OKHSL and OKHSV, sRGB gamut only (use the okhsl module directly for other gamuts)
+
+OKHSL = {
+  'id': 'okhsl',
+  'base': OKLab,
+  'toBase': lambda hsl: okhsl.OKHSLToOKLab(hsl, sRGBGamut),
+  'fromBase': lambda lab: okhsl.OKLabToOKHSL(lab, sRGBGamut),
+}
+
+OKHSV = {
+  'id': 'okhsv',
+  'base': OKLab,
+  'toBase': lambda hsv: okhsl.OKHSVToOKLab(hsv, sRGBGamut),
+  'fromBase': lambda lab: okhsl.OKLabToOKHSV(lab, sRGBGamut),
+}
+
+def listColorSpaces():
+  return [
+    XYZ, # D65
+    XYZD50,
+    OKLab,
+    OKLCH,
+    OKHSV,
+    OKHSL,
+    sRGB,
+    sRGBLinear,
+    DisplayP3,
+    DisplayP3Linear,
+    Rec2020,
+    Rec2020Linear,
+    A98RGB,
+    A98RGBLinear,
+    ProPhotoRGB,
+    ProPhotoRGBLinear,
+  ]
+
+def listColorGamuts():
+  return [sRGBGamut, DisplayP3Gamut, Rec2020Gamut, A98RGBGamut, ProPhotoRGBGamut]
@@ -0,0 +1,28 @@
+import numpy as np
+
+def constrain_angle(angle):
+  # same as constrainAngle in src/util.js, ((angle % 360) + 360) % 360 with JS remainder semantics
+  return np.fmod(np.fmod(angle, 360) + 360, 360)
+
+def transform(input, matrix):
+  # Multiplies every (..., 3) coordinate by a 3x3 matrix, in the same order of operations as
+  # transform in src/convert.js so that results match the JS output bit for bit.
+  # The precision of the input and matrix is kept, so float32 in gives float32 out.
+  x = input[..., 0]
+  y = input[..., 1]
+  z = input[..., 2]
+  rows = [x * matrix[i][0] + y * matrix[i][1] + z * matrix[i][2] for i in range(3)]
+  out = np.empty(np.shape(rows[0]) + (3,), dtype=np.result_type(*rows, 0.0))
+  for i in range(3):
+    out[..., i] = rows[i]
+  return out
+
+def stack3(x, y, z):
+  # (..., 3) coordinates from three channel arrays
+  dtype = np.result_type(x, y, z, 0.0)
+  x, y, z = np.broadcast_arrays(x, y, z)
+  out = np.empty(x.shape + (3,), dtype=dtype)
+  out[..., 0] = x
+  out[..., 1] = y
+  out[..., 2] = z
+  return out